@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Iterable, Sequence
 
 from core.logging.logger import get_logger
+from core.resources.asset_store import INDEX_FILE, open_asset_store
 from core.settings.storage_paths import get_app_data_dir
 
 logger = get_logger(__name__)
@@ -19,12 +20,21 @@ class CacheTarget:
     recursive: bool = False
 
 
+@dataclass(frozen=True)
+class CacheAssetTarget:
+    """Entries of the shared asset store whose namespace starts with ``namespace``."""
+
+    store_root: Path
+    namespace: str
+
+
 @dataclass(frozen=True)
 class CacheFamilyDescriptor:
     family_id: str
     label: str
     description: str
     targets: tuple[CacheTarget, ...]
+    asset_targets: tuple[CacheAssetTarget, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -49,6 +59,7 @@ def get_cache_family_descriptors(
 
     app_root = Path(app_data_dir) if app_data_dir is not None else get_app_data_dir()
     cache_root = app_root / "cache"
+    asset_root = cache_root / "assets"
     reddit_root = (
         Path(reddit_cache_dir)
         if reddit_cache_dir is not None
@@ -60,6 +71,7 @@ def get_cache_family_descriptors(
             "RSS Images",
             "Downloaded images from configured RSS and JSON feeds.",
             (CacheTarget(cache_root / "rss"),),
+            (CacheAssetTarget(asset_root, "cache/rss"),),
         ),
         CacheFamilyDescriptor(
             "reddit",
@@ -87,6 +99,7 @@ def get_cache_family_descriptors(
             "Steam Data And Artwork",
             "Account-scoped API responses and public artwork. Steam credentials are never included.",
             (CacheTarget(app_root / "steam" / "cache", recursive=True),),
+            (CacheAssetTarget(asset_root, "steam/cache"),),
         ),
         CacheFamilyDescriptor(
             "settings",
@@ -145,6 +158,21 @@ def clear_cache_families(
                         candidate.name,
                         exc,
                     )
+        for asset_target in descriptor.asset_targets:
+            if not (Path(asset_target.store_root) / INDEX_FILE).is_file():
+                continue
+            try:
+                entries, freed = open_asset_store(asset_target.store_root).clear(asset_target.namespace)
+                removed_files += entries
+                removed_bytes += freed
+            except Exception as exc:
+                errors.append(f"{descriptor.label}: could not clear stored artwork")
+                logger.debug(
+                    "[CACHE_MAINTENANCE] Asset clear failed family=%s namespace=%s error=%s",
+                    family_id,
+                    asset_target.namespace,
+                    exc,
+                )
 
     logger.info(
         "[CACHE_MAINTENANCE] selected=%s removed_files=%d removed_bytes=%d skipped=%d",
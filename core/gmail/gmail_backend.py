@@ -123,6 +123,7 @@ class GmailBackend(QObject):
     def shutdown(self) -> None:
         """Release a backend-owned fallback manager at process shutdown."""
 
+        self._retire_imap_client()
         manager = self._bootstrap_thread_manager
         self._bootstrap_thread_manager = None
         if self._owns_bootstrap_thread_manager and manager is not None:
@@ -204,7 +205,7 @@ class GmailBackend(QObject):
             self._mode = GmailBackendMode(snapshot.backend_mode)
             self._imap_email = snapshot.imap_email
             self._imap_password = snapshot.imap_password
-            self._imap_client = None
+            self._retire_imap_client()
             self._oauth_manager.install_prepared_bootstrap(snapshot)
             self._oauth_client = (
                 GmailClient(self._oauth_manager)
@@ -339,11 +340,20 @@ class GmailBackend(QObject):
             return f"Signed in (IMAP: {self._imap_email})"
         return "Enter email & app password"
 
+    def _retire_imap_client(self) -> None:
+        """Drop the cached IMAP client and log out its pooled connection."""
+        client, self._imap_client = self._imap_client, None
+        if client is not None:
+            try:
+                client.close()
+            except Exception as exc:
+                logger.debug("[GMAIL_BACKEND] IMAP client close suppressed: %s", exc)
+
     def save_imap_credentials(self, email_address: str, app_password: str) -> None:
         """Store IMAP credentials (DPAPI-encrypted)."""
         self._imap_email = email_address
         self._imap_password = app_password
-        self._imap_client = None
+        self._retire_imap_client()
         try:
             if self._imap_creds_path is None:
                 raise RuntimeError("Gmail backend is not initialized")
@@ -358,7 +368,7 @@ class GmailBackend(QObject):
         """Remove stored IMAP credentials."""
         self._imap_email = None
         self._imap_password = None
-        self._imap_client = None
+        self._retire_imap_client()
         try:
             if self._imap_creds_path is not None and self._imap_creds_path.exists():
                 self._imap_creds_path.unlink()
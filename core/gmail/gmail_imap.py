@@ -15,21 +15,33 @@ import email as email_lib
 import imaplib
 import re
 import threading
+import time
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from email.header import decode_header as _decode_header
 from email.utils import parsedate_to_datetime
-from typing import Callable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from core.gmail.gmail_deeplinks import build_open_url, gmail_inbox_url
 from core.gmail.gmail_client import EmailMetadata, GmailFetchCancelled
 from core.logging.logger import get_logger
 from core.windows.secure_url_launcher import open_url
 
+if TYPE_CHECKING:
+    from core.gmail.gmail_imap_idle import GmailImapIdleWatcher
+
 logger = get_logger(__name__)
 
 IMAP_HOST = "imap.gmail.com"
 IMAP_PORT = 993
 IMAP_TIMEOUT = 30
+IMAP_RECONNECT_INITIAL_S = 2.0
+IMAP_RECONNECT_MAX_S = 300.0
+# RFC 2177: clients must re-issue IDLE at least every 29 minutes.
+IMAP_IDLE_RENEW_S = 25 * 60
+
+_UID_RE = re.compile(rb"UID (\d+)")
+_FLAGS_RE = re.compile(rb"FLAGS \(([^)]*)\)")
 
 
 def _decode_header_value(raw: Optional[str]) -> str:
@@ -56,14 +68,124 @@ def _parse_date(raw: Optional[str]) -> datetime:
         return datetime.now()
 
 
+class _ReconnectBackoff:
+    """Exponential reconnect delay shared by the session and IDLE connections."""
+
+    def __init__(
+        self,
+        initial_s: float = IMAP_RECONNECT_INITIAL_S,
+        max_s: float = IMAP_RECONNECT_MAX_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._initial_s = float(initial_s)
+        self._max_s = float(max_s)
+        self._clock = clock
+        self._delay_s = 0.0
+        self._not_before = 0.0
+
+    @property
+    def delay_s(self) -> float:
+        return self._delay_s
+
+    def remaining_s(self) -> float:
+        return max(0.0, self._not_before - self._clock())
+
+    def failed(self) -> float:
+        self._delay_s = min(self._max_s, max(self._initial_s, self._delay_s * 2.0))
+        self._not_before = self._clock() + self._delay_s
+        return self._delay_s
+
+    def succeeded(self) -> None:
+        self._delay_s = 0.0
+        self._not_before = 0.0
+
+
+@dataclass
+class _MailboxWindow:
+    """Last listed window of a mailbox, reused across incremental refreshes."""
+
+    uidvalidity: Optional[int]
+    uidnext: Optional[int]
+    highestmodseq: Optional[int]
+    exists: int
+    max_results: int
+    uids: List[int] = field(default_factory=list)  # newest first
+    messages: Dict[int, EmailMetadata] = field(default_factory=dict)
+
+    def snapshot(self) -> List[EmailMetadata]:
+        return [self.messages[uid] for uid in self.uids if uid in self.messages]
+
+
+def _uid_set(uids: Iterable[int]) -> str:
+    """Compress UIDs into an IMAP sequence set (``5:9,12``)."""
+    ordered = sorted(set(int(uid) for uid in uids))
+    parts: List[str] = []
+    index = 0
+    while index < len(ordered):
+        first = last = ordered[index]
+        while index + 1 < len(ordered) and ordered[index + 1] == last + 1:
+            index += 1
+            last = ordered[index]
+        parts.append(str(first) if first == last else f"{first}:{last}")
+        index += 1
+    return ",".join(parts)
+
+
+def _response_int(conn: Any, code: str) -> Optional[int]:
+    """Pop an untagged response code (``UIDNEXT``, ``HIGHESTMODSEQ``...) as int."""
+    getter = getattr(conn, "response", None)
+    if not callable(getter):
+        return None
+    try:
+        _typ, data = getter(code)
+    except Exception:
+        return None
+    for item in reversed(data or ()):
+        if isinstance(item, bytes):
+            item = item.decode("ascii", errors="ignore")
+        try:
+            return int(str(item).split()[0])
+        except (TypeError, ValueError, IndexError):
+            continue
+    return None
+
+
+def _has_capability(conn: Any, name: str) -> bool:
+    caps = getattr(conn, "capabilities", ()) or ()
+    wanted = name.upper()
+    for cap in caps:
+        text = cap.decode("ascii", errors="ignore") if isinstance(cap, bytes) else str(cap)
+        if text.upper() == wanted:
+            return True
+    return False
+
+
+class GmailImapIdleUnsupported(RuntimeError):
+    """The server does not advertise IMAP IDLE."""
+
+
 class GmailImapClient:
-    """IMAP-based Gmail client using App Password auth."""
+    """IMAP-based Gmail client using App Password auth.
+
+    One authenticated connection is kept open and reused by every call;
+    dropped connections are re-established transparently (once per call)
+    with exponential backoff between failed attempts. Listing is
+    incremental: the last window per mailbox is remembered, unchanged
+    mailboxes (same UIDVALIDITY/UIDNEXT/EXISTS/HIGHESTMODSEQ) cost one
+    EXAMINE, and otherwise only UIDs not seen before are fetched, in one
+    batched ``UID FETCH``.
+    """
 
     def __init__(self, email_address: str, app_password: str):
         self._email = email_address
         self._password = app_password
         self._lock = threading.Lock()
         self._supports_gmail_extensions = False
+        self._conn: Optional[imaplib.IMAP4_SSL] = None
+        self._condstore = False
+        self._backoff = _ReconnectBackoff()
+        self._windows: Dict[Tuple[str, str], _MailboxWindow] = {}
+        self._closed = False
 
     def _connect(self) -> imaplib.IMAP4_SSL:
         """Create and authenticate an IMAP connection."""
@@ -90,6 +212,144 @@ class GmailImapClient:
             logger.debug("[GMAIL_IMAP] Capability check failed: %s", exc)
         return False
 
+    @staticmethod
+    def _enable_condstore(conn: imaplib.IMAP4_SSL) -> bool:
+        """Turn on CONDSTORE so EXAMINE reports HIGHESTMODSEQ."""
+        if not _has_capability(conn, "CONDSTORE"):
+            return False
+        enable = getattr(conn, "enable", None)
+        if callable(enable) and _has_capability(conn, "ENABLE"):
+            try:
+                status, _ = enable("CONDSTORE")
+                return status == "OK"
+            except Exception as exc:
+                logger.debug("[GMAIL_IMAP] ENABLE CONDSTORE failed: %s", exc)
+                return False
+        # RFC 7162: servers that advertise CONDSTORE report HIGHESTMODSEQ
+        # on EXAMINE even without an explicit ENABLE.
+        return True
+
+    # ------------------------------------------------------------------
+    # Session (lock held)
+    # ------------------------------------------------------------------
+
+    def _session(self) -> imaplib.IMAP4_SSL:
+        """Return the pooled connection, reconnecting if needed."""
+        if self._closed:
+            raise ConnectionError("IMAP client is closed")
+        if self._conn is not None:
+            return self._conn
+        wait_s = self._backoff.remaining_s()
+        if wait_s > 0.0:
+            raise ConnectionError(f"IMAP reconnect backing off for {wait_s:.1f}s")
+        try:
+            conn = self._connect()
+        except Exception:
+            delay = self._backoff.failed()
+            logger.warning("[GMAIL_IMAP] Connect failed; next attempt in %.0fs", delay)
+            raise
+        self._backoff.succeeded()
+        self._condstore = self._enable_condstore(conn)
+        self._conn = conn
+        return conn
+
+    def _drop_session(self, *, logout: bool) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        if logout:
+            try:
+                conn.logout()
+            except Exception:
+                pass
+        else:
+            try:
+                conn.shutdown()
+            except Exception:
+                pass
+
+    def _with_session(self, operation: Callable[[imaplib.IMAP4_SSL], Any]) -> Any:
+        """Run *operation* on the pooled connection, retrying once if it dropped.
+
+        Only transport failures (``IMAP4.abort``/``OSError``) are retried;
+        NO/BAD command failures and cancellations propagate unchanged.
+        """
+        try:
+            for attempt in (0, 1):
+                conn = self._session()
+                try:
+                    return operation(conn)
+                except (imaplib.IMAP4.abort, OSError) as exc:
+                    self._drop_session(logout=False)
+                    if attempt:
+                        raise
+                    logger.info("[GMAIL_IMAP] Connection dropped (%s); reconnecting", exc)
+            raise AssertionError("unreachable")
+        finally:
+            if self._closed:
+                self._drop_session(logout=True)
+
+    # ------------------------------------------------------------------
+    # IDLE push
+    # ------------------------------------------------------------------
+
+    def open_idle_connection(self, mailbox: str = "INBOX") -> imaplib.IMAP4_SSL:
+        """Open a dedicated connection with *mailbox* examined, ready for IDLE.
+
+        IDLE monopolises its connection, so this never touches the pooled
+        session. Raises ``GmailImapIdleUnsupported`` when the server lacks it.
+        """
+        conn = self._connect()
+        try:
+            if not _has_capability(conn, "IDLE"):
+                raise GmailImapIdleUnsupported(f"{IMAP_HOST} does not advertise IDLE")
+            status, _ = conn.select(f'"{mailbox}"', readonly=True)
+            if status != "OK":
+                raise imaplib.IMAP4.error(f"EXAMINE {mailbox} failed")
+        except Exception:
+            try:
+                conn.logout()
+            except Exception:
+                pass
+            raise
+        return conn
+
+    def create_idle_watcher(
+        self,
+        on_change: Callable[[], None],
+        *,
+        on_unavailable: Optional[Callable[[], None]] = None,
+        mailbox: str = "INBOX",
+    ) -> "GmailImapIdleWatcher":
+        """Build (but do not start) an IDLE watcher for *mailbox*."""
+        from core.gmail.gmail_imap_idle import GmailImapIdleWatcher
+
+        return GmailImapIdleWatcher(
+            self,
+            on_change,
+            on_unavailable=on_unavailable,
+            mailbox=mailbox,
+        )
+
+    def close(self) -> None:
+        """Log out the pooled connection; the client cannot be reused afterwards.
+
+        Never blocks the caller behind an in-flight call: that call logs out
+        on its way out instead.
+        """
+        self._closed = True
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._drop_session(logout=True)
+            self._windows.clear()
+        finally:
+            self._lock.release()
+
+    # ------------------------------------------------------------------
+    # Listing
+    # ------------------------------------------------------------------
+
     def list_messages(
         self,
         label_ids: Optional[List[str]] = None,
@@ -118,48 +378,15 @@ class GmailImapClient:
                 "IMPORTANT": "[Gmail]/Important",
             }
             mailbox = gmail_label_map.get(first, first)
+        criteria = "UNSEEN" if query and "is:unread" in query else "ALL"
 
         with self._lock:
-            conn = None
             try:
-                conn = self._connect()
-                status, _ = conn.select(f'"{mailbox}"', readonly=True)
-                if status != "OK":
-                    logger.warning("[GMAIL_IMAP] Failed to select mailbox %s", mailbox)
-                    return []
-
-                search_criteria = "UNSEEN" if query and "is:unread" in query else "ALL"
-                status, data = conn.uid("SEARCH", None, search_criteria)
-                if status != "OK" or not data[0]:
-                    return []
-
-                msg_ids = data[0].split()
-                recent_ids = msg_ids[-max_results:]
-                recent_ids.reverse()
-
-                results: List[EmailMetadata] = []
-                failed_ids: List[str] = []
-                for mid in recent_ids:
-                    if should_cancel is not None and should_cancel():
-                        raise GmailFetchCancelled("imap:list_messages")
-                    try:
-                        meta = self._fetch_message_metadata(conn, mid)
-                        if meta:
-                            results.append(meta)
-                    except GmailFetchCancelled:
-                        raise
-                    except Exception as exc:
-                        failed_ids.append(
-                            mid.decode("ascii", errors="replace") if isinstance(mid, bytes) else str(mid)
-                        )
-                        logger.warning("[GMAIL_IMAP] Failed to fetch msg %s: %s", mid, exc)
-
-                if failed_ids:
-                    raise RuntimeError(
-                        "IMAP partial fetch failure for UIDs: " + ", ".join(failed_ids)
+                return self._with_session(
+                    lambda conn: self._list_window(
+                        conn, mailbox, criteria, max(1, int(max_results)), should_cancel
                     )
-
-                return results
+                )
             except GmailFetchCancelled:
                 raise
             except imaplib.IMAP4.error as exc:
@@ -168,56 +395,204 @@ class GmailImapClient:
             except Exception as exc:
                 logger.error("[GMAIL_IMAP] Connection error: %s", exc)
                 raise
-            finally:
-                if conn:
-                    try:
-                        conn.logout()
-                    except Exception:
-                        pass
+
+    def _list_window(
+        self,
+        conn: imaplib.IMAP4_SSL,
+        mailbox: str,
+        criteria: str,
+        max_results: int,
+        should_cancel: Optional[Callable[[], bool]],
+    ) -> List[EmailMetadata]:
+        status, data = conn.select(f'"{mailbox}"', readonly=True)
+        if status != "OK":
+            logger.warning("[GMAIL_IMAP] Failed to select mailbox %s", mailbox)
+            return []
+        try:
+            exists = int(data[0]) if data and data[0] else 0
+        except (TypeError, ValueError):
+            exists = 0
+        uidvalidity = _response_int(conn, "UIDVALIDITY")
+        uidnext = _response_int(conn, "UIDNEXT")
+        highestmodseq = _response_int(conn, "HIGHESTMODSEQ") if self._condstore else None
+
+        key = (mailbox, criteria)
+        previous = self._windows.get(key)
+        if previous is not None and previous.uidvalidity != uidvalidity:
+            previous = None
+        if (
+            previous is not None
+            and previous.max_results == max_results
+            and uidnext is not None
+            and highestmodseq is not None
+            and (previous.uidnext, previous.highestmodseq, previous.exists)
+            == (uidnext, highestmodseq, exists)
+        ):
+            return previous.snapshot()
+
+        if should_cancel is not None and should_cancel():
+            raise GmailFetchCancelled("imap:list_messages")
+        if criteria == "ALL":
+            window_flags = self._fetch_window_flags(conn, exists, max_results)
+        else:
+            window_flags = self._search_window(conn, criteria, max_results)
+
+        cached = previous.messages if previous is not None else {}
+        missing = [uid for uid, _flags in window_flags if uid not in cached]
+        fetched = self._fetch_metadata_batch(conn, missing, should_cancel) if missing else {}
+
+        failed = [uid for uid in missing if uid not in fetched]
+        if failed:
+            raise RuntimeError(
+                "IMAP partial fetch failure for UIDs: " + ", ".join(str(uid) for uid in failed)
+            )
+
+        window = _MailboxWindow(
+            uidvalidity=uidvalidity,
+            uidnext=uidnext,
+            highestmodseq=highestmodseq,
+            exists=exists,
+            max_results=max_results,
+        )
+        for uid, flags in window_flags:
+            meta = fetched.get(uid)
+            if meta is None:
+                meta = self._with_flags(cached[uid], flags)
+            window.uids.append(uid)
+            window.messages[uid] = meta
+        self._windows[key] = window
+        return window.snapshot()
+
+    @staticmethod
+    def _fetch_window_flags(
+        conn: imaplib.IMAP4_SSL, exists: int, max_results: int
+    ) -> List[Tuple[int, Optional[bytes]]]:
+        """UIDs + flags of the newest *max_results* messages, newest first.
+
+        Addressed by sequence number, so no mailbox-wide SEARCH is needed.
+        """
+        if exists <= 0:
+            return []
+        first = max(1, exists - max_results + 1)
+        status, data = conn.fetch(f"{first}:{exists}", "(UID FLAGS)")
+        if status != "OK":
+            raise imaplib.IMAP4.error(f"FETCH {first}:{exists} failed")
+        rows: Dict[int, Optional[bytes]] = {}
+        for part in data or ():
+            line = part[0] if isinstance(part, tuple) else part
+            if not isinstance(line, bytes):
+                continue
+            uid_match = _UID_RE.search(line)
+            if uid_match is None:
+                continue
+            flags_match = _FLAGS_RE.search(line)
+            rows[int(uid_match.group(1))] = flags_match.group(1) if flags_match else b""
+        return sorted(rows.items(), reverse=True)[:max_results]
+
+    @staticmethod
+    def _search_window(
+        conn: imaplib.IMAP4_SSL, criteria: str, max_results: int
+    ) -> List[Tuple[int, Optional[bytes]]]:
+        status, data = conn.uid("SEARCH", None, criteria)
+        if status != "OK" or not data or not data[0]:
+            return []
+        uids = sorted(int(uid) for uid in data[0].split())
+        # UNSEEN by construction; other flags do not affect metadata.
+        return [(uid, b"") for uid in reversed(uids[-max_results:])]
+
+    @staticmethod
+    def _with_flags(meta: EmailMetadata, flags: Optional[bytes]) -> EmailMetadata:
+        if flags is None:
+            return meta
+        is_unread = b"\\Seen" not in flags
+        if is_unread == meta.is_unread:
+            return meta
+        labels = [label for label in meta.labels if label != "UNREAD"]
+        if is_unread:
+            labels.append("UNREAD")
+        return replace(meta, is_unread=is_unread, labels=tuple(labels))
+
+    def _fetch_parts(self) -> str:
+        fetch_parts = "UID FLAGS BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE MESSAGE-ID)]"
+        if self._supports_gmail_extensions:
+            fetch_parts += " X-GM-MSGID X-GM-THRID X-GM-LABELS"
+        return fetch_parts
+
+    def _fetch_metadata_batch(
+        self,
+        conn: imaplib.IMAP4_SSL,
+        uids: List[int],
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ) -> Dict[int, EmailMetadata]:
+        """Fetch headers + flags for *uids* with a single ``UID FETCH``."""
+        if should_cancel is not None and should_cancel():
+            raise GmailFetchCancelled("imap:list_messages")
+        uid_set = _uid_set(uids)
+        try:
+            try:
+                status, data = conn.uid("FETCH", uid_set, f"({self._fetch_parts()})")
+            except (AttributeError, TypeError):
+                status, data = conn.fetch(uid_set, f"({self._fetch_parts()})")
+        except (imaplib.IMAP4.abort, OSError):
+            raise
+        except Exception as exc:
+            logger.warning("[GMAIL_IMAP] Batched fetch failed for %d UIDs: %s", len(uids), exc)
+            return {}
+        if status != "OK":
+            return {}
+        results: Dict[int, EmailMetadata] = {}
+        wanted = set(uids)
+        for part in data or ():
+            if not isinstance(part, tuple):
+                continue
+            header_info = part[0] if isinstance(part[0], bytes) else b""
+            uid_match = _UID_RE.search(header_info)
+            if uid_match is not None:
+                uid = int(uid_match.group(1))
+            elif len(wanted) == 1:
+                uid = next(iter(wanted))
+            else:
+                continue
+            if uid not in wanted:
+                continue
+            raw_headers = part[1] if len(part) > 1 and isinstance(part[1], bytes) else b""
+            results[uid] = self._parse_metadata(str(uid).encode("ascii"), header_info, raw_headers)
+        return results
 
     def _fetch_message_metadata(
         self, conn: imaplib.IMAP4_SSL, msg_id: bytes
     ) -> Optional[EmailMetadata]:
         """Fetch headers + flags for a single message."""
-        fetch_parts = "FLAGS BODY[HEADER.FIELDS (FROM SUBJECT DATE MESSAGE-ID)]"
-        if self._supports_gmail_extensions:
-            fetch_parts += " X-GM-MSGID X-GM-THRID X-GM-LABELS"
-        try:
-            status, data = conn.uid("FETCH", msg_id, f"({fetch_parts})")
-        except (AttributeError, TypeError):
-            status, data = conn.fetch(msg_id, f"({fetch_parts})")
-        if status != "OK" or not data or not data[0]:
-            return None
+        uid = int(msg_id.decode("ascii") if isinstance(msg_id, bytes) else msg_id)
+        return self._fetch_metadata_batch(conn, [uid]).get(uid)
 
+    def _parse_metadata(
+        self, msg_id: bytes, header_info: bytes, raw_headers: bytes
+    ) -> EmailMetadata:
         raw_flags = b""
-        raw_headers = b""
         gmail_msgid = ""
         gmail_thrid = ""
         gmail_labels: tuple = ()
 
-        for part in data:
-            if isinstance(part, tuple):
-                header_info = part[0] if isinstance(part[0], bytes) else b""
-                raw_headers = part[1] if len(part) > 1 and isinstance(part[1], bytes) else b""
-                header_str = header_info.decode("utf-8", errors="replace")
-                if b"FLAGS" in header_info:
-                    flags_match = re.search(r"FLAGS \(([^)]*)\)", header_str)
-                    if flags_match:
-                        raw_flags = flags_match.group(1).encode()
-                    msgid_match = re.search(r"X-GM-MSGID (\d+)", header_str)
-                    if msgid_match:
-                        gmail_msgid = msgid_match.group(1)
-                    thrid_match = re.search(r"X-GM-THRID (\d+)", header_str)
-                    if thrid_match:
-                        gmail_thrid = thrid_match.group(1)
-                    labels_match = re.search(r'X-GM-LABELS \(([^)]*)\)', header_str)
-                    if labels_match:
-                        raw_label_str = labels_match.group(1)
-                        gmail_labels = tuple(
-                            lbl.strip('"').replace("\\\\", "")
-                            for lbl in raw_label_str.split()
-                            if lbl
-                        )
+        header_str = header_info.decode("utf-8", errors="replace")
+        if b"FLAGS" in header_info:
+            flags_match = re.search(r"FLAGS \(([^)]*)\)", header_str)
+            if flags_match:
+                raw_flags = flags_match.group(1).encode()
+            msgid_match = re.search(r"X-GM-MSGID (\d+)", header_str)
+            if msgid_match:
+                gmail_msgid = msgid_match.group(1)
+            thrid_match = re.search(r"X-GM-THRID (\d+)", header_str)
+            if thrid_match:
+                gmail_thrid = thrid_match.group(1)
+            labels_match = re.search(r'X-GM-LABELS \(([^)]*)\)', header_str)
+            if labels_match:
+                raw_label_str = labels_match.group(1)
+                gmail_labels = tuple(
+                    lbl.strip('"').replace("\\\\", "")
+                    for lbl in raw_label_str.split()
+                    if lbl
+                )
 
         msg = email_lib.message_from_bytes(raw_headers)
         sender = _decode_header_value(msg.get("From", "Unknown"))
@@ -268,24 +643,20 @@ class GmailImapClient:
 
     def get_unread_count(self, label_id: str = "INBOX") -> int:
         """Return the number of unseen messages."""
+        def _count(conn: imaplib.IMAP4_SSL) -> int:
+            status, data = conn.status('"INBOX"', "(UNSEEN)")
+            if status == "OK" and data and isinstance(data[0], bytes):
+                match = re.search(rb"UNSEEN (\d+)", data[0])
+                if match:
+                    return int(match.group(1))
+            return 0
+
         with self._lock:
-            conn = None
             try:
-                conn = self._connect()
-                conn.select("INBOX", readonly=True)
-                status, data = conn.search(None, "UNSEEN")
-                if status == "OK" and data[0]:
-                    return len(data[0].split())
-                return 0
+                return self._with_session(_count)
             except Exception as exc:
                 logger.error("[GMAIL_IMAP] Unread count failed: %s", exc)
                 return 0
-            finally:
-                if conn:
-                    try:
-                        conn.logout()
-                    except Exception:
-                        pass
 
     def _coerce_imap_uid(self, message_id: str) -> str:
         uid = str(message_id or "").strip()
@@ -306,24 +677,19 @@ class GmailImapClient:
             logger.warning("[GMAIL_IMAP] %s skipped: %s", action_name, exc)
             return False
 
+        def _select_and_run(conn: imaplib.IMAP4_SSL) -> bool:
+            status, _ = conn.select('"INBOX"', readonly=False)
+            if status != "OK":
+                logger.warning("[GMAIL_IMAP] %s failed: could not select INBOX", action_name)
+                return False
+            return action(conn, uid)
+
         with self._lock:
-            conn = None
             try:
-                conn = self._connect()
-                status, _ = conn.select('"INBOX"', readonly=False)
-                if status != "OK":
-                    logger.warning("[GMAIL_IMAP] %s failed: could not select INBOX", action_name)
-                    return False
-                return action(conn, uid)
+                return self._with_session(_select_and_run)
             except Exception as exc:
                 logger.warning("[GMAIL_IMAP] %s failed for UID %s: %s", action_name, uid, exc)
                 return False
-            finally:
-                if conn:
-                    try:
-                        conn.logout()
-                    except Exception:
-                        pass
 
     @staticmethod
     def _uid_store(conn: imaplib.IMAP4_SSL, uid: str, operation: str, flags: str) -> bool:
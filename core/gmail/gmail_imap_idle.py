@@ -0,0 +1,184 @@
+"""IMAP IDLE watcher that pushes mailbox changes to the Gmail widget.
+
+The watcher owns one dedicated connection (IDLE monopolises it) on its own
+thread. Any untagged ``EXISTS``/``EXPUNGE``/``FETCH`` while idling means the
+mailbox changed: IDLE is ended with ``DONE``, the burst is allowed to settle,
+and ``on_change`` is invoked so the owner can run an incremental
+``list_messages``. The connection's socket timeout doubles as the RFC 2177
+renewal interval: on timeout the connection is discarded and a fresh one
+re-enters IDLE, which avoids reusing a reader whose buffer a timeout may have
+left inconsistent.
+"""
+from __future__ import annotations
+
+import imaplib
+import socket
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from core.gmail.gmail_imap import (
+    IMAP_IDLE_RENEW_S,
+    GmailImapIdleUnsupported,
+    _ReconnectBackoff,
+)
+from core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from core.gmail.gmail_imap import GmailImapClient
+
+logger = get_logger(__name__)
+
+_CHANGE_MARKERS = (b" EXISTS", b" EXPUNGE", b" FETCH", b" VANISHED")
+_SETTLE_S = 1.0
+_JOIN_TIMEOUT_S = 2.0
+
+
+class GmailImapIdleWatcher:
+    """Background IDLE loop with reconnect backoff."""
+
+    def __init__(
+        self,
+        client: "GmailImapClient",
+        on_change: Callable[[], None],
+        *,
+        on_unavailable: Optional[Callable[[], None]] = None,
+        mailbox: str = "INBOX",
+        renew_s: float = IMAP_IDLE_RENEW_S,
+        settle_s: float = _SETTLE_S,
+    ) -> None:
+        self._client = client
+        self._on_change = on_change
+        self._on_unavailable = on_unavailable
+        self._mailbox = mailbox
+        self._renew_s = float(renew_s)
+        self._settle_s = max(0.0, float(settle_s))
+        self._backoff = _ReconnectBackoff()
+        self._stop_event = threading.Event()
+        self._conn_lock = threading.Lock()
+        self._conn: Any = None
+        self._thread: Optional[threading.Thread] = None
+        self.changes_seen = 0
+
+    # -- lifecycle -----------------------------------------------------
+    def is_running(self) -> bool:
+        thread = self._thread
+        return bool(thread is not None and thread.is_alive())
+
+    def start(self) -> bool:
+        if self.is_running():
+            return False
+        self._stop_event.clear()
+        thread = threading.Thread(target=self._run, name="GmailImapIdle", daemon=True)
+        self._thread = thread
+        thread.start()
+        logger.info("[GMAIL_IMAP] IDLE watcher started for %s", self._mailbox)
+        return True
+
+    def stop(self, *, timeout_s: float = _JOIN_TIMEOUT_S) -> bool:
+        """Interrupt IDLE and join. Returns True when the thread finished."""
+        self._stop_event.set()
+        with self._conn_lock:
+            conn = self._conn
+        if conn is not None:
+            # Unblocks the reader; the loop then logs out and exits.
+            try:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+            except Exception:
+                pass
+        thread = self._thread
+        if thread is None or thread is threading.current_thread():
+            return True
+        thread.join(timeout=max(0.0, float(timeout_s)))
+        finished = not thread.is_alive()
+        if finished:
+            self._thread = None
+        else:
+            logger.warning("[GMAIL_IMAP] IDLE watcher did not stop within %.1fs", timeout_s)
+        return finished
+
+    # -- loop ------------------------------------------------------------
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                conn = self._client.open_idle_connection(self._mailbox)
+            except GmailImapIdleUnsupported as exc:
+                logger.info("[GMAIL_IMAP] IDLE unavailable, falling back to polling: %s", exc)
+                self._notify(self._on_unavailable)
+                return
+            except Exception as exc:
+                delay = self._backoff.failed()
+                logger.warning(
+                    "[GMAIL_IMAP] IDLE connect failed (%s); retrying in %.0fs", exc, delay
+                )
+                self._stop_event.wait(delay)
+                continue
+
+            self._backoff.succeeded()
+            with self._conn_lock:
+                if self._stop_event.is_set():
+                    # stop() ran while we were connecting and had no socket to close.
+                    try:
+                        conn.shutdown()
+                    except Exception:
+                        pass
+                    break
+                self._conn = conn
+            try:
+                try:
+                    conn.sock.settimeout(self._renew_s)
+                except Exception:
+                    pass
+                while not self._stop_event.is_set():
+                    if self._idle_until_change(conn):
+                        self.changes_seen += 1
+                        if self._stop_event.wait(self._settle_s):
+                            break
+                        self._notify(self._on_change)
+            except (socket.timeout, TimeoutError):
+                logger.debug("[GMAIL_IMAP] IDLE renewal: reconnecting")
+            except (imaplib.IMAP4.error, OSError, ValueError) as exc:
+                if not self._stop_event.is_set():
+                    delay = self._backoff.failed()
+                    logger.info("[GMAIL_IMAP] IDLE connection lost (%s); retrying in %.0fs", exc, delay)
+                    self._stop_event.wait(delay)
+            finally:
+                with self._conn_lock:
+                    self._conn = None
+                try:
+                    conn.shutdown()
+                except Exception:
+                    pass
+        logger.debug("[GMAIL_IMAP] IDLE watcher stopped")
+
+    def _idle_until_change(self, conn: Any) -> bool:
+        """Run one IDLE command; True when the server reported a change."""
+        tag = conn._new_tag()
+        conn.send(tag + b" IDLE\r\n")
+        changed = False
+        done_sent = False
+        while True:
+            line = conn.readline()
+            if not line:
+                raise imaplib.IMAP4.abort("connection closed during IDLE")
+            if line.startswith(tag):
+                if b" OK" not in line[: len(tag) + 4]:
+                    raise imaplib.IMAP4.error(line.decode("ascii", errors="replace").strip())
+                return changed
+            if line.startswith(b"+"):
+                continue
+            if line.startswith(b"* BYE"):
+                raise imaplib.IMAP4.abort(line.decode("ascii", errors="replace").strip())
+            if line.startswith(b"*") and any(marker in line for marker in _CHANGE_MARKERS):
+                changed = True
+                if not done_sent:
+                    conn.send(b"DONE\r\n")
+                    done_sent = True
+
+    @staticmethod
+    def _notify(callback: Optional[Callable[[], None]]) -> None:
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception:
+            logger.exception("[GMAIL_IMAP] IDLE callback failed")
@@ -6,6 +6,12 @@ from core.performance.frame_budget import (
     get_frame_budget,
     get_gc_controller,
 )
+from core.performance.metrics_registry import (
+    Histogram,
+    MetricsRegistry,
+    get_metrics_registry,
+    maybe_export_metrics,
+)
 from core.performance.widget_profiler import (
     flush_widget_perf_metrics,
     record_widget_paint_result,
@@ -20,6 +26,10 @@ __all__ = [
     "GCController",
     "get_frame_budget",
     "get_gc_controller",
+    "Histogram",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "maybe_export_metrics",
     "widget_timer_sample",
     "widget_paint_sample",
     "record_widget_timer_result",
@@ -1,17 +1,30 @@
-"""Passive app-owned Qt event-loop timer-lateness measurement."""
+"""Passive app-owned Qt event-loop timer-lateness measurement.
+
+Lateness is recorded into a fixed-memory histogram registered with the
+metrics registry.  The summary window covers the last ``window_size`` to
+``2 * window_size`` ticks: the live histogram window is rotated into a
+retained generation every ``window_size`` ticks.
+"""
 from __future__ import annotations
 
 import time
-from collections import deque
 from dataclasses import dataclass
 
 from PySide6.QtCore import QObject, QTimer, Qt
 
 from core.logging.logger import get_logger
+from core.performance.metrics_registry import (
+    Histogram,
+    HistogramSnapshot,
+    get_metrics_registry,
+    maybe_export_metrics,
+)
 
 
 logger = get_logger(__name__)
 
+_STALL_THRESHOLDS_MS = (25.0, 50.0, 100.0)
+
 
 @dataclass(frozen=True)
 class EventLoopLatenessSnapshot:
@@ -42,7 +55,17 @@ class EventLoopStallRecorder(QObject):
         super().__init__(parent)
         self._interval_ms = max(10, int(interval_ms))
         self._report_interval_s = max(1.0, float(report_interval_s))
-        self._lateness_ms: deque[float] = deque(maxlen=max(32, int(window_size)))
+        self._window_size = max(32, int(window_size))
+        self._lateness = Histogram()
+        self._retained: HistogramSnapshot | None = None
+        # Exact over-threshold counts for the live and retained generations.
+        self._over = [0] * len(_STALL_THRESHOLDS_MS)
+        self._retained_over = [0] * len(_STALL_THRESHOLDS_MS)
+        get_metrics_registry().attach(
+            "event_loop_lateness_ms",
+            self._lateness,
+            description="GUI timer delivery lateness",
+        )
         self._sample_count = 0
         self._expected_at: float | None = None
         self._last_report_at: float | None = None
@@ -68,7 +91,7 @@ class EventLoopStallRecorder(QObject):
         logger.info(
             "[PERF] [EVENT LOOP] recorder_start interval_ms=%d window=%d",
             self._interval_ms,
-            self._lateness_ms.maxlen,
+            self._window_size,
         )
 
     def stop(self) -> None:
@@ -85,7 +108,15 @@ class EventLoopStallRecorder(QObject):
             return None
         observed_at = time.perf_counter() if now is None else float(now)
         lateness_ms = max(0.0, (observed_at - self._expected_at) * 1000.0)
-        self._lateness_ms.append(lateness_ms)
+        if self._lateness.window_count >= self._window_size:
+            self._retained = self._lateness.window()
+            self._retained_over[:] = self._over
+            for index in range(len(self._over)):
+                self._over[index] = 0
+        self._lateness.record(lateness_ms)
+        for index, threshold in enumerate(_STALL_THRESHOLDS_MS):
+            if lateness_ms > threshold:
+                self._over[index] += 1
         self._sample_count += 1
         # Reset from the observed delivery so a single stall is not counted again
         # by an artificial catch-up sequence.
@@ -93,29 +124,20 @@ class EventLoopStallRecorder(QObject):
         return lateness_ms
 
     def snapshot(self) -> EventLoopLatenessSnapshot:
-        values = sorted(self._lateness_ms)
-
-        def percentile(fraction: float) -> float:
-            if not values:
-                return 0.0
-            index = min(
-                len(values) - 1,
-                max(0, int(round((len(values) - 1) * fraction))),
-            )
-            return float(values[index])
-
+        window = self._lateness.window(reset=False).merged(self._retained)
+        over = [live + kept for live, kept in zip(self._over, self._retained_over)]
         return EventLoopLatenessSnapshot(
             samples=self._sample_count,
-            retained_samples=len(values),
+            retained_samples=window.count,
             interval_ms=self._interval_ms,
-            p50_ms=percentile(0.50),
-            p90_ms=percentile(0.90),
-            p95_ms=percentile(0.95),
-            p99_ms=percentile(0.99),
-            max_ms=max(values, default=0.0),
-            over_25_ms=sum(value > 25.0 for value in values),
-            over_50_ms=sum(value > 50.0 for value in values),
-            over_100_ms=sum(value > 100.0 for value in values),
+            p50_ms=window.quantile(0.50),
+            p90_ms=window.quantile(0.90),
+            p95_ms=window.quantile(0.95),
+            p99_ms=window.quantile(0.99),
+            max_ms=window.max,
+            over_25_ms=over[0],
+            over_50_ms=over[1],
+            over_100_ms=over[2],
         )
 
     def _on_timeout(self) -> None:
@@ -127,6 +149,7 @@ class EventLoopStallRecorder(QObject):
         ):
             self._emit_summary(outcome="sampled")
             self._last_report_at = now
+            maybe_export_metrics()
 
     def _emit_summary(self, *, outcome: str) -> None:
         snapshot = self.snapshot()
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional
 
 from core.logging.logger import get_logger, is_perf_metrics_enabled
+from core.performance.metrics_registry import Histogram, get_metrics_registry
 
 logger = get_logger(__name__)
 
@@ -73,6 +74,7 @@ class FrameBudget:
         self._last_frame_time_ms: float = 0.0
         self._max_frame_time_ms: float = 0.0
         self._min_frame_time_ms: float = float('inf')
+        self._frame_times = Histogram()
         self._spike_warning_last_ts: float = 0.0
         self._spike_warning_cooldown_s: float = 0.5
         self._spike_warning_suppressed_count: int = 0
@@ -117,6 +119,9 @@ class FrameBudget:
                 self._last_frame_time_ms = frame_time
                 self._max_frame_time_ms = max(self._max_frame_time_ms, frame_time)
                 self._min_frame_time_ms = min(self._min_frame_time_ms, frame_time)
+                # Idle gaps between transitions would swamp the percentiles.
+                if frame_time < 500.0:
+                    self._frame_times.record(frame_time)
                 
                 if frame_time > self._config.frame_time_ms + self._config.overrun_threshold_ms:
                     self._overrun_count += 1
@@ -247,6 +252,7 @@ class FrameBudget:
     
     def get_metrics(self) -> Dict[str, float]:
         """Get frame budget metrics."""
+        frames = self._frame_times.snapshot()
         with self._lock:
             return {
                 "total_frames": self._total_frames,
@@ -255,6 +261,9 @@ class FrameBudget:
                 "last_frame_ms": self._last_frame_time_ms,
                 "max_frame_ms": self._max_frame_time_ms,
                 "min_frame_ms": self._min_frame_time_ms if self._min_frame_time_ms != float('inf') else 0.0,
+                "p50_frame_ms": frames.quantile(0.50),
+                "p95_frame_ms": frames.quantile(0.95),
+                "p99_frame_ms": frames.quantile(0.99),
                 "target_fps": self._config.target_fps,
             }
     
@@ -266,13 +275,17 @@ class FrameBudget:
         metrics = self.get_metrics()
         logger.info(
             "[PERF] [FRAME] Budget metrics: frames=%d, overruns=%d, spikes=%d, "
-            "last=%.1fms, max=%.1fms, min=%.1fms, target=%dfps",
+            "last=%.1fms, max=%.1fms, min=%.1fms, p50=%.1fms, p95=%.1fms, p99=%.1fms, "
+            "target=%dfps",
             metrics["total_frames"],
             metrics["overrun_count"],
             metrics["spike_count"],
             metrics["last_frame_ms"],
             metrics["max_frame_ms"],
             metrics["min_frame_ms"],
+            metrics["p50_frame_ms"],
+            metrics["p95_frame_ms"],
+            metrics["p99_frame_ms"],
             metrics["target_fps"],
         )
 
@@ -365,6 +378,7 @@ def get_frame_budget() -> FrameBudget:
     global _frame_budget
     if _frame_budget is None:
         _frame_budget = FrameBudget()
+        get_metrics_registry().attach("frame_time_ms", _frame_budget._frame_times)
     return _frame_budget
 
 
@@ -0,0 +1,576 @@
+"""Process-wide metrics registry with fixed-memory latency histograms.
+
+Histograms are log-linear (HDR-style): values are scaled to integer units
+(microseconds for the default millisecond histograms), the first
+``2**sub_bucket_bits`` units are counted exactly and every further power of
+two is split into ``2**(sub_bucket_bits - 1)`` linear sub-buckets, which
+bounds the relative error of any reported quantile to ``2**-(sub_bucket_bits
+- 1)`` (~3% at the default 5 bits).  Recording is an index computation and
+two integer increments on preallocated arrays - no sorting, no per-sample
+storage, no allocation.
+
+Every histogram keeps a cumulative view and a *window* view owned by the
+code that records into it (e.g. one window per transition); taking a window
+snapshot resets only that window.  The registry's periodic export diffs
+cumulative snapshots against its own baselines instead, so exporting never
+disturbs an owner's window.
+
+The registry can dump itself as JSON (one line per export interval appended
+to ``perf_metrics.jsonl``) and as OpenMetrics text (``perf_metrics.prom``,
+overwritten) in the log directory, so long sessions can be charted without
+parsing log lines.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from array import array
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from core.logging.logger import get_logger, is_perf_metrics_enabled
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "HistogramSnapshot",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "maybe_export_metrics",
+]
+
+DEFAULT_SUB_BUCKET_BITS = 5
+DEFAULT_HIGHEST_BITS = 27          # 2**27 us ~= 134 s at the default unit scale
+DEFAULT_UNIT_SCALE = 1000.0        # ms values -> integer microseconds
+DEFAULT_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+EXPORT_INTERVAL_S = 15.0
+JSONL_FILENAME = "perf_metrics.jsonl"
+OPENMETRICS_FILENAME = "perf_metrics.prom"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Optional[Mapping[str, Any]]) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+# ----------------------------------------------------------------------
+# Histogram
+# ----------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Detached copy of one histogram view; quantiles are computed on demand."""
+
+    count: int
+    total: float
+    min: float
+    max: float
+    counts: Tuple[int, ...]
+    sub_bucket_bits: int
+    unit_scale: float
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Value at quantile *q* (0..1), clamped to the observed min/max."""
+        if self.count <= 0:
+            return 0.0
+        rank = max(1, int(math.ceil(min(1.0, max(0.0, float(q))) * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            if seen >= rank:
+                low, width = _bucket_bounds(index, self.sub_bucket_bits)
+                value = (low + width / 2.0) / self.unit_scale
+                return min(self.max, max(self.min, value))
+        return self.max
+
+    def since(self, baseline: Optional["HistogramSnapshot"]) -> "HistogramSnapshot":
+        """Samples recorded after *baseline* (an earlier cumulative snapshot).
+
+        min/max of the interval are only known to bucket resolution.
+        """
+        if baseline is None or baseline.count == 0:
+            return self
+        count = self.count - baseline.count
+        if count <= 0:
+            return replace(self, count=0, total=0.0, min=0.0, max=0.0, counts=())
+        counts = tuple(a - b for a, b in zip(self.counts, baseline.counts))
+        nonzero = [i for i, c in enumerate(counts) if c]
+        low, _ = _bucket_bounds(nonzero[0], self.sub_bucket_bits)
+        top, width = _bucket_bounds(nonzero[-1], self.sub_bucket_bits)
+        return HistogramSnapshot(
+            count=count,
+            total=self.total - baseline.total,
+            min=max(self.min, low / self.unit_scale),
+            max=min(self.max, (top + width) / self.unit_scale),
+            counts=counts,
+            sub_bucket_bits=self.sub_bucket_bits,
+            unit_scale=self.unit_scale,
+        )
+
+    def merged(self, other: Optional["HistogramSnapshot"]) -> "HistogramSnapshot":
+        """Combined view of two snapshots taken with the same layout."""
+        if other is None or other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        return HistogramSnapshot(
+            count=self.count + other.count,
+            total=self.total + other.total,
+            min=min(self.min, other.min),
+            max=max(self.max, other.max),
+            counts=tuple(a + b for a, b in zip(self.counts, other.counts)),
+            sub_bucket_bits=self.sub_bucket_bits,
+            unit_scale=self.unit_scale,
+        )
+
+    def to_dict(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, float]:
+        data: Dict[str, float] = {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "min": round(self.min, 6),
+            "max": round(self.max, 6),
+            "mean": round(self.mean, 6),
+        }
+        for q in quantiles:
+            data[f"p{_quantile_label(q)}"] = round(self.quantile(q), 6)
+        return data
+
+
+def _bucket_bounds(index: int, sub_bucket_bits: int) -> Tuple[int, int]:
+    """``(lowest_unit, width_in_units)`` of bucket *index*."""
+    sub_count = 1 << sub_bucket_bits
+    if index < sub_count:
+        return index, 1
+    half = sub_count >> 1
+    offset = index - sub_count
+    shift = offset // half + 1
+    return (half + offset % half) << shift, 1 << shift
+
+
+_ZERO_BLOCKS: Dict[int, array] = {}
+
+
+def _zero_block(size: int) -> array:
+    """Shared read-only zero array used to reset windows by slice assignment."""
+    block = _ZERO_BLOCKS.get(size)
+    if block is None:
+        block = _ZERO_BLOCKS.setdefault(size, array("q", bytes(8 * size)))
+    return block
+
+
+def _quantile_label(q: float) -> str:
+    text = f"{q * 100:.3f}".rstrip("0").rstrip(".")
+    return text.replace(".", "_")
+
+
+class Histogram:
+    """Fixed-memory log-linear histogram; ``record`` is O(1) and allocation-free."""
+
+    __slots__ = (
+        "_lock",
+        "_sub_bits",
+        "_sub_count",
+        "_half",
+        "_scale",
+        "_max_units",
+        "_counts",
+        "_window",
+        "_zeros",
+        "_count",
+        "_total",
+        "_min",
+        "_max",
+        "_w_count",
+        "_w_total",
+        "_w_min",
+        "_w_max",
+    )
+
+    def __init__(
+        self,
+        *,
+        sub_bucket_bits: int = DEFAULT_SUB_BUCKET_BITS,
+        highest_bits: int = DEFAULT_HIGHEST_BITS,
+        unit_scale: float = DEFAULT_UNIT_SCALE,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._sub_bits = max(2, int(sub_bucket_bits))
+        self._sub_count = 1 << self._sub_bits
+        self._half = self._sub_count >> 1
+        self._scale = float(unit_scale)
+        highest = max(self._sub_bits + 1, int(highest_bits))
+        self._max_units = (1 << highest) - 1
+        size = self._sub_count + (highest - self._sub_bits) * self._half
+        self._zeros = _zero_block(size)
+        self._counts = array("q", self._zeros)
+        self._window = array("q", self._zeros)
+        self._count = 0
+        self._total = 0.0
+        self._min = math.inf
+        self._max = 0.0
+        self._w_count = 0
+        self._w_total = 0.0
+        self._w_min = math.inf
+        self._w_max = 0.0
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._counts)
+
+    def _index(self, units: int) -> int:
+        if units < self._sub_count:
+            return units
+        shift = units.bit_length() - self._sub_bits
+        return self._sub_count + (shift - 1) * self._half + ((units >> shift) - self._half)
+
+    def record(self, value: float) -> None:
+        """Record one sample; negative values clamp to zero."""
+        value = float(value)
+        if value != value:  # NaN
+            return
+        if value < 0.0:
+            value = 0.0
+        units = int(value * self._scale)
+        if units > self._max_units:
+            units = self._max_units
+        index = self._index(units)
+        with self._lock:
+            self._counts[index] += 1
+            self._window[index] += 1
+            self._count += 1
+            self._total += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+            self._w_count += 1
+            self._w_total += value
+            if value < self._w_min:
+                self._w_min = value
+            if value > self._w_max:
+                self._w_max = value
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def window_count(self) -> int:
+        return self._w_count
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Cumulative view since creation."""
+        with self._lock:
+            return self._snapshot(self._counts, self._count, self._total, self._min, self._max)
+
+    def window(self, *, reset: bool = True) -> HistogramSnapshot:
+        """View since the last window reset; resets it unless ``reset=False``."""
+        with self._lock:
+            snap = self._snapshot(self._window, self._w_count, self._w_total, self._w_min, self._w_max)
+            if reset:
+                self._reset_window_locked()
+            return snap
+
+    def reset_window(self) -> None:
+        with self._lock:
+            self._reset_window_locked()
+
+    def _reset_window_locked(self) -> None:
+        if self._w_count:
+            self._window[:] = self._zeros
+        self._w_count = 0
+        self._w_total = 0.0
+        self._w_min = math.inf
+        self._w_max = 0.0
+
+    def _snapshot(self, counts: array, count: int, total: float, low: float, high: float) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            count=count,
+            total=total,
+            min=low if count else 0.0,
+            max=high if count else 0.0,
+            counts=tuple(counts) if count else (),
+            sub_bucket_bits=self._sub_bits,
+            unit_scale=self._scale,
+        )
+
+
+# ----------------------------------------------------------------------
+# Counter / Gauge
+# ----------------------------------------------------------------------
+
+class Counter:
+    """Monotonic counter with a resettable window."""
+
+    __slots__ = ("_lock", "_value", "_window")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0
+        self._window = 0
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+            self._window += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def window(self, *, reset: bool = True) -> int:
+        with self._lock:
+            value = self._window
+            if reset:
+                self._window = 0
+            return value
+
+
+class Gauge:
+    """Last-value gauge."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+
+Instrument = Union[Histogram, Counter, Gauge]
+
+
+# ----------------------------------------------------------------------
+# Registry
+# ----------------------------------------------------------------------
+
+class MetricsRegistry:
+    """Named, labelled instruments plus JSON/OpenMetrics dumps.
+
+    Lookups take a lock; hot paths should resolve an instrument once and
+    keep the reference.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._instruments: Dict[Tuple[str, LabelKey], Instrument] = {}
+        self._help: Dict[str, str] = {}
+        self._started = time.time()
+        self._last_export = 0.0
+        # Cumulative values at the previous interval snapshot, per instrument.
+        self._baselines: Dict[Tuple[str, LabelKey], Union[HistogramSnapshot, int]] = {}
+
+    def histogram(
+        self,
+        name: str,
+        *,
+        labels: Optional[Mapping[str, Any]] = None,
+        description: str = "",
+        **layout: Any,
+    ) -> Histogram:
+        return self._get_or_create(name, labels, description, Histogram, layout)  # type: ignore[return-value]
+
+    def counter(self, name: str, *, labels: Optional[Mapping[str, Any]] = None, description: str = "") -> Counter:
+        return self._get_or_create(name, labels, description, Counter, {})  # type: ignore[return-value]
+
+    def gauge(self, name: str, *, labels: Optional[Mapping[str, Any]] = None, description: str = "") -> Gauge:
+        return self._get_or_create(name, labels, description, Gauge, {})  # type: ignore[return-value]
+
+    def attach(
+        self,
+        name: str,
+        instrument: Instrument,
+        *,
+        labels: Optional[Mapping[str, Any]] = None,
+        description: str = "",
+    ) -> Instrument:
+        """Register an owner-held instrument, replacing any previous one."""
+        with self._lock:
+            self._instruments[(name, _label_key(labels))] = instrument
+            if description:
+                self._help.setdefault(name, description)
+        return instrument
+
+    def detach(self, name: str, *, labels: Optional[Mapping[str, Any]] = None) -> None:
+        with self._lock:
+            self._instruments.pop((name, _label_key(labels)), None)
+
+    def _get_or_create(self, name, labels, description, factory, layout) -> Instrument:
+        key = (name, _label_key(labels))
+        with self._lock:
+            instrument = self._instruments.get(key)
+            if instrument is None:
+                instrument = factory(**layout)
+                self._instruments[key] = instrument
+                if description:
+                    self._help.setdefault(name, description)
+            elif not isinstance(instrument, factory):
+                raise TypeError(f"metric {name!r} is already registered as {type(instrument).__name__}")
+            return instrument
+
+    def _items(self) -> List[Tuple[str, LabelKey, Instrument]]:
+        with self._lock:
+            return [(name, labels, inst) for (name, labels), inst in sorted(self._instruments.items())]
+
+    # -- snapshots -----------------------------------------------------
+    def snapshot(self, *, interval: bool = False) -> Dict[str, Any]:
+        """JSON-ready dict of every instrument.
+
+        ``interval=True`` reports only what was recorded since the previous
+        interval snapshot.  Intervals are diffs against the registry's own
+        baselines, so they never disturb an owner's ``window()``.
+        """
+        metrics: List[Dict[str, Any]] = []
+        for name, labels, inst in self._items():
+            key = (name, labels)
+            entry: Dict[str, Any] = {"name": name}
+            if labels:
+                entry["labels"] = dict(labels)
+            if isinstance(inst, Histogram):
+                snap = inst.snapshot()
+                if interval:
+                    previous = self._baselines.get(key)
+                    self._baselines[key] = snap
+                    snap = snap.since(previous if isinstance(previous, HistogramSnapshot) else None)
+                    if snap.count == 0:
+                        continue
+                entry["type"] = "histogram"
+                entry.update(snap.to_dict())
+            elif isinstance(inst, Counter):
+                value = inst.value
+                if interval:
+                    previous = self._baselines.get(key)
+                    self._baselines[key] = value
+                    value -= previous if isinstance(previous, int) and previous <= value else 0
+                entry["type"] = "counter"
+                entry["value"] = value
+            else:
+                entry["type"] = "gauge"
+                entry["value"] = inst.value
+            metrics.append(entry)
+        return {
+            "ts": round(time.time(), 3),
+            "uptime_s": round(time.time() - self._started, 3),
+            "interval": interval,
+            "metrics": metrics,
+        }
+
+    def to_openmetrics(self) -> str:
+        """Cumulative OpenMetrics text exposition (histograms as summaries)."""
+        lines: List[str] = []
+        declared: set = set()
+        for name, labels, inst in self._items():
+            metric = _metric_name(name)
+            kind = "summary" if isinstance(inst, Histogram) else (
+                "counter" if isinstance(inst, Counter) else "gauge"
+            )
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f"# TYPE {metric} {kind}")
+                help_text = self._help.get(name)
+                if help_text:
+                    lines.append(f"# HELP {metric} {help_text}")
+            if isinstance(inst, Histogram):
+                snap = inst.snapshot()
+                for q in DEFAULT_QUANTILES:
+                    lines.append(f"{metric}{_labels_text(labels, quantile=str(q))} {snap.quantile(q):.6g}")
+                lines.append(f"{metric}_sum{_labels_text(labels)} {snap.total:.6g}")
+                lines.append(f"{metric}_count{_labels_text(labels)} {snap.count}")
+            elif isinstance(inst, Counter):
+                lines.append(f"{metric}_total{_labels_text(labels)} {inst.value}")
+            else:
+                lines.append(f"{metric}{_labels_text(labels)} {inst.value:.6g}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    # -- file export ---------------------------------------------------
+    def export(self, directory: Path) -> None:
+        """Append one interval line to the JSONL log and rewrite the OpenMetrics file."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(self.snapshot(interval=True), separators=(",", ":"))
+        with open(directory / JSONL_FILENAME, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        target = directory / OPENMETRICS_FILENAME
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(self.to_openmetrics(), encoding="utf-8")
+        os.replace(tmp, target)
+        self._last_export = time.monotonic()
+
+    def export_if_due(self, directory: Path, *, interval_s: float = EXPORT_INTERVAL_S) -> bool:
+        if self._last_export and time.monotonic() - self._last_export < interval_s:
+            return False
+        self.export(directory)
+        return True
+
+
+def _metric_name(name: str) -> str:
+    cleaned = "".join(ch if ch.isalnum() or ch in "_:" else "_" for ch in name)
+    return f"srpss_{cleaned}"
+
+
+def _labels_text(labels: LabelKey, **extra: str) -> str:
+    pairs = list(labels) + sorted(extra.items())
+    if not pairs:
+        return ""
+    body = ",".join(
+        f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global MetricsRegistry instance."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+    return _registry
+
+
+def maybe_export_metrics(*, force: bool = False) -> bool:
+    """Write the metrics files to the log directory when PERF metrics are on.
+
+    Called from existing periodic PERF summaries; exports at most once per
+    ``EXPORT_INTERVAL_S`` unless *force*.
+    """
+    if not is_perf_metrics_enabled():
+        return False
+    try:
+        from core.logging.logger import get_log_dir
+
+        registry = get_metrics_registry()
+        if force:
+            registry.export(get_log_dir())
+            return True
+        return registry.export_if_due(get_log_dir())
+    except Exception as e:
+        logger.debug("[PERF] Metrics export failed: %s", e)
+        return False
+
+
+atexit.register(maybe_export_metrics, force=True)
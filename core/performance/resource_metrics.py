@@ -85,6 +85,14 @@ class ResourceAccountingSnapshot:
     gl_pbo_resources: int
     gl_pbo_bytes: int
     resources: tuple[ResourceAccountingRecord, ...]
+    # Idle QImage/QPixmap buffers parked in ResourceManager's reuse pool.
+    # Reported separately: they are reusable capacity, not tracked resources.
+    pool_entries: int = 0
+    pool_bytes: int = 0
+    pool_byte_budget: int = 0
+    pool_hits: int = 0
+    pool_misses: int = 0
+    pool_evictions: int = 0
 
     @property
     def known_tracked_bytes(self) -> int:
@@ -117,6 +125,12 @@ class ResourceAccountingSnapshot:
             "gl_renderbuffer_bytes": self.gl_renderbuffer_bytes,
             "gl_pbo_resources": self.gl_pbo_resources,
             "gl_pbo_bytes": self.gl_pbo_bytes,
+            "pool_entries": self.pool_entries,
+            "pool_bytes": self.pool_bytes,
+            "pool_byte_budget": self.pool_byte_budget,
+            "pool_hits": self.pool_hits,
+            "pool_misses": self.pool_misses,
+            "pool_evictions": self.pool_evictions,
             # QOpenGLWidget's default FBO is Qt-owned.  The baseline has no
             # application-owned FBO allocation seam, so it is intentionally
             # outside the application byte total rather than guessed.
@@ -770,8 +784,15 @@ def collect_resource_accounting(
             )
         )
 
+    pool_stats: Mapping[str, Any] = {}
     resource_manager = _safe_getattr(engine, "resource_manager")
     if resource_manager is not None:
+        pool_getter = _safe_getattr(resource_manager, "get_pool_stats")
+        if callable(pool_getter):
+            try:
+                pool_stats = pool_getter()
+            except Exception:
+                logger.debug("[LIFECYCLE] ResourceManager pool stats failed", exc_info=True)
         getter_name = (
             "get_usage_accounting_snapshot"
             if worker_safe
@@ -870,6 +891,21 @@ def collect_resource_accounting(
         gl_pbo_resources=len(pbo_records),
         gl_pbo_bytes=known_bytes(pbo_records),
         resources=tuple(records),
+        pool_entries=int(
+            (pool_stats.get("pixmap_pool_size", 0) or 0)
+            + (pool_stats.get("image_pool_size", 0) or 0)
+        ),
+        pool_bytes=int(pool_stats.get("bytes_held", 0) or 0),
+        pool_byte_budget=int(pool_stats.get("byte_budget", 0) or 0),
+        pool_hits=int(
+            (pool_stats.get("pixmap_hits", 0) or 0)
+            + (pool_stats.get("image_hits", 0) or 0)
+        ),
+        pool_misses=int(
+            (pool_stats.get("pixmap_misses", 0) or 0)
+            + (pool_stats.get("image_misses", 0) or 0)
+        ),
+        pool_evictions=int(pool_stats.get("evictions", 0) or 0),
     )
 
 
@@ -898,7 +934,10 @@ def log_lifecycle_resource_snapshot(
                 "gl_texture_resources=%d gl_texture_bytes=%d "
                 "gl_framebuffer_resources=%d gl_framebuffer_bytes=%d "
                 "gl_renderbuffer_resources=%d gl_renderbuffer_bytes=%d "
-                "gl_pbo_resources=%d gl_pbo_bytes=%d qt_default_fbo=%s",
+                "gl_pbo_resources=%d gl_pbo_bytes=%d "
+                "pool_entries=%d pool_bytes=%d pool_byte_budget=%d "
+                "pool_hits=%d pool_misses=%d pool_evictions=%d "
+                "qt_default_fbo=%s",
                 event,
                 stage,
                 fields["tracked_resources"],
@@ -921,6 +960,12 @@ def log_lifecycle_resource_snapshot(
                 fields["gl_renderbuffer_bytes"],
                 fields["gl_pbo_resources"],
                 fields["gl_pbo_bytes"],
+                fields["pool_entries"],
+                fields["pool_bytes"],
+                fields["pool_byte_budget"],
+                fields["pool_hits"],
+                fields["pool_misses"],
+                fields["pool_evictions"],
                 fields["qt_default_fbo"],
             )
         if lifecycle_enabled:
@@ -4,6 +4,8 @@ This module centralises the lightweight counters we emit for overlay widgets
 so we can spot idle timers or expensive paint events. Metrics are aggregated
 per widget/metric pair and periodically flushed to the dedicated
 ``perf_widgets.log`` file when PERF logging is enabled for the runtime.
+Durations also feed a per-pair histogram in the metrics registry, which
+supplies the emitted percentiles and the exported metrics files.
 """
 from __future__ import annotations
 
@@ -16,6 +18,7 @@ from typing import Dict, Optional, Tuple
 
 from core.logging.logger import get_logger, is_perf_metrics_enabled
 from core.logging.tags import TAG_WIDGET_PERF
+from core.performance.metrics_registry import Histogram, HistogramSnapshot, get_metrics_registry
 
 
 __all__ = [
@@ -50,6 +53,8 @@ class _PerfBucket:
     interval_ms: Optional[int] = None
     area_px: Optional[int] = None
     last_log_monotonic: float = field(default_factory=time.monotonic)
+    latency: Optional[Histogram] = None
+    window: Optional[HistogramSnapshot] = None
 
     def reset(self, now_monotonic: float | None = None) -> None:
         self.call_count = 0
@@ -196,8 +201,17 @@ def _record_sample(
     with _BUCKET_LOCK:
         bucket = _BUCKETS.get(key)
         if bucket is None:
-            bucket = _PerfBucket(widget=widget_name, metric=metric_name, kind=kind)
+            bucket = _PerfBucket(
+                widget=widget_name,
+                metric=metric_name,
+                kind=kind,
+                latency=get_metrics_registry().histogram(
+                    f"widget_{kind}_ms",
+                    labels={"widget": widget_name, "metric": metric_name},
+                ),
+            )
             _BUCKETS[key] = bucket
+        bucket.latency.record(duration_ms)
         bucket.call_count += 1
         bucket.total_ms += duration_ms
         if duration_ms > bucket.max_ms:
@@ -234,6 +248,11 @@ def _emit_bucket(bucket: _PerfBucket) -> None:
         f"calls={bucket.call_count} avg_ms={avg_ms:.2f} max_ms={bucket.max_ms:.2f} "
         f"slow_calls={bucket.slow_count}"
     )
+    if bucket.window is not None and bucket.window.count:
+        summary += (
+            f" p50_ms={bucket.window.quantile(0.50):.2f}"
+            f" p95_ms={bucket.window.quantile(0.95):.2f}"
+        )
     if bucket.interval_ms is not None:
         summary += f" interval_ms={bucket.interval_ms}"
     if bucket.area_px is not None:
@@ -277,6 +296,7 @@ def _copy_bucket(bucket: _PerfBucket) -> _PerfBucket:
         interval_ms=bucket.interval_ms,
         area_px=bucket.area_px,
         last_log_monotonic=bucket.last_log_monotonic,
+        window=bucket.latency.window() if bucket.latency is not None else None,
     )
 
 
@@ -5,6 +5,7 @@ Provides multiprocessing infrastructure for offloading heavy work:
 - ImageWorker: decode/prescale with shared-memory output
 - RSSWorker: fetch/parse/mirror with validated metadata
 - TransitionPrepWorker: CPU precompute payloads
+- AudioAnalysisWorker: visualizer DSP over shared-memory PCM blocks
 
 All workers communicate via queues with immutable messages.
 No Qt objects cross process boundaries.
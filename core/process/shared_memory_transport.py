@@ -4,17 +4,29 @@ Windows removes a named mapping when its final open handle closes.  The image
 worker therefore keeps only the currently published mapping open until the
 parent proves that it has attached by setting a one-byte acknowledgement.  The
 parent owns every mapping after attachment and always closes/unlinks it.
+
+Pooled slabs invert that ownership: the parent creates a small fixed ring of
+pre-sized mappings, leases one per request and the worker writes into it
+in place.  Slabs are never unlinked per transfer; they return to the ring
+once the consumer releases them, so the steady state performs no
+create/unlink at all.  Payloads that do not fit (or arrive while every slab
+is leased) fall back to the per-transfer segment path above.
 """
 from __future__ import annotations
 
+import os
 import threading
 import time
+import uuid
 from dataclasses import dataclass
 from multiprocessing.shared_memory import SharedMemory
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping, Optional
 
 
 IMAGE_SHARED_MEMORY_PREFIX = "srpss_img_"
+IMAGE_SLAB_PREFIX = IMAGE_SHARED_MEMORY_PREFIX + "slab_"
+# TransitionWorker block arrays reuse the per-transfer segment handoff.
+TRANSITION_SHARED_MEMORY_PREFIX = IMAGE_SHARED_MEMORY_PREFIX + "tx_"
 SHARED_MEMORY_HANDOFF_VERSION = 1
 SHARED_MEMORY_ACK_PENDING = 0
 SHARED_MEMORY_ACK_ATTACHED = 0xA5
@@ -32,13 +44,19 @@ class SharedMemoryDescriptor:
     payload_offset: int = SHARED_MEMORY_PAYLOAD_OFFSET
     ack_offset: int = SHARED_MEMORY_ACK_OFFSET
     handoff_version: int = SHARED_MEMORY_HANDOFF_VERSION
+    # Non-zero when the payload lives in a parent-owned pooled slab.
+    slab_generation: int = 0
 
     @property
     def required_size(self) -> int:
         return self.payload_offset + self.data_size
 
+    @property
+    def pooled(self) -> bool:
+        return self.slab_generation > 0
+
     def payload_fields(self) -> dict[str, int | str]:
-        return {
+        fields: dict[str, int | str] = {
             "shared_memory_name": self.name,
             # Keep the established field while making the data-only meaning
             # explicit for the versioned handoff.
@@ -48,6 +66,9 @@ class SharedMemoryDescriptor:
             "shared_memory_ack_offset": self.ack_offset,
             "shared_memory_handoff_version": self.handoff_version,
         }
+        if self.pooled:
+            fields["shared_memory_slab_generation"] = self.slab_generation
+        return fields
 
     @classmethod
     def from_payload(
@@ -93,12 +114,21 @@ class SharedMemoryDescriptor:
         ):
             raise ValueError("Invalid versioned shared-memory layout")
 
+        slab_generation = int(payload.get("shared_memory_slab_generation", 0) or 0)
+        if slab_generation < 0:
+            raise ValueError("Negative slab generation is invalid")
+        if slab_generation and not name.startswith(IMAGE_SLAB_PREFIX):
+            raise ValueError("Pooled transfer does not name a slab")
+        if not slab_generation and name.startswith(IMAGE_SLAB_PREFIX):
+            raise ValueError("Slab transfer is missing its generation")
+
         return cls(
             name=name,
             data_size=data_size,
             payload_offset=payload_offset,
             ack_offset=ack_offset,
             handoff_version=version,
+            slab_generation=slab_generation,
         )
 
 
@@ -319,6 +349,280 @@ def dispose_malformed_shared_memory_payload(
     return descriptor, unlink_failed
 
 
+@dataclass(frozen=True)
+class SharedMemorySlabTicket:
+    """Picklable lease of one pooled slab, sent to the worker with a request."""
+
+    name: str
+    capacity: int
+    generation: int
+
+    def payload_fields(self) -> dict[str, int | str]:
+        return {
+            "name": self.name,
+            "capacity": self.capacity,
+            "generation": self.generation,
+        }
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: Mapping[str, Any] | None,
+    ) -> "SharedMemorySlabTicket | None":
+        if not payload:
+            return None
+        name = str(payload.get("name") or "")
+        if not name.startswith(IMAGE_SLAB_PREFIX):
+            return None
+        capacity = int(payload.get("capacity", 0) or 0)
+        generation = int(payload.get("generation", 0) or 0)
+        if capacity <= 0 or generation <= 0:
+            return None
+        return cls(name=name, capacity=capacity, generation=generation)
+
+
+def write_image_slab(
+    shm: SharedMemory,
+    ticket: SharedMemorySlabTicket,
+    rgba_data: bytes,
+) -> SharedMemoryDescriptor | None:
+    """Fill a leased slab in place; ``None`` means the payload does not fit."""
+    data_size = len(rgba_data)
+    if data_size <= 0 or data_size > ticket.capacity:
+        return None
+    descriptor = SharedMemoryDescriptor(
+        name=ticket.name,
+        data_size=data_size,
+        slab_generation=ticket.generation,
+    )
+    if descriptor.required_size > len(shm.buf):
+        return None
+    shm.buf[descriptor.payload_offset:descriptor.required_size] = rgba_data
+    return descriptor
+
+
+class SharedMemorySlabPool:
+    """Parent-owned fixed ring of pre-sized slabs leased per image request.
+
+    Leases are keyed by an owner string (the request correlation id).  A
+    lease is *pending* while the worker may still write into it and *held*
+    once a consumer has the payload; a worker restart reclaims pending
+    leases only, because held slabs may still back a live QImage.
+    """
+
+    def __init__(
+        self,
+        slab_count: int,
+        slab_bytes: int,
+        *,
+        accounting: "SharedMemoryAccounting | None" = None,
+    ) -> None:
+        self._lock = threading.RLock()
+        self._slab_count = max(0, int(slab_count))
+        self._slab_bytes = max(0, min(int(slab_bytes), MAX_IMAGE_SHARED_MEMORY_BYTES))
+        self._accounting = accounting
+        self._token = f"{os.getpid():x}{uuid.uuid4().hex[:6]}"
+        self._slabs: list[Optional[SharedMemory]] = [None] * self._slab_count
+        self._uses: list[int] = [0] * self._slab_count
+        self._owners: dict[str, int] = {}
+        self._held: set[str] = set()
+        self._tickets: dict[str, SharedMemorySlabTicket] = {}
+        self._cursor = 0
+        self._generation = 0
+        self._closed = False
+        self._publish_occupancy()
+
+    @property
+    def enabled(self) -> bool:
+        return self._slab_count > 0 and self._slab_bytes > 0 and not self._closed
+
+    def lease(self, owner: str) -> SharedMemorySlabTicket | None:
+        """Lease the next free slab in ring order, creating it on first use."""
+        with self._lock:
+            if not self.enabled or not owner:
+                return None
+            existing = self._tickets.get(owner)
+            if existing is not None:
+                return existing
+            busy = set(self._owners.values())
+            for step in range(self._slab_count):
+                index = (self._cursor + step) % self._slab_count
+                if index in busy:
+                    continue
+                try:
+                    shm = self._ensure_slab(index)
+                except Exception:
+                    return None
+                self._cursor = (index + 1) % self._slab_count
+                self._generation += 1
+                ticket = SharedMemorySlabTicket(
+                    name=shm.name,
+                    capacity=self._slab_bytes,
+                    generation=self._generation,
+                )
+                self._owners[owner] = index
+                self._tickets[owner] = ticket
+                self._publish_occupancy()
+                return ticket
+            return None
+
+    def ticket_for(self, owner: str) -> SharedMemorySlabTicket | None:
+        with self._lock:
+            return self._tickets.get(owner)
+
+    def matches(self, owner: str, descriptor: SharedMemoryDescriptor) -> bool:
+        ticket = self.ticket_for(owner)
+        return (
+            ticket is not None
+            and ticket.name == descriptor.name
+            and ticket.generation == descriptor.slab_generation
+            and descriptor.data_size <= ticket.capacity
+        )
+
+    def hold(self, owner: str, descriptor: SharedMemoryDescriptor) -> tuple[memoryview, bool]:
+        """Mark the lease consumer-held and return ``(payload view, reused)``."""
+        with self._lock:
+            if not self.matches(owner, descriptor):
+                raise ValueError("Slab transfer does not match its lease")
+            index = self._owners[owner]
+            shm = self._slabs[index]
+            if shm is None:
+                raise ValueError("Leased slab is no longer mapped")
+            self._held.add(owner)
+            reused = self._uses[index] > 0
+            self._uses[index] += 1
+            return (
+                shm.buf[descriptor.payload_offset:descriptor.required_size],
+                reused,
+            )
+
+    def release(self, owner: str) -> bool:
+        """Return one lease to the ring; repeated releases are harmless."""
+        with self._lock:
+            index = self._owners.pop(owner, None)
+            self._tickets.pop(owner, None)
+            self._held.discard(owner)
+            if index is None:
+                return False
+            self._publish_occupancy()
+            return True
+
+    def release_pending(self) -> int:
+        """Reclaim leases the worker never answered (worker stop/restart)."""
+        with self._lock:
+            pending = [owner for owner in self._owners if owner not in self._held]
+            for owner in pending:
+                self.release(owner)
+            return len(pending)
+
+    def close(self) -> None:
+        """Unlink every slab; held views keep their mapping until released."""
+        with self._lock:
+            self._closed = True
+            self._owners.clear()
+            self._tickets.clear()
+            self._held.clear()
+            slabs = list(self._slabs)
+            self._slabs = [None] * self._slab_count
+            self._publish_occupancy()
+        for shm in slabs:
+            if shm is None:
+                continue
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+            except Exception:
+                if self._accounting is not None:
+                    self._accounting.record_unlink_failure()
+            try:
+                shm.close()
+            except BufferError:
+                # A consumer still holds a zero-copy view; the mapping is
+                # released when that view and the SharedMemory object die.
+                pass
+            except Exception:
+                pass
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "slab_count": self._slab_count,
+                "slabs_created": sum(1 for shm in self._slabs if shm is not None),
+                "slabs_leased": len(self._owners),
+                "slab_bytes": self._slab_bytes,
+            }
+
+    def _ensure_slab(self, index: int) -> SharedMemory:
+        shm = self._slabs[index]
+        if shm is None:
+            shm = SharedMemory(
+                name=f"{IMAGE_SLAB_PREFIX}{self._token}_{index}",
+                create=True,
+                size=SHARED_MEMORY_PAYLOAD_OFFSET + self._slab_bytes,
+            )
+            self._slabs[index] = shm
+        return shm
+
+    def _publish_occupancy(self) -> None:
+        if self._accounting is None:
+            return
+        self._accounting.update_slab_occupancy(
+            slab_count=self._slab_count if not self._closed else 0,
+            slabs_leased=len(self._owners),
+            slab_bytes=self._slab_bytes,
+        )
+
+
+class SharedMemoryResponseLease:
+    """Parent-side handle on one transfer payload, released exactly once.
+
+    Wraps either a pooled slab view or a per-transfer read lease so callers
+    can keep a zero-copy view alive until their upload finishes.
+    """
+
+    def __init__(
+        self,
+        descriptor: SharedMemoryDescriptor,
+        view: memoryview,
+        on_release: Callable[[bool], None],
+    ) -> None:
+        self.descriptor = descriptor
+        self._view: memoryview | None = view
+        self._on_release: Callable[[bool], None] | None = on_release
+        self.consumed = True
+
+    @property
+    def view(self) -> memoryview:
+        if self._view is None:
+            raise ValueError("Shared-memory lease already released")
+        return self._view
+
+    @property
+    def released(self) -> bool:
+        return self._on_release is None
+
+    def release(self) -> None:
+        on_release = self._on_release
+        self._on_release = None
+        if on_release is None:
+            return
+        view = self._view
+        self._view = None
+        if view is not None:
+            try:
+                view.release()
+            except Exception:
+                pass
+        on_release(self.consumed)
+
+    def __enter__(self) -> "SharedMemoryResponseLease":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.release()
+
+
 class SharedMemoryAccounting:
     """Thread-safe exact accounting for parent-visible image transfers."""
 
@@ -329,6 +633,38 @@ class SharedMemoryAccounting:
         self._segments_consumed = 0
         self._segments_reclaimed_late = 0
         self._unlink_failures = 0
+        self._slab_count = 0
+        self._slabs_leased = 0
+        self._slab_bytes = 0
+        self._slab_transfers = 0
+        self._slab_reuse_hits = 0
+        self._slab_fallbacks = 0
+
+    def update_slab_occupancy(
+        self,
+        *,
+        slab_count: int,
+        slabs_leased: int,
+        slab_bytes: int,
+    ) -> None:
+        with self._lock:
+            self._slab_count = int(slab_count)
+            self._slabs_leased = int(slabs_leased)
+            self._slab_bytes = int(slab_bytes)
+
+    def record_slab_transfer(self, *, reused: bool) -> None:
+        with self._lock:
+            self._slab_transfers += 1
+            if reused:
+                self._slab_reuse_hits += 1
+
+    def record_slab_fallback(self) -> None:
+        with self._lock:
+            self._slab_fallbacks += 1
+
+    def record_unlink_failure(self) -> None:
+        with self._lock:
+            self._unlink_failures += 1
 
     def register(self, descriptor: SharedMemoryDescriptor) -> None:
         with self._lock:
@@ -367,4 +703,10 @@ class SharedMemoryAccounting:
                 "segments_consumed": self._segments_consumed,
                 "segments_reclaimed_late": self._segments_reclaimed_late,
                 "unlink_failures": self._unlink_failures,
+                "slab_count": self._slab_count,
+                "slabs_leased": self._slabs_leased,
+                "slab_bytes": self._slab_bytes,
+                "slab_transfers": self._slab_transfers,
+                "slab_reuse_hits": self._slab_reuse_hits,
+                "slab_fallbacks": self._slab_fallbacks,
             }
@@ -7,6 +7,7 @@ Manages lifecycle of worker processes including:
 - Exponential backoff restart policy
 - Graceful shutdown integration with ResourceManager
 - Supervisor-owned correlated response waiting/buffering for shared worker queues
+- Multi-process ImageWorker pool with least-loaded dispatch
 """
 from __future__ import annotations
 
@@ -34,9 +35,17 @@ from core.process.shared_memory_transport import (
     SharedMemoryAccounting,
     SharedMemoryDescriptor,
     SharedMemoryReadLease,
+    SharedMemoryResponseLease,
+    SharedMemorySlabPool,
     dispose_malformed_shared_memory_payload,
     dispose_shared_memory_descriptor,
 )
+from core.process.worker_instances import (
+    MAX_IMAGE_WORKER_INSTANCES,
+    InstanceLoadTracker,
+    WorkerInstance,
+    default_instance_count,
+)
 
 logger = get_logger(__name__)
 
@@ -50,6 +59,10 @@ class ProcessSupervisor:
     - Exponential backoff restart policy
     - Non-blocking message passing
     - Supervisor-owned correlated response waiting/buffering
+    - Pooled shared-memory slabs for ImageWorker prescale results
+    - Several ImageWorker processes behind one WorkerType entry, each with
+      its own request queue, heartbeat and restart; requests go to the
+      instance with the fewest unanswered requests
     - Integration with ResourceManager for cleanup
     - Settings-based worker enable/disable
     
@@ -65,6 +78,20 @@ class ProcessSupervisor:
     MAX_BUFFERED_RESPONSES = 128
     POLL_TIMEOUT_MS = 10       # Non-blocking poll timeout
     
+    # Pooled ImageWorker transfer slabs: enough for one in-flight prescale
+    # per display on a three-monitor setup.  Each slab fits a 4K RGBA frame;
+    # larger results fall back to a per-transfer segment.
+    IMAGE_SLAB_COUNT = 3
+    IMAGE_SLAB_BYTES = 3840 * 2160 * 4
+    
+    _INTERNAL_RESPONSES = frozenset({
+        MessageType.WORKER_READY,
+        MessageType.HEARTBEAT_ACK,
+        MessageType.WORKER_BUSY,
+        MessageType.WORKER_IDLE,
+        MessageType.SHUTDOWN,
+    })
+    
     def __init__(
         self,
         resource_manager: Optional[Any] = None,
@@ -107,7 +134,21 @@ class ProcessSupervisor:
         self._abandoned_correlations: dict[WorkerType, dict[str, str]] = {
             wt: {} for wt in WorkerType
         }
+        # Pooled worker types: instance 0 lives in the dicts above, extra
+        # processes share its response queue but own their request queues.
+        self._extra_instances: dict[WorkerType, list[WorkerInstance]] = {
+            wt: [] for wt in WorkerType
+        }
+        self._instance_load: dict[WorkerType, InstanceLoadTracker] = {
+            wt: InstanceLoadTracker() for wt in WorkerType
+        }
+        self._ready_pids: set[int] = set()
         self._shared_memory_accounting = SharedMemoryAccounting()
+        self._image_slabs = SharedMemorySlabPool(
+            self.IMAGE_SLAB_COUNT,
+            self.IMAGE_SLAB_BYTES,
+            accounting=self._shared_memory_accounting,
+        )
         
         # Initialize health status for all worker types
         for wt in WorkerType:
@@ -215,25 +256,7 @@ class ProcessSupervisor:
                 # Without this, callers may send messages before the worker's
                 # message loop has started, causing timeouts on the first
                 # request (e.g. display 0's initial image load).
-                ready = False
-                resp_q = self._response_queues[worker_type]
-                deadline = time.time() + 10.0  # 10s max wait
-                while time.time() < deadline and process.is_alive():
-                    try:
-                        data = resp_q.get(timeout=0.25)
-                        resp = self._response_from_data(data)
-                        if resp.msg_type == MessageType.WORKER_READY:
-                            ready = True
-                            break
-                        if self._process_internal_response(worker_type, resp):
-                            continue
-                        if self._dispose_if_abandoned(worker_type, resp):
-                            continue
-                        self._buffer_response(worker_type, resp)
-                    except QueueEmpty:
-                        continue
-                    except Exception:
-                        break
+                ready = self._await_worker_ready(worker_type, process)
                 
                 if not ready:
                     logger.error(
@@ -249,6 +272,11 @@ class ProcessSupervisor:
                 self._health[worker_type].record_heartbeat()
                 logger.info("%s worker ready", worker_type.value)
                 
+                # Extra instances report ready on their own threads and only
+                # join the dispatch rotation once they do.
+                for index in range(1, self._instance_count(worker_type)):
+                    self._start_instance(worker_type, index)
+                
                 # Start heartbeat monitoring if not already running
                 self._ensure_heartbeat_monitoring()
                 
@@ -280,41 +308,56 @@ class ProcessSupervisor:
                 return True
             
             process = self._workers[worker_type]
-            if not process.is_alive():
+            extras = [
+                instance
+                for instance in self._extra_instances[worker_type]
+                if instance.is_alive()
+            ]
+            if not process.is_alive() and not extras:
                 self._cleanup_worker(worker_type)
                 return True
             
             self._health[worker_type].state = WorkerState.STOPPING
             
             try:
-                # Send shutdown message
-                shutdown_msg = WorkerMessage(
-                    msg_type=MessageType.SHUTDOWN,
-                    seq_no=self._next_seq(worker_type),
-                    correlation_id=str(uuid.uuid4()),
-                    worker_type=worker_type,
-                )
-                
                 req_queue = self._request_queues.get(worker_type)
-                if req_queue is None:
+                if req_queue is None and not extras:
                     return False
-                try:
-                    req_queue.put_nowait(shutdown_msg.to_dict())
-                except Exception:
-                    pass
+                targets = []
+                if req_queue is not None and process.is_alive():
+                    targets.append((process, req_queue))
+                for instance in extras:
+                    instance.health.state = WorkerState.STOPPING
+                    targets.append((instance.process, instance.request_queue))
+                
+                # Send shutdown message to every instance
+                for _, queue in targets:
+                    shutdown_msg = WorkerMessage(
+                        msg_type=MessageType.SHUTDOWN,
+                        seq_no=self._next_seq(worker_type),
+                        correlation_id=str(uuid.uuid4()),
+                        worker_type=worker_type,
+                    )
+                    try:
+                        queue.put_nowait(shutdown_msg.to_dict())
+                    except Exception:
+                        pass
                 
                 # Drain response resources while waiting.  In particular this
                 # acknowledges a published ImageWorker mapping so the worker
                 # can close its producer handle and reach SHUTDOWN cleanly.
                 deadline = time.monotonic() + max(0.0, float(timeout))
-                while process.is_alive() and time.monotonic() < deadline:
+                while time.monotonic() < deadline:
+                    alive = [proc for proc, _ in targets if proc.is_alive()]
+                    if not alive:
+                        break
                     self._drain_worker_response_queue(
                         worker_type,
                         dispose_application=True,
                         reason="worker_stopping",
                     )
                     remaining = max(0.0, deadline - time.monotonic())
-                    process.join(timeout=min(0.05, remaining))
+                    alive[0].join(timeout=min(0.05, remaining))
 
                 self._drain_worker_response_queue(
                     worker_type,
@@ -322,21 +365,8 @@ class ProcessSupervisor:
                     reason="worker_stopping",
                 )
                 
-                if process.is_alive():
-                    logger.warning(
-                        "%s worker did not stop gracefully, terminating",
-                        worker_type.value,
-                    )
-                    process.terminate()
-                    process.join(timeout=PROCESS_TERMINATE_TIMEOUT_S)
-                    
-                    if process.is_alive():
-                        logger.error(
-                            "%s worker did not terminate, killing",
-                            worker_type.value,
-                        )
-                        process.kill()
-                        process.join(timeout=PROCESS_TERMINATE_TIMEOUT_S)
+                for proc, _ in targets:
+                    self._terminate_process(worker_type, proc)
                 
                 self._cleanup_worker(worker_type)
                 logger.info("Stopped %s worker", worker_type.value)
@@ -407,17 +437,21 @@ class ProcessSupervisor:
             Correlation ID if sent, None if queue full or worker not running
         """
         with self._lock:
-            if worker_type not in self._workers:
-                return None
-            
-            if not self._workers[worker_type].is_alive():
-                return None
-            
-            req_queue = self._request_queues.get(worker_type)
-            if not req_queue:
+            targets = self._live_request_targets(worker_type)
+            if not targets:
                 return None
             
             corr_id = correlation_id or str(uuid.uuid4())
+            if (
+                worker_type == WorkerType.IMAGE
+                and msg_type == MessageType.IMAGE_PRESCALE
+            ):
+                ticket = self._image_slabs.lease(corr_id)
+                if ticket is not None:
+                    payload = {
+                        **payload,
+                        "shared_memory_slab": ticket.payload_fields(),
+                    }
             message = WorkerMessage(
                 msg_type=msg_type,
                 seq_no=self._next_seq(worker_type),
@@ -432,20 +466,41 @@ class ProcessSupervisor:
                     "Message payload too large for %s worker",
                     worker_type.value,
                 )
+                self._image_slabs.release(corr_id)
                 return None
             
-            try:
-                req_queue.put_nowait(message.to_dict())
+            if msg_type == MessageType.CONFIG_UPDATE and len(targets) > 1:
+                # Every instance must see configuration changes; only the
+                # first instance's reply is delivered to the caller.
+                for _index, extra_queue in targets[1:]:
+                    extra_id = str(uuid.uuid4())
+                    self._abandoned_correlations[worker_type][extra_id] = "config_broadcast"
+                    self._put_request(
+                        worker_type,
+                        extra_queue,
+                        WorkerMessage(
+                            msg_type=msg_type,
+                            seq_no=self._next_seq(worker_type),
+                            correlation_id=extra_id,
+                            payload=payload,
+                            worker_type=worker_type,
+                        ),
+                    )
+                targets = targets[:1]
+            
+            # Least-loaded dispatch: fewest unanswered requests, lowest index
+            # on ties so a single-instance pool behaves exactly as before.
+            load = self._instance_load[worker_type]
+            index, req_queue = min(
+                targets,
+                key=lambda target: (load.load(target[0]), target[0]),
+            )
+            load.record_dispatch(index, corr_id)
+            if self._put_request(worker_type, req_queue, message):
                 return corr_id
-            except Exception:
-                # Queue full - drop oldest policy
-                try:
-                    req_queue.get_nowait()  # Drop oldest
-                    req_queue.put_nowait(message.to_dict())
-                    logger.debug("Dropped oldest message for %s worker", worker_type.value)
-                    return corr_id
-                except Exception:
-                    return None
+            load.forget(corr_id)
+            self._image_slabs.release(corr_id)
+            return None
     
     def poll_responses(
         self,
@@ -596,9 +651,12 @@ class ProcessSupervisor:
             True if worker process is alive and running
         """
         with self._lock:
-            if worker_type not in self._workers:
-                return False
-            return self._workers[worker_type].is_alive()
+            if worker_type in self._workers and self._workers[worker_type].is_alive():
+                return True
+            return any(
+                instance.is_alive()
+                for instance in self._extra_instances[worker_type]
+            )
     
     def get_health(self, worker_type: WorkerType) -> HealthStatus:
         """Get health status for a worker."""
@@ -688,6 +746,7 @@ class ProcessSupervisor:
                 diagnostics["shared_memory"] = (
                     self._shared_memory_accounting.snapshot()
                 )
+            diagnostics["instances"] = self._instance_snapshots(worker_type)
             
             return diagnostics
 
@@ -696,12 +755,22 @@ class ProcessSupervisor:
         return self._shared_memory_accounting.snapshot()
 
     def get_image_worker_usage_snapshot(self) -> dict[str, Any]:
-        """Return PID-labelled ImageWorker RSS plus shared-memory accounting."""
+        """Return PID-labelled ImageWorker RSS plus shared-memory accounting.
+
+        The top-level ``image_worker_*`` fields describe instance 0; the
+        per-instance list adds queue depth, in-flight count and response
+        latency for every ImageWorker process.
+        """
         diagnostics = self.get_detailed_health(WorkerType.IMAGE)
+        instances = diagnostics.get("instances") or []
         snapshot: dict[str, Any] = {
             "image_worker_pid": diagnostics.get("process_pid"),
             "image_worker_rss_mb": diagnostics.get("memory_rss_mb"),
             "image_worker_vms_mb": diagnostics.get("memory_vms_mb"),
+            "image_worker_instance_count": sum(
+                1 for instance in instances if instance.get("alive")
+            ),
+            "image_worker_instances": instances,
         }
         snapshot.update(self._shared_memory_accounting.snapshot())
         return snapshot
@@ -712,25 +781,65 @@ class ProcessSupervisor:
         consumer: Callable[[memoryview, SharedMemoryDescriptor], Any],
     ) -> Any:
         """Consume one response mapping and finalize it exactly once."""
+        lease = self.lease_shared_memory_response(response)
+        lease.consumed = False
+        try:
+            result = consumer(lease.view, lease.descriptor)
+            lease.consumed = True
+            return result
+        finally:
+            lease.release()
+
+    def lease_shared_memory_response(
+        self,
+        response: WorkerResponse,
+    ) -> SharedMemoryResponseLease:
+        """Claim a response payload as a view that stays valid until released.
+
+        Pooled slabs go back to the ring on release; per-transfer segments
+        are closed and unlinked.  Callers wanting zero-copy access keep the
+        lease until their upload finishes.
+        """
         descriptor = self._claim_shared_memory_descriptor(response)
         if descriptor is None:
             raise ValueError("Worker response has no shared-memory descriptor")
 
-        lease = SharedMemoryReadLease(descriptor)
-        consumed = False
+        if descriptor.pooled:
+            owner = response.correlation_id
+            try:
+                view, reused = self._image_slabs.hold(owner, descriptor)
+            except Exception:
+                self._image_slabs.release(owner)
+                raise
+            self._shared_memory_accounting.record_slab_transfer(reused=reused)
+
+            def _release_slab(_consumed: bool) -> None:
+                self._image_slabs.release(owner)
+
+            return SharedMemoryResponseLease(descriptor, view, _release_slab)
+
+        read_lease = SharedMemoryReadLease(descriptor)
         try:
-            payload_view = lease.open()
-            result = consumer(payload_view, descriptor)
-            consumed = True
-            return result
-        finally:
-            lease.close()
+            payload_view = read_lease.open()
+        except Exception:
+            read_lease.close()
+            self._shared_memory_accounting.finalize(
+                descriptor,
+                consumed=False,
+                unlink_failed=read_lease.unlink_failed,
+            )
+            raise
+
+        def _release_segment(consumed: bool) -> None:
+            read_lease.close()
             self._shared_memory_accounting.finalize(
                 descriptor,
                 consumed=consumed,
-                unlink_failed=lease.unlink_failed,
+                unlink_failed=read_lease.unlink_failed,
             )
 
+        return SharedMemoryResponseLease(descriptor, payload_view, _release_segment)
+
     def dispose_response(
         self,
         response: WorkerResponse,
@@ -738,6 +847,9 @@ class ProcessSupervisor:
         reason: str,
     ) -> bool:
         """Release payload-owned resources from a discarded response."""
+        # A discarded prescale never reaches a consumer, so its slab lease
+        # (if any) returns to the ring whatever the payload looks like.
+        slab_released = self._image_slabs.release(response.correlation_id)
         try:
             descriptor = self._claim_shared_memory_descriptor(response)
         except Exception as e:
@@ -758,9 +870,11 @@ class ProcessSupervisor:
                 emergency_descriptor is not None,
                 e,
             )
-            return emergency_descriptor is not None
+            return emergency_descriptor is not None or slab_released
         if descriptor is None:
-            return False
+            return slab_released
+        if descriptor.pooled:
+            return slab_released
 
         _opened, unlink_failed = dispose_shared_memory_descriptor(descriptor)
         self._shared_memory_accounting.finalize(
@@ -861,19 +975,25 @@ class ProcessSupervisor:
             except Exception as e:
                 logger.error("Error stopping %s worker: %s", worker_type.value, e)
 
+        self._image_slabs.close()
+
         if is_perf_metrics_enabled():
             shared = self._shared_memory_accounting.snapshot()
             logger.info(
                 "[PERF] [WORKER] shared_memory_final "
                 "segments_created=%d segments_live=%d live_bytes=%d "
                 "segments_consumed=%d segments_reclaimed_late=%d "
-                "unlink_failures=%d",
+                "unlink_failures=%d slab_transfers=%d slab_reuse_hits=%d "
+                "slab_fallbacks=%d",
                 shared["segments_created"],
                 shared["segments_live"],
                 shared["live_bytes"],
                 shared["segments_consumed"],
                 shared["segments_reclaimed_late"],
                 shared["unlink_failures"],
+                shared["slab_transfers"],
+                shared["slab_reuse_hits"],
+                shared["slab_fallbacks"],
             )
         logger.info("ProcessSupervisor shutdown complete")
     
@@ -889,16 +1009,20 @@ class ProcessSupervisor:
     def _process_internal_response(self, worker_type: WorkerType, response: WorkerResponse) -> bool:
         """Apply supervisor-owned side effects for internal worker responses."""
         if response.msg_type == MessageType.WORKER_READY:
+            pid = response.payload.get("pid") if response.payload else None
+            if isinstance(pid, int):
+                with self._lock:
+                    self._ready_pids.add(pid)
             return True
 
         if response.msg_type == MessageType.HEARTBEAT_ACK:
             with self._lock:
-                self._health[worker_type].record_heartbeat()
+                self._health_for_response(worker_type, response).record_heartbeat()
             return True
 
         if response.msg_type == MessageType.WORKER_BUSY:
             with self._lock:
-                self._health[worker_type].set_busy(True)
+                self._health_for_response(worker_type, response).set_busy(True)
                 if is_perf_metrics_enabled():
                     logger.debug(
                         "[PERF] [WORKER] %s marked as BUSY",
@@ -908,23 +1032,51 @@ class ProcessSupervisor:
 
         if response.msg_type == MessageType.WORKER_IDLE:
             with self._lock:
-                self._health[worker_type].set_busy(False)
-                self._health[worker_type].record_heartbeat()
+                health = self._health_for_response(worker_type, response)
+                health.set_busy(False)
+                health.record_heartbeat()
             return True
 
         return False
 
+    def _health_for_response(
+        self,
+        worker_type: WorkerType,
+        response: WorkerResponse,
+    ) -> HealthStatus:
+        """Return the health record of the instance that sent *response*."""
+        pid = response.payload.get("pid") if response.payload else None
+        if pid is not None:
+            for instance in self._extra_instances[worker_type]:
+                if instance.health.pid == pid:
+                    return instance.health
+        return self._health[worker_type]
+
     def _response_from_data(self, data: Any) -> WorkerResponse:
         """Decode one queue item and register any resource descriptor."""
         response = WorkerResponse.from_dict(data)
+        if response.correlation_id and response.msg_type not in self._INTERNAL_RESPONSES:
+            with self._lock:
+                for load in self._instance_load.values():
+                    if load.record_completion(response.correlation_id) is not None:
+                        break
         try:
             descriptor = SharedMemoryDescriptor.from_payload(response.payload)
         except Exception:
             # The response remains caller-owned so the normal disposal path can
             # report the malformed descriptor without silently losing it.
             descriptor = None
-        if descriptor is not None:
+        if descriptor is not None and not descriptor.pooled:
             self._shared_memory_accounting.register(descriptor)
+            if self._image_slabs.enabled:
+                self._shared_memory_accounting.record_slab_fallback()
+        if (
+            response.msg_type == MessageType.IMAGE_RESULT
+            and (descriptor is None or not descriptor.pooled)
+        ):
+            # The worker answered without using its slab (small result,
+            # oversize fallback or failure): return the lease immediately.
+            self._image_slabs.release(response.correlation_id)
         return response
 
     def _claim_shared_memory_descriptor(
@@ -937,7 +1089,8 @@ class ProcessSupervisor:
         # Claim by removing the handle.  Repeated finalizers are therefore
         # harmless even when shutdown races a consumer exception.
         response.payload.pop("shared_memory_name", None)
-        self._shared_memory_accounting.register(descriptor)
+        if not descriptor.pooled:
+            self._shared_memory_accounting.register(descriptor)
         return descriptor
 
     def _dispose_if_abandoned(
@@ -1102,26 +1255,478 @@ class ProcessSupervisor:
         
         # Close queues
         for queue_dict in [self._request_queues, self._response_queues]:
-            queue = queue_dict.pop(worker_type, None)
-            if queue:
-                try:
-                    queue.cancel_join_thread()
-                except Exception as e:
-                    logger.debug("[WORKER] Exception suppressed: %s", e)
-                try:
-                    queue.close()
-                except Exception as e:
-                    logger.debug("[WORKER] Exception suppressed: %s", e)
-                try:
-                    queue.join_thread()
-                except Exception as e:
-                    logger.debug("[WORKER] Exception suppressed: %s", e)
+            self._close_queue(queue_dict.pop(worker_type, None))
         
+        for instance in self._extra_instances[worker_type]:
+            self._retire_instance(worker_type, instance.process, instance.request_queue)
+            instance.process = None
+            instance.request_queue = None
+            instance.health.state = WorkerState.STOPPED
+            instance.health.pid = None
+        self._extra_instances[worker_type].clear()
+        self._instance_load[worker_type].clear()
+
+        if worker_type == WorkerType.IMAGE:
+            self._image_slabs.release_pending()
+
         self._health[worker_type].state = WorkerState.STOPPED
         self._health[worker_type].pid = None
         self._abandoned_correlations[worker_type].clear()
         self._broadcast_health(worker_type)
     
+    def _instance_count(self, worker_type: WorkerType) -> int:
+        """Return how many processes to run for *worker_type*.
+
+        ``workers.<type>.instances`` overrides the core-count default; only
+        the ImageWorker is pooled.
+        """
+        if worker_type != WorkerType.IMAGE:
+            return 1
+        configured = 0
+        if self._settings_manager:
+            try:
+                configured = int(
+                    self._settings_manager.get(
+                        f"workers.{worker_type.value}.instances",
+                        0,
+                    )
+                    or 0
+                )
+            except Exception as e:
+                logger.debug("[WORKER] Exception suppressed: %s", e)
+                configured = 0
+        if configured <= 0:
+            configured = default_instance_count(worker_type)
+        return max(1, min(MAX_IMAGE_WORKER_INSTANCES, configured))
+
+    def _live_request_targets(self, worker_type: WorkerType) -> list[tuple[int, Queue]]:
+        """Return ``(index, request queue)`` for each live instance (must hold lock)."""
+        targets: list[tuple[int, Queue]] = []
+        process = self._workers.get(worker_type)
+        req_queue = self._request_queues.get(worker_type)
+        if process is not None and req_queue is not None and process.is_alive():
+            targets.append((0, req_queue))
+        for instance in self._extra_instances[worker_type]:
+            if (
+                instance.request_queue is not None
+                and instance.health.state == WorkerState.RUNNING
+                and instance.is_alive()
+            ):
+                targets.append((instance.index, instance.request_queue))
+        return targets
+
+    def _put_request(
+        self,
+        worker_type: WorkerType,
+        req_queue: Queue,
+        message: WorkerMessage,
+    ) -> bool:
+        """Enqueue *message* with the drop-oldest policy (must hold lock)."""
+        try:
+            req_queue.put_nowait(message.to_dict())
+            return True
+        except Exception:
+            # Queue full - drop oldest policy
+            try:
+                dropped = req_queue.get_nowait()  # Drop oldest
+                if isinstance(dropped, dict):
+                    dropped_id = str(dropped.get("correlation_id") or "")
+                    self._instance_load[worker_type].forget(dropped_id)
+                    self._image_slabs.release(dropped_id)
+                req_queue.put_nowait(message.to_dict())
+                logger.debug("Dropped oldest message for %s worker", worker_type.value)
+                return True
+            except Exception:
+                return False
+
+    def _spawn_process(
+        self,
+        worker_type: WorkerType,
+        index: int,
+        request_queue: Queue,
+        response_queue: Queue,
+    ) -> mp.Process:
+        """Start one worker process (must hold lock)."""
+        name = f"SRPSS_{worker_type.value}_worker"
+        if index:
+            name = f"{name}_{index}"
+        process = mp.Process(
+            target=self._worker_factories[worker_type],
+            args=(request_queue, response_queue),
+            name=name,
+            daemon=True,  # Die with parent
+        )
+        process.start()
+        return process
+
+    def _await_worker_ready(
+        self,
+        worker_type: WorkerType,
+        process: mp.Process,
+        timeout_s: float = 10.0,
+    ) -> bool:
+        """Wait for *process* to send WORKER_READY (must hold lock).
+
+        Pooled instances share a response queue that other threads may be
+        reading, so a READY consumed elsewhere is matched by pid instead.
+        """
+        resp_q = self._response_queues[worker_type]
+        deadline = time.time() + timeout_s
+        while time.time() < deadline and process.is_alive():
+            if process.pid in self._ready_pids:
+                self._ready_pids.discard(process.pid)
+                return True
+            try:
+                data = resp_q.get(timeout=0.25)
+                resp = self._response_from_data(data)
+                if resp.msg_type == MessageType.WORKER_READY:
+                    pid = resp.payload.get("pid") if resp.payload else None
+                    if pid is None or pid == process.pid:
+                        return True
+                    self._ready_pids.add(pid)
+                    continue
+                if self._process_internal_response(worker_type, resp):
+                    continue
+                if self._dispose_if_abandoned(worker_type, resp):
+                    continue
+                self._buffer_response(worker_type, resp)
+            except QueueEmpty:
+                continue
+            except Exception:
+                break
+        return False
+
+    def _start_instance(self, worker_type: WorkerType, index: int) -> bool:
+        """Spawn extra instance *index* on the shared response queue (must hold lock).
+
+        Returns once the process is started; readiness is awaited on a
+        separate thread by :meth:`_await_instance_ready`.
+        """
+        response_queue = self._response_queues.get(worker_type)
+        if response_queue is None or worker_type not in self._worker_factories:
+            return False
+        instance = next(
+            (item for item in self._extra_instances[worker_type] if item.index == index),
+            None,
+        )
+        if instance is None:
+            instance = WorkerInstance(
+                index=index,
+                health=HealthStatus(worker_type=worker_type, state=WorkerState.STOPPED),
+            )
+            self._extra_instances[worker_type].append(instance)
+        instance.health.state = WorkerState.STARTING
+        try:
+            instance.request_queue = Queue(self.REQUEST_QUEUE_SIZE)
+            instance.process = self._spawn_process(
+                worker_type,
+                index,
+                instance.request_queue,
+                response_queue,
+            )
+        except Exception as e:
+            logger.warning(
+                "[FALLBACK] Failed to start %s worker instance %d: %s",
+                worker_type.value,
+                index,
+                e,
+            )
+            self._close_queue(instance.request_queue)
+            instance.request_queue = None
+            instance.process = None
+            instance.health.state = WorkerState.ERROR
+            instance.health.error_message = str(e)
+            return False
+
+        instance.health.pid = instance.process.pid
+        # POLICY EXEMPTION: plain thread for the same reason as the heartbeat
+        # timer; ThreadManager needs a QCoreApplication.
+        threading.Thread(
+            target=self._await_instance_ready,
+            args=(worker_type, instance, instance.process),
+            name=f"SRPSS_{worker_type.value}_ready_{index}",
+            daemon=True,
+        ).start()
+        return True
+
+    def _await_instance_ready(
+        self,
+        worker_type: WorkerType,
+        instance: WorkerInstance,
+        process: mp.Process,
+        timeout_s: float = 10.0,
+    ) -> bool:
+        """Promote *instance* to RUNNING once *process* sends WORKER_READY.
+
+        Runs without holding the lock between polls, so dispatch and
+        heartbeat restarts keep going while the process boots. Until then the
+        instance stays STARTING, which keeps it out of the dispatch rotation.
+        """
+        deadline = time.time() + timeout_s
+        while True:
+            with self._lock:
+                if self._shutdown or instance.process is not process:
+                    # Stopped or restarted while booting.
+                    return False
+                if process.pid in self._ready_pids:
+                    self._ready_pids.discard(process.pid)
+                    instance.health.state = WorkerState.RUNNING
+                    instance.health.record_heartbeat()
+                    logger.info(
+                        "%s worker instance %d ready (PID: %d)",
+                        worker_type.value,
+                        instance.index,
+                        process.pid,
+                    )
+                    return True
+                if time.time() >= deadline or not process.is_alive():
+                    logger.warning(
+                        "[FALLBACK] %s worker instance %d never signalled ready; "
+                        "continuing with fewer instances",
+                        worker_type.value,
+                        instance.index,
+                    )
+                    instance.health.state = WorkerState.ERROR
+                    instance.health.error_message = "Worker never signalled ready"
+                    return False
+            # READY may also be picked up by any other reader of the shared
+            # response queue; both paths record it in _ready_pids.
+            self._drain_worker_response_queue(
+                worker_type,
+                dispose_application=False,
+                reason="instance_ready_drain",
+                max_count=20,
+            )
+            time.sleep(0.05)
+
+
+    def _restart_instance(self, worker_type: WorkerType, index: int) -> bool:
+        """Restart one process of a pooled worker type, leaving the others running."""
+        with self._lock:
+            if self._shutdown or worker_type not in self._workers:
+                return False
+            instance = next(
+                (
+                    item
+                    for item in self._extra_instances[worker_type]
+                    if item.index == index
+                ),
+                None,
+            )
+            if index and instance is None:
+                return False
+            health = instance.health if instance else self._health[worker_type]
+            if not health.should_restart():
+                logger.warning(
+                    "Cannot restart %s worker instance %d: restart limit exceeded",
+                    worker_type.value,
+                    index,
+                )
+                return False
+
+            if instance is None:
+                process = self._workers.get(worker_type)
+                request_queue = self._request_queues.pop(worker_type, None)
+            else:
+                process, request_queue = instance.process, instance.request_queue
+                instance.process = None
+                instance.request_queue = None
+            health.state = WorkerState.RESTARTING
+            health.record_restart()
+            backoff_ms = health.get_restart_backoff_ms()
+            logger.info(
+                "Restarting %s worker instance %d after %dms backoff (attempt %d)",
+                worker_type.value,
+                index,
+                backoff_ms,
+                health.restart_count,
+            )
+            # Index 0's Process object stays in _workers until replaced so
+            # stop()/is_running() keep seeing a (dead) primary.
+            self._retire_instance(worker_type, process, request_queue, close=index != 0)
+            for correlation_id in self._instance_load[worker_type].reset_instance(index):
+                self._image_slabs.release(correlation_id)
+
+        time.sleep(backoff_ms / 1000.0)
+
+        with self._lock:
+            if self._shutdown or worker_type not in self._workers:
+                return False
+            if index:
+                return self._start_instance(worker_type, index)
+
+            try:
+                request_queue = Queue(self.REQUEST_QUEUE_SIZE)
+                process = self._spawn_process(
+                    worker_type,
+                    0,
+                    request_queue,
+                    self._response_queues[worker_type],
+                )
+            except Exception as e:
+                logger.exception("Failed to restart %s worker: %s", worker_type.value, e)
+                health.state = WorkerState.ERROR
+                health.error_message = str(e)
+                self._broadcast_health(worker_type)
+                return False
+            previous = self._workers.get(worker_type)
+            self._workers[worker_type] = process
+            self._request_queues[worker_type] = request_queue
+            if previous is not None:
+                try:
+                    previous.close()
+                except Exception as e:
+                    logger.debug("[WORKER] Exception suppressed: %s", e)
+            health.pid = process.pid
+            if not self._await_worker_ready(worker_type, process):
+                health.state = WorkerState.ERROR
+                health.error_message = "Worker never signalled ready"
+                self._broadcast_health(worker_type)
+                return False
+            health.state = WorkerState.RUNNING
+            health.record_heartbeat()
+            self._broadcast_health(worker_type)
+            return True
+
+    def _check_instance_health(
+        self,
+        worker_type: WorkerType,
+        index: int,
+        process: Optional[mp.Process],
+        request_queue: Optional[Queue],
+        health: HealthStatus,
+    ) -> bool:
+        """Heartbeat one instance; returns True if it needs a restart (must hold lock)."""
+        if process is None or not process.is_alive():
+            if health.state != WorkerState.ERROR:
+                logger.warning(
+                    "%s worker process died unexpectedly (instance %d)",
+                    worker_type.value,
+                    index,
+                )
+            health.state = WorkerState.ERROR
+            health.error_message = "Process died"
+            return True
+
+        # Send heartbeat
+        if request_queue is not None:
+            self._put_request(
+                worker_type,
+                request_queue,
+                WorkerMessage(
+                    msg_type=MessageType.HEARTBEAT,
+                    seq_no=self._next_seq(worker_type),
+                    correlation_id=str(uuid.uuid4()),
+                    payload={"timestamp": time.time()},
+                    worker_type=worker_type,
+                ),
+            )
+
+        # Check for missed heartbeats
+        time_since_heartbeat = time.time() - health.last_heartbeat
+        if time_since_heartbeat > self._heartbeat_interval_s * 2:
+            health.record_missed_heartbeat()
+            if is_perf_metrics_enabled():
+                logger.warning(
+                    "[PERF] [WORKER] %s missed heartbeat (%d consecutive, instance %d)",
+                    worker_type.value,
+                    health.missed_heartbeats,
+                    index,
+                )
+            return health.should_restart()
+        return False
+
+    def _terminate_process(self, worker_type: WorkerType, process: Optional[mp.Process]) -> None:
+        """Terminate, then kill, a process that ignored SHUTDOWN."""
+        if process is None or not process.is_alive():
+            return
+        logger.warning(
+            "%s worker did not stop gracefully, terminating",
+            worker_type.value,
+        )
+        process.terminate()
+        process.join(timeout=PROCESS_TERMINATE_TIMEOUT_S)
+        
+        if process.is_alive():
+            logger.error(
+                "%s worker did not terminate, killing",
+                worker_type.value,
+            )
+            process.kill()
+            process.join(timeout=PROCESS_TERMINATE_TIMEOUT_S)
+
+    def _retire_instance(
+        self,
+        worker_type: WorkerType,
+        process: Optional[mp.Process],
+        request_queue: Optional[Queue],
+        *,
+        close: bool = True,
+    ) -> None:
+        """Stop one instance's process and release its request queue (must hold lock)."""
+        if process is not None:
+            try:
+                self._terminate_process(worker_type, process)
+                if close:
+                    process.close()
+            except Exception as e:
+                logger.debug("[WORKER] Exception suppressed: %s", e)
+        self._close_queue(request_queue)
+
+    @staticmethod
+    def _close_queue(queue: Optional[Queue]) -> None:
+        if not queue:
+            return
+        try:
+            queue.cancel_join_thread()
+        except Exception as e:
+            logger.debug("[WORKER] Exception suppressed: %s", e)
+        try:
+            queue.close()
+        except Exception as e:
+            logger.debug("[WORKER] Exception suppressed: %s", e)
+        try:
+            queue.join_thread()
+        except Exception as e:
+            logger.debug("[WORKER] Exception suppressed: %s", e)
+
+    def _instance_snapshots(self, worker_type: WorkerType) -> list[dict[str, Any]]:
+        """Per-instance queue depth, load and latency (must hold lock)."""
+        load = self._instance_load[worker_type]
+        rows = [(
+            0,
+            self._workers.get(worker_type),
+            self._request_queues.get(worker_type),
+            self._health[worker_type],
+        )]
+        rows.extend(
+            (instance.index, instance.process, instance.request_queue, instance.health)
+            for instance in self._extra_instances[worker_type]
+        )
+        snapshots: list[dict[str, Any]] = []
+        for index, process, request_queue, health in rows:
+            if process is None and index == 0:
+                continue
+            try:
+                queue_depth = request_queue.qsize() if request_queue else 0
+            except Exception:
+                queue_depth = -1  # Queue doesn't support qsize
+            try:
+                alive = bool(process is not None and process.is_alive())
+            except Exception:
+                alive = False
+            snapshots.append({
+                "index": index,
+                "pid": health.pid,
+                "state": health.state.name,
+                "alive": alive,
+                "busy": health.is_busy,
+                "queue_depth": queue_depth,
+                "restart_count": health.restart_count,
+                **load.stats(index),
+            })
+        return snapshots
+
     def _ensure_heartbeat_monitoring(self) -> None:
         """Start heartbeat monitoring if not already running.
 
@@ -1144,6 +1749,7 @@ class ProcessSupervisor:
             return
         
         workers_to_restart = []
+        instances_to_restart = []
         
         # First, poll ALL worker response queues to process any pending HEARTBEAT_ACKs
         # This is CRITICAL - without this, heartbeat responses are never processed
@@ -1162,37 +1768,30 @@ class ProcessSupervisor:
         
         with self._lock:
             for worker_type, process in list(self._workers.items()):
-                if not process.is_alive():
-                    logger.warning(
-                        "%s worker process died unexpectedly",
-                        worker_type.value,
-                    )
-                    self._health[worker_type].state = WorkerState.ERROR
-                    self._health[worker_type].error_message = "Process died"
-                    workers_to_restart.append(worker_type)
-                    continue
-                
-                # Send heartbeat
-                self.send_message(
+                pooled = bool(self._extra_instances[worker_type])
+                if self._check_instance_health(
                     worker_type,
-                    MessageType.HEARTBEAT,
-                    {"timestamp": time.time()},
-                )
-                
-                # Check for missed heartbeats
-                health = self._health[worker_type]
-                time_since_heartbeat = time.time() - health.last_heartbeat
-                if time_since_heartbeat > self._heartbeat_interval_s * 2:
-                    health.record_missed_heartbeat()
-                    if is_perf_metrics_enabled():
-                        logger.warning(
-                            "[PERF] [WORKER] %s missed heartbeat (%d consecutive)",
-                            worker_type.value,
-                            health.missed_heartbeats,
-                        )
-                    
-                    if health.should_restart():
+                    0,
+                    process,
+                    self._request_queues.get(worker_type),
+                    self._health[worker_type],
+                ):
+                    if pooled:
+                        instances_to_restart.append((worker_type, 0))
+                    else:
                         workers_to_restart.append(worker_type)
+                for instance in self._extra_instances[worker_type]:
+                    if instance.health.state == WorkerState.STARTING:
+                        # Still booting; _await_instance_ready owns it.
+                        continue
+                    if self._check_instance_health(
+                        worker_type,
+                        instance.index,
+                        instance.process,
+                        instance.request_queue,
+                        instance.health,
+                    ):
+                        instances_to_restart.append((worker_type, instance.index))
         
         # Restart unhealthy workers (outside lock)
         for worker_type in workers_to_restart:
@@ -1200,6 +1799,16 @@ class ProcessSupervisor:
                 self.restart(worker_type)
             except Exception as e:
                 logger.exception("Failed to restart %s worker: %s", worker_type.value, e)
+        for worker_type, index in instances_to_restart:
+            try:
+                self._restart_instance(worker_type, index)
+            except Exception as e:
+                logger.exception(
+                    "Failed to restart %s worker instance %d: %s",
+                    worker_type.value,
+                    index,
+                    e,
+                )
         
         # Schedule next check
         if not self._shutdown:
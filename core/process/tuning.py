@@ -78,6 +78,13 @@ _DEFAULT_CONFIGS: Dict[WorkerType, WorkerTuningConfig] = {
         target_latency_ms=200,      # Precompute can be slow
         max_latency_ms=1000,
     ),
+    WorkerType.AUDIO: WorkerTuningConfig(
+        request_queue_size=8,       # Only attach/detach use the queue
+        response_queue_size=8,      # PCM and results travel via shared memory
+        backpressure_policy=BackpressurePolicy.DROP_NEW,
+        target_latency_ms=20,       # Attach seeds DSP state once
+        max_latency_ms=250,
+    ),
 }
 
 
@@ -23,6 +23,7 @@ class WorkerType(Enum):
     IMAGE = "image"           # decode/prescale with path|scaled:WxH cache keys
     RSS = "rss"               # fetch/parse/mirror with validated ImageMetadata
     TRANSITION = "transition" # CPU precompute payloads
+    AUDIO = "audio"           # visualizer DSP over shared-memory PCM blocks
 
 
 class WorkerState(Enum):
@@ -60,6 +61,10 @@ class MessageType(Enum):
     TRANSITION_PRECOMPUTE = "transition_precompute"
     TRANSITION_RESULT = "transition_result"
     
+    # Audio analysis worker messages
+    AUDIO_ATTACH = "audio_attach"
+    AUDIO_DETACH = "audio_detach"
+    
     # Error messages
     ERROR = "error"
 
@@ -84,6 +89,7 @@ class WorkerMessage:
     MAX_IMAGE_PAYLOAD = 50 * 1024 * 1024   # 50MB for large images
     MAX_RSS_PAYLOAD = 1 * 1024 * 1024      # 1MB for RSS data
     MAX_TRANSITION_PAYLOAD = 1 * 1024 * 1024  # 1MB for transition data
+    MAX_AUDIO_PAYLOAD = 4 * 1024 * 1024    # 4MB for the seeded DSP state
     
     def validate_size(self) -> bool:
         """Validate payload size against channel limits."""
@@ -94,6 +100,7 @@ class WorkerMessage:
             WorkerType.IMAGE: self.MAX_IMAGE_PAYLOAD,
             WorkerType.RSS: self.MAX_RSS_PAYLOAD,
             WorkerType.TRANSITION: self.MAX_TRANSITION_PAYLOAD,
+            WorkerType.AUDIO: self.MAX_AUDIO_PAYLOAD,
         }
         
         if self.worker_type and self.worker_type in limits:
@@ -0,0 +1,140 @@
+"""
+Per-instance bookkeeping for worker types that run more than one process.
+
+A pooled worker type (currently only the ImageWorker) keeps one request
+queue per process and a single shared response queue.  The supervisor
+dispatches each request to the least-loaded live instance, measured by the
+number of correlated requests still awaiting a response, so a decode that
+stalls one process never holds up prescales for the other displays.
+
+Instance 0 always lives in the supervisor's per-``WorkerType`` dicts so
+single-process worker types behave exactly as before.
+"""
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from multiprocessing import Queue
+from typing import Any, Optional
+
+from core.process.types import HealthStatus, WorkerType
+
+# Upper bound on ImageWorker processes.  Each one holds a PIL decode working
+# set, so beyond one per display on a three-monitor wall the extra RSS buys
+# nothing.
+MAX_IMAGE_WORKER_INSTANCES = 3
+
+# Cores left for the UI thread, GL compositor and audio capture.
+RESERVED_CORES = 2
+
+_LATENCY_EMA_ALPHA = 0.25
+
+STALE_IN_FLIGHT_S = 60.0
+
+
+def default_instance_count(worker_type: WorkerType, cpu_count: Optional[int] = None) -> int:
+    """Return how many processes *worker_type* should run on this machine."""
+    if worker_type != WorkerType.IMAGE:
+        return 1
+    cores = cpu_count if cpu_count is not None else (os.cpu_count() or 1)
+    spare = max(0, int(cores) - RESERVED_CORES)
+    return max(1, min(MAX_IMAGE_WORKER_INSTANCES, spare // 2))
+
+
+@dataclass
+class WorkerInstance:
+    """One extra process of a pooled worker type (index >= 1)."""
+    index: int
+    health: HealthStatus
+    process: Any = None
+    request_queue: Optional[Queue] = None
+
+    def is_alive(self) -> bool:
+        try:
+            return self.process is not None and self.process.is_alive()
+        except Exception:
+            return False
+
+
+class InstanceLoadTracker:
+    """Track in-flight requests and response latency per instance index.
+
+    Shared by instance 0 (whose process lives in the supervisor's legacy
+    dicts) and the extra instances so dispatch compares like with like.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[int, dict[str, float]] = {}
+        self._owner: dict[str, int] = {}
+        self._completed: dict[int, int] = {}
+        self._latency_ema: dict[int, float] = {}
+        self._latency_last: dict[int, float] = {}
+
+    def load(self, index: int) -> int:
+        return len(self._in_flight.get(index, ()))
+
+    def record_dispatch(self, index: int, correlation_id: str) -> None:
+        now = time.monotonic()
+        in_flight = self._in_flight.setdefault(index, {})
+        # Requests the worker answers without a response (or whose response
+        # was lost with a dead queue) must not pin an instance as busy.
+        stale = [cid for cid, sent in in_flight.items() if now - sent > STALE_IN_FLIGHT_S]
+        for cid in stale:
+            in_flight.pop(cid, None)
+            self._owner.pop(cid, None)
+        in_flight[correlation_id] = now
+        self._owner[correlation_id] = index
+
+    def forget(self, correlation_id: str) -> Optional[int]:
+        """Drop a request that never reached (or never left) a process."""
+        index = self._owner.pop(correlation_id, None)
+        if index is not None:
+            self._in_flight.get(index, {}).pop(correlation_id, None)
+        return index
+
+    def record_completion(self, correlation_id: str) -> Optional[int]:
+        """Mark *correlation_id* answered; returns the owning instance index."""
+        index = self._owner.pop(correlation_id, None)
+        if index is None:
+            return None
+        sent = self._in_flight.get(index, {}).pop(correlation_id, None)
+        if sent is not None:
+            latency_ms = (time.monotonic() - sent) * 1000.0
+            previous = self._latency_ema.get(index)
+            self._latency_ema[index] = (
+                latency_ms
+                if previous is None
+                else previous + _LATENCY_EMA_ALPHA * (latency_ms - previous)
+            )
+            self._latency_last[index] = latency_ms
+        self._completed[index] = self._completed.get(index, 0) + 1
+        return index
+
+    def reset_instance(self, index: int) -> list[str]:
+        """Forget everything dispatched to *index*; returns the orphaned ids."""
+        orphaned = list(self._in_flight.pop(index, {}))
+        for correlation_id in orphaned:
+            self._owner.pop(correlation_id, None)
+        return orphaned
+
+    def clear(self) -> list[str]:
+        orphaned = list(self._owner)
+        self._in_flight.clear()
+        self._owner.clear()
+        return orphaned
+
+    def stats(self, index: int) -> dict[str, Any]:
+        in_flight = self._in_flight.get(index, {})
+        oldest = min(in_flight.values(), default=None)
+        return {
+            "in_flight": len(in_flight),
+            "oldest_in_flight_ms": (
+                round((time.monotonic() - oldest) * 1000.0, 1)
+                if oldest is not None
+                else None
+            ),
+            "completed": self._completed.get(index, 0),
+            "latency_ms_avg": round(self._latency_ema.get(index, 0.0), 1),
+            "latency_ms_last": round(self._latency_last.get(index, 0.0), 1),
+        }
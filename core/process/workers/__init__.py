@@ -5,12 +5,15 @@ Each worker runs in a separate process and communicates via queues.
 Workers handle heavy computation without blocking the UI thread.
 """
 from .base import BaseWorker
+from .audio_worker import AudioAnalysisWorker, audio_analysis_worker_main
 from .image_worker import ImageWorker, image_worker_main
 from .rss_worker import RSSWorker, rss_worker_main
 from .transition_worker import TransitionWorker, TransitionPrecomputeConfig, transition_worker_main
 
 __all__ = [
     "BaseWorker",
+    "AudioAnalysisWorker",
+    "audio_analysis_worker_main",
     "ImageWorker",
     "image_worker_main",
     "RSSWorker",
@@ -0,0 +1,481 @@
+"""
+Audio Analysis Worker for the Spotify visualizer DSP.
+
+Runs the visualizer's FFT/bar analysis in a separate process so the
+per-frame numpy work and its Python overhead leave the UI process.
+
+Data path:
+- The UI process creates a :class:`SharedMemorySPSCRing` for input and a
+  :class:`SharedMemoryTripleBuffer` for output, then sends AUDIO_ATTACH
+  with both segment names and a seed of the live DSP state.
+- Ring records are either PCM blocks (float32 mono samples plus the
+  activation id and capture timestamp) or control records carrying DSP
+  config changes and forwarded reset calls, applied in ring order.
+- A dedicated analysis thread drains the ring, runs the unchanged
+  ``bar_computation`` pipeline on its own ``SpotifyVisualizerAudioWorker``
+  state, and publishes the newest analysis frame into the triple buffer.
+
+Only the newest PCM block of a drained batch is analysed (latest-wins, the
+same contract as the beat engine's pending frame).  Frames are packed as
+exact float64 so the UI side sees bit-identical values to an in-process
+compute.  The request queue only carries attach/detach; no per-frame
+traffic goes through it.
+"""
+from __future__ import annotations
+
+import math
+import pickle
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing import Queue
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.process.types import (
+    MessageType,
+    WorkerMessage,
+    WorkerResponse,
+    WorkerType,
+)
+from core.process.workers.base import BaseWorker
+from utils.lockfree import SharedMemorySPSCRing, SharedMemoryTripleBuffer
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+AUDIO_RING_SLOTS = 8
+AUDIO_RING_SLOT_BYTES = 32 * 1024
+MAX_ANALYSIS_BARS = 256
+
+RECORD_PCM = 1
+RECORD_CONTROL = 2
+
+# Control ops carried by RECORD_CONTROL records.
+CONTROL_CONFIG = "config"
+CONTROL_CALL = "call"
+
+# DSP methods the UI side may forward; anything else is rejected.
+FORWARDED_CALLS: Tuple[str, ...] = (
+    "reset_reactivity_state",
+    "reset_processing_caches",
+    "reconfigure_bar_count",
+    "set_floor_config",
+)
+
+ONSET_TYPES: Tuple[str, ...] = ("", "kick", "snare", "vocal_swell")
+
+# Float DSP scalars mirrored back onto the UI-side worker with each frame;
+# the beat engine's energy/floor/transient getters read exactly these.
+ANALYSIS_STATE_FIELDS: Tuple[str, ...] = (
+    "_running_peak",
+    "_raw_bass_avg",
+    "_applied_noise_floor",
+    "_last_noise_floor",
+    "_gate_floor",
+    "_support_pressure",
+    "_support_signal_avg",
+    "_transient_bass",
+    "_transient_mid",
+    "_transient_high",
+    "_onset_strength",
+    "_pre_agc_control_norm",
+    "_pre_agc_control_bass",
+    "_pre_agc_control_mid",
+    "_pre_agc_control_treble",
+    "_pre_agc_live_bass",
+    "_pre_agc_live_mid",
+    "_pre_agc_live_treble",
+    "_pre_agc_bass",
+    "_pre_agc_mid",
+    "_pre_agc_treble",
+    "_last_raw_bass",
+    "_last_raw_mid",
+    "_last_raw_treble",
+    "_prev_raw_bass",
+)
+
+_KIND = struct.Struct("<B")
+_PCM_HEADER = struct.Struct("<BqdI")
+# activation_id, capture_ts, computed_ts, onset_detected, onset_type, onset_ts, bar_count
+_FRAME_HEADER = struct.Struct("<qddBBdI")
+_STATE = struct.Struct("<%dd" % len(ANALYSIS_STATE_FIELDS))
+
+ANALYSIS_FRAME_BYTES = _FRAME_HEADER.size + _STATE.size + 8 * MAX_ANALYSIS_BARS
+
+
+@dataclass
+class AnalysisFrame:
+    """One analysed PCM block as published by the audio worker."""
+    activation_id: int
+    capture_ts: float
+    computed_ts: float
+    raw_bars: List[float]
+    onset_detected: bool = False
+    onset_type: str = ""
+    onset_ts: float = 0.0
+    # Missing DSP attributes travel as NaN and are left out on unpack.
+    state: Dict[str, float] = field(default_factory=dict)
+
+
+def pack_pcm_record(activation_id: int, capture_ts: float, samples: bytes) -> bytes:
+    """Build a ring record for one block of float32 mono samples."""
+    header = _PCM_HEADER.pack(RECORD_PCM, int(activation_id), float(capture_ts), len(samples) // 4)
+    return header + samples
+
+
+def pack_control_record(op: str, payload: Any) -> bytes:
+    """Build a ring record for a config change or forwarded DSP call."""
+    return _KIND.pack(RECORD_CONTROL) + pickle.dumps((op, payload), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def pack_analysis_frame(frame: AnalysisFrame) -> bytes:
+    """Serialize *frame* as exact float64 values."""
+    bars = frame.raw_bars
+    if len(bars) > MAX_ANALYSIS_BARS:
+        raise ValueError(f"analysis frame has {len(bars)} bars (max {MAX_ANALYSIS_BARS})")
+    try:
+        onset_code = ONSET_TYPES.index(frame.onset_type)
+    except ValueError:
+        onset_code = 0
+    header = _FRAME_HEADER.pack(
+        int(frame.activation_id),
+        float(frame.capture_ts),
+        float(frame.computed_ts),
+        1 if frame.onset_detected else 0,
+        onset_code,
+        float(frame.onset_ts),
+        len(bars),
+    )
+    state = _STATE.pack(*(
+        float(frame.state.get(name, math.nan)) for name in ANALYSIS_STATE_FIELDS
+    ))
+    return header + state + struct.pack("<%dd" % len(bars), *bars)
+
+
+def unpack_analysis_frame(data: bytes) -> AnalysisFrame:
+    """Inverse of :func:`pack_analysis_frame`."""
+    (
+        activation_id,
+        capture_ts,
+        computed_ts,
+        onset_detected,
+        onset_code,
+        onset_ts,
+        bar_count,
+    ) = _FRAME_HEADER.unpack_from(data, 0)
+    offset = _FRAME_HEADER.size
+    values = _STATE.unpack_from(data, offset)
+    offset += _STATE.size
+    bars = list(struct.unpack_from("<%dd" % bar_count, data, offset))
+    state = {
+        name: value
+        for name, value in zip(ANALYSIS_STATE_FIELDS, values)
+        if not math.isnan(value)
+    }
+    return AnalysisFrame(
+        activation_id=activation_id,
+        capture_ts=capture_ts,
+        computed_ts=computed_ts,
+        raw_bars=bars,
+        onset_detected=bool(onset_detected),
+        onset_type=ONSET_TYPES[onset_code] if onset_code < len(ONSET_TYPES) else "",
+        onset_ts=onset_ts,
+        state=state,
+    )
+
+
+class AudioAnalysisSession:
+    """DSP state plus the shared-memory endpoints of one attach.
+
+    ``process_records`` is the whole analysis step and runs without a
+    thread, so the same code path can be driven directly for verification.
+    """
+
+    def __init__(
+        self,
+        dsp: Any,
+        ring: SharedMemorySPSCRing,
+        frames: SharedMemoryTripleBuffer,
+    ) -> None:
+        self.dsp = dsp
+        self.ring = ring
+        self.frames = frames
+        self.frames_published = 0
+        self.blocks_dropped = 0
+        self.controls_applied = 0
+
+    @classmethod
+    def attach(
+        cls,
+        ring_name: str,
+        frames_name: str,
+        *,
+        bar_count: int,
+        state: Optional[Dict[str, Any]] = None,
+    ) -> "AudioAnalysisSession":
+        """Build the DSP state from *state* and attach both segments."""
+        from widgets.spotify_visualizer.audio_worker import SpotifyVisualizerAudioWorker
+
+        dsp = SpotifyVisualizerAudioWorker(bar_count)
+        for name, value in (state or {}).items():
+            setattr(dsp, name, value)
+        dsp._np = np
+        ring = SharedMemorySPSCRing.attach(ring_name)
+        try:
+            frames = SharedMemoryTripleBuffer.attach(frames_name)
+        except Exception:
+            ring.close()
+            raise
+        return cls(dsp, ring, frames)
+
+    def apply_control(self, op: str, payload: Any) -> None:
+        if op == CONTROL_CONFIG:
+            for name, value in dict(payload).items():
+                setattr(self.dsp, name, value)
+        elif op == CONTROL_CALL:
+            name, args = payload
+            if name not in FORWARDED_CALLS:
+                raise ValueError(f"DSP call {name!r} cannot be forwarded")
+            getattr(self.dsp, name)(*args)
+        else:
+            raise ValueError(f"Unknown audio control op: {op!r}")
+        self.controls_applied += 1
+
+    def process_records(self, records: List[bytes]) -> Optional[AnalysisFrame]:
+        """Apply *records* in order and analyse the newest surviving PCM block.
+
+        A control record supersedes any PCM block queued before it, mirroring
+        how resets cancel the beat engine's pending frame.
+        """
+        pending: Optional[bytes] = None
+        for record in records:
+            kind = record[0] if record else 0
+            if kind == RECORD_PCM:
+                if pending is not None:
+                    self.blocks_dropped += 1
+                pending = record
+            elif kind == RECORD_CONTROL:
+                if pending is not None:
+                    self.blocks_dropped += 1
+                    pending = None
+                op, payload = pickle.loads(record[_KIND.size:])
+                self.apply_control(op, payload)
+        if pending is None:
+            return None
+        frame = self.analyse(pending)
+        if frame is not None:
+            self.frames.publish(pack_analysis_frame(frame))
+            self.frames_published += 1
+        return frame
+
+    def analyse(self, record: bytes) -> Optional[AnalysisFrame]:
+        """Run the visualizer bar computation on one PCM record."""
+        from widgets.spotify_visualizer.bar_computation import compute_bars_from_samples
+
+        _kind, activation_id, capture_ts, count = _PCM_HEADER.unpack_from(record, 0)
+        samples = np.frombuffer(record, dtype=np.float32, count=count, offset=_PCM_HEADER.size)
+        dsp = self.dsp
+        dsp._activation_id = activation_id
+        # Same detached-snapshot contract as the in-process compute lane, so
+        # both lanes evolve the DSP state identically.
+        state = dsp.make_compute_snapshot()
+        raw_bars = compute_bars_from_samples(state, samples)
+        if not isinstance(raw_bars, list):
+            return None
+        dsp.commit_compute_snapshot(state)
+        computed_ts = time.time()
+        onset_detected = bool(getattr(dsp, "_onset_detected", False))
+        onset_ts = 0.0
+        if onset_detected:
+            bus = getattr(dsp, "_transient_bus", None)
+            onset_ts = float(getattr(bus, "_last_onset_ts", 0.0) or computed_ts)
+        mirrored: Dict[str, float] = {}
+        for name in ANALYSIS_STATE_FIELDS:
+            try:
+                mirrored[name] = float(getattr(dsp, name))
+            except (AttributeError, TypeError, ValueError):
+                continue
+        return AnalysisFrame(
+            activation_id=activation_id,
+            capture_ts=capture_ts,
+            computed_ts=computed_ts,
+            raw_bars=[float(value) for value in raw_bars],
+            onset_detected=onset_detected,
+            onset_type=str(getattr(dsp, "_onset_type", "") or ""),
+            onset_ts=onset_ts,
+            state=mirrored,
+        )
+
+    def close(self) -> None:
+        """Release this process's mappings; the UI process owns the segments."""
+        self.ring.close()
+        self.frames.close()
+
+
+class AudioAnalysisWorker(BaseWorker):
+    """
+    Worker for visualizer audio analysis.
+
+    Handles:
+    - AUDIO_ATTACH: Attach the shared-memory ring/triple buffer and start analysing
+    - AUDIO_DETACH: Stop analysing and release the mappings
+
+    PCM and analysis frames never travel through the queues; the queues
+    only carry the attach/detach handshake and heartbeats.
+    """
+
+    IDLE_WAIT_S = 0.002
+
+    def __init__(self, request_queue: Queue, response_queue: Queue):
+        super().__init__(request_queue, response_queue)
+        self._session: Optional[AudioAnalysisSession] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._analysis_errors = 0
+
+    @property
+    def worker_type(self) -> WorkerType:
+        return WorkerType.AUDIO
+
+    def handle_message(self, msg: WorkerMessage) -> Optional[WorkerResponse]:
+        """Handle audio analysis messages."""
+        if msg.msg_type == MessageType.AUDIO_ATTACH:
+            return self._handle_attach(msg)
+        elif msg.msg_type == MessageType.AUDIO_DETACH:
+            return self._handle_detach(msg)
+        else:
+            return WorkerResponse(
+                msg_type=MessageType.ERROR,
+                seq_no=msg.seq_no,
+                correlation_id=msg.correlation_id,
+                success=False,
+                error=f"Unknown message type: {msg.msg_type}",
+            )
+
+    def _handle_attach(self, msg: WorkerMessage) -> WorkerResponse:
+        """Attach to the UI process's segments and start the analysis thread."""
+        if not NUMPY_AVAILABLE:
+            return WorkerResponse(
+                msg_type=MessageType.AUDIO_ATTACH,
+                seq_no=msg.seq_no,
+                correlation_id=msg.correlation_id,
+                success=False,
+                error="numpy not available",
+            )
+        self._stop_session()
+        payload = msg.payload
+        self._session = AudioAnalysisSession.attach(
+            payload["ring_name"],
+            payload["frames_name"],
+            bar_count=int(payload.get("bar_count", 32)),
+            state=payload.get("state"),
+        )
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._analysis_loop,
+            args=(self._session, self._stop_event),
+            name="audio_analysis",
+            daemon=True,
+        )
+        self._thread.start()
+        if self._logger:
+            self._logger.info(
+                "Audio analysis attached (ring=%s, frames=%s, bars=%s)",
+                payload["ring_name"],
+                payload["frames_name"],
+                payload.get("bar_count"),
+            )
+        return WorkerResponse(
+            msg_type=MessageType.AUDIO_ATTACH,
+            seq_no=msg.seq_no,
+            correlation_id=msg.correlation_id,
+            success=True,
+        )
+
+    def _handle_detach(self, msg: WorkerMessage) -> WorkerResponse:
+        self._stop_session()
+        return WorkerResponse(
+            msg_type=MessageType.AUDIO_DETACH,
+            seq_no=msg.seq_no,
+            correlation_id=msg.correlation_id,
+            success=True,
+        )
+
+    def _analysis_loop(self, session: AudioAnalysisSession, stop: threading.Event) -> None:
+        while not stop.is_set():
+            records = session.ring.drain()
+            if not records:
+                stop.wait(self.IDLE_WAIT_S)
+                continue
+            try:
+                session.process_records(records)
+            except Exception as e:
+                self._analysis_errors += 1
+                if self._logger and self._analysis_errors <= 3:
+                    self._logger.exception("Audio analysis step failed: %s", e)
+
+    def _stop_session(self) -> None:
+        thread = self._thread
+        session = self._session
+        self._thread = None
+        self._session = None
+        self._stop_event.set()
+        if thread is not None:
+            thread.join(timeout=1.0)
+        if session is not None:
+            session.close()
+
+    def _heartbeat_stats(self) -> dict:
+        session = self._session
+        if session is None:
+            return {"attached": False}
+        return {
+            "attached": True,
+            "frames_published": session.frames_published,
+            "blocks_dropped": session.blocks_dropped,
+            "controls_applied": session.controls_applied,
+            "analysis_errors": self._analysis_errors,
+        }
+
+    def _cleanup(self) -> None:
+        """Stop analysing and log final statistics."""
+        session = self._session
+        self._stop_session()
+        if self._logger and session is not None:
+            self._logger.info(
+                "Audio stats: %d frames, %d dropped blocks, %d controls",
+                session.frames_published,
+                session.blocks_dropped,
+                session.controls_applied,
+            )
+
+
+def audio_analysis_worker_main(request_queue: Queue, response_queue: Queue) -> None:
+    """Entry point for audio analysis worker process."""
+    import sys
+    import traceback
+
+    sys.stderr.write("=== AUDIO Worker: Process started ===\n")
+    sys.stderr.flush()
+
+    try:
+        sys.stderr.write("AUDIO Worker: Creating worker instance...\n")
+        sys.stderr.flush()
+        worker = AudioAnalysisWorker(request_queue, response_queue)
+
+        sys.stderr.write("AUDIO Worker: Starting main loop...\n")
+        sys.stderr.flush()
+        worker.run()
+
+        sys.stderr.write("AUDIO Worker: Exiting normally\n")
+        sys.stderr.flush()
+    except Exception as e:
+        sys.stderr.write(f"AUDIO Worker CRASHED: {e}\n")
+        sys.stderr.write(f"AUDIO Worker crash traceback:\n{''.join(traceback.format_exc())}\n")
+        sys.stderr.flush()
+        raise
@@ -154,6 +154,7 @@ class BaseWorker:
             seq_no=0,
             correlation_id="",
             success=True,
+            payload={"pid": os.getpid()},
         ))
         
         try:
@@ -236,9 +237,14 @@ class BaseWorker:
                 "uptime_s": time.time() - self._start_time,
                 "messages_processed": self._messages_processed,
                 "pid": os.getpid(),
+                **self._heartbeat_stats(),
             },
         ))
     
+    def _heartbeat_stats(self) -> dict:
+        """Subclass hook for extra counters reported with each heartbeat ack."""
+        return {}
+    
     def _send_response(self, response: WorkerResponse) -> bool:
         """Send a response and notify subclasses of publication outcome."""
         delivered = False
@@ -272,7 +278,7 @@ class BaseWorker:
             seq_no=self._next_seq(),
             correlation_id=correlation_id,
             success=True,
-            payload={"worker_type": self.worker_type.value},
+            payload={"worker_type": self.worker_type.value, "pid": os.getpid()},
         ))
     
     def _send_idle_notification(self, correlation_id: str) -> None:
@@ -282,7 +288,7 @@ class BaseWorker:
             seq_no=self._next_seq(),
             correlation_id=correlation_id,
             success=True,
-            payload={"worker_type": self.worker_type.value},
+            payload={"worker_type": self.worker_type.value, "pid": os.getpid()},
         ))
     
     def _cleanup(self) -> None:
@@ -6,8 +6,10 @@ avoiding blocking the UI thread. Results are returned via queue or
 shared memory for large images.
 
 Key responsibilities:
-- Decode images from disk (JPEG, PNG, WebP, etc.)
-- Prescale to target dimensions using Lanczos
+- Decode images from disk (JPEG, PNG, WebP, etc.), using reduced-size
+  decode (JPEG draft / integer reduce) when the target is much smaller
+- Prescale to target dimensions using Lanczos; FILL resamples only the
+  source region its centre crop keeps (``rendering.display_geometry``)
 - Apply sharpening for downscaled images
 - Return RGBA data for Qt consumption
 """
@@ -28,11 +30,14 @@ from core.process.types import (
 )
 from core.process.shared_memory_transport import (
     SharedMemoryDescriptor,
+    SharedMemorySlabTicket,
     close_producer_shared_memory,
     create_image_shared_memory,
     wait_for_shared_memory_attachment,
+    write_image_slab,
 )
 from core.process.workers.base import BaseWorker
+from rendering.display_geometry import fill_cover_size, fill_source_box
 
 try:
     from PIL import Image, ImageFilter
@@ -57,6 +62,10 @@ class ImageWorker(BaseWorker):
     # Quality settings
     LANCZOS_RESAMPLE = Image.Resampling.LANCZOS if PIL_AVAILABLE else None
     SHARPEN_THRESHOLD = 0.5  # Apply sharpening when scale < 0.5
+    # Non-JPEG box reduction leaves at least this much downscale for Lanczos
+    REDUCING_GAP = 2.0
+    # Modes Image.reduce handles directly; others convert to RGBA first
+    REDUCE_MODES = frozenset({"L", "LA", "RGB", "RGBA", "CMYK", "I", "F"})
     
     # Shared memory threshold: 2MB (lowered from 5MB to catch 2560x1438 images)
     # 2560x1438 RGBA = 14.7MB, so this threshold ensures shared memory is used
@@ -68,11 +77,21 @@ class ImageWorker(BaseWorker):
         self._prescale_count = 0
         self._total_decode_ms = 0.0
         self._total_prescale_ms = 0.0
+        # Reduced-resolution decode counters (draft = JPEG DCT scaling,
+        # reduce = integer box reduction after a full decode)
+        self._draft_decodes = 0
+        self._reduced_decodes = 0
+        self._full_decodes = 0
+        self._decode_pixels_full = 0
+        self._decode_pixels_decoded = 0
         # The worker is sequential, so at most one published transfer awaits a
         # parent attachment.  This is a bounded handoff, not a lifetime cache.
         self._pending_shared_transfers: dict[
             str, tuple[SharedMemory, SharedMemoryDescriptor]
         ] = {}
+        # Parent-owned pooled slabs stay attached for the worker's lifetime;
+        # the parent creates and unlinks them, the worker only writes.
+        self._slab_handles: dict[str, SharedMemory] = {}
     
     @property
     def worker_type(self) -> WorkerType:
@@ -198,24 +217,26 @@ class ImageWorker(BaseWorker):
         
         start = time.time()
         try:
-            # Decode
-            img = Image.open(path)
-            img.load()
-            original_size = img.size
-            
-            # Convert to RGBA
-            if img.mode != "RGBA":
-                img = img.convert("RGBA")
-            
-            # Calculate scale based on mode
-            scaled_size = self._calculate_scale_size(
-                original_size, (target_width, target_height), mode
+            # Decode at the smallest scale that still covers the target
+            img, original_size, scaled_size, decode_scale = self._open_reduced(
+                path, (target_width, target_height), mode
             )
             
-            # Prescale if needed
+            # Prescale if needed (a reduced decode may already have landed on size)
             if scaled_size != original_size:
-                resample = self.LANCZOS_RESAMPLE if use_lanczos else Image.Resampling.BILINEAR
-                img = img.resize(scaled_size, resample)
+                if img.size != scaled_size:
+                    resample = self.LANCZOS_RESAMPLE if use_lanczos else Image.Resampling.BILINEAR
+                    target = (target_width, target_height)
+                    if mode == "fill" and scaled_size != target:
+                        # Crop before resampling: scale only the region the
+                        # centre crop keeps, straight to the target size.
+                        img = img.resize(
+                            target,
+                            resample,
+                            box=fill_source_box(img.size, scaled_size, target),
+                        )
+                    else:
+                        img = img.resize(scaled_size, resample)
                 
                 # Apply sharpening for aggressive downscaling
                 if sharpen and PIL_AVAILABLE:
@@ -247,6 +268,33 @@ class ImageWorker(BaseWorker):
             self._total_prescale_ms += prescale_ms
             
             # Use shared memory for large images to avoid queue serialization
+            slab_descriptor = None
+            if data_size > self.SHARED_MEMORY_THRESHOLD:
+                slab_descriptor = self._write_to_slab(
+                    msg.payload.get("shared_memory_slab"),
+                    rgba_data,
+                )
+            if slab_descriptor is not None:
+                self._send_idle_notification(msg.correlation_id)
+                return WorkerResponse(
+                    msg_type=MessageType.IMAGE_RESULT,
+                    seq_no=msg.seq_no,
+                    correlation_id=msg.correlation_id,
+                    success=True,
+                    payload={
+                        "path": path,
+                        "original_width": original_size[0],
+                        "original_height": original_size[1],
+                        "width": width,
+                        "height": height,
+                        "format": "RGBA",
+                        **slab_descriptor.payload_fields(),
+                        "cache_key": cache_key,
+                        "mode": mode,
+                        "decode_scale": decode_scale,
+                    },
+                    processing_time_ms=prescale_ms,
+                )
             if data_size > self.SHARED_MEMORY_THRESHOLD:
                 try:
                     shm_name = f"srpss_img_{uuid.uuid4().hex[:12]}"
@@ -280,6 +328,7 @@ class ImageWorker(BaseWorker):
                             **descriptor.payload_fields(),
                             "cache_key": cache_key,
                             "mode": mode,
+                            "decode_scale": decode_scale,
                         },
                         processing_time_ms=prescale_ms,
                     )
@@ -304,6 +353,7 @@ class ImageWorker(BaseWorker):
                     "rgba_data": rgba_data,
                     "cache_key": cache_key,
                     "mode": mode,
+                    "decode_scale": decode_scale,
                 },
                 processing_time_ms=prescale_ms,
             )
@@ -321,6 +371,117 @@ class ImageWorker(BaseWorker):
                 error=f"Prescale failed: {e}",
             )
     
+    def _open_reduced(
+        self,
+        path: str,
+        target: Tuple[int, int],
+        mode: str,
+    ) -> Tuple["Image.Image", Tuple[int, int], Tuple[int, int], float]:
+        """Open and decode *path* at the smallest size that still covers the target.
+        
+        JPEGs use ``draft()`` so libjpeg performs DCT-domain downscaling
+        (1/2, 1/4, 1/8) during decode. Other formats decode fully and are
+        then box-reduced by an integer factor, keeping ``REDUCING_GAP`` of
+        headroom for the Lanczos pass like ``Image.thumbnail`` does.
+        
+        Returns:
+            (decoded RGBA image, original size, final scaled size, decode scale)
+        """
+        img = Image.open(path)
+        original_size = img.size
+        scaled_size = self._calculate_scale_size(original_size, target, mode)
+        src_w, src_h = original_size
+        shrinking = (
+            src_w > 0 and src_h > 0
+            and scaled_size[0] < src_w and scaled_size[1] < src_h
+        )
+        
+        reduced_by = "none"
+        if shrinking and img.format == "JPEG" and img.mode in ("RGB", "L", "CMYK"):
+            try:
+                if img.draft(img.mode, scaled_size) is not None and img.size != original_size:
+                    reduced_by = "draft"
+            except Exception as e:
+                if self._logger:
+                    self._logger.debug("JPEG draft decode unavailable for %s: %s", path, e)
+        
+        img.load()
+        
+        if shrinking and reduced_by == "none":
+            factor = int(min(src_w / scaled_size[0], src_h / scaled_size[1]) / self.REDUCING_GAP)
+            if factor >= 2:
+                # Image.reduce rejects palette, bilevel and 16-bit modes.
+                if img.mode not in self.REDUCE_MODES:
+                    img = img.convert("RGBA")
+                img = img.reduce(factor)
+                reduced_by = "reduce"
+        
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        
+        decode_scale = img.size[0] / src_w if src_w else 1.0
+        self._record_decode_scale(reduced_by, original_size, img.size)
+        return img, original_size, scaled_size, decode_scale
+    
+    def _record_decode_scale(
+        self,
+        reduced_by: str,
+        original_size: Tuple[int, int],
+        decoded_size: Tuple[int, int],
+    ) -> None:
+        """Accumulate reduced-resolution decode counters."""
+        if reduced_by == "draft":
+            self._draft_decodes += 1
+        elif reduced_by == "reduce":
+            self._reduced_decodes += 1
+        else:
+            self._full_decodes += 1
+        full_px = original_size[0] * original_size[1]
+        decoded_px = decoded_size[0] * decoded_size[1]
+        self._decode_pixels_full += full_px
+        self._decode_pixels_decoded += decoded_px
+    
+    def get_decode_stats(self) -> dict:
+        """Return decode-scale counters for diagnostics."""
+        full_px = self._decode_pixels_full
+        return {
+            "decode_count": self._decode_count,
+            "prescale_count": self._prescale_count,
+            "draft_decodes": self._draft_decodes,
+            "reduced_decodes": self._reduced_decodes,
+            "full_decodes": self._full_decodes,
+            "decoded_pixel_ratio": (
+                self._decode_pixels_decoded / full_px if full_px else 1.0
+            ),
+            "avg_prescale_ms": (
+                self._total_prescale_ms / self._prescale_count
+                if self._prescale_count else 0.0
+            ),
+        }
+    
+    def _heartbeat_stats(self) -> dict:
+        return {"decode_stats": self.get_decode_stats()}
+    
+    def _write_to_slab(
+        self,
+        slab_payload: Optional[dict],
+        rgba_data: bytes,
+    ) -> Optional[SharedMemoryDescriptor]:
+        """Write into the parent-leased slab, or None to use a fresh segment."""
+        ticket = SharedMemorySlabTicket.from_payload(slab_payload)
+        if ticket is None:
+            return None
+        try:
+            shm = self._slab_handles.get(ticket.name)
+            if shm is None:
+                shm = SharedMemory(name=ticket.name, create=False)
+                self._slab_handles[ticket.name] = shm
+            return write_image_slab(shm, ticket, rgba_data)
+        except Exception as e:
+            if self._logger:
+                self._logger.warning("Slab write failed, using fresh segment: %s", e)
+            return None
+    
     def _calculate_scale_size(
         self,
         source: Tuple[int, int],
@@ -339,15 +500,7 @@ class ImageWorker(BaseWorker):
         
         if mode == "fill":
             # Scale to cover target completely (crop excess)
-            if src_ratio > tgt_ratio:
-                # Source wider - scale by height
-                new_h = tgt_h
-                new_w = int(new_h * src_ratio)
-            else:
-                # Source taller - scale by width
-                new_w = tgt_w
-                new_h = int(new_w / src_ratio)
-            return (max(new_w, tgt_w), max(new_h, tgt_h))
+            return fill_cover_size(source, target)
         
         elif mode == "fit":
             # Scale to fit within target (may have bars)
@@ -448,6 +601,12 @@ class ImageWorker(BaseWorker):
         for shm, _descriptor in self._pending_shared_transfers.values():
             close_producer_shared_memory(shm, attached=False)
         self._pending_shared_transfers.clear()
+        for shm in self._slab_handles.values():
+            try:
+                shm.close()
+            except Exception:
+                pass
+        self._slab_handles.clear()
         
         if self._logger:
             if self._decode_count > 0:
@@ -462,6 +621,12 @@ class ImageWorker(BaseWorker):
                     "Prescale stats: %d images, avg %.1fms",
                     self._prescale_count, avg_prescale
                 )
+                stats = self.get_decode_stats()
+                self._logger.info(
+                    "Decode scale stats: draft=%d reduce=%d full=%d decoded_px=%.1f%%",
+                    stats["draft_decodes"], stats["reduced_decodes"],
+                    stats["full_decodes"], stats["decoded_pixel_ratio"] * 100.0,
+                )
 
 
 def image_worker_main(request_queue: Queue, response_queue: Queue) -> None:
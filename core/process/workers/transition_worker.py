@@ -9,15 +9,23 @@ Key responsibilities:
 - Generate lookup tables for warp/distortion effects
 - Prepare particle system initial states
 - Cache computed data for reuse
+
+Block patterns are packed as one int32 array (one row per field, one column
+per block).  Large arrays travel through a shared-memory segment using the
+same attach/ack handoff as ImageWorker; small ones ride the queue as bytes.
+Use :func:`unpack_precomputed_blocks` on the receiving side.
 """
 from __future__ import annotations
 
 import hashlib
 import random
 import time
+import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from multiprocessing import Queue
-from typing import Any, Dict, Optional
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Optional, Tuple
 
 from core.process.types import (
     MessageType,
@@ -25,6 +33,13 @@ from core.process.types import (
     WorkerResponse,
     WorkerType,
 )
+from core.process.shared_memory_transport import (
+    TRANSITION_SHARED_MEMORY_PREFIX,
+    SharedMemoryDescriptor,
+    close_producer_shared_memory,
+    create_image_shared_memory,
+    wait_for_shared_memory_attachment,
+)
 from core.process.workers.base import BaseWorker
 
 try:
@@ -34,6 +49,44 @@ except ImportError:
     NUMPY_AVAILABLE = False
 
 
+DIFFUSE_BLOCK_FIELDS: Tuple[str, ...] = ("order", "x", "y", "w", "h")
+GRID_BLOCK_FIELDS: Tuple[str, ...] = ("order", "x", "y", "w", "h", "distance", "flip_axis")
+FLIP_AXES: Tuple[str, ...] = ("x", "y")
+
+
+def precompute_cache_key(transition_type: str, params: Dict) -> str:
+    """Stable key for one precomputation request."""
+    key_data = f"{transition_type}:{sorted(params.items())}"
+    return hashlib.md5(key_data.encode()).hexdigest()[:16]
+
+
+def inverse_permutation(indices: "np.ndarray") -> "np.ndarray":
+    """Return ``order`` such that ``order[indices[k]] == k`` in O(n)."""
+    order = np.empty_like(indices)
+    order[indices] = np.arange(indices.size, dtype=indices.dtype)
+    return order
+
+
+def unpack_precomputed_blocks(
+    data: Dict[str, Any],
+    buffer: Optional[memoryview] = None,
+) -> Optional["np.ndarray"]:
+    """Return the packed ``(fields, blocks)`` int32 array of a precompute result.
+
+    *buffer* is the shared-memory payload view when the response carried
+    one; otherwise the array is read from the inline ``blocks`` bytes.  The
+    result is always a private copy, so the mapping can be released at once.
+    """
+    shape = data.get("blocks_shape")
+    if not shape:
+        return None
+    source = buffer if buffer is not None else data.get("blocks")
+    if source is None:
+        return None
+    packed = np.frombuffer(source, dtype=np.int32, count=int(shape[0]) * int(shape[1]))
+    return packed.reshape(int(shape[0]), int(shape[1])).copy()
+
+
 @dataclass
 class TransitionPrecomputeConfig:
     """Configuration for transition precomputation."""
@@ -74,14 +127,23 @@ class TransitionWorker(BaseWorker):
     - TRANSITION_PRECOMPUTE: Compute transition data (block indices, patterns, etc.)
     - CONFIG_UPDATE: Update precomputation configuration
     
-    Precomputed data is returned via queue and can be cached by the UI process.
+    Precomputed data is returned via queue (or shared memory for packed
+    block arrays) and can be cached by the UI process.
     """
+
+    # Packed block arrays above this size go through shared memory
+    SHARED_MEMORY_THRESHOLD = 64 * 1024
+    # Distinct resolutions/transition types kept in the precompute cache
+    MAX_CACHE_ENTRIES = 16
     
     def __init__(self, request_queue: Queue, response_queue: Queue):
         super().__init__(request_queue, response_queue)
         self._config = TransitionPrecomputeConfig()
         self._precompute_count = 0
-        self._cache: Dict[str, PrecomputeResult] = {}
+        self._cache: "OrderedDict[str, PrecomputeResult]" = OrderedDict()
+        self._pending_shared_transfers: dict[
+            str, tuple[SharedMemory, SharedMemoryDescriptor]
+        ] = {}
     
     @property
     def worker_type(self) -> WorkerType:
@@ -118,24 +180,20 @@ class TransitionWorker(BaseWorker):
         if "seed" in params:
             self._config.seed = params["seed"]
         
-        # Generate cache key
-        cache_key = self._generate_cache_key(transition_type, params)
+        # Generate cache key from the resolved resolution so a request that
+        # leans on config defaults never hits another resolution's entry
+        cache_key = self._generate_cache_key(transition_type, {
+            "screen_width": self._config.screen_width,
+            "screen_height": self._config.screen_height,
+            **params,
+        })
         
         # Check cache
         if use_cache and cache_key in self._cache:
             cached = self._cache[cache_key]
-            return WorkerResponse(
-                msg_type=MessageType.TRANSITION_RESULT,
-                seq_no=msg.seq_no,
-                correlation_id=msg.correlation_id,
-                success=True,
-                payload={
-                    "transition_type": transition_type,
-                    "cache_key": cache_key,
-                    "data": cached.data,
-                    "cached": True,
-                },
-                processing_time_ms=0.0,
+            self._cache.move_to_end(cache_key)
+            return self._build_result_response(
+                msg, transition_type, cache_key, cached.data, cached=True, processing_time_ms=0.0,
             )
         
         start = time.time()
@@ -154,19 +212,12 @@ class TransitionWorker(BaseWorker):
                 compute_time_ms=compute_time_ms,
             )
             self._cache[cache_key] = result
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.MAX_CACHE_ENTRIES:
+                self._cache.popitem(last=False)
             
-            return WorkerResponse(
-                msg_type=MessageType.TRANSITION_RESULT,
-                seq_no=msg.seq_no,
-                correlation_id=msg.correlation_id,
-                success=True,
-                payload={
-                    "transition_type": transition_type,
-                    "cache_key": cache_key,
-                    "data": data,
-                    "cached": False,
-                },
-                processing_time_ms=compute_time_ms,
+            return self._build_result_response(
+                msg, transition_type, cache_key, data, cached=False, processing_time_ms=compute_time_ms,
             )
             
         except Exception as e:
@@ -179,6 +230,64 @@ class TransitionWorker(BaseWorker):
                 success=False,
                 error=f"Precompute failed: {e}",
             )
+
+    def _build_result_response(
+        self,
+        msg: WorkerMessage,
+        transition_type: str,
+        cache_key: str,
+        data: Dict[str, Any],
+        *,
+        cached: bool,
+        processing_time_ms: float,
+    ) -> WorkerResponse:
+        """Build a TRANSITION_RESULT, moving packed blocks off the queue."""
+        payload: Dict[str, Any] = {
+            "transition_type": transition_type,
+            "cache_key": cache_key,
+            "cached": cached,
+        }
+        blocks = data.get("blocks")
+        if NUMPY_AVAILABLE and isinstance(blocks, np.ndarray):
+            wire = {k: v for k, v in data.items() if k != "blocks"}
+            wire["blocks_shape"] = list(blocks.shape)
+            packed = blocks.tobytes()
+            descriptor = None
+            if len(packed) > self.SHARED_MEMORY_THRESHOLD:
+                descriptor = self._publish_shared(msg.correlation_id, packed)
+            if descriptor is not None:
+                payload.update(descriptor.payload_fields())
+            else:
+                wire["blocks"] = packed
+            payload["data"] = wire
+        else:
+            payload["data"] = data
+        return WorkerResponse(
+            msg_type=MessageType.TRANSITION_RESULT,
+            seq_no=msg.seq_no,
+            correlation_id=msg.correlation_id,
+            success=True,
+            payload=payload,
+            processing_time_ms=processing_time_ms,
+        )
+
+    def _publish_shared(
+        self,
+        correlation_id: str,
+        packed: bytes,
+    ) -> Optional[SharedMemoryDescriptor]:
+        """Copy *packed* into a fresh segment; ``None`` means use the queue."""
+        try:
+            shm, descriptor = create_image_shared_memory(
+                packed,
+                name=f"{TRANSITION_SHARED_MEMORY_PREFIX}{uuid.uuid4().hex[:12]}",
+            )
+        except Exception as e:
+            if self._logger:
+                self._logger.warning("Shared memory failed, using queue: %s", e)
+            return None
+        self._pending_shared_transfers[correlation_id] = (shm, descriptor)
+        return descriptor
     
     def _precompute(self, transition_type: str, params: Dict) -> Dict[str, Any]:
         """Perform precomputation for a transition type."""
@@ -202,6 +311,9 @@ class TransitionWorker(BaseWorker):
     
     def _precompute_diffuse(self, params: Dict) -> Dict[str, Any]:
         """Precompute block dissolution pattern for Diffuse transition."""
+        if not NUMPY_AVAILABLE:
+            return {"precomputed": False, "error": "NumPy required"}
+        
         block_size = params.get("block_size", self._config.diffuse_block_size)
         width = params.get("screen_width", self._config.screen_width)
         height = params.get("screen_height", self._config.screen_height)
@@ -219,19 +331,17 @@ class TransitionWorker(BaseWorker):
         indices = list(range(total_blocks))
         random.shuffle(indices)
         
-        # Generate block positions
-        blocks = []
-        for idx in indices:
-            row = idx // cols
-            col = idx % cols
-            x = col * block_size
-            y = row * block_size
-            w = min(block_size, width - x)
-            h = min(block_size, height - y)
-            blocks.append({
-                "x": x, "y": y, "w": w, "h": h,
-                "order": indices.index(idx),
-            })
+        # Blocks are listed in dissolution order, so block k dissolves k-th
+        perm = np.asarray(indices, dtype=np.int32)
+        x = (perm % cols) * block_size
+        y = (perm // cols) * block_size
+        blocks = np.stack((
+            np.arange(total_blocks, dtype=np.int32),
+            x,
+            y,
+            np.minimum(block_size, width - x),
+            np.minimum(block_size, height - y),
+        )).astype(np.int32, copy=False)
         
         return {
             "precomputed": True,
@@ -239,12 +349,15 @@ class TransitionWorker(BaseWorker):
             "cols": cols,
             "rows": rows,
             "total_blocks": total_blocks,
-            "dissolution_order": indices,
+            "block_fields": DIFFUSE_BLOCK_FIELDS,
             "blocks": blocks,
         }
     
     def _precompute_blocks(self, params: Dict) -> Dict[str, Any]:
         """Precompute block grid for BlockFlip/BlockSpin transitions."""
+        if not NUMPY_AVAILABLE:
+            return {"precomputed": False, "error": "NumPy required"}
+        
         cols = params.get("cols", self._config.block_cols)
         rows = params.get("rows", self._config.block_rows)
         width = params.get("screen_width", self._config.screen_width)
@@ -261,26 +374,23 @@ class TransitionWorker(BaseWorker):
         # Generate random flip order
         indices = list(range(total_blocks))
         random.shuffle(indices)
-        
-        # Generate block data
-        blocks = []
-        for idx in range(total_blocks):
-            row = idx // cols
-            col = idx % cols
-            x = col * block_w
-            y = row * block_h
-            
-            # Staggered timing based on distance from center
-            cx, cy = cols // 2, rows // 2
-            dist = abs(col - cx) + abs(row - cy)
-            
-            blocks.append({
-                "x": x, "y": y,
-                "w": block_w, "h": block_h,
-                "order": indices.index(idx),
-                "distance": dist,
-                "flip_axis": random.choice(["x", "y"]),
-            })
+        flip_axes = [random.choice(FLIP_AXES) for _ in range(total_blocks)]
+        
+        # Block data, one column per grid cell in row-major order
+        grid = np.arange(total_blocks, dtype=np.int32)
+        col = grid % cols
+        row = grid // cols
+        # Staggered timing based on distance from center
+        cx, cy = cols // 2, rows // 2
+        blocks = np.stack((
+            inverse_permutation(np.asarray(indices, dtype=np.int32)),
+            col * block_w,
+            row * block_h,
+            np.full(total_blocks, block_w, dtype=np.int32),
+            np.full(total_blocks, block_h, dtype=np.int32),
+            np.abs(col - cx) + np.abs(row - cy),
+            np.fromiter((FLIP_AXES.index(a) for a in flip_axes), dtype=np.int32, count=total_blocks),
+        )).astype(np.int32, copy=False)
         
         return {
             "precomputed": True,
@@ -289,7 +399,7 @@ class TransitionWorker(BaseWorker):
             "block_w": block_w,
             "block_h": block_h,
             "total_blocks": total_blocks,
-            "flip_order": indices,
+            "block_fields": GRID_BLOCK_FIELDS,
             "blocks": blocks,
         }
     
@@ -420,8 +530,7 @@ class TransitionWorker(BaseWorker):
     
     def _generate_cache_key(self, transition_type: str, params: Dict) -> str:
         """Generate a cache key for the precomputation."""
-        key_data = f"{transition_type}:{sorted(params.items())}"
-        return hashlib.md5(key_data.encode()).hexdigest()[:16]
+        return precompute_cache_key(transition_type, params)
     
     def _handle_config(self, msg: WorkerMessage) -> WorkerResponse:
         """Handle configuration update."""
@@ -443,8 +552,33 @@ class TransitionWorker(BaseWorker):
             success=True,
         )
     
+    def _after_response_sent(
+        self,
+        response: WorkerResponse,
+        *,
+        delivered: bool,
+    ) -> None:
+        """Close the producer mapping as soon as parent attachment is proven."""
+        transfer = self._pending_shared_transfers.pop(response.correlation_id, None)
+        if transfer is None:
+            return
+        shm, descriptor = transfer
+        attached = False
+        try:
+            if delivered:
+                attached = wait_for_shared_memory_attachment(
+                    shm,
+                    descriptor,
+                    timeout_s=1.0,
+                )
+        finally:
+            close_producer_shared_memory(shm, attached=attached)
+
     def _cleanup(self) -> None:
-        """Log final statistics."""
+        """Log final statistics and reclaim unpublished handoffs."""
+        for shm, _descriptor in self._pending_shared_transfers.values():
+            close_producer_shared_memory(shm, attached=False)
+        self._pending_shared_transfers.clear()
         if self._logger:
             self._logger.info(
                 "Transition stats: %d precomputes, %d cached",
@@ -0,0 +1,744 @@
+"""
+Content-addressed disk store shared by the downloaded-image caches.
+
+RSS images, Imgur images and Steam artwork used to live in separate
+directories, each with its own bookkeeping: a JSON index rewritten on every
+``put``, whole-cache sorts on eviction, or a stat/header pass over every file
+at startup.  They now share one store:
+
+Layout under the store root (``<app_data>/cache/assets/`` for the shared
+store)::
+
+    assets.sqlite3       transactional index (WAL)
+    blobs/<aa>/<sha256>.<ext>
+
+- A blob is named by the SHA-256 of its bytes, so an image fetched by two
+  providers (or twice under different keys) is stored once.
+- Entries map ``(namespace, key)`` to a blob and carry the provider's JSON
+  metadata.  Namespaces are named after the legacy directory they replace,
+  relative to the app data root (``cache/rss``, ``cache/imgur``,
+  ``steam/cache/<profile>/assets``).
+- Eviction is least-recently-used over blobs against one global byte budget.
+  ``blobs.last_used`` is indexed, so picking the next victim is an index seek
+  rather than a sort.  Namespaces can additionally cap their entry count.
+- Startup enumeration is an index query; no blob is stat'ed or opened until
+  it is actually used.  A blob deleted behind the store's back is detected on
+  ``get`` and its entries are dropped.
+
+Directories outside the app data root (tests, custom cache dirs) get a
+private store rooted at that directory, so callers need not care which kind
+they were handed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA_VERSION = "1"
+INDEX_FILE = "assets.sqlite3"
+BLOB_DIR = "blobs"
+DEFAULT_ASSET_BUDGET_BYTES = 768 * 1024 * 1024
+
+IMAGE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif"})
+
+_TOUCH_FLUSH_THRESHOLD = 64
+_EVICT_BATCH = 32
+_HASH_CHUNK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class AssetRecord:
+    """One namespace entry and the blob it points at."""
+
+    namespace: str
+    key: str
+    digest: str
+    path: Path
+    size: int
+    ext: str
+    created: float
+    last_used: float
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+class AssetStore:
+    """SQLite-indexed content-addressed blob store with a global LRU budget.
+
+    Thread-safe; one connection is shared under ``_lock``.
+    """
+
+    def __init__(self, root: Path, byte_budget: int = DEFAULT_ASSET_BUDGET_BYTES) -> None:
+        self.root = Path(root)
+        self.blob_dir = self.root / BLOB_DIR
+        self.byte_budget = max(0, int(byte_budget))
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        # (namespace, key) -> last_used, written back in batches
+        self._pending_touches: Dict[Tuple[str, str], float] = {}
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "puts": 0,
+            "dedup_hits": 0,
+            "evictions": 0,
+            "evicted_bytes": 0,
+            "missing_blobs": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Namespaces
+    # ------------------------------------------------------------------
+
+    def namespace(self, name: str, *, legacy_dir: Optional[Path] = None) -> "AssetNamespace":
+        return AssetNamespace(self, name, legacy_dir=legacy_dir)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        namespace: str,
+        key: str,
+        data: bytes,
+        *,
+        ext: str = "bin",
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> AssetRecord:
+        """Store *data* under ``(namespace, key)``, reusing an identical blob."""
+        digest = hashlib.sha256(data).hexdigest()
+        ext = _normalize_ext(ext)
+        with self._lock:
+            conn = self._ensure_open_locked()
+            existing = conn.execute("SELECT ext FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            target = self._blob_path(digest, existing[0] if existing else ext)
+            if existing is None or not target.is_file():
+                self._write_atomic(target, data)
+            return self._link_locked(namespace, key, digest, ext, len(data), meta, existing is not None)
+
+    def put_file(
+        self,
+        namespace: str,
+        key: str,
+        source: Path,
+        *,
+        ext: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        move: bool = True,
+    ) -> AssetRecord:
+        """Store the file at *source*; with ``move`` the file is consumed."""
+        source = Path(source)
+        ext = _normalize_ext(ext or source.suffix or "bin")
+        digest, size = _hash_file(source)
+        with self._lock:
+            conn = self._ensure_open_locked()
+            existing = conn.execute("SELECT ext FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            target = self._blob_path(digest, existing[0] if existing else ext)
+            if existing is None or not target.is_file():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if move:
+                    try:
+                        os.replace(source, target)
+                    except OSError:
+                        shutil.move(str(source), str(target))
+                else:
+                    tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+                    shutil.copyfile(source, tmp)
+                    os.replace(tmp, target)
+            elif move:
+                _unlink(source)
+            return self._link_locked(namespace, key, digest, ext, size, meta, existing is not None)
+
+    def update_meta(self, namespace: str, key: str, meta: Dict[str, Any]) -> bool:
+        with self._lock:
+            conn = self._ensure_open_locked()
+            with conn:
+                cur = conn.execute(
+                    "UPDATE entries SET meta = ? WHERE namespace = ? AND key = ?",
+                    (json.dumps(meta), namespace, key),
+                )
+            return cur.rowcount > 0
+
+    def remove(self, namespace: str, key: str) -> bool:
+        with self._lock:
+            conn = self._ensure_open_locked()
+            self._pending_touches.pop((namespace, key), None)
+            with conn:
+                row = conn.execute(
+                    "SELECT digest FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+                ).fetchone()
+                if row is None:
+                    return False
+                conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                unlinked = self._release_blob_locked(conn, row[0])
+            self._unlink_blobs(unlinked)
+            return True
+
+    def clear(self, namespace_prefix: str) -> Tuple[int, int]:
+        """Drop every entry whose namespace is or starts with *namespace_prefix*.
+
+        Returns ``(entries_removed, bytes_freed)``; blobs still referenced by
+        other namespaces are kept.
+        """
+        prefix = namespace_prefix.rstrip("/")
+        with self._lock:
+            conn = self._ensure_open_locked()
+            self._flush_touches_locked()
+            pattern = _like_escape(prefix) + "/%"
+            with conn:
+                rows = conn.execute(
+                    "SELECT namespace, key, digest FROM entries "
+                    "WHERE namespace = ? OR namespace LIKE ? ESCAPE '\\'",
+                    (prefix, pattern),
+                ).fetchall()
+                conn.execute(
+                    "DELETE FROM entries WHERE namespace = ? OR namespace LIKE ? ESCAPE '\\'",
+                    (prefix, pattern),
+                )
+                unlinked: List[Tuple[str, str, int]] = []
+                for digest in {row[2] for row in rows}:
+                    unlinked.extend(self._release_blob_locked(conn, digest))
+            self._unlink_blobs(unlinked)
+            return len(rows), sum(size for _d, _e, size in unlinked)
+
+    def trim_namespace(self, namespace: str, max_entries: int) -> int:
+        """Drop least-recently-used entries of *namespace* beyond *max_entries*."""
+        with self._lock:
+            conn = self._ensure_open_locked()
+            self._flush_touches_locked()
+            count = conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE namespace = ?", (namespace,)
+            ).fetchone()[0]
+            excess = int(count) - max(0, int(max_entries))
+            if excess <= 0:
+                return 0
+            with conn:
+                rows = conn.execute(
+                    "SELECT key, digest FROM entries WHERE namespace = ? "
+                    "ORDER BY last_used LIMIT ?",
+                    (namespace, excess),
+                ).fetchall()
+                unlinked: List[Tuple[str, str, int]] = []
+                for key, digest in rows:
+                    conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                    unlinked.extend(self._release_blob_locked(conn, digest))
+            self._unlink_blobs(unlinked)
+            return len(rows)
+
+    def evict_to_budget(self, byte_budget: Optional[int] = None, *, keep: Iterable[str] = ()) -> int:
+        """Evict least-recently-used blobs (and their entries) until under budget."""
+        budget = self.byte_budget if byte_budget is None else max(0, int(byte_budget))
+        keep_set = set(keep)
+        with self._lock:
+            conn = self._ensure_open_locked()
+            if self._total_bytes <= budget:
+                return 0
+            self._flush_touches_locked()
+            evicted = 0
+            unlinked: List[Tuple[str, str, int]] = []
+            with conn:
+                offset = 0
+                while self._total_bytes > budget:
+                    rows = conn.execute(
+                        "SELECT digest, ext, size FROM blobs ORDER BY last_used LIMIT ? OFFSET ?",
+                        (_EVICT_BATCH, offset),
+                    ).fetchall()
+                    if not rows:
+                        break
+                    for digest, ext, size in rows:
+                        if self._total_bytes <= budget:
+                            break
+                        if digest in keep_set:
+                            offset += 1
+                            continue
+                        conn.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+                        conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+                        self._total_bytes -= int(size)
+                        unlinked.append((digest, ext, int(size)))
+                        evicted += 1
+            self._unlink_blobs(unlinked)
+            if evicted:
+                freed = sum(size for _d, _e, size in unlinked)
+                self._stats["evictions"] += evicted
+                self._stats["evicted_bytes"] += freed
+                logger.debug("[RESOURCES] Asset store evicted %d blobs (%d bytes)", evicted, freed)
+            return evicted
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, namespace: str, key: str, *, touch: bool = True) -> Optional[AssetRecord]:
+        """Return the entry if its blob is still on disk; records the access."""
+        with self._lock:
+            conn = self._ensure_open_locked()
+            row = conn.execute(
+                "SELECT e.digest, b.ext, b.size, e.created, e.last_used, e.meta "
+                "FROM entries e JOIN blobs b ON b.digest = e.digest "
+                "WHERE e.namespace = ? AND e.key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            record = self._record(namespace, key, row)
+            if not record.path.is_file():
+                # Deleted externally (cache maintenance, AV, user).
+                self._stats["missing_blobs"] += 1
+                self._stats["misses"] += 1
+                self._drop_blob_locked(record.digest)
+                return None
+            self._stats["hits"] += 1
+            if touch:
+                now = time.time()
+                self._pending_touches[(namespace, key)] = now
+                if len(self._pending_touches) >= _TOUCH_FLUSH_THRESHOLD:
+                    self._flush_touches_locked()
+                record = replace(record, last_used=now)
+            return record
+
+    def contains(self, namespace: str, key: str) -> bool:
+        """Index-only membership test (does not touch the blob)."""
+        with self._lock:
+            conn = self._ensure_open_locked()
+            return conn.execute(
+                "SELECT 1 FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone() is not None
+
+    def entries(self, namespace: str, *, limit: Optional[int] = None) -> List[AssetRecord]:
+        """Entries of *namespace*, most recently used first, from the index only."""
+        with self._lock:
+            conn = self._ensure_open_locked()
+            self._flush_touches_locked()
+            sql = (
+                "SELECT e.key, e.digest, b.ext, b.size, e.created, e.last_used, e.meta "
+                "FROM entries e JOIN blobs b ON b.digest = e.digest "
+                "WHERE e.namespace = ? ORDER BY e.last_used DESC"
+            )
+            params: Tuple[Any, ...] = (namespace,)
+            if limit is not None:
+                sql += " LIMIT ?"
+                params = (namespace, max(0, int(limit)))
+            return [self._record(namespace, row[0], row[1:]) for row in conn.execute(sql, params)]
+
+    def namespace_stats(self, namespace: str) -> Tuple[int, int]:
+        """``(entry_count, logical_bytes)`` for *namespace*."""
+        with self._lock:
+            conn = self._ensure_open_locked()
+            row = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(b.size), 0) FROM entries e "
+                "JOIN blobs b ON b.digest = e.digest WHERE e.namespace = ?",
+                (namespace,),
+            ).fetchone()
+            return int(row[0]), int(row[1])
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._ensure_open_locked()
+            blobs = conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+            entries, logical = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(b.size), 0) FROM entries e JOIN blobs b ON b.digest = e.digest"
+            ).fetchone()
+            return {
+                "blobs": int(blobs),
+                "entries": int(entries),
+                "bytes": self._total_bytes,
+                "byte_budget": self.byte_budget,
+                "dedup_saved_bytes": max(0, int(logical) - self._total_bytes),
+                **self._stats,
+            }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._flush_touches_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                return
+            try:
+                self._flush_touches_locked()
+            except sqlite3.Error as e:
+                logger.debug("[RESOURCES] Asset store touch flush failed: %s", e)
+            self._conn = None
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.debug("[RESOURCES] Asset store close failed: %s", e)
+
+    # ------------------------------------------------------------------
+    # Internals (lock held)
+    # ------------------------------------------------------------------
+
+    def _ensure_open_locked(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.root / INDEX_FILE), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if row is None or row[0] != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS entries")
+            conn.execute("DROP TABLE IF EXISTS blobs")
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)", (SCHEMA_VERSION,))
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            "digest TEXT PRIMARY KEY, ext TEXT NOT NULL, size INTEGER NOT NULL, "
+            "refs INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS blobs_lru ON blobs (last_used)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, digest TEXT NOT NULL, "
+            "meta TEXT NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest)")
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (namespace, last_used)")
+        conn.commit()
+        self._total_bytes = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0])
+        self._conn = conn
+        return conn
+
+    def _link_locked(
+        self,
+        namespace: str,
+        key: str,
+        digest: str,
+        ext: str,
+        size: int,
+        meta: Optional[Dict[str, Any]],
+        blob_existed: bool,
+    ) -> AssetRecord:
+        conn = self._conn
+        assert conn is not None
+        now = time.time()
+        unlinked: List[Tuple[str, str, int]] = []
+        with conn:
+            if blob_existed:
+                ext = conn.execute("SELECT ext FROM blobs WHERE digest = ?", (digest,)).fetchone()[0]
+            else:
+                conn.execute(
+                    "INSERT INTO blobs (digest, ext, size, refs, last_used) VALUES (?, ?, ?, 0, ?)",
+                    (digest, ext, int(size), now),
+                )
+                self._total_bytes += int(size)
+            previous = conn.execute(
+                "SELECT digest, created FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            created = now
+            if previous is not None:
+                created = float(previous[1])
+                conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                if previous[0] != digest:
+                    unlinked.extend(self._release_blob_locked(conn, previous[0]))
+                else:
+                    conn.execute("UPDATE blobs SET refs = refs - 1 WHERE digest = ?", (digest,))
+            conn.execute(
+                "INSERT INTO entries (namespace, key, digest, meta, created, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, digest, json.dumps(meta or {}), created, now),
+            )
+            conn.execute(
+                "UPDATE blobs SET refs = refs + 1, last_used = ? WHERE digest = ?", (now, digest)
+            )
+        self._pending_touches.pop((namespace, key), None)
+        self._unlink_blobs(unlinked)
+        self._stats["puts"] += 1
+        if blob_existed:
+            self._stats["dedup_hits"] += 1
+        self.evict_to_budget(keep=(digest,))
+        return AssetRecord(
+            namespace=namespace,
+            key=key,
+            digest=digest,
+            path=self._blob_path(digest, ext),
+            size=int(size),
+            ext=ext,
+            created=created,
+            last_used=now,
+            meta=dict(meta or {}),
+        )
+
+    def _release_blob_locked(self, conn: sqlite3.Connection, digest: str) -> List[Tuple[str, str, int]]:
+        """Drop one reference; returns the blob for unlinking when it was the last."""
+        conn.execute("UPDATE blobs SET refs = refs - 1 WHERE digest = ?", (digest,))
+        row = conn.execute("SELECT ext, size, refs FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        if row is None or int(row[2]) > 0:
+            return []
+        conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        self._total_bytes -= int(row[1])
+        return [(digest, row[0], int(row[1]))]
+
+    def _drop_blob_locked(self, digest: str) -> None:
+        conn = self._conn
+        assert conn is not None
+        with conn:
+            row = conn.execute("SELECT size FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            conn.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+            conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        if row is not None:
+            self._total_bytes -= int(row[0])
+
+    def _flush_touches_locked(self) -> None:
+        if not self._pending_touches or self._conn is None:
+            return
+        touches = self._pending_touches
+        self._pending_touches = {}
+        conn = self._conn
+        with conn:
+            conn.executemany(
+                "UPDATE entries SET last_used = ? WHERE namespace = ? AND key = ?",
+                [(ts, ns, key) for (ns, key), ts in touches.items()],
+            )
+            conn.executemany(
+                "UPDATE blobs SET last_used = MAX(last_used, ?) WHERE digest = "
+                "(SELECT digest FROM entries WHERE namespace = ? AND key = ?)",
+                [(ts, ns, key) for (ns, key), ts in touches.items()],
+            )
+
+    def _record(self, namespace: str, key: str, row: Tuple[Any, ...]) -> AssetRecord:
+        digest, ext, size, created, last_used, meta = row
+        try:
+            meta_dict = json.loads(meta) if meta else {}
+        except ValueError:
+            meta_dict = {}
+        return AssetRecord(
+            namespace=namespace,
+            key=key,
+            digest=digest,
+            path=self._blob_path(digest, ext),
+            size=int(size),
+            ext=ext,
+            created=float(created),
+            last_used=float(last_used),
+            meta=meta_dict,
+        )
+
+    def _blob_path(self, digest: str, ext: str) -> Path:
+        return self.blob_dir / digest[:2] / f"{digest}.{ext}"
+
+    @staticmethod
+    def _write_atomic(target: Path, data: bytes) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, target)
+        except Exception:
+            _unlink(tmp)
+            raise
+
+    def _unlink_blobs(self, blobs: Iterable[Tuple[str, str, int]]) -> None:
+        for digest, ext, _size in blobs:
+            _unlink(self._blob_path(digest, ext))
+
+
+class AssetNamespace:
+    """A provider's view of the store: the same API with the namespace bound."""
+
+    def __init__(self, store: AssetStore, name: str, *, legacy_dir: Optional[Path] = None) -> None:
+        self.store = store
+        self.name = name
+        self.legacy_dir = Path(legacy_dir) if legacy_dir is not None else None
+
+    @property
+    def private(self) -> bool:
+        """True when the store is rooted at this namespace's own directory."""
+        return self.legacy_dir is not None and self.store.root == self.legacy_dir
+
+    def put(self, key: str, data: bytes, *, ext: str = "bin", meta: Optional[Dict[str, Any]] = None) -> AssetRecord:
+        return self.store.put(self.name, key, data, ext=ext, meta=meta)
+
+    def put_file(
+        self,
+        key: str,
+        source: Path,
+        *,
+        ext: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        move: bool = True,
+    ) -> AssetRecord:
+        return self.store.put_file(self.name, key, source, ext=ext, meta=meta, move=move)
+
+    def get(self, key: str, *, touch: bool = True) -> Optional[AssetRecord]:
+        return self.store.get(self.name, key, touch=touch)
+
+    def contains(self, key: str) -> bool:
+        return self.store.contains(self.name, key)
+
+    def entries(self, *, limit: Optional[int] = None) -> List[AssetRecord]:
+        return self.store.entries(self.name, limit=limit)
+
+    def update_meta(self, key: str, meta: Dict[str, Any]) -> bool:
+        return self.store.update_meta(self.name, key, meta)
+
+    def remove(self, key: str) -> bool:
+        return self.store.remove(self.name, key)
+
+    def clear(self) -> Tuple[int, int]:
+        return self.store.clear(self.name)
+
+    def trim(self, max_entries: int) -> int:
+        return self.store.trim_namespace(self.name, max_entries)
+
+    def stats(self) -> Tuple[int, int]:
+        return self.store.namespace_stats(self.name)
+
+    def adopt_legacy_files(
+        self,
+        *,
+        suffixes: Iterable[str] = IMAGE_SUFFIXES,
+        meta_for: Optional[Callable[[Path], Optional[Dict[str, Any]]]] = None,
+        accept: Optional[Callable[[Path], bool]] = None,
+    ) -> int:
+        """Move loose files from the legacy directory into the store.
+
+        Files are keyed by their stem, matching the old per-provider naming.
+        Hidden files (in-flight ``.tmp.`` downloads) are left alone; files
+        failing *accept* are deleted.  *meta_for(path)* may supply entry
+        metadata.  Returns the count adopted.
+        """
+        if self.legacy_dir is None or not self.legacy_dir.is_dir():
+            return 0
+        wanted = {s.lower() for s in suffixes}
+        adopted = 0
+        try:
+            candidates = [
+                entry for entry in os.scandir(self.legacy_dir)
+                if not entry.name.startswith(".")
+                and entry.is_file()
+                and Path(entry.name).suffix.lower() in wanted
+            ]
+        except OSError as e:
+            logger.debug("[RESOURCES] Legacy scan failed for %s: %s", self.legacy_dir, e)
+            return 0
+        for entry in candidates:
+            path = Path(entry.path)
+            try:
+                if accept is not None and not accept(path):
+                    _unlink(path)
+                    continue
+                meta = meta_for(path) if meta_for is not None else None
+                self.put_file(path.stem, path, meta=meta, move=True)
+                adopted += 1
+            except Exception as e:
+                logger.debug("[RESOURCES] Failed to adopt legacy asset %s: %s", path.name, e)
+        if adopted:
+            logger.info("[RESOURCES] Adopted %d legacy files into asset namespace %s", adopted, self.name)
+        return adopted
+
+    def close(self) -> None:
+        """Close a private store; the shared store outlives its namespaces."""
+        if self.private:
+            release_asset_store(self.store)
+
+
+# ----------------------------------------------------------------------
+# Store registry
+# ----------------------------------------------------------------------
+
+_stores: Dict[str, AssetStore] = {}
+_stores_lock = threading.Lock()
+
+
+def open_asset_store(root: Path, byte_budget: int = DEFAULT_ASSET_BUDGET_BYTES) -> AssetStore:
+    """Return the process-wide store for *root*, creating it on first use."""
+    key = os.path.normcase(str(Path(root).resolve()))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = AssetStore(Path(root), byte_budget)
+            _stores[key] = store
+        return store
+
+
+def release_asset_store(store: AssetStore) -> None:
+    key = os.path.normcase(str(store.root.resolve()))
+    with _stores_lock:
+        if _stores.get(key) is store:
+            del _stores[key]
+    store.close()
+
+
+def get_shared_asset_store() -> AssetStore:
+    """The app-wide store under ``<app_data>/cache/assets/``."""
+    from core.settings.storage_paths import get_asset_store_dir
+
+    return open_asset_store(get_asset_store_dir())
+
+
+def namespace_for_directory(cache_dir: Path, *, app_data_dir: Optional[Path] = None) -> AssetNamespace:
+    """Map a provider's cache directory onto an asset namespace.
+
+    Directories under the app data root share the app-wide store, namespaced
+    by their path relative to that root; any other directory gets a private
+    store rooted at itself.
+    """
+    cache_dir = Path(cache_dir)
+    if app_data_dir is None:
+        from core.settings.storage_paths import resolve_app_data_dir
+
+        app_data_dir = resolve_app_data_dir()
+    try:
+        relative = cache_dir.resolve().relative_to(Path(app_data_dir).resolve())
+    except ValueError:
+        return open_asset_store(cache_dir).namespace("local", legacy_dir=cache_dir)
+    store = open_asset_store(Path(app_data_dir) / "cache" / "assets")
+    return store.namespace(relative.as_posix(), legacy_dir=cache_dir)
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+
+def _normalize_ext(ext: str) -> str:
+    ext = str(ext or "bin").lower().lstrip(".")
+    return "jpg" if ext == "jpeg" else (ext or "bin")
+
+
+def _hash_file(path: Path) -> Tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_HASH_CHUNK)
+            if not chunk:
+                break
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _unlink(path: Path) -> None:
+    try:
+        Path(path).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug("[RESOURCES] Failed to remove %s: %s", path, e)
@@ -0,0 +1,233 @@
+"""
+Byte-budgeted pool for reusable QImage/QPixmap buffers.
+
+Qt image objects can only be reused at their exact dimensions and format, so
+entries are keyed by ``(kind, format, width, height)``.  Each key also maps
+to a power-of-two byte *size class*, which the pool uses for its
+accounting.  The pool as a whole is capped by a byte budget and trimmed
+least-recently-released first, so a burst of odd sizes (shadows, thumbnails)
+cannot pin memory that full-screen canvases need.
+
+The pool never touches the objects beyond ``width()``, ``height()``,
+``format()``/``depth()`` and ``sizeInBytes()``, so it is safe to use from
+worker threads for QImage; QPixmap entries must still only be acquired and
+released on the GUI thread.
+"""
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+PoolKey = Tuple[str, str, int, int]
+
+ANY_FORMAT = "*"
+
+
+def size_class(nbytes: int) -> int:
+    """Smallest power of two >= *nbytes* (0 for empty buffers)."""
+    if nbytes <= 0:
+        return 0
+    return 1 << max(0, math.ceil(math.log2(nbytes)))
+
+
+def format_key(image_format: Any) -> str:
+    """Stable pool key for a ``QImage.Format`` (or any enum-like value)."""
+    return str(getattr(image_format, "name", image_format))
+
+
+def _format_name(obj: Any, kind: str) -> str:
+    if kind == "pixmap":
+        try:
+            return f"depth{int(obj.depth())}"
+        except Exception:
+            return "depth32"
+    try:
+        image_format = obj.format()
+    except Exception:
+        return "unknown"
+    return format_key(image_format)
+
+
+def _buffer_bytes(obj: Any, kind: str) -> int:
+    if kind == "image":
+        try:
+            return int(obj.sizeInBytes())
+        except Exception:
+            pass
+    try:
+        depth = int(obj.depth())
+    except Exception:
+        depth = 32
+    return int(obj.width()) * int(obj.height()) * max(1, math.ceil(depth / 8))
+
+
+class ImageBufferPool:
+    """Size-classed, per-format, LRU-trimmed pool with a global byte budget."""
+
+    def __init__(self, byte_budget: int, max_per_key: int = 8, lock: Optional[Any] = None) -> None:
+        self.byte_budget = max(0, int(byte_budget))
+        self.max_per_key = max(1, int(max_per_key))
+        self._lock = lock if lock is not None else threading.Lock()
+        # (key, serial) -> (object, nbytes), oldest release first
+        self._lru: "OrderedDict[Tuple[PoolKey, int], Tuple[Any, int]]" = OrderedDict()
+        self._by_key: Dict[PoolKey, List[int]] = {}
+        # (kind, width, height) -> formats currently pooled, for format-agnostic acquires
+        self._formats: Dict[Tuple[str, int, int], Dict[str, int]] = {}
+        self._serial = 0
+        self._bytes_held = 0
+        self._stats: Dict[str, int] = {
+            "pixmap_hits": 0,
+            "pixmap_misses": 0,
+            "image_hits": 0,
+            "image_misses": 0,
+            "evictions": 0,
+            "evicted_bytes": 0,
+            "rejected": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Acquire / release
+    # ------------------------------------------------------------------
+
+    def acquire(self, kind: str, width: int, height: int, image_format: Optional[str] = None) -> Optional[Any]:
+        """Pop the most recently released buffer for the exact shape, or None.
+
+        ``image_format=None`` accepts any pooled format of that size.
+        """
+        with self._lock:
+            key = self._resolve_key(kind, int(width), int(height), image_format)
+            serials = self._by_key.get(key) if key is not None else None
+            if not serials:
+                self._stats[f"{kind}_misses"] += 1
+                return None
+            serial = serials.pop()
+            obj, nbytes = self._lru.pop((key, serial))
+            self._forget_locked(key, nbytes, serials)
+            self._stats[f"{kind}_hits"] += 1
+            return obj
+
+    def release(self, kind: str, obj: Any) -> bool:
+        """Pool *obj*; returns False if it is null, too large or its key is full."""
+        try:
+            if obj is None or obj.isNull():
+                return False
+            width, height = int(obj.width()), int(obj.height())
+        except Exception as e:
+            logger.debug("[RESOURCES] Exception suppressed: %s", e)
+            return False
+        nbytes = _buffer_bytes(obj, kind)
+        key: PoolKey = (kind, _format_name(obj, kind), width, height)
+
+        with self._lock:
+            if nbytes > self.byte_budget:
+                self._stats["rejected"] += 1
+                return False
+            serials = self._by_key.setdefault(key, [])
+            if len(serials) >= self.max_per_key:
+                self._stats["rejected"] += 1
+                return False
+            self._serial += 1
+            serials.append(self._serial)
+            self._lru[(key, self._serial)] = (obj, nbytes)
+            self._bytes_held += nbytes
+            formats = self._formats.setdefault((kind, width, height), {})
+            formats[key[1]] = formats.get(key[1], 0) + 1
+            self._trim_locked()
+            return True
+
+    def trim(self, byte_budget: Optional[int] = None) -> int:
+        """Evict LRU entries until under *byte_budget* (default: the pool budget)."""
+        with self._lock:
+            return self._trim_locked(self.byte_budget if byte_budget is None else max(0, int(byte_budget)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lru.clear()
+            self._by_key.clear()
+            self._formats.clear()
+            self._bytes_held = 0
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    @property
+    def bytes_held(self) -> int:
+        return self._bytes_held
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = {"pixmap": 0, "image": 0}
+            bytes_by_kind = {"pixmap": 0, "image": 0}
+            by_class: Dict[int, int] = {}
+            by_format: Dict[str, int] = {}
+            for (key, _serial), (_obj, nbytes) in self._lru.items():
+                kind = key[0]
+                counts[kind] += 1
+                bytes_by_kind[kind] += nbytes
+                cls = size_class(nbytes)
+                by_class[cls] = by_class.get(cls, 0) + nbytes
+                by_format[key[1]] = by_format.get(key[1], 0) + nbytes
+            return {
+                "pixmap_pool_size": counts["pixmap"],
+                "image_pool_size": counts["image"],
+                "pixmap_buckets": sum(1 for k, v in self._by_key.items() if k[0] == "pixmap" and v),
+                "image_buckets": sum(1 for k, v in self._by_key.items() if k[0] == "image" and v),
+                "pixmap_bytes": bytes_by_kind["pixmap"],
+                "image_bytes": bytes_by_kind["image"],
+                "bytes_held": self._bytes_held,
+                "byte_budget": self.byte_budget,
+                "bytes_by_size_class": dict(sorted(by_class.items())),
+                "bytes_by_format": by_format,
+                **self._stats,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals (lock held)
+    # ------------------------------------------------------------------
+
+    def _resolve_key(self, kind: str, width: int, height: int, image_format: Optional[str]) -> Optional[PoolKey]:
+        if image_format is not None and image_format != ANY_FORMAT:
+            return (kind, image_format, width, height)
+        formats = self._formats.get((kind, width, height))
+        if not formats:
+            return None
+        # Prefer the format with the most pooled buffers.
+        return (kind, max(formats, key=formats.__getitem__), width, height)
+
+    def _forget_locked(self, key: PoolKey, nbytes: int, serials: List[int]) -> None:
+        self._bytes_held -= nbytes
+        if not serials:
+            del self._by_key[key]
+        shape = (key[0], key[2], key[3])
+        formats = self._formats.get(shape)
+        if formats is not None:
+            remaining = formats.get(key[1], 0) - 1
+            if remaining > 0:
+                formats[key[1]] = remaining
+            else:
+                formats.pop(key[1], None)
+                if not formats:
+                    del self._formats[shape]
+
+    def _trim_locked(self, budget: Optional[int] = None) -> int:
+        budget = self.byte_budget if budget is None else budget
+        evicted = 0
+        while self._bytes_held > budget and self._lru:
+            (key, serial), (_obj, nbytes) = self._lru.popitem(last=False)
+            serials = self._by_key.get(key, [])
+            try:
+                serials.remove(serial)
+            except ValueError:
+                pass
+            self._forget_locked(key, nbytes, serials)
+            self._stats["evictions"] += 1
+            self._stats["evicted_bytes"] += nbytes
+            evicted += 1
+        return evicted
@@ -16,6 +16,7 @@ import threading
 from types import MappingProxyType
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
+from .buffer_pool import ImageBufferPool, format_key
 from .types import CleanupProtocol, ResourceInfo, ResourceType
 from core.logging.logger import get_logger, is_verbose_logging
 
@@ -172,6 +173,7 @@ class ResourceManager:
     # Pool configuration
     PIXMAP_POOL_MAX_SIZE = 8  # Max pooled pixmaps per size bucket
     IMAGE_POOL_MAX_SIZE = 8   # Max pooled images per size bucket
+    POOL_BYTE_BUDGET = 128 * 1024 * 1024  # Global cap across both pools
     _app_shared_manager: Optional["ResourceManager"] = None
     _app_shared_lock = threading.RLock()
 
@@ -210,13 +212,15 @@ class ResourceManager:
         self._initialized = False
         self._lock = threading.RLock()
         
-        # Object pools for reducing GC pressure
-        # Key: (width, height) tuple, Value: list of pooled objects
-        self._pixmap_pool: Dict[tuple, List[Any]] = {}
-        self._image_pool: Dict[tuple, List[Any]] = {}
+        # Object pools for reducing GC pressure: exact (kind, format, w, h)
+        # buckets under one global byte budget, trimmed LRU-first.
         self._pool_lock = threading.Lock()
-        self._pool_stats = {"pixmap_hits": 0, "pixmap_misses": 0, 
-                          "image_hits": 0, "image_misses": 0}
+        self._buffer_pool = ImageBufferPool(
+            self.POOL_BYTE_BUDGET,
+            max_per_key=max(self.PIXMAP_POOL_MAX_SIZE, self.IMAGE_POOL_MAX_SIZE),
+            lock=self._pool_lock,
+        )
+        self._pool_stats = self._buffer_pool._stats
         
         # Register cleanup on interpreter shutdown
         if not getattr(sys, 'is_finalizing', False):
@@ -980,19 +984,15 @@ class ResourceManager:
         Returns:
             QPixmap from pool or None
         """
-        key = (width, height)
-        with self._pool_lock:
-            if key in self._pixmap_pool and self._pixmap_pool[key]:
-                pixmap = self._pixmap_pool[key].pop()
-                self._pool_stats["pixmap_hits"] += 1
-                # Clear the pixmap for reuse
-                try:
-                    pixmap.fill()  # Fill with transparent
-                except Exception as e:
-                    _logger.debug("[RESOURCES] Exception suppressed: %s", e)
-                return pixmap
-            self._pool_stats["pixmap_misses"] += 1
-            return None
+        pixmap = self._buffer_pool.acquire("pixmap", width, height)
+        if pixmap is not None:
+            try:
+                from PySide6.QtCore import Qt
+
+                pixmap.fill(Qt.GlobalColor.transparent)
+            except Exception as e:
+                _logger.debug("[RESOURCES] Exception suppressed: %s", e)
+        return pixmap
     
     def release_pixmap(self, pixmap: Any) -> bool:
         """
@@ -1002,51 +1002,39 @@ class ResourceManager:
             pixmap: QPixmap to return to pool
             
         Returns:
-            True if pooled, False if pool is full or pixmap is invalid
+            True if pooled, False if the bucket is full, the pixmap is
+            invalid or larger than the pool byte budget
         """
-        if pixmap is None:
-            return False
-        try:
-            if pixmap.isNull():
-                return False
-            key = (pixmap.width(), pixmap.height())
-        except Exception as e:
-            _logger.debug("[RESOURCES] Exception suppressed: %s", e)
-            return False
-        
-        with self._pool_lock:
-            if key not in self._pixmap_pool:
-                self._pixmap_pool[key] = []
-            if len(self._pixmap_pool[key]) < self.PIXMAP_POOL_MAX_SIZE:
-                self._pixmap_pool[key].append(pixmap)
-                return True
+        if self._shutdown:
             return False
+        return self._buffer_pool.release("pixmap", pixmap)
     
-    def acquire_image(self, width: int, height: int, format_hint: Any = None) -> Optional[Any]:
+    def acquire_image(
+        self, width: int, height: int, format_hint: Any = None, *, clear: bool = True
+    ) -> Optional[Any]:
         """
         Acquire a QImage from the pool or return None if none available.
         
         Args:
             width: Required width
             height: Required height
-            format_hint: Optional QImage.Format to match
+            format_hint: Optional QImage.Format to match; None accepts any
+                pooled format of the requested size
+            clear: Fill with transparent before returning; callers that
+                immediately fill with their own background pass False
             
         Returns:
             QImage from pool or None
         """
-        key = (width, height)
-        with self._pool_lock:
-            if key in self._image_pool and self._image_pool[key]:
-                image = self._image_pool[key].pop()
-                self._pool_stats["image_hits"] += 1
-                # Fill with transparent
-                try:
-                    image.fill(0)
-                except Exception as e:
-                    _logger.debug("[RESOURCES] Exception suppressed: %s", e)
-                return image
-            self._pool_stats["image_misses"] += 1
-            return None
+        image_format = None if format_hint is None else format_key(format_hint)
+        image = self._buffer_pool.acquire("image", width, height, image_format)
+        if image is not None and clear:
+            # Fill with transparent
+            try:
+                image.fill(0)
+            except Exception as e:
+                _logger.debug("[RESOURCES] Exception suppressed: %s", e)
+        return image
     
     def release_image(self, image: Any) -> bool:
         """
@@ -1056,45 +1044,25 @@ class ResourceManager:
             image: QImage to return to pool
             
         Returns:
-            True if pooled, False if pool is full or image is invalid
+            True if pooled, False if the bucket is full, the image is
+            invalid or larger than the pool byte budget
         """
-        if image is None:
-            return False
-        try:
-            if image.isNull():
-                return False
-            key = (image.width(), image.height())
-        except Exception as e:
-            _logger.debug("[RESOURCES] Exception suppressed: %s", e)
-            return False
-        
-        with self._pool_lock:
-            if key not in self._image_pool:
-                self._image_pool[key] = []
-            if len(self._image_pool[key]) < self.IMAGE_POOL_MAX_SIZE:
-                self._image_pool[key].append(image)
-                return True
+        if self._shutdown:
             return False
+        return self._buffer_pool.release("image", image)
+    
+    def trim_pools(self, byte_budget: Optional[int] = None) -> int:
+        """Evict least-recently released buffers until under *byte_budget*."""
+        return self._buffer_pool.trim(byte_budget)
     
     def clear_pools(self) -> None:
         """Clear all object pools."""
-        with self._pool_lock:
-            self._pixmap_pool.clear()
-            self._image_pool.clear()
-            self._logger.debug("Object pools cleared")
+        self._buffer_pool.clear()
+        self._logger.debug("Object pools cleared")
     
     def get_pool_stats(self) -> Dict[str, Any]:
-        """Get object pool statistics."""
-        with self._pool_lock:
-            total_pixmaps = sum(len(v) for v in self._pixmap_pool.values())
-            total_images = sum(len(v) for v in self._image_pool.values())
-            return {
-                "pixmap_pool_size": total_pixmaps,
-                "image_pool_size": total_images,
-                "pixmap_buckets": len(self._pixmap_pool),
-                "image_buckets": len(self._image_pool),
-                **self._pool_stats
-            }
+        """Get object pool statistics (counts, bytes held, hits/misses, evictions)."""
+        return self._buffer_pool.stats()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get resource manager statistics."""
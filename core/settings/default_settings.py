@@ -1218,7 +1218,9 @@ DEFAULT_SETTINGS = {'accessibility': {'dimming': {'enabled': False, 'opacity': 4
                          'show_condition_icon': True,
                          'show_details_row': True,
                          'show_forecast': True}},
- 'workers': {'fft': {'enabled': False},
+ 'workers': {'audio': {'enabled': False},
+             'audio.enabled': False,
+             'fft': {'enabled': False},
              'fft.enabled': False,
              'image': {'enabled': True},
              'image.enabled': True,
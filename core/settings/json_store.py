@@ -4,6 +4,8 @@ Provides a thin API compatible with the subset of QSettings used by
 core.settings.settings_manager.SettingsManager. Internally maintains a flat
 mapping of keys → values (where keys match the dotted notation previously
 stored in QSettings) while persisting a canonical nested snapshot to disk.
+Every mutation also republishes an immutable read snapshot (see
+core.settings.settings_snapshot) that readers use without locking.
 """
 from __future__ import annotations
 
@@ -12,9 +14,10 @@ import json
 import os
 import threading
 import weakref
+from contextlib import contextmanager
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Set, Tuple
 
 from core.logging.logger import get_logger
 from core.settings.persistence import (
@@ -22,6 +25,7 @@ from core.settings.persistence import (
     flush_settings_path,
     get_settings_persistence,
 )
+from core.settings.settings_snapshot import SettingsSnapshot, freeze_value
 
 logger = get_logger(__name__)
 
@@ -55,9 +59,11 @@ class JsonSettingsStore:
         self._profile = profile
         self._meta: Dict[str, Any] = dict(metadata or {})
         self._data: Dict[str, Any] = {}
-        self._manager_cache: Dict[str, Any] = {}
-        self._manager_cache_lock = threading.RLock()
         self._lock = threading.RLock()
+        self._snapshot = SettingsSnapshot(0, {})
+        self._publish_hold = 0
+        self._pending_keys: Set[str] = set()
+        self._pending_full = False
         self._dirty = False
         self._state_revision = 0
         self._durable_state_revision = 0
@@ -166,19 +172,57 @@ class JsonSettingsStore:
         self._last_requested_state_revision = self._state_revision
         self._last_ticket = None
         self._last_persistence_error = None
-        with self._manager_cache_lock:
-            self._manager_cache.clear()
         self._dirty = False
+        self._publish_snapshot_locked(None)
 
-    def manager_cache(self) -> Dict[str, Any]:
-        """Return the cache shared by every manager for this store authority."""
+    def snapshot(self) -> SettingsSnapshot:
+        """Return the current immutable read snapshot (lock-free)."""
 
-        return self._manager_cache
+        return self._snapshot
 
-    def manager_cache_lock(self) -> threading.RLock:
-        """Return the lock protecting the shared manager read cache."""
+    @contextmanager
+    def deferred_publish(self) -> Iterator[None]:
+        """Hold snapshot publication so a batch of mutations appears at once."""
 
-        return self._manager_cache_lock
+        with self._lock:
+            self._publish_hold += 1
+            try:
+                yield
+            finally:
+                self._publish_hold -= 1
+                if self._publish_hold == 0 and (self._pending_full or self._pending_keys):
+                    keys = None if self._pending_full else tuple(self._pending_keys)
+                    self._pending_full = False
+                    self._pending_keys.clear()
+                    self._publish_snapshot_locked(keys)
+
+    def _publish_snapshot_locked(self, keys: Optional[Iterable[str]]) -> None:
+        """Freeze changed *keys* (all when None) and swap in a new snapshot.
+
+        Unchanged values are shared with the previous snapshot, so a
+        publish costs a shallow copy plus freezing what actually changed.
+        """
+
+        if self._publish_hold:
+            if keys is None:
+                self._pending_full = True
+            else:
+                self._pending_keys.update(keys)
+            return
+        previous = self._snapshot.data
+        if keys is None:
+            frozen = {
+                key: freeze_value(value, previous.get(key))
+                for key, value in self._data.items()
+            }
+        else:
+            frozen = dict(previous)
+            for key in keys:
+                if key in self._data:
+                    frozen[key] = freeze_value(self._data[key], previous.get(key))
+                else:
+                    frozen.pop(key, None)
+        self._snapshot = SettingsSnapshot(self._state_revision, frozen)
 
     def manager_operation_lock(self) -> threading.RLock:
         """Return the store-wide lock ordering manager reads and mutations."""
@@ -264,9 +308,12 @@ class JsonSettingsStore:
                 self._dirty = True
                 self._last_persistence_error = error
 
-    def _mark_changed_locked(self) -> None:
+    def _mark_changed_locked(self, keys: Optional[Iterable[str]] = ()) -> None:
+        """Bump the revision and republish *keys* (every key when None)."""
         self._state_revision += 1
         self._dirty = True
+        if keys is None or keys:
+            self._publish_snapshot_locked(keys)
 
     # ------------------------------------------------------------------
     # QSettings-like API surface
@@ -283,7 +330,7 @@ class JsonSettingsStore:
             if current == value:
                 return
             self._data[key] = deepcopy(value)
-            self._mark_changed_locked()
+            self._mark_changed_locked((key,))
 
     def contains(self, key: str) -> bool:
         with self._lock:
@@ -293,12 +340,12 @@ class JsonSettingsStore:
         with self._lock:
             if key in self._data:
                 del self._data[key]
-                self._mark_changed_locked()
+                self._mark_changed_locked((key,))
 
     def clear(self) -> None:
         with self._lock:
             self._data.clear()
-            self._mark_changed_locked()
+            self._mark_changed_locked(None)
 
     def allKeys(self) -> Iterable[str]:
         with self._lock:
@@ -311,7 +358,7 @@ class JsonSettingsStore:
     def replace_all(self, items: Mapping[str, Any]) -> None:
         with self._lock:
             self._data = {k: deepcopy(v) for k, v in items.items()}
-            self._mark_changed_locked()
+            self._mark_changed_locked(None)
 
     # Metadata helpers -------------------------------------------------
     def update_metadata(self, **entries: Any) -> None:
@@ -118,6 +118,7 @@ class CacheSettings:
     max_items: int = 16
     max_memory_mb: int = 256
     max_concurrent: int = 2
+    disk_cache_mb: int = 1024
     
     @classmethod
     def from_settings(cls, settings: "SettingsManager") -> "CacheSettings":
@@ -127,6 +128,7 @@ class CacheSettings:
             max_items=settings.get("cache.max_items", 16),
             max_memory_mb=settings.get("cache.max_memory_mb", 256),
             max_concurrent=settings.get("cache.max_concurrent", 2),
+            disk_cache_mb=settings.get("cache.disk_cache_mb", 1024),
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -136,6 +138,7 @@ class CacheSettings:
             "cache.max_items": self.max_items,
             "cache.max_memory_mb": self.max_memory_mb,
             "cache.max_concurrent": self.max_concurrent,
+            "cache.disk_cache_mb": self.disk_cache_mb,
         }
 
 
@@ -15,6 +15,7 @@ from core.settings.json_store import (
     get_json_settings_store,
 )
 from core.settings.models import SpotifyVisualizerSettings
+from core.settings.settings_snapshot import MISSING, SettingAccessor, SettingsSnapshot, thaw_value
 from core.settings.visualizer_settings_snapshot import normalize_visualizer_section_mapping
 from core.settings.visualizer_retired_modes import strip_retired_visualizer_settings
 from core.settings.visualizer_settings_contract import (
@@ -104,15 +105,10 @@ class SettingsManager(QObject):
         self._storage_path = storage_path
         self._storage_base_dir = storage_base_dir
         # Managers sharing one profile path also share the store operation
-        # lock.  A cache miss therefore cannot read an old store value and
-        # repopulate the shared cache after a peer mutation invalidates it.
+        # lock, which orders mutations.  Reads go through the store's
+        # published snapshot and take no lock at all.
         self._lock = self._settings.manager_operation_lock()
         self._change_handlers: Dict[str, List[Callable]] = {}
-        
-        # In-memory cache for frequently accessed settings (P2 optimization)
-        self._cache = self._settings.manager_cache()
-        self._cache_lock = self._settings.manager_cache_lock()
-        self._cache_enabled = True
         with _MANAGER_REGISTRY_LOCK:
             managers = _MANAGERS_BY_STORE.get(self._settings)
             if managers is None:
@@ -305,7 +301,6 @@ class SettingsManager(QObject):
 
             if migrated:
                 self._settings.sync()
-                self._clear_cache_locked()
 
         if migrated:
             logger.info("Migrated legacy setting aliases: %s", migrated)
@@ -530,6 +525,10 @@ class SettingsManager(QObject):
         """
         Get a setting value.
         
+        Reads the store's current immutable snapshot without locking.
+        Mapping and list values are returned as fresh plain copies; use
+        :meth:`accessor` on hot paths to avoid the copy and the lookup.
+        
         Args:
             key: Setting key in dot notation (e.g., 'sources.mode')
             default: Default value if key not found
@@ -537,60 +536,59 @@ class SettingsManager(QObject):
         Returns:
             Setting value or default
         """
-        def to_plain(obj: Any) -> Any:
-            if isinstance(obj, Mapping):
-                return {k: to_plain(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [to_plain(v) for v in obj]
-            return obj
-
         key = self._canonicalize_key(key)
-        with self._lock:
-            # Check cache first (P2 optimization)
-            cache_key = f"{key}:{id(default)}"
-            if self._cache_enabled:
-                with self._cache_lock:
-                    cached = self._cache.get(cache_key, self._MISSING)
-                if cached is not self._MISSING:
-                    return cached
-
-            structured_value = self._get_structured_value_locked(key)
-            if structured_value is not self._MISSING:
-                value = structured_value
-            else:
-                value = self._settings.value(key, default)
+        value = self._settings.snapshot().lookup(key)
+        if value is MISSING:
+            if isinstance(default, Mapping):
+                return self._to_plain_value(default)
+            return default
 
-            if isinstance(value, Mapping):
-                return to_plain(value)
-
-            # Some QSettings backends (notably on Windows) round-trip
-            # QVariantList items as strings. Normalize critical list-valued
-            # settings before publishing them to the shared cache.
-            dotted = str(key) if key is not None else ""
-            if dotted == "display.show_on_monitors" and isinstance(value, list):
-                coerced: list[Any] = []
-                for item in value:
-                    try:
-                        coerced.append(int(item))
-                    except Exception as exc:
-                        logger.debug(
-                            "[SETTINGS] Exception suppressed: %s",
-                            exc,
-                            exc_info=True,
-                        )
-                        coerced.append(item)
-                if self._cache_enabled:
-                    with self._cache_lock:
-                        self._cache[cache_key] = coerced
-                return coerced
-
-            # Cache the result before releasing the shared store operation
-            # lock so a peer mutation cannot invalidate and then be followed
-            # by this older read repopulating the cache.
-            if self._cache_enabled:
-                with self._cache_lock:
-                    self._cache[cache_key] = value
-            return value
+        # Some QSettings backends (notably on Windows) round-trip
+        # QVariantList items as strings. Normalize critical list-valued
+        # settings before handing them out.
+        if key == "display.show_on_monitors" and isinstance(value, tuple):
+            coerced: list[Any] = []
+            for item in value:
+                try:
+                    coerced.append(int(item))
+                except Exception as exc:
+                    logger.debug(
+                        "[SETTINGS] Exception suppressed: %s",
+                        exc,
+                        exc_info=True,
+                    )
+                    coerced.append(item)
+            return coerced
+        return thaw_value(value)
+
+    def snapshot(self) -> SettingsSnapshot:
+        """Return the current immutable, versioned settings snapshot.
+
+        Values in the snapshot are frozen (read-only mappings and tuples)
+        and the snapshot never changes after publication.
+        """
+        return self._settings.snapshot()
+
+    def accessor(
+        self,
+        key: str,
+        default: Any = None,
+        *,
+        coerce: Optional[Callable[[Any], Any]] = None,
+    ) -> SettingAccessor:
+        """Return a precompiled accessor for *key*.
+
+        The accessor caches its (optionally coerced) value and only
+        re-resolves when a new snapshot has been published, so hot paths
+        pay a version compare per read.  ``accessor.changed()`` reports
+        whether this key actually changed since the previous read.
+        """
+        return SettingAccessor(
+            self._settings.snapshot,
+            self._canonicalize_key(key),
+            default,
+            coerce,
+        )
     
     @staticmethod
     def to_bool(value: Any, default: bool = False) -> bool:
@@ -672,6 +670,7 @@ class SettingsManager(QObject):
             "cache.max_items",
             "cache.max_memory_mb",
             "cache.max_concurrent",
+            "cache.disk_cache_mb",
         }
 
         try:
@@ -704,7 +703,6 @@ class SettingsManager(QObject):
                     self._settings.remove(key)
                     removed.append(key)
             if removed:
-                self._clear_cache_locked()
                 self._settings.sync()
                 logger.info("Removed legacy global preset keys: %s", removed)
         return removed
@@ -747,7 +745,6 @@ class SettingsManager(QObject):
                 if widgets_changed:
                     self._store_widgets_root_locked(widgets_copy)
             if removed:
-                self._clear_cache_locked()
                 self._settings.sync()
                 logger.info("Cleaned up %d obsolete settings: %s", len(removed), removed)
         return removed
@@ -762,26 +759,31 @@ class SettingsManager(QObject):
         """
         key = self._canonicalize_key(key)
         with self._lock:
-            handled, old_value = self._set_structured_value_locked(key, value)
-            if not handled:
-                if key == "widgets" and isinstance(value, Mapping):
-                    old_value = self._settings.value(key)
-                    value = self._store_widgets_root_locked(dict(value))
-                elif key == "transitions" and isinstance(value, Mapping):
-                    old_value = self._settings.value(key)
-                    value = self._store_transitions_root_locked(dict(value))
-                else:
-                    old_value = self._settings.value(key)
-                    self._settings.setValue(key, value)
-
-            # Invalidate cache entries for this key/root (P2 optimization)
-            self._invalidate_cache_for_key_locked(key)
+            value, old_value = self._set_value_locked(key, value)
 
             # Every semantic mutation enters the process-owned ordered writer.
             # Complete pending snapshots from this same store may coalesce;
-            # in-memory visibility, cache invalidation, and notification do not.
+            # in-memory visibility, snapshot publication, and notification do not.
             self._settings.sync()
 
+        self._notify_set(key, value, old_value)
+
+    def _set_value_locked(self, key: str, value: Any) -> tuple[Any, Any]:
+        """Apply one canonical-key mutation; return ``(stored, old)`` values."""
+        handled, old_value = self._set_structured_value_locked(key, value)
+        if not handled:
+            if key == "widgets" and isinstance(value, Mapping):
+                old_value = self._settings.value(key)
+                value = self._store_widgets_root_locked(dict(value))
+            elif key == "transitions" and isinstance(value, Mapping):
+                old_value = self._settings.value(key)
+                value = self._store_transitions_root_locked(dict(value))
+            else:
+                old_value = self._settings.value(key)
+                self._settings.setValue(key, value)
+        return value, old_value
+
+    def _notify_set(self, key: str, value: Any, old_value: Any) -> None:
         self._publish_store_change(key, value, old_value)
 
         # Compact logging by default so large nested maps (e.g. 'widgets')
@@ -792,39 +794,6 @@ class SettingsManager(QObject):
         else:
             logger.debug("Setting changed: %s", key)
 
-    def _invalidate_cache_for_key_locked(self, key: str) -> None:
-        """Invalidate cached values tied to *key* (and descendants)."""
-        if not self._cache_enabled:
-            return
-        key_text = str(key or "")
-        with self._cache_lock:
-            if not key_text or key_text == "*":
-                self._cache.clear()
-                return
-            key_root = key_text.split(".", 1)[0]
-            keys_to_remove: list[str] = []
-            for cache_key in list(self._cache.keys()):
-                cache_name = cache_key.split(":", 1)[0]
-                if not cache_name:
-                    keys_to_remove.append(cache_key)
-                    continue
-                if (
-                    cache_name == key_text
-                    or cache_name.startswith(f"{key_text}.")
-                    or cache_name == key_root
-                    or cache_name.startswith(f"{key_root}.")
-                ):
-                    keys_to_remove.append(cache_key)
-            for cache_key in keys_to_remove:
-                self._cache.pop(cache_key, None)
-
-    def _clear_cache_locked(self) -> None:
-        """Clear the in-memory settings cache after bulk store mutations."""
-        if not self._cache_enabled:
-            return
-        with self._cache_lock:
-            self._cache.clear()
-
     def _publish_store_change(self, key: str, value: Any, old_value: Any) -> None:
         """Synchronously notify every live manager sharing this store."""
 
@@ -834,7 +803,6 @@ class SettingsManager(QObject):
         for manager in managers:
             try:
                 with manager._lock:
-                    manager._invalidate_cache_for_key_locked(key)
                     handlers = list(manager._change_handlers.get(key, ()))
                 manager.settings_changed.emit(key, value)
                 for handler in handlers:
@@ -851,9 +819,22 @@ class SettingsManager(QObject):
                 continue
 
     def set_many(self, values: Mapping[str, Any]) -> None:
-        """Set multiple settings in one call."""
-        for k, v in values.items():
-            self.set(k, v)
+        """Set multiple settings in one call.
+
+        All values become visible to readers in a single snapshot; change
+        notifications are delivered afterwards in input order.
+        """
+        changes: list[tuple[str, Any, Any]] = []
+        with self._lock:
+            with self._settings.deferred_publish():
+                for k, v in values.items():
+                    key = self._canonicalize_key(k)
+                    value, old_value = self._set_value_locked(key, v)
+                    changes.append((key, value, old_value))
+            self._settings.sync()
+
+        for key, value, old_value in changes:
+            self._notify_set(key, value, old_value)
 
     # Typed helpers -----------------------------------------------------
     def get_spotify_visualizer_settings(self) -> SpotifyVisualizerSettings:
@@ -878,7 +859,6 @@ class SettingsManager(QObject):
             widgets = dict(stored_widgets) if isinstance(stored_widgets, Mapping) else {}
             widgets["spotify_visualizer"] = visualizer_section
             widgets = self._store_widgets_root_locked(widgets)
-            self._invalidate_cache_for_key_locked("widgets")
             self._settings.sync()
 
         self._publish_store_change("widgets", widgets, stored_widgets)
@@ -943,8 +923,6 @@ class SettingsManager(QObject):
             # not hold this manager's lock while it waits, or a peer mutation's
             # synchronous signal fanout could deadlock on this manager.
             self._settings.load()
-            with self._lock:
-                self._clear_cache_locked()
         except SettingsDurabilityError as exc:
             logger.error(
                 "[SETTINGS_PERSIST] Refusing reload across failed boundary: %s",
@@ -1119,7 +1097,6 @@ class SettingsManager(QObject):
                 repairs['transitions'] = f"Invalid type: {type(transitions).__name__}"
             
             if repairs:
-                self._clear_cache_locked()
                 self._settings.sync()
                 logger.info(f"Settings validation repaired {len(repairs)} issues: {list(repairs.keys())}")
             else:
@@ -1218,7 +1195,8 @@ class SettingsManager(QObject):
         """Reset all settings to default values, preserving configured user data."""
         from core.settings.defaults import PRESERVE_ON_RESET, get_default_settings
         
-        with self._lock:
+        # Readers keep the previous snapshot until the reset is complete.
+        with self._lock, self._settings.deferred_publish():
             # Preserve user-specific data before clearing
             preserved: dict[str, Any] = {}
             for key in sorted(PRESERVE_ON_RESET):
@@ -1292,7 +1270,6 @@ class SettingsManager(QObject):
                     self._store_widgets_root_locked(widgets_dict)
             
             self._settings.sync()
-            self._clear_cache_locked()
 
         logger.info("Settings reset to defaults (preserved: %s)", list(preserved.keys()))
         self._publish_store_change('*', None, self._MISSING)
@@ -1328,7 +1305,6 @@ class SettingsManager(QObject):
             removed = self._remove_structured_key_locked(key)
             if not removed:
                 self._settings.remove(key)
-            self._invalidate_cache_for_key_locked(str(key))
             self._settings.sync()
 
         self._publish_store_change(key, None, self._MISSING)
@@ -1339,7 +1315,6 @@ class SettingsManager(QObject):
         """Clear all settings (use with caution)."""
         with self._lock:
             self._settings.clear()
-            self._clear_cache_locked()
             self._settings.sync()
         self._publish_store_change('*', None, self._MISSING)
         logger.warning("All settings cleared")
@@ -1483,12 +1458,10 @@ class SettingsManager(QObject):
         dict so callers can work with standard container types.
         """
 
-        with self._lock:
-            value = self._settings.value(section, default)
-
-        if isinstance(value, Mapping):
-            return dict(value)
-        return value
+        value = self._settings.snapshot().data.get(section, MISSING)
+        if value is MISSING:
+            return dict(default) if isinstance(default, Mapping) else default
+        return thaw_value(value)
 
     def set_section(self, section: str, value: Mapping[str, Any], *, emit_change: bool = True) -> None:
         """Set a whole section value in one shot.
@@ -1507,7 +1480,6 @@ class SettingsManager(QObject):
                 mapping = self._store_transitions_root_locked(mapping)
             else:
                 self._settings.setValue(section, mapping)
-            self._invalidate_cache_for_key_locked(section)
 
             self._settings.sync()
 
@@ -1534,7 +1506,7 @@ class SettingsManager(QObject):
         This is a thin wrapper around set_section('widgets', ...) to keep
         callers from hard-coding the 'widgets' key. Use emit_change=False only
         for owner-local repair/rebuild paths that also refresh their runtime
-        state explicitly; silent writes still sync and invalidate dotted caches.
+        state explicitly; silent writes still sync and republish the read snapshot.
         """
 
         self.set_section('widgets', widgets, emit_change=emit_change)
@@ -0,0 +1,174 @@
+"""Immutable, versioned read snapshots of the settings store.
+
+``JsonSettingsStore`` republishes a :class:`SettingsSnapshot` after every
+mutation by swapping a single attribute, so readers never take a lock: they
+grab the current snapshot and resolve keys against frozen data.  Freezing
+shares unchanged subtrees with the previous snapshot, which lets
+:class:`SettingAccessor` detect per-key changes with a version compare and
+an identity check instead of re-reading and comparing values.
+"""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generic, Mapping, Optional, TypeVar
+
+MISSING: Any = object()
+_UNSET: Any = object()
+
+STRUCTURED_ROOTS = frozenset({"widgets", "transitions", "ui"})
+
+T = TypeVar("T")
+
+
+def freeze_value(value: Any, previous: Any = None) -> Any:
+    """Return a deeply immutable copy of *value*.
+
+    Mappings become ``MappingProxyType`` and lists/tuples become tuples.
+    When *previous* is an earlier frozen value that is equal, it is returned
+    as-is so untouched subtrees keep their identity across snapshots.
+    """
+    if isinstance(value, Mapping):
+        prev_map = previous if isinstance(previous, MappingProxyType) else None
+        same = prev_map is not None and len(prev_map) == len(value)
+        frozen: Dict[Any, Any] = {}
+        for key, child in value.items():
+            old = prev_map.get(key, _UNSET) if prev_map is not None else None
+            new = freeze_value(child, old)
+            frozen[key] = new
+            if new is not old:
+                same = False
+        return prev_map if same else MappingProxyType(frozen)
+    if isinstance(value, (list, tuple)):
+        prev_seq = previous if isinstance(previous, tuple) else ()
+        same = isinstance(previous, tuple) and len(prev_seq) == len(value)
+        items = []
+        for index, child in enumerate(value):
+            old = prev_seq[index] if index < len(prev_seq) else None
+            new = freeze_value(child, old)
+            items.append(new)
+            if new is not old:
+                same = False
+        return prev_seq if same else tuple(items)
+    if isinstance(value, (set, frozenset)):
+        value = frozenset(value)
+    if type(previous) is type(value) and previous == value:
+        return previous
+    return value
+
+
+def thaw_value(value: Any) -> Any:
+    """Return a plain mutable copy of a frozen value (dicts and lists)."""
+    if isinstance(value, Mapping):
+        return {key: thaw_value(child) for key, child in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_value(child) for child in value]
+    if isinstance(value, frozenset):
+        return set(value)
+    return value
+
+
+class SettingsSnapshot:
+    """One published revision of the settings store.
+
+    ``data`` maps store keys (flat dotted keys plus the nested structured
+    roots) to frozen values.  Resolved lookups are memoised per snapshot;
+    the memo only ever gains entries that are pure functions of ``data``.
+    """
+
+    __slots__ = ("version", "data", "_resolved")
+
+    def __init__(self, version: int, data: Dict[str, Any]) -> None:
+        # *data* is handed over by the publisher and never mutated again.
+        self.version = version
+        self.data: Mapping[str, Any] = MappingProxyType(data)
+        self._resolved: Dict[str, Any] = {}
+
+    def lookup(self, key: str) -> Any:
+        """Return the frozen value for a canonical *key*, or ``MISSING``.
+
+        Dotted keys under a structured root (``widgets.clock.enabled``)
+        traverse the nested mapping first and fall back to the flat key,
+        mirroring ``SettingsManager`` write semantics.
+        """
+        value = self._resolved.get(key, _UNSET)
+        if value is not _UNSET:
+            return value
+        value = MISSING
+        root, sep, tail = key.partition(".")
+        if sep and root in STRUCTURED_ROOTS:
+            parts = [part for part in tail.split(".") if part]
+            node = self.data.get(root, MISSING)
+            if parts and isinstance(node, Mapping):
+                for part in parts:
+                    if not isinstance(node, Mapping):
+                        node = MISSING
+                        break
+                    node = node.get(part, MISSING)
+                    if node is MISSING:
+                        break
+                value = node
+        if value is MISSING:
+            value = self.data.get(key, MISSING)
+        self._resolved[key] = value
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the frozen value for *key*, or *default* when absent."""
+        value = self.lookup(key)
+        return default if value is MISSING else value
+
+
+class SettingAccessor(Generic[T]):
+    """Precompiled, typed read of a single setting.
+
+    The value is re-resolved (and re-coerced) only when the published
+    snapshot version moves, and :meth:`changed` reports a change only when
+    the key's frozen node was actually replaced.  Values are frozen, so
+    mappings and sequences come back read-only.  Accessors are meant to be
+    owned by one consumer and are not themselves synchronised.
+    """
+
+    __slots__ = ("key", "_source", "_default", "_coerce", "_version", "_node", "_value")
+
+    def __init__(
+        self,
+        source: Callable[[], SettingsSnapshot],
+        key: str,
+        default: Any = None,
+        coerce: Optional[Callable[[Any], T]] = None,
+    ) -> None:
+        self.key = key
+        self._source = source
+        self._default = default
+        self._coerce = coerce
+        self._version = -1
+        self._node: Any = _UNSET
+        self._value: Any = None
+
+    @property
+    def version(self) -> int:
+        """Snapshot version the cached value was last checked against."""
+        return self._version
+
+    def get(self) -> T:
+        snapshot = self._source()
+        if snapshot.version != self._version:
+            self._refresh(snapshot)
+        return self._value
+
+    def changed(self) -> bool:
+        """Refresh and return True if the value differs from the last read."""
+        snapshot = self._source()
+        if snapshot.version == self._version:
+            return False
+        return self._refresh(snapshot)
+
+    def _refresh(self, snapshot: SettingsSnapshot) -> bool:
+        self._version = snapshot.version
+        node = snapshot.lookup(self.key)
+        if node is self._node:
+            return False
+        self._node = node
+        raw = self._default if node is MISSING else node
+        self._value = self._coerce(raw) if self._coerce is not None else raw
+        return True
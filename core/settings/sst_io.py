@@ -158,7 +158,8 @@ def import_from_sst(mgr: "SettingsManager", path: str, merge: bool = True) -> bo
     normalized_root = normalize_sst_snapshot(stripped_root)
 
     try:
-        with mgr._lock:
+        # Readers see the imported settings all at once, never a partial merge.
+        with mgr._lock, mgr._settings.deferred_publish():
             if not merge:
                 mgr._settings.clear()
             for section_key, section_value in normalized_root.items():
@@ -225,7 +226,6 @@ def import_from_sst(mgr: "SettingsManager", path: str, merge: bool = True) -> bo
                     mgr._settings.setValue(section_key, coerced)
 
             mgr._settings.sync()
-            mgr._clear_cache_locked()
 
         mgr._publish_store_change('*', None, mgr._MISSING)
         logger.info("Imported settings snapshot from %s", path)
@@ -13,6 +13,8 @@ Directory layout under the application data root::
     ├── cache/
     │   ├── rss/
     │   ├── imgur/
+    │   ├── folder_index/
+    │   ├── scaled/
     │   └── weather.json
     ├── state/
     │   └── feed_health.json
@@ -133,6 +135,27 @@ def get_imgur_cache_dir(profile: Optional[str] = None) -> Path:
     return d
 
 
+def get_asset_store_dir(profile: Optional[str] = None) -> Path:
+    """Return ``<app_data>/cache/assets/`` for the shared content-addressed image store."""
+    d = get_cache_dir(profile) / "assets"
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
+def get_folder_index_dir(profile: Optional[str] = None) -> Path:
+    """Return ``<app_data>/cache/folder_index/`` for persistent folder scan indexes."""
+    d = get_cache_dir(profile) / "folder_index"
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
+def get_scaled_image_cache_dir(profile: Optional[str] = None) -> Path:
+    """Return ``<app_data>/cache/scaled/`` for display-ready image derivatives."""
+    d = get_cache_dir(profile) / "scaled"
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
 def get_weather_cache_file(profile: Optional[str] = None) -> Path:
     """Return ``<app_data>/cache/weather.json``."""
     return get_cache_dir(profile) / "weather.json"
@@ -155,6 +178,11 @@ def get_feed_health_file(profile: Optional[str] = None) -> Path:
     return get_state_dir(profile) / "feed_health.json"
 
 
+def get_feed_response_cache_file(profile: Optional[str] = None) -> Path:
+    """Return ``<app_data>/state/feed_responses.json`` (ETags + parsed entries)."""
+    return get_state_dir(profile) / "feed_responses.json"
+
+
 def get_steam_dir(profile: Optional[str] = None) -> Path:
     """Return ``<app_data>/steam/`` for Steam credential/cache state."""
     d = get_app_data_dir(profile) / "steam"
@@ -45,6 +45,7 @@ from core.steam.request_policy import (
     SteamRequestKey,
     backoff_result,
 )
+from core.steam.refresh_executor import SteamRefreshExecutor
 
 
 ABANDONMENT_ROTATION_STATE_KEY = "abandonment_issues"
@@ -58,6 +59,7 @@ DEFAULT_SELECTED_ACHIEVEMENTS_FRESH_SECONDS = 24.0 * 60.0 * 60.0
 MAX_CACHED_ACHIEVEMENT_PROBES = 12
 _request_coordinator = SteamRequestCoordinator()
 _request_backoff = SteamBackoffPolicy()
+_request_executor = SteamRefreshExecutor(max_concurrency=2)
 _profile_locks: dict[str, threading.RLock] = {}
 _profile_locks_guard = threading.Lock()
 logger = get_logger(__name__)
@@ -292,8 +294,9 @@ def refresh_abandonment_cache(
     reference_now = time.time() if now is None else float(now)
     lock = _profile_lock_for(profile_key)
     with lock:
-        refresh_results = [
-            _fetch_and_cache(
+        # Owned and recent games are independent sources; fetch them together.
+        refresh_results = _request_executor.map(lambda fetch: fetch(), [
+            lambda: _fetch_and_cache(
                 profile_key=profile_key,
                 cache_key=OWNED_GAMES_CACHE_KEY,
                 source_id=SteamSourceId.OWNED_GAMES,
@@ -307,7 +310,7 @@ def refresh_abandonment_cache(
                 include_appinfo=True,
                 include_played_free_games=True,
             ),
-            _fetch_and_cache(
+            lambda: _fetch_and_cache(
                 profile_key=profile_key,
                 cache_key=RECENT_GAMES_CACHE_KEY,
                 source_id=SteamSourceId.RECENTLY_PLAYED,
@@ -320,7 +323,7 @@ def refresh_abandonment_cache(
                 fresh_seconds=recent_fresh_seconds,
                 count=20,
             ),
-        ]
+        ])
         snapshot = load_abandonment_cache_snapshot(
             profile_key=profile_key,
             selection=selection,
@@ -29,6 +29,7 @@ from core.steam.request_policy import (
     SteamRequestKey,
     backoff_result,
 )
+from core.steam.refresh_executor import SteamRefreshExecutor
 
 RECENT_GAMES_CACHE_KEY = "achievement_pulse_recent_games"
 OWNED_GAMES_CACHE_KEY = "achievement_pulse_owned_games"
@@ -39,6 +40,7 @@ DEFAULT_SOURCE_FRESH_SECONDS = 10.0 * 60.0
 RECENT_ACHIEVEMENT_CANDIDATE_LIMIT = 5
 _refresh_coordinator = SteamRequestCoordinator()
 _refresh_backoff = SteamBackoffPolicy()
+_refresh_executor = SteamRefreshExecutor()
 _refresh_locks: dict[str, threading.Lock] = {}
 _refresh_locks_guard = threading.Lock()
 _RefreshIdentity = tuple[str, str, str, str, int | None]
@@ -252,12 +254,19 @@ def refresh_achievement_pulse_cache(
     now: float | None = None,
     force: bool = False,
     source_fresh_seconds: float = DEFAULT_SOURCE_FRESH_SECONDS,
+    executor: SteamRefreshExecutor | None = None,
+    on_partial: Callable[[AchievementPulseCacheSnapshot], None] | None = None,
 ) -> AchievementPulseRefreshOutcome:
     """Refresh the selected app through the cache boundary without owning scheduling.
 
     Callers must run this explicit IO operation through ``ThreadManager``.
     Concurrent display instances share a profile lock; a follower returns the
     freshly written cache instead of issuing a duplicate startup request.
+
+    Candidate achievement requests fan out on *executor*.  Each one that
+    freshens its cache record reloads the cache-only snapshot and hands it to
+    *on_partial* on the calling thread, so a widget can paint progress before
+    the schema request for the final selection completes.
     """
     profile_key = derive_profile_cache_key(credential.profile_identifier)
     reference_now = time.time() if now is None else float(now)
@@ -312,8 +321,9 @@ def refresh_achievement_pulse_cache(
                 recent_result = existing.recent_result
 
         candidate_appids = _selection_candidate_appids(recent_result, selection)
-        for appid in candidate_appids:
-            refresh_results.append(_fetch_and_cache(
+
+        def fetch_candidate(appid: int) -> SteamResult:
+            return _fetch_and_cache(
                 profile_key=profile_key,
                 cache_key=achievement_cache_key_for_app(appid),
                 source_id=SteamSourceId.PLAYER_ACHIEVEMENTS,
@@ -324,8 +334,25 @@ def refresh_achievement_pulse_cache(
                 opener=opener,
                 now=reference_now,
                 fresh_seconds=0.0 if force else source_fresh_window,
+            )
+
+        def publish_partial(_appid: int, result: SteamResult) -> None:
+            if on_partial is None or not result.ok:
+                return
+            on_partial(load_achievement_pulse_cache_snapshot(
+                profile_key=profile_key,
+                selection=selection,
+                profile=profile,
+                root=root,
+                now=reference_now,
             ))
 
+        refresh_results.extend((executor or _refresh_executor).map(
+            fetch_candidate,
+            candidate_appids,
+            on_result=publish_partial,
+        ))
+
         provisional = load_achievement_pulse_cache_snapshot(
             profile_key=profile_key,
             selection=selection,
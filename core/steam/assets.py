@@ -4,14 +4,16 @@ from __future__ import annotations
 import hashlib
 import math
 import urllib.error
-import urllib.request
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import urlparse
 
 from core.logging.logger import get_logger
+from core.resources.asset_store import AssetNamespace, namespace_for_directory
+from core.steam.connection_pool import get_steam_connection_pool
 from core.steam.models import SteamResult, SteamResultStatus
+from core.steam.refresh_executor import SteamRefreshExecutor
 
 logger = get_logger(__name__)
 
@@ -45,9 +47,18 @@ class SteamAssetRecord:
     image_kind: str
 
 
+def _asset_namespace(cache_dir: Path) -> AssetNamespace:
+    """Asset-store namespace backing one Steam asset cache directory."""
+    return namespace_for_directory(cache_dir)
+
+
 def find_cached_asset(cache_dir: Path, url: str) -> Path | None:
     """Return a validated asset-cache entry by URL fingerprint without network IO."""
     fingerprint = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+    record = _asset_namespace(cache_dir).get(fingerprint)
+    if record is not None:
+        return record.path
+    # Loose file from before the asset store; adopted on the next prune.
     for suffix in _ALLOWED_SUFFIX_BY_KIND:
         candidate = cache_dir / f"{fingerprint}.{suffix}"
         if candidate.is_file() and candidate.stat().st_size > 0:
@@ -166,20 +177,20 @@ def prepare_desaturated_steam_artwork(
         f"desaturation:{strength}"
     )
     fingerprint = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:24]
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    output_path = cache_dir / f"{fingerprint}.png"
-    if output_path.is_file() and output_path.stat().st_size > 0:
-        return output_path
+    assets = _asset_namespace(cache_dir)
+    record = assets.get(fingerprint)
+    if record is not None:
+        return record.path
 
     from PIL import Image, ImageEnhance
 
-    tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_dir / f".{fingerprint}.png.tmp"
     try:
         with Image.open(source_path) as image:
             prepared = ImageEnhance.Color(image.convert("RGBA")).enhance(1.0 - strength / 100.0)
             prepared.save(tmp_path, format="PNG", optimize=True)
-        tmp_path.replace(output_path)
-        return output_path
+        return assets.put_file(fingerprint, tmp_path, ext="png").path
     except Exception:
         try:
             tmp_path.unlink(missing_ok=True)
@@ -249,21 +260,14 @@ def cache_asset_from_bytes(
         return SteamResult(status=SteamResultStatus.ASSET_INVALID, message="Steam asset did not look like a supported image.")
     fingerprint = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
     cache_dir.mkdir(parents=True, exist_ok=True)
-    path = cache_dir / f"{fingerprint}.{kind}"
-    tmp_path = path.with_name(f"{path.name}.tmp")
     try:
-        tmp_path.write_bytes(data)
-        tmp_path.replace(path)
+        record = _asset_namespace(cache_dir).put(fingerprint, data, ext=kind)
     except Exception:
-        try:
-            tmp_path.unlink(missing_ok=True)
-        except Exception:
-            pass
-        logger.exception("[STEAM] Failed to write asset cache path=%s", path)
+        logger.exception("[STEAM] Failed to write asset cache fingerprint=%s", fingerprint)
         raise
     return SteamAssetRecord(
         url_fingerprint=fingerprint,
-        path=path,
+        path=record.path,
         bytes_written=len(data),
         image_kind=kind,
     )
@@ -312,27 +316,69 @@ def fetch_and_cache_asset(
     return cache_asset_from_bytes(cache_dir=cache_dir, url=url, data=data, allowed_hosts=allowed_hosts)
 
 
+def fetch_and_cache_assets(
+    *,
+    cache_dir: Path,
+    urls: Iterable[str],
+    fetcher: Callable[[str], bytes] | None = None,
+    executor: SteamRefreshExecutor | None = None,
+    allowed_hosts: tuple[str, ...] = STEAM_ASSET_ALLOWED_HOSTS,
+) -> dict[str, SteamAssetRecord | SteamResult]:
+    """Cache several assets, fetching only cache misses with bounded concurrency."""
+    results: dict[str, SteamAssetRecord | SteamResult] = {}
+    missing: list[str] = []
+    for url in dict.fromkeys(str(url or "").strip() for url in urls):
+        if not url:
+            continue
+        cached = find_cached_asset(cache_dir, url)
+        if cached is None:
+            missing.append(url)
+            continue
+        results[url] = SteamAssetRecord(
+            url_fingerprint=hashlib.sha256(url.encode("utf-8")).hexdigest()[:24],
+            path=cached,
+            bytes_written=cached.stat().st_size,
+            image_kind=cached.suffix.lstrip("."),
+        )
+    fetched = (executor or SteamRefreshExecutor()).map(
+        lambda url: fetch_and_cache_asset(
+            cache_dir=cache_dir,
+            url=url,
+            fetcher=fetcher or _default_fetch_asset,
+            allowed_hosts=allowed_hosts,
+        ),
+        missing,
+    )
+    results.update(zip(missing, fetched))
+    return results
+
+
 def _default_fetch_asset(url: str) -> bytes:
-    request = urllib.request.Request(url, headers={"User-Agent": "SRPSS-Steam/0.1"})
-    with urllib.request.urlopen(request, timeout=12.0) as response:
-        return response.read(MAX_STEAM_ASSET_BYTES + 1)
+    return get_steam_connection_pool().fetch(
+        url,
+        headers={"User-Agent": "SRPSS-Steam/0.1"},
+        timeout=12.0,
+        max_bytes=MAX_STEAM_ASSET_BYTES,
+        allowed_hosts=STEAM_ASSET_ALLOWED_HOSTS,
+    )
 
 
 def prune_asset_cache(cache_dir: Path, *, max_files: int = 256) -> int:
-    """Prune oldest cached Steam asset files beyond max_files."""
+    """Prune least recently used Steam assets beyond max_files.
+
+    Loose files from before the asset store are adopted first so they count
+    towards the limit. The shared store separately enforces its byte budget.
+    """
     if not cache_dir.exists():
         return 0
-    files = [path for path in cache_dir.iterdir() if path.is_file() and not path.name.endswith(".tmp")]
-    if len(files) <= max_files:
+    assets = _asset_namespace(cache_dir)
+    try:
+        assets.adopt_legacy_files(suffixes=tuple(f".{kind}" for kind in _ALLOWED_SUFFIX_BY_KIND))
+        return assets.trim(max(0, int(max_files)))
+    except Exception:
+        logger.warning("[STEAM] Failed to prune asset cache dir_hash=%s",
+                       hashlib.sha256(str(cache_dir).encode("utf-8")).hexdigest()[:12], exc_info=True)
         return 0
-    removed = 0
-    for path in sorted(files, key=lambda item: item.stat().st_mtime)[: max(0, len(files) - max_files)]:
-        try:
-            path.unlink()
-            removed += 1
-        except Exception:
-            logger.warning("[STEAM] Failed to prune asset cache file path=%s", path)
-    return removed
 
 
 def _detect_image_kind(data: bytes) -> str | None:
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from core.logging.logger import get_logger
+from core.steam.connection_pool import get_steam_connection_pool
 from core.steam.credentials import safe_fingerprint
 from core.steam.models import (
     SteamResult,
@@ -308,7 +309,7 @@ def validate_connection(
 
 
 def _default_open(request: urllib.request.Request, timeout: float) -> Any:
-    return urllib.request.urlopen(request, timeout=timeout)
+    return get_steam_connection_pool().open(request, timeout)
 
 
 def _source_url(source_id: SteamSourceId) -> str:
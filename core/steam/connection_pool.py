@@ -0,0 +1,362 @@
+"""Per-host keep-alive HTTP connections for Steam API and asset requests.
+
+``urllib.request.urlopen`` opens (and TLS-handshakes) a new connection for
+every call.  Refreshing a large library issues many small requests to the
+same two or three hosts, so this pool keeps idle HTTP/1.1 connections per
+``(scheme, host, port)`` and bounds how many are open to one host at a time.
+
+Same-scheme redirects to the original host (or hosts the caller allows)
+are followed like ``urlopen`` did.  When the system or environment
+configures a proxy for the scheme, requests go through ``urlopen`` instead
+so the proxy keeps working; kept-alive connections are a direct-only win.
+
+``SteamConnectionPool.open`` matches the injectable opener contract used by
+``core.steam.backend.fetch_json`` and ``fetch`` matches the asset fetcher
+contract in ``core.steam.assets``, so callers and tests can swap transports
+freely.  Connections come from an injectable factory; tests point it at a
+local HTTP stand-in instead of the network.
+"""
+from __future__ import annotations
+
+import http.client
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urljoin, urlsplit
+
+from core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
+DEFAULT_IDLE_TIMEOUT_SECONDS = 30.0
+MAX_POOLED_BODY_BYTES = 4_000_000
+MAX_REDIRECTS = 5
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+_PoolKey = tuple[str, str, int | None]
+ConnectionFactory = Callable[[str, str, "int | None", float], http.client.HTTPConnection]
+
+# Errors that mean a kept-alive connection was closed by the server while
+# idle; the request is retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+@dataclass(frozen=True)
+class PooledResponse:
+    """Fully-read response; ``read`` mirrors the subset fetch_json uses."""
+
+    status: int
+    body: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    def read(self, amt: int | None = None) -> bytes:
+        return self.body if amt is None else self.body[: max(0, int(amt))]
+
+
+def default_connection_factory(
+    scheme: str,
+    host: str,
+    port: int | None,
+    timeout: float,
+) -> http.client.HTTPConnection:
+    if scheme == "https":
+        return http.client.HTTPSConnection(
+            host,
+            port,
+            timeout=timeout,
+            context=ssl.create_default_context(),
+        )
+    return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+class SteamConnectionPool:
+    """Thread-safe pool of idle keep-alive connections keyed by host."""
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        connection_factory: ConnectionFactory | None = None,
+    ) -> None:
+        self.max_connections_per_host = max(1, int(max_connections_per_host))
+        self.idle_timeout_seconds = max(0.0, float(idle_timeout_seconds))
+        self._factory = connection_factory or default_connection_factory
+        self._lock = threading.Lock()
+        self._idle: dict[_PoolKey, list[tuple[http.client.HTTPConnection, float]]] = {}
+        self._slots: dict[_PoolKey, threading.BoundedSemaphore] = {}
+        self._stats = {"opened": 0, "reused": 0, "discarded": 0}
+
+    # ------------------------------------------------------------------
+    # Transport contracts
+    # ------------------------------------------------------------------
+    def open(self, request: urllib.request.Request, timeout: float) -> PooledResponse:
+        """Opener for ``fetch_json``: returns the response, whatever its status."""
+        return self.request(
+            request.full_url,
+            method=request.get_method(),
+            headers=dict(request.header_items()),
+            timeout=timeout,
+        )
+
+    def fetch(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 12.0,
+        max_bytes: int = MAX_POOLED_BODY_BYTES,
+        allowed_hosts: Collection[str] = (),
+    ) -> bytes:
+        """Asset fetcher: returns the body, raising ``HTTPError`` on non-2xx."""
+        response = self.request(
+            url,
+            headers=headers,
+            timeout=timeout,
+            max_bytes=max_bytes,
+            allowed_hosts=allowed_hosts,
+        )
+        if not 200 <= response.status < 300:
+            raise urllib.error.HTTPError(url, response.status, f"HTTP {response.status}", None, None)
+        return response.body
+
+    def request(
+        self,
+        url: str,
+        *,
+        method: str = "GET",
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 12.0,
+        max_bytes: int = MAX_POOLED_BODY_BYTES,
+        allowed_hosts: Collection[str] = (),
+    ) -> PooledResponse:
+        """Issue one request and read at most ``max_bytes + 1`` of the body.
+
+        Redirects are followed up to ``MAX_REDIRECTS`` times when they keep
+        the scheme and point at the original host or one of
+        ``allowed_hosts``; any other redirect is returned as-is.
+        """
+        key = self._pool_key(url)
+        if self._uses_proxy(key):
+            with self._slot(key):
+                return self._request_via_urlopen(url, method, headers, timeout, max_bytes)
+
+        response = self._request_once(url, key, method, headers, timeout, max_bytes)
+        for _ in range(MAX_REDIRECTS):
+            target = self._redirect_target(url, response, allowed_hosts)
+            if target is None:
+                break
+            if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                method = "GET"
+            url = target
+            key = self._pool_key(url)
+            response = self._request_once(url, key, method, headers, timeout, max_bytes)
+        return response
+
+    # ------------------------------------------------------------------
+    # Transports
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _pool_key(url: str) -> _PoolKey:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("Steam connection pool only supports absolute http(s) URLs")
+        return (scheme, parts.hostname.lower(), parts.port)
+
+    def _uses_proxy(self, key: _PoolKey) -> bool:
+        # An injected factory decides the transport itself (tests, stand-ins).
+        if self._factory is not default_connection_factory:
+            return False
+        scheme, host, _port = key
+        if not urllib.request.getproxies().get(scheme):
+            return False
+        try:
+            return not urllib.request.proxy_bypass(host)
+        except Exception:
+            logger.debug("[STEAM] Proxy bypass check failed", exc_info=True)
+            return True
+
+    @staticmethod
+    def _redirect_target(
+        url: str,
+        response: PooledResponse,
+        allowed_hosts: Collection[str],
+    ) -> str | None:
+        if response.status not in _REDIRECT_STATUSES:
+            return None
+        location = next(
+            (value for name, value in response.headers.items() if name.lower() == "location"),
+            None,
+        )
+        if not location:
+            return None
+        source = urlsplit(url)
+        target = urljoin(url, location)
+        parts = urlsplit(target)
+        host = (parts.hostname or "").lower()
+        if parts.scheme.lower() != source.scheme.lower() or not host:
+            logger.debug("[STEAM] Not following cross-scheme redirect to %s", parts.scheme or "<none>")
+            return None
+        if host != (source.hostname or "").lower() and host not in allowed_hosts:
+            logger.debug("[STEAM] Not following redirect to disallowed host %s", host)
+            return None
+        return target
+
+    def _request_once(
+        self,
+        url: str,
+        key: _PoolKey,
+        method: str,
+        headers: Mapping[str, str] | None,
+        timeout: float,
+        max_bytes: int,
+    ) -> PooledResponse:
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        with self._slot(key):
+            for attempt in range(2):
+                connection, reused = self._checkout(key, timeout)
+                try:
+                    connection.request(method, target, headers=dict(headers or {}))
+                    response = connection.getresponse()
+                    body = response.read(max_bytes + 1)
+                except _STALE_CONNECTION_ERRORS:
+                    self._discard(connection)
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except BaseException:
+                    self._discard(connection)
+                    raise
+                # Only a fully drained, keep-alive response leaves the
+                # connection in a state the next request can use.
+                if len(body) <= max_bytes and response.isclosed() and not response.will_close:
+                    self._checkin(key, connection)
+                else:
+                    self._discard(connection)
+                return PooledResponse(
+                    status=int(response.status),
+                    body=body,
+                    headers=dict(response.getheaders()),
+                )
+        raise AssertionError("unreachable")
+
+    @staticmethod
+    def _request_via_urlopen(
+        url: str,
+        method: str,
+        headers: Mapping[str, str] | None,
+        timeout: float,
+        max_bytes: int,
+    ) -> PooledResponse:
+        request = urllib.request.Request(url, headers=dict(headers or {}), method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return PooledResponse(
+                    status=int(response.status),
+                    body=response.read(max_bytes + 1),
+                    headers=dict(response.getheaders()),
+                )
+        except urllib.error.HTTPError as exc:
+            try:
+                body = exc.read(max_bytes + 1) if exc.fp is not None else b""
+            finally:
+                exc.close()
+            return PooledResponse(status=int(exc.code), body=body, headers=dict(exc.headers or {}))
+
+    # ------------------------------------------------------------------
+    # Pool bookkeeping
+    # ------------------------------------------------------------------
+    def _slot(self, key: _PoolKey) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_connections_per_host)
+                self._slots[key] = slot
+            return slot
+
+    def _checkout(self, key: _PoolKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        expired: list[http.client.HTTPConnection] = []
+        connection = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate, idle_since = idle.pop()
+                if now - idle_since <= self.idle_timeout_seconds:
+                    connection = candidate
+                    break
+                expired.append(candidate)
+            if connection is not None:
+                self._stats["reused"] += 1
+            else:
+                self._stats["opened"] += 1
+            self._stats["discarded"] += len(expired)
+        for stale in expired:
+            stale.close()
+        if connection is None:
+            return self._factory(key[0], key[1], key[2], timeout), False
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection, True
+
+    def _checkin(self, key: _PoolKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append((connection, time.monotonic()))
+
+    def _discard(self, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._stats["discarded"] += 1
+        try:
+            connection.close()
+        except Exception:
+            logger.debug("[STEAM] Pooled connection close failed", exc_info=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "idle": sum(len(entries) for entries in self._idle.values()),
+            }
+
+    def close(self) -> None:
+        """Close every idle connection (in-flight requests finish normally)."""
+        with self._lock:
+            idle = [connection for entries in self._idle.values() for connection, _ in entries]
+            self._idle.clear()
+        for connection in idle:
+            try:
+                connection.close()
+            except Exception:
+                logger.debug("[STEAM] Pooled connection close failed", exc_info=True)
+
+
+_shared_pool: SteamConnectionPool | None = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_steam_connection_pool() -> SteamConnectionPool:
+    """Return the process-wide pool used by the default Steam transports."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = SteamConnectionPool()
+        return _shared_pool
@@ -0,0 +1,79 @@
+"""Bounded-concurrency fan-out for independent Steam refresh requests.
+
+Refresh entry points still run inside one ThreadManager IO task.  Within
+that task the per-app achievement, schema and artwork requests are
+independent, so this executor runs them on a short-lived, bounded worker set
+instead of strictly one after another.  Request dedupe and backoff stay in
+``SteamRequestCoordinator``/``SteamBackoffPolicy``; each worker goes through
+the same ``_fetch_and_cache`` path a sequential refresh would.
+
+``on_result`` callbacks run on the calling thread in completion order, which
+lets callers publish partial results without extra locking.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TypeVar
+
+from core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class SteamRefreshExecutor:
+    """Run ``fn`` over items with at most ``max_concurrency`` in flight."""
+
+    def __init__(self, *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+
+    def map(
+        self,
+        fn: Callable[[T], R],
+        items: Iterable[T],
+        *,
+        on_result: Callable[[T, R], None] | None = None,
+    ) -> list[R]:
+        """Return ``fn(item)`` for every item, in input order.
+
+        The first exception raised by ``fn`` propagates after the remaining
+        in-flight work has finished; exceptions from ``on_result`` are
+        logged and do not abort the batch.
+        """
+        work = list(items)
+        if not work:
+            return []
+        if self.max_concurrency == 1 or len(work) == 1:
+            results: list[R] = []
+            for item in work:
+                result = fn(item)
+                self._notify(on_result, item, result)
+                results.append(result)
+            return results
+
+        ordered: list[R | None] = [None] * len(work)
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(work)),
+            thread_name_prefix="steam_refresh",
+        ) as pool:
+            futures = {pool.submit(fn, item): index for index, item in enumerate(work)}
+            for future in as_completed(futures):
+                index = futures[future]
+                result = future.result()
+                ordered[index] = result
+                self._notify(on_result, work[index], result)
+        return ordered  # type: ignore[return-value]
+
+    @staticmethod
+    def _notify(on_result: Callable[[T, R], None] | None, item: T, result: R) -> None:
+        if on_result is None:
+            return
+        try:
+            on_result(item, result)
+        except Exception:
+            logger.warning("[STEAM] Partial refresh callback failed", exc_info=True)
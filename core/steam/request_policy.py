@@ -144,16 +144,21 @@ class SteamRequestCoordinator:
 
 
 class SteamBackoffPolicy:
-    """Bounded per-request backoff without timers or background work."""
+    """Bounded per-request backoff without timers or background work.
+
+    Safe to share between the workers of a concurrent refresh batch.
+    """
 
     def __init__(self, *, base_seconds: float = 60.0, max_seconds: float = 900.0) -> None:
         self.base_seconds = max(1.0, float(base_seconds))
         self.max_seconds = max(self.base_seconds, float(max_seconds))
         self._failures: dict[SteamRequestKey, int] = {}
         self._next_allowed_at: dict[SteamRequestKey, float] = {}
+        self._lock = threading.Lock()
 
     def check(self, key: SteamRequestKey, *, now: float) -> SteamBackoffDecision:
-        due = self._next_allowed_at.get(key, 0.0)
+        with self._lock:
+            due = self._next_allowed_at.get(key, 0.0)
         if due > now:
             return SteamBackoffDecision(
                 allowed=False,
@@ -164,8 +169,9 @@ class SteamBackoffPolicy:
 
     def record_result(self, key: SteamRequestKey, result: SteamResult, *, now: float) -> None:
         if result.ok:
-            self._failures.pop(key, None)
-            self._next_allowed_at.pop(key, None)
+            with self._lock:
+                self._failures.pop(key, None)
+                self._next_allowed_at.pop(key, None)
             return
         if result.status not in {
             SteamResultStatus.NETWORK_ERROR,
@@ -175,10 +181,11 @@ class SteamBackoffPolicy:
             SteamResultStatus.INVALID_RESPONSE,
         }:
             return
-        failures = self._failures.get(key, 0) + 1
-        self._failures[key] = failures
-        delay = min(self.max_seconds, self.base_seconds * (2 ** (failures - 1)))
-        self._next_allowed_at[key] = now + delay
+        with self._lock:
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            delay = min(self.max_seconds, self.base_seconds * (2 ** (failures - 1)))
+            self._next_allowed_at[key] = now + delay
         logger.warning(
             "[STEAM] Backoff armed source=%s category=%s failures=%d delay=%.1fs",
             key.source_id.value,
@@ -8,12 +8,13 @@ import os
 import threading
 import time
 import weakref
-from concurrent.futures import ThreadPoolExecutor, Future, wait as wait_futures
+from concurrent.futures import Future, wait as wait_futures
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 from PySide6.QtCore import QTimer, QObject, QThread, QCoreApplication, Signal, Qt
 from core.logging.logger import get_logger, is_verbose_logging, is_perf_metrics_enabled
+from core.threading.priority_pool import PriorityThreadPool
 
 logger = get_logger(__name__)
 
@@ -509,7 +510,8 @@ class ThreadManager:
     
     Features:
     - Separate IO and COMPUTE thread pools
-    - Task prioritization and result handling
+    - Priority-ordered queues with aging (see ``PriorityThreadPool``)
+    - Task result handling
     - Resource cleanup integration
     - UI thread dispatch utilities
     - Lock-free statistics
@@ -587,7 +589,7 @@ class ThreadManager:
         }
         self.config = {**default_config, **(config or {})}
         
-        self._executors: Dict[ThreadPoolType, ThreadPoolExecutor] = {}
+        self._executors: Dict[ThreadPoolType, PriorityThreadPool] = {}
         self._active_tasks: Dict[str, Task] = {}
         # Active ownership, category totals, and public pool totals describe
         # one task lifecycle. Keep them under one authority so admission and
@@ -618,6 +620,14 @@ class ThreadManager:
                 "last_execution_ms": 0.0,
                 "last_callback": "<none>",
                 "last_callback_ms": 0.0,
+                "queue_wait_by_priority": {
+                    priority.name.lower(): {
+                        "tasks": 0,
+                        "queue_wait_ms_total": 0.0,
+                        "queue_wait_ms_max": 0.0,
+                    }
+                    for priority in TaskPriority
+                },
             }
             for pool_type in ThreadPoolType
         }
@@ -647,9 +657,11 @@ class ThreadManager:
         """Initialize thread pools based on configuration."""
         for pool_type, max_workers in self.config.items():
             try:
-                executor = ThreadPoolExecutor(
+                executor = PriorityThreadPool(
                     max_workers=max_workers,
-                    thread_name_prefix=f"{pool_type.value}_pool"
+                    thread_name_prefix=f"{pool_type.value}_pool",
+                    levels=len(TaskPriority),
+                    default_level=TaskPriority.NORMAL.value,
                 )
                 
                 # Register with resource manager if available
@@ -685,7 +697,8 @@ class ThreadManager:
             func: Function to execute
             *args: Positional arguments for func
             task_id: Optional unique identifier
-            priority: Task priority
+            priority: Queue priority. Higher levels are dispatched first;
+                queued lower levels age upward so they are never starved.
             callback: Optional callback for result
             category: Stable diagnostics category. This passive metadata never
                 affects scheduling.
@@ -724,6 +737,13 @@ class ThreadManager:
                 pool_diag["last_task_category"] = task.category
                 pool_diag["last_task"] = _callable_debug_name(task.func)
                 pool_diag["last_queue_wait_ms"] = queue_wait_ms
+                priority_wait = pool_diag["queue_wait_by_priority"][task.priority.name.lower()]
+                priority_wait["tasks"] += 1
+                priority_wait["queue_wait_ms_total"] += queue_wait_ms
+                priority_wait["queue_wait_ms_max"] = max(
+                    float(priority_wait["queue_wait_ms_max"]),
+                    queue_wait_ms,
+                )
             try:
                 result = task.func(*task.args, **task.kwargs)
                 execution_time = time.time() - start_time
@@ -811,7 +831,11 @@ class ThreadManager:
         # the executor can run a fast task and unregister itself.
         self._register_active_task(task)
         try:
-            future = executor.submit(wrapped_func)
+            submit_with_priority = getattr(executor, "submit_with_priority", None)
+            if submit_with_priority is not None:
+                future = submit_with_priority(task.priority.value, wrapped_func)
+            else:
+                future = executor.submit(wrapped_func)
         except Exception:
             self._unregister_active_task(
                 task.task_id,
@@ -941,17 +965,32 @@ class ThreadManager:
     def get_diagnostic_snapshot(self) -> Dict[str, Any]:
         """Return bounded passive queue, worker, callback and UI-delivery counters."""
         with self._diagnostic_lock:
-            pools = {
-                pool_name: values.copy()
-                for pool_name, values in self._diagnostic_pools.items()
-            }
+            pools = {}
+            for pool_name, values in self._diagnostic_pools.items():
+                pool = values.copy()
+                pool["queue_wait_by_priority"] = {
+                    name: waits.copy()
+                    for name, waits in values["queue_wait_by_priority"].items()
+                }
+                pools[pool_name] = pool
         for pool_type, executor in self._executors.items():
             queue_depth = -1
+            pool = pools.setdefault(pool_type.value, {})
             try:
-                queue_depth = int(executor._work_queue.qsize())
+                queue_depth = int(executor.qsize())
+                pool["queue_depth_by_priority"] = {
+                    priority.name.lower(): depth
+                    for priority, depth in zip(TaskPriority, executor.queued_by_level())
+                }
+                pool["scheduler"] = executor.snapshot()
             except Exception:
                 pass
-            pools.setdefault(pool_type.value, {})["queue_depth"] = queue_depth
+            pool["queue_depth"] = queue_depth
+            for waits in pool.get("queue_wait_by_priority", {}).values():
+                tasks = int(waits["tasks"])
+                waits["queue_wait_ms_mean"] = (
+                    float(waits["queue_wait_ms_total"]) / tasks if tasks else 0.0
+                )
         with _ui_diagnostic_lock:
             ui = dict(_ui_diagnostics)
         scheduler = self._compute_lane_scheduler
@@ -1012,7 +1051,7 @@ class ThreadManager:
             queue_depth = -1
             executor = self._executors.get(pool_type)
             try:
-                queue_depth = int(executor._work_queue.qsize())
+                queue_depth = int(executor.qsize())
             except Exception:
                 pass
             snapshot[f"{pool_type.value}_queue_depth"] = queue_depth
@@ -0,0 +1,219 @@
+"""Priority-ordered worker pool used by ThreadManager for IO/COMPUTE work.
+
+Drop-in for the subset of ``ThreadPoolExecutor`` ThreadManager relies on
+(``submit``/``shutdown``/``_max_workers``) plus ``submit_with_priority``.
+
+Queued work waits in one FIFO per priority level.  A free worker takes the
+head with the highest *effective* level, where effective level is the base
+level raised by one for every ``aging_interval_s`` spent queued (capped at
+the top level, which still wins ties).  Aging keeps LOW work moving under a
+steady stream of HIGH submissions.
+
+Preemption of queued work is bounded as well: every time a newer item is
+dispatched ahead of a queued head, that head's bypass count grows, and a
+head bypassed ``max_bypass`` times runs next regardless of level.  Running
+tasks are never interrupted.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future
+import itertools
+import threading
+import time
+from typing import Any, Callable
+
+
+class _WorkItem:
+    __slots__ = ("future", "fn", "args", "kwargs", "level", "seq", "enqueued_at", "bypassed")
+
+    def __init__(
+        self,
+        future: Future,
+        fn: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+        level: int,
+        seq: int,
+        enqueued_at: float,
+    ) -> None:
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.level = level
+        self.seq = seq
+        self.enqueued_at = enqueued_at
+        self.bypassed = 0
+
+    def run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except BaseException as exc:
+            self.future.set_exception(exc)
+        else:
+            self.future.set_result(result)
+
+
+class PriorityThreadPool:
+    """Bounded worker pool that dispatches queued work by priority level."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        thread_name_prefix: str = "",
+        *,
+        levels: int = 4,
+        default_level: int = 1,
+        aging_interval_s: float = 2.0,
+        max_bypass: int = 64,
+    ) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self._max_workers = int(max_workers)
+        self._thread_name_prefix = thread_name_prefix or "priority_pool"
+        self._levels = max(1, int(levels))
+        self._default_level = self._clamp_level(default_level)
+        self._aging_interval_s = max(1e-3, float(aging_interval_s))
+        self._max_bypass = max(1, int(max_bypass))
+        self._condition = threading.Condition(threading.Lock())
+        self._queues: list[deque[_WorkItem]] = [deque() for _ in range(self._levels)]
+        self._queued = 0
+        self._idle = 0
+        self._seq = itertools.count()
+        self._threads: list[threading.Thread] = []
+        self._shutdown = False
+        self._metrics: dict[str, int] = {
+            "dispatched": 0,
+            "aged_dispatches": 0,
+            "forced_dispatches": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Executor surface
+    # ------------------------------------------------------------------
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Queue *fn* at the default level."""
+        return self.submit_with_priority(self._default_level, fn, *args, **kwargs)
+
+    def submit_with_priority(
+        self,
+        level: int,
+        fn: Callable[..., Any],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Future:
+        """Queue *fn* at *level* (0 = lowest) and return its Future."""
+        future: Future = Future()
+        thread = None
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            level = self._clamp_level(level)
+            self._queues[level].append(
+                _WorkItem(future, fn, args, kwargs, level, next(self._seq), time.monotonic())
+            )
+            self._queued += 1
+            if self._queued > self._idle and len(self._threads) < self._max_workers:
+                thread = self._new_worker_locked()
+            self._condition.notify()
+        if thread is not None:
+            # Started outside the lock so the new worker can claim the item
+            # as soon as it runs, like ThreadPoolExecutor.
+            thread.start()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for queue in self._queues:
+                    while queue:
+                        queue.popleft().future.cancel()
+                self._queued = 0
+            self._condition.notify_all()
+            threads = tuple(self._threads)
+        if wait:
+            for thread in threads:
+                if thread is not threading.current_thread() and thread.ident is not None:
+                    thread.join()
+
+    # ------------------------------------------------------------------
+    # Diagnostics
+    # ------------------------------------------------------------------
+
+    def qsize(self) -> int:
+        with self._condition:
+            return self._queued
+
+    def queued_by_level(self) -> list[int]:
+        with self._condition:
+            return [len(queue) for queue in self._queues]
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                **self._metrics,
+                "queued": [len(queue) for queue in self._queues],
+                "worker_threads": len(self._threads),
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _clamp_level(self, level: int) -> int:
+        return min(self._levels - 1, max(0, int(level)))
+
+    def _new_worker_locked(self) -> threading.Thread:
+        thread = threading.Thread(
+            target=self._worker_loop,
+            name=f"{self._thread_name_prefix}_{len(self._threads)}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        return thread
+
+    def _next_item_locked(self, now: float) -> _WorkItem:
+        heads = [queue[0] for queue in self._queues if queue]
+        forced = [item for item in heads if item.bypassed >= self._max_bypass]
+        if forced:
+            chosen = min(forced, key=lambda item: item.seq)
+            self._metrics["forced_dispatches"] += 1
+        else:
+            top = self._levels - 1
+            chosen = max(
+                heads,
+                key=lambda item: (
+                    min(top, item.level + (now - item.enqueued_at) / self._aging_interval_s),
+                    item.level,
+                    -item.seq,
+                ),
+            )
+            if any(item.level > chosen.level for item in heads):
+                self._metrics["aged_dispatches"] += 1
+        self._queues[chosen.level].popleft()
+        self._queued -= 1
+        self._metrics["dispatched"] += 1
+        for item in heads:
+            if item is not chosen and item.seq < chosen.seq:
+                item.bypassed += 1
+        return chosen
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queued and not self._shutdown:
+                    self._idle += 1
+                    self._condition.wait()
+                    self._idle -= 1
+                if not self._queued:
+                    return
+                item = self._next_item_locked(time.monotonic())
+            item.run()
+            del item
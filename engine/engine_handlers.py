@@ -31,14 +31,28 @@ from core.settings.capability_activation import (
     normalize_transition_capability_state,
 )
 from rendering.display_widget import DisplayWidget
-from ui.settings_dialog import SettingsDialog
 
 if TYPE_CHECKING:
     from engine.screensaver_engine import ScreensaverEngine
+    from ui.settings_dialog import SettingsDialog
+else:
+    # Imported on the first S-key/tray request; /s never needs the dialog
+    # stack at startup (see _settings_dialog_cls).
+    SettingsDialog = None
+
 
 logger = get_logger(__name__)
 
 
+def _settings_dialog_cls():
+    global SettingsDialog
+    if SettingsDialog is None:
+        from ui.settings_dialog import SettingsDialog as dialog_cls
+
+        SettingsDialog = dialog_cls
+    return SettingsDialog
+
+
 def _record_diagnostic_stage(stage: str, **fields: object) -> None:
     """Write a frozen-crash breadcrumb only in the dedicated diagnostic build."""
 
@@ -439,7 +453,7 @@ def _open_settings_after_runtime_destroyed(
             "settings_dialog_constructor_begin",
             generation=dialog_generation,
         )
-        dialog = SettingsDialog(
+        dialog = _settings_dialog_cls()(
             engine.settings_manager,
             animations,
             runtime_generation=dialog_generation,
@@ -960,6 +974,7 @@ def on_sources_changed(engine: ScreensaverEngine) -> None:
                         thread_manager=engine.thread_manager,
                         cache=engine._image_cache,
                         max_concurrent=2,
+                        planner=getattr(engine, "_prefetch_planner", None),
                     )
                     logger.info("Prefetcher restarted with updated queue")
                 except Exception as e:
@@ -350,11 +350,15 @@ def stop(
             except Exception as e:
                 logger.debug(f"RSSCoordinator request_stop failed: {e}")
 
-        # Stop background RSS refresh timer if present so no further
+        # Stop background RSS refresh / folder rescan timers so no further
         # callbacks run after teardown begins.
         if engine._rss_refresh_timer is not None:
             stop_qtimer_safe(engine, engine._rss_refresh_timer, description="Background RSS refresh timer")
             engine._rss_refresh_timer = None
+        folder_rescan_timer = getattr(engine, "_folder_rescan_timer", None)
+        if folder_rescan_timer is not None:
+            stop_qtimer_safe(engine, folder_rescan_timer, description="Background folder rescan timer")
+            engine._folder_rescan_timer = None
 
         # Stop rotation timer (do not delete here to avoid double-delete on repeated stops)
         if engine._rotation_timer:
@@ -463,6 +467,23 @@ def stop(
                         int(stats.get("replacements", 0)),
                         int(stats.get("idempotent_puts_avoided", 0)),
                     )
+                    l2_stats = stats.get("l2")
+                    if isinstance(l2_stats, dict):
+                        logger.info(
+                            "[PERF] [CACHE] ImageCacheTiers: l1_hit_rate=%.1f%%%% l2_hits=%d "
+                            "l2_misses=%d l2_hit_rate=%.1f%%%% l2_entries=%d l2_mb=%.1f/%.0f "
+                            "l2_writes=%d l2_evictions=%d l2_failures=%d",
+                            stats.get("l1_hit_rate_percent", 0.0),
+                            int(stats.get("l2_hits", 0)),
+                            int(stats.get("l2_misses", 0)),
+                            stats.get("l2_hit_rate_percent", 0.0),
+                            int(l2_stats.get("entries", 0)),
+                            int(l2_stats.get("bytes", 0)) / (1024 * 1024),
+                            int(l2_stats.get("max_bytes", 0)) / (1024 * 1024),
+                            int(l2_stats.get("writes", 0)),
+                            int(l2_stats.get("evictions", 0)),
+                            int(l2_stats.get("failures", 0)),
+                        )
                 cache_flow = getattr(engine, "_cache_runtime_stats", None)
                 if isinstance(cache_flow, dict):
                     logger.info(
@@ -498,6 +519,14 @@ def stop(
             except Exception as e:
                 logger.debug("[PERF] ImageCache summary logging failed: %s", e, exc_info=True)
 
+        # Pending L2 writes drained with the IO pool above; flush the index.
+        image_cache = getattr(engine, "_image_cache", None)
+        if image_cache is not None:
+            try:
+                image_cache.close_disk_tier()
+            except Exception as e:
+                logger.debug("[CACHE] Disk image cache close failed: %s", e)
+
         # Clear class-level flag for widget perf logging
         with engine._instance_lock:
             engine.__class__._instance_running = False
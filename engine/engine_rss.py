@@ -14,6 +14,7 @@ from typing import List, Tuple, TYPE_CHECKING
 from core.events import EventType
 from core.logging.logger import get_logger, is_perf_metrics_enabled
 from core.logging.tags import TAG_RSS
+from core.threading.manager import TaskPriority
 from sources.base_provider import ImageMetadata, ImageSourceType
 
 if TYPE_CHECKING:
@@ -197,7 +198,7 @@ def load_rss_images_async(engine: ScreensaverEngine) -> None:
         remaining = max(0, cap - current_rss)
         if remaining > 0:
             to_add = new_images[:remaining]
-            engine.image_queue.add_images(to_add)
+            engine.image_queue.ingest(to_add)
             logger.info(f"{TAG_RSS} Added {len(to_add)} new RSS images to queue (cap={cap})")
         else:
             logger.debug(f"{TAG_RSS} RSS cap reached ({cap}), skipping {len(new_images)} new images")
@@ -332,7 +333,12 @@ def background_refresh_rss(engine: ScreensaverEngine) -> None:
                 logger.debug(f"Background RSS merge failed: {e}")
 
         try:
-            engine.thread_manager.submit_io_task(_refresh_task, callback=_on_done)
+            engine.thread_manager.submit_io_task(
+                _refresh_task,
+                callback=_on_done,
+                priority=TaskPriority.LOW,
+                category="rss.background_refresh",
+            )
         except Exception as e:
             logger.debug(f"Background RSS submit failed: {e}")
     except Exception as e:
@@ -406,7 +412,7 @@ def merge_rss_images_from_refresh(
 
         added = 0
         try:
-            added = engine.image_queue.add_images(to_add)
+            added = engine.image_queue.ingest(to_add)
         except Exception as e:
             logger.debug(f"Background RSS queue add failed: {e}")
             return
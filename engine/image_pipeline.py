@@ -24,8 +24,9 @@ from core.logging.logger import (
 )
 from core.logging.tags import TAG_WORKER, TAG_PERF, TAG_ASYNC
 from core.constants.timing import TRANSITION_STAGGER_MS
-from core.threading.manager import ThreadManager
+from core.threading.manager import TaskPriority, ThreadManager
 from core.process.types import WorkerType, MessageType
+from core.process.shared_memory_transport import SharedMemoryResponseLease
 from core.settings import SettingsManager
 from rendering.display_modes import DisplayMode
 from rendering.image_processor_async import AsyncImageProcessor
@@ -296,6 +297,7 @@ def _ensure_cache_runtime_stats(engine: ScreensaverEngine) -> Dict[str, int]:
         "raw_misses": 0,
         "scaled_hits": 0,
         "scaled_misses": 0,
+        "scaled_l2_hits": 0,
         "worker_requests": 0,
         "worker_fallbacks": 0,
         "prefetch_resume_scheduled": 0,
@@ -307,6 +309,8 @@ def _ensure_cache_runtime_stats(engine: ScreensaverEngine) -> Dict[str, int]:
         "raw_prefetch_paths": 0,
         "raw_prefetch_skipped_display_ready": 0,
         "scaled_reuses_without_put": 0,
+        "deadline_hits": 0,
+        "deadline_misses": 0,
     }
     setattr(engine, "_cache_runtime_stats", stats)
     return stats
@@ -329,6 +333,14 @@ def _probe_cache(
     cached = cache.get(cache_key)
     if cached is None:
         _bump_cache_runtime_stat(engine, f"{bucket}_misses")
+        if bucket == "scaled":
+            # L1 miss: a previous session may have left this derivative on
+            # disk, which is far cheaper than scheduling decode + resample.
+            load_l2 = getattr(cache, "get_from_disk_tier", None)
+            if callable(load_l2):
+                cached = load_l2(cache_key)
+                if cached is not None:
+                    _bump_cache_runtime_stat(engine, "scaled_l2_hits")
     else:
         _bump_cache_runtime_stat(engine, f"{bucket}_hits")
     return cached
@@ -539,6 +551,7 @@ def _derive_scaled_pixmap_from_raw_cache(
     if scaled_qimage.isNull():
         return None
     scaled_pixmap = QPixmap.fromImage(scaled_qimage)
+    AsyncImageProcessor.recycle(scaled_qimage)
     if scaled_pixmap.isNull():
         return None
     cache = getattr(engine, "_image_cache", None)
@@ -668,65 +681,104 @@ def _get_cached_pixmap_variants(
 # ImageWorker-based loading
 # ------------------------------------------------------------------
 
-def load_image_via_worker(
+class WorkerImageLease:
+    """Worker prescale result that may borrow supervisor shared memory.
+
+    ``image`` is only valid until :meth:`release`. Zero-copy callers upload
+    it (or :meth:`detach` an owned copy) and then release so the pooled slab
+    returns to the supervisor's ring.
+    """
+
+    def __init__(
+        self,
+        image: QImage,
+        shared_lease: Optional[SharedMemoryResponseLease] = None,
+    ) -> None:
+        self._image: Optional[QImage] = image
+        self._shared_lease = shared_lease
+
+    @property
+    def image(self) -> QImage:
+        if self._image is None:
+            raise ValueError("Worker image lease already released")
+        return self._image
+
+    @property
+    def borrowed(self) -> bool:
+        return self._shared_lease is not None and not self._shared_lease.released
+
+    def detach(self) -> QImage:
+        """Return a Qt-owned copy and release the borrowed mapping."""
+        if self._shared_lease is None:
+            image = self.image
+            self._image = None
+            return image
+        try:
+            # No local reference: the borrowed QImage must be gone by release().
+            owned = self.image.copy()
+            if owned.isNull():
+                self._shared_lease.consumed = False
+                raise ValueError("QImage failed to detach shared RGBA payload")
+            return owned
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        # The non-owning QImage must die before the memoryview is released.
+        self._image = None
+        if self._shared_lease is not None:
+            self._shared_lease.release()
+
+    def __enter__(self) -> "WorkerImageLease":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.release()
+
+
+def _request_worker_prescale(
     engine: ScreensaverEngine,
     image_path: str,
     target_width: int,
     target_height: int,
-    display_mode: str = "fill",
-    sharpen: bool = False,
-    timeout_ms: int = 500,
-) -> Optional[QImage]:
-    """
-    Load and prescale image using ImageWorker process.
-
-    Uses the ImageWorker for decode/prescale in a separate process,
-    avoiding GIL contention. Falls back to None if worker unavailable.
-
-    Args:
-        engine: ScreensaverEngine instance
-        image_path: Path to image file
-        target_width: Target width in pixels
-        target_height: Target height in pixels
-        display_mode: Display mode (fill, fit, shrink)
-        sharpen: Whether to apply sharpening
-        timeout_ms: Timeout for worker response
+    display_mode: str,
+    sharpen: bool,
+    timeout_ms: int,
+) -> Optional[tuple[Any, int, int]]:
+    """Send one IMAGE_PRESCALE request and validate the correlated response.
 
-    Returns:
-        QImage if successful, None if worker unavailable or failed
+    Returns ``(response, width, height)`` with payload ownership still held
+    by the caller, or None after any rejected response has been disposed.
     """
     supervisor = engine._process_supervisor
-    if not supervisor or not supervisor.is_running(WorkerType.IMAGE):
-        return None
-
     runtime_generation, runtime_display_manager = _capture_runtime_identity(engine)
-    response = None
-    try:
-        # Get quality settings from settings manager
-        use_lanczos = True
-        if engine.settings_manager:
-            use_lanczos = engine.settings_manager.get('display.use_lanczos', True)
-            if isinstance(use_lanczos, str):
-                use_lanczos = use_lanczos.lower() == 'true'
-
-        response = supervisor.send_request_and_await_response(
-            WorkerType.IMAGE,
-            MessageType.IMAGE_PRESCALE,
-            payload={
-                "path": image_path,
-                "target_width": target_width,
-                "target_height": target_height,
-                "mode": display_mode,
-                "use_lanczos": use_lanczos,
-                "sharpen": sharpen,
-            },
-            timeout_ms=timeout_ms,
-        )
 
-        if not response:
-            logger.warning(f"{TAG_WORKER} ImageWorker timeout after %dms", timeout_ms)
-            return None
+    # Get quality settings from settings manager
+    use_lanczos = True
+    if engine.settings_manager:
+        use_lanczos = engine.settings_manager.get('display.use_lanczos', True)
+        if isinstance(use_lanczos, str):
+            use_lanczos = use_lanczos.lower() == 'true'
+
+    response = supervisor.send_request_and_await_response(
+        WorkerType.IMAGE,
+        MessageType.IMAGE_PRESCALE,
+        payload={
+            "path": image_path,
+            "target_width": target_width,
+            "target_height": target_height,
+            "mode": display_mode,
+            "use_lanczos": use_lanczos,
+            "sharpen": sharpen,
+        },
+        timeout_ms=timeout_ms,
+    )
+
+    if not response:
+        logger.warning(f"{TAG_WORKER} ImageWorker timeout after %dms", timeout_ms)
+        return None
 
+    try:
         if not _runtime_identity_is_current(
             engine,
             runtime_generation,
@@ -753,9 +805,8 @@ def load_image_via_worker(
             supervisor.dispose_response(response, reason="invalid_dimensions")
             return None
 
-        expected_size = width * height * 4
-        shm_name = payload.get("shared_memory_name")
-        if shm_name:
+        if payload.get("shared_memory_name"):
+            expected_size = width * height * 4
             declared_size = int(
                 payload.get(
                     "shared_memory_data_size",
@@ -775,70 +826,160 @@ def load_image_via_worker(
                     reason="invalid_payload_size",
                 )
                 return None
+    except Exception as e:
+        supervisor.dispose_response(response, reason="parent_consumer_exception")
+        logger.warning(f"{TAG_WORKER} ImageWorker error: %s", e)
+        return None
 
-            def _copy_shared_rgba(
-                rgba_view: memoryview,
-                _descriptor: object,
-            ) -> QImage:
-                if len(rgba_view) != expected_size:
-                    raise ValueError(
-                        "Mapped image payload does not match RGBA dimensions"
-                    )
-                source_qimage = QImage(
-                    rgba_view,
-                    width,
-                    height,
-                    width * 4,
-                    QImage.Format.Format_RGBA8888,
-                )
-                try:
-                    if source_qimage.isNull():
-                        raise ValueError("QImage rejected shared RGBA payload")
-                    owned_qimage = source_qimage.copy()
-                    if owned_qimage.isNull():
-                        raise ValueError("QImage failed to detach shared RGBA payload")
-                    return owned_qimage
-                finally:
-                    # The non-owning QImage must die before the memoryview is
-                    # released by the supervisor's transfer lease.
-                    del source_qimage
-
-            qimage = supervisor.consume_shared_memory_response(
-                response,
-                _copy_shared_rgba,
-            )
-            if is_perf_metrics_enabled():
-                logger.debug(
-                    f"{TAG_PERF} {TAG_WORKER} ImageWorker used shared memory: %.1f MB",
-                    declared_size / (1024 * 1024),
-                )
-        else:
-            rgba_data = payload.get("rgba_data")
-            if not rgba_data or len(rgba_data) != expected_size:
-                logger.warning(f"{TAG_WORKER} ImageWorker returned invalid RGBA data")
-                return None
-            source_qimage = QImage(
-                rgba_data,
-                width,
-                height,
-                width * 4,
-                QImage.Format.Format_RGBA8888,
-            )
-            qimage = source_qimage.copy()
-            del source_qimage
+    return response, width, height
 
-        if is_perf_metrics_enabled():
-            proc_time = response.processing_time_ms or 0
-            logger.info(
-                f"{TAG_PERF} {TAG_WORKER} ImageWorker prescale: %dx%d in %.1fms",
-                width,
-                height,
-                proc_time,
-            )
-        return qimage
 
+def _queued_rgba_qimage(payload: Dict[str, Any], width: int, height: int) -> Optional[QImage]:
+    """Build a Qt-owned QImage from a queue-transferred RGBA payload."""
+    rgba_data = payload.get("rgba_data")
+    if not rgba_data or len(rgba_data) != width * height * 4:
+        logger.warning(f"{TAG_WORKER} ImageWorker returned invalid RGBA data")
+        return None
+    source_qimage = QImage(
+        rgba_data,
+        width,
+        height,
+        width * 4,
+        QImage.Format.Format_RGBA8888,
+    )
+    qimage = source_qimage.copy()
+    del source_qimage
+    return qimage
+
+
+def _log_worker_prescale(response: Any, width: int, height: int, *, shared_bytes: int = 0) -> None:
+    if not is_perf_metrics_enabled():
+        return
+    if shared_bytes:
+        logger.debug(
+            f"{TAG_PERF} {TAG_WORKER} ImageWorker used shared memory: %.1f MB (pooled=%s)",
+            shared_bytes / (1024 * 1024),
+            bool(response.payload.get("shared_memory_slab_generation")),
+        )
+    logger.info(
+        f"{TAG_PERF} {TAG_WORKER} ImageWorker prescale: %dx%d in %.1fms",
+        width,
+        height,
+        response.processing_time_ms or 0,
+    )
+
+
+def load_image_via_worker(
+    engine: ScreensaverEngine,
+    image_path: str,
+    target_width: int,
+    target_height: int,
+    display_mode: str = "fill",
+    sharpen: bool = False,
+    timeout_ms: int = 500,
+) -> Optional[QImage]:
+    """
+    Load and prescale image using ImageWorker process.
+
+    Uses the ImageWorker for decode/prescale in a separate process,
+    avoiding GIL contention. Falls back to None if worker unavailable.
+    The result is detached from a :func:`lease_image_via_worker` lease, so
+    any pooled slab goes straight back to the supervisor's ring.
+
+    Args:
+        engine: ScreensaverEngine instance
+        image_path: Path to image file
+        target_width: Target width in pixels
+        target_height: Target height in pixels
+        display_mode: Display mode (fill, fit, shrink)
+        sharpen: Whether to apply sharpening
+        timeout_ms: Timeout for worker response
+
+    Returns:
+        QImage if successful, None if worker unavailable or failed
+    """
+    lease = lease_image_via_worker(
+        engine,
+        image_path,
+        target_width,
+        target_height,
+        display_mode=display_mode,
+        sharpen=sharpen,
+        timeout_ms=timeout_ms,
+    )
+    if lease is None:
+        return None
+    try:
+        return lease.detach()
     except Exception as e:
-        if response is not None:
+        logger.warning(f"{TAG_WORKER} ImageWorker error: %s", e)
+        return None
+
+
+def lease_image_via_worker(
+    engine: ScreensaverEngine,
+    image_path: str,
+    target_width: int,
+    target_height: int,
+    display_mode: str = "fill",
+    sharpen: bool = False,
+    timeout_ms: int = 500,
+) -> Optional[WorkerImageLease]:
+    """Zero-copy variant of :func:`load_image_via_worker`.
+
+    Shared-memory results are returned as a QImage that reads straight from
+    the supervisor-owned mapping (a pooled slab when one was free). The
+    caller must release the lease once the image has been uploaded; until
+    then the slab stays out of the ring.
+    """
+    supervisor = engine._process_supervisor
+    if not supervisor or not supervisor.is_running(WorkerType.IMAGE):
+        return None
+
+    response = None
+    shared_lease = None
+    try:
+        requested = _request_worker_prescale(
+            engine,
+            image_path,
+            target_width,
+            target_height,
+            display_mode,
+            sharpen,
+            timeout_ms,
+        )
+        if requested is None:
+            return None
+        response, width, height = requested
+        expected_size = width * height * 4
+
+        if not response.payload.get("shared_memory_name"):
+            qimage = _queued_rgba_qimage(response.payload, width, height)
+            if qimage is None:
+                return None
+            _log_worker_prescale(response, width, height)
+            return WorkerImageLease(qimage)
+
+        shared_lease = supervisor.lease_shared_memory_response(response)
+        if len(shared_lease.view) != expected_size:
+            raise ValueError("Mapped image payload does not match RGBA dimensions")
+        qimage = QImage(
+            shared_lease.view,
+            width,
+            height,
+            width * 4,
+            QImage.Format.Format_RGBA8888,
+        )
+        if qimage.isNull():
+            raise ValueError("QImage rejected shared RGBA payload")
+        _log_worker_prescale(response, width, height, shared_bytes=expected_size)
+        return WorkerImageLease(qimage, shared_lease)
+
+    except Exception as e:
+        if shared_lease is not None:
+            shared_lease.consumed = False
+            shared_lease.release()
+        elif response is not None:
             supervisor.dispose_response(
                 response,
                 reason="parent_consumer_exception",
@@ -1078,13 +1219,11 @@ def _process_display_image_candidate(
     )
 
     if cache is not None:
-        cached_scaled = cache.get(scaled_key)
+        cached_scaled = _probe_cache(engine, scaled_key, bucket="scaled")
         if isinstance(cached_scaled, QImage) and not cached_scaled.isNull():
             processed_qimage = cached_scaled
             scaled_cache_hit = True
-            _bump_cache_runtime_stat(engine, "scaled_hits")
-        else:
-            _bump_cache_runtime_stat(engine, "scaled_misses")
+        _record_slide_deadline(engine, display_index, scaled_cache_hit)
 
         if processed_qimage is None:
             cached_raw = cache.get(img_path)
@@ -1628,6 +1767,7 @@ def load_and_display_image_async(
         engine.thread_manager.submit_compute_task(
             _do_load_and_process,
             callback=lambda r: engine.thread_manager.run_on_ui_thread(lambda: _on_process_complete(r)),
+            priority=TaskPriority.HIGH,
             category="image.load_and_process",
         )
         return True
@@ -1815,6 +1955,7 @@ def load_and_display_image_async_with_metas(
         engine.thread_manager.submit_compute_task(
             _do_load,
             callback=lambda r: engine.thread_manager.run_on_ui_thread(lambda: _on_complete(r)),
+            priority=TaskPriority.HIGH,
             category="image.previous_load",
         )
         return True
@@ -1949,6 +2090,51 @@ def _has_transition_work_pending(engine: ScreensaverEngine) -> bool:
     return False
 
 
+def _record_slide_deadline(engine: ScreensaverEngine, display_index: int, ready: bool) -> None:
+    """A slide is on time when its display-ready derivative exists as it falls due."""
+    _bump_cache_runtime_stat(engine, "deadline_hits" if ready else "deadline_misses")
+    planner = getattr(engine, "_prefetch_planner", None)
+    if planner is not None:
+        planner.record_deadline(display_index, ready)
+
+
+def _plan_prefetch_depth(engine: ScreensaverEngine) -> int:
+    """Feed the planner the current slide cadence and return the depth to preview."""
+    planner = getattr(engine, "_prefetch_planner", None)
+    prefetcher = engine._prefetcher
+    if planner is None or not hasattr(prefetcher, "apply_plan"):
+        return engine._prefetch_ahead
+
+    settings_manager = getattr(engine, "settings_manager", None)
+    interval_s = 10.0
+    same_image = True
+    if settings_manager is not None:
+        try:
+            interval_s = float(settings_manager.get("timing.interval", 10))
+        except (TypeError, ValueError):
+            interval_s = 10.0
+        same_image = SettingsManager.to_bool(
+            settings_manager.get("display.same_image_all_monitors", True), True
+        )
+    specs = _get_prefetch_target_specs_in_display_order(engine)
+    planner.set_display_intervals(
+        {idx: interval_s for idx in range(max(1, len(specs)))},
+        same_image=same_image,
+    )
+    # Same-image mode keeps one derivative per distinct target alive per
+    # slide; different-images mode keeps one per display for its own image.
+    if same_image:
+        slide_specs = _get_prefetch_target_specs(engine)
+        slide_bytes = sum(spec["width"] * spec["height"] * 4 for spec in slide_specs)
+    else:
+        slide_bytes = max((spec["width"] * spec["height"] * 4 for spec in specs), default=0)
+    planner.set_bytes_per_slide(slide_bytes)
+
+    plan = planner.plan(prefetcher.memory_budget_bytes())
+    prefetcher.apply_plan(plan)
+    return plan.depth
+
+
 def schedule_prefetch(engine: ScreensaverEngine) -> None:
     """Schedule prefetch of upcoming images."""
     try:
@@ -1958,12 +2144,13 @@ def schedule_prefetch(engine: ScreensaverEngine) -> None:
             if is_verbose_logging():
                 logger.debug("Prefetch deferred: transition still active or pending")
             return
+        depth = _plan_prefetch_depth(engine)
         preview_many = getattr(engine.image_queue, "preview_upcoming", None)
         if callable(preview_many):
-            upcoming = preview_many(engine._prefetch_ahead)
+            upcoming = preview_many(depth)
             preview_source = "preview_upcoming"
         else:
-            upcoming = engine.image_queue.peek_many(engine._prefetch_ahead)
+            upcoming = engine.image_queue.peek_many(depth)
             preview_source = "peek_many"
 
         paths: List[str] = []
@@ -1979,6 +2166,9 @@ def schedule_prefetch(engine: ScreensaverEngine) -> None:
                 continue
         if not paths:
             return
+        planner = getattr(engine, "_prefetch_planner", None)
+        if planner is not None:
+            planner.note_upcoming(paths)
 
         scaled_requests = _build_prefetch_scaled_requests(engine, paths)
         raw_prefetch_paths: List[str] = []
@@ -2039,6 +2229,23 @@ def schedule_prefetch(engine: ScreensaverEngine) -> None:
                 len(scaled_requests),
                 preview_source,
             )
+            if planner is not None:
+                planner_state = planner.snapshot()
+                logger.info(
+                    "[PERF] [PREFETCH] plan depth=%d concurrency=%d cooldown_ms=%.0f "
+                    "service_ms=%.1f interval_s=%.2f memory_limited=%s "
+                    "deadline_miss_rate=%.3f recent_miss_rate=%.3f misses=%d/%d",
+                    planner_state["depth"],
+                    planner_state["concurrency"],
+                    planner_state["post_transition_delay_ms"],
+                    planner_state["service_time_ms"],
+                    planner_state["slide_interval_s"],
+                    planner_state["memory_limited"],
+                    planner_state["deadline_miss_rate"],
+                    planner_state["recent_deadline_miss_rate"],
+                    planner_state["deadline_misses"],
+                    planner_state["deadline_hits"] + planner_state["deadline_misses"],
+                )
         elif is_verbose_logging():
             logger.debug("Prefetch scheduled for %d upcoming images", len(paths))
     except Exception as e:
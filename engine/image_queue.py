@@ -6,12 +6,15 @@ source selection between local folders and RSS/JSON feeds.
 """
 import random
 import threading
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 from collections import deque
 from urllib.parse import urlparse
 from sources.base_provider import ImageMetadata, ImageSourceType
 from core.logging.logger import get_logger
 
+if TYPE_CHECKING:
+    from core.threading.manager import ThreadManager
+
 logger = get_logger(__name__)
 
 # History lookback constants - RSS needs longer history to avoid repetition
@@ -19,6 +22,20 @@ logger = get_logger(__name__)
 LOCAL_IMAGE_LOOKBACK = 5   # Local images can repeat after 5 transitions
 RSS_IMAGE_LOOKBACK = 15    # RSS images need 15+ transitions before repeat
 
+# Streaming ingestion: images are spliced in under the lock this many at a
+# time so next() can interleave with a long enumeration.
+INGEST_BATCH_SIZE = 512
+# When a shuffled pool has this few pending images left, the next cycle's
+# shuffle is prepared on a background thread.
+RESHUFFLE_LOW_WATER = 64
+
+# Pool name -> (all-images attribute, pending-queue attribute)
+_POOL_ATTRS = {
+    'local': ('_local_images', '_local_queue'),
+    'rss': ('_rss_images', '_rss_queue'),
+    'combined': ('_images', '_queue'),
+}
+
 
 def _extract_domain(image: ImageMetadata) -> str:
     """Extract domain from RSS image URL or source_id for diversity tracking."""
@@ -97,6 +114,12 @@ class ImageQueue:
         
         # FIX: Store ImageMetadata objects directly instead of string paths (fixes RSS None path issue)
         self._history: deque[ImageMetadata] = deque(maxlen=history_size)
+        # Parallel key deque plus key -> sequence number of its latest history
+        # entry, so recent-history checks are O(1) instead of a history scan.
+        # The entry at history index i has sequence _history_seq - len + i.
+        self._history_keys: deque[str] = deque(maxlen=history_size)
+        self._last_seen: Dict[str, int] = {}
+        self._history_seq: int = 0
         self._current_image: Optional[ImageMetadata] = None
         self._current_index: int = -1
         self._wrap_count: int = 0
@@ -107,6 +130,20 @@ class ImageQueue:
         
         # Track last RSS domain for diversity (prefer different domains)
         self._last_rss_domain: str = ""
+        # id(image) -> (image, key, domain), filled once in add_images() so
+        # next() never re-derives keys or parses URLs. The image reference
+        # pins the id for as long as the entry exists.
+        self._image_info: Dict[int, Tuple[ImageMetadata, str, str]] = {}
+        
+        # Background reshuffle state. Every membership change bumps
+        # _generation, which invalidates prepared cycles and pending seeds.
+        # A pending cycle is fully determined by its seed, so a pool that
+        # runs dry before the worker finishes shuffles synchronously from the
+        # same seed and the order never depends on thread timing.
+        self._thread_manager: Optional["ThreadManager"] = None
+        self._generation: int = 0
+        self._next_cycles: Dict[str, deque[ImageMetadata]] = {}
+        self._reshuffle_seeds: Dict[str, Tuple[int, int]] = {}
         
         # FIX: Add thread safety with RLock (reentrant for same thread)
         self._lock = threading.RLock()
@@ -117,6 +154,33 @@ class ImageQueue:
                 f"ImageQueue initialized (shuffle={shuffle}, history_size={history_size}, local_ratio={local_ratio}%)"
             )
     
+    def set_thread_manager(self, thread_manager: Optional["ThreadManager"]) -> None:
+        """Enable background reshuffles on the compute pool (None disables)."""
+        with self._lock:
+            self._thread_manager = thread_manager
+    
+    def _register_images(self, images: List[ImageMetadata]) -> Tuple[List[ImageMetadata], List[ImageMetadata]]:
+        """Cache keys/domains, extend the pools and split by type (lock held)."""
+        local_new: List[ImageMetadata] = []
+        rss_new: List[ImageMetadata] = []
+        
+        image_info = self._image_info
+        for img in images:
+            if img.source_type == ImageSourceType.FOLDER:
+                local_new.append(img)
+                image_info[id(img)] = (img, self._get_image_key(img), "")
+            else:
+                # RSS, CUSTOM, or any other type goes to RSS pool
+                rss_new.append(img)
+                image_info[id(img)] = (img, self._get_image_key(img), _extract_domain(img))
+        
+        # Store in respective pools
+        self._local_images.extend(local_new)
+        self._rss_images.extend(rss_new)
+        self._images.extend(images)  # Combined for backwards compatibility
+        self._invalidate_cycles()
+        return local_new, rss_new
+    
     def add_images(self, images: List[ImageMetadata]) -> int:
         """
         Add images to the queue (thread-safe).
@@ -137,20 +201,7 @@ class ImageQueue:
         # FIX: Thread-safe queue modification
         with self._lock:
             # Categorize images by source type
-            local_new: List[ImageMetadata] = []
-            rss_new: List[ImageMetadata] = []
-            
-            for img in images:
-                if img.source_type == ImageSourceType.FOLDER:
-                    local_new.append(img)
-                else:
-                    # RSS, CUSTOM, or any other type goes to RSS pool
-                    rss_new.append(img)
-            
-            # Store in respective pools
-            self._local_images.extend(local_new)
-            self._rss_images.extend(rss_new)
-            self._images.extend(images)  # Combined for backwards compatibility
+            local_new, rss_new = self._register_images(images)
             
             # Add to respective queues
             if self.shuffle_enabled:
@@ -177,6 +228,75 @@ class ImageQueue:
             )
             return len(images)
     
+    def ingest(self, images: Iterable[ImageMetadata], batch_size: int = INGEST_BATCH_SIZE) -> int:
+        """
+        Stream images into the queue in batches (thread-safe).
+        
+        Accepts any iterable, including a generator that is still
+        enumerating a source. Each batch is spliced into the pending queues
+        with an incremental Fisher-Yates insert (when shuffling), so new
+        images are spread uniformly through what is left of the current
+        cycle instead of waiting behind it. The lock is released between
+        batches, so next() keeps serving slides during a long ingest.
+        
+        Args:
+            images: Iterable of image metadata to add
+            batch_size: Images spliced per lock acquisition
+        
+        Returns:
+            Number of images added
+        """
+        batch_size = max(1, int(batch_size))
+        total = 0
+        batch: List[ImageMetadata] = []
+        for img in images:
+            batch.append(img)
+            if len(batch) >= batch_size:
+                total += self._splice_batch(batch)
+                batch = []
+        if batch:
+            total += self._splice_batch(batch)
+        
+        if total:
+            logger.info(
+                f"Ingested {total} images. "
+                f"Pools: local={len(self._local_queue)}, rss={len(self._rss_queue)}"
+            )
+        return total
+    
+    def _splice_batch(self, batch: List[ImageMetadata]) -> int:
+        with self._lock:
+            local_new, rss_new = self._register_images(batch)
+            if self.shuffle_enabled:
+                self._splice_shuffled(self._local_queue, local_new)
+                self._splice_shuffled(self._rss_queue, rss_new)
+                self._splice_shuffled(self._queue, batch)
+            else:
+                self._local_queue.extend(local_new)
+                self._rss_queue.extend(rss_new)
+                self._queue.extend(batch)
+            return len(batch)
+    
+    def _splice_shuffled(self, queue: deque[ImageMetadata], items: List[ImageMetadata]) -> None:
+        """Inside-out Fisher-Yates: append each item, then swap it with a
+        uniformly chosen slot, keeping the pending queue a uniform shuffle.
+        
+        Runs on a list copy because indexing into a deque is O(n); the copy
+        makes a whole batch O(n + k) instead of O(n * k).
+        """
+        if not items:
+            return
+        rng = self._rng
+        pending = list(queue)
+        for item in items:
+            pending.append(item)
+            j = rng.randrange(len(pending))
+            if j != len(pending) - 1:
+                pending[-1] = pending[j]
+                pending[j] = item
+        queue.clear()
+        queue.extend(pending)
+    
     def set_images(self, images: List[ImageMetadata]) -> int:
         """
         Replace all images in the queue (thread-safe).
@@ -192,6 +312,57 @@ class ImageQueue:
             self.clear()
             return self.add_images(images)
     
+    def apply_delta(
+        self,
+        added: Iterable[ImageMetadata],
+        removed: Iterable[ImageMetadata],
+    ) -> Tuple[int, int]:
+        """
+        Apply an incremental source change without rebuilding the queue (thread-safe).
+        
+        Removed images are filtered out of every pool and pending queue while
+        keeping the remaining order; added images are spliced in through
+        add_images(). History is left untouched so previous() still works.
+        
+        Args:
+            added: Newly discovered images
+            removed: Images that no longer exist at their source
+        
+        Returns:
+            Tuple of (added count, removed count)
+        """
+        added = list(added)
+        removed_keys = {self._get_image_key(img) for img in removed}
+        removed_keys.discard("")
+        
+        with self._lock:
+            removed_count = 0
+            if removed_keys:
+                def keep(img: ImageMetadata) -> bool:
+                    return self._image_key(img) not in removed_keys
+                
+                before = len(self._images)
+                kept: List[ImageMetadata] = []
+                for img in self._images:
+                    if keep(img):
+                        kept.append(img)
+                    else:
+                        self._image_info.pop(id(img), None)
+                self._images = kept
+                removed_count = before - len(self._images)
+                self._local_images = [img for img in self._local_images if keep(img)]
+                self._rss_images = [img for img in self._rss_images if keep(img)]
+                self._queue = deque(img for img in self._queue if keep(img))
+                self._local_queue = deque(img for img in self._local_queue if keep(img))
+                self._rss_queue = deque(img for img in self._rss_queue if keep(img))
+                self._invalidate_cycles()
+            
+            added_count = self.add_images(added) if added else 0
+        
+        if removed_count:
+            logger.info(f"Applied source delta: +{added_count}/-{removed_count} images")
+        return added_count, removed_count
+    
     def set_local_ratio(self, ratio: int) -> None:
         """
         Set the local/RSS usage ratio.
@@ -246,29 +417,97 @@ class ImageQueue:
         # Normal ratio-based selection
         return self._rng.randint(0, 99) < self._local_ratio
     
-    def _rebuild_local_queue(self) -> None:
-        """Rebuild local queue from local images."""
-        if not self._local_images:
+    def _invalidate_cycles(self) -> None:
+        """Drop prepared/pending reshuffles after a membership change (lock held)."""
+        self._generation += 1
+        self._next_cycles.clear()
+        self._reshuffle_seeds.clear()
+    
+    def _rebuild_pool(self, pool: str) -> None:
+        """Refill an exhausted pending queue with the next cycle (lock held).
+        
+        Uses the background-prepared shuffle when it is ready, otherwise
+        shuffles synchronously (from the pending seed if one was issued).
+        """
+        images_attr, queue_attr = _POOL_ATTRS[pool]
+        images: List[ImageMetadata] = getattr(self, images_attr)
+        queue: deque[ImageMetadata] = getattr(self, queue_attr)
+        if not images:
             return
-        if self.shuffle_enabled:
-            shuffled = self._local_images.copy()
-            self._rng.shuffle(shuffled)
-            self._local_queue.extend(shuffled)
+        if not self.shuffle_enabled:
+            queue.extend(images)
+            return
+        
+        prepared = self._next_cycles.pop(pool, None)
+        pending = self._reshuffle_seeds.pop(pool, None)
+        if prepared is not None:
+            queue.extend(prepared)
+            logger.debug(f"{pool} queue swapped in prepared cycle ({len(queue)} images)")
+            return
+        shuffled = images.copy()
+        if pending is not None:
+            random.Random(pending[0]).shuffle(shuffled)
         else:
-            self._local_queue.extend(self._local_images)
-        logger.debug(f"Local queue rebuilt with {len(self._local_queue)} images")
+            self._rng.shuffle(shuffled)
+        queue.extend(shuffled)
+        logger.debug(f"{pool} queue rebuilt with {len(queue)} images")
+    
+    def _maybe_prepare_next_cycle(self, pool: str) -> None:
+        """Start a background shuffle once a pool's pending queue runs low (lock held).
+        
+        The seed is drawn even without a thread manager so the RNG stream,
+        and therefore preview_upcoming(), is the same either way.
+        """
+        if not self.shuffle_enabled:
+            return
+        if pool in self._next_cycles or pool in self._reshuffle_seeds:
+            return
+        images_attr, queue_attr = _POOL_ATTRS[pool]
+        if len(getattr(self, queue_attr)) > RESHUFFLE_LOW_WATER:
+            return
+        images: List[ImageMetadata] = getattr(self, images_attr)
+        if len(images) <= RESHUFFLE_LOW_WATER:
+            return  # Small pools shuffle faster inline than a task round-trip
+        
+        seed = self._rng.getrandbits(64)
+        generation = self._generation
+        self._reshuffle_seeds[pool] = (seed, generation)
+        thread_manager = self._thread_manager
+        if thread_manager is None:
+            return
+        snapshot = images.copy()
+        try:
+            from core.threading.manager import TaskPriority
+            
+            thread_manager.submit_compute_task(
+                self._prepare_cycle,
+                pool,
+                snapshot,
+                seed,
+                generation,
+                priority=TaskPriority.LOW,
+                category="image_queue_reshuffle",
+            )
+        except Exception as e:
+            # The seed stays registered; _rebuild_pool shuffles inline.
+            logger.debug("[IMAGE_QUEUE] Background reshuffle submit failed: %s", e)
+    
+    def _prepare_cycle(self, pool: str, snapshot: List[ImageMetadata], seed: int, generation: int) -> None:
+        """Worker: shuffle a snapshot and publish it if still current."""
+        random.Random(seed).shuffle(snapshot)
+        cycle = deque(snapshot)
+        with self._lock:
+            if self._reshuffle_seeds.get(pool) == (seed, generation) and generation == self._generation:
+                self._next_cycles[pool] = cycle
+                del self._reshuffle_seeds[pool]
+    
+    def _rebuild_local_queue(self) -> None:
+        """Rebuild local queue from local images."""
+        self._rebuild_pool('local')
     
     def _rebuild_rss_queue(self) -> None:
         """Rebuild RSS queue from RSS images."""
-        if not self._rss_images:
-            return
-        if self.shuffle_enabled:
-            shuffled = self._rss_images.copy()
-            self._rng.shuffle(shuffled)
-            self._rss_queue.extend(shuffled)
-        else:
-            self._rss_queue.extend(self._rss_images)
-        logger.debug(f"RSS queue rebuilt with {len(self._rss_queue)} images")
+        self._rebuild_pool('rss')
     
     def _get_image_key(self, image: ImageMetadata) -> str:
         """Get a unique key for an image to check for duplicates."""
@@ -276,6 +515,53 @@ class ImageQueue:
             return str(image.local_path)
         return image.url or ""
     
+    def _image_key(self, image: ImageMetadata) -> str:
+        """Cached _get_image_key() for images that went through add_images()."""
+        info = self._image_info.get(id(image))
+        if info is not None and info[0] is image:
+            return info[1]
+        return self._get_image_key(image)
+    
+    def _image_domain(self, image: ImageMetadata) -> str:
+        """Cached _extract_domain() for images that went through add_images()."""
+        info = self._image_info.get(id(image))
+        if info is not None and info[0] is image and info[2]:
+            return info[2]
+        return _extract_domain(image)
+    
+    def _record_history(self, image: ImageMetadata) -> None:
+        """Append to history, keeping the key index in step (lock held)."""
+        maxlen = self._history.maxlen
+        if maxlen == 0:
+            return
+        if maxlen is not None and len(self._history) == maxlen:
+            # The oldest entry is about to be evicted; drop its index entry
+            # unless the key has been shown again since.
+            evicted_key = self._history_keys[0]
+            if self._last_seen.get(evicted_key) == self._history_seq - maxlen:
+                del self._last_seen[evicted_key]
+        key = self._image_key(image)
+        self._history.append(image)
+        self._history_keys.append(key)
+        if key:
+            self._last_seen[key] = self._history_seq
+        self._history_seq += 1
+    
+    def _pop_history(self) -> ImageMetadata:
+        """Remove the newest history entry, restoring the key index (lock held)."""
+        image = self._history.pop()
+        key = self._history_keys.pop()
+        self._history_seq -= 1
+        if key and self._last_seen.get(key) == self._history_seq:
+            # Rare (Back navigation): fall back to the key's previous entry.
+            del self._last_seen[key]
+            base = self._history_seq - len(self._history_keys)
+            for index in range(len(self._history_keys) - 1, -1, -1):
+                if self._history_keys[index] == key:
+                    self._last_seen[key] = base + index
+                    break
+        return image
+    
     def _is_in_recent_history(self, image: ImageMetadata, lookback: Optional[int] = None) -> bool:
         """Check if image was shown in the last N images.
         
@@ -284,9 +570,12 @@ class ImageQueue:
         """
         if not self._history:
             return False
-        key = self._get_image_key(image)
+        key = self._image_key(image)
         if not key:
             return False
+        seen = self._last_seen.get(key)
+        if seen is None:
+            return False
         
         # Use appropriate lookback based on image source type
         if lookback is None:
@@ -295,13 +584,8 @@ class ImageQueue:
             else:
                 lookback = LOCAL_IMAGE_LOOKBACK
         
-        # Check last N items in history
-        recent = list(self._history)[-lookback:]
-        for hist_img in recent:
-            hist_key = self._get_image_key(hist_img)
-            if hist_key == key:
-                return True
-        return False
+        # The newest history entry has sequence _history_seq - 1.
+        return lookback <= 0 or self._history_seq - seen <= lookback
     
     def next(self) -> Optional[ImageMetadata]:
         """
@@ -340,12 +624,12 @@ class ImageQueue:
 
                 self._current_image = image
                 self._current_index += 1
-                self._history.append(image)
+                self._record_history(image)
                 if image.source_type == ImageSourceType.FOLDER:
                     self._local_count += 1
                 else:
                     self._rss_count += 1
-                    self._last_rss_domain = _extract_domain(image)
+                    self._last_rss_domain = self._image_domain(image)
                 return image
 
             # Determine which pool to use
@@ -380,7 +664,7 @@ class ImageQueue:
                     if not self._is_in_recent_history(candidate):
                         # For RSS images, also prefer different domain
                         if pool_name == 'rss' and self._last_rss_domain:
-                            candidate_domain = _extract_domain(candidate)
+                            candidate_domain = self._image_domain(candidate)
                             if candidate_domain != self._last_rss_domain:
                                 # Perfect: not in history AND different domain
                                 image = candidate
@@ -398,7 +682,7 @@ class ImageQueue:
                         # Save for potential reuse if we can't find a non-duplicate
                         skipped_candidates.append((pool_name, candidate))
                         logger.debug(
-                            f"Skipping recent duplicate from {pool_name}: {self._get_image_key(candidate)}"
+                            f"Skipping recent duplicate from {pool_name}: {self._image_key(candidate)}"
                         )
                 
                 if image is not None:
@@ -412,7 +696,7 @@ class ImageQueue:
             if image is None and skipped_candidates:
                 pool_name, image = skipped_candidates[0]
                 logger.warning(
-                    f"Could not find non-duplicate, using: {self._get_image_key(image)} from {pool_name}"
+                    f"Could not find non-duplicate, using: {self._image_key(image)} from {pool_name}"
                 )
             
             # Put back any unused skipped candidates to their respective queues
@@ -431,7 +715,7 @@ class ImageQueue:
             
             self._current_image = image
             self._current_index += 1
-            self._history.append(image)
+            self._record_history(image)
             
             # Track source type for stats and domain diversity
             if image.source_type == ImageSourceType.FOLDER:
@@ -439,7 +723,7 @@ class ImageQueue:
             else:
                 self._rss_count += 1
                 # Track last RSS domain for diversity in future selections
-                self._last_rss_domain = _extract_domain(image)
+                self._last_rss_domain = self._image_domain(image)
             
             # Log with pool sizes for debugging
             local_pool_size = len(self._local_queue) + len(self._local_images)
@@ -463,7 +747,9 @@ class ImageQueue:
         if not self._local_queue:
             return None
         
-        return self._local_queue.popleft()
+        image = self._local_queue.popleft()
+        self._maybe_prepare_next_cycle('local')
+        return image
     
     def _get_from_rss_pool(self) -> Optional[ImageMetadata]:
         """Get next image from RSS pool, rebuilding if needed."""
@@ -476,7 +762,9 @@ class ImageQueue:
         if not self._rss_queue:
             return None
         
-        return self._rss_queue.popleft()
+        image = self._rss_queue.popleft()
+        self._maybe_prepare_next_cycle('rss')
+        return image
     
     def _get_from_combined_queue(self) -> Optional[ImageMetadata]:
         """Get next image from combined queue (backwards compatibility)."""
@@ -490,7 +778,9 @@ class ImageQueue:
         if not self._queue:
             return None
         
-        return self._queue.popleft()
+        image = self._queue.popleft()
+        self._maybe_prepare_next_cycle('combined')
+        return image
     
     def previous(self) -> Optional[ImageMetadata]:
         """
@@ -506,7 +796,7 @@ class ImageQueue:
                 return self._current_image
             
             # Remove current from history
-            self._history.pop()
+            self._pop_history()
             
             # FIX: Get previous ImageMetadata directly (O(1) instead of O(n) search)
             prev_image = self._history[-1]
@@ -584,6 +874,11 @@ class ImageQueue:
             preview_queue._images = list(self._images)
             preview_queue._queue = deque(self._queue)
             preview_queue._history = deque(self._history, maxlen=self.history_size)
+            preview_queue._history_keys = deque(self._history_keys, maxlen=self.history_size)
+            preview_queue._last_seen = dict(self._last_seen)
+            preview_queue._history_seq = self._history_seq
+            # Read-only for the preview; it never adds or removes images.
+            preview_queue._image_info = self._image_info
             preview_queue._current_image = self._current_image
             preview_queue._current_index = self._current_index
             preview_queue._wrap_count = self._wrap_count
@@ -591,6 +886,11 @@ class ImageQueue:
             preview_queue._rss_count = self._rss_count
             preview_queue._last_rss_domain = self._last_rss_domain
             preview_queue._rng.setstate(self._rng.getstate())
+            # No thread manager on the preview: pending cycles are rebuilt
+            # inline from their seeds, matching what the live queue will get.
+            preview_queue._generation = self._generation
+            preview_queue._next_cycles = {name: deque(cycle) for name, cycle in self._next_cycles.items()}
+            preview_queue._reshuffle_seeds = dict(self._reshuffle_seeds)
 
         upcoming: List[ImageMetadata] = []
         for _ in range(count):
@@ -602,20 +902,7 @@ class ImageQueue:
     
     def _rebuild_queue(self) -> None:
         """Rebuild queue from original image list."""
-        if not self._images:
-            return
-        
-        # Start with all images
-        if self.shuffle_enabled:
-            # Shuffle
-            shuffled = self._images.copy()
-            self._rng.shuffle(shuffled)
-            self._queue.extend(shuffled)
-        else:
-            # Keep original order
-            self._queue.extend(self._images)
-        
-        logger.debug(f"Queue rebuilt with {len(self._queue)} images")
+        self._rebuild_pool('combined')
     
     def shuffle(self) -> None:
         """Shuffle current queue (thread-safe)."""
@@ -645,6 +932,7 @@ class ImageQueue:
                 return
             
             self.shuffle_enabled = enabled
+            self._invalidate_cycles()
             logger.info(f"Shuffle {'enabled' if enabled else 'disabled'}")
             
             # Rebuild queue with new shuffle setting
@@ -674,6 +962,11 @@ class ImageQueue:
             self._images.clear()
             self._queue.clear()
             self._history.clear()
+            self._history_keys.clear()
+            self._last_seen.clear()
+            self._history_seq = 0
+            self._image_info.clear()
+            self._invalidate_cycles()
             self._current_image = None
             self._current_index = -1
             self._wrap_count = 0
@@ -823,6 +1116,8 @@ class ImageQueue:
             for i, img in enumerate(self._images):
                 if str(img.local_path) == image_path:
                     self._images.pop(i)
+                    self._image_info.pop(id(img), None)
+                    self._invalidate_cycles()
                     removed_from_list = True
                     break
             
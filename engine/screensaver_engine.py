@@ -20,6 +20,7 @@ State Management:
         RUNNING -> REINITIALIZING -> RUNNING (for settings changes)
         Any state -> SHUTTING_DOWN (terminal)
 """
+import functools
 import threading
 import weakref
 import random
@@ -32,12 +33,14 @@ from PySide6.QtGui import QPixmap, QImage
 from core.events import EventSystem
 from core.resources import ResourceManager
 from core.threading import ThreadManager
+from core.threading.manager import TaskPriority
 from core.animation import AnimationManager
 from core.settings import SettingsManager
 from core.logging.logger import get_logger
 from core.process.types import WorkerType
 from core.process.supervisor import ProcessSupervisor
 from core.process.workers import (
+    audio_analysis_worker_main,
     image_worker_main,
     rss_worker_main,
     transition_worker_main,
@@ -62,10 +65,36 @@ from core.settings.capability_activation import (
     normalize_transition_capability_state,
 )
 from utils.image_cache import ImageCache
+from utils.scaled_image_disk_cache import ScaledImageDiskCache
 from utils.image_prefetcher import ImagePrefetcher
+from utils.prefetch_planner import PrefetchPlanner, create_prefetch_planner
 
 logger = get_logger(__name__)
 
+# Warm folder rescans only stat each indexed directory, so they are cheap
+# enough to pick up new and deleted files every few minutes.
+FOLDER_RESCAN_INTERVAL_MS = 10 * 60_000
+
+
+def _create_scaled_disk_cache(
+    settings_manager: SettingsManager,
+    thread_manager: Optional[ThreadManager],
+) -> Optional[ScaledImageDiskCache]:
+    """Build the persistent L2 tier for scaled images (None when disabled)."""
+    configured_mb = int(settings_manager.get('cache.disk_cache_mb', 1024))
+    disk_mb = max(0, min(8192, configured_mb))
+    if disk_mb <= 0:
+        logger.info("[CACHE] Disk image cache disabled")
+        return None
+    submit = None
+    if thread_manager is not None:
+        submit = functools.partial(
+            thread_manager.submit_io_task,
+            priority=TaskPriority.LOW,
+            category="cache.l2_persist",
+        )
+    return ScaledImageDiskCache(max_bytes=disk_mb * 1024 * 1024, submit=submit)
+
 
 class EngineState(Enum):
     """Engine lifecycle states.
@@ -203,9 +232,13 @@ class ScreensaverEngine(QObject):
         self._image_cache: Optional[ImageCache] = None
         self._prefetcher: Optional[ImagePrefetcher] = None
         self._prefetch_ahead: int = 5
+        self._prefetch_planner: Optional[PrefetchPlanner] = None
         # Background RSS refresh
         self._rss_refresh_timer: Optional[QTimer] = None
         self._rss_merge_lock = threading.Lock()
+        # Background folder rescans; the lock keeps them off the startup stream
+        self._folder_rescan_timer: Optional[QTimer] = None
+        self._folder_scan_lock = threading.Lock()
         
         # Process Supervisor for multiprocessing workers
         self._process_supervisor: Optional[ProcessSupervisor] = None
@@ -393,6 +426,7 @@ class ScreensaverEngine(QObject):
 
             # Enable background RSS refresh if applicable
             self._start_rss_background_refresh_if_needed()
+            self._start_folder_rescan_if_needed()
             
             # Start multiprocessing workers (non-blocking, fallback if workers fail)
             self._start_workers()
@@ -471,7 +505,8 @@ class ScreensaverEngine(QObject):
             self._process_supervisor.register_worker_factory(WorkerType.IMAGE, image_worker_main)
             self._process_supervisor.register_worker_factory(WorkerType.RSS, rss_worker_main)
             self._process_supervisor.register_worker_factory(WorkerType.TRANSITION, transition_worker_main)
-            logger.info("ProcessSupervisor initialized with 3 worker factories")
+            self._process_supervisor.register_worker_factory(WorkerType.AUDIO, audio_analysis_worker_main)
+            logger.info("ProcessSupervisor initialized with 4 worker factories")
             
             logger.info("Core systems initialized successfully")
             return True
@@ -578,24 +613,18 @@ class ScreensaverEngine(QObject):
                 history_size=history_size,
                 local_ratio=local_ratio
             )
+            # Next-cycle reshuffles of large pools run on the compute pool.
+            self.image_queue.set_thread_manager(self.thread_manager)
             
-            # Collect LOCAL images first (synchronous - fast)
-            local_images: List[ImageMetadata] = []
-            for folder_source in self.folder_sources:
-                try:
-                    images = folder_source.get_images()
-                    local_images.extend(images)
-                    logger.info(f"Added {len(images)} images from {folder_source.folder_path}")
-                except Exception as e:
-                    logger.warning(f"[FALLBACK] Failed to get images from folder source: {e}")
+            # Stream LOCAL images in from the IO pool; only the first scan
+            # batch is waited for, the rest is spliced in behind it.
+            local_count = self._stream_folder_sources()
             
-            # Add local images to queue immediately
-            if local_images:
-                count = self.image_queue.add_images(local_images)
-                logger.info(f"Queue initialized with {count} local images")
+            if local_count:
+                logger.info(f"Queue initialized with {local_count} local images")
             
             # If we have no local images and no RSS sources at all, fail
-            if not local_images and not self.rss_coordinator:
+            if not local_count and not self.rss_coordinator:
                 logger.error("No images found from any source")
                 self.error_occurred.emit("No images found")
                 return False
@@ -646,6 +675,110 @@ class ScreensaverEngine(QObject):
             logger.exception(f"Image queue build failed: {e}")
             return False
     
+    def _stream_folder_sources(self) -> int:
+        """Feed folder-source scan batches into the image queue.
+        
+        The scan runs as an IO task that ingests each batch as soon as the
+        folder index yields it. This blocks only until the first batch is
+        queued (or every source turned out empty) and returns the number of
+        images queued by then; later batches keep arriving in the background.
+        """
+        queue = self.image_queue
+        sources = list(self.folder_sources)
+        if queue is None or not sources:
+            return 0
+        first_batch = threading.Event()
+        
+        def _stream() -> int:
+            total = 0
+            try:
+                with self._folder_scan_lock:
+                    for folder_source in sources:
+                        added = 0
+                        try:
+                            for batch in folder_source.iter_image_batches():
+                                if self._shutting_down or self.image_queue is not queue:
+                                    return total
+                                added += queue.ingest(batch)
+                                total += len(batch)
+                                first_batch.set()
+                        except Exception as e:
+                            logger.warning(f"[FALLBACK] Failed to get images from folder source: {e}")
+                        logger.info(f"Added {added} images from {folder_source.folder_path}")
+            finally:
+                first_batch.set()
+            return total
+        
+        submitted = False
+        if self.thread_manager is not None:
+            try:
+                self.thread_manager.submit_io_task(
+                    _stream,
+                    priority=TaskPriority.HIGH,
+                    category="sources.folder_scan",
+                )
+                submitted = True
+            except Exception as e:
+                logger.warning(f"[FALLBACK] Folder scan submit failed, scanning inline: {e}")
+        if submitted:
+            first_batch.wait()
+        else:
+            _stream()
+        return queue.total_images()
+    
+    def _start_folder_rescan_if_needed(self) -> None:
+        """Schedule periodic warm rescans of the folder sources."""
+        if not self.thread_manager or self._folder_rescan_timer is not None:
+            return
+        try:
+            self._folder_rescan_timer = self.thread_manager.schedule_recurring(
+                FOLDER_RESCAN_INTERVAL_MS,
+                self._rescan_folder_sources,
+            )
+            logger.info("Background folder rescan enabled (interval=%dms)", FOLDER_RESCAN_INTERVAL_MS)
+        except Exception as e:
+            logger.debug(f"Background folder rescan scheduling failed: {e}")
+            self._folder_rescan_timer = None
+    
+    def _rescan_folder_sources(self) -> None:
+        """Apply folder changes to the live queue (UI-thread timer tick).
+        
+        Each source runs a warm refresh_delta() on the IO pool (only
+        directories whose mtime moved are listed again) and the delta is
+        applied in place, so new, deleted and rewritten files show up
+        without rebuilding the queue or losing history.
+        """
+        if not self._running or not self.thread_manager:
+            return
+        queue = self.image_queue
+        sources = list(self.folder_sources)
+        if queue is None or not sources:
+            return
+        
+        def _rescan() -> None:
+            # Skip the tick while the startup stream or a previous rescan
+            # still owns the sources.
+            if not self._folder_scan_lock.acquire(blocking=False):
+                return
+            try:
+                for folder_source in sources:
+                    if self._shutting_down or self.image_queue is not queue:
+                        return
+                    delta = folder_source.refresh_delta()
+                    if delta:
+                        queue.apply_delta(delta.added, delta.removed)
+            finally:
+                self._folder_scan_lock.release()
+        
+        try:
+            self.thread_manager.submit_io_task(
+                _rescan,
+                priority=TaskPriority.LOW,
+                category="sources.folder_rescan",
+            )
+        except Exception as e:
+            logger.debug(f"Background folder rescan submit failed: {e}")
+    
     def _load_rss_images_async(self) -> None:
         """Delegates to engine.engine_rss."""
         from engine.engine_rss import load_rss_images_async
@@ -709,9 +842,19 @@ class ScreensaverEngine(QObject):
                     max_conc,
                 )
             self._image_cache = ImageCache(max_items=max_items, max_memory_mb=max_mem_mb)
+            disk_tier = _create_scaled_disk_cache(self.settings_manager, self.thread_manager)
+            if disk_tier is not None:
+                self._image_cache.attach_disk_tier(disk_tier)
             if self.thread_manager:
-                self._prefetcher = ImagePrefetcher(self.thread_manager, self._image_cache, max_concurrent=max_conc)
-            logger.info(f"Image prefetcher initialized (ahead={self._prefetch_ahead}, max_concurrent={max_conc})")
+                # cache.prefetch_ahead caps the depth the planner may choose.
+                self._prefetch_planner = create_prefetch_planner(self._prefetch_ahead)
+                self._prefetcher = ImagePrefetcher(
+                    self.thread_manager,
+                    self._image_cache,
+                    max_concurrent=max_conc,
+                    planner=self._prefetch_planner,
+                )
+            logger.info(f"Image prefetcher initialized (ahead<={self._prefetch_ahead}, max_concurrent={max_conc})")
         except Exception as e:
             logger.debug(f"Prefetcher init failed: {e}")
 
@@ -1037,19 +1180,20 @@ class ScreensaverEngine(QObject):
         workers_started = 0
         workers_failed = 0
         
-        # Priority order: Image only
+        # Priority order: Image, then the opt-in visualizer audio analysis
         # FFT worker removed (deprecated, inline FFT used instead)
         # RSS and Transition workers use ThreadManager
         worker_configs = [
-            (WorkerType.IMAGE, 'workers.image.enabled', "ImageWorker", "ThreadManager fallback"),
+            (WorkerType.IMAGE, 'workers.image.enabled', True, "ImageWorker", "ThreadManager fallback"),
+            (WorkerType.AUDIO, 'workers.audio.enabled', False, "AudioAnalysisWorker", "in-process visualizer compute"),
         ]
         
-        for worker_type, setting_key, name, fallback_msg in worker_configs:
+        for worker_type, setting_key, default_enabled, name, fallback_msg in worker_configs:
             if workers_started >= max_workers:
                 logger.debug(f"{name} skipped - max_workers limit reached ({max_workers})")
                 continue
                 
-            if self.settings_manager.get(setting_key, True):
+            if self.settings_manager.get(setting_key, default_enabled):
                 if self._process_supervisor.start(worker_type):
                     logger.info(f"{name} started successfully")
                     workers_started += 1
@@ -42,10 +42,9 @@ from core.build_profile import (
 from core.source_head import log_source_head
 from core.settings.settings_manager import SettingsManager
 from core.settings.persistence import flush_and_close_settings_persistence
-from core.animation import AnimationManager
-from engine.screensaver_engine import ScreensaverEngine
-from ui.settings_dialog import SettingsDialog
-from ui.system_tray import ScreensaverTrayIcon
+# The engine, settings dialog and tray are imported inside run_screensaver /
+# run_config: /s is launched fresh on every idle timeout and should not pay
+# for the settings UI.  tools/startup_import_report.py tracks the budget.
 from versioning import APP_VERSION, APP_EXE_NAME
 
 logger = get_logger(__name__)
@@ -404,6 +403,8 @@ def run_screensaver(app: QApplication, *, usage_enabled: bool = False) -> int:
         return run_config(app)
     # Create and start screensaver engine
     try:
+        from engine.screensaver_engine import ScreensaverEngine
+
         engine = ScreensaverEngine()
         if not engine.initialize():
             logger.error("Failed to initialize screensaver engine")
@@ -493,6 +494,8 @@ def run_screensaver(app: QApplication, *, usage_enabled: bool = False) -> int:
         tray_icon = None
         if interaction_mode_enabled:
             try:
+                from ui.system_tray import ScreensaverTrayIcon
+
                 tray_icon = ScreensaverTrayIcon(app, app.windowIcon())
             except Exception:
                 logger.debug("Failed to create system tray icon", exc_info=True)
@@ -554,11 +557,15 @@ def run_config(app: QApplication) -> int:
     # Create settings manager
     settings = SettingsManager()
     
+    from core.animation import AnimationManager
+
     # Create animation manager
     animations = AnimationManager(owner="settings:config")
     
     # Create and show settings dialog
     try:
+        from ui.settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(settings, animations)
         dialog.show()
         
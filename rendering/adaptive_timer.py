@@ -13,12 +13,12 @@ from __future__ import annotations
 
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass, field, asdict
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Optional
 
 from core.logging.logger import get_logger, is_perf_metrics_enabled
+from core.performance.metrics_registry import Histogram, get_metrics_registry
 from core.threading.manager import ThreadManager, ThreadPoolType
 from core.resources.manager import ResourceManager
 from utils.lockfree.spsc_queue import SPSCQueue
@@ -38,7 +38,6 @@ _PENDING_UPDATE_LOG_AFTER_MS = 250.0
 _PENDING_UPDATE_LOG_INTERVAL_MS = 1000.0
 _DEADLINE_SLEEP_CAP_S = 0.004
 _DEADLINE_YIELD_WINDOW_S = 0.00075
-_DELIVERY_SAMPLE_WINDOW = 4096
 _DELIVERY_ACTIVE_SAMPLE_INTERVAL_S = 0.100
 
 
@@ -49,13 +48,22 @@ def _safe_attr(widget, name: str, default=None):
         return default
 
 
-def _delivery_deque(widget, name: str):
-    """Return one bounded perf-only delivery sample deque owned by the compositor."""
+def _delivery_histogram(widget, name: str) -> Histogram:
+    """Return one perf-only delivery latency histogram owned by the compositor.
+
+    The histogram's window is the transition-local attribution window; its
+    cumulative view is exported through the metrics registry per screen.
+    """
     samples = _safe_attr(widget, name)
-    if not isinstance(samples, deque):
-        samples = deque(maxlen=_DELIVERY_SAMPLE_WINDOW)
+    if not isinstance(samples, Histogram):
+        samples = Histogram()
         try:
             setattr(widget, name, samples)
+            get_metrics_registry().attach(
+                name[len("_srpss_"):],
+                samples,
+                labels={"screen": _delivery_screen(widget)},
+            )
         except Exception:
             pass
     return samples
@@ -94,7 +102,7 @@ def _reset_delivery_perf_window(widget) -> None:
             "_srpss_delivery_paint_active_ms",
             "_srpss_delivery_paint_inactive_ms",
         ):
-            setattr(widget, name, deque(maxlen=_DELIVERY_SAMPLE_WINDOW))
+            _delivery_histogram(widget, name).reset_window()
     except Exception:
         # Diagnostics must never become a delivery failure source.
         pass
@@ -166,7 +174,7 @@ def _record_delivery_wake(
         wake_late_ms = None
         if isinstance(deadline_ts, (int, float)) and deadline_ts > 0.0:
             wake_late_ms = max(0.0, (time.perf_counter() - float(deadline_ts)) * 1000.0)
-            _delivery_deque(widget, "_srpss_delivery_wake_late_ms").append(wake_late_ms)
+            _delivery_histogram(widget, "_srpss_delivery_wake_late_ms").record(wake_late_ms)
         setattr(widget, "_srpss_timer_last_wake_late_ms", wake_late_ms)
     except Exception:
         pass
@@ -221,36 +229,26 @@ def _record_delivery_paint_start(widget, paint_start_ts: float) -> None:
             )
             return
         paint_pending_ms = max(0.0, (float(paint_start_ts) - dispatched_ts) * 1000.0)
-        _delivery_deque(widget, "_srpss_delivery_paint_pending_ms").append(paint_pending_ms)
+        _delivery_histogram(widget, "_srpss_delivery_paint_pending_ms").record(paint_pending_ms)
         active = _safe_attr(widget, "_srpss_timer_window_active_at_dispatch", None)
         if active is True:
-            _delivery_deque(widget, "_srpss_delivery_paint_active_ms").append(paint_pending_ms)
+            _delivery_histogram(widget, "_srpss_delivery_paint_active_ms").record(paint_pending_ms)
         elif active is False:
-            _delivery_deque(widget, "_srpss_delivery_paint_inactive_ms").append(paint_pending_ms)
+            _delivery_histogram(widget, "_srpss_delivery_paint_inactive_ms").record(paint_pending_ms)
     except Exception:
         pass
 
 
-def _delivery_percentile(values, percentile: float) -> float:
-    samples = [float(value) for value in values if isinstance(value, (int, float))]
-    if not samples:
-        return 0.0
-    samples.sort()
-    index = min(
-        len(samples) - 1,
-        max(0, int(round((len(samples) - 1) * float(percentile)))),
-    )
-    return samples[index]
-
-
 def _delivery_stats(widget, name: str) -> tuple[int, float, float, float]:
-    values = list(_safe_attr(widget, name, ()) or ())
-    numeric = [float(value) for value in values if isinstance(value, (int, float))]
+    samples = _safe_attr(widget, name)
+    if not isinstance(samples, Histogram):
+        return 0, 0.0, 0.0, 0.0
+    window = samples.window(reset=False)
     return (
-        len(numeric),
-        _delivery_percentile(numeric, 0.50),
-        _delivery_percentile(numeric, 0.95),
-        max(numeric, default=0.0),
+        window.count,
+        window.quantile(0.50),
+        window.quantile(0.95),
+        window.max,
     )
 
 
@@ -430,12 +428,12 @@ def _mark_widget_update_dispatched(widget) -> None:
         pending_since = float(_safe_attr(widget, "_srpss_timer_update_pending_since", 0.0) or 0.0)
         if pending_since > 0.0:
             dispatch_ms = max(0.0, (now - pending_since) * 1000.0)
-            _delivery_deque(widget, "_srpss_delivery_dispatch_ms").append(dispatch_ms)
+            _delivery_histogram(widget, "_srpss_delivery_dispatch_ms").record(dispatch_ms)
             active = _record_delivery_window_active(widget, now)
             if active is True:
-                _delivery_deque(widget, "_srpss_delivery_dispatch_active_ms").append(dispatch_ms)
+                _delivery_histogram(widget, "_srpss_delivery_dispatch_active_ms").record(dispatch_ms)
             elif active is False:
-                _delivery_deque(widget, "_srpss_delivery_dispatch_inactive_ms").append(dispatch_ms)
+                _delivery_histogram(widget, "_srpss_delivery_dispatch_inactive_ms").record(dispatch_ms)
             setattr(widget, "_srpss_timer_window_active_at_dispatch", active)
         setattr(widget, "_srpss_timer_dispatch_timing_unknown", False)
         setattr(widget, "_srpss_timer_update_dispatched_ts", now)
@@ -532,7 +530,7 @@ def _queue_safe_widget_update(widget) -> bool:
                 setattr(widget, "_srpss_timer_last_skip_stage", "dispatch")
                 age_ms = _pending_widget_update_age_ms(widget)
                 if age_ms is not None:
-                    _delivery_deque(widget, "_srpss_delivery_dispatch_skip_age_ms").append(age_ms)
+                    _delivery_histogram(widget, "_srpss_delivery_dispatch_skip_age_ms").record(age_ms)
             return False
         # Passive only: a long-unpainted request is still worth reporting, but
         # it cannot change what happens next.
@@ -1,44 +1,242 @@
-"""Software renderer backend placeholder."""
+"""Software renderer backend.
+
+Renders transitions on the CPU with the NumPy kernels in
+``rendering.backends.software.transition_engine`` for hosts without a usable
+GL context (RDP sessions, VMs, kiosks).  Frames are rendered into a
+double-buffered RGBA surface at an adaptive internal resolution; the
+presenter callback (usually the DisplayWidget) scales the front buffer to
+the screen.
+"""
 
 from __future__ import annotations
 
+import time
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
 from core.logging.logger import get_logger
 
-from ..base import BackendCapabilities, RenderSurface, RendererBackend, SurfaceDescriptor, TransitionPipeline
+from ..base import (
+    BackendCapabilities,
+    RenderSurface,
+    RendererBackend,
+    SurfaceDescriptor,
+    TransitionPipeline,
+    TransitionRenderPacket,
+)
+from .transition_engine import (
+    TRANSITION_KERNELS,
+    AdaptiveRenderScale,
+    FrameBuffers,
+    resample_frame,
+    resolve_kernel_name,
+    to_rgba_array,
+)
 
 logger = get_logger(__name__)
 
+Presenter = Callable[[np.ndarray], None]
+
 
 class SoftwareRenderSurface(RenderSurface):
+    """Double-buffered RGBA frame store at ``logical size * render scale``."""
+
+    def __init__(self, descriptor: SurfaceDescriptor) -> None:
+        super().__init__(descriptor)
+        self._logical_size: Tuple[int, int] = (max(1, descriptor.width), max(1, descriptor.height))
+        self._render_scale = 1.0
+        self._frames: List[np.ndarray] = []
+        self._back_index = 0
+        self._presenter: Optional[Presenter] = None
+        self.frames_presented = 0
+
+    # ------------------------------------------------------------------
+    # Geometry
+    # ------------------------------------------------------------------
+
+    @property
+    def render_scale(self) -> float:
+        return self._render_scale
+
+    @property
+    def render_size(self) -> Tuple[int, int]:
+        width, height = self._logical_size
+        scale = self._render_scale
+        return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+    def set_render_scale(self, scale: float) -> None:
+        scale = min(1.0, max(0.1, float(scale)))
+        if scale != self._render_scale:
+            self._render_scale = scale
+            self._frames = []
+            logger.debug("[SOFTWARE] Render scale -> %.3f (%sx%s)", scale, *self.render_size)
+
     def resize(self, width: int, height: int, dpi: float) -> None:  # type: ignore[override]
         logger.debug("SoftwareRenderSurface.resize -> %sx%s (dpi=%s)", width, height, dpi)
+        size = (max(1, int(width)), max(1, int(height)))
+        if size != self._logical_size:
+            self._logical_size = size
+            self._frames = []
+
+    # ------------------------------------------------------------------
+    # Frame lifecycle
+    # ------------------------------------------------------------------
+
+    def set_presenter(self, presenter: Optional[Presenter]) -> None:
+        """Install the callback that receives each presented front buffer."""
+        self._presenter = presenter
+
+    @property
+    def back_buffer(self) -> np.ndarray:
+        self._ensure_frames()
+        return self._frames[self._back_index]
+
+    @property
+    def front_buffer(self) -> Optional[np.ndarray]:
+        if not self._frames:
+            return None
+        return self._frames[self._back_index ^ 1]
 
     def begin_frame(self) -> None:  # type: ignore[override]
-        logger.debug("SoftwareRenderSurface.begin_frame (noop)")
+        self._ensure_frames()
 
     def end_frame(self) -> None:  # type: ignore[override]
-        logger.debug("SoftwareRenderSurface.end_frame (noop)")
+        self._back_index ^= 1
 
     def present(self) -> None:  # type: ignore[override]
-        logger.debug("SoftwareRenderSurface.present (noop)")
+        front = self.front_buffer
+        if front is None:
+            return
+        self.frames_presented += 1
+        if self._presenter is not None:
+            try:
+                self._presenter(front)
+            except Exception:
+                logger.debug("[SOFTWARE] Presenter failed", exc_info=True)
+
+    def to_qimage(self):
+        """Wrap the front buffer as a ``Format_RGBA8888`` QImage (no copy).
+
+        The QImage borrows the surface's memory and is only valid until the
+        next ``end_frame``/``resize``; ``.copy()`` it to keep it.
+        """
+        from PySide6.QtGui import QImage
+
+        front = self.front_buffer
+        if front is None:
+            return QImage()
+        height, width = front.shape[:2]
+        return QImage(front.data, width, height, width * 4, QImage.Format.Format_RGBA8888)
 
     def shutdown(self) -> None:  # type: ignore[override]
-        logger.debug("SoftwareRenderSurface.shutdown (noop)")
+        logger.debug("SoftwareRenderSurface.shutdown")
+        self._frames = []
+        self._presenter = None
+
+    def _ensure_frames(self) -> None:
+        if self._frames:
+            return
+        width, height = self.render_size
+        self._frames = [np.zeros((height, width, 4), dtype=np.uint8) for _ in range(2)]
+        self._back_index = 0
 
 
 class SoftwareTransitionPipeline(TransitionPipeline):
-    def upload_assets(self, packet) -> None:  # type: ignore[override]
-        logger.debug("SoftwareTransitionPipeline.upload_assets (noop)")
+    """Drives one CPU transition kernel into a :class:`SoftwareRenderSurface`."""
 
-    def render(self, packet) -> None:  # type: ignore[override]
-        logger.debug("SoftwareTransitionPipeline.render (noop)")
+    def __init__(self, transition_name: str = "crossfade", *, target_fps: float = 60.0) -> None:
+        self.transition_name = transition_name
+        self.kernel_name = resolve_kernel_name(transition_name)
+        self._kernel = TRANSITION_KERNELS[self.kernel_name]
+        self._surface: Optional[SoftwareRenderSurface] = None
+        self._scale = AdaptiveRenderScale(target_fps=target_fps)
+        self._source_ids: Tuple[int, int] = (0, 0)
+        self._sources: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._frames: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._buffers: Optional[FrameBuffers] = None
+        self.frames_rendered = 0
+        self.last_render_ms = 0.0
+
+    def attach_surface(self, surface: SoftwareRenderSurface) -> None:
+        self._surface = surface
+        surface.set_render_scale(self._scale.scale)
+
+    @property
+    def render_scale(self) -> float:
+        return self._scale.scale
+
+    def upload_assets(self, packet: TransitionRenderPacket) -> None:  # type: ignore[override]
+        new = to_rgba_array(packet.new_texture)
+        if packet.old_texture is None:
+            old = np.zeros_like(new)
+            old[..., 3] = 255
+        else:
+            old = to_rgba_array(packet.old_texture)
+        self._sources = (old, new)
+        self._source_ids = (id(packet.old_texture), id(packet.new_texture))
+        self._frames = None
+        logger.debug(
+            "[SOFTWARE] %s assets: old=%sx%s new=%sx%s",
+            self.kernel_name,
+            old.shape[1],
+            old.shape[0],
+            new.shape[1],
+            new.shape[0],
+        )
+
+    def render(self, packet: TransitionRenderPacket) -> None:  # type: ignore[override]
+        surface = self._surface
+        if surface is None:
+            logger.debug("SoftwareTransitionPipeline.render without a surface; skipping")
+            return
+        if self._sources is None or self._source_ids != (id(packet.old_texture), id(packet.new_texture)):
+            self.upload_assets(packet)
+
+        start = time.perf_counter()
+        surface.begin_frame()
+        target = surface.back_buffer
+        old, new = self._frames_for(target.shape[1], target.shape[0])
+        progress = min(1.0, max(0.0, float(packet.progress)))
+        self._kernel(old, new, target, progress, packet.parameters or {}, self._buffers)  # type: ignore[arg-type]
+        surface.end_frame()
+        self.last_render_ms = (time.perf_counter() - start) * 1000.0
+        surface.present()
+        self.frames_rendered += 1
+
+        if self._scale.record(self.last_render_ms):
+            logger.info(
+                "[SOFTWARE] %s render scale -> %.3f (%.2fms/frame at %sx%s)",
+                self.kernel_name,
+                self._scale.scale,
+                self.last_render_ms,
+                target.shape[1],
+                target.shape[0],
+            )
+            surface.set_render_scale(self._scale.scale)
 
     def cleanup(self) -> None:  # type: ignore[override]
-        logger.debug("SoftwareTransitionPipeline.cleanup (noop)")
+        logger.debug("SoftwareTransitionPipeline.cleanup (%s, %d frames)", self.kernel_name, self.frames_rendered)
+        self._sources = None
+        self._frames = None
+        self._buffers = None
+        self._surface = None
+
+    def _frames_for(self, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Old/new frames resampled to the render size (cached per size)."""
+        frames = self._frames
+        if frames is None or frames[0].shape[:2] != (height, width):
+            assert self._sources is not None
+            old, new = self._sources
+            frames = (resample_frame(old, width, height), resample_frame(new, width, height))
+            self._frames = frames
+        if self._buffers is None or self._buffers.size != (width, height):
+            self._buffers = FrameBuffers(width, height)
+        return frames
 
 
 class SoftwareRendererBackend(RendererBackend):
-    """Fallback renderer relying on existing CPU transition pipeline."""
+    """Fallback renderer that runs transitions as NumPy kernels on the CPU."""
 
     def initialize(self) -> None:  # type: ignore[override]
         logger.info("Using software renderer backend")
@@ -53,8 +251,13 @@ class SoftwareRendererBackend(RendererBackend):
         surface.shutdown()
 
     def create_transition_pipeline(self, transition_name: str) -> TransitionPipeline:  # type: ignore[override]
-        logger.debug("SoftwareRendererBackend.create_transition_pipeline -> %s", transition_name)
-        return SoftwareTransitionPipeline()
+        pipeline = SoftwareTransitionPipeline(transition_name)
+        logger.debug(
+            "SoftwareRendererBackend.create_transition_pipeline -> %s (kernel=%s)",
+            transition_name,
+            pipeline.kernel_name,
+        )
+        return pipeline
 
     def release_transition_pipeline(self, pipeline: TransitionPipeline) -> None:  # type: ignore[override]
         pipeline.cleanup()
@@ -0,0 +1,589 @@
+"""Vectorised CPU transition engine for the software renderer backend.
+
+Every transition is a NumPy kernel over ``(H, W, 4)`` uint8 RGBA frames that
+writes into a caller-owned output buffer.  Kernels mirror the GLSL programs in
+``rendering.gl_programs`` closely enough that a host without usable GL (RDP,
+VMs, kiosks) sees the same transition family, only rendered on the CPU.
+
+Blending is ``old + ((new - old) * w) >> 7`` in int16 with a 7-bit weight:
+``new - old`` is computed once per frame pair and cached, so a blended frame
+costs three passes (multiply, shift, add-into-output).  Weights must keep
+the channel axis contiguous - a scalar, a ``(1, W, 4)`` row, an ``(H, 1, 1)``
+column or a full ``(H, W, 4)`` plane; ``(H, W, 1)`` broadcasting is several
+times slower in NumPy, so per-pixel weights are written as uint64 words
+holding the weight in all four 16-bit lanes and viewed as int16.  Hard-edged transitions (wipe, slide,
+block-flip) are slice copies and never touch the blend path.
+
+Scratch planes and per-resolution lookup tables live in
+:class:`FrameBuffers` and are reused until the render size changes;
+:class:`AdaptiveRenderScale` picks that size from measured frame times.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+try:
+    from PIL import Image  # type: ignore[import]
+
+    PILLOW_AVAILABLE = True
+except ImportError:  # pragma: no cover - environment dependent
+    PILLOW_AVAILABLE = False
+
+Frame = np.ndarray
+Kernel = Callable[[Frame, Frame, Frame, float, Mapping[str, Any], "FrameBuffers"], None]
+
+# 7-bit fixed point keeps (new - old) * w inside int16.
+WEIGHT_ONE = 128
+_WEIGHT_SHIFT = 7
+# Replicates a 16-bit value into all four lanes of a uint64.
+_LANE_SPLAT = np.uint64(0x0001000100010001)
+
+
+# ---------------------------------------------------------------------------
+# Buffers
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class FrameBuffers:
+    """Reusable scratch for one render resolution."""
+
+    width: int
+    height: int
+    scratch: np.ndarray = field(init=False, repr=False)
+    wide_weight: np.ndarray = field(init=False, repr=False)
+    # Per-resolution lookup tables keyed by (kind, *params)
+    tables: Dict[Tuple[Any, ...], Any] = field(init=False, repr=False)
+    _delta_key: Optional[Tuple[Frame, Frame]] = field(default=None, init=False, repr=False)
+    _delta: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        h, w = self.height, self.width
+        self.scratch = np.empty((h, w, 4), dtype=np.int16)
+        self.wide_weight = np.empty((h, w), dtype=np.uint64)
+        self.tables = {}
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return (self.width, self.height)
+
+    def nbytes(self) -> int:
+        arrays = [self.scratch, self.wide_weight]
+        if self._delta is not None:
+            arrays.append(self._delta)
+        return int(sum(a.nbytes for a in arrays))
+
+    def delta(self, old: Frame, new: Frame) -> np.ndarray:
+        """``new - old`` as int16, cached for the current frame pair."""
+        key = self._delta_key
+        if key is None or key[0] is not old or key[1] is not new:
+            if self._delta is None:
+                self._delta = np.empty((self.height, self.width, 4), dtype=np.int16)
+            np.subtract(new, old, out=self._delta, dtype=np.int16)
+            self._delta_key = (old, new)
+        return self._delta  # type: ignore[return-value]
+
+    def release_frames(self) -> None:
+        """Drop the cached delta (and the references to its frames)."""
+        self._delta_key = None
+        self._delta = None
+
+    def cell_tables(self, cols: int, rows: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Pixel -> cell index and 0..1 local coordinate, per axis."""
+        key = ("cells", cols, rows)
+        cached = self.tables.get(key)
+        if cached is None:
+            xs = (np.arange(self.width, dtype=np.float32) + 0.5) / self.width
+            ys = (np.arange(self.height, dtype=np.float32) + 0.5) / self.height
+            cell_x = np.minimum((xs * cols).astype(np.intp), cols - 1)
+            cell_y = np.minimum((ys * rows).astype(np.intp), rows - 1)
+            local_x = (xs * cols - cell_x).astype(np.float32)
+            local_y = (ys * rows - cell_y).astype(np.float32)
+            cached = (cell_x, cell_y, local_x, local_y)
+            self.tables[key] = cached
+        return cached
+
+    def cell_bounds(self, cols: int, rows: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Pixel edges of the grid: ``cols + 1`` x edges and ``rows + 1`` y edges."""
+        key = ("bounds", cols, rows)
+        cached = self.tables.get(key)
+        if cached is None:
+            cell_x, cell_y, _, _ = self.cell_tables(cols, rows)
+            cached = (
+                np.searchsorted(cell_x, np.arange(cols + 1)),
+                np.searchsorted(cell_y, np.arange(rows + 1)),
+            )
+            self.tables[key] = cached
+        return cached
+
+    def axis_tables(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Normalised pixel-centre coordinates, shaped ``(1, W)`` and ``(H, 1)``."""
+        cached = self.tables.get(("axis",))
+        if cached is None:
+            xs = ((np.arange(self.width, dtype=np.float32) + 0.5) / self.width)[None, :]
+            ys = ((np.arange(self.height, dtype=np.float32) + 0.5) / self.height)[:, None]
+            cached = (xs, ys)
+            self.tables[("axis",)] = cached
+        return cached
+
+
+def _blend_region(out: Frame, old: Frame, delta: np.ndarray, weight: Any, scratch: np.ndarray) -> None:
+    np.multiply(delta, weight, out=scratch)
+    np.right_shift(scratch, _WEIGHT_SHIFT, out=scratch)
+    np.add(scratch, old, out=out, casting="unsafe")
+
+
+def blend_into(out: Frame, old: Frame, new: Frame, weight: Any, buffers: FrameBuffers) -> None:
+    """``out = old + (new - old) * weight / 128`` (weight 0..128, see module doc)."""
+    _blend_region(out, old, buffers.delta(old, new), weight, buffers.scratch)
+
+
+def scalar_weight(t: float) -> np.int16:
+    return np.int16(int(min(1.0, max(0.0, t)) * WEIGHT_ONE + 0.5))
+
+
+def _to_fixed(weight: np.ndarray) -> np.ndarray:
+    """Quantise a 0..1 float weight to 0..128 in place (still float)."""
+    np.multiply(weight, float(WEIGHT_ONE), out=weight)
+    np.add(weight, 0.5, out=weight)
+    np.clip(weight, 0.0, float(WEIGHT_ONE), out=weight)
+    return weight
+
+
+def _band_weight(distance: np.ndarray, half: float, feather: float, floor: float) -> np.ndarray:
+    """Soft band mask, in place over *distance* (``|coord - 0.5|``).
+
+    Equals the GLSL ``smoothstep(left - f, left, c) * (1 - smoothstep(right,
+    right + f, c))`` for a band of half-width *half*, raised to *floor*.
+    """
+    x = distance
+    np.subtract(x, half, out=x)
+    np.multiply(x, 1.0 / feather, out=x)
+    np.clip(x, 0.0, 1.0, out=x)
+    # 1 - smoothstep(x) = 1 - x * x * (3 - 2x)
+    ramp = 3.0 - 2.0 * x
+    np.multiply(x, x, out=x)
+    np.multiply(x, ramp, out=x)
+    np.subtract(1.0, x, out=x)
+    np.maximum(x, floor, out=x)
+    return x
+
+
+def _smoothstep_scalar(edge0: float, edge1: float, x: float) -> float:
+    t = min(1.0, max(0.0, (x - edge0) / max(edge1 - edge0, 1e-6)))
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _hash1(n: np.ndarray) -> np.ndarray:
+    """The GLSL ``fract(sin(n) * 43758.5453123)`` hash, vectorised."""
+    value = np.sin(n) * 43758.5453123
+    return value - np.floor(value)
+
+
+def _direction_value(params: Mapping[str, Any], default: str) -> str:
+    value = params.get("direction", default)
+    if isinstance(value, Enum):
+        value = value.value
+    return str(value).lower()
+
+
+def _grid(params: Mapping[str, Any], default: Tuple[int, int]) -> Tuple[int, int]:
+    grid = params.get("grid", default)
+    try:
+        cols, rows = int(grid[0]), int(grid[1])
+    except Exception:
+        cols, rows = default
+    return max(1, cols), max(1, rows)
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+
+def render_crossfade(old: Frame, new: Frame, out: Frame, t: float, params: Mapping[str, Any], buffers: FrameBuffers) -> None:
+    blend_into(out, old, new, scalar_weight(t), buffers)
+
+
+def render_wipe(old: Frame, new: Frame, out: Frame, t: float, params: Mapping[str, Any], buffers: FrameBuffers) -> None:
+    """Hard-edged wipe; mirrors ``wipe_program`` modes 0..5."""
+    h, w = out.shape[:2]
+    direction = _direction_value(params, "left_to_right")
+    if direction in ("left_to_right", "right_to_left"):
+        edge = int(round(t * w))
+        split = edge if direction == "left_to_right" else w - edge
+        first, second = (new, old) if direction == "left_to_right" else (old, new)
+        out[:, :split] = first[:, :split]
+        out[:, split:] = second[:, split:]
+        return
+    if direction in ("top_to_bottom", "bottom_to_top"):
+        edge = int(round(t * h))
+        split = edge if direction == "top_to_bottom" else h - edge
+        first, second = (new, old) if direction == "top_to_bottom" else (old, new)
+        out[:split] = first[:split]
+        out[split:] = second[split:]
+        return
+
+    # Diagonal: pixel (x, y) is new when (x' + y) / 2 <= t, i.e. a per-row
+    # prefix (TL->BR) or suffix (TR->BL) of length ``counts[y]``.
+    _, ys = buffers.axis_tables()
+    limit = (2.0 * t - ys[:, 0]) * w - 0.5
+    counts = np.clip(np.floor(limit).astype(np.intp) + 1, 0, w)
+    prefix = direction != "diag_tr_bl"
+    for y, count in enumerate(counts.tolist()):
+        split = count if prefix else w - count
+        first, second = (new, old) if prefix else (old, new)
+        out[y, :split] = first[y, :split]
+        out[y, split:] = second[y, split:]
+
+
+_SLIDE_VECTORS: Dict[str, Tuple[int, int]] = {
+    # Direction the old image leaves towards; the new one arrives from the
+    # opposite side (see GLCompositorSlideTransition._calculate_positions).
+    "left": (-1, 0),
+    "right": (1, 0),
+    "up": (0, -1),
+    "down": (0, 1),
+    "diag_tl_br": (-1, -1),
+    "diag_tr_bl": (1, -1),
+}
+
+
+def _paste_shifted(out: Frame, src: Frame, dx: int, dy: int) -> None:
+    """Copy *src* into *out* translated by (dx, dy), clipping at the edges."""
+    h, w = out.shape[:2]
+    if abs(dx) >= w or abs(dy) >= h:
+        return
+    dst_x0, dst_y0 = max(0, dx), max(0, dy)
+    src_x0, src_y0 = max(0, -dx), max(0, -dy)
+    span_w, span_h = w - abs(dx), h - abs(dy)
+    out[dst_y0 : dst_y0 + span_h, dst_x0 : dst_x0 + span_w] = src[
+        src_y0 : src_y0 + span_h, src_x0 : src_x0 + span_w
+    ]
+
+
+def render_slide(old: Frame, new: Frame, out: Frame, t: float, params: Mapping[str, Any], buffers: FrameBuffers) -> None:
+    """Old image slides out while the new one slides in, on black."""
+    h, w = out.shape[:2]
+    vx, vy = _SLIDE_VECTORS.get(_direction_value(params, "left"), _SLIDE_VECTORS["left"])
+    old_dx, old_dy = int(round(vx * t * w)), int(round(vy * t * h))
+    new_dx, new_dy = old_dx - vx * w, old_dy - vy * h
+    if vx and vy:
+        # Diagonal slides uncover black corners; cardinal ones tile exactly.
+        out[...] = 0
+        out[..., 3] = 255
+    _paste_shifted(out, old, old_dx, old_dy)
+    # New always wins in the overlap, matching slide_program.
+    _paste_shifted(out, new, new_dx, new_dy)
+
+
+_BLINDS_DIRECTIONS = {"horizontal": 0, "vertical": 1, "diagonal": 2}
+
+
+def render_blinds(old: Frame, new: Frame, out: Frame, t: float, params: Mapping[str, Any], buffers: FrameBuffers) -> None:
+    """Bands grow from each cell's centre; mirrors ``blinds_program``."""
+    cols, rows = _grid(params, (12, 1))
+    feather = min(0.5, max(0.001, float(params.get("feather", 0.08))))
+    raw_direction = params.get("direction", 0)
+    if isinstance(raw_direction, str):
+        mode = _BLINDS_DIRECTIONS.get(raw_direction.lower(), 0)
+    else:
+        mode = int(raw_direction)
+    half = 0.5 * t
+    tail = _smoothstep_scalar(0.96, 1.0, t)
+
+    if mode == 2:
+        # Diagonal stripes: coord = fract((x + y) / 2 * bands).  x + y is
+        # constant along anti-diagonals, so evaluate the band once along a
+        # 1-D strip and give each row a window shifted by its y offset.
+        h, w = out.shape[:2]
+        key = ("diagonal_strip",)
+        strip = buffers.tables.get(key)
+        if strip is None:
+            offsets = np.rint((np.arange(h) + 0.5) * w / h).astype(np.intp)
+            positions = (np.arange(w + int(offsets[-1]), dtype=np.float32) + 0.5) / w
+            strip = (offsets.tolist(), positions)
+            buffers.tables[key] = strip
+        offsets, positions = strip
+        bands = max(1.0, (cols + rows) * 0.5)
+        coord = np.multiply(positions, 0.5 * bands)
+        np.subtract(coord, np.floor(coord), out=coord)
+        np.subtract(coord, 0.5, out=coord)
+        np.abs(coord, out=coord)
+        fixed = _to_fixed(_band_weight(coord, half, feather, tail)).astype(np.uint64)
+        np.multiply(fixed, _LANE_SPLAT, out=fixed)
+        wide = buffers.wide_weight
+        for y, offset in enumerate(offsets):
+            wide[y] = fixed[offset : offset + w]
+        blend_into(out, old, new, wide.view(np.int16).reshape(h, w, 4), buffers)
+        return
+
+    # Horizontal/vertical bands depend on one axis only, so the weight is a
+    # single (1, W, 4) row or (H, 1, 1) column.
+    _, _, local_x, local_y = buffers.cell_tables(cols, rows)
+    distance = np.abs((local_y if mode == 1 else local_x) - 0.5)
+    weight = _to_fixed(_band_weight(distance, half, feather, tail)).astype(np.int16)
+    if mode == 1:
+        shaped = weight[:, None, None]
+    else:
+        shaped = np.repeat(weight, 4).reshape(1, -1, 4)
+    blend_into(out, old, new, shaped, buffers)
+
+
+def render_diffuse(old: Frame, new: Frame, out: Frame, t: float, params: Mapping[str, Any], buffers: FrameBuffers) -> None:
+    """Per-block randomised dissolve; ``diffuse_program`` rectangle mode
+    without the 8% edge darkening."""
+    cols, rows = _grid(params, (24, 14))
+    key = ("diffuse", cols, rows)
+    thresholds = buffers.tables.get(key)
+    if thresholds is None:
+        index = np.arange(rows * cols, dtype=np.float64).reshape(rows, cols)
+        thresholds = np.minimum(np.power(_hash1(index * 37.0 + 13.0), 1.35), 1.0 - 0.18)
+        buffers.tables[key] = thresholds
+
+    # smoothstep(threshold, threshold + 0.18, t) per block
+    local = np.clip((t - thresholds) / 0.18, 0.0, 1.0)
+    cell_weight = (local * local * (3.0 - 2.0 * local) * WEIGHT_ONE + 0.5).astype(np.int16)
+
+    # One (1, W, 4) weight row per band of blocks.
+    cell_x, _, _, _ = buffers.cell_tables(cols, rows)
+    _, y_edges = buffers.cell_bounds(cols, rows)
+    row_weights = np.repeat(cell_weight[:, cell_x], 4, axis=1).reshape(rows, 1, -1, 4)
+    delta = buffers.delta(old, new)
+    scratch = buffers.scratch
+    for row in range(rows):
+        y0, y1 = int(y_edges[row]), int(y_edges[row + 1])
+        if y0 == y1:
+            continue
+        _blend_region(out[y0:y1], old[y0:y1], delta[y0:y1], row_weights[row], scratch[y0:y1])
+
+
+_BLOCKFLIP_VECTORS: Dict[str, Tuple[float, float]] = {
+    "left": (1.0, 0.0),
+    "right": (-1.0, 0.0),
+    "down": (0.0, 1.0),
+    "up": (0.0, -1.0),
+    "diag_tl_br": (1.0, 1.0),
+    "diag_tr_bl": (-1.0, 1.0),
+}
+
+
+def _blockflip_starts(cols: int, rows: int, dx: float, dy: float) -> np.ndarray:
+    """Per-block flip start times; the ``blockflip_program`` wavefront."""
+    col, row = np.meshgrid(np.arange(cols, dtype=np.float64), np.arange(rows, dtype=np.float64))
+    horizontal = abs(dx) >= abs(dy)
+    diagonal = abs(dx) > 1e-3 and abs(dy) > 1e-3
+    from_x = col if dx > 0 else (cols - 1.0 - col)
+    from_y = row if dy > 0 else (rows - 1.0 - row)
+
+    if diagonal:
+        base = (from_x + from_y) / max(1.0, (cols - 1.0) + (rows - 1.0))
+    elif horizontal:
+        base = from_x / (cols - 1.0) if cols > 1 else np.zeros_like(col)
+    else:
+        base = from_y / (rows - 1.0) if rows > 1 else np.zeros_like(row)
+
+    # Blocks near the centre of the orthogonal axis start slightly early so
+    # the wavefront forms a shallow arrow rather than a straight slit.
+    col_norm = col / (cols - 1.0) if cols > 1 else np.full_like(col, 0.5)
+    row_norm = row / (rows - 1.0) if rows > 1 else np.full_like(row, 0.5)
+    if diagonal:
+        ortho, bias, jitter = np.abs((col_norm - row_norm) * 0.5), 0.20, 0.16
+    elif horizontal:
+        ortho, bias, jitter = np.abs(row_norm - 0.5), 0.25, 0.18
+    else:
+        ortho, bias, jitter = np.abs(col_norm - 0.5), 0.32, 0.10
+    base = np.clip(base - (0.5 - ortho) * 2.0 * bias, 0.0, 1.0)
+
+    index = row * cols + col
+    base = np.clip(base + (_hash1(index * 91.0 + 7.0) - 0.5) * (jitter / max(cols, rows)), 0.0, 1.0)
+    return np.clip(base * 0.9, 0.0, 0.75)
+
+
+def render_blockflip(old: Frame, new: Frame, out: Frame, t: float, params: Mapping[str, Any], buffers: FrameBuffers) -> None:
+    """Blocks flip in a directional wave; mirrors ``blockflip_program``.
+
+    Each block reveals a hard-edged centred band of the new image, so the
+    frame is the old image (or its late crossfade tail) plus one rectangle
+    copy per block.
+    """
+    if t <= 0.0:
+        np.copyto(out, old)
+        return
+    if t >= 1.0:
+        np.copyto(out, new)
+        return
+
+    cols, rows = _grid(params, (16, 9))
+    direction = _direction_value(params, "left")
+    dx, dy = _BLOCKFLIP_VECTORS.get(direction, _BLOCKFLIP_VECTORS["left"])
+    key = ("blockflip", cols, rows, direction)
+    starts = buffers.tables.get(key)
+    if starts is None:
+        starts = _blockflip_starts(cols, rows, dx, dy)
+        buffers.tables[key] = starts
+
+    # Late global tail: pixels outside the bands fade to new.
+    tail = _smoothstep_scalar(0.92, 1.0, t)
+    if tail > 0.0:
+        blend_into(out, old, new, scalar_weight(tail), buffers)
+    else:
+        np.copyto(out, old)
+
+    # Eased band half-width per block: 0.5 * (0.5 - 0.5 * cos(pi * local)),
+    # converted to a pixel span [lo, hi) along the flip axis of each block.
+    local = np.clip((t - starts) / 0.25, 0.0, 1.0)
+    half_band = 0.25 - 0.25 * np.cos(local * np.pi)
+    horizontal = abs(dx) >= abs(dy)
+    h, w = out.shape[:2]
+    x_edges, y_edges = buffers.cell_bounds(cols, rows)
+    if horizontal:
+        cells, extent = np.arange(cols, dtype=np.float64)[None, :], w / cols
+    else:
+        cells, extent = np.arange(rows, dtype=np.float64)[:, None], h / rows
+    lo = np.ceil((cells + 0.5 - half_band) * extent - 0.5).astype(np.intp)
+    hi = np.floor((cells + 0.5 + half_band) * extent - 0.5).astype(np.intp) + 1
+
+    for row, col in zip(*np.nonzero(hi > lo)):
+        y0, y1 = int(y_edges[row]), int(y_edges[row + 1])
+        x0, x1 = int(x_edges[col]), int(x_edges[col + 1])
+        if horizontal:
+            x0, x1 = max(x0, int(lo[row, col])), min(x1, int(hi[row, col]))
+        else:
+            y0, y1 = max(y0, int(lo[row, col])), min(y1, int(hi[row, col]))
+        if x1 > x0 and y1 > y0:
+            out[y0:y1, x0:x1] = new[y0:y1, x0:x1]
+
+
+TRANSITION_KERNELS: Dict[str, Kernel] = {
+    "crossfade": render_crossfade,
+    "wipe": render_wipe,
+    "slide": render_slide,
+    "blinds": render_blinds,
+    "diffuse": render_diffuse,
+    "blockflip": render_blockflip,
+}
+
+_ALIASES = {
+    "fade": "crossfade",
+    "block puzzle flip": "blockflip",
+    "block flip": "blockflip",
+    "block_flip": "blockflip",
+    "blockpuzzleflip": "blockflip",
+}
+
+
+def resolve_kernel_name(transition_name: str) -> str:
+    """Map a transition display/registry name onto a kernel key (crossfade fallback)."""
+    key = (transition_name or "").strip().lower()
+    for prefix in ("gl compositor ", "gl_compositor_", "gl "):
+        if key.startswith(prefix):
+            key = key[len(prefix) :]
+    key = _ALIASES.get(key, key.replace(" ", ""))
+    return key if key in TRANSITION_KERNELS else "crossfade"
+
+
+# ---------------------------------------------------------------------------
+# Frames and adaptive resolution
+# ---------------------------------------------------------------------------
+
+
+def to_rgba_array(texture: Any) -> Frame:
+    """Return *texture* (ndarray, QImage or QPixmap) as a contiguous RGBA array."""
+    if isinstance(texture, np.ndarray):
+        if texture.ndim != 3 or texture.shape[2] != 4 or texture.dtype != np.uint8:
+            raise ValueError(f"expected (H, W, 4) uint8 frame, got {texture.shape} {texture.dtype}")
+        return np.ascontiguousarray(texture)
+
+    from PySide6.QtGui import QImage
+
+    image = texture.toImage() if hasattr(texture, "toImage") else texture
+    if not isinstance(image, QImage) or image.isNull():
+        raise ValueError("texture is not a usable image")
+    rgba = image.convertToFormat(QImage.Format.Format_RGBA8888)
+    rows = np.frombuffer(rgba.constBits(), dtype=np.uint8).reshape(rgba.height(), rgba.bytesPerLine())
+    return rows[:, : rgba.width() * 4].reshape(rgba.height(), rgba.width(), 4).copy()
+
+
+def resample_frame(frame: Frame, width: int, height: int) -> Frame:
+    """Resample *frame* to ``width`` x ``height`` (bilinear; identity if equal)."""
+    if frame.shape[1] == width and frame.shape[0] == height:
+        return frame
+    if PILLOW_AVAILABLE:
+        resized = Image.fromarray(frame, "RGBA").resize((width, height), Image.Resampling.BILINEAR)
+        return np.asarray(resized).copy()
+    ys = np.minimum((np.arange(height) * frame.shape[0]) // height, frame.shape[0] - 1)
+    xs = np.minimum((np.arange(width) * frame.shape[1]) // width, frame.shape[1] - 1)
+    return frame[ys[:, None], xs[None, :]]
+
+
+class AdaptiveRenderScale:
+    """Steps the internal render scale to keep frame time inside budget.
+
+    An exponential moving average of render time is compared against the
+    frame budget; above ``high_water`` of budget the scale drops one step,
+    below ``low_water`` for ``recover_frames`` consecutive frames it rises
+    one step.  Scale changes reset the average so one slow frame at the old
+    size does not cascade.
+    """
+
+    def __init__(
+        self,
+        target_fps: float = 60.0,
+        steps: Tuple[float, ...] = (1.0, 0.75, 0.5, 0.375),
+        *,
+        high_water: float = 0.85,
+        low_water: float = 0.45,
+        recover_frames: int = 30,
+        smoothing: float = 0.2,
+    ) -> None:
+        self.budget_ms = 1000.0 / max(1.0, float(target_fps))
+        self.steps = tuple(sorted(steps, reverse=True))
+        self.high_water = high_water
+        self.low_water = low_water
+        self.recover_frames = max(1, int(recover_frames))
+        self.smoothing = smoothing
+        self._index = 0
+        self._ema_ms: Optional[float] = None
+        self._fast_frames = 0
+
+    @property
+    def scale(self) -> float:
+        return self.steps[self._index]
+
+    @property
+    def average_ms(self) -> Optional[float]:
+        return self._ema_ms
+
+    def render_size(self, width: int, height: int) -> Tuple[int, int]:
+        scale = self.scale
+        return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+    def record(self, render_ms: float) -> bool:
+        """Feed one frame time; return True when the scale changed."""
+        if self._ema_ms is None:
+            self._ema_ms = render_ms
+        else:
+            self._ema_ms += self.smoothing * (render_ms - self._ema_ms)
+
+        if self._ema_ms > self.budget_ms * self.high_water and self._index < len(self.steps) - 1:
+            self._index += 1
+            self._reset()
+            return True
+        if self._ema_ms < self.budget_ms * self.low_water and self._index > 0:
+            self._fast_frames += 1
+            if self._fast_frames >= self.recover_frames:
+                self._index -= 1
+                self._reset()
+                return True
+        else:
+            self._fast_frames = 0
+        return False
+
+    def _reset(self) -> None:
+        self._ema_ms = None
+        self._fast_frames = 0
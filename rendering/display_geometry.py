@@ -0,0 +1,82 @@
+"""
+Display-mode geometry shared by the in-process and ImageWorker pipelines.
+
+Pure Python on purpose: the ImageWorker process imports this without Qt, and
+``AsyncImageProcessor`` uses the same numbers, so FILL framing cannot drift
+between the two paths.
+
+FILL historically resampled the whole source to a *cover* size and then
+centre-cropped the overflow.  ``fill_source_box`` maps that centre crop back
+into source pixels so callers can resample only the visible region; PIL's
+``resize(box=...)`` over that box reproduces the pixels the full resize
+would have kept (to within one step of rounding).
+"""
+from __future__ import annotations
+
+from typing import NamedTuple, Tuple
+
+Size = Tuple[int, int]
+
+
+class FillGeometry(NamedTuple):
+    """FILL framing of one source on one target."""
+
+    # Size the whole source would be resampled to so it covers the target
+    cover_size: Size
+    # Top-left of the centred target-sized window inside ``cover_size``
+    crop_offset: Size
+    # That window in source pixel coordinates, ``(left, top, right, bottom)``
+    source_box: Tuple[float, float, float, float]
+
+
+def fill_cover_size(source: Size, target: Size) -> Size:
+    """Smallest aspect-preserving size of *source* that covers *target*."""
+    src_w, src_h = source
+    tgt_w, tgt_h = target
+    if src_w <= 0 or src_h <= 0 or tgt_h <= 0:
+        return target
+    src_ratio = src_w / src_h
+    if src_ratio > tgt_w / tgt_h:
+        # Source wider - scale by height
+        new_h = tgt_h
+        new_w = int(new_h * src_ratio)
+    else:
+        # Source taller - scale by width
+        new_w = tgt_w
+        new_h = int(new_w / src_ratio)
+    return (max(new_w, tgt_w), max(new_h, tgt_h))
+
+
+def fill_crop_offset(cover: Size, target: Size) -> Size:
+    """Centre-crop offset of *target* inside *cover*."""
+    return (max(0, (cover[0] - target[0]) // 2), max(0, (cover[1] - target[1]) // 2))
+
+
+def fill_source_box(source: Size, cover: Size, target: Size) -> Tuple[float, float, float, float]:
+    """Source-space rectangle that lands in the target after cover + crop.
+
+    *source* is the image actually being resampled (which may be a reduced
+    decode of the original); *cover* is the cover size computed from the
+    original, so the framing matches the full-resolution path.
+    """
+    scale_x = source[0] / cover[0]
+    scale_y = source[1] / cover[1]
+    left, top = fill_crop_offset(cover, target)
+    visible_w = min(target[0], cover[0])
+    visible_h = min(target[1], cover[1])
+    return (
+        left * scale_x,
+        top * scale_y,
+        (left + visible_w) * scale_x,
+        (top + visible_h) * scale_y,
+    )
+
+
+def fill_geometry(source: Size, target: Size) -> FillGeometry:
+    """Full FILL framing for *source* on *target*."""
+    cover = fill_cover_size(source, target)
+    return FillGeometry(
+        cover_size=cover,
+        crop_offset=fill_crop_offset(cover, target),
+        source_box=fill_source_box(source, cover, target),
+    )
@@ -15,7 +15,8 @@ from core.logging.logger import get_logger
 from core.events.event_system import EventSystem
 from core.settings.settings_manager import SettingsManager
 from rendering.backends import create_backend_from_settings
-from rendering.backends.base import SurfaceDescriptor
+from rendering.backends.base import SurfaceDescriptor, TransitionPipeline
+from rendering.backends.software.backend import SoftwareRenderSurface, SoftwareRendererBackend
 from rendering.gl_compositor import GLCompositorWidget
 from transitions.overlay_manager import hide_backend_fallback_overlay
 
@@ -127,6 +128,21 @@ def ensure_render_surface(widget) -> None:
         descriptor.prefer_triple_buffer,
     )
 
+def create_software_transition_pipeline(widget, transition_name: str) -> Optional[TransitionPipeline]:
+    """Return a CPU transition pipeline when the software backend is active.
+
+    Returns None for any other backend so the transition factory keeps
+    building GL compositor transitions.
+    """
+    backend = widget._renderer_backend
+    if not isinstance(backend, SoftwareRendererBackend):
+        return None
+    ensure_render_surface(widget)
+    if not isinstance(widget._render_surface, SoftwareRenderSurface):
+        return None
+    return backend.create_transition_pipeline(transition_name)
+
+
 def ensure_gl_compositor(widget) -> None:
     """Create or resize the shared GL compositor widget when appropriate.
 
@@ -31,10 +31,16 @@ except ImportError:
 from core.logging.logger import get_logger, is_verbose_logging, is_perf_metrics_enabled
 from rendering.gl_compositor import GLCompositorWidget
 from transitions.overlay_manager import GL_OVERLAY_KEYS
-from widgets.spotify_bars_gl_overlay import SpotifyBarsGLOverlay
 
 from rendering.display_widget import _describe_pixmap
 
+if TYPE_CHECKING:
+    from widgets.spotify_bars_gl_overlay import SpotifyBarsGLOverlay
+else:
+    # Resolved on first use so the visualizer stack stays out of startup
+    # imports when Spotify widgets are disabled (see _spotify_bars_overlay_cls).
+    SpotifyBarsGLOverlay = None
+
 logger = get_logger(__name__)
 win_diag_logger = logging.getLogger("win_diag")
 
@@ -1029,14 +1035,24 @@ def _resolve_spotify_visualizer_overlay_rect(vis) -> QRect | None:
         return None
 
 
+def _spotify_bars_overlay_cls():
+    global SpotifyBarsGLOverlay
+    if SpotifyBarsGLOverlay is None:
+        from widgets.spotify_bars_gl_overlay import SpotifyBarsGLOverlay as overlay_cls
+
+        SpotifyBarsGLOverlay = overlay_cls
+    return SpotifyBarsGLOverlay
+
+
 def _ensure_spotify_bars_overlay(widget) -> SpotifyBarsGLOverlay | None:
     """Return the shared Spotify GL overlay, creating it if needed."""
 
     # Lazily create a small GL overlay dedicated to Spotify bars. This
     # sits above the card widget in Z-order while the card itself remains
     # a normal QWidget with ShadowFadeProfile-driven opacity.
+    overlay_cls = _spotify_bars_overlay_cls()
     overlay = getattr(widget, "_spotify_bars_overlay", None)
-    if overlay is None or not isinstance(overlay, SpotifyBarsGLOverlay):
+    if overlay is None or not isinstance(overlay, overlay_cls):
         try:
             initial_mode = None
             try:
@@ -1045,7 +1061,7 @@ def _ensure_spotify_bars_overlay(widget) -> SpotifyBarsGLOverlay | None:
                     initial_mode = str(getattr(vis, "_vis_mode_str", "") or "").strip().lower() or None
             except Exception:
                 logger.debug("[SPOTIFY_VIS] Failed to read visualizer mode for overlay init", exc_info=True)
-            overlay = SpotifyBarsGLOverlay(widget, initial_mode=initial_mode)
+            overlay = overlay_cls(widget, initial_mode=initial_mode)
             overlay.setObjectName("spotify_bars_gl_overlay")
             widget._spotify_bars_overlay = overlay
             if widget._resource_manager is not None:
@@ -1,6 +1,6 @@
 """Display widget for OpenGL/software rendered screensaver overlays."""
 from collections import defaultdict
-from typing import Optional, Iterable, Tuple, Callable, Dict, Any, List, Set
+from typing import Optional, Iterable, Tuple, Callable, Dict, Any, List, Set, TYPE_CHECKING
 import logging
 import time
 import sys
@@ -38,16 +38,6 @@ from rendering.gl_compositor import GLCompositorWidget
 from transitions.base_transition import BaseTransition
 from rendering.transition_factory import TransitionFactory
 from rendering.transition_registry import canonicalize_transition_name
-from widgets.clock_widget import ClockWidget
-from widgets.weather_widget import WeatherWidget
-from widgets.media_widget import MediaWidget
-from widgets.reddit_widget import RedditWidget
-from widgets.pixel_shift_manager import PixelShiftManager
-from widgets.spotify_visualizer_widget import SpotifyVisualizerWidget
-from widgets.spotify_bars_gl_overlay import SpotifyBarsGLOverlay
-from widgets.spotify_volume_widget import SpotifyVolumeWidget
-from widgets.context_menu import ScreensaverContextMenu
-from widgets.cursor_halo import CursorHaloWidget
 from rendering.widget_manager import WidgetManager
 from rendering.input_handler import InputHandler
 from rendering.transition_controller import TransitionController
@@ -68,7 +58,22 @@ from transitions.overlay_manager import (
 )
 from core.mc import is_mc_build
 from rendering.backends import BackendSelectionResult
-from rendering.backends.base import RendererBackend, RenderSurface, SurfaceDescriptor
+from rendering.backends.base import RendererBackend, RenderSurface, SurfaceDescriptor, TransitionPipeline
+from rendering.backends.software.backend import SoftwareRenderSurface
+
+if TYPE_CHECKING:
+    # Widget families are only annotations here; the factories import them
+    # when a widget is actually enabled, keeping /s startup lean.
+    from widgets.clock_widget import ClockWidget
+    from widgets.weather_widget import WeatherWidget
+    from widgets.media_widget import MediaWidget
+    from widgets.reddit_widget import RedditWidget
+    from widgets.pixel_shift_manager import PixelShiftManager
+    from widgets.spotify_visualizer_widget import SpotifyVisualizerWidget
+    from widgets.spotify_bars_gl_overlay import SpotifyBarsGLOverlay
+    from widgets.spotify_volume_widget import SpotifyVolumeWidget
+    from widgets.context_menu import ScreensaverContextMenu
+    from widgets.cursor_halo import CursorHaloWidget
 
 
 logger = get_logger(__name__)
@@ -512,6 +517,8 @@ class DisplayWidget(QWidget):
         # Initialize renderer backend using new backend factory
         self._renderer_backend: Optional[RendererBackend] = None
         self._render_surface: Optional[RenderSurface] = None
+        # Set by SoftwareBackendTransition while its frames own the paint.
+        self._software_transition_surface: Optional[SoftwareRenderSurface] = None
         self._backend_selection: Optional[BackendSelectionResult] = None
         self._backend_fallback_message: Optional[str] = None
         self._has_rendered_first_frame = False
@@ -526,6 +533,7 @@ class DisplayWidget(QWidget):
                 resource_manager=self._resource_manager,
                 compositor_checker=self._has_gl_compositor,
                 compositor_ensurer=self._ensure_gl_compositor,
+                software_pipeline_provider=self._create_software_transition_pipeline,
             )
 
         # Ensure transitions are cleaned up if the widget is destroyed
@@ -936,6 +944,7 @@ class DisplayWidget(QWidget):
                 resource_manager=self._resource_manager,
                 compositor_checker=self._has_gl_compositor,
                 compositor_ensurer=self._ensure_gl_compositor,
+                software_pipeline_provider=self._create_software_transition_pipeline,
             )
         
         return self._transition_factory.create_transition()
@@ -1215,11 +1224,17 @@ class DisplayWidget(QWidget):
         from rendering.display_gl_init import ensure_gl_compositor
         return ensure_gl_compositor(self)
 
+    def _create_software_transition_pipeline(self, transition_name: str) -> Optional[TransitionPipeline]:
+        """Delegates to rendering.display_gl_init."""
+        from rendering.display_gl_init import create_software_transition_pipeline
+        return create_software_transition_pipeline(self, transition_name)
+
     def _has_gl_compositor(self) -> bool:
         """Check if the GL compositor is available and ready."""
         return isinstance(self._gl_compositor, GLCompositorWidget)
 
     def _destroy_render_surface(self) -> None:
+        self._software_transition_surface = None
         if self._render_surface is None or self._renderer_backend is None:
             self._render_surface = None
             return
@@ -1413,6 +1428,17 @@ class DisplayWidget(QWidget):
         except Exception as e:
             logger.debug("[DISPLAY_WIDGET] Exception suppressed: %s", e)
 
+        # Software backend transition in flight: paint its latest frame.
+        surface = self._software_transition_surface
+        if surface is not None and surface.front_buffer is not None:
+            painter = QPainter(self)
+            try:
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+                painter.drawImage(self.rect(), surface.to_qimage())
+            finally:
+                painter.end()
+            return
+
         pixmap_to_paint = self.current_pixmap
         if (pixmap_to_paint is None or pixmap_to_paint.isNull()) and self._seed_pixmap and not self._seed_pixmap.isNull():
             pixmap_to_paint = self._seed_pixmap
@@ -1586,7 +1612,7 @@ class DisplayWidget(QWidget):
         
         super().closeEvent(event)
 
-    def _resolve_media_widget_for_transport(self) -> Optional[MediaWidget]:
+    def _resolve_media_widget_for_transport(self) -> Optional["MediaWidget"]:
         """Return the best media widget candidate across active displays."""
         media_widget = getattr(self, "media_widget", None)
         if media_widget is not None:
@@ -1608,7 +1634,7 @@ class DisplayWidget(QWidget):
             logger.debug("[DISPLAY_WIDGET] Cross-display media widget lookup failed", exc_info=True)
         return None
 
-    def _resolve_volume_widget_for_hotkeys(self) -> Optional[SpotifyVolumeWidget]:
+    def _resolve_volume_widget_for_hotkeys(self) -> Optional["SpotifyVolumeWidget"]:
         """Return the best Spotify volume widget candidate across active displays."""
         volume_widget = getattr(self, "spotify_volume_widget", None)
         if volume_widget is not None:
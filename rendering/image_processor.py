@@ -52,7 +52,9 @@ class ImageProcessor:
             sharpen,
         )
         pixmap = QPixmap.fromImage(processed_qimage)
-        # Clear QImage reference to free memory (Section 1.1 fix)
+        # The pixmap holds its own copy: recycle the canvas (a no-op when the
+        # result aliases qimage), then drop our reference (Section 1.1 fix)
+        AsyncImageProcessor.recycle(processed_qimage)
         processed_qimage = None
         return pixmap
 
@@ -7,20 +7,26 @@ COMPUTE pool.
 """
 from __future__ import annotations
 
-from typing import Optional, Callable
+import math
+import threading
+import weakref
+from typing import Callable, Dict, Optional
 
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QImage
 
 from core.logging.logger import get_logger
+from core.resources.manager import ResourceManager
 from core.threading.manager import ThreadManager, TaskResult
+from rendering.display_geometry import FillGeometry, fill_geometry
 from rendering.display_modes import DisplayMode
+from rendering.qimage_pil_bridge import scale_qimage_lanczos
 
 
 logger = get_logger(__name__)
 
 try:
-    from PIL import Image, ImageFilter  # type: ignore[import]
+    from PIL import ImageFilter  # type: ignore[import]
 
     PILLOW_AVAILABLE = True
 except ImportError:  # pragma: no cover - environment dependent
@@ -28,6 +34,34 @@ except ImportError:  # pragma: no cover - environment dependent
     logger.warning("PIL/Pillow not available, using Qt scaling only (async path)")
 
 
+# Canvases allocated by _black_canvas that may go back to the buffer pool,
+# keyed by id(). QImage is unhashable, so weakrefs drop entries on collection.
+_owned_canvases: Dict[int, "weakref.ref[QImage]"] = {}
+_owned_canvases_lock = threading.Lock()
+
+
+def _claim_canvas(image: QImage) -> None:
+    key = id(image)
+
+    def _forget(ref: "weakref.ref[QImage]", key: int = key) -> None:
+        with _owned_canvases_lock:
+            if _owned_canvases.get(key) is ref:
+                del _owned_canvases[key]
+
+    with _owned_canvases_lock:
+        _owned_canvases[key] = weakref.ref(image, _forget)
+
+
+def _disown_canvas(image: QImage) -> bool:
+    """Drop *image*'s pool ownership; True if the processor owned it."""
+    with _owned_canvases_lock:
+        ref = _owned_canvases.get(id(image))
+        if ref is None or ref() is not image:
+            return False
+        del _owned_canvases[id(image)]
+        return True
+
+
 class AsyncImageProcessor:
     """QImage-first image processing utilities.
 
@@ -46,12 +80,16 @@ class AsyncImageProcessor:
         """Synchronous QImage processing that mirrors ImageProcessor.process_image.
 
         Returns a QImage cropped/scaled to ``screen_size`` according to ``mode``.
+        The result may be *image* itself (perfect fit); only canvases this
+        call allocated are eligible for :meth:`recycle`.
         """
 
+        # The caller (or a cache) holds the input; it is never ours to pool.
+        _disown_canvas(image)
+
         if image.isNull():
             logger.warning("[CACHE][FALLBACK] QImage is null, returning empty ARGB32 image")
-            result = QImage(screen_size, QImage.Format.Format_ARGB32_Premultiplied)
-            result.fill(Qt.GlobalColor.black)
+            result = AsyncImageProcessor._black_canvas(screen_size)
             return result
 
         if mode == DisplayMode.FILL:
@@ -108,6 +146,41 @@ class AsyncImageProcessor:
     # Internal helpers (QImage-based equivalents of ImageProcessor paths)
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _black_canvas(screen_size: QSize) -> QImage:
+        """Screen-sized premultiplied canvas, reused from the buffer pool when possible."""
+        image = None
+        manager = ResourceManager.get_app_shared()
+        if manager is not None:
+            image = manager.acquire_image(
+                screen_size.width(),
+                screen_size.height(),
+                QImage.Format.Format_ARGB32_Premultiplied,
+                clear=False,
+            )
+        if image is None:
+            image = QImage(screen_size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.black)
+        _claim_canvas(image)
+        return image
+
+    @staticmethod
+    def recycle(image: Optional[QImage]) -> None:
+        """Hand a finished canvas from :meth:`process_qimage` back to the buffer pool.
+
+        Only canvases the processor allocated itself are pooled. Anything
+        else, such as a perfect-fit result that is the caller's own (possibly
+        cached) input, is ignored so a later canvas cannot paint over it.
+        Callers must not use *image* after recycling it.
+        """
+        if image is None or not _disown_canvas(image):
+            return
+        if image.isNull():
+            return
+        manager = ResourceManager.get_app_shared()
+        if manager is not None:
+            manager.release_image(image)
+
     @staticmethod
     def _scale_image(
         image: QImage,
@@ -127,88 +200,41 @@ class AsyncImageProcessor:
             )
 
         try:
-            qimage = image
-            if qimage.hasAlphaChannel():
-                qimage = qimage.convertToFormat(QImage.Format.Format_RGBA8888)
-                mode = "RGBA"
-            else:
-                qimage = qimage.convertToFormat(QImage.Format.Format_RGB888)
-                mode = "RGB"
-
-            ptr = qimage.constBits()
-            if hasattr(ptr, "setsize"):
-                ptr.setsize(qimage.sizeInBytes())
-                img_data = bytes(ptr)
-            else:
-                img_data = ptr.tobytes()
-
-            pil_image = Image.frombytes(
-                mode,
-                (qimage.width(), qimage.height()),
-                img_data,
-            )
-
             # Calculate target size preserving aspect ratio (matching Qt's KeepAspectRatio)
             # This is critical for video frames which may have non-square pixels
-            src_w, src_h = pil_image.size
+            src_w, src_h = image.width(), image.height()
             if src_w == 0 or src_h == 0:
-                scaled_pil = pil_image
+                return image
+            src_ratio = src_w / src_h
+            target_ratio = width / height if height > 0 else src_ratio
+
+            if src_ratio > target_ratio:
+                # Source is wider - fit to width
+                new_w = width
+                new_h = int(width / src_ratio)
             else:
-                src_ratio = src_w / src_h
-                target_ratio = width / height if height > 0 else src_ratio
-                
-                if src_ratio > target_ratio:
-                    # Source is wider - fit to width
-                    new_w = width
-                    new_h = int(width / src_ratio)
-                else:
-                    # Source is taller - fit to height
-                    new_h = height
-                    new_w = int(height * src_ratio)
-                
-                # Ensure we don't exceed requested dimensions
-                new_w = min(new_w, width)
-                new_h = min(new_h, height)
-                
-                scaled_pil = pil_image.resize((new_w, new_h), Image.Resampling.LANCZOS)
-
-            if sharpen and (width < qimage.width() or height < qimage.height()):
-                scale_factor = min(width / qimage.width(), height / qimage.height())
-                if scale_factor < 0.5:
-                    scaled_pil = scaled_pil.filter(
-                        ImageFilter.UnsharpMask(
-                            radius=2,
-                            percent=150,
-                            threshold=3,
-                        )
-                    )
-                else:
-                    scaled_pil = scaled_pil.filter(ImageFilter.SHARPEN)
-
-            if scaled_pil.mode == "RGBA":
-                data = scaled_pil.tobytes("raw", "RGBA")
-                qimg = QImage(
-                    data,
-                    scaled_pil.width,
-                    scaled_pil.height,
-                    scaled_pil.width * 4,
-                    QImage.Format.Format_RGBA8888,
-                )
-                qimg = qimg.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
-            else:
-                data = scaled_pil.tobytes("raw", "RGB")
-                qimg = QImage(
-                    data,
-                    scaled_pil.width,
-                    scaled_pil.height,
-                    scaled_pil.width * 3,
-                    QImage.Format.Format_RGB888,
-                )
+                # Source is taller - fit to height
+                new_h = height
+                new_w = int(height * src_ratio)
+
+            # Ensure we don't exceed requested dimensions
+            new_w = min(new_w, width)
+            new_h = min(new_h, height)
+
+            sharpen_filter = (
+                AsyncImageProcessor._sharpen_filter(src_w, src_h, width, height)
+                if sharpen
+                else None
+            )
+
+            # Shares the QImage buffers with PIL instead of round-tripping
+            # through bytes; see rendering.qimage_pil_bridge.
+            qimg = scale_qimage_lanczos(image, new_w, new_h, sharpen_filter=sharpen_filter)
 
             logger.debug(
                 "Scaled QImage with Lanczos: %sx%s → %sx%s",
-                qimage.width(),
-                qimage.height(),
+                src_w,
+                src_h,
                 width,
                 height,
             )
@@ -224,6 +250,71 @@ class AsyncImageProcessor:
                 Qt.TransformationMode.SmoothTransformation,
             )
 
+    @staticmethod
+    def _sharpen_filter(src_w: int, src_h: int, width: int, height: int):
+        """PIL filter applied after downscaling *src* to ``width`` x ``height``."""
+        if not (width < src_w or height < src_h):
+            return None
+        scale_factor = min(width / src_w, height / src_h)
+        if scale_factor < 0.5:
+            return ImageFilter.UnsharpMask(
+                radius=2,
+                percent=150,
+                threshold=3,
+            )
+        return ImageFilter.SHARPEN
+
+    @staticmethod
+    def _scale_fill_region(
+        image: QImage,
+        geometry: FillGeometry,
+        screen_size: QSize,
+        use_lanczos: bool,
+        sharpen: bool,
+    ) -> QImage:
+        """Resample only the part of *image* FILL keeps, straight to screen size."""
+        tgt_w, tgt_h = screen_size.width(), screen_size.height()
+        src_w, src_h = image.width(), image.height()
+        cover_w, cover_h = geometry.cover_size
+
+        if PILLOW_AVAILABLE and use_lanczos:
+            try:
+                sharpen_filter = (
+                    AsyncImageProcessor._sharpen_filter(src_w, src_h, cover_w, cover_h)
+                    if sharpen
+                    else None
+                )
+                return scale_qimage_lanczos(
+                    image,
+                    tgt_w,
+                    tgt_h,
+                    sharpen_filter=sharpen_filter,
+                    box=geometry.source_box,
+                )
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning(
+                    "Lanczos FILL region scaling failed, falling back to Qt: %s", exc
+                )
+
+        # Qt has no fractional source box: scale the whole-pixel rectangle that
+        # encloses it, then trim the sub-pixel remainder.
+        left, top, right, bottom = geometry.source_box
+        x0, y0 = int(math.floor(left)), int(math.floor(top))
+        x1, y1 = min(src_w, int(math.ceil(right))), min(src_h, int(math.ceil(bottom)))
+        scale_x = cover_w / src_w
+        scale_y = cover_h / src_h
+        region_w = max(tgt_w, int(math.ceil((x1 - x0) * scale_x)))
+        region_h = max(tgt_h, int(math.ceil((y1 - y0) * scale_y)))
+        region = image.copy(x0, y0, x1 - x0, y1 - y0).scaled(
+            region_w,
+            region_h,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        x_offset = min(region_w - tgt_w, int(round((left - x0) * scale_x)))
+        y_offset = min(region_h - tgt_h, int(round((top - y0) * scale_y)))
+        return region.copy(x_offset, y_offset, tgt_w, tgt_h)
+
     @staticmethod
     def _process_fill_qimage(
         image: QImage,
@@ -241,22 +332,14 @@ class AsyncImageProcessor:
                 img_size.width(),
                 img_size.height(),
             )
-            result = QImage(screen_size, QImage.Format.Format_ARGB32_Premultiplied)
-            result.fill(Qt.GlobalColor.black)
+            result = AsyncImageProcessor._black_canvas(screen_size)
             return result
 
-        screen_ratio = screen_size.width() / screen_size.height()
-        img_ratio = img_size.width() / img_size.height()
-
-        if img_ratio > screen_ratio:
-            scale_height = screen_size.height()
-            scale_width = int(scale_height * img_ratio)
-        else:
-            scale_width = screen_size.width()
-            scale_height = int(scale_width / img_ratio)
-
-        scale_width = max(scale_width, screen_size.width())
-        scale_height = max(scale_height, screen_size.height())
+        geometry = fill_geometry(
+            (img_size.width(), img_size.height()),
+            (screen_size.width(), screen_size.height()),
+        )
+        scale_width, scale_height = geometry.cover_size
 
         if scale_width == img_size.width() and scale_height == img_size.height():
             scaled = image
@@ -266,28 +349,43 @@ class AsyncImageProcessor:
                 img_size.height(),
             )
         else:
-            scaled = AsyncImageProcessor._scale_image(
+            # Crop before resampling: only the visible source region is
+            # scaled, directly to screen size.
+            region = AsyncImageProcessor._scale_fill_region(
                 image,
-                scale_width,
-                scale_height,
+                geometry,
+                screen_size,
                 use_lanczos,
                 sharpen,
             )
-            logger.debug(
-                "Fill(QImage): Scaled %sx%s → %sx%s (Lanczos=%s)",
+            if region.hasAlphaChannel():
+                # Match the crop path below, which composites onto black.
+                result = AsyncImageProcessor._black_canvas(screen_size)
+                painter = QImagePainter(result)
+                painter.drawImage(0, 0, region)
+                painter.end()
+                region = result
+            logger.info(
+                "FILL(QImage): Image %sx%s → region %.0f,%.0f %.0fx%.0f → %sx%s (cover %sx%s, Lanczos=%s)",
                 img_size.width(),
                 img_size.height(),
+                geometry.source_box[0],
+                geometry.source_box[1],
+                geometry.source_box[2] - geometry.source_box[0],
+                geometry.source_box[3] - geometry.source_box[1],
+                screen_size.width(),
+                screen_size.height(),
                 scale_width,
                 scale_height,
                 use_lanczos,
             )
+            return region
 
         if scaled.width() > screen_size.width() or scaled.height() > screen_size.height():
             x_offset = (scaled.width() - screen_size.width()) // 2
             y_offset = (scaled.height() - screen_size.height()) // 2
 
-            result = QImage(screen_size, QImage.Format.Format_ARGB32_Premultiplied)
-            result.fill(Qt.GlobalColor.black)
+            result = AsyncImageProcessor._black_canvas(screen_size)
 
             painter = QImagePainter(result)
             painter.drawImage(
@@ -336,8 +434,7 @@ class AsyncImageProcessor:
                 image.width(),
                 image.height(),
             )
-            result = QImage(screen_size, QImage.Format.Format_ARGB32_Premultiplied)
-            result.fill(Qt.GlobalColor.black)
+            result = AsyncImageProcessor._black_canvas(screen_size)
             return result
 
         img_ratio = image.width() / image.height()
@@ -365,8 +462,7 @@ class AsyncImageProcessor:
             sharpen,
         )
 
-        result = QImage(screen_size, QImage.Format.Format_ARGB32_Premultiplied)
-        result.fill(Qt.GlobalColor.black)
+        result = AsyncImageProcessor._black_canvas(screen_size)
 
         x_offset = (screen_size.width() - scaled.width()) // 2
         y_offset = (screen_size.height() - scaled.height()) // 2
@@ -401,13 +497,11 @@ class AsyncImageProcessor:
                 img_size.width(),
                 img_size.height(),
             )
-            result = QImage(screen_size, QImage.Format.Format_ARGB32_Premultiplied)
-            result.fill(Qt.GlobalColor.black)
+            result = AsyncImageProcessor._black_canvas(screen_size)
             return result
 
         if img_size.width() <= screen_size.width() and img_size.height() <= screen_size.height():
-            result = QImage(screen_size, QImage.Format.Format_ARGB32_Premultiplied)
-            result.fill(Qt.GlobalColor.black)
+            result = AsyncImageProcessor._black_canvas(screen_size)
 
             x_offset = (screen_size.width() - img_size.width()) // 2
             y_offset = (screen_size.height() - img_size.height()) // 2
@@ -443,8 +537,7 @@ class AsyncImageProcessor:
             sharpen,
         )
 
-        result = QImage(screen_size, QImage.Format.Format_ARGB32_Premultiplied)
-        result.fill(Qt.GlobalColor.black)
+        result = AsyncImageProcessor._black_canvas(screen_size)
 
         x_offset = (screen_size.width() - scaled.width()) // 2
         y_offset = (screen_size.height() - scaled.height()) // 2
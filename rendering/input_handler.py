@@ -64,6 +64,7 @@ class InputHandler(RuntimeInputOwner):
         super().__init__(parent)
         self._parent = parent
         self._settings_manager = settings_manager
+        self._interaction_mode_setting = None
         self._widget_manager = widget_manager
         self._defer_focus_restore_after_widget_click: bool = False
         
@@ -83,9 +84,21 @@ class InputHandler(RuntimeInputOwner):
         if self._settings_manager is None:
             return False
         try:
-            return SettingsManager.to_bool(
-                self._settings_manager.get('input.interaction_mode', False), False
-            )
+            # Checked on every pointer event: a snapshot accessor turns the
+            # read into a version compare.
+            accessor = self._interaction_mode_setting
+            if accessor is None:
+                if not isinstance(self._settings_manager, SettingsManager):
+                    return SettingsManager.to_bool(
+                        self._settings_manager.get('input.interaction_mode', False), False
+                    )
+                accessor = self._settings_manager.accessor(
+                    'input.interaction_mode',
+                    False,
+                    coerce=lambda raw: SettingsManager.to_bool(raw, False),
+                )
+                self._interaction_mode_setting = accessor
+            return accessor.get()
         except Exception as e:
             logger.debug("[INPUT_HANDLER] Exception suppressed: %s", e)
             return False
@@ -140,6 +153,7 @@ class InputHandler(RuntimeInputOwner):
         """Clean up input handler state."""
         super().cleanup()
         self._settings_manager = None
+        self._interaction_mode_setting = None
         self._widget_manager = None
         self._parent = None
         logger.debug("[INPUT_HANDLER] Cleanup complete")
@@ -0,0 +1,130 @@
+"""Buffer-sharing bridge between ``QImage`` and PIL for Lanczos scaling.
+
+PIL's Lanczos filter is separable and per-channel, so for the 32-bit QImage
+layouts it neither cares about channel order (BGRX vs RGBX) nor needs to
+know which byte is alpha as long as the colour channels are already
+premultiplied.  That lets the bridge
+
+* map a 32-bit source QImage into PIL as an ``"RGBX"`` view over
+  ``constBits()`` (``Image.frombuffer``, no copy);
+* resize it — the only full-size allocation PIL makes;
+* paste the result straight into a freshly allocated destination QImage,
+  again through an ``"RGBX"`` view over its ``bits()``.
+
+Straight-alpha sources are premultiplied once, up front, by Qt; Lanczos
+ringing can leave a colour channel above its alpha, so premultiplied results
+are clamped in place afterwards to keep them valid for Qt.  Sharpening
+is the exception: an unsharp mask over premultiplied data can push colour
+above alpha, so alpha sources that are sharpened resize in straight space
+and are premultiplied once at the end instead.
+
+Views returned here borrow the QImage's memory; the caller must keep the
+QImage alive (and unmodified) for as long as the view is used.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional, Tuple
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+try:
+    from PIL import Image  # type: ignore[import]
+
+    PILLOW_AVAILABLE = True
+except ImportError:  # pragma: no cover - environment dependent
+    PILLOW_AVAILABLE = False
+
+_Format = QImage.Format
+
+# 32-bit layouts whose four bytes can be resampled as independent channels.
+_OPAQUE_PASSTHROUGH = frozenset({_Format.Format_RGB32, _Format.Format_RGBX8888})
+_PREMULTIPLIED_PASSTHROUGH = frozenset({_Format.Format_ARGB32_Premultiplied})
+
+
+def pil_view(image: QImage, mode: str = "RGBX", *, writable: bool = False) -> "Image.Image":
+    """Map a 32-bit *image* into PIL as *mode* without copying its pixels.
+
+    *mode* is ``"RGBX"`` (four independent channels) or ``"RGBA"`` (fourth
+    byte is straight alpha).  With ``writable=True`` the view aliases
+    ``bits()`` and PIL writes (e.g. ``paste``) land directly in the QImage.
+    """
+    if image.depth() != 32:
+        raise ValueError(f"pil_view needs a 32-bit QImage, got {image.format()}")
+    buffer = image.bits() if writable else image.constBits()
+    view = Image.frombuffer(
+        mode,
+        (image.width(), image.height()),
+        buffer,
+        "raw",
+        mode,
+        image.bytesPerLine(),
+        1,
+    )
+    if writable:
+        # frombuffer maps read-only by default; clearing the flag keeps
+        # paste() from copying-on-write away from the QImage's memory.
+        view.readonly = 0
+    return view
+
+
+def scale_qimage_lanczos(
+    image: QImage,
+    width: int,
+    height: int,
+    *,
+    sharpen_filter: Optional[Any] = None,
+    box: Optional[Tuple[float, float, float, float]] = None,
+) -> QImage:
+    """Resample *image* to exactly ``width`` x ``height`` with PIL Lanczos.
+
+    With *box* only that source rectangle is resampled (PIL ``resize(box=)``),
+    which equals resampling the whole image larger and cropping, minus the
+    work spent on pixels the crop would discard.
+
+    Opaque results are ``Format_RGB32`` (or ``Format_RGBX8888`` for such
+    sources) and alpha results ``Format_ARGB32_Premultiplied``.
+    *sharpen_filter* (a ``PIL.ImageFilter`` filter) is applied to the resized
+    image before it is written into the destination.
+    """
+    if not PILLOW_AVAILABLE:
+        raise RuntimeError("Pillow is required for Lanczos scaling")
+
+    source = image
+    fmt = source.format()
+    if source.hasAlphaChannel() and sharpen_filter is not None:
+        # ARGB32 is BGRA in memory: alpha is the fourth byte, and the filters
+        # treat the colour bytes symmetrically.
+        if fmt != _Format.Format_ARGB32:
+            source = source.convertToFormat(_Format.Format_ARGB32)
+        scaled = pil_view(source, "RGBA").resize((width, height), Image.Resampling.LANCZOS, box=box)
+        scaled = scaled.filter(sharpen_filter)
+        result = QImage(width, height, _Format.Format_ARGB32)
+        pil_view(result, "RGBA", writable=True).paste(scaled)
+        result.convertTo(_Format.Format_ARGB32_Premultiplied)
+        return result
+
+    if fmt in _OPAQUE_PASSTHROUGH or fmt in _PREMULTIPLIED_PASSTHROUGH:
+        out_format = fmt
+    elif source.hasAlphaChannel():
+        out_format = _Format.Format_ARGB32_Premultiplied
+        source = source.convertToFormat(out_format)
+    else:
+        out_format = _Format.Format_RGB32
+        source = source.convertToFormat(out_format)
+
+    scaled = pil_view(source).resize((width, height), Image.Resampling.LANCZOS, box=box)
+    if sharpen_filter is not None:
+        scaled = scaled.filter(sharpen_filter)
+    result = QImage(width, height, out_format)
+    pil_view(result, writable=True).paste(scaled)
+    if out_format in _PREMULTIPLIED_PASSTHROUGH:
+        _clamp_premultiplied(result)
+    return result
+
+
+def _clamp_premultiplied(image: QImage) -> None:
+    """Clamp colour to alpha in place (alpha is the fourth byte of ARGB32)."""
+    rows = np.frombuffer(image.bits(), dtype=np.uint8).reshape(image.height(), image.bytesPerLine())
+    pixels = rows[:, : image.width() * 4].reshape(image.height(), image.width(), 4)
+    np.minimum(pixels[..., :3], pixels[..., 3:], out=pixels[..., :3])
@@ -15,6 +15,10 @@ from core.settings.defaults import get_default_settings
 from core.settings.settings_manager import SettingsManager
 from core.resources.manager import ResourceManager
 from core.process import ProcessSupervisor, WorkerType, MessageType
+from core.process.workers.transition_worker import (
+    precompute_cache_key,
+    unpack_precomputed_blocks,
+)
 from rendering.transition_registry import (
     canonicalize_transition_name,
     get_transition_descriptor,
@@ -46,11 +50,18 @@ from transitions.gl_compositor_crumble_transition import GLCompositorCrumbleTran
 from transitions.gl_compositor_particle_transition import GLCompositorParticleTransition
 from transitions.gl_compositor_burn_transition import GLCompositorBurnTransition
 
+# Software renderer backend
+from rendering.backends.base import TransitionPipeline
+from transitions.software_backend_transition import SoftwareBackendTransition
+
 if TYPE_CHECKING:
     pass  # Future type hints if needed
 
 logger = get_logger(__name__)
 
+# Decoded TransitionWorker results kept per (type, resolution, params)
+_MAX_PRECOMPUTE_CACHE_ENTRIES = 8
+
 
 # Direction maps used across multiple transition types
 SLIDE_DIRECTION_MAP = {
@@ -104,6 +115,7 @@ class TransitionFactory:
         resource_manager: Optional[ResourceManager] = None,
         compositor_checker: Optional[Callable[[], bool]] = None,
         compositor_ensurer: Optional[Callable[[], None]] = None,
+        software_pipeline_provider: Optional[Callable[[str], Optional[TransitionPipeline]]] = None,
     ):
         """Initialize the factory.
         
@@ -112,11 +124,15 @@ class TransitionFactory:
             resource_manager: Resource manager for transition lifecycle
             compositor_checker: Callable that returns True if GL compositor is available
             compositor_ensurer: Callable that ensures GL compositor is initialized
+            software_pipeline_provider: Callable returning a CPU transition
+                pipeline for a transition name when the software renderer
+                backend is active, or None otherwise
         """
         self._settings = settings_manager
         self._resources = resource_manager
         self._check_compositor = compositor_checker or (lambda: False)
         self._ensure_compositor = compositor_ensurer or (lambda: None)
+        self._software_pipeline = software_pipeline_provider or (lambda _name: None)
         
         # ProcessSupervisor for TransitionWorker integration
         self._process_supervisor: Optional[ProcessSupervisor] = None
@@ -147,6 +163,9 @@ class TransitionFactory:
         """Precompute transition data using TransitionWorker.
         
         Returns precomputed data if successful, None if worker unavailable or failed.
+        Packed block arrays come back as ``data["blocks"]`` (int32, one row per
+        ``data["block_fields"]`` entry).  Results are cached by
+        :func:`precompute_cache_key`, so repeat requests skip the round trip.
         """
         if not self._process_supervisor:
             return None
@@ -155,15 +174,19 @@ class TransitionFactory:
             if not self._process_supervisor.is_running(WorkerType.TRANSITION):
                 return None
             
-            import time
+            request_params = {
+                "screen_width": width,
+                "screen_height": height,
+                **(params or {}),
+            }
+            cache_key = precompute_cache_key(transition_type, request_params)
+            cached_data = self._precompute_cache.get(cache_key)
+            if cached_data is not None:
+                return cached_data
             
             payload = {
                 "transition_type": transition_type,
-                "params": {
-                    "screen_width": width,
-                    "screen_height": height,
-                    **(params or {}),
-                },
+                "params": request_params,
                 "use_cache": True,
             }
             
@@ -176,31 +199,41 @@ class TransitionFactory:
             if not correlation_id:
                 return None
             
-            # Poll for response with short timeout
-            start_time = time.time()
-            timeout_s = timeout_ms / 1000.0
+            # Waits without stealing other responses; a late reply is
+            # tombstoned so its shared-memory segment is still reclaimed.
+            response = self._process_supervisor.await_response(
+                WorkerType.TRANSITION,
+                correlation_id,
+                timeout_ms=timeout_ms,
+                poll_slice_ms=5,
+            )
+            if response is None:
+                return None
+            if not response.success:
+                self._process_supervisor.dispose_response(response, reason="precompute_failed")
+                return None
             
-            while (time.time() - start_time) < timeout_s:
-                responses = self._process_supervisor.poll_responses(WorkerType.TRANSITION, max_count=5)
-                
-                for response in responses:
-                    if response.correlation_id == correlation_id:
-                        if response.success:
-                            data = response.payload.get("data", {})
-                            if is_perf_metrics_enabled():
-                                proc_time = response.processing_time_ms or 0
-                                cached = response.payload.get("cached", False)
-                                logger.info(
-                                    "[PERF] [WORKER] TransitionWorker precompute: %s in %.1fms (cached=%s)",
-                                    transition_type, proc_time, cached
-                                )
-                            return data
-                        else:
-                            return None
-                
-                time.sleep(0.005)
+            data = dict(response.payload.get("data", {}))
+            if response.payload.get("shared_memory_name"):
+                data["blocks"] = self._process_supervisor.consume_shared_memory_response(
+                    response,
+                    lambda view, _descriptor: unpack_precomputed_blocks(data, view),
+                )
+            elif data.get("blocks_shape"):
+                data["blocks"] = unpack_precomputed_blocks(data)
             
-            return None
+            if is_perf_metrics_enabled():
+                proc_time = response.processing_time_ms or 0
+                cached = response.payload.get("cached", False)
+                logger.info(
+                    "[PERF] [WORKER] TransitionWorker precompute: %s in %.1fms (cached=%s)",
+                    transition_type, proc_time, cached
+                )
+            
+            self._precompute_cache[cache_key] = data
+            while len(self._precompute_cache) > _MAX_PRECOMPUTE_CACHE_ENTRIES:
+                self._precompute_cache.pop(next(iter(self._precompute_cache)))
+            return data
             
         except Exception as e:
             logger.debug("[TRANSITION_FACTORY] TransitionWorker precompute error: %s", e)
@@ -267,9 +300,13 @@ class TransitionFactory:
         easing_curve = descriptor.easing_curve
         
         # Create the appropriate transition
-        transition = self._create_by_type(
+        transition = self._create_software_transition(
             transition_type, transitions_settings, duration_ms, easing_curve
         )
+        if transition is None:
+            transition = self._create_by_type(
+                transition_type, transitions_settings, duration_ms, easing_curve
+            )
         
         if transition:
             transition.set_resource_manager(self._resources)
@@ -413,6 +450,7 @@ class TransitionFactory:
         self._process_supervisor = None
         self._check_compositor = lambda: False
         self._ensure_compositor = lambda: None
+        self._software_pipeline = lambda _name: None
         self._settings = None
         self._resources = None
     
@@ -508,6 +546,42 @@ class TransitionFactory:
         logger.warning("Unknown transition type: %s, using Crossfade", transition_type)
         return self._create_crossfade(duration_ms, easing_curve)
     
+    def _create_software_transition(
+        self,
+        transition_type: str,
+        settings: dict,
+        duration_ms: int,
+        easing_curve: EasingCurve,
+    ) -> Optional[BaseTransition]:
+        """Create a CPU-pipeline transition when the software backend is active.
+
+        Returns None when no software pipeline is available so the caller
+        falls through to the GL compositor transitions. Types without a
+        software kernel render as crossfade.
+        """
+        try:
+            pipeline = self._software_pipeline(transition_type)
+        except Exception:
+            logger.debug("[SOFTWARE] Failed to create transition pipeline", exc_info=True)
+            return None
+        if pipeline is None:
+            return None
+
+        parameters: dict = {}
+        if transition_type == 'Slide':
+            slide_settings = settings.get('slide', {}) if isinstance(settings.get('slide', {}), dict) else {}
+            parameters['direction'] = self._get_slide_direction(settings, slide_settings, 'slide')
+        elif transition_type == 'Wipe':
+            wipe_settings = settings.get('wipe', {}) if isinstance(settings.get('wipe', {}), dict) else {}
+            parameters['direction'] = self._get_wipe_direction(settings, wipe_settings)
+        elif transition_type == 'Block Puzzle Flip':
+            block_flip_settings = settings.get('block_flip', {}) if isinstance(settings.get('block_flip', {}), dict) else {}
+            rows = self._safe_int(block_flip_settings.get('rows', 4), 4)
+            cols = self._safe_int(block_flip_settings.get('cols', 6), 6)
+            parameters['grid'] = (cols, rows)
+
+        return SoftwareBackendTransition(pipeline, duration_ms, easing_curve, parameters)
+    
     # Individual transition creators
     
     def _create_crossfade(self, duration_ms: int, easing_curve: EasingCurve) -> BaseTransition:
@@ -1,6 +1,6 @@
 """Image sources for screensaver."""
 
 from .base_provider import ImageProvider, ImageMetadata, ImageSourceType
-from .folder_source import FolderSource
+from .folder_source import FolderSource, FolderDelta
 
-__all__ = ['ImageProvider', 'ImageMetadata', 'ImageSourceType', 'FolderSource']
+__all__ = ['ImageProvider', 'ImageMetadata', 'ImageSourceType', 'FolderSource', 'FolderDelta']
@@ -0,0 +1,311 @@
+"""
+Persistent incremental index for folder image sources.
+
+Stores one row per indexed directory (keyed by its mtime) and one row per
+image file in a small SQLite database under the app cache. Warm scans stat
+each known directory once and only re-enumerate directories whose mtime
+changed; unchanged directories reuse their indexed file rows without touching
+the files themselves. Enumeration uses ``os.scandir`` so the per-file stat
+data comes from the ``DirEntry`` (free on Windows, one call elsewhere).
+``iter_scan`` hands the rows out directory by directory during the walk so
+callers can start using the first images before the whole tree is visited.
+
+Directory mtimes change when entries are created, deleted or renamed, not
+when an existing file is rewritten in place, so in-place edits are picked up
+on the next rescan of that directory rather than immediately.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA_VERSION = "1"
+
+# Directory mtimes this close to the scan clock are not trusted: a file added
+# within the same filesystem timestamp tick would otherwise be missed forever.
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+_UNTRUSTED_MTIME = -1
+
+
+class IndexedFile(NamedTuple):
+    """One image file row as stored in the index."""
+    rel_dir: str
+    name: str
+    size: int
+    mtime_ns: int
+    ctime_ns: int
+
+
+@dataclass
+class FolderIndexScan:
+    """Result of a single :meth:`FolderIndex.scan` pass."""
+    entries: List[IndexedFile] = field(default_factory=list)
+    rescanned_dirs: int = 0
+    reused_dirs: int = 0
+    removed_dirs: int = 0
+    scanned_files: int = 0
+    persistent: bool = False
+    duration_s: float = 0.0
+
+
+def default_index_file(root: Path, recursive: bool) -> Path:
+    """Return the cache file used for *root* (one database per root/mode)."""
+    from core.settings.storage_paths import get_folder_index_dir
+
+    try:
+        resolved = str(root.resolve())
+    except OSError:
+        resolved = str(root)
+    digest = hashlib.sha1(f"{os.path.normcase(resolved)}|{int(bool(recursive))}".encode("utf-8")).hexdigest()
+    return get_folder_index_dir() / f"{digest[:20]}.sqlite3"
+
+
+class FolderIndex:
+    """Mtime-keyed on-disk index of the image files below one root folder."""
+
+    def __init__(
+        self,
+        root: Path,
+        extensions: Iterable[str],
+        recursive: bool = True,
+        index_file: Optional[Path] = None,
+        persistent: bool = True,
+    ):
+        """
+        Args:
+            root: Folder to index
+            extensions: Lower-case file suffixes (with leading dot) to index
+            recursive: If True, descend into subdirectories
+            index_file: Optional explicit database path (defaults to the app cache)
+            persistent: If False, keep the index in memory only (full scan each time)
+        """
+        self.root = Path(root)
+        self.recursive = bool(recursive)
+        self._extensions = frozenset(e.lower() for e in extensions)
+        self._index_file = index_file
+        self._persistent = bool(persistent)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def scan(self) -> FolderIndexScan:
+        """Bring the index up to date with the filesystem and return all entries.
+
+        Raises:
+            OSError: If the root folder itself cannot be read.
+        """
+        result = FolderIndexScan()
+        entries: List[IndexedFile] = []
+        for batch in self.iter_scan(result):
+            entries.extend(batch)
+        entries.sort()
+        result.entries = entries
+        return result
+
+    def iter_scan(self, result: Optional[FolderIndexScan] = None) -> Iterator[List[IndexedFile]]:
+        """Like :meth:`scan`, but yield each directory's rows as soon as known.
+
+        Directories reused from the index yield their stored rows, rescanned
+        ones their fresh listing. Counters and timing are written to *result*
+        when the walk finishes (its ``entries`` stay empty), and the index is
+        only committed once the iterator is exhausted; abandoning it early
+        rolls the pass back.
+
+        Raises:
+            OSError: If the root folder itself cannot be read.
+        """
+        if result is None:
+            result = FolderIndexScan()
+        start = time.perf_counter()
+        conn, persistent = self._connect()
+        try:
+            yield from self._walk(conn, result)
+            conn.commit()
+        except BaseException:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            raise
+        finally:
+            conn.close()
+        result.persistent = persistent
+        result.duration_s = time.perf_counter() - start
+
+    def clear(self) -> None:
+        """Delete the on-disk index so the next scan starts cold."""
+        if not self._persistent:
+            return
+        path = self._resolve_index_file()
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            try:
+                Path(str(path) + suffix).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug("[FOLDER_INDEX] Failed to remove %s%s: %s", path, suffix, e)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _resolve_index_file(self) -> Path:
+        if self._index_file is None:
+            self._index_file = default_index_file(self.root, self.recursive)
+        return self._index_file
+
+    def _connect(self) -> Tuple[sqlite3.Connection, bool]:
+        if self._persistent:
+            try:
+                path = self._resolve_index_file()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(path))
+                self._prepare(conn)
+                return conn, True
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("[FALLBACK] Folder index unavailable for %s, using full scan: %s", self.root, e)
+                self.clear()
+        conn = sqlite3.connect(":memory:")
+        self._prepare(conn)
+        return conn, False
+
+    def _prepare(self, conn: sqlite3.Connection) -> None:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        root_row = conn.execute("SELECT value FROM meta WHERE key = 'root'").fetchone()
+        if row is None or row[0] != SCHEMA_VERSION or root_row is None or root_row[0] != str(self.root):
+            conn.execute("DROP TABLE IF EXISTS dirs")
+            conn.execute("DROP TABLE IF EXISTS files")
+            conn.execute("DELETE FROM meta")
+            conn.execute("INSERT INTO meta (key, value) VALUES ('schema', ?)", (SCHEMA_VERSION,))
+            conn.execute("INSERT INTO meta (key, value) VALUES ('root', ?)", (str(self.root),))
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS dirs ("
+            "path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "dir TEXT NOT NULL, name TEXT NOT NULL, size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, ctime_ns INTEGER NOT NULL, "
+            "PRIMARY KEY (dir, name))"
+        )
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _walk(self, conn: sqlite3.Connection, result: FolderIndexScan) -> Iterator[List[IndexedFile]]:
+        known: Dict[str, int] = {}
+        children: Dict[str, List[str]] = defaultdict(list)
+        for path, parent, mtime_ns in conn.execute("SELECT path, parent, mtime_ns FROM dirs"):
+            known[path] = mtime_ns
+            if parent is not None:
+                children[parent].append(path)
+
+        seen: Set[str] = set()
+        visited_inodes: Set[Tuple[int, int]] = set()
+        scan_clock_ns = time.time_ns()
+        stack: List[Tuple[str, Optional[str]]] = [("", None)]
+
+        while stack:
+            rel, parent = stack.pop()
+            abs_dir = os.path.join(self.root, rel) if rel else str(self.root)
+            try:
+                st = os.stat(abs_dir)
+            except OSError as e:
+                if not rel:
+                    raise
+                logger.debug("[FOLDER_INDEX] Skipping unreadable directory %s: %s", abs_dir, e)
+                continue
+
+            inode = (st.st_dev, st.st_ino)
+            if st.st_ino and inode in visited_inodes:
+                continue
+            visited_inodes.add(inode)
+
+            previous = known.get(rel)
+            if previous is not None and previous == st.st_mtime_ns and previous != _UNTRUSTED_MTIME:
+                seen.add(rel)
+                result.reused_dirs += 1
+                if self.recursive:
+                    stack.extend((child, rel) for child in children.get(rel, ()))
+                reused = [
+                    IndexedFile(*row)
+                    for row in conn.execute(
+                        "SELECT dir, name, size, mtime_ns, ctime_ns FROM files WHERE dir = ? ORDER BY name",
+                        (rel,),
+                    )
+                ]
+                if reused:
+                    yield reused
+                continue
+
+            try:
+                files, subdirs, scanned = self._enumerate(abs_dir, rel)
+            except OSError as e:
+                if not rel:
+                    raise
+                logger.debug("[FOLDER_INDEX] Skipping unreadable directory %s: %s", abs_dir, e)
+                continue
+
+            seen.add(rel)
+            result.rescanned_dirs += 1
+            result.scanned_files += scanned
+            mtime_ns = st.st_mtime_ns
+            if scan_clock_ns - mtime_ns < RACY_MTIME_WINDOW_NS:
+                mtime_ns = _UNTRUSTED_MTIME
+            conn.execute(
+                "INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)",
+                (rel, parent, mtime_ns),
+            )
+            conn.execute("DELETE FROM files WHERE dir = ?", (rel,))
+            conn.executemany("INSERT INTO files (dir, name, size, mtime_ns, ctime_ns) VALUES (?, ?, ?, ?, ?)", files)
+            if self.recursive:
+                stack.extend((child, rel) for child in subdirs)
+            if files:
+                yield files
+
+        stale = [path for path in known if path not in seen]
+        if stale:
+            result.removed_dirs = len(stale)
+            conn.executemany("DELETE FROM files WHERE dir = ?", ((p,) for p in stale))
+            conn.executemany("DELETE FROM dirs WHERE path = ?", ((p,) for p in stale))
+
+    def _enumerate(self, abs_dir: str, rel: str) -> Tuple[List[IndexedFile], List[str], int]:
+        """List one directory, returning (image rows, child rel paths, files seen)."""
+        files: List[IndexedFile] = []
+        subdirs: List[str] = []
+        scanned = 0
+        with os.scandir(abs_dir) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        if self.recursive:
+                            subdirs.append(os.path.join(rel, entry.name) if rel else entry.name)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    scanned += 1
+                    if os.path.splitext(entry.name)[1].lower() not in self._extensions:
+                        continue
+                    est = entry.stat()
+                except OSError as e:
+                    logger.debug("[FOLDER_INDEX] Error reading entry %s: %s", entry.path, e)
+                    continue
+                files.append(IndexedFile(rel, entry.name, est.st_size, est.st_mtime_ns, est.st_ctime_ns))
+        return files, subdirs, scanned
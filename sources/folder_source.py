@@ -5,9 +5,11 @@ Scans local directories for image files.
 """
 import os
 from pathlib import Path
-from typing import List, Set
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set
 from datetime import datetime
 from sources.base_provider import ImageProvider, ImageMetadata, ImageSourceType
+from sources.folder_index import FolderIndex, FolderIndexScan, IndexedFile
 from core.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +26,19 @@ SUPPORTED_EXTENSIONS = {
     '.jfif',          # JPEG File Interchange Format
 }
 
+# Images per batch handed out by FolderSource.iter_image_batches()
+SCAN_BATCH_SIZE = 256
+
+
+@dataclass
+class FolderDelta:
+    """Images added to / removed from a folder since the previous scan."""
+    added: List[ImageMetadata] = field(default_factory=list)
+    removed: List[ImageMetadata] = field(default_factory=list)
+    
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
 
 class FolderSource(ImageProvider):
     """
@@ -33,11 +48,14 @@ class FolderSource(ImageProvider):
     - Recursive or non-recursive scanning
     - Supports all common image formats
     - Caches scan results
+    - Persistent mtime-keyed index for fast warm rescans
+    - Batched results while a scan is still walking the tree
     - Handles permission errors gracefully
     """
     
     def __init__(self, folder_path: str | Path, recursive: bool = True, 
-                 source_id: str = None):
+                 source_id: str = None, index_file: Optional[Path] = None,
+                 use_index: bool = True):
         """
         Initialize folder source.
         
@@ -45,6 +63,8 @@ class FolderSource(ImageProvider):
             folder_path: Path to folder to scan
             recursive: If True, scan subdirectories recursively
             source_id: Optional custom source ID (defaults to folder name)
+            index_file: Optional explicit path for the persistent folder index
+            use_index: If False, keep the index in memory (full scan each refresh)
         """
         self.folder_path = Path(folder_path)
         self.recursive = recursive
@@ -56,7 +76,15 @@ class FolderSource(ImageProvider):
         super().__init__(source_id, ImageSourceType.FOLDER)
         
         self._images: List[ImageMetadata] = []
+        self._by_path: Dict[str, ImageMetadata] = {}
         self._last_scan: datetime | None = None
+        self._index = FolderIndex(
+            self.folder_path,
+            SUPPORTED_EXTENSIONS,
+            recursive=recursive,
+            index_file=index_file,
+            persistent=use_index,
+        )
         
         self._logger.info(f"Created FolderSource for '{self.folder_path}' "
                          f"(recursive={recursive})")
@@ -81,60 +109,108 @@ class FolderSource(ImageProvider):
         Returns:
             True if scan was successful, False otherwise
         """
+        return self.refresh_delta() is not None
+    
+    def iter_image_batches(self, batch_size: int = SCAN_BATCH_SIZE) -> Iterator[List[ImageMetadata]]:
+        """
+        Scan the folder, yielding images in batches while the walk runs.
+        
+        Same scan as refresh_delta() and it updates the same cache once the
+        walk finishes, but the first images reach the caller as soon as
+        *batch_size* of them are known instead of after the whole tree.
+        Nothing is yielded if the folder is unavailable or the scan fails.
+        
+        Args:
+            batch_size: Images per batch (the last one may be smaller)
+        
+        Yields:
+            Lists of ImageMetadata in scan order
+        """
         if not self.is_available():
             self._logger.error(f"Folder not available: {self.folder_path}")
-            return False
+            return
         
-        self._logger.info(f"Scanning folder: {self.folder_path}")
-        start_time = datetime.now()
+        try:
+            yield from self._scan_batches(FolderDelta(), max(1, int(batch_size)))
+        except PermissionError as e:
+            self._logger.error(f"Permission denied accessing {self.folder_path}: {e}")
+        except Exception as e:
+            self._logger.error(f"Error scanning folder: {e}", exc_info=True)
+    
+    def refresh_delta(self) -> Optional[FolderDelta]:
+        """
+        Rescan the folder and report what changed since the previous scan.
+        
+        Uses the persistent folder index, so only directories whose mtime
+        changed since the last run are re-enumerated. The first call after
+        construction reports every image as added; a file whose size or
+        mtime changed is reported as removed and re-added.
         
+        Returns:
+            FolderDelta with added/removed images, or None if the scan failed
+        """
+        if not self.is_available():
+            self._logger.error(f"Folder not available: {self.folder_path}")
+            return None
+        
+        delta = FolderDelta()
         try:
-            images = []
-            scanned_files = 0
-            found_images = 0
-            
-            # Choose scanning method
-            if self.recursive:
-                pattern = '**/*'
-            else:
-                pattern = '*'
-            
-            # Scan for image files
-            for file_path in self.folder_path.glob(pattern):
-                if not file_path.is_file():
-                    continue
-                
-                scanned_files += 1
-                
-                # Check if file is an image
-                if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
-                    continue
-                
-                # Create metadata
-                try:
-                    metadata = self._create_metadata(file_path)
-                    images.append(metadata)
-                    found_images += 1
-                except Exception as e:
-                    self._logger.warning(f"Error processing {file_path}: {e}")
-                    continue
-            
-            # Update cache
-            self._images = images
-            self._last_scan = datetime.now()
-            
-            scan_duration = (datetime.now() - start_time).total_seconds()
-            self._logger.info(f"Scan complete: {found_images} images found "
-                            f"({scanned_files} files scanned) in {scan_duration:.2f}s")
-            
-            return True
-            
+            for _ in self._scan_batches(delta, SCAN_BATCH_SIZE):
+                pass
         except PermissionError as e:
             self._logger.error(f"Permission denied accessing {self.folder_path}: {e}")
-            return False
+            return None
         except Exception as e:
             self._logger.error(f"Error scanning folder: {e}", exc_info=True)
-            return False
+            return None
+        return delta
+    
+    def _scan_batches(self, delta: FolderDelta, batch_size: int) -> Iterator[List[ImageMetadata]]:
+        """Walk the index, yielding images in batches and filling *delta*.
+        
+        The cache is only replaced once the walk completes.
+        """
+        self._logger.info(f"Scanning folder: {self.folder_path}")
+        
+        scan = FolderIndexScan()
+        previous = self._by_path
+        current: Dict[str, ImageMetadata] = {}
+        images: List[ImageMetadata] = []
+        pending: List[ImageMetadata] = []
+        for entries in self._index.iter_scan(scan):
+            for entry in entries:
+                file_path = self.folder_path / entry.rel_dir / entry.name
+                key = str(file_path)
+                metadata = previous.get(key)
+                if metadata is None or not self._metadata_matches(metadata, entry):
+                    try:
+                        metadata = self._create_metadata_from_entry(file_path, entry)
+                    except Exception as e:
+                        self._logger.warning(f"Error processing {file_path}: {e}")
+                        continue
+                    delta.added.append(metadata)
+                current[key] = metadata
+                images.append(metadata)
+                pending.append(metadata)
+            if len(pending) >= batch_size:
+                yield pending
+                pending = []
+        if pending:
+            yield pending
+        # Files rewritten in place come back as a new entry, so their old
+        # metadata is reported as removed alongside the re-added one.
+        delta.removed = [img for key, img in previous.items() if current.get(key) is not img]
+        
+        # Update cache
+        self._images = images
+        self._by_path = current
+        self._last_scan = datetime.now()
+        
+        self._logger.info(
+            f"Scan complete: {len(images)} images found (+{len(delta.added)}/-{len(delta.removed)}, "
+            f"{scan.rescanned_dirs} dirs rescanned, {scan.reused_dirs} reused from index, "
+            f"{scan.scanned_files} files scanned) in {scan.duration_s:.2f}s"
+        )
     
     def is_available(self) -> bool:
         """
@@ -149,6 +225,38 @@ class FolderSource(ImageProvider):
             self._logger.debug(f"Error checking folder availability: {e}")
             return False
     
+    @staticmethod
+    def _metadata_matches(metadata: ImageMetadata, entry: IndexedFile) -> bool:
+        """True if cached metadata still describes the file in *entry*."""
+        return (
+            metadata.file_size == entry.size
+            and metadata.modified_date == datetime.fromtimestamp(entry.mtime_ns / 1e9)
+        )
+    
+    def _create_metadata_from_entry(self, file_path: Path, entry: IndexedFile) -> ImageMetadata:
+        """
+        Create ImageMetadata from an index row without touching the file.
+        
+        Args:
+            file_path: Absolute path to image file
+            entry: Index row carrying the cached stat data
+        
+        Returns:
+            ImageMetadata object
+        """
+        image_id = f"{entry.rel_dir}/{entry.name}" if entry.rel_dir else entry.name
+        return ImageMetadata(
+            source_type=ImageSourceType.FOLDER,
+            source_id=self.source_id,
+            image_id=image_id.replace('\\', '/'),
+            local_path=file_path,
+            title=file_path.stem,
+            file_size=entry.size,
+            format=file_path.suffix[1:].lower(),
+            created_date=datetime.fromtimestamp(entry.ctime_ns / 1e9),
+            modified_date=datetime.fromtimestamp(entry.mtime_ns / 1e9),
+        )
+    
     def _create_metadata(self, file_path: Path) -> ImageMetadata:
         """
         Create ImageMetadata for a file.
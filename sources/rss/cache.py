@@ -2,14 +2,16 @@
 RSSCache - Disk cache with ResourceManager integration.
 
 Responsibilities:
-    - Load cached images from disk on startup (up to MAX_CACHED_IMAGES_TO_LOAD)
-    - Validate image integrity (header bytes, minimum size)
+    - Load cached images from the asset-store index on startup (up to
+      MAX_CACHED_IMAGES_TO_LOAD) without touching the files
+    - Validate legacy loose files (header bytes, minimum size) once on adoption
     - Track cached image metadata (ImageMetadata list)
     - Evict oldest images when size or count limits are exceeded
     - Register with ResourceManager for deterministic cleanup
     - Report current cached count for dynamic download budget
 """
 import hashlib
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional, Set
@@ -22,6 +24,7 @@ from sources.rss.constants import (
     DEFAULT_MAX_CACHE_SIZE_MB,
 )
 from core.logging.logger import get_logger
+from core.resources.asset_store import IMAGE_SUFFIXES, AssetNamespace, namespace_for_directory
 
 logger = get_logger(__name__)
 
@@ -43,9 +46,14 @@ class RSSCache:
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.max_cache_size = max_cache_size_mb * 1024 * 1024
-
-        # Copy-on-write: IO thread creates new list on add(), UI thread
-        # reads the reference atomically.  No locks needed.
+        # Images live in the shared content-addressed store; cache_dir only
+        # holds in-flight downloads (and legacy files awaiting adoption).
+        self._assets = namespace_for_directory(self.cache_dir)
+
+        # Copy-on-write: IO threads create a new list on add(), the UI
+        # thread reads the reference atomically.  Concurrent feed lanes
+        # serialise their copy+swap on _write_lock so no add is lost.
+        self._write_lock = threading.Lock()
         self._images: List[ImageMetadata] = []
         self._cached_urls: Set[str] = set()
         self._resource_id: Optional[str] = None
@@ -81,83 +89,68 @@ class RSSCache:
         return {str(img.local_path) for img in self._images if img.local_path}
 
     def add(self, metadata: ImageMetadata) -> None:
-        """Add a single image via copy-on-write (thread-safe, lock-free)."""
-        new_list = list(self._images)
-        new_list.append(metadata)
-        self._images = new_list  # atomic reference swap
+        """Add a single image via copy-on-write (lock-free for readers)."""
+        with self._write_lock:
+            new_list = list(self._images)
+            new_list.append(metadata)
+            self._images = new_list  # atomic reference swap
+
+    @property
+    def assets(self) -> AssetNamespace:
+        """This cache's namespace in the shared asset store."""
+        return self._assets
 
     def load_from_disk(self) -> int:
-        """Load cached images from disk for instant startup availability.
+        """Load cached images from the asset index for instant startup availability.
 
-        Validates each file and returns the number of valid images loaded.
+        Enumeration is an index query: no cached file is stat'ed or opened.
+        Loose files left in the legacy cache directory are validated and
+        adopted into the store once.  Returns the number of images loaded.
         """
         try:
-            if not self.cache_dir.exists():
-                return 0
+            adopted = self._assets.adopt_legacy_files(accept=self._accept_legacy_file)
+            if adopted:
+                logger.info(f"[RSS_CACHE] Migrated {adopted} cached images into the asset store")
 
-            pending: List[ImageMetadata] = []
-            image_extensions = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
-            cached_files = [
-                f for f in self.cache_dir.glob("*")
-                if f.is_file() and f.suffix.lower() in image_extensions
-            ]
-
-            if not cached_files:
+            records = self._assets.entries(limit=MAX_CACHED_IMAGES_TO_LOAD)
+            if not records:
                 return 0
 
-            # Newest first for freshness
-            cached_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            cached_files = cached_files[:MAX_CACHED_IMAGES_TO_LOAD]
-
-            valid = 0
-            removed = 0
-
-            for cache_file in cached_files:
-                try:
-                    file_size = cache_file.stat().st_size
-                    if file_size < 100:
-                        cache_file.unlink()
-                        removed += 1
-                        continue
-
-                    if not self._validate_image_header(cache_file):
-                        cache_file.unlink()
-                        removed += 1
-                        continue
-
-                    meta = ImageMetadata(
+            pending: List[ImageMetadata] = []
+            for record in records:
+                pending.append(
+                    ImageMetadata(
                         source_type=ImageSourceType.RSS,
                         source_id="cached",
-                        image_id=cache_file.name,
-                        local_path=cache_file,
-                        title=cache_file.stem,
-                        fetched_date=datetime.utcfromtimestamp(cache_file.stat().st_mtime),
-                        file_size=file_size,
-                        format=cache_file.suffix[1:].upper(),
+                        image_id=f"{record.key}.{record.ext}",
+                        local_path=record.path,
+                        title=record.key,
+                        fetched_date=datetime.utcfromtimestamp(record.created),
+                        file_size=record.size,
+                        format=record.ext.upper(),
                     )
-                    pending.append(meta)
-                    self._cached_urls.add(cache_file.stem)
-                    valid += 1
-
-                except Exception as e:
-                    logger.debug(f"[RSS_CACHE] Skipping {cache_file.name}: {e}")
+                )
+                self._cached_urls.add(record.key)
 
             # Atomic swap - all cached images appear at once
-            if pending:
-                self._images = pending
-
-            if removed:
-                logger.info(f"[RSS_CACHE] Removed {removed} corrupt cached images")
-            logger.info(f"[RSS_CACHE] Loaded {valid} cached images from disk")
-            return valid
+            self._images = pending
+            logger.info(f"[RSS_CACHE] Loaded {len(pending)} cached images from disk")
+            return len(pending)
 
         except Exception as e:
             logger.error(f"[RSS_CACHE] Failed to load cached images: {e}")
             return 0
 
     def get_cache_path(self, image_url: str) -> Path:
-        """Return expected cache path for a URL (does not download)."""
+        """Return the stored path for a URL, or where its download will land.
+
+        Does not download.  Indexed URLs resolve to their blob so duplicate
+        claims match the ``local_path`` of already-published images.
+        """
         url_hash = hashlib.md5(image_url.encode()).hexdigest()
+        record = self._assets.get(url_hash, touch=False)
+        if record is not None:
+            return record.path
         parsed = urlparse(image_url)
         ext = Path(parsed.path).suffix or ".jpg"
         return self.cache_dir / f"{url_hash}{ext}"
@@ -171,60 +164,40 @@ class RSSCache:
         self._cached_urls.add(url_hash)
 
     def cleanup(self, min_keep: int = MIN_CACHE_BEFORE_CLEANUP) -> None:
-        """Evict oldest files when cache exceeds size or count limits."""
-        try:
-            cache_files = []
-            total_size = 0
-
-            for f in self.cache_dir.glob("*"):
-                if f.is_file() and not f.name.startswith(".tmp."):
-                    size = f.stat().st_size
-                    mtime = f.stat().st_mtime
-                    cache_files.append((f, size, mtime))
-                    total_size += size
+        """Evict least-recently-used entries beyond the count and size limits.
 
+        The shared store enforces the global byte budget on every put; this
+        additionally keeps the RSS namespace within its own caps.
+        """
+        try:
+            count, total_size = self._assets.stats()
             max_files = max(min_keep * 2, MAX_CACHED_IMAGES_TO_LOAD)
-            size_ok = total_size <= self.max_cache_size
-            count_ok = len(cache_files) <= max_files
-
-            if size_ok and count_ok:
+            if total_size <= self.max_cache_size and count <= max_files:
                 return
 
-            cache_files.sort(key=lambda x: x[2])  # oldest first
-            max_removable = max(0, len(cache_files) - min_keep)
-            removed_count = 0
-            removed_size = 0
-            current_count = len(cache_files)
-
-            for i, (file, size, _) in enumerate(cache_files):
-                if i >= max_removable:
-                    break
-                if (total_size - removed_size) <= self.max_cache_size * 0.8 and \
-                   (current_count - removed_count) <= max_files:
-                    break
-                try:
-                    file.unlink()
-                    removed_count += 1
-                    removed_size += size
-                except Exception as e:
-                    logger.warning(f"[RSS_CACHE] Failed to remove {file}: {e}")
-
+            keep = min(count, max_files)
+            if total_size > self.max_cache_size and count:
+                # Average-size estimate of how many entries fit in 80% of the cap.
+                keep = min(keep, int(count * self.max_cache_size * 0.8 / total_size))
+            removed_count = self._assets.trim(max(min_keep, keep))
             if removed_count:
+                _count, remaining_size = self._assets.stats()
                 logger.info(
                     f"[RSS_CACHE] Evicted {removed_count} files "
-                    f"({removed_size / 1024 / 1024:.1f}MB), "
-                    f"kept {len(cache_files) - removed_count}"
+                    f"({(total_size - remaining_size) / 1024 / 1024:.1f}MB), "
+                    f"kept {count - removed_count}"
                 )
 
         except Exception as e:
             logger.error(f"[RSS_CACHE] Cleanup failed: {e}")
 
     def clear_all(self) -> int:
-        """Remove every cached file. Returns count removed."""
+        """Remove every cached image. Returns count removed."""
         removed = 0
         try:
+            removed, _freed = self._assets.clear()
             for f in self.cache_dir.glob("*"):
-                if f.is_file():
+                if f.is_file() and f.suffix.lower() in IMAGE_SUFFIXES:
                     f.unlink()
                     removed += 1
         except Exception as e:
@@ -237,6 +210,13 @@ class RSSCache:
     # Internals
     # ------------------------------------------------------------------
 
+    @classmethod
+    def _accept_legacy_file(cls, path: Path) -> bool:
+        try:
+            return path.stat().st_size >= 100 and cls._validate_image_header(path)
+        except OSError:
+            return False
+
     @staticmethod
     def _validate_image_header(path: Path) -> bool:
         """Quick validation via magic bytes."""
@@ -72,12 +72,21 @@ HIGH_QUALITY_FALLBACK_DOMAINS = (
 MAX_CACHED_IMAGES_TO_LOAD = 35   # Startup cache ceiling
 MIN_CACHE_BEFORE_CLEANUP = 20    # Don't evict until we have at least 20
 DEFAULT_MAX_CACHE_SIZE_MB = 500  # On-disk cache size cap
+# Parsed entries kept per feed for conditional (304) refreshes.  Larger than
+# any per-feed download limit so a cached list can serve every caller.
+MAX_CACHED_FEED_ENTRIES = 25
 
 # ---------------------------------------------------------------------------
 # Domain-based rate limiting (applies to all domains)
 # ---------------------------------------------------------------------------
 DOMAIN_RATE_LIMIT_PER_MINUTE = 15
 DOMAIN_RATE_LIMIT_WINDOW = 60.0  # seconds
+DOMAIN_MAX_CONCURRENT_REQUESTS = 2  # In-flight requests per host
+
+# ---------------------------------------------------------------------------
+# Concurrency
+# ---------------------------------------------------------------------------
+MAX_CONCURRENT_FEED_FETCHES = 4  # Feed lanes (caller thread + IO pool tasks)
 
 # ---------------------------------------------------------------------------
 # Feed health / backoff
@@ -5,12 +5,15 @@ Responsibilities:
     - State machine: IDLE → LOADING → LOADED → ERROR
     - Dynamic download budget based on cache size vs startup target
     - Orchestrate cache, parser, downloader, and health tracker
+    - Revalidate feeds with ETag / Last-Modified and reuse parsed entries on 304
     - Provide clean API for screensaver_engine (replaces raw RSSSource usage)
     - No time.sleep() in main flow - delegates to downloader's interruptible waits
-    - ThreadManager integration for async loading
+    - ThreadManager integration for async loading and bounded concurrent
+      feed fetches (images are published as each feed completes)
     - ResourceManager integration via RSSCache
 """
 import threading
+from collections import deque
 from enum import Enum, auto
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +26,8 @@ from sources.rss.constants import (
     MAX_PER_FEED_DOWNLOAD,
     MIN_PER_FEED_DOWNLOAD,
     MAX_REDDIT_FEEDS_PER_STARTUP,
+    MAX_CONCURRENT_FEED_FETCHES,
+    MAX_CACHED_FEED_ENTRIES,
     DEFAULT_TIMEOUT_SECONDS,
     DEFAULT_MAX_CACHE_SIZE_MB,
     MIN_WALLPAPER_REFRESH_TARGET,
@@ -34,6 +39,7 @@ from sources.rss.cache import RSSCache
 from sources.rss.parser import RSSParser, ParsedEntry
 from sources.rss.downloader import RSSDownloader
 from sources.rss.health import FeedHealthTracker
+from sources.rss.feed_cache import FeedResponseCache
 from core.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -47,6 +53,34 @@ class RSSState(Enum):
     ERROR = auto()
 
 
+class _FeedBudget:
+    """Thread-safe download budget shared by concurrent feed lanes.
+
+    A lane reserves its per-feed limit up front and refunds whatever the feed
+    did not fill, so concurrent feeds can never overshoot the total.
+    """
+
+    def __init__(self, total: int):
+        self._lock = threading.Lock()
+        self._remaining = max(0, int(total))
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return self._remaining
+
+    def reserve(self, limit: int) -> int:
+        with self._lock:
+            granted = max(0, min(int(limit), self._remaining))
+            self._remaining -= granted
+            return granted
+
+    def refund(self, unused: int) -> None:
+        if unused > 0:
+            with self._lock:
+                self._remaining += unused
+
+
 class RSSCoordinator:
     """Orchestrates the full RSS image pipeline.
 
@@ -107,6 +141,12 @@ class RSSCoordinator:
             shutdown_check=shutdown_check,
         )
         self._health = FeedHealthTracker()
+        self._feed_cache = FeedResponseCache()
+
+        # Guards the shared existing-paths set while lanes claim downloads,
+        # and serialises the per-feed publish callback.
+        self._dedup_lock = threading.Lock()
+        self._publish_lock = threading.Lock()
 
         # NOTE: load_from_disk() is NOT called here to avoid blocking
         # the UI thread.  Call warm_cache() explicitly or let load_async()
@@ -163,7 +203,10 @@ class RSSCoordinator:
         """Start async loading on the IO thread pool.
 
         Args:
-            on_images: Callback invoked with newly downloaded images (on IO thread).
+            on_images: Callback invoked on an IO thread, never concurrently.
+                It is called once with ``[]`` as soon as the disk cache is
+                warm (so the engine can pre-load cached images), then once
+                per feed with that feed's new images as each one completes.
         """
         if self._thread_manager is None:
             logger.warning("[RSS_COORD] No ThreadManager, falling back to sync load")
@@ -175,11 +218,11 @@ class RSSCoordinator:
 
         def _task():
             self.warm_cache()  # disk I/O on IO thread, not UI thread
-            new_images = self._load_feeds()
             if on_images:
-                on_images(new_images)  # always call so engine can pre-load cache
+                self._publish(on_images, [])
+            self._load_feeds(on_feed_images=on_images)
 
-        self._thread_manager.submit_io_task(_task)
+        self._thread_manager.submit_io_task(_task, category="rss.load")
 
     def load_sync(self) -> List[ImageMetadata]:
         """Synchronous load - blocks until complete. Returns new images."""
@@ -202,16 +245,31 @@ class RSSCoordinator:
         """Signal all sub-modules to abort immediately."""
         self._downloader.request_stop()
 
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self._downloader.close()
+
     def get_feed_health(self) -> dict:
-        return self._health.get_status(self.feed_urls)
+        status = self._health.get_status(self.feed_urls)
+        for url, entry in status.items():
+            entry.update(self._feed_cache.get_status(url))
+        return status
 
     # ------------------------------------------------------------------
     # Core loading logic
     # ------------------------------------------------------------------
 
-    def _load_feeds(self) -> List[ImageMetadata]:
+    def _load_feeds(
+        self,
+        on_feed_images: Optional[Callable[[List[ImageMetadata]], None]] = None,
+    ) -> List[ImageMetadata]:
         """Load images from all feeds respecting dynamic limits.
 
+        Feeds are fetched by up to ``MAX_CONCURRENT_FEED_FETCHES`` lanes; the
+        downloader keeps per-domain spacing and the shared budget keeps the
+        total within ``new_needed``.  ``on_feed_images`` (if given) receives
+        each feed's new images as soon as that feed finishes.
+
         Returns list of newly downloaded ImageMetadata (not cached ones).
         """
         self._set_state(RSSState.LOADING)
@@ -259,47 +317,54 @@ class RSSCoordinator:
 
         existing_paths = self._cache.existing_paths()
         all_new: List[ImageMetadata] = []
-        total_budget_remaining = new_needed
+        results_lock = threading.Lock()
+        budget = _FeedBudget(new_needed)
+        total_feeds = len(urls_to_process)
 
-        for i, feed_url in enumerate(urls_to_process):
+        def _fetch_feed(position: int, feed_url: str) -> None:
             if not self._should_continue():
-                logger.info("[RSS_COORD] Shutdown requested, aborting load")
-                break
-
-            if total_budget_remaining <= 0:
-                logger.info(f"[RSS_COORD] Budget exhausted after {i} feeds")
-                break
+                return
 
             # Skip unhealthy feeds
             if self._health.should_skip(feed_url):
                 logger.debug(f"[RSS_COORD] Skipping unhealthy feed: {feed_url[:60]}")
-                continue
+                return
 
-            feed_limit = min(per_feed, total_budget_remaining)
-            logger.info(f"[RSS_COORD] Feed {i+1}/{len(urls_to_process)}: {feed_url[:60]}... (limit={feed_limit})")
+            feed_limit = budget.reserve(per_feed)
+            if feed_limit <= 0:
+                logger.debug(f"[RSS_COORD] Budget exhausted, skipping feed {position+1}/{total_feeds}")
+                return
+            logger.info(f"[RSS_COORD] Feed {position+1}/{total_feeds}: {feed_url[:60]}... (limit={feed_limit})")
 
             new_images = self._process_single_feed(feed_url, feed_limit, existing_paths)
+            budget.refund(feed_limit - len(new_images))
 
             if new_images:
-                all_new.extend(new_images)
-                total_budget_remaining -= len(new_images)
-                # Update existing paths for dedup across feeds
-                for img in new_images:
-                    if img.local_path:
-                        existing_paths.add(str(img.local_path))
+                with results_lock:
+                    all_new.extend(new_images)
                 self._health.record_success(feed_url)
+                if on_feed_images:
+                    self._publish(on_feed_images, new_images)
             else:
                 is_reddit = "reddit.com" in feed_url.lower()
                 if is_reddit:
                     self._health.record_failure(feed_url)
 
+        self._run_feed_lanes(list(enumerate(urls_to_process)), _fetch_feed)
+
+        if not self._should_continue():
+            logger.info("[RSS_COORD] Shutdown requested, aborting load")
+
         # Fallback: ensure we have a minimum pool of wallpaper-quality images by
         # leaning on high-quality feeds (Bing/NASA) when other feeds underfill.
+        fetched = len(all_new)
         all_new = self._top_up_with_high_quality_feeds(
             all_new,
             urls_to_process,
             existing_paths,
         )
+        if on_feed_images and len(all_new) > fetched:
+            self._publish(on_feed_images, all_new[fetched:])
 
         # Cleanup cache if we added images and cache is large enough
         if all_new and self._cache.count > 20:
@@ -311,6 +376,77 @@ class RSSCoordinator:
         )
         return all_new
 
+    def _run_feed_lanes(self, jobs: list, run_job: Callable) -> None:
+        """Run ``run_job(*job)`` for every job on up to N concurrent lanes.
+
+        The calling thread is always one of the lanes, so progress never
+        depends on a free IO worker (the load itself already occupies one)
+        and nested waits cannot deadlock the pool.  Helper lanes that only
+        start after the caller has drained the queue exit immediately.
+        """
+        pending = deque(jobs)
+        lanes = min(MAX_CONCURRENT_FEED_FETCHES, len(pending))
+        done = threading.Condition()
+        active = [0]
+        closed = [False]
+
+        def _drain() -> None:
+            while self._should_continue():
+                try:
+                    job = pending.popleft()
+                except IndexError:
+                    return
+                try:
+                    run_job(*job)
+                except Exception as e:
+                    logger.error(f"[RSS_COORD] Feed lane error: {e}")
+
+        def _helper_lane() -> None:
+            with done:
+                if closed[0]:
+                    return
+                active[0] += 1
+            try:
+                _drain()
+            finally:
+                with done:
+                    active[0] -= 1
+                    done.notify_all()
+
+        if self._thread_manager is not None:
+            for _ in range(lanes - 1):
+                try:
+                    self._thread_manager.submit_io_task(_helper_lane, category="rss.feed_fetch")
+                except Exception as e:
+                    logger.debug(f"[RSS_COORD] Feed lane submit failed, continuing inline: {e}")
+                    break
+
+        _drain()
+
+        with done:
+            closed[0] = True
+            while active[0] > 0:
+                done.wait()
+
+    def _publish(self, callback: Callable[[List[ImageMetadata]], None], images: List[ImageMetadata]) -> None:
+        with self._publish_lock:
+            try:
+                callback(images)
+            except Exception as e:
+                logger.error(f"[RSS_COORD] Image callback failed: {e}")
+
+    def _claim_path(self, path: str, existing_paths: Set[str]) -> bool:
+        """Atomically reserve *path* so concurrent feeds never fetch it twice."""
+        with self._dedup_lock:
+            if path in existing_paths:
+                return False
+            existing_paths.add(path)
+            return True
+
+    def _release_path(self, path: str, existing_paths: Set[str]) -> None:
+        with self._dedup_lock:
+            existing_paths.discard(path)
+
     def _process_single_feed(
         self,
         feed_url: str,
@@ -321,20 +457,8 @@ class RSSCoordinator:
         if not self._should_continue():
             return []
 
-        request_url, mode, original_url = RSSParser.resolve_feed_mode(feed_url)
-        entries: List[ParsedEntry] = []
-
         try:
-            if mode == "json":
-                data = self._downloader.fetch_json(request_url)
-                if data is not None:
-                    entries = RSSParser.parse_json(data, original_url, max_entries=max_images)
-            else:
-                feed_data = self._downloader.fetch_rss(request_url)
-                if feed_data is not None:
-                    if feed_data.bozo:
-                        logger.warning(f"[RSS_COORD] Feed has parsing errors: {feed_url[:60]}")
-                    entries = RSSParser.parse_rss(feed_data, feed_url, max_entries=max_images)
+            entries = self._fetch_entries(feed_url, max_images)
         except Exception as e:
             logger.error(f"[RSS_COORD] Feed fetch/parse failed: {feed_url[:60]} - {e}")
             return []
@@ -350,15 +474,16 @@ class RSSCoordinator:
             if len(new_images) >= max_images:
                 break
 
-            # Dedup check
+            # Dedup check (claimed up front; other lanes share the set)
             expected_path = str(self._cache.get_cache_path(entry.image_url))
-            if expected_path in existing_paths:
+            if not self._claim_path(expected_path, existing_paths):
                 continue
 
             cached_path = self._downloader.download_image(
-                entry.image_url, self._cache.cache_dir
+                entry.image_url, self._cache.cache_dir, store=self._cache.assets
             )
             if not cached_path:
+                self._release_path(expected_path, existing_paths)
                 continue
 
             # Save to permanent storage if configured
@@ -389,6 +514,41 @@ class RSSCoordinator:
 
         return new_images
 
+    def _fetch_entries(self, feed_url: str, max_images: int) -> List[ParsedEntry]:
+        """Fetch and parse *feed_url*, serving cached entries on a 304.
+
+        Full responses are parsed to ``MAX_CACHED_FEED_ENTRIES`` so the
+        cached list can serve any later limit; callers get the first
+        *max_images* entries either way.
+        """
+        request_url, mode, original_url = RSSParser.resolve_feed_mode(feed_url)
+        etag, last_modified = self._feed_cache.validators(feed_url)
+
+        result = self._downloader.fetch_feed(request_url, mode, etag, last_modified)
+        if result is None:
+            return []
+
+        if result.not_modified:
+            cached = self._feed_cache.not_modified(feed_url, max_images)
+            if cached is not None:
+                logger.debug(f"[RSS_COORD] Feed not modified, reusing {len(cached)} entries: {feed_url[:60]}")
+                return cached
+            # Entries vanished since the request went out: fetch unconditionally.
+            result = self._downloader.fetch_feed(request_url, mode)
+            if result is None or result.not_modified:
+                return []
+
+        parse_limit = max(max_images, MAX_CACHED_FEED_ENTRIES)
+        if mode == "json":
+            entries = RSSParser.parse_json(result.data, original_url, max_entries=parse_limit)
+        else:
+            if result.data.bozo:
+                logger.warning(f"[RSS_COORD] Feed has parsing errors: {feed_url[:60]}")
+            entries = RSSParser.parse_rss(result.data, feed_url, max_entries=parse_limit)
+
+        self._feed_cache.store(feed_url, entries, result.etag, result.last_modified)
+        return entries[:max_images]
+
     # ------------------------------------------------------------------
     # Fallback helpers
     # ------------------------------------------------------------------
@@ -443,9 +603,6 @@ class RSSCoordinator:
 
             current_new.extend(extra_images)
             deficit -= len(extra_images)
-            for img in extra_images:
-                if img.local_path:
-                    existing_paths.add(str(img.local_path))
 
         return current_new
 
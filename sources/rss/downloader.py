@@ -3,8 +3,10 @@ RSSDownloader - Shutdown-aware network I/O with domain rate limiting.
 
 Responsibilities:
     - Fetch RSS feeds (via feedparser) and JSON feeds (via requests)
+    - Conditional feed requests (If-None-Match / If-Modified-Since)
     - Download individual images with atomic write (temp → rename)
-    - Domain-based rate limiting (shared state per instance, sequential processing)
+    - Domain-based rate limiting shared by concurrent feed lanes
+    - Pooled keep-alive HTTP sessions, one per host
     - Shutdown checks before and during every network call
     - No time.sleep() - returns wait times for coordinator to handle
     - Reddit rate limiter coordination for Reddit feeds
@@ -15,28 +17,48 @@ import hashlib
 import shutil
 import threading
 import requests
+from requests.adapters import HTTPAdapter
 import feedparser
 from pathlib import Path
-from typing import Optional, Callable
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
 from urllib.parse import urlparse
 
 from sources.rss.constants import (
+    DOMAIN_MAX_CONCURRENT_REQUESTS,
     DOMAIN_RATE_LIMIT_PER_MINUTE,
     DOMAIN_RATE_LIMIT_WINDOW,
     DEFAULT_TIMEOUT_SECONDS,
+    MAX_CONCURRENT_FEED_FETCHES,
 )
 from core.logging.logger import get_logger
 from core.constants import MIN_WALLPAPER_WIDTH, MIN_WALLPAPER_HEIGHT
 from PySide6.QtGui import QImageReader
 
+if TYPE_CHECKING:
+    from core.resources.asset_store import AssetNamespace
+
 logger = get_logger(__name__)
 
 
+class FeedFetch(NamedTuple):
+    """Outcome of :meth:`RSSDownloader.fetch_feed`."""
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    not_modified: bool = False
+
+
+def _header(resp, name: str) -> Optional[str]:
+    value = resp.headers.get(name)
+    return value if isinstance(value, str) and value else None
+
+
 class RSSDownloader:
     """Handles all network I/O for the RSS system.
 
-    Designed for sequential, single-threaded use on an IO pool thread.
-    No locks needed - only one feed is processed at a time.
+    Shared by the coordinator's concurrent feed lanes.  Rate-limit state and
+    the per-host session table are guarded by ``_lock``; each host also
+    admits at most ``DOMAIN_MAX_CONCURRENT_REQUESTS`` requests at a time.
     """
 
     def __init__(
@@ -47,8 +69,12 @@ class RSSDownloader:
         self.timeout = timeout
         self._shutdown_check = shutdown_check
         self._stop_event = threading.Event()
+        self._lock = threading.Lock()
         # Domain rate limiting: {domain: [timestamp, ...]}
         self._domain_requests: dict = {}
+        self._domain_slots: dict = {}
+        # Keep-alive sessions: {host: requests.Session}
+        self._sessions: dict = {}
 
     # ------------------------------------------------------------------
     # Shutdown awareness
@@ -65,6 +91,52 @@ class RSSDownloader:
     def request_stop(self) -> None:
         """Signal the stop event so any interruptible wait wakes immediately."""
         self._stop_event.set()
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled HTTP sessions (they are recreated on next use)."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # HTTP sessions
+    # ------------------------------------------------------------------
+
+    def _session(self, url: str) -> requests.Session:
+        """Return the keep-alive session for *url*'s host."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=MAX_CONCURRENT_FEED_FETCHES,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def _domain_slot(self, url: str) -> threading.BoundedSemaphore:
+        domain = self._get_domain(url)
+        with self._lock:
+            slot = self._domain_slots.get(domain)
+            if slot is None:
+                slot = threading.BoundedSemaphore(DOMAIN_MAX_CONCURRENT_REQUESTS)
+                self._domain_slots[domain] = slot
+            return slot
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the host's pooled session, within its concurrency slot."""
+        with self._domain_slot(url):
+            return self._session(url).get(url, timeout=self.timeout, **kwargs)
 
     # ------------------------------------------------------------------
     # Domain rate limiting
@@ -75,9 +147,10 @@ class RSSDownloader:
 
         Returns 0.0 if safe to proceed immediately.
         """
-        domain = self._get_domain(url)
-        now = time.time()
+        with self._lock:
+            return self._domain_wait_locked(self._get_domain(url), time.time())
 
+    def _domain_wait_locked(self, domain: str, now: float) -> float:
         if domain in self._domain_requests:
             self._domain_requests[domain] = [
                 t for t in self._domain_requests[domain]
@@ -93,9 +166,29 @@ class RSSDownloader:
 
         return 0.0
 
-    def _record_domain_request(self, url: str) -> None:
+    def _reserve_domain_request(self, url: str) -> float:
+        """Claim a rate-limit slot for *url*, or return seconds to wait first.
+
+        Check and record happen under one lock so concurrent lanes cannot
+        both see the last free slot.
+        """
         domain = self._get_domain(url)
-        self._domain_requests.setdefault(domain, []).append(time.time())
+        with self._lock:
+            now = time.time()
+            wait = self._domain_wait_locked(domain, now)
+            if wait <= 0:
+                self._domain_requests[domain].append(now)
+            return wait
+
+    def _await_domain_slot(self, url: str) -> bool:
+        """Block (interruptibly) until *url*'s domain may be hit again."""
+        while True:
+            wait = self._reserve_domain_request(url)
+            if wait <= 0:
+                return True
+            logger.info(f"[RSS_DL] Domain rate limit: waiting {wait:.1f}s for {self._get_domain(url)}")
+            if not self._interruptible_wait(wait):
+                return False
 
     @staticmethod
     def _get_domain(url: str) -> str:
@@ -126,25 +219,8 @@ class RSSDownloader:
 
         Returns the feedparser result or None on failure / shutdown.
         """
-        if not self._should_continue():
-            return None
-
-        wait = self.domain_wait_time(url)
-        if wait > 0:
-            logger.info(f"[RSS_DL] Domain rate limit: waiting {wait:.1f}s for {self._get_domain(url)}")
-            if not self._interruptible_wait(wait):
-                return None
-
-        if not self._should_continue():
-            return None
-
-        try:
-            feed = feedparser.parse(url, request_headers={"User-Agent": self._user_agent()})
-            self._record_domain_request(url)
-            return feed
-        except Exception as e:
-            logger.error(f"[RSS_DL] Failed to fetch RSS {url}: {e}")
-            return None
+        result = self.fetch_feed(url, "rss")
+        return result.data if result is not None else None
 
     def fetch_json(self, url: str) -> Optional[dict]:
         """Fetch a JSON feed (Flickr or Reddit).
@@ -152,10 +228,27 @@ class RSSDownloader:
         For Reddit URLs, coordinates with RedditRateLimiter.
         Returns parsed JSON dict or None on failure / shutdown.
         """
+        result = self.fetch_feed(url, "json")
+        return result.data if result is not None else None
+
+    def fetch_feed(
+        self,
+        url: str,
+        mode: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[FeedFetch]:
+        """Fetch a feed, revalidating with *etag* / *last_modified* if given.
+
+        *mode* is ``"rss"`` (feedparser) or ``"json"``.  Returns a
+        :class:`FeedFetch` (``not_modified=True`` and no data on a 304), or
+        None on failure / shutdown.
+        """
         if not self._should_continue():
             return None
 
-        is_reddit = "reddit.com" in url.lower()
+        is_json = mode == "json"
+        is_reddit = is_json and "reddit.com" in url.lower()
 
         # Reddit quota check
         if is_reddit:
@@ -168,11 +261,8 @@ class RSSDownloader:
                 pass
 
         # Domain rate limit
-        wait = self.domain_wait_time(url)
-        if wait > 0:
-            logger.info(f"[RSS_DL] Domain rate limit: waiting {wait:.1f}s for {self._get_domain(url)}")
-            if not self._interruptible_wait(wait):
-                return None
+        if not self._await_domain_slot(url):
+            return None
 
         # Reddit-specific rate limiter
         if is_reddit:
@@ -190,28 +280,51 @@ class RSSDownloader:
         if not self._should_continue():
             return None
 
+        headers = {"User-Agent": self._user_agent()}
+        if is_json:
+            headers["Accept"] = "application/json"
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
         try:
-            resp = requests.get(
-                url,
-                timeout=self.timeout,
-                headers={"User-Agent": self._user_agent(), "Accept": "application/json"},
-            )
+            resp = self._get(url, headers=headers)
+            if resp.status_code == 304:
+                return FeedFetch(
+                    None,
+                    _header(resp, "ETag") or etag,
+                    _header(resp, "Last-Modified") or last_modified,
+                    not_modified=True,
+                )
             resp.raise_for_status()
-            self._record_domain_request(url)
-            return resp.json()
+            if is_json:
+                data = resp.json()
+            else:
+                data = feedparser.parse(resp.content, response_headers=dict(resp.headers))
+            return FeedFetch(data, _header(resp, "ETag"), _header(resp, "Last-Modified"))
         except Exception as e:
-            logger.error(f"[RSS_DL] Failed to fetch JSON {url}: {e}")
+            kind = "JSON" if is_json else "RSS"
+            logger.error(f"[RSS_DL] Failed to fetch {kind} {url}: {e}")
             return None
 
     # ------------------------------------------------------------------
     # Image downloading
     # ------------------------------------------------------------------
 
-    def download_image(self, image_url: str, cache_dir: Path) -> Optional[Path]:
+    def download_image(
+        self,
+        image_url: str,
+        cache_dir: Path,
+        store: Optional["AssetNamespace"] = None,
+    ) -> Optional[Path]:
         """Download an image to cache with atomic write.
 
-        Returns the cache Path on success, or the existing path if already cached.
-        Returns None on failure or shutdown.
+        With *store*, the validated download is moved into the shared asset
+        store (keyed by URL hash) and the blob path is returned; *cache_dir*
+        only holds the temporary file.  Returns the cache Path on success, or
+        the existing path if already cached.  Returns None on failure or
+        shutdown.
         """
         if not self._should_continue():
             return None
@@ -223,34 +336,46 @@ class RSSDownloader:
         temp_file = cache_dir / f".tmp.{url_hash}{ext}"
 
         # Already cached
-        if cache_file.exists():
+        if store is not None:
+            record = store.get(url_hash)
+            if record is not None:
+                return record.path
+        elif cache_file.exists():
             return cache_file
 
         try:
-            resp = requests.get(
-                image_url,
-                timeout=self.timeout,
-                headers={"User-Agent": self._user_agent()},
-                stream=True,
-            )
-            resp.raise_for_status()
-
-            content_type = resp.headers.get("Content-Type", "")
-            if "image" not in content_type:
-                logger.debug(f"[RSS_DL] Not an image: {content_type} for {image_url}")
-                return None
+            with self._domain_slot(image_url):
+                resp = self._session(image_url).get(
+                    image_url,
+                    timeout=self.timeout,
+                    headers={"User-Agent": self._user_agent()},
+                    stream=True,
+                )
+                try:
+                    resp.raise_for_status()
 
-            downloaded = 0
-            with open(temp_file, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    if not self._should_continue():
-                        logger.info("[RSS_DL] Shutdown during download, aborting")
-                        f.close()
-                        self._safe_unlink(temp_file)
+                    content_type = resp.headers.get("Content-Type", "")
+                    if "image" not in content_type:
+                        logger.debug(f"[RSS_DL] Not an image: {content_type} for {image_url}")
                         return None
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
+
+                    downloaded = 0
+                    with open(temp_file, "wb") as f:
+                        for chunk in resp.iter_content(chunk_size=8192):
+                            if not self._should_continue():
+                                logger.info("[RSS_DL] Shutdown during download, aborting")
+                                f.close()
+                                self._safe_unlink(temp_file)
+                                return None
+                            if chunk:
+                                f.write(chunk)
+                                downloaded += len(chunk)
+                finally:
+                    # Return the connection to the host pool promptly.
+                    resp.close()
+
+            if store is not None:
+                return self._store_download(store, url_hash, ext, temp_file, downloaded)
 
             # Atomic replace with retry for Windows WinError 32 (handle held
             # briefly by antivirus / filesystem journal after close).
@@ -287,6 +412,25 @@ class RSSDownloader:
             self._safe_unlink(temp_file)
             return None
 
+    def _store_download(
+        self,
+        store: "AssetNamespace",
+        url_hash: str,
+        ext: str,
+        temp_file: Path,
+        downloaded: int,
+    ) -> Optional[Path]:
+        """Validate a finished download and move it into the asset store."""
+        if not self._validate_wallpaper_dimensions(temp_file):
+            self._safe_unlink(temp_file)
+            return None
+        try:
+            record = store.put_file(url_hash, temp_file, ext=ext, move=True)
+        finally:
+            self._safe_unlink(temp_file)
+        logger.debug(f"[RSS_DL] Stored {url_hash}{ext} ({downloaded} bytes)")
+        return record.path
+
     def download_image_to_save_dir(self, cache_path: Path, save_dir: Path) -> None:
         """Copy a cached image to permanent storage."""
         try:
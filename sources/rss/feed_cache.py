@@ -0,0 +1,158 @@
+"""
+Feed response cache for HTTP conditional requests.
+
+Responsibilities:
+    - Persist ETag / Last-Modified validators per feed URL
+    - Keep the parsed entry list of the last full response per feed
+    - Serve that list on ``304 Not Modified`` so an unchanged feed costs one
+      round trip and no parsing
+    - Count hits (304) and misses (full body) per feed for health reporting
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sources.rss.parser import ParsedEntry
+from core.logging.logger import get_logger
+from core.settings.storage_paths import get_feed_response_cache_file
+
+logger = get_logger(__name__)
+
+
+def _entry_to_dict(entry: ParsedEntry) -> dict:
+    return {
+        "image_url": entry.image_url,
+        "title": entry.title,
+        "description": entry.description,
+        "author": entry.author,
+        "created_date": entry.created_date.isoformat() if entry.created_date else None,
+        "source_url": entry.source_url,
+    }
+
+
+def _entry_from_dict(data: dict) -> Optional[ParsedEntry]:
+    image_url = data.get("image_url")
+    if not image_url:
+        return None
+    created = data.get("created_date")
+    try:
+        created_date = datetime.fromisoformat(created) if created else None
+    except (TypeError, ValueError):
+        created_date = None
+    return ParsedEntry(
+        image_url=image_url,
+        title=data.get("title") or "Untitled",
+        description=data.get("description") or "",
+        author=data.get("author") or "",
+        created_date=created_date,
+        source_url=data.get("source_url") or "",
+    )
+
+
+class FeedResponseCache:
+    """Validators and parsed entries per feed, persisted next to feed health."""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self._file = cache_file or get_feed_response_cache_file()
+        self._lock = threading.Lock()
+        # {feed_url: {"etag": str|None, "last_modified": str|None, "entries": [dict]}}
+        self._feeds: Dict[str, dict] = {}
+        self._entries: Dict[str, List[ParsedEntry]] = {}
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def validators(self, feed_url: str) -> tuple:
+        """Return ``(etag, last_modified)`` to send, or ``(None, None)``.
+
+        Validators are only offered when the parsed entries are cached too,
+        otherwise a 304 would leave nothing to serve.
+        """
+        with self._lock:
+            record = self._feeds.get(feed_url)
+            if not record or feed_url not in self._entries:
+                return None, None
+            return record.get("etag"), record.get("last_modified")
+
+    def not_modified(self, feed_url: str, max_entries: int) -> Optional[List[ParsedEntry]]:
+        """Record a 304 and return the cached entries (``None`` if evicted)."""
+        with self._lock:
+            entries = self._entries.get(feed_url)
+            if entries is None:
+                return None
+            self._hits[feed_url] = self._hits.get(feed_url, 0) + 1
+            return entries[:max_entries]
+
+    def store(
+        self,
+        feed_url: str,
+        entries: List[ParsedEntry],
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        """Record a full response and remember its validators and entries."""
+        with self._lock:
+            self._misses[feed_url] = self._misses.get(feed_url, 0) + 1
+            if not etag and not last_modified:
+                # Server offers no validators: nothing to revalidate against.
+                if self._feeds.pop(feed_url, None) is not None:
+                    self._entries.pop(feed_url, None)
+                    self._save_locked()
+                return
+            self._entries[feed_url] = list(entries)
+            self._feeds[feed_url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "entries": [_entry_to_dict(e) for e in entries],
+            }
+            self._save_locked()
+
+    def get_status(self, feed_url: str) -> dict:
+        with self._lock:
+            return {
+                "cache_hits": self._hits.get(feed_url, 0),
+                "cache_misses": self._misses.get(feed_url, 0),
+            }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            if not self._file.exists():
+                return
+            with open(self._file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                return
+            for url, record in data.items():
+                if not isinstance(record, dict):
+                    continue
+                entries = [
+                    e for e in (_entry_from_dict(d) for d in record.get("entries") or [] if isinstance(d, dict))
+                    if e is not None
+                ]
+                self._feeds[url] = record
+                self._entries[url] = entries
+            logger.debug(f"[FEED_CACHE] Loaded validators for {len(self._feeds)} feeds")
+        except Exception as e:
+            logger.debug(f"[FEED_CACHE] Load failed: {e}")
+            self._feeds = {}
+            self._entries = {}
+
+    def _save_locked(self) -> None:
+        tmp = self._file.with_name(self._file.name + ".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._feeds, f)
+            os.replace(tmp, self._file)
+        except Exception as e:
+            logger.debug(f"[FEED_CACHE] Save failed: {e}")
@@ -8,6 +8,7 @@ Responsibilities:
     - Auto-reset after FEED_HEALTH_RESET_HOURS
 """
 import json
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Optional
@@ -31,6 +32,8 @@ class FeedHealthTracker:
     def __init__(self, health_file: Optional[Path] = None):
         self._file = health_file or _HEALTH_FILE
         self._health: Dict[str, dict] = {}
+        # Feeds are fetched on several IO threads at once.
+        self._lock = threading.RLock()
         self._load()
 
     # ------------------------------------------------------------------
@@ -39,6 +42,10 @@ class FeedHealthTracker:
 
     def should_skip(self, feed_url: str) -> bool:
         """Return True if this feed should be skipped due to backoff."""
+        with self._lock:
+            return self._should_skip_locked(feed_url)
+
+    def _should_skip_locked(self, feed_url: str) -> bool:
         if feed_url not in self._health:
             return False
 
@@ -63,24 +70,26 @@ class FeedHealthTracker:
 
     def record_success(self, feed_url: str) -> None:
         """Reset failure count for a feed."""
-        if feed_url in self._health:
-            del self._health[feed_url]
-            self._save()
+        with self._lock:
+            if feed_url in self._health:
+                del self._health[feed_url]
+                self._save()
 
     def record_failure(self, feed_url: str) -> None:
         """Increment failure count and calculate next skip_until."""
-        now = time.time()
-        if feed_url not in self._health:
-            self._health[feed_url] = {"failures": 0, "last_failure": 0, "skip_until": 0}
-
-        h = self._health[feed_url]
-        h["failures"] = h.get("failures", 0) + 1
-        h["last_failure"] = now
-        # Exponential backoff: 60, 120, 240, 480, ...
-        backoff = FAILURE_BACKOFF_BASE_SECONDS * (2 ** (h["failures"] - 1))
-        h["skip_until"] = now + backoff
-        logger.info(f"[FEED_HEALTH] {feed_url}: failure #{h['failures']}, backoff {backoff}s")
-        self._save()
+        with self._lock:
+            now = time.time()
+            if feed_url not in self._health:
+                self._health[feed_url] = {"failures": 0, "last_failure": 0, "skip_until": 0}
+
+            h = self._health[feed_url]
+            h["failures"] = h.get("failures", 0) + 1
+            h["last_failure"] = now
+            # Exponential backoff: 60, 120, 240, 480, ...
+            backoff = FAILURE_BACKOFF_BASE_SECONDS * (2 ** (h["failures"] - 1))
+            h["skip_until"] = now + backoff
+            logger.info(f"[FEED_HEALTH] {feed_url}: failure #{h['failures']}, backoff {backoff}s")
+            self._save()
 
     def get_status(self, feed_urls: list) -> Dict[str, dict]:
         """Return health status for a list of feed URLs."""
@@ -731,6 +731,15 @@ class _DeliveryWidget:
         self.update_count += 1
 
 
+def _window_samples(widget, name: str) -> tuple[int, float, float]:
+    """(count, min, max) of one delivery histogram's current window."""
+    histogram = getattr(widget, name, None)
+    if histogram is None:
+        return (0, 0.0, 0.0)
+    window = histogram.window(reset=False)
+    return (window.count, window.min, window.max)
+
+
 class TestDeliveryStageInvariants(unittest.TestCase):
     """Invariants for the passive Phase 5 delivery-stage attribution seam.
 
@@ -833,21 +842,21 @@ class TestDeliveryStageInvariants(unittest.TestCase):
         far_future = time.perf_counter() + 3600.0
 
         _record_delivery_wake(widget, deadline_ts=far_future, immediate=False)
-        wake_samples = list(getattr(widget, "_srpss_delivery_wake_late_ms", []))
-        self.assertEqual(wake_samples, [0.0])
+        wake_samples = _window_samples(widget, "_srpss_delivery_wake_late_ms")
+        self.assertEqual(wake_samples, (1, 0.0, 0.0))
 
         widget._srpss_timer_update_pending_since = far_future
         _mark_widget_update_dispatched(widget)
-        dispatch_samples = list(getattr(widget, "_srpss_delivery_dispatch_ms", []))
-        self.assertEqual(dispatch_samples, [0.0])
+        dispatch_samples = _window_samples(widget, "_srpss_delivery_dispatch_ms")
+        self.assertEqual(dispatch_samples, (1, 0.0, 0.0))
 
         widget._srpss_timer_update_pending_since = 100.0
         widget._srpss_timer_update_dispatched_ts = 100.0
         _record_delivery_paint_start(widget, 90.0)
-        paint_samples = list(getattr(widget, "_srpss_delivery_paint_pending_ms", []))
-        self.assertEqual(paint_samples, [0.0])
+        paint_samples = _window_samples(widget, "_srpss_delivery_paint_pending_ms")
+        self.assertEqual(paint_samples, (1, 0.0, 0.0))
 
-        self.assertTrue(all(value >= 0.0 for value in wake_samples + dispatch_samples + paint_samples))
+        self.assertTrue(all(sample[1] >= 0.0 for sample in (wake_samples, dispatch_samples, paint_samples)))
 
     def test_paint_latency_is_not_recorded_without_a_live_pending_generation(self):
         """A consumed/torn-down pending state cannot back-date a later paint."""
@@ -857,7 +866,7 @@ class TestDeliveryStageInvariants(unittest.TestCase):
 
         _record_delivery_paint_start(widget, 200.0)
 
-        self.assertEqual(list(getattr(widget, "_srpss_delivery_paint_pending_ms", [])), [])
+        self.assertEqual(_window_samples(widget, "_srpss_delivery_paint_pending_ms")[0], 0)
         self.assertEqual(int(getattr(widget, "_srpss_delivery_dispatch_unknown", 0) or 0), 0)
 
     def test_missing_dispatch_timestamp_is_counted_rather_than_guessed(self):
@@ -867,7 +876,7 @@ class TestDeliveryStageInvariants(unittest.TestCase):
 
         _record_delivery_paint_start(widget, 200.0)
 
-        self.assertEqual(list(getattr(widget, "_srpss_delivery_paint_pending_ms", [])), [])
+        self.assertEqual(_window_samples(widget, "_srpss_delivery_paint_pending_ms")[0], 0)
         self.assertEqual(int(getattr(widget, "_srpss_delivery_dispatch_unknown", 0) or 0), 1)
 
     # --- Invariant 3: PERF-off changes nothing but the evidence -----------
@@ -930,7 +939,7 @@ class TestDeliveryStageInvariants(unittest.TestCase):
         )
         self.assertEqual(self._skip_totals(widget), (0, 0, 0))
         self.assertEqual(int(getattr(widget, "_srpss_delivery_accepted", 0) or 0), 0)
-        self.assertEqual(list(getattr(widget, "_srpss_delivery_wake_late_ms", [])), [])
+        self.assertEqual(_window_samples(widget, "_srpss_delivery_wake_late_ms")[0], 0)
         self.assertIsNone(getattr(widget, "_srpss_delivery_window_active_last"))
 
     def test_consumed_update_clears_dispatch_timestamps_for_the_next_generation(self):
@@ -948,7 +957,7 @@ class TestDeliveryStageInvariants(unittest.TestCase):
 
         # A paint arriving after consumption cannot attribute to the retired state.
         _record_delivery_paint_start(widget, time.perf_counter())
-        self.assertEqual(list(getattr(widget, "_srpss_delivery_paint_pending_ms", [])), [])
+        self.assertEqual(_window_samples(widget, "_srpss_delivery_paint_pending_ms")[0], 0)
 
     def test_a_replacement_widget_starts_with_no_inherited_delivery_state(self):
         retiring = _DeliveryWidget()
@@ -0,0 +1,110 @@
+"""Tests for the shared content-addressed AssetStore."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.resources.asset_store import AssetStore, namespace_for_directory, release_asset_store
+
+
+def _store(tmp_path: Path, budget: int = 1 << 20) -> AssetStore:
+    return AssetStore(tmp_path / "assets", byte_budget=budget)
+
+
+def test_identical_bytes_are_stored_once_across_namespaces(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    first = store.put("cache/rss", "a", b"\xff\xd8\xffsame", ext="jpeg")
+    second = store.put("cache/imgur", "b", b"\xff\xd8\xffsame", ext="jpg", meta={"width": 4})
+
+    assert first.path == second.path
+    assert first.path.read_bytes() == b"\xff\xd8\xffsame"
+    stats = store.get_stats()
+    assert stats["blobs"] == 1
+    assert stats["entries"] == 2
+    assert stats["dedup_saved_bytes"] == len(b"\xff\xd8\xffsame")
+
+    # The blob survives until its last reference goes.
+    assert store.remove("cache/rss", "a")
+    assert first.path.exists()
+    assert store.remove("cache/imgur", "b")
+    assert not first.path.exists()
+    assert store.get_stats()["bytes"] == 0
+
+
+def test_global_budget_evicts_least_recently_used_blob(tmp_path: Path) -> None:
+    store = _store(tmp_path, budget=300)
+    old = store.put("cache/rss", "old", b"o" * 100)
+    warm = store.put("cache/imgur", "warm", b"w" * 100)
+    store.put("cache/rss", "mid", b"m" * 100)
+
+    assert store.get("cache/rss", "old") is not None  # now most recent
+    store.put("steam/cache/p/assets", "new", b"n" * 100)
+
+    assert store.contains("cache/rss", "old")
+    assert not store.contains("cache/imgur", "warm")
+    assert not warm.path.exists()
+    assert old.path.exists()
+    assert store.get_stats()["bytes"] == 300
+
+
+def test_index_survives_reopen_and_enumerates_without_files(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    for idx in range(3):
+        store.put("cache/rss", f"k{idx}", f"payload-{idx}".encode(), meta={"idx": idx})
+    store.get("cache/rss", "k0")
+    store.close()
+
+    reopened = _store(tmp_path)
+    entries = reopened.entries("cache/rss")
+    assert [e.key for e in entries] == ["k0", "k2", "k1"]
+    assert entries[0].meta == {"idx": 0}
+    assert reopened.get_stats()["bytes"] == sum(len(f"payload-{i}".encode()) for i in range(3))
+
+
+def test_missing_blob_is_dropped_on_get(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    record = store.put("cache/rss", "gone", b"bytes")
+    record.path.unlink()
+
+    assert store.get("cache/rss", "gone") is None
+    assert not store.contains("cache/rss", "gone")
+    assert store.get_stats()["bytes"] == 0
+
+
+def test_trim_and_prefix_clear(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    for idx in range(4):
+        store.put("steam/cache/a/assets", f"k{idx}", f"a{idx}".encode())
+    store.put("steam/cache/b/assets", "k", b"b")
+    store.put("steam/cachex", "k", b"c")
+
+    assert store.trim_namespace("steam/cache/a/assets", 2) == 2
+    assert [e.key for e in store.entries("steam/cache/a/assets")] == ["k3", "k2"]
+
+    removed, _freed = store.clear("steam/cache")
+    assert removed == 3
+    assert store.contains("steam/cachex", "k")
+
+
+def test_namespace_for_directory_shares_app_store_and_adopts_legacy_files(tmp_path: Path) -> None:
+    app_root = tmp_path / "SRPSS"
+    rss_dir = app_root / "cache" / "rss"
+    rss_dir.mkdir(parents=True)
+    (rss_dir / "deadbeef.jpg").write_bytes(b"\xff\xd8\xfflegacy")
+
+    rss = namespace_for_directory(rss_dir, app_data_dir=app_root)
+    imgur = namespace_for_directory(app_root / "cache" / "imgur", app_data_dir=app_root)
+    try:
+        assert rss.name == "cache/rss"
+        assert rss.store is imgur.store
+        assert rss.store.root == app_root / "cache" / "assets"
+
+        assert rss.adopt_legacy_files() == 1
+        assert not (rss_dir / "deadbeef.jpg").exists()
+        assert rss.get("deadbeef").path.read_bytes() == b"\xff\xd8\xfflegacy"
+
+        private = namespace_for_directory(tmp_path / "elsewhere", app_data_dir=app_root)
+        assert private.private
+        assert private.store.root == tmp_path / "elsewhere"
+        private.close()
+    finally:
+        release_asset_store(rss.store)
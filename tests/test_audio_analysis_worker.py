@@ -0,0 +1,277 @@
+"""Tests for the out-of-process visualizer audio analysis lane."""
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from core.process.supervisor import ProcessSupervisor  # noqa: E402
+from core.process.types import WorkerType  # noqa: E402
+from core.process.workers.audio_worker import (  # noqa: E402
+    ANALYSIS_FRAME_BYTES,
+    ANALYSIS_STATE_FIELDS,
+    AUDIO_RING_SLOT_BYTES,
+    AUDIO_RING_SLOTS,
+    AnalysisFrame,
+    AudioAnalysisSession,
+    audio_analysis_worker_main,
+    pack_analysis_frame,
+    unpack_analysis_frame,
+)
+from utils.lockfree import SharedMemorySPSCRing, SharedMemoryTripleBuffer  # noqa: E402
+from widgets.spotify_visualizer.analysis_process_client import (  # noqa: E402
+    AudioAnalysisProcessClient,
+    samples_to_pcm_bytes,
+)
+from widgets.spotify_visualizer.audio_worker import SpotifyVisualizerAudioWorker, _AudioFrame  # noqa: E402
+from widgets.spotify_visualizer.beat_engine import _SpotifyBeatEngine  # noqa: E402
+from widgets.spotify_visualizer.bar_computation import compute_bars_from_samples  # noqa: E402
+from widgets.spotify_visualizer.feature_frame import FeatureClip, load_jsonl  # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures" / "visualizer_replay" / "v1"
+
+
+def _pcm_blocks(count: int, size: int = 1024, seed: int = 5) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    t = np.arange(size, dtype=np.float64) / 48000.0
+    blocks = []
+    for index in range(count):
+        kick = 0.9 if index % 6 == 0 else 0.15
+        wave = kick * np.sin(2 * np.pi * 60.0 * t) + 0.2 * np.sin(2 * np.pi * 2400.0 * t)
+        wave += rng.normal(0.0, 0.02, size)
+        blocks.append(wave.astype(np.float32))
+    return blocks
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def segments():
+    ring = SharedMemorySPSCRing.create(AUDIO_RING_SLOTS, AUDIO_RING_SLOT_BYTES)
+    frames = SharedMemoryTripleBuffer.create(ANALYSIS_FRAME_BYTES)
+    try:
+        yield ring, frames
+    finally:
+        ring.unlink()
+        frames.unlink()
+
+
+def _dsp(bar_count: int = 16) -> SpotifyVisualizerAudioWorker:
+    dsp = SpotifyVisualizerAudioWorker(bar_count)
+    dsp._np = np
+    return dsp
+
+
+def test_analysis_frame_round_trips_exact_float64() -> None:
+    state = {name: math.pi * (index + 1) / 7.0 for index, name in enumerate(ANALYSIS_STATE_FIELDS)}
+    del state["_running_peak"]
+    frame = AnalysisFrame(
+        activation_id=9,
+        capture_ts=1234.000001,
+        computed_ts=1234.000002,
+        raw_bars=[0.1 + i / 3.0 for i in range(24)],
+        onset_detected=True,
+        onset_type="snare",
+        onset_ts=1233.5,
+        state=state,
+    )
+
+    assert len(pack_analysis_frame(frame)) <= ANALYSIS_FRAME_BYTES
+    assert unpack_analysis_frame(pack_analysis_frame(frame)) == frame
+
+
+def test_replay_goldens_survive_shared_memory_transport(segments) -> None:
+    _ring, frames = segments
+    consumer = SharedMemoryTripleBuffer.attach(frames.name)
+    manifest = json.loads((FIXTURES / "manifest.json").read_text(encoding="utf-8"))
+    try:
+        for entry in manifest["fixtures"]:
+            clip = load_jsonl(FIXTURES / entry["file"], name=entry["name"])
+            rebuilt = []
+            for frame in clip.frames:
+                transient = frame.energy.transient
+                frames.publish(pack_analysis_frame(AnalysisFrame(
+                    activation_id=1,
+                    capture_ts=frame.timestamp_us / 1e6,
+                    computed_ts=frame.timestamp_us / 1e6,
+                    raw_bars=list(frame.raw_bars),
+                    state={
+                        "_transient_bass": transient.bass,
+                        "_transient_mid": transient.mid,
+                        "_transient_high": transient.high,
+                        "_onset_strength": transient.onset_strength,
+                    },
+                )))
+                received = unpack_analysis_frame(consumer.consume_latest())
+                energy = dataclasses.replace(
+                    frame.energy,
+                    transient=dataclasses.replace(
+                        transient,
+                        bass=received.state["_transient_bass"],
+                        mid=received.state["_transient_mid"],
+                        high=received.state["_transient_high"],
+                        onset_strength=received.state["_onset_strength"],
+                    ),
+                )
+                rebuilt.append(dataclasses.replace(
+                    frame,
+                    raw_bars=tuple(received.raw_bars),
+                    energy=energy,
+                ))
+            assert FeatureClip(clip.name, tuple(rebuilt)).sha256() == entry["sha256"]
+    finally:
+        consumer.close()
+
+
+def test_session_matches_in_process_compute_bit_for_bit(segments, monkeypatch) -> None:
+    clock = _Clock()
+    monkeypatch.setattr(time, "time", clock)
+    ring, frames = segments
+    reference = _dsp()
+    live = _dsp()
+    for dsp in (reference, live):
+        dsp.set_floor_config(False, 0.2)
+        dsp.set_energy_boost(1.2)
+
+    client = AudioAnalysisProcessClient(object(), ring, frames, live)
+    session = AudioAnalysisSession.attach(
+        ring.name, frames.name, bar_count=16, state=client._seed_state()
+    )
+    try:
+        for index, block in enumerate(_pcm_blocks(40)):
+            clock.now += 0.021
+            if index == 15:
+                # Settings write config; resets are forwarded explicitly.
+                for dsp in (reference, live):
+                    dsp.set_input_gain(1.4)
+                    dsp.reset_reactivity_state()
+                client.forward_call("reset_reactivity_state")
+            if index == 30:
+                for dsp in (reference, live):
+                    dsp.set_floor_config(True, 0.1)
+                client.forward_call("set_floor_config", True, 0.1)
+
+            state = reference.make_compute_snapshot()
+            expected = compute_bars_from_samples(state, block)
+            reference.commit_compute_snapshot(state)
+
+            assert client.push_samples(
+                samples_to_pcm_bytes(block, np), activation_id=3, capture_ts=clock.now
+            )
+            session.process_records(ring.drain())
+            frame = client.consume_latest()
+
+            assert frame is not None and frame.activation_id == 3
+            assert frame.raw_bars == expected
+            for name in ANALYSIS_STATE_FIELDS:
+                assert frame.state[name] == float(getattr(reference, name)), name
+            assert frame.onset_detected == reference._onset_detected
+            assert frame.onset_type == reference._onset_type
+        assert session.blocks_dropped == 0
+    finally:
+        session.close()
+
+
+def test_session_drops_pcm_superseded_by_control(segments) -> None:
+    ring, frames = segments
+    live = _dsp()
+    client = AudioAnalysisProcessClient(object(), ring, frames, live)
+    session = AudioAnalysisSession.attach(
+        ring.name, frames.name, bar_count=16, state=client._seed_state()
+    )
+    blocks = _pcm_blocks(3)
+    try:
+        client.push_samples(samples_to_pcm_bytes(blocks[0], np), activation_id=1, capture_ts=1.0)
+        client.push_samples(samples_to_pcm_bytes(blocks[1], np), activation_id=1, capture_ts=2.0)
+        client.forward_call("reconfigure_bar_count", 8)
+        client.push_samples(samples_to_pcm_bytes(blocks[2], np), activation_id=2, capture_ts=3.0)
+        session.process_records(ring.drain())
+
+        frame = client.consume_latest()
+        assert frame.activation_id == 2 and frame.capture_ts == 3.0
+        assert len(frame.raw_bars) == 8
+        assert session.blocks_dropped == 2
+        assert session.dsp._bar_count == 8
+
+        with pytest.raises(ValueError):
+            client.forward_call("start")
+    finally:
+        session.close()
+
+
+def test_beat_engine_routes_pcm_through_attached_client(segments) -> None:
+    ring, frames = segments
+    engine = _SpotifyBeatEngine(16)
+    engine._audio_worker._np = np
+    engine._is_spotify_playing = True
+    client = AudioAnalysisProcessClient(object(), ring, frames, engine._audio_worker)
+    session = AudioAnalysisSession.attach(
+        ring.name, frames.name, bar_count=16, state=client._seed_state()
+    )
+    engine._analysis_client = client
+    block = _pcm_blocks(1)[0]
+    try:
+        engine._audio_buffer.publish(_AudioFrame(block, engine._activation_id, time.time()))
+        engine.tick()
+        assert engine.has_pending_analysis_frame() is False
+        assert client.blocks_pushed == 1
+
+        published = session.process_records(ring.drain())
+        engine._consume_process_analysis(time.time())
+
+        assert engine._latest_bars == published.raw_bars
+        assert engine.get_latest_authoritative_frame()[0] == published.computed_ts
+        assert engine._audio_worker._pre_agc_bass == published.state["_pre_agc_bass"]
+
+        engine.reset_smoothing_state()
+        engine._audio_buffer.publish(_AudioFrame(block, engine._activation_id, time.time()))
+        engine.tick()
+        session.process_records(ring.drain())
+        assert session.controls_applied == 2
+        assert session.frames_published == 2
+        engine.force_stop()
+        assert engine._analysis_client is None and client.active is False
+    finally:
+        session.close()
+
+
+def test_worker_process_attaches_and_publishes_frames() -> None:
+    supervisor = ProcessSupervisor()
+    supervisor.register_worker_factory(WorkerType.AUDIO, audio_analysis_worker_main)
+    client = None
+    try:
+        assert supervisor.start(WorkerType.AUDIO)
+        client = AudioAnalysisProcessClient.attach(supervisor, _dsp(), 16)
+        assert client is not None
+
+        frame = None
+        deadline = time.time() + 10.0
+        for block in _pcm_blocks(200):
+            client.push_samples(samples_to_pcm_bytes(block, np), activation_id=0, capture_ts=time.time())
+            time.sleep(0.01)
+            frame = client.consume_latest() or frame
+            if frame is not None or time.time() > deadline:
+                break
+
+        assert frame is not None
+        assert len(frame.raw_bars) == 16
+        assert all(0.0 <= value <= 1.0 for value in frame.raw_bars)
+        assert client.check_health(time.time())
+    finally:
+        if client is not None:
+            client.close()
+        supervisor.shutdown()
@@ -0,0 +1,134 @@
+"""Tests for the struct-of-arrays broadphase behind BubbleSimulation."""
+from __future__ import annotations
+
+import random
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from widgets.spotify_visualizer import bubble_grid  # noqa: E402
+from widgets.spotify_visualizer.bubble_grid import (  # noqa: E402
+    BubbleColumns,
+    UniformGrid,
+    contact_pairs,
+    live_sweep,
+    sweep_order,
+)
+from widgets.spotify_visualizer.bubble_simulation import BubbleSimulation  # noqa: E402
+
+
+def _columns(n: int, seed: int) -> BubbleColumns:
+    rng = np.random.default_rng(seed)
+    return BubbleColumns(
+        rng.uniform(-0.1, 1.1, n),
+        rng.uniform(-0.1, 1.1, n),
+        rng.uniform(0.004, 0.05, n),
+        rng.random(n) < 0.3,
+    )
+
+
+def _brute_pairs(columns: BubbleColumns, factor: float, bias: float, slack: float) -> set:
+    found = set()
+    n = len(columns)
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = columns.x[j] - columns.x[i]
+            dy = columns.y[j] - columns.y[i]
+            reach = (columns.radius[i] + columns.radius[j]) * factor + bias + slack
+            if dx * dx + dy * dy < reach * reach:
+                found.add((i, j))
+    return found
+
+
+@pytest.mark.parametrize("n,dense", [(110, True), (400, False)])
+def test_contact_pairs_match_brute_force(n: int, dense: bool, monkeypatch) -> None:
+    if not dense:
+        monkeypatch.setattr(bubble_grid, "_DENSE_PAIR_LIMIT", 0)
+    columns = _columns(n, seed=n)
+
+    first, second = contact_pairs(columns, gap_factor=1.12, gap_bias=0.006, slack=0.01)
+
+    got = {(min(i, j), max(i, j)) for i, j in zip(first.tolist(), second.tolist())}
+    assert len(got) == first.size
+    assert got == _brute_pairs(columns, 1.12, 0.006, 0.01)
+
+
+def test_sweep_order_matches_sorted_sweep() -> None:
+    columns = _columns(80, seed=3)
+    first, second = contact_pairs(columns, gap_factor=1.0, gap_bias=0.0, slack=0.05)
+    wanted = set(zip(first.tolist(), second.tolist()))
+    wanted |= {(j, i) for i, j in wanted}
+
+    order = sorted(range(len(columns)), key=lambda idx: columns.x[idx])
+    expected = [
+        (order[p], order[q])
+        for p in range(len(order))
+        for q in range(p + 1, len(order))
+        if (order[p], order[q]) in wanted
+    ]
+
+    assert list(sweep_order(columns, first, second)) == expected
+
+
+def test_live_sweep_reads_positions_moved_mid_sweep() -> None:
+    bubbles = [types.SimpleNamespace(x=x, y=0.5) for x in (0.10, 0.12, 0.30)]
+    radii = [0.01, 0.01, 0.01]
+
+    visited = []
+    for i, j in live_sweep(bubbles, radii, gap_factor=1.0, gap_bias=0.0):
+        visited.append((i, j))
+        if (i, j) == (0, 1):
+            # A push made for the first pair brings bubble 1 next to bubble 2.
+            bubbles[1].x = 0.29
+
+    assert visited == [(0, 1), (1, 2)]
+
+
+def test_grid_query_covers_reach() -> None:
+    columns = _columns(200, seed=9)
+    grid = UniformGrid.build(columns.x, columns.y, 0.07)
+    grid.insert(200, 0.5, 0.5)
+
+    near = set(grid.query(0.5, 0.5, 0.09))
+
+    assert 200 in near
+    for i in range(200):
+        if abs(columns.x[i] - 0.5) <= 0.09 and abs(columns.y[i] - 0.5) <= 0.09:
+            assert i in near
+
+
+def _bubble(x: float, y: float, radius: float, is_big: bool):
+    return types.SimpleNamespace(
+        x=x, y=y, radius=radius, vx=0.0, vy=0.0, is_big=is_big, promoted=False,
+    )
+
+
+@pytest.mark.parametrize("stream_dir", ["up", "none", "top_left"])
+def test_spawn_grid_agrees_with_full_scan(stream_dir: str) -> None:
+    rng = random.Random(5)
+    sim = BubbleSimulation()
+    sim._bubbles = [
+        _bubble(rng.uniform(-0.05, 1.05), rng.uniform(-0.05, 1.05), rng.uniform(0.005, 0.04), rng.random() < 0.3)
+        for _ in range(100)
+    ]
+    probes = [
+        (rng.uniform(-0.05, 1.05), rng.uniform(-0.05, 1.05), rng.uniform(0.005, 0.04), rng.random() < 0.5)
+        for _ in range(300)
+    ]
+
+    def _check(x, y, r, big):
+        return sim._overlaps_existing(
+            x, y, r, candidate_is_big=big, stream_dir=stream_dir, candidate_vx=0.0, candidate_vy=0.0,
+        )
+
+    full = [_check(*p) for p in probes]
+    sim._begin_spawn_phase()
+    try:
+        indexed = [_check(*p) for p in probes]
+    finally:
+        sim._end_spawn_phase()
+
+    assert indexed == full
+    assert any(full) and not all(full)
@@ -0,0 +1,104 @@
+"""Tests for the byte-budgeted ImageBufferPool behind ResourceManager pooling."""
+from __future__ import annotations
+
+from core.resources.buffer_pool import ImageBufferPool, format_key, size_class
+
+
+class _Format:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class _FakeImage:
+    """Minimal QImage stand-in: 4 bytes per pixel, named format."""
+
+    def __init__(self, width: int, height: int, fmt: str = "Format_ARGB32_Premultiplied") -> None:
+        self._w = width
+        self._h = height
+        self._fmt = _Format(fmt)
+
+    def isNull(self) -> bool:
+        return self._w <= 0 or self._h <= 0
+
+    def width(self) -> int:
+        return self._w
+
+    def height(self) -> int:
+        return self._h
+
+    def format(self):
+        return self._fmt
+
+    def depth(self) -> int:
+        return 32
+
+    def sizeInBytes(self) -> int:
+        return self._w * self._h * 4
+
+
+def test_size_class_rounds_up_to_power_of_two():
+    assert size_class(0) == 0
+    assert size_class(1) == 1
+    assert size_class(4096) == 4096
+    assert size_class(4097) == 8192
+
+
+def test_acquire_matches_exact_shape_and_format():
+    pool = ImageBufferPool(byte_budget=1 << 20)
+    argb = _FakeImage(16, 16)
+    rgb = _FakeImage(16, 16, "Format_RGB32")
+    assert pool.release("image", argb)
+    assert pool.release("image", rgb)
+
+    assert pool.acquire("image", 16, 16, format_key(_Format("Format_RGB32"))) is rgb
+    assert pool.acquire("image", 16, 16, "Format_RGB32") is None
+    assert pool.acquire("image", 16, 17) is None
+    # No format hint accepts whatever is pooled at that size.
+    assert pool.acquire("image", 16, 16) is argb
+
+    stats = pool.stats()
+    assert stats["image_hits"] == 2
+    assert stats["image_misses"] == 2
+    assert stats["bytes_held"] == 0
+
+
+def test_kinds_are_segregated():
+    pool = ImageBufferPool(byte_budget=1 << 20)
+    pool.release("pixmap", _FakeImage(8, 8))
+
+    assert pool.acquire("image", 8, 8) is None
+    assert pool.acquire("pixmap", 8, 8) is not None
+
+
+def test_byte_budget_trims_least_recently_released():
+    pool = ImageBufferPool(byte_budget=3 * 1024)
+    first = _FakeImage(16, 16)  # 1 KiB each
+    second = _FakeImage(16, 16, "Format_RGB32")
+    third = _FakeImage(8, 32)
+    fourth = _FakeImage(32, 8)
+    for image in (first, second, third, fourth):
+        pool.release("image", image)
+
+    stats = pool.stats()
+    assert stats["bytes_held"] == 3 * 1024
+    assert stats["evictions"] == 1
+    assert pool.acquire("image", 16, 16, "Format_ARGB32_Premultiplied") is None
+    assert pool.acquire("image", 32, 8) is fourth
+
+    assert pool.trim(0) == 2
+    assert pool.stats()["image_pool_size"] == 0
+
+
+def test_oversized_and_full_buckets_are_rejected():
+    pool = ImageBufferPool(byte_budget=2048, max_per_key=2)
+    assert not pool.release("image", _FakeImage(64, 64))
+    assert pool.release("image", _FakeImage(8, 8))
+    assert pool.release("image", _FakeImage(8, 8))
+    assert not pool.release("image", _FakeImage(8, 8))
+    assert not pool.release("image", _FakeImage(0, 8))
+
+    stats = pool.stats()
+    assert stats["image_pool_size"] == 2
+    assert stats["image_buckets"] == 1
+    assert stats["rejected"] == 2
+    assert stats["bytes_by_size_class"] == {256: 512}
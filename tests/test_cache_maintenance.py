@@ -79,6 +79,32 @@ def test_clear_cache_families_removes_only_allowlisted_files(tmp_path: Path) ->
     assert (app_root / "steam" / "cache").is_dir()
 
 
+def test_clear_cache_families_clears_family_entries_in_asset_store(tmp_path: Path) -> None:
+    from core.resources.asset_store import namespace_for_directory, release_asset_store
+
+    app_root = tmp_path / "SRPSS"
+    rss = namespace_for_directory(app_root / "cache" / "rss", app_data_dir=app_root)
+    imgur = namespace_for_directory(app_root / "cache" / "imgur", app_data_dir=app_root)
+    try:
+        rss_record = rss.put("a", b"rss-bytes", ext="jpg")
+        imgur.put("b", b"imgur-bytes", ext="jpg")
+        rss.store.flush()
+
+        result = clear_cache_families(
+            ("rss",),
+            descriptors=get_cache_family_descriptors(app_data_dir=app_root),
+        )
+
+        assert result.complete is True
+        assert result.removed_files == 1
+        assert result.removed_bytes == len(b"rss-bytes")
+        assert not rss_record.path.exists()
+        assert not rss.contains("a")
+        assert imgur.contains("b")
+    finally:
+        release_asset_store(rss.store)
+
+
 def test_clear_cache_families_rejects_unknown_scope(tmp_path: Path) -> None:
     descriptors = get_cache_family_descriptors(app_data_dir=tmp_path / "SRPSS")
 
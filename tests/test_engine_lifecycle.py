@@ -621,6 +621,95 @@ def test_sources_changed_invalidates_prefetch_before_clearing_cache():
     assert events == ["prefetch_invalidated", "cache_cleared"]
 
 
+def test_folder_sources_stream_first_batch_before_scan_finishes():
+    from engine.image_queue import ImageQueue
+    from sources.base_provider import ImageMetadata, ImageSourceType
+
+    def _images(prefix, count):
+        return [
+            ImageMetadata(
+                source_type=ImageSourceType.FOLDER,
+                source_id="lib",
+                image_id=f"{prefix}_{i}",
+                local_path=f"/lib/{prefix}_{i}.jpg",
+            )
+            for i in range(count)
+        ]
+
+    release = threading.Event()
+    threads = []
+
+    class _Source:
+        folder_path = "/lib"
+
+        def iter_image_batches(self):
+            yield _images("first", 3)
+            release.wait(5.0)
+            yield _images("rest", 5)
+
+    class _ThreadManager:
+        def submit_io_task(self, func, *args, **kwargs):
+            thread = threading.Thread(target=func, args=args, daemon=True)
+            threads.append(thread)
+            thread.start()
+            return "scan"
+
+    engine = SimpleNamespace(
+        image_queue=ImageQueue(shuffle=False),
+        folder_sources=[_Source()],
+        thread_manager=_ThreadManager(),
+        _shutting_down=False,
+        _folder_scan_lock=threading.Lock(),
+    )
+
+    # Returns once the first batch is queued, with the scan still running.
+    assert ScreensaverEngine._stream_folder_sources(engine) == 3
+    assert threads[0].is_alive()
+
+    release.set()
+    threads[0].join(5.0)
+    assert engine.image_queue.total_images() == 8
+
+
+def test_folder_rescan_applies_delta_to_live_queue(tmp_path):
+    from engine.image_queue import ImageQueue
+    from sources.folder_source import FolderSource
+
+    library = tmp_path / "library"
+    library.mkdir()
+    for name in ("a.jpg", "b.jpg"):
+        (library / name).write_bytes(b"x")
+    source = FolderSource(library, index_file=tmp_path / "idx.sqlite3")
+    queue = ImageQueue(shuffle=False)
+    queue.add_images(source.get_images())
+
+    class _ThreadManager:
+        def submit_io_task(self, func, *args, **kwargs):
+            func(*args)
+            return "rescan"
+
+    engine = SimpleNamespace(
+        image_queue=queue,
+        folder_sources=[source],
+        thread_manager=_ThreadManager(),
+        _running=True,
+        _shutting_down=False,
+        _folder_scan_lock=threading.Lock(),
+    )
+
+    (library / "a.jpg").unlink()
+    (library / "c.jpg").write_bytes(b"x")
+    ScreensaverEngine._rescan_folder_sources(engine)
+
+    assert sorted(img.local_path.name for img in queue.get_all_images()) == ["b.jpg", "c.jpg"]
+
+    # A scan still holding the sources makes the tick a no-op.
+    (library / "d.jpg").write_bytes(b"x")
+    with engine._folder_scan_lock:
+        ScreensaverEngine._rescan_folder_sources(engine)
+    assert queue.total_images() == 2
+
+
 class TestEngineState:
     """Test EngineState enum and state properties."""
     
@@ -5,6 +5,7 @@ import logging
 import pytest
 
 from core.performance.event_loop_recorder import EventLoopStallRecorder
+from core.performance.metrics_registry import Histogram
 
 
 def _prime(recorder: EventLoopStallRecorder, expected_at: float = 10.0) -> None:
@@ -37,8 +38,9 @@ def test_event_loop_recorder_retention_is_bounded(qt_app):
 
     snapshot = recorder.snapshot()
     assert snapshot.samples == 100
-    assert snapshot.retained_samples == 32
-    assert recorder._lateness_ms.maxlen == 32
+    # One full retained generation (ticks 65-96) plus the live one (97-100).
+    assert snapshot.retained_samples == 36
+    assert recorder._lateness.bucket_count == Histogram().bucket_count
 
 
 def test_event_loop_summary_is_periodic_not_per_tick(qt_app, caplog):
@@ -0,0 +1,135 @@
+"""Tests for crop-before-resample FILL in both the in-process and worker paths."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from PIL import Image
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QImage
+
+from core.process.types import MessageType, WorkerMessage, WorkerType
+from core.process.workers.image_worker import ImageWorker
+from rendering.display_geometry import fill_cover_size, fill_geometry
+from rendering.display_modes import DisplayMode
+from rendering.image_processor_async import AsyncImageProcessor
+
+# (source, target): panorama, portrait-on-landscape, near-matching ratio
+CASES = [
+    ((1200, 300), (320, 180)),
+    ((300, 600), (320, 180)),
+    ((700, 400), (320, 180)),
+]
+
+
+class _Queue:
+    def put_nowait(self, item) -> None:
+        pass
+
+
+def _smooth_rgb(size, seed: int = 0) -> np.ndarray:
+    width, height = size
+    x = np.linspace(0.0, 6.0, width)[None, :]
+    y = np.linspace(0.0, 4.0, height)[:, None]
+    phase = seed * 0.7
+    rgb = np.stack(
+        [
+            127 + 120 * np.sin(x + y + phase),
+            127 + 120 * np.cos(2 * x - y + phase),
+            127 + 120 * np.sin(x * y / 3 + phase),
+        ],
+        axis=-1,
+    )
+    return rgb.astype(np.uint8)
+
+
+def _reference_fill(rgb: np.ndarray, target) -> np.ndarray:
+    """Resample the whole source to the cover size, then centre-crop."""
+    geometry = fill_geometry((rgb.shape[1], rgb.shape[0]), target)
+    cover = Image.fromarray(rgb).resize(geometry.cover_size, Image.Resampling.LANCZOS)
+    left, top = geometry.crop_offset
+    return np.asarray(cover.crop((left, top, left + target[0], top + target[1])))
+
+
+def _qimage_rgb(image: QImage) -> np.ndarray:
+    rgb = image.convertToFormat(QImage.Format.Format_RGB888)
+    rows = np.frombuffer(rgb.constBits(), dtype=np.uint8).reshape(rgb.height(), rgb.bytesPerLine())
+    return rows[:, : rgb.width() * 3].reshape(rgb.height(), rgb.width(), 3).copy()
+
+
+def test_worker_cover_size_uses_shared_geometry() -> None:
+    worker = ImageWorker(_Queue(), _Queue())
+    for source, target in CASES + [((1920, 1080), (1707, 959)), ((801, 1201), (2560, 1440))]:
+        assert worker._calculate_scale_size(source, target, "fill") == fill_cover_size(source, target)
+
+
+def test_source_box_is_centred_and_covers_target_aspect() -> None:
+    geometry = fill_geometry((1200, 300), (320, 180))
+
+    left, top, right, bottom = geometry.source_box
+    assert geometry.cover_size == (720, 180)
+    assert (top, bottom) == (0.0, 300.0)
+    assert left == pytest.approx(1200 - right)
+    assert (right - left) / (bottom - top) == pytest.approx(320 / 180, rel=1e-3)
+
+
+@pytest.mark.parametrize("source,target", CASES)
+def test_in_process_fill_matches_scale_then_crop(qt_app, source, target) -> None:
+    rgb = _smooth_rgb(source)
+    image = QImage(rgb.tobytes(), source[0], source[1], source[0] * 3, QImage.Format.Format_RGB888).copy()
+
+    result = AsyncImageProcessor.process_qimage(image, QSize(*target), DisplayMode.FILL, use_lanczos=True)
+
+    diff = np.abs(_qimage_rgb(result).astype(np.int16) - _reference_fill(rgb, target).astype(np.int16))
+    assert (result.width(), result.height()) == target
+    # Box resampling recomputes filter centres from the box, so fractional
+    # offsets can round a handful of pixels one step differently.
+    assert diff.max() <= 1
+
+
+@pytest.mark.parametrize("source,target", CASES)
+def test_qt_fallback_fill_stays_within_tolerance(qt_app, source, target) -> None:
+    rgb = _smooth_rgb(source, seed=2)
+    image = QImage(rgb.tobytes(), source[0], source[1], source[0] * 3, QImage.Format.Format_RGB888).copy()
+
+    result = AsyncImageProcessor.process_qimage(image, QSize(*target), DisplayMode.FILL, use_lanczos=False)
+
+    diff = np.abs(_qimage_rgb(result).astype(np.int16) - _reference_fill(rgb, target).astype(np.int16))
+    assert (result.width(), result.height()) == target
+    assert diff.mean() < 2.0
+
+
+@pytest.mark.parametrize("source,target", CASES)
+def test_worker_fill_matches_in_process(qt_app, tmp_path, source, target) -> None:
+    rgb = _smooth_rgb(source, seed=1)
+    path = tmp_path / "source.png"
+    Image.fromarray(rgb).save(path)
+    worker = ImageWorker(_Queue(), _Queue())
+    msg = WorkerMessage(
+        msg_type=MessageType.IMAGE_PRESCALE,
+        seq_no=1,
+        correlation_id="fill-1",
+        payload={
+            "path": str(path),
+            "target_width": target[0],
+            "target_height": target[1],
+            "mode": "fill",
+            "use_lanczos": True,
+            "sharpen": False,
+        },
+        worker_type=WorkerType.IMAGE,
+    )
+    try:
+        response = worker.handle_message(msg)
+    finally:
+        worker._cleanup()
+
+    assert response.success
+    assert (response.payload["width"], response.payload["height"]) == target
+    rgba = np.frombuffer(response.payload["rgba_data"], dtype=np.uint8).reshape(target[1], target[0], 4)
+    image = QImage(rgb.tobytes(), source[0], source[1], source[0] * 3, QImage.Format.Format_RGB888).copy()
+    in_process = _qimage_rgb(
+        AsyncImageProcessor.process_qimage(image, QSize(*target), DisplayMode.FILL, use_lanczos=True)
+    )
+    # The worker may box-reduce large sources before Lanczos; these cases
+    # stay under REDUCING_GAP so both paths see the full source.
+    assert np.array_equal(rgba[..., :3], in_process)
@@ -0,0 +1,176 @@
+"""Tests for the persistent folder index and FolderSource delta rescans."""
+import os
+import time
+
+import pytest
+
+from engine.image_queue import ImageQueue
+from sources.folder_index import FolderIndex
+from sources.folder_source import FolderSource, SUPPORTED_EXTENSIONS
+
+
+def _touch(path, payload=b"x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+
+
+def _age_tree(root, seconds=60):
+    """Push directory mtimes out of the racy window so the index trusts them."""
+    past = time.time() - seconds
+    for dirpath, _dirnames, _filenames in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "library"
+    _touch(root / "a.jpg")
+    _touch(root / "notes.txt")
+    _touch(root / "sub" / "b.png")
+    _touch(root / "sub" / "deep" / "c.webp")
+    _touch(root / "other" / "d.JPG")
+    _age_tree(root)
+    return root
+
+
+def test_index_cold_scan_lists_supported_images(library, tmp_path):
+    index = FolderIndex(library, SUPPORTED_EXTENSIONS, index_file=tmp_path / "idx.sqlite3")
+    scan = index.scan()
+
+    names = sorted(entry.name for entry in scan.entries)
+    assert names == ["a.jpg", "b.png", "c.webp", "d.JPG"]
+    assert scan.persistent is True
+    assert scan.rescanned_dirs == 4
+    assert scan.reused_dirs == 0
+
+
+def test_index_warm_scan_reuses_unchanged_directories(library, tmp_path):
+    index_file = tmp_path / "idx.sqlite3"
+    FolderIndex(library, SUPPORTED_EXTENSIONS, index_file=index_file).scan()
+
+    warm = FolderIndex(library, SUPPORTED_EXTENSIONS, index_file=index_file).scan()
+    assert warm.rescanned_dirs == 0
+    assert warm.reused_dirs == 4
+    assert len(warm.entries) == 4
+
+
+def test_index_rescans_only_changed_directory(library, tmp_path):
+    index_file = tmp_path / "idx.sqlite3"
+    index = FolderIndex(library, SUPPORTED_EXTENSIONS, index_file=index_file)
+    index.scan()
+
+    _touch(library / "sub" / "new.jpg")
+    scan = index.scan()
+
+    assert scan.rescanned_dirs == 1
+    assert "new.jpg" in {entry.name for entry in scan.entries}
+
+
+def test_index_drops_removed_subtree(library, tmp_path):
+    import shutil
+
+    index = FolderIndex(library, SUPPORTED_EXTENSIONS, index_file=tmp_path / "idx.sqlite3")
+    index.scan()
+
+    shutil.rmtree(library / "sub")
+    scan = index.scan()
+
+    assert sorted(entry.name for entry in scan.entries) == ["a.jpg", "d.JPG"]
+    assert scan.removed_dirs == 2
+
+
+def test_index_non_recursive(library, tmp_path):
+    index = FolderIndex(library, SUPPORTED_EXTENSIONS, recursive=False, index_file=tmp_path / "idx.sqlite3")
+    assert [entry.name for entry in index.scan().entries] == ["a.jpg"]
+
+
+def test_folder_source_refresh_delta(library, tmp_path):
+    source = FolderSource(library, index_file=tmp_path / "idx.sqlite3")
+
+    first = source.refresh_delta()
+    assert len(first.added) == 4
+    assert first.removed == []
+
+    (library / "a.jpg").unlink()
+    _touch(library / "other" / "e.png")
+    delta = source.refresh_delta()
+
+    assert [img.local_path.name for img in delta.added] == ["e.png"]
+    assert [img.local_path.name for img in delta.removed] == ["a.jpg"]
+    assert len(source.get_images()) == 4
+
+    assert not source.refresh_delta()
+
+
+def test_folder_source_refresh_delta_reports_rewritten_file(library, tmp_path):
+    source = FolderSource(library, index_file=tmp_path / "idx.sqlite3")
+    old = {img.image_id: img for img in source.refresh_delta().added}["sub/b.png"]
+
+    # Save-then-rename, as image editors do; the directory mtime moves.
+    _touch(library / "sub" / "b.tmp", b"rewritten")
+    os.replace(library / "sub" / "b.tmp", library / "sub" / "b.png")
+    delta = source.refresh_delta()
+
+    assert delta.removed == [old]
+    assert [img.image_id for img in delta.added] == ["sub/b.png"]
+    assert delta.added[0].file_size == len(b"rewritten")
+    assert len(source.get_images()) == 4
+
+
+def test_folder_source_iter_image_batches(library, tmp_path):
+    source = FolderSource(library, index_file=tmp_path / "idx.sqlite3")
+
+    batches = source.iter_image_batches(batch_size=1)
+    first = next(batches)
+    assert len(first) == 1
+    # The cache is only replaced once the walk has finished.
+    assert source.get_source_info()["image_count"] == 0
+
+    rest = [img for batch in batches for img in batch]
+    names = sorted(img.local_path.name for img in first + rest)
+    assert names == ["a.jpg", "b.png", "c.webp", "d.JPG"]
+    assert source.get_source_info()["image_count"] == 4
+    assert not source.refresh_delta()
+
+
+def test_abandoned_batch_scan_leaves_cache_untouched(library, tmp_path):
+    source = FolderSource(library, index_file=tmp_path / "idx.sqlite3")
+
+    batches = source.iter_image_batches(batch_size=1)
+    next(batches)
+    batches.close()
+
+    assert source.get_source_info()["image_count"] == 0
+    assert len(source.refresh_delta().added) == 4
+
+
+def test_folder_source_metadata_from_index(library, tmp_path):
+    source = FolderSource(library, index_file=tmp_path / "idx.sqlite3")
+    images = {img.image_id: img for img in source.get_images()}
+
+    deep = images["sub/deep/c.webp"]
+    assert deep.local_path == library / "sub" / "deep" / "c.webp"
+    assert deep.format == "webp"
+    assert deep.file_size == 1
+
+
+def test_folder_source_without_index(library):
+    source = FolderSource(library, use_index=False)
+    assert source.refresh() is True
+    assert len(source.get_images()) == 4
+
+
+def test_image_queue_apply_delta(library, tmp_path):
+    source = FolderSource(library, index_file=tmp_path / "idx.sqlite3")
+    queue = ImageQueue(shuffle=False)
+    queue.add_images(source.get_images())
+
+    (library / "sub" / "b.png").unlink()
+    _touch(library / "f.jpg")
+    delta = source.refresh_delta()
+
+    added, removed = queue.apply_delta(delta.added, delta.removed)
+    assert (added, removed) == (1, 1)
+    names = sorted(img.local_path.name for img in queue.get_all_images())
+    assert names == ["a.jpg", "c.webp", "d.JPG", "f.jpg"]
+    assert all(img.local_path.name != "b.png" for img in queue._queue)
@@ -34,7 +34,8 @@ def test_imap_mark_as_read_uses_uid_store(monkeypatch) -> None:
     assert client.mark_as_read("42") is True
     assert conn.selected == [('"INBOX"', False)]
     assert conn.uid_calls == [("STORE", "42", "+FLAGS", r"(\Seen)")]
-    assert conn.logged_out is True
+    # The session stays open for the next call.
+    assert conn.logged_out is False
 
 
 def test_imap_mark_as_unread_uses_uid_store(monkeypatch) -> None:
@@ -47,7 +48,7 @@ def test_imap_mark_as_unread_uses_uid_store(monkeypatch) -> None:
     assert client.mark_as_unread("42") is True
     assert conn.selected == [('"INBOX"', False)]
     assert conn.uid_calls == [("STORE", "42", "-FLAGS", r"(\Seen)")]
-    assert conn.logged_out is True
+    assert conn.logged_out is False
 
 
 def test_imap_archive_removes_inbox_label(monkeypatch) -> None:
@@ -64,23 +65,21 @@ def test_imap_archive_removes_inbox_label(monkeypatch) -> None:
 def test_imap_spam_and_trash_use_gmail_labels(monkeypatch) -> None:
     from core.gmail.gmail_imap import GmailImapClient
 
-    spam_conn = FakeImapActionConn()
-    trash_conn = FakeImapActionConn()
+    conn = FakeImapActionConn()
+    connects = []
     client = GmailImapClient("fake@example.com", "fake_app_password")
+    monkeypatch.setattr(client, "_connect", lambda: connects.append(1) or conn)
 
-    monkeypatch.setattr(client, "_connect", lambda: spam_conn)
     assert client.spam_message("42") is True
-    assert spam_conn.uid_calls == [
+    assert client.trash_message("42") is True
+    assert conn.uid_calls == [
         ("STORE", "42", "+X-GM-LABELS", r"(\Spam)"),
         ("STORE", "42", "-X-GM-LABELS", r"(\Inbox)"),
-    ]
-
-    monkeypatch.setattr(client, "_connect", lambda: trash_conn)
-    assert client.trash_message("42") is True
-    assert trash_conn.uid_calls == [
         ("STORE", "42", "+X-GM-LABELS", r"(\Trash)"),
         ("STORE", "42", "-X-GM-LABELS", r"(\Inbox)"),
     ]
+    # Both actions ran on one pooled session.
+    assert connects == [1]
 
 
 def test_imap_action_rejects_non_numeric_uid(monkeypatch) -> None:
@@ -119,95 +118,228 @@ def test_imap_metadata_fetch_prefers_uid_fetch() -> None:
     assert conn.uid_calls[0][0] == "FETCH"
 
 
-def test_imap_list_messages_preserves_recent_uid_order(monkeypatch) -> None:
-    from core.gmail.gmail_imap import GmailImapClient
+class FakeImapServer:
+    """Local IMAP stand-in: one mailbox, sequence/UID addressing, CONDSTORE."""
 
-    class FakeListConn:
-        def __init__(self):
-            self.fetch_uids = []
-            self.logged_out = False
-
-        def capability(self):
-            return "OK", [b""]
-
-        def select(self, mailbox, readonly=True):
-            assert mailbox == '"INBOX"'
-            assert readonly is True
-            return "OK", [b""]
-
-        def uid(self, command, *args):
-            if command == "SEARCH":
-                return "OK", [b"1 2 3 4 5 6 7 8 9 10"]
-            if command == "FETCH":
-                uid = args[0].decode("ascii") if isinstance(args[0], bytes) else str(args[0])
-                self.fetch_uids.append(uid)
-                dates = {"9": "Mon, 13 Jan 2025 12:00:00 +0000", "10": "Tue, 14 Jan 2025 12:00:00 +0000"}
-                date = dates.get(uid, "Wed, 01 Jan 2025 12:00:00 +0000")
+    def __init__(self, uids, *, condstore=True, unseen=()):
+        self.capabilities = ("IMAP4REV1", "IDLE", "ENABLE") + (("CONDSTORE",) if condstore else ())
+        self.uids = list(uids)
+        self.unseen = set(unseen)
+        self.uidvalidity = 7
+        self.modseq = 100
+        self.commands = []
+        self.fail_fetch_uids = set()
+        self.logged_out = False
+        self._pending = {}
+
+    # mailbox mutations -------------------------------------------------
+    def deliver(self, uid):
+        self.uids.append(uid)
+        self.unseen.add(uid)
+        self.modseq += 1
+
+    def mark_seen(self, uid):
+        self.unseen.discard(uid)
+        self.modseq += 1
+
+    # imaplib surface ---------------------------------------------------
+    def enable(self, capability):
+        self.commands.append(("ENABLE", capability))
+        return "OK", [b""]
+
+    def capability(self):
+        return "OK", [" ".join(self.capabilities).encode("ascii")]
+
+    def select(self, mailbox, readonly=False):
+        self.commands.append(("SELECT", mailbox, readonly))
+        uidnext = (max(self.uids) + 1) if self.uids else 1
+        self._pending = {
+            "UIDVALIDITY": [str(self.uidvalidity).encode()],
+            "UIDNEXT": [str(uidnext).encode()],
+        }
+        if "CONDSTORE" in self.capabilities:
+            self._pending["HIGHESTMODSEQ"] = [str(self.modseq).encode()]
+        return "OK", [str(len(self.uids)).encode()]
+
+    def response(self, code):
+        return code, self._pending.pop(code, [None])
+
+    def _flags(self, uid):
+        return b"" if uid in self.unseen else b"\\Seen"
+
+    def fetch(self, message_set, query):
+        self.commands.append(("FETCH", message_set, query))
+        first, last = (int(part) for part in message_set.split(":"))
+        rows = []
+        for seq in range(first, last + 1):
+            uid = self.uids[seq - 1]
+            rows.append(f"{seq} (UID {uid} FLAGS (".encode() + self._flags(uid) + b"))")
+        return "OK", rows
+
+    def uid(self, command, *args):
+        self.commands.append(("UID", command) + args)
+        if command == "SEARCH":
+            matches = [uid for uid in self.uids if args[1] != "UNSEEN" or uid in self.unseen]
+            return "OK", [" ".join(str(uid) for uid in matches).encode()]
+        if command == "FETCH":
+            wanted = set()
+            for part in str(args[0]).split(","):
+                lo, _, hi = part.partition(":")
+                wanted.update(range(int(lo), int(hi or lo) + 1))
+            if wanted & self.fail_fetch_uids:
+                raise RuntimeError("System Error")
+            data = []
+            for seq, uid in enumerate(self.uids, start=1):
+                if uid not in wanted:
+                    continue
                 headers = (
                     b"From: fake_sender@example.com\r\n"
-                    + f"Subject: Message {uid}\r\n".encode("ascii")
-                    + f"Date: {date}\r\n".encode("ascii")
-                    + f"Message-ID: <fake-{uid}@example.com>\r\n\r\n".encode("ascii")
+                    + f"Subject: Message {uid}\r\n".encode()
+                    + f"Date: Tue, 14 Jan 2025 12:{uid % 60:02d}:00 +0000\r\n".encode()
+                    + f"Message-ID: <fake-{uid}@example.com>\r\n\r\n".encode()
                 )
-                return "OK", [(f"{uid} (FLAGS (\\Seen))".encode("ascii"), headers)]
-            raise AssertionError(f"unexpected command {command}")
+                info = f"{seq} (UID {uid} FLAGS (".encode() + self._flags(uid) + b") BODY[HEADER.FIELDS] {1}"
+                data.extend([(info, headers), b")"])
+            return "OK", data
+        raise AssertionError(f"unexpected UID command {command}")
 
-        def logout(self):
-            self.logged_out = True
+    def status(self, mailbox, items):
+        self.commands.append(("STATUS", mailbox, items))
+        return "OK", [f'"INBOX" (UNSEEN {len(self.unseen)})'.encode()]
+
+    def logout(self):
+        self.logged_out = True
+
+    def shutdown(self):
+        self.logged_out = True
+
+
+def _client_with(monkeypatch, server):
+    from core.gmail.gmail_imap import GmailImapClient
 
-    conn = FakeListConn()
     client = GmailImapClient("fake@example.com", "fake_app_password")
-    monkeypatch.setattr(client, "_connect", lambda: conn)
+    connects = []
+
+    def _connect():
+        connects.append(1)
+        return server
+
+    monkeypatch.setattr(client, "_connect", _connect)
+    return client, connects
+
+
+def _uid_fetches(server):
+    return [cmd[2] for cmd in server.commands if cmd[:2] == ("UID", "FETCH")]
+
+
+def test_imap_list_messages_preserves_recent_uid_order(monkeypatch) -> None:
+    server = FakeImapServer(range(1, 11))
+    client, _ = _client_with(monkeypatch, server)
 
     messages = client.list_messages(label_ids=["INBOX"], max_results=2)
 
     assert [message.subject for message in messages] == ["Message 10", "Message 9"]
-    assert conn.fetch_uids == ["10", "9"]
-    assert conn.logged_out is True
+    # One batched UID FETCH for the window and no mailbox-wide SEARCH.
+    assert _uid_fetches(server) == ["9:10"]
+    assert not [cmd for cmd in server.commands if cmd[:2] == ("UID", "SEARCH")]
+    assert server.logged_out is False
+
+
+def test_imap_list_messages_is_incremental_and_reuses_connection(monkeypatch) -> None:
+    server = FakeImapServer(range(1, 51))
+    client, connects = _client_with(monkeypatch, server)
+
+    first = client.list_messages(label_ids=["INBOX"], max_results=5)
+    assert [m.imap_uid for m in first] == ["50", "49", "48", "47", "46"]
+
+    # Unchanged mailbox: EXAMINE only, no FETCH at all.
+    server.commands.clear()
+    assert client.list_messages(label_ids=["INBOX"], max_results=5) == first
+    assert [cmd[0] for cmd in server.commands] == ["SELECT"]
+
+    # New mail + a flag change: only the new UID's headers are fetched.
+    server.deliver(51)
+    server.unseen.add(48)
+    server.commands.clear()
+    updated = client.list_messages(label_ids=["INBOX"], max_results=5)
+
+    assert [m.imap_uid for m in updated] == ["51", "50", "49", "48", "47"]
+    assert _uid_fetches(server) == ["51"]
+    assert updated[3].is_unread is True and "UNREAD" in updated[3].labels
+    assert connects == [1]
 
 
 def test_imap_list_messages_raises_on_partial_fetch_failure(monkeypatch) -> None:
+    server = FakeImapServer([1, 2])
+    server.fail_fetch_uids = {1}
+    client, _ = _client_with(monkeypatch, server)
+
+    with pytest.raises(RuntimeError, match="partial fetch failure"):
+        client.list_messages(label_ids=["INBOX"], max_results=2)
+
+
+def test_imap_session_reconnects_once_after_drop(monkeypatch) -> None:
+    import imaplib
+
     from core.gmail.gmail_imap import GmailImapClient
 
-    class FakeListConn:
-        def __init__(self):
-            self.logged_out = False
-
-        def capability(self):
-            return "OK", [b""]
-
-        def select(self, mailbox, readonly=True):
-            assert mailbox == '"INBOX"'
-            assert readonly is True
-            return "OK", [b""]
-
-        def uid(self, command, *args):
-            if command == "SEARCH":
-                return "OK", [b"1 2"]
-            if command == "FETCH":
-                uid = args[0].decode("ascii") if isinstance(args[0], bytes) else str(args[0])
-                if uid == "2":
-                    headers = (
-                        b"From: fake_sender@example.com\r\n"
-                        b"Subject: Message 2\r\n"
-                        b"Date: Tue, 14 Jan 2025 12:00:00 +0000\r\n"
-                        b"Message-ID: <fake-2@example.com>\r\n\r\n"
-                    )
-                    return "OK", [(b"2 (FLAGS (\\Seen))", headers)]
-                raise RuntimeError("System Error")
-            raise AssertionError(f"unexpected command {command}")
+    dropped = FakeImapServer([1, 2, 3])
+    healthy = FakeImapServer([1, 2, 3])
 
-        def logout(self):
-            self.logged_out = True
+    def _abort(*_args, **_kwargs):
+        raise imaplib.IMAP4.abort("socket error: EOF")
 
-    conn = FakeListConn()
+    dropped.select = _abort
+    conns = [dropped, healthy]
     client = GmailImapClient("fake@example.com", "fake_app_password")
-    monkeypatch.setattr(client, "_connect", lambda: conn)
+    monkeypatch.setattr(client, "_connect", lambda: conns.pop(0))
 
-    with pytest.raises(RuntimeError, match="partial fetch failure"):
-        client.list_messages(label_ids=["INBOX"], max_results=2)
+    messages = client.list_messages(label_ids=["INBOX"], max_results=3)
+
+    assert [m.imap_uid for m in messages] == ["3", "2", "1"]
+    assert conns == []
+
+
+def test_imap_connect_failures_back_off(monkeypatch) -> None:
+    from core.gmail.gmail_imap import GmailImapClient
+
+    attempts = []
+
+    def _refuse():
+        attempts.append(1)
+        raise OSError("connection refused")
+
+    client = GmailImapClient("fake@example.com", "fake_app_password")
+    monkeypatch.setattr(client, "_connect", _refuse)
+
+    assert client.get_unread_count() == 0
+    assert client.get_unread_count() == 0
+    assert attempts == [1]
+    assert client._backoff.delay_s > 0
+
+
+def test_imap_idle_watcher_reports_mailbox_changes() -> None:
+    from core.gmail.gmail_imap_idle import GmailImapIdleWatcher
+
+    class FakeIdleConn:
+        def __init__(self):
+            self.sent = []
+            self.lines = [b"+ idling\r\n", b"* 4 EXISTS\r\n", b"A1 OK IDLE terminated\r\n"]
+
+        def _new_tag(self):
+            return b"A1"
+
+        def send(self, data):
+            self.sent.append(data)
+
+        def readline(self):
+            return self.lines.pop(0)
+
+    conn = FakeIdleConn()
+    watcher = GmailImapIdleWatcher(client=None, on_change=lambda: None)
 
-    assert conn.logged_out is True
+    assert watcher._idle_until_change(conn) is True
+    assert conn.sent == [b"A1 IDLE\r\n", b"DONE\r\n"]
 
 
 def test_backend_tests_supplied_imap_credentials_without_saving(monkeypatch, tmp_path) -> None:
@@ -528,7 +528,7 @@ def test_normal_async_retry_retains_existing_image_change_owner():
         def __init__(self):
             self.callbacks = []
 
-        def submit_compute_task(self, _task, *, callback, category):
+        def submit_compute_task(self, _task, *, callback, category, priority=None):
             self.callbacks.append((callback, category))
 
         def run_on_ui_thread(self, callback):
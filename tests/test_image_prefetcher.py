@@ -7,6 +7,7 @@ from PySide6.QtGui import QColor, QImage, QPixmap
 
 from rendering.display_modes import DisplayMode
 from utils.image_prefetcher import ImagePrefetcher
+from utils.prefetch_planner import PrefetchPlan, PrefetchPlanner
 
 
 def _solid_qimage(width: int, height: int, color: str) -> QImage:
@@ -634,3 +635,34 @@ def test_scaled_prefetch_compute_returns_qimage_not_qpixmap(qt_app):
     assert key == "worker-safe-scaled"
     assert isinstance(image, QImage)
     assert not isinstance(image, QPixmap)
+
+
+def test_planner_plan_widens_concurrency_and_records_scale_latency(qt_app):
+    raw_path = r"C:\wall\planned.jpg"
+    cache = _FakeCache({raw_path: _solid_qimage(320, 180, "blue")})
+    threads = _FakeThreads()
+    planner = PrefetchPlanner(max_concurrency=6)
+    prefetcher = ImagePrefetcher(threads, cache, max_concurrent=1, planner=planner)
+    raw_paths = [fr"C:\wall\{idx}.jpg" for idx in range(6)]
+
+    prefetcher.prefetch_paths(raw_paths)
+    assert len(threads.io_callbacks) == 1
+
+    prefetcher.apply_plan(
+        PrefetchPlan(
+            depth=7,
+            concurrency=5,
+            post_transition_delay_ms=0.0,
+            service_time_s=2.0,
+            slide_interval_s=0.5,
+        )
+    )
+
+    # The plan may go past the legacy four-worker cap and fills the new slots.
+    assert len(threads.io_callbacks) == 5
+    assert prefetcher.get_post_transition_delay_ms() == 0
+
+    prefetcher.register_scaled_requests([_scaled_request(raw_path, "planned-scaled")])
+    compute, _callback = threads.compute_callbacks[0]
+    assert compute()[0] == "planned-scaled"
+    assert "local.scale_p95_ms" in prefetcher.snapshot_planner_state()["latency"]
@@ -1,7 +1,9 @@
 """Tests for image processor."""
 import pytest
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtGui import QColor, QPixmap, QImage
+from core.resources.buffer_pool import ImageBufferPool, format_key
+from core.resources.manager import ResourceManager
 from rendering.image_processor import ImageProcessor
 from rendering.display_modes import DisplayMode
 from rendering.image_processor_async import AsyncImageProcessor
@@ -324,3 +326,65 @@ def _to_argb32_bytes(value) -> bytes:
         ptr.setsize(image.sizeInBytes())
         return bytes(ptr)
     return ptr.tobytes()
+
+
+class _PoolManager:
+    """Stand-in for the app-shared ResourceManager's QImage pool."""
+
+    def __init__(self) -> None:
+        self.pool = ImageBufferPool(byte_budget=1 << 24)
+
+    def acquire_image(self, width, height, format_hint=None, *, clear=True):
+        image_format = None if format_hint is None else format_key(format_hint)
+        return self.pool.acquire("image", width, height, image_format)
+
+    def release_image(self, image) -> bool:
+        return self.pool.release("image", image)
+
+
+@pytest.fixture
+def pool_manager(monkeypatch):
+    manager = _PoolManager()
+    monkeypatch.setattr(ResourceManager, "get_app_shared", classmethod(lambda cls: manager))
+    return manager
+
+
+def test_recycled_canvas_is_reused_by_next_process(qt_app, pool_manager):
+    """A canvas handed back via recycle() backs the next same-size result."""
+    screen = QSize(320, 180)
+    source = QImage(640, 200, QImage.Format.Format_ARGB32)
+    source.fill(Qt.GlobalColor.red)
+
+    first = AsyncImageProcessor.process_qimage(source, screen, DisplayMode.FIT)
+    AsyncImageProcessor.recycle(first)
+    assert pool_manager.pool.stats()["image_pool_size"] == 1
+
+    second = AsyncImageProcessor.process_qimage(source, screen, DisplayMode.FIT)
+    assert second is first
+    assert pool_manager.pool.stats()["image_hits"] == 1
+    # Letterbox bars were repainted black, the image band red.
+    assert second.pixelColor(0, 0) == QColor(Qt.GlobalColor.black)
+    assert second.pixelColor(160, 90) == QColor(Qt.GlobalColor.red)
+
+
+def test_perfect_fit_input_is_never_pooled(qt_app, pool_manager):
+    """The perfect-fit path returns the caller's image, which must stay intact."""
+    screen = QSize(320, 180)
+    cached = QImage(screen, QImage.Format.Format_ARGB32_Premultiplied)
+    cached.fill(Qt.GlobalColor.green)
+
+    result = AsyncImageProcessor.process_qimage(cached, screen, DisplayMode.FILL)
+    assert result is cached
+    AsyncImageProcessor.recycle(result)
+    assert pool_manager.pool.stats()["image_pool_size"] == 0
+
+    # Even a former canvas stops being poolable once it is fed back in.
+    canvas = AsyncImageProcessor.process_qimage(
+        QImage(640, 200, QImage.Format.Format_ARGB32), screen, DisplayMode.FIT
+    )
+    assert AsyncImageProcessor.process_qimage(canvas, screen, DisplayMode.FILL) is canvas
+    AsyncImageProcessor.recycle(canvas)
+    assert pool_manager.pool.stats()["image_pool_size"] == 0
+
+    AsyncImageProcessor.process_qimage(cached, screen, DisplayMode.FIT)
+    assert cached.pixelColor(160, 90) == QColor(Qt.GlobalColor.green)
@@ -1,4 +1,6 @@
 """Tests for image queue."""
+import random
+
 import pytest
 from engine.image_queue import ImageQueue
 from sources.base_provider import ImageMetadata, ImageSourceType
@@ -460,3 +462,148 @@ def test_wraparound_preserves_shuffle():
     
     # Without shuffle, order should be identical
     assert first_round == second_round
+
+
+def test_recent_history_index_tracks_eviction_and_previous(sample_images):
+    """Key index matches a linear history scan across eviction and Back."""
+    queue = ImageQueue(shuffle=False, history_size=4)
+    queue.add_images(sample_images[:6])
+
+    for _ in range(6):
+        queue.next()  # history now image_2..image_5
+
+    assert queue._is_in_recent_history(sample_images[1], lookback=10) is False
+    assert queue._is_in_recent_history(sample_images[2], lookback=4) is True
+    assert queue._is_in_recent_history(sample_images[2], lookback=3) is False
+    assert len(queue._last_seen) == 4
+
+    queue.previous()  # drops image_5
+    assert queue._is_in_recent_history(sample_images[5], lookback=10) is False
+    assert queue._is_in_recent_history(sample_images[4], lookback=1) is True
+
+    queue.clear()
+    assert queue._last_seen == {}
+    assert queue._image_info == {}
+
+
+def _folder_images(count: int, prefix: str = "img"):
+    from pathlib import Path
+
+    return [
+        ImageMetadata(
+            source_type=ImageSourceType.FOLDER,
+            source_id="/test",
+            image_id=f"{prefix}_{i}",
+            local_path=Path(f"/test/{prefix}_{i}.jpg"),
+        )
+        for i in range(count)
+    ]
+
+
+def test_ingest_streams_generator_in_batches():
+    """ingest() accepts a generator and splices every image exactly once."""
+    images = _folder_images(100)
+    queue = ImageQueue(shuffle=True)
+
+    assert queue.ingest((img for img in images), batch_size=7) == 100
+    assert queue.total_images() == 100
+    assert sorted(img.image_id for img in queue._queue) == sorted(img.image_id for img in images)
+    assert len(queue._local_queue) == 100
+
+
+def test_ingest_spreads_new_images_through_pending_queue():
+    """Late arrivals are spliced into the remaining cycle, not appended."""
+    queue = ImageQueue(shuffle=True)
+    queue._rng.seed(5)
+    queue.ingest(_folder_images(200, "old"))
+    queue.ingest(_folder_images(50, "new"))
+
+    positions = [i for i, img in enumerate(queue._queue) if img.image_id.startswith("new_")]
+    assert len(positions) == 50
+    assert min(positions) < 200
+
+
+def test_ingest_without_shuffle_keeps_order():
+    images = _folder_images(10)
+    queue = ImageQueue(shuffle=False)
+    queue.ingest(iter(images), batch_size=3)
+
+    assert [img.image_id for img in queue._queue] == [img.image_id for img in images]
+
+
+def test_ingest_splice_matches_inside_out_shuffle():
+    """Batches are spliced with the same draws as an in-place Fisher-Yates."""
+    queue = ImageQueue(shuffle=True)
+    queue.ingest(_folder_images(1000, "old"))
+    pending = list(queue._local_queue)
+
+    queue._rng.seed(3)
+    queue.ingest(_folder_images(600, "new"), batch_size=600)
+
+    rng = random.Random(3)
+    for item in _folder_images(600, "new"):
+        pending.append(item)
+        j = rng.randrange(len(pending))
+        pending[-1], pending[j] = pending[j], item
+    assert [img.image_id for img in queue._local_queue] == [img.image_id for img in pending]
+
+
+class _DeferredThreadManager:
+    def __init__(self):
+        self.tasks = []
+
+    def submit_compute_task(self, func, *args, **kwargs):
+        self.tasks.append((func, args))
+        return f"task-{len(self.tasks)}"
+
+    def run_all(self):
+        tasks, self.tasks = self.tasks, []
+        for func, args in tasks:
+            func(*args)
+
+
+def _cycle_ids(queue, count):
+    return [queue.next().image_id for _ in range(count)]
+
+
+def test_background_reshuffle_matches_inline_cycle():
+    """A prepared cycle is identical whether or not the worker finished in time."""
+    images = _folder_images(300)
+
+    def build(thread_manager):
+        queue = ImageQueue(shuffle=True, history_size=1)
+        queue._rng.seed(11)
+        queue.set_thread_manager(thread_manager)
+        queue.ingest(images)
+        return queue
+
+    manager = _DeferredThreadManager()
+    background = build(manager)
+    inline = build(None)
+
+    first = _cycle_ids(background, 300)
+    assert first == _cycle_ids(inline, 300)
+    assert manager.tasks, "low-water mark should have scheduled a reshuffle"
+    manager.run_all()
+    assert "combined" in background._next_cycles
+
+    assert _cycle_ids(background, 300) == _cycle_ids(inline, 300)
+
+
+def test_stale_background_reshuffle_is_discarded():
+    manager = _DeferredThreadManager()
+    queue = ImageQueue(shuffle=True, history_size=1)
+    queue.set_thread_manager(manager)
+    queue.ingest(_folder_images(100))
+    _cycle_ids(queue, 100)
+    assert manager.tasks
+
+    queue.ingest(_folder_images(5, "late"))
+    manager.run_all()
+
+    assert queue._next_cycles == {}
+    # The late batch was spliced into the (empty) pending queue; the next
+    # full cycle is rebuilt from all 105 images.
+    assert all(i.startswith("late_") for i in _cycle_ids(queue, 5))
+    ids = _cycle_ids(queue, 105)
+    assert sum(1 for i in ids if i.startswith("late_")) == 5
@@ -319,6 +319,99 @@ class TestImageWorkerCacheKey:
         assert response.payload["cache_key"] == expected_key
 
 
+@pytest.fixture
+def camera_jpeg_path():
+    """Create a large JPEG so the worker can use DCT-domain draft decode."""
+    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
+        img = Image.linear_gradient("L").resize((3200, 2400)).convert("RGB")
+        img.save(f.name, "JPEG", quality=90)
+        yield f.name
+    try:
+        os.unlink(f.name)
+    except Exception:
+        pass
+
+
+class TestImageWorkerReducedDecode:
+    """Tests for draft/reduce decode ahead of the Lanczos prescale."""
+    
+    def _prescale(self, w, path, width, height, mode="fill"):
+        msg = WorkerMessage(
+            msg_type=MessageType.IMAGE_PRESCALE,
+            seq_no=1,
+            correlation_id="test-reduced",
+            payload={
+                "path": path,
+                "target_width": width,
+                "target_height": height,
+                "mode": mode,
+            },
+            worker_type=WorkerType.IMAGE,
+        )
+        return w.handle_message(msg)
+    
+    def test_jpeg_uses_draft_decode(self, worker, camera_jpeg_path):
+        w, req_q, resp_q = worker
+        response = self._prescale(w, camera_jpeg_path, 640, 480)
+        
+        assert response.success is True
+        assert response.payload["width"] == 640
+        assert response.payload["height"] == 480
+        assert response.payload["original_width"] == 3200
+        assert response.payload["original_height"] == 2400
+        # 3200 -> 640 needs 1/5; the smallest covering DCT scale is 1/4
+        assert response.payload["decode_scale"] == pytest.approx(0.25)
+        stats = w.get_decode_stats()
+        assert stats["draft_decodes"] == 1
+        assert stats["full_decodes"] == 0
+        assert stats["decoded_pixel_ratio"] == pytest.approx(1 / 16)
+    
+    def test_draft_output_matches_full_decode(self, worker, camera_jpeg_path):
+        w, req_q, resp_q = worker
+        response = self._prescale(w, camera_jpeg_path, 640, 480)
+        reduced = Image.frombytes("RGBA", (640, 480), response.payload["rgba_data"])
+        
+        reference = Image.open(camera_jpeg_path).convert("RGBA").resize(
+            (640, 480), Image.Resampling.LANCZOS
+        )
+        from PIL import ImageChops, ImageStat
+        diff = ImageStat.Stat(ImageChops.difference(reduced, reference)).mean
+        assert max(diff[:3]) < 8
+    
+    def test_png_uses_integer_reduce(self, worker, large_test_image_path):
+        w, req_q, resp_q = worker
+        response = self._prescale(w, large_test_image_path, 320, 180)
+        
+        assert response.success is True
+        assert response.payload["width"] == 320
+        assert response.payload["decode_scale"] == pytest.approx(1 / 3)
+        assert w.get_decode_stats()["reduced_decodes"] == 1
+    
+    def test_palette_png_reduces_after_conversion(self, worker):
+        w, req_q, resp_q = worker
+        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+            Image.new("RGB", (4000, 3000), color=(40, 90, 200)).quantize(16).save(f.name, "PNG")
+        try:
+            assert Image.open(f.name).mode == "P"
+            response = self._prescale(w, f.name, 640, 360)
+        finally:
+            os.unlink(f.name)
+        
+        assert response.success is True
+        assert (response.payload["width"], response.payload["height"]) == (640, 360)
+        assert w.get_decode_stats()["reduced_decodes"] == 1
+        pixel = Image.frombytes("RGBA", (640, 360), response.payload["rgba_data"]).getpixel((320, 180))
+        assert abs(pixel[2] - 200) <= 8 and pixel[3] == 255
+    
+    def test_upscale_decodes_full(self, worker, test_image_path):
+        w, req_q, resp_q = worker
+        response = self._prescale(w, test_image_path, 640, 480)
+        
+        assert response.success is True
+        assert response.payload["decode_scale"] == 1.0
+        assert w.get_decode_stats()["full_decodes"] == 1
+
+
 class TestImageWorkerLatency:
     """Tests for worker latency requirements."""
     
@@ -12,13 +12,14 @@ from core.process.shared_memory_transport import (
     SHARED_MEMORY_ACK_ATTACHED,
     SharedMemoryAccounting,
     SharedMemoryDescriptor,
+    SharedMemorySlabPool,
     close_producer_shared_memory,
     create_image_shared_memory,
 )
 from core.process.supervisor import ProcessSupervisor
 from core.process.types import MessageType, WorkerResponse, WorkerState, WorkerType
 from core.process.workers.image_worker import ImageWorker
-from engine.image_pipeline import load_image_via_worker
+from engine.image_pipeline import lease_image_via_worker, load_image_via_worker
 
 
 def _new_transfer(
@@ -72,6 +73,12 @@ def test_parent_consumes_once_and_returns_live_accounting_to_zero() -> None:
             "segments_consumed": 1,
             "segments_reclaimed_late": 0,
             "unlink_failures": 0,
+            "slab_count": 3,
+            "slabs_leased": 0,
+            "slab_bytes": 3840 * 2160 * 4,
+            "slab_transfers": 0,
+            "slab_reuse_hits": 0,
+            "slab_fallbacks": 1,
         }
     finally:
         close_producer_shared_memory(producer, attached=True)
@@ -99,6 +106,12 @@ def test_accounting_does_not_retain_completed_transfer_names() -> None:
         "segments_consumed": 1000,
         "segments_reclaimed_late": 0,
         "unlink_failures": 0,
+        "slab_count": 0,
+        "slabs_leased": 0,
+        "slab_bytes": 0,
+        "slab_transfers": 0,
+        "slab_reuse_hits": 0,
+        "slab_fallbacks": 0,
     }
 
 
@@ -133,6 +146,12 @@ def test_malformed_descriptor_is_reclaimed_and_accounted(
             "segments_consumed": 0,
             "segments_reclaimed_late": 1,
             "unlink_failures": 0,
+            "slab_count": 3,
+            "slabs_leased": 0,
+            "slab_bytes": 3840 * 2160 * 4,
+            "slab_transfers": 0,
+            "slab_reuse_hits": 0,
+            "slab_fallbacks": 0,
         }
     finally:
         close_producer_shared_memory(producer, attached=True)
@@ -466,3 +485,183 @@ def test_cleanup_worker_drains_queue_before_closing_it() -> None:
         close_producer_shared_memory(producer, attached=True)
         supervisor.shutdown()
     _assert_mapping_gone(descriptor.name)
+
+
+def _slab_response(
+    supervisor: ProcessSupervisor,
+    worker: ImageWorker,
+    rgba_data: bytes,
+    *,
+    correlation_id: str,
+    width: int = 2,
+    height: int = 1,
+) -> WorkerResponse:
+    ticket = supervisor._image_slabs.lease(correlation_id)
+    assert ticket is not None
+    descriptor = worker._write_to_slab(ticket.payload_fields(), rgba_data)
+    assert descriptor is not None and descriptor.pooled
+    raw = WorkerResponse(
+        msg_type=MessageType.IMAGE_RESULT,
+        seq_no=1,
+        correlation_id=correlation_id,
+        success=True,
+        payload={
+            "width": width,
+            "height": height,
+            "format": "RGBA",
+            **descriptor.payload_fields(),
+        },
+    )
+    return supervisor._response_from_data(raw.to_dict())
+
+
+def _slab_supervisor(slab_count: int = 2, slab_bytes: int = 64) -> ProcessSupervisor:
+    supervisor = ProcessSupervisor()
+    supervisor._image_slabs.close()
+    supervisor._image_slabs = SharedMemorySlabPool(
+        slab_count,
+        slab_bytes,
+        accounting=supervisor._shared_memory_accounting,
+    )
+    return supervisor
+
+
+def test_slab_roundtrip_reuses_slab_without_new_segments() -> None:
+    supervisor = _slab_supervisor(slab_count=1)
+    worker = ImageWorker(_ResponseQueue(), _ResponseQueue())
+    try:
+        for index, rgba in enumerate((
+            bytes((1, 2, 3, 255, 4, 5, 6, 255)),
+            bytes((7, 8, 9, 255, 10, 11, 12, 255)),
+        )):
+            response = _slab_response(
+                supervisor,
+                worker,
+                rgba,
+                correlation_id=f"slab-{index}",
+            )
+            copied = supervisor.consume_shared_memory_response(
+                response,
+                lambda view, _descriptor: bytes(view),
+            )
+            assert copied == rgba
+
+        accounting = supervisor.get_shared_memory_accounting_snapshot()
+        assert accounting["segments_created"] == 0
+        assert accounting["slab_transfers"] == 2
+        assert accounting["slab_reuse_hits"] == 1
+        assert accounting["slab_fallbacks"] == 0
+        assert accounting["slabs_leased"] == 0
+    finally:
+        worker._cleanup()
+        supervisor.shutdown()
+
+
+def test_slab_ring_exhaustion_and_oversize_fall_back() -> None:
+    supervisor = _slab_supervisor(slab_count=1, slab_bytes=8)
+    worker = ImageWorker(_ResponseQueue(), _ResponseQueue())
+    try:
+        ticket = supervisor._image_slabs.lease("busy")
+        assert ticket is not None
+        assert supervisor._image_slabs.lease("starved") is None
+        assert worker._write_to_slab(ticket.payload_fields(), bytes(16)) is None
+        assert worker._write_to_slab({"name": "srpss_img_bogus"}, bytes(8)) is None
+    finally:
+        worker._cleanup()
+        supervisor.shutdown()
+
+
+def test_dispose_and_restart_return_pending_slabs_to_ring() -> None:
+    supervisor = _slab_supervisor(slab_count=2)
+    worker = ImageWorker(_ResponseQueue(), _ResponseQueue())
+    try:
+        response = _slab_response(
+            supervisor,
+            worker,
+            bytes(8),
+            correlation_id="discarded",
+        )
+        assert supervisor._image_slabs.lease("in-flight") is not None
+        assert supervisor.get_shared_memory_accounting_snapshot()["slabs_leased"] == 2
+
+        supervisor.dispose_response(response, reason="test_discard")
+        assert supervisor._image_slabs.release_pending() == 1
+        assert supervisor.get_shared_memory_accounting_snapshot()["slabs_leased"] == 0
+    finally:
+        worker._cleanup()
+        supervisor.shutdown()
+
+
+def test_zero_copy_lease_borrows_slab_until_released() -> None:
+    rgba = bytes((255, 0, 0, 255, 0, 0, 255, 255))
+    supervisor = _slab_supervisor(slab_count=1)
+    worker = ImageWorker(_ResponseQueue(), _ResponseQueue())
+    engine = SimpleNamespace(
+        _process_supervisor=supervisor,
+        _runtime_generation=1,
+        _shutting_down=False,
+        display_manager=object(),
+        settings_manager=None,
+    )
+    supervisor.is_running = lambda _worker_type: True
+    supervisor.send_request_and_await_response = (
+        lambda *_args, **_kwargs: _slab_response(
+            supervisor,
+            worker,
+            rgba,
+            correlation_id="zero-copy",
+        )
+    )
+    try:
+        lease = lease_image_via_worker(engine, "synthetic.png", 2, 1)
+        assert lease is not None and lease.borrowed
+        assert lease.image.pixelColor(1, 0) == QColor(0, 0, 255, 255)
+        assert supervisor.get_shared_memory_accounting_snapshot()["slabs_leased"] == 1
+
+        owned = lease.detach()
+        assert not lease.borrowed
+        assert owned.pixelColor(0, 0) == QColor(255, 0, 0, 255)
+        assert supervisor.get_shared_memory_accounting_snapshot()["slabs_leased"] == 0
+    finally:
+        worker._cleanup()
+        supervisor.shutdown()
+
+
+def test_load_image_via_worker_copies_through_lease_and_frees_slab() -> None:
+    rgba = bytes((0, 255, 0, 255, 10, 20, 30, 255))
+    supervisor = _slab_supervisor(slab_count=1)
+    worker = ImageWorker(_ResponseQueue(), _ResponseQueue())
+    engine = SimpleNamespace(
+        _process_supervisor=supervisor,
+        _runtime_generation=1,
+        _shutting_down=False,
+        display_manager=object(),
+        settings_manager=None,
+    )
+    leased: list[str] = []
+    lease = supervisor.lease_shared_memory_response
+
+    def _recording_lease(response):
+        leased.append(response.correlation_id)
+        return lease(response)
+
+    supervisor.is_running = lambda _worker_type: True
+    supervisor.lease_shared_memory_response = _recording_lease
+    supervisor.send_request_and_await_response = (
+        lambda *_args, **_kwargs: _slab_response(
+            supervisor,
+            worker,
+            rgba,
+            correlation_id="copy-path",
+        )
+    )
+    try:
+        qimage = load_image_via_worker(engine, "synthetic.png", 2, 1)
+        assert leased == ["copy-path"]
+        assert supervisor.get_shared_memory_accounting_snapshot()["slabs_leased"] == 0
+        # The slab is free again, so the copy must not alias it.
+        assert supervisor._image_slabs.lease("next") is not None
+        assert qimage.pixelColor(1, 0) == QColor(10, 20, 30, 255)
+    finally:
+        worker._cleanup()
+        supervisor.shutdown()
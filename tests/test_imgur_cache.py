@@ -222,6 +222,33 @@ class TestMetadataPersistence:
             _, meta = result
             assert meta.gallery_url == "url1"
 
+    def test_legacy_metadata_is_migrated_into_asset_store(self):
+        """Test that a JSON-indexed cache directory is adopted once."""
+        import json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            (cache_dir / "old1.jpg").write_bytes(b"\xff\xd8\xff" + b"x" * 200)
+            (cache_dir / "cache_metadata.json").write_text(json.dumps({
+                "version": 1,
+                "items": [{
+                    "id": "old1", "path": str(cache_dir / "old1.jpg"), "size_bytes": 203,
+                    "width": 320, "height": 240, "last_accessed": 1.0, "download_time": 1.0,
+                    "is_animated": False, "gallery_url": "https://imgur.com/gallery/old1",
+                }],
+            }))
+
+            cache = ImgurImageCache(cache_dir=cache_dir)
+            try:
+                assert not (cache_dir / "cache_metadata.json").exists()
+                assert not (cache_dir / "old1.jpg").exists()
+                path, meta = cache.get("old1")
+                assert path.exists()
+                assert (meta.width, meta.height) == (320, 240)
+                assert meta.gallery_url == "https://imgur.com/gallery/old1"
+            finally:
+                cache.cleanup()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
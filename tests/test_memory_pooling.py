@@ -17,7 +17,7 @@ class TestPixmapPoolManagement:
         from core.resources.manager import ResourceManager
         
         rm = ResourceManager()
-        assert len(rm._pixmap_pool) == 0
+        assert rm.get_pool_stats()["pixmap_pool_size"] == 0
     
     def test_pixmap_pool_max_size_constant(self):
         """Test PIXMAP_POOL_MAX_SIZE is reasonable."""
@@ -45,7 +45,7 @@ class TestImagePoolManagement:
         from core.resources.manager import ResourceManager
         
         rm = ResourceManager()
-        assert len(rm._image_pool) == 0
+        assert rm.get_pool_stats()["image_pool_size"] == 0
     
     def test_image_pool_max_size_constant(self):
         """Test IMAGE_POOL_MAX_SIZE is reasonable."""
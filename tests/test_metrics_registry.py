@@ -0,0 +1,84 @@
+"""Tests for the streaming histogram metrics registry."""
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+from core.performance.metrics_registry import (
+    JSONL_FILENAME,
+    OPENMETRICS_FILENAME,
+    Histogram,
+    MetricsRegistry,
+)
+
+
+def test_quantiles_stay_within_bucket_error():
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(2.0, 0.8) for _ in range(20000)]
+    hist = Histogram()
+    for value in samples:
+        hist.record(value)
+
+    ordered = sorted(samples)
+    snap = hist.snapshot()
+    assert snap.count == len(samples)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * len(ordered)) - 1]
+        assert abs(snap.quantile(q) - exact) <= exact * 0.04
+    assert snap.min == min(samples)
+    assert snap.max == max(samples)
+
+
+def test_single_sample_reports_exact_value_and_empty_is_zero():
+    hist = Histogram()
+    assert hist.snapshot().quantile(0.99) == 0.0
+
+    hist.record(200)
+    snap = hist.snapshot()
+    assert snap.quantile(0.5) == 200.0
+    assert snap.quantile(0.99) == 200.0
+
+
+def test_window_resets_without_touching_cumulative_counts():
+    hist = Histogram()
+    for value in (1.0, 2.0, 3.0):
+        hist.record(value)
+
+    window = hist.window()
+    assert window.count == 3
+    assert hist.window_count == 0
+    assert hist.count == 3
+
+    hist.record(50.0)
+    peek = hist.window(reset=False)
+    assert (peek.count, peek.min, peek.max) == (1, 50.0, 50.0)
+    assert hist.window_count == 1
+
+
+def test_interval_export_does_not_disturb_owner_windows(tmp_path: Path):
+    registry = MetricsRegistry()
+    owned = registry.attach("delivery_ms", Histogram(), labels={"screen": "0"})
+    ticks = registry.counter("ticks")
+    for value in (4.0, 8.0):
+        owned.record(value)
+    ticks.inc(2)
+
+    registry.export(tmp_path)
+    owned.record(16.0)
+    ticks.inc()
+    registry.export(tmp_path)
+
+    assert owned.window_count == 3
+    lines = [json.loads(line) for line in (tmp_path / JSONL_FILENAME).read_text().splitlines()]
+    assert len(lines) == 2
+    second = {m["name"]: m for m in lines[1]["metrics"]}
+    assert second["delivery_ms"]["count"] == 1
+    assert second["delivery_ms"]["labels"] == {"screen": "0"}
+    assert second["ticks"]["value"] == 1
+
+    text = (tmp_path / OPENMETRICS_FILENAME).read_text()
+    assert "# TYPE srpss_delivery_ms summary" in text
+    assert 'srpss_delivery_ms_count{screen="0"} 3' in text
+    assert "srpss_ticks_total 3" in text
+    assert text.endswith("# EOF\n")
@@ -0,0 +1,96 @@
+"""Tests for the latency/deadline-driven PrefetchPlanner."""
+from __future__ import annotations
+
+from utils.prefetch_planner import (
+    SOURCE_LOCAL,
+    SOURCE_NETWORK,
+    SOURCE_RSS_CACHE,
+    STAGE_DECODE,
+    STAGE_SCALE,
+    LatencyHistogram,
+    PrefetchPlanner,
+)
+
+
+def _feed(planner: PrefetchPlanner, source: str, decode_s: float, scale_s: float, count: int = 20) -> None:
+    for _ in range(count):
+        planner.record_latency(source, STAGE_DECODE, decode_s)
+        planner.record_latency(source, STAGE_SCALE, scale_s)
+
+
+def test_histogram_quantile_tracks_tail_within_bucket_error():
+    hist = LatencyHistogram()
+    for _ in range(95):
+        hist.record(0.010)
+    for _ in range(5):
+        hist.record(0.500)
+
+    assert 0.010 <= hist.quantile(0.5) < 0.010 * 1.25
+    assert 0.500 <= hist.quantile(0.99) < 0.500 * 1.25
+    assert LatencyHistogram().quantile(0.95) is None
+
+
+def test_classify_source_by_path():
+    planner = PrefetchPlanner(rss_cache_roots=[r"C:\Users\me\AppData\Roaming\SRPSS\cache\rss"])
+
+    assert planner.classify_source(r"C:\Users\me\AppData\Roaming\SRPSS\cache\rss\abc.jpg") == SOURCE_RSS_CACHE
+    assert planner.classify_source(r"\\nas\photos\one.jpg") == SOURCE_NETWORK
+    assert planner.classify_source("/home/me/Pictures/one.jpg") == SOURCE_LOCAL
+
+
+def test_fast_local_source_keeps_shallow_plan():
+    planner = PrefetchPlanner(max_depth=8, max_concurrency=4)
+    planner.set_display_intervals({0: 10.0}, same_image=True)
+    _feed(planner, SOURCE_LOCAL, 0.05, 0.03)
+
+    plan = planner.plan()
+
+    assert plan.concurrency == 1
+    assert plan.depth == 2
+    assert plan.post_transition_delay_ms == 100.0
+
+
+def test_slow_network_source_deepens_and_widens_plan():
+    planner = PrefetchPlanner(max_depth=8, max_concurrency=4)
+    planner.set_display_intervals({0: 2.0, 1: 2.0}, same_image=False)
+    _feed(planner, SOURCE_NETWORK, 2.0, 0.2)
+    planner.note_upcoming([r"\\nas\photos\a.jpg"] * 8)
+
+    plan = planner.plan()
+
+    # Two displays drain one image per second; each takes ~2.2s+ to prepare.
+    assert plan.slide_interval_s == 1.0
+    assert plan.concurrency >= 3
+    assert plan.depth >= plan.concurrency + 1
+    # No spare time per slide: the cool-down must not delay prefetch further.
+    assert plan.post_transition_delay_ms == 0.0
+
+
+def test_memory_budget_caps_depth():
+    planner = PrefetchPlanner(max_depth=8, max_concurrency=4)
+    planner.set_display_intervals({0: 1.0}, same_image=True)
+    planner.set_bytes_per_slide(3840 * 2160 * 4)
+    _feed(planner, SOURCE_NETWORK, 2.0, 0.2)
+
+    plan = planner.plan(memory_budget_bytes=3 * 3840 * 2160 * 4)
+
+    assert plan.depth == 3
+    assert plan.memory_limited
+
+
+def test_deadline_miss_rate_is_reported_and_adds_a_worker():
+    planner = PrefetchPlanner(max_concurrency=4)
+    planner.set_display_intervals({0: 10.0}, same_image=True)
+    _feed(planner, SOURCE_LOCAL, 0.05, 0.03)
+    baseline = planner.plan().concurrency
+
+    for ready in (True, False, True, False):
+        planner.record_deadline(1, ready)
+
+    assert planner.deadline_miss_rate == 0.5
+    assert planner.plan().concurrency == baseline + 1
+    snapshot = planner.snapshot()
+    assert snapshot["deadline_misses"] == 2
+    assert snapshot["deadline_misses_by_display"] == {1: 2}
+    assert snapshot["recent_deadline_miss_rate"] == 0.5
+    assert "local.decode_p95_ms" in snapshot["latency"]
@@ -0,0 +1,118 @@
+"""Tests for priority-ordered ThreadManager pools."""
+from __future__ import annotations
+
+import threading
+import time
+
+from core.threading.manager import TaskPriority, ThreadManager, ThreadPoolType
+from core.threading.priority_pool import PriorityThreadPool
+
+
+def _blocked_pool(**kwargs):
+    """Single-worker pool whose worker is parked until the gate opens."""
+    pool = PriorityThreadPool(1, "test_pool", **kwargs)
+    gate = threading.Event()
+    started = threading.Event()
+
+    def _hold():
+        started.set()
+        gate.wait(5)
+
+    pool.submit(_hold)
+    assert started.wait(5)
+    return pool, gate
+
+
+def _queue(pool, order, label, level):
+    return pool.submit_with_priority(level, order.append, label)
+
+
+def test_higher_priority_runs_first_and_fifo_within_level() -> None:
+    pool, gate = _blocked_pool()
+    order: list[str] = []
+    futures = [
+        _queue(pool, order, "low", TaskPriority.LOW.value),
+        _queue(pool, order, "normal-1", TaskPriority.NORMAL.value),
+        _queue(pool, order, "critical", TaskPriority.CRITICAL.value),
+        _queue(pool, order, "normal-2", TaskPriority.NORMAL.value),
+        _queue(pool, order, "high", TaskPriority.HIGH.value),
+    ]
+    assert pool.queued_by_level() == [1, 2, 1, 1]
+
+    gate.set()
+    for future in futures:
+        future.result(timeout=5)
+    pool.shutdown()
+
+    assert order == ["critical", "high", "normal-1", "normal-2", "low"]
+
+
+def test_aged_low_priority_task_overtakes_fresh_high() -> None:
+    pool, gate = _blocked_pool(aging_interval_s=0.01)
+    order: list[str] = []
+    low = _queue(pool, order, "low", TaskPriority.LOW.value)
+    time.sleep(0.05)
+    high = _queue(pool, order, "high", TaskPriority.HIGH.value)
+
+    gate.set()
+    low.result(timeout=5)
+    high.result(timeout=5)
+    snapshot = pool.snapshot()
+    pool.shutdown()
+
+    assert order == ["low", "high"]
+    assert snapshot["aged_dispatches"] == 1
+
+
+def test_queued_task_is_bypassed_a_bounded_number_of_times() -> None:
+    pool, gate = _blocked_pool(aging_interval_s=3600.0, max_bypass=2)
+    order: list[str] = []
+    futures = [_queue(pool, order, "low", TaskPriority.LOW.value)]
+    futures += [_queue(pool, order, f"high-{i}", TaskPriority.HIGH.value) for i in range(3)]
+
+    gate.set()
+    for future in futures:
+        future.result(timeout=5)
+    snapshot = pool.snapshot()
+    pool.shutdown()
+
+    assert order == ["high-0", "high-1", "low", "high-2"]
+    assert snapshot["forced_dispatches"] == 1
+
+
+def test_cancelled_and_shutdown_cancelled_work_never_runs() -> None:
+    pool, gate = _blocked_pool()
+    ran: list[str] = []
+    cancelled = _queue(pool, ran, "cancelled", TaskPriority.HIGH.value)
+    dropped = _queue(pool, ran, "dropped", TaskPriority.LOW.value)
+
+    assert cancelled.cancel() is True
+    gate.set()
+    pool.shutdown(wait=True, cancel_futures=True)
+
+    assert ran == []
+    assert dropped.cancelled()
+
+
+def test_thread_manager_reports_queue_wait_per_priority() -> None:
+    manager = ThreadManager(config={ThreadPoolType.IO: 1, ThreadPoolType.COMPUTE: 1})
+    try:
+        done = threading.Event()
+        manager.submit_io_task(lambda: None, priority=TaskPriority.LOW)
+        manager.submit_io_task(done.set, priority=TaskPriority.HIGH)
+        assert done.wait(5)
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            io = manager.get_diagnostic_snapshot()["pools"]["io"]
+            if io["tasks_finished"] >= 2:
+                break
+            time.sleep(0.01)
+    finally:
+        manager.shutdown()
+
+    waits = io["queue_wait_by_priority"]
+    assert waits["low"]["tasks"] == 1
+    assert waits["high"]["tasks"] == 1
+    assert waits["normal"]["tasks"] == 0
+    assert waits["high"]["queue_wait_ms_mean"] >= 0.0
+    assert set(io["queue_depth_by_priority"]) == {"low", "normal", "high", "critical"}
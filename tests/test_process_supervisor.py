@@ -620,3 +620,222 @@ class TestWorkerContracts:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class _ListQueue:
+    def __init__(self):
+        self.items = []
+
+    def put_nowait(self, item):
+        self.items.append(item)
+
+    def get_nowait(self):
+        from queue import Empty
+
+        if not self.items:
+            raise Empty
+        return self.items.pop(0)
+
+    def qsize(self):
+        return len(self.items)
+
+
+class _AliveProcess:
+    def __init__(self, pid):
+        self.pid = pid
+
+    def is_alive(self):
+        return True
+
+
+class TestImageWorkerPool:
+    """Tests for multi-instance ImageWorker dispatch and health."""
+
+    def _pooled_supervisor(self, instances=2):
+        from core.process.worker_instances import WorkerInstance
+
+        supervisor = ProcessSupervisor()
+        supervisor._workers[WorkerType.IMAGE] = _AliveProcess(1000)
+        supervisor._request_queues[WorkerType.IMAGE] = _ListQueue()
+        supervisor._health[WorkerType.IMAGE].state = WorkerState.RUNNING
+        supervisor._health[WorkerType.IMAGE].pid = 1000
+        for index in range(1, instances):
+            health = HealthStatus(
+                worker_type=WorkerType.IMAGE,
+                state=WorkerState.RUNNING,
+                pid=1000 + index,
+            )
+            supervisor._extra_instances[WorkerType.IMAGE].append(
+                WorkerInstance(
+                    index=index,
+                    health=health,
+                    process=_AliveProcess(1000 + index),
+                    request_queue=_ListQueue(),
+                )
+            )
+        return supervisor
+
+    def _queues(self, supervisor):
+        return [supervisor._request_queues[WorkerType.IMAGE]] + [
+            instance.request_queue
+            for instance in supervisor._extra_instances[WorkerType.IMAGE]
+        ]
+
+    def test_default_instance_count_scales_with_cores(self):
+        from core.process.worker_instances import (
+            MAX_IMAGE_WORKER_INSTANCES,
+            default_instance_count,
+        )
+
+        assert default_instance_count(WorkerType.IMAGE, cpu_count=2) == 1
+        assert default_instance_count(WorkerType.IMAGE, cpu_count=6) == 2
+        assert default_instance_count(WorkerType.IMAGE, cpu_count=64) == MAX_IMAGE_WORKER_INSTANCES
+        assert default_instance_count(WorkerType.RSS, cpu_count=64) == 1
+
+    def test_instance_count_setting_override(self):
+        class Settings:
+            def get(self, key, default=None):
+                return {"workers.image.instances": 2}.get(key, default)
+
+        supervisor = ProcessSupervisor(settings_manager=Settings())
+        try:
+            assert supervisor._instance_count(WorkerType.IMAGE) == 2
+            assert supervisor._instance_count(WorkerType.TRANSITION) == 1
+        finally:
+            supervisor.shutdown()
+
+    def test_dispatch_goes_to_least_loaded_instance(self):
+        supervisor = self._pooled_supervisor(instances=3)
+        try:
+            ids = [
+                supervisor.send_message(
+                    WorkerType.IMAGE,
+                    MessageType.IMAGE_DECODE,
+                    {"path": f"{n}.jpg"},
+                )
+                for n in range(3)
+            ]
+            assert [queue.qsize() for queue in self._queues(supervisor)] == [1, 1, 1]
+
+            # Instance 1 answers first, so it takes the next request.
+            second = supervisor._extra_instances[WorkerType.IMAGE][0].request_queue
+            supervisor._response_from_data(WorkerResponse(
+                msg_type=MessageType.IMAGE_RESULT,
+                seq_no=1,
+                correlation_id=second.items[0]["correlation_id"],
+                success=True,
+            ).to_dict())
+            supervisor.send_message(WorkerType.IMAGE, MessageType.IMAGE_DECODE, {"path": "x.jpg"})
+            assert second.qsize() == 2
+            assert len(set(ids)) == 3
+        finally:
+            supervisor._workers.clear()
+            supervisor._extra_instances[WorkerType.IMAGE].clear()
+            supervisor.shutdown()
+
+    def test_dead_instance_is_skipped(self):
+        supervisor = self._pooled_supervisor(instances=2)
+        try:
+            extra = supervisor._extra_instances[WorkerType.IMAGE][0]
+            extra.process.is_alive = lambda: False
+            for _ in range(3):
+                supervisor.send_message(WorkerType.IMAGE, MessageType.IMAGE_DECODE, {})
+            assert [queue.qsize() for queue in self._queues(supervisor)] == [3, 0]
+            assert supervisor.is_running(WorkerType.IMAGE) is True
+        finally:
+            supervisor._workers.clear()
+            supervisor._extra_instances[WorkerType.IMAGE].clear()
+            supervisor.shutdown()
+
+    def test_heartbeats_are_per_instance(self):
+        supervisor = self._pooled_supervisor(instances=2)
+        try:
+            extra = supervisor._extra_instances[WorkerType.IMAGE][0]
+            extra.health.missed_heartbeats = 3
+            supervisor._health[WorkerType.IMAGE].missed_heartbeats = 2
+            supervisor._process_internal_response(
+                WorkerType.IMAGE,
+                WorkerResponse(
+                    msg_type=MessageType.HEARTBEAT_ACK,
+                    seq_no=1,
+                    correlation_id="hb",
+                    success=True,
+                    payload={"pid": 1001},
+                ),
+            )
+            assert extra.health.missed_heartbeats == 0
+            assert supervisor._health[WorkerType.IMAGE].missed_heartbeats == 2
+
+            for index, queue in enumerate(self._queues(supervisor)):
+                health = extra.health if index else supervisor._health[WorkerType.IMAGE]
+                supervisor._check_instance_health(
+                    WorkerType.IMAGE, index, _AliveProcess(1), queue, health,
+                )
+                assert queue.items[-1]["msg_type"] == MessageType.HEARTBEAT.value
+        finally:
+            supervisor._workers.clear()
+            supervisor._extra_instances[WorkerType.IMAGE].clear()
+            supervisor.shutdown()
+
+    def test_extra_instance_joins_rotation_only_after_ready(self):
+        import threading
+        import time
+
+        supervisor = self._pooled_supervisor(instances=1)
+        supervisor._worker_factories[WorkerType.IMAGE] = object()
+        supervisor._response_queues[WorkerType.IMAGE] = _ListQueue()
+        supervisor._spawn_process = lambda *_args: _AliveProcess(2001)
+        try:
+            with supervisor._lock:
+                assert supervisor._start_instance(WorkerType.IMAGE, 1) is True
+            extra = supervisor._extra_instances[WorkerType.IMAGE][0]
+            assert extra.health.state == WorkerState.STARTING
+
+            # The lock is free while the instance boots, and it gets no work.
+            sender = threading.Thread(
+                target=supervisor.send_message,
+                args=(WorkerType.IMAGE, MessageType.IMAGE_DECODE, {}),
+            )
+            sender.start()
+            sender.join(timeout=1.0)
+            assert not sender.is_alive()
+            assert supervisor._request_queues[WorkerType.IMAGE].qsize() == 1
+            assert extra.request_queue.qsize() == 0
+
+            supervisor._response_queues[WorkerType.IMAGE].put_nowait(WorkerResponse(
+                msg_type=MessageType.WORKER_READY,
+                seq_no=1,
+                correlation_id="ready",
+                success=True,
+                payload={"pid": 2001},
+            ).to_dict())
+            deadline = time.time() + 2.0
+            while extra.health.state != WorkerState.RUNNING and time.time() < deadline:
+                time.sleep(0.01)
+            assert extra.health.state == WorkerState.RUNNING
+
+            supervisor.send_message(WorkerType.IMAGE, MessageType.IMAGE_DECODE, {})
+            assert extra.request_queue.qsize() == 1
+        finally:
+            supervisor._workers.clear()
+            supervisor._extra_instances[WorkerType.IMAGE].clear()
+            supervisor._response_queues.clear()
+            supervisor.shutdown()
+
+    def test_usage_snapshot_reports_each_instance(self):
+        supervisor = self._pooled_supervisor(instances=2)
+        try:
+            supervisor.send_message(WorkerType.IMAGE, MessageType.IMAGE_DECODE, {})
+            supervisor.send_message(WorkerType.IMAGE, MessageType.IMAGE_DECODE, {})
+            snapshot = supervisor.get_image_worker_usage_snapshot()
+            assert snapshot["image_worker_instance_count"] == 2
+            rows = snapshot["image_worker_instances"]
+            assert [row["index"] for row in rows] == [0, 1]
+            assert [row["pid"] for row in rows] == [1000, 1001]
+            assert all(row["queue_depth"] == 1 for row in rows)
+            assert all(row["in_flight"] == 1 for row in rows)
+            assert {"latency_ms_avg", "latency_ms_last", "completed"} <= set(rows[0])
+        finally:
+            supervisor._workers.clear()
+            supervisor._extra_instances[WorkerType.IMAGE].clear()
+            supervisor.shutdown()
@@ -0,0 +1,96 @@
+"""Tests for the buffer-sharing QImage/PIL Lanczos bridge."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from PIL import Image, ImageFilter
+from PySide6.QtGui import QImage
+
+from rendering.image_processor_async import AsyncImageProcessor
+from rendering.qimage_pil_bridge import pil_view, scale_qimage_lanczos
+
+
+def _noise_image(width: int, height: int, fmt: QImage.Format, *, alpha: bool, seed: int = 1) -> QImage:
+    rng = np.random.default_rng(seed)
+    rgba = rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+    if not alpha:
+        rgba[..., 3] = 255
+    source = QImage(rgba.tobytes(), width, height, width * 4, QImage.Format.Format_RGBA8888)
+    return source.convertToFormat(fmt)
+
+
+def _rgba_array(image: QImage) -> np.ndarray:
+    straight = image.convertToFormat(QImage.Format.Format_RGBA8888)
+    data = np.frombuffer(straight.constBits(), dtype=np.uint8)
+    rows = data.reshape(straight.height(), straight.bytesPerLine())
+    return rows[:, : straight.width() * 4].reshape(straight.height(), straight.width(), 4).copy()
+
+
+def _legacy_scale(image: QImage, width: int, height: int, sharpen_filter=None) -> QImage:
+    """The bytes round-trip the bridge replaced."""
+    alpha = image.hasAlphaChannel()
+    qimage = image.convertToFormat(
+        QImage.Format.Format_RGBA8888 if alpha else QImage.Format.Format_RGB888
+    )
+    mode = "RGBA" if alpha else "RGB"
+    pil = Image.frombytes(mode, (qimage.width(), qimage.height()), bytes(qimage.constBits()), "raw", mode, qimage.bytesPerLine())
+    scaled = pil.resize((width, height), Image.Resampling.LANCZOS)
+    if sharpen_filter is not None:
+        scaled = scaled.filter(sharpen_filter)
+    data = scaled.tobytes("raw", mode)
+    fmt = QImage.Format.Format_RGBA8888 if alpha else QImage.Format.Format_RGB888
+    return QImage(data, width, height, width * len(mode), fmt).convertToFormat(
+        QImage.Format.Format_ARGB32_Premultiplied if alpha else QImage.Format.Format_RGB32
+    )
+
+
+def test_views_share_qimage_memory(qt_app) -> None:
+    image = _noise_image(33, 17, QImage.Format.Format_RGB32, alpha=False)
+    view = pil_view(image)
+    assert view.readonly
+
+    target = QImage(33, 17, QImage.Format.Format_RGB32)
+    pil_view(target, writable=True).paste(view)
+
+    assert target == image
+
+
+@pytest.mark.parametrize("fmt", [QImage.Format.Format_RGB32, QImage.Format.Format_RGB888])
+@pytest.mark.parametrize("sharpen", [None, ImageFilter.SHARPEN])
+def test_opaque_scale_matches_bytes_round_trip(qt_app, fmt, sharpen) -> None:
+    image = _noise_image(301, 211, fmt, alpha=False)
+
+    result = scale_qimage_lanczos(image, 128, 90, sharpen_filter=sharpen)
+
+    assert result.format() == QImage.Format.Format_RGB32
+    assert np.array_equal(_rgba_array(result), _rgba_array(_legacy_scale(image, 128, 90, sharpen)))
+
+
+@pytest.mark.parametrize(
+    "fmt",
+    [QImage.Format.Format_ARGB32, QImage.Format.Format_ARGB32_Premultiplied, QImage.Format.Format_RGBA8888],
+)
+@pytest.mark.parametrize("sharpen", [None, ImageFilter.SHARPEN])
+def test_alpha_scale_matches_bytes_round_trip_within_rounding(qt_app, fmt, sharpen) -> None:
+    image = _noise_image(257, 199, fmt, alpha=True, seed=4)
+
+    result = scale_qimage_lanczos(image, 100, 77, sharpen_filter=sharpen)
+
+    assert result.format() == QImage.Format.Format_ARGB32_Premultiplied
+    got = _rgba_array(result).astype(np.int32)
+    want = _rgba_array(_legacy_scale(image, 100, 77, sharpen)).astype(np.int32)
+    # Straight-alpha RGBA is quantised differently depending on where the
+    # premultiply happens; compare premultiplied colour instead.
+    got_pm = got[..., :3] * got[..., 3:] // 255
+    want_pm = want[..., :3] * want[..., 3:] // 255
+    assert np.abs(got[..., 3] - want[..., 3]).max() <= 1
+    assert np.abs(got_pm - want_pm).max() <= 3
+
+
+def test_async_processor_lanczos_keeps_aspect_and_format(qt_app) -> None:
+    image = _noise_image(640, 360, QImage.Format.Format_RGB32, alpha=False)
+
+    scaled = AsyncImageProcessor._scale_image(image, 320, 320, use_lanczos=True, sharpen=True)
+
+    assert (scaled.width(), scaled.height()) == (320, 180)
+    assert scaled.format() == QImage.Format.Format_RGB32
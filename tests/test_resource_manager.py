@@ -20,6 +20,7 @@ from PySide6.QtCore import QObject
 from PySide6.QtGui import QImage, QPixmap
 
 from core.resources import manager as resource_manager_module
+from core.resources.buffer_pool import ImageBufferPool
 from core.resources.manager import ResourceManager
 from core.resources.types import ResourceType
 
@@ -67,8 +68,8 @@ class TestResourceManagerInit:
     def test_init_creates_pools(self):
         """Test that object pools are created."""
         manager = ResourceManager()
-        assert isinstance(manager._pixmap_pool, dict)
-        assert isinstance(manager._image_pool, dict)
+        assert isinstance(manager._buffer_pool, ImageBufferPool)
+        assert manager._buffer_pool.byte_budget == ResourceManager.POOL_BYTE_BUDGET
 
     def test_init_not_shutdown(self):
         """Test that manager is not shutdown on init."""
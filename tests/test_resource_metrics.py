@@ -112,6 +112,28 @@ def test_collect_resource_accounting_keeps_exact_known_bytes_and_unknowns():
     assert snapshot.aggregate_fields()["qt_default_fbo"] == "qt_owned_untracked"
 
 
+def test_collect_resource_accounting_reports_buffer_pool_separately():
+    engine = _engine()
+    engine.resource_manager.get_pool_stats = lambda: {
+        "pixmap_pool_size": 2,
+        "image_pool_size": 1,
+        "bytes_held": 4096,
+        "byte_budget": 1 << 20,
+        "pixmap_hits": 3,
+        "image_hits": 4,
+        "pixmap_misses": 1,
+        "image_misses": 2,
+        "evictions": 5,
+    }
+
+    snapshot = resource_metrics.collect_resource_accounting(engine)
+    fields = snapshot.aggregate_fields()
+
+    assert (fields["pool_entries"], fields["pool_bytes"], fields["pool_byte_budget"]) == (3, 4096, 1 << 20)
+    assert (fields["pool_hits"], fields["pool_misses"], fields["pool_evictions"]) == (7, 3, 5)
+    assert snapshot.known_tracked_bytes == 1184
+
+
 def test_collect_resource_accounting_uses_detached_display_aggregate_only():
     class _LiveDisplayTrap:
         def get_image_accounting_snapshot(self):
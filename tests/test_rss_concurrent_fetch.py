@@ -0,0 +1,141 @@
+"""Tests for concurrent RSS feed lanes, shared budget and downloader politeness."""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from sources.base_provider import ImageMetadata, ImageSourceType
+from sources.rss import downloader as downloader_mod
+from sources.rss.coordinator import RSSCoordinator
+from sources.rss.downloader import RSSDownloader
+
+
+class _ThreadedIO:
+    """Minimal ThreadManager stand-in that runs IO tasks on real threads."""
+
+    def __init__(self) -> None:
+        self.threads: list[threading.Thread] = []
+        self.categories: list[str] = []
+
+    def submit_io_task(self, func, *args, category: str = "uncategorized", **kwargs) -> str:
+        self.categories.append(category)
+        thread = threading.Thread(target=func, args=args, kwargs=kwargs, daemon=True)
+        self.threads.append(thread)
+        thread.start()
+        return f"task-{len(self.threads)}"
+
+    def join(self) -> None:
+        for thread in self.threads:
+            thread.join(timeout=5)
+
+
+def _meta(feed_url: str, index: int, cache_dir: Path) -> ImageMetadata:
+    return ImageMetadata(
+        source_type=ImageSourceType.RSS,
+        source_id=feed_url,
+        image_id=f"{index}.jpg",
+        local_path=cache_dir / f"{abs(hash(feed_url))}_{index}.jpg",
+    )
+
+
+def _coordinator(tmp_path, feeds, thread_manager=None, target=40) -> RSSCoordinator:
+    return RSSCoordinator(
+        feed_urls=feeds,
+        cache_dir=tmp_path / "rss_cache",
+        target_total_images=target,
+        min_refresh_target=1,
+        thread_manager=thread_manager,
+    )
+
+
+def test_feeds_run_concurrently_and_publish_per_feed(tmp_path) -> None:
+    feeds = [f"https://example{i}.test/feed.json" for i in range(4)]
+    io = _ThreadedIO()
+    coord = _coordinator(tmp_path, feeds, thread_manager=io)
+
+    barrier = threading.Barrier(4, timeout=5)
+    published: list[list[ImageMetadata]] = []
+
+    def _fake_feed(feed_url, max_images, existing_paths):
+        barrier.wait()  # only passes if all four feeds are in flight at once
+        return [_meta(feed_url, i, coord.cache_dir) for i in range(2)]
+
+    coord._process_single_feed = _fake_feed  # type: ignore[method-assign]
+
+    result = coord._load_feeds(on_feed_images=published.append)
+    io.join()
+
+    assert len(result) == 8
+    assert sorted(len(batch) for batch in published) == [2, 2, 2, 2]
+    assert io.categories == ["rss.feed_fetch"] * 3
+
+
+def test_shared_budget_never_overshoots(tmp_path) -> None:
+    feeds = [f"https://example{i}.test/feed.json" for i in range(6)]
+    io = _ThreadedIO()
+    # 6 feeds at the 1-image floor against a 5-image budget.
+    coord = _coordinator(tmp_path, feeds, thread_manager=io, target=5)
+
+    limits: list[int] = []
+    lock = threading.Lock()
+
+    def _fake_feed(feed_url, max_images, existing_paths):
+        with lock:
+            limits.append(max_images)
+        return [_meta(feed_url, i, coord.cache_dir) for i in range(max_images)]
+
+    coord._process_single_feed = _fake_feed  # type: ignore[method-assign]
+
+    result = coord._load_feeds()
+    io.join()
+
+    assert len(result) == 5
+    assert sorted(limits) == [1, 1, 1, 1, 1]
+
+
+def test_unfilled_budget_is_refunded_to_later_feeds(tmp_path) -> None:
+    feeds = [f"https://example{i}.test/feed.json" for i in range(6)]
+    coord = _coordinator(tmp_path, feeds, target=4)
+
+    def _fake_feed(feed_url, max_images, existing_paths):
+        if feed_url.startswith("https://example0"):
+            return []
+        return [_meta(feed_url, i, coord.cache_dir) for i in range(max_images)]
+
+    coord._process_single_feed = _fake_feed  # type: ignore[method-assign]
+
+    # No thread manager: a single inline lane.  The empty feed hands its
+    # slot back, so four other feeds still fill the budget.
+    assert len(coord._load_feeds()) == 4
+
+
+def test_claim_path_is_exclusive(tmp_path) -> None:
+    coord = _coordinator(tmp_path, [])
+    existing: set[str] = set()
+
+    assert coord._claim_path("a.jpg", existing) is True
+    assert coord._claim_path("a.jpg", existing) is False
+    coord._release_path("a.jpg", existing)
+    assert coord._claim_path("a.jpg", existing) is True
+
+
+def test_domain_reservation_is_atomic(monkeypatch) -> None:
+    monkeypatch.setattr(downloader_mod, "DOMAIN_RATE_LIMIT_PER_MINUTE", 3)
+    dl = RSSDownloader()
+    url = "https://feeds.example.test/a.json"
+
+    granted = [dl._reserve_domain_request(url) == 0 for _ in range(5)]
+
+    assert granted == [True, True, True, False, False]
+    assert dl.domain_wait_time(url) > 0
+
+
+def test_sessions_are_pooled_per_host() -> None:
+    dl = RSSDownloader()
+    try:
+        first = dl._session("https://a.example.test/feed.json")
+        assert dl._session("https://a.example.test/images/1.jpg") is first
+        assert dl._session("https://b.example.test/feed.json") is not first
+    finally:
+        dl.close()
+    assert dl._sessions == {}
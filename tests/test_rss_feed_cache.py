@@ -0,0 +1,111 @@
+"""Tests for ETag/Last-Modified revalidation and the parsed feed cache."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+from sources.rss.coordinator import RSSCoordinator
+from sources.rss.downloader import FeedFetch, RSSDownloader
+from sources.rss.feed_cache import FeedResponseCache
+from sources.rss.parser import ParsedEntry, RSSParser
+
+FEED = "https://www.flickr.com/services/feeds/photos_public.gne?format=json&nojsoncallback=1"
+
+
+def _flickr_payload(count: int) -> dict:
+    return {
+        "items": [
+            {
+                "title": f"Photo {i}",
+                "published": "2026-06-19T10:59:36Z",
+                "media": {"m": f"https://live.staticflickr.com/test/photo{i}_m.jpg"},
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def test_feed_cache_persists_validators_and_entries(tmp_path) -> None:
+    path = tmp_path / "feed_responses.json"
+    entry = ParsedEntry(
+        "https://example.test/a.jpg",
+        title="A",
+        created_date=datetime(2026, 1, 2, tzinfo=timezone.utc),
+    )
+    cache = FeedResponseCache(path)
+    assert cache.validators(FEED) == (None, None)
+
+    cache.store(FEED, [entry], '"v1"', "Tue, 01 Sep 2026 00:00:00 GMT")
+
+    reloaded = FeedResponseCache(path)
+    assert reloaded.validators(FEED) == ('"v1"', "Tue, 01 Sep 2026 00:00:00 GMT")
+    restored = reloaded.not_modified(FEED, 5)
+    assert [e.image_url for e in restored] == ["https://example.test/a.jpg"]
+    assert restored[0].created_date == entry.created_date
+
+
+def test_feed_cache_drops_feeds_without_validators(tmp_path) -> None:
+    cache = FeedResponseCache(tmp_path / "feed_responses.json")
+    cache.store(FEED, [ParsedEntry("https://example.test/a.jpg")], '"v1"', None)
+    cache.store(FEED, [ParsedEntry("https://example.test/b.jpg")], None, None)
+
+    assert cache.validators(FEED) == (None, None)
+    assert cache.not_modified(FEED, 5) is None
+    assert cache.get_status(FEED) == {"cache_hits": 0, "cache_misses": 2}
+
+
+def test_unchanged_feed_skips_parsing(tmp_path, monkeypatch) -> None:
+    coord = RSSCoordinator(feed_urls=[FEED], cache_dir=tmp_path / "rss_cache")
+    coord._feed_cache = FeedResponseCache(tmp_path / "feed_responses.json")
+
+    calls: list[tuple] = []
+    responses = [
+        FeedFetch(_flickr_payload(6), '"v1"', None),
+        FeedFetch(None, '"v1"', None, not_modified=True),
+    ]
+
+    def _fake_fetch(url, mode, etag=None, last_modified=None):
+        calls.append((mode, etag, last_modified))
+        return responses.pop(0)
+
+    coord._downloader.fetch_feed = _fake_fetch  # type: ignore[method-assign]
+
+    first = coord._fetch_entries(FEED, 3)
+    assert len(first) == 3
+
+    parse = Mock(side_effect=AssertionError("parsed an unchanged feed"))
+    monkeypatch.setattr(RSSParser, "parse_json", parse)
+    second = coord._fetch_entries(FEED, 5)
+
+    assert [e.image_url for e in second] == [
+        f"https://live.staticflickr.com/test/photo{i}_b.jpg" for i in range(5)
+    ]
+    assert calls == [("json", None, None), ("json", '"v1"', None)]
+    health = coord.get_feed_health()[FEED]
+    assert health["cache_hits"] == 1
+    assert health["cache_misses"] == 1
+
+
+def test_downloader_sends_validators_and_reports_304() -> None:
+    seen: dict = {}
+
+    def _fake_get(url, **kwargs):
+        seen.update(kwargs["headers"])
+        resp = Mock()
+        resp.status_code = 304
+        resp.headers = {}
+        return resp
+
+    dl = RSSDownloader()
+    with patch("requests.Session.get", side_effect=_fake_get):
+        result = dl.fetch_feed(
+            "https://feeds.example.test/a.json",
+            "json",
+            etag='"v1"',
+            last_modified="Tue, 01 Sep 2026 00:00:00 GMT",
+        )
+    dl.close()
+
+    assert result == FeedFetch(None, '"v1"', "Tue, 01 Sep 2026 00:00:00 GMT", not_modified=True)
+    assert seen["If-None-Match"] == '"v1"'
+    assert seen["If-Modified-Since"] == "Tue, 01 Sep 2026 00:00:00 GMT"
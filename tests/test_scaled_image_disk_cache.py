@@ -0,0 +1,116 @@
+"""Tests for the persistent L2 tier behind ImageCache scaled entries."""
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+from PySide6.QtGui import QColor, QImage
+
+from engine.image_pipeline import _build_scaled_cache_key, _probe_cache
+from rendering.display_modes import DisplayMode
+from utils.image_cache import ImageCache
+from utils.scaled_image_disk_cache import ScaledImageDiskCache
+
+
+def _source(tmp_path, name: str = "one.jpg") -> str:
+    path = tmp_path / name
+    path.write_bytes(b"source-bytes")
+    return str(path)
+
+
+def _image(width: int, height: int, color: str, fmt=QImage.Format.Format_ARGB32_Premultiplied) -> QImage:
+    image = QImage(width, height, fmt)
+    image.fill(QColor(color))
+    return image
+
+
+def _key(source: str, width: int = 64, height: int = 48) -> str:
+    return _build_scaled_cache_key(source, width, height, DisplayMode.FILL, True, False)
+
+
+def test_entry_survives_reopen_with_identical_pixels(tmp_path) -> None:
+    source = _source(tmp_path)
+    key = _key(source)
+    image = _image(64, 48, "orange", QImage.Format.Format_RGBA8888)
+    first = ScaledImageDiskCache(tmp_path / "l2")
+    assert first.store(key, image) is True
+    assert first.store(key, image) is False
+    first.close()
+
+    second = ScaledImageDiskCache(tmp_path / "l2")
+    loaded = second.load(key)
+
+    assert loaded is not None
+    assert loaded.format() == QImage.Format.Format_RGBA8888
+    assert loaded == image
+    assert second.get_stats()["entries"] == 1
+    assert second.load(_key(source, 32, 24)) is None
+
+
+def test_modified_source_misses(tmp_path) -> None:
+    source = _source(tmp_path)
+    key = _key(source)
+    cache = ScaledImageDiskCache(tmp_path / "l2")
+    cache.store(key, _image(16, 16, "red"))
+
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert cache.load(key) is None
+
+
+def test_byte_budget_evicts_least_recently_used_across_reopen(tmp_path) -> None:
+    entry_bytes = 32 * 32 * 4
+    keys = [_key(_source(tmp_path, f"{i}.jpg"), 32, 32) for i in range(3)]
+    cache = ScaledImageDiskCache(tmp_path / "l2", max_bytes=entry_bytes * 3)
+    for key in keys:
+        cache.store(key, _image(32, 32, "blue"))
+    assert cache.load(keys[0]) is not None
+    cache.close()
+
+    reopened = ScaledImageDiskCache(tmp_path / "l2", max_bytes=entry_bytes * 3)
+    reopened.store(_key(_source(tmp_path, "new.jpg"), 32, 32), _image(32, 32, "green"))
+
+    assert reopened.load(keys[1]) is None
+    assert reopened.load(keys[0]) is not None
+    stats = reopened.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == entry_bytes * 3
+    assert len(list((tmp_path / "l2").glob("*.px"))) == 3
+
+
+def test_torn_entry_is_dropped_as_a_miss(tmp_path) -> None:
+    key = _key(_source(tmp_path))
+    cache = ScaledImageDiskCache(tmp_path / "l2")
+    cache.store(key, _image(64, 48, "white"))
+    (entry,) = (tmp_path / "l2").glob("*.px")
+    entry.write_bytes(entry.read_bytes()[:100])
+
+    assert cache.load(key) is None
+    stats = cache.get_stats()
+    assert stats["failures"] == 1
+    assert stats["entries"] == 0
+
+
+def test_image_cache_promotes_l2_hits_and_reports_tier_rates(qt_app, tmp_path) -> None:
+    key = _key(_source(tmp_path))
+    writer = ImageCache(max_items=4)
+    writer.attach_disk_tier(ScaledImageDiskCache(tmp_path / "l2"))
+    writer.put(key, _image(64, 48, "purple"))
+    writer.close_disk_tier()
+
+    reader = ImageCache(max_items=4)
+    reader.attach_disk_tier(ScaledImageDiskCache(tmp_path / "l2"))
+    engine = SimpleNamespace(_image_cache=reader)
+
+    cached = _probe_cache(engine, key, bucket="scaled")
+    again = _probe_cache(engine, key, bucket="scaled")
+
+    assert isinstance(cached, QImage) and cached.size() == _image(64, 48, "purple").size()
+    assert again is cached
+    assert engine._cache_runtime_stats["scaled_l2_hits"] == 1
+    stats = reader.get_stats()
+    assert stats["l2_hits"] == 1
+    assert stats["l2_hit_rate_percent"] == 100.0
+    assert stats["l1_hit_rate_percent"] == 50.0
+    assert stats["l2"]["writes"] == 0
@@ -136,6 +136,7 @@ class TestDefaultsArtifactParity:
         assert "latitude" not in snapshot["widgets"]["weather"]
         assert "longitude" not in snapshot["widgets"]["weather"]
         assert snapshot["workers"]["fft"]["enabled"] is False
+        assert snapshot["workers"]["audio"]["enabled"] is False
 
         assert "custom_preset_backup" not in snapshot
         assert "preset" not in snapshot
@@ -383,6 +383,69 @@ class TestSettingsManagerCacheInvalidation:
         assert "gmail" not in new_widgets
 
 
+class TestSettingsManagerSnapshots:
+    def test_get_returns_copies_while_snapshot_is_read_only(self, tmp_path: Path) -> None:
+        manager = _make_manager(tmp_path)
+        manager.set("widgets.clock.monitors", [1, 2])
+
+        clock = manager.get("widgets.clock")
+        clock["monitors"].append(3)
+        assert manager.get("widgets.clock.monitors") == [1, 2]
+
+        frozen = manager.snapshot().get("widgets.clock")
+        assert frozen["monitors"] == (1, 2)
+        with pytest.raises(TypeError):
+            frozen["monitors"] = ()
+
+    def test_unrelated_mutation_keeps_subtree_identity(self, tmp_path: Path) -> None:
+        manager = _make_manager(tmp_path)
+        manager.set("widgets.weather.enabled", True)
+        before = manager.snapshot()
+
+        manager.set("widgets.clock.enabled", False)
+        after = manager.snapshot()
+
+        assert after.version > before.version
+        assert after.lookup("widgets.weather") is before.lookup("widgets.weather")
+        assert after.lookup("widgets.clock") is not before.lookup("widgets.clock")
+
+    def test_accessor_coerces_once_and_reports_only_its_own_changes(self, tmp_path: Path) -> None:
+        manager = _make_manager(tmp_path)
+        manager.set("input.interaction_mode", "false")
+        calls: list[object] = []
+
+        def coerce(raw: object) -> bool:
+            calls.append(raw)
+            return SettingsManager.to_bool(raw, False)
+
+        accessor = manager.accessor("input.hard_exit", False, coerce=coerce)
+        assert accessor.key == "input.interaction_mode"
+        assert accessor.get() is False
+        assert accessor.get() is False
+        assert calls == ["false"]
+
+        manager.set("sources.mode", "folders")
+        assert accessor.changed() is False
+
+        manager.set("input.interaction_mode", "on")
+        assert accessor.changed() is True
+        assert accessor.get() is True
+        assert calls == ["false", "on"]
+
+    def test_set_many_publishes_values_together(self, tmp_path: Path) -> None:
+        manager = _make_manager(tmp_path)
+        manager.set_many({"batch.first": 0, "batch.second": 0})
+        seen: list[object] = []
+        manager.on_changed("batch.first", lambda _new, _old: seen.append(manager.get("batch.second")))
+        version = manager.snapshot().version
+
+        manager.set_many({"batch.first": 1, "batch.second": 2})
+
+        assert seen == [2]
+        assert manager.snapshot().version > version
+        assert manager.get("batch.first") == 1
+
+
 class TestSettingsManagerChangeNotifications:
     def test_settings_changed_signal_emitted(self, tmp_path: Path) -> None:
         manager = _make_manager(tmp_path)
@@ -307,10 +307,10 @@ def test_same_profile_manager_cache_and_signal_follow_peer_mutation(
     assert received == [("peer.value", "after")]
 
 
-def test_peer_invalidation_waits_for_shared_cache_read_lock(
+def test_reader_snapshot_is_isolated_from_peer_mutation(
     tmp_path: Path,
 ) -> None:
-    app_name = "SharedCacheLockProfile"
+    app_name = "SharedSnapshotProfile"
     first = SettingsManager(
         organization="TestOrg",
         application=app_name,
@@ -322,51 +322,19 @@ def test_peer_invalidation_waits_for_shared_cache_read_lock(
         storage_base_dir=tmp_path,
     )
     first.set("cache.race", "before")
-    assert second.get("cache.race") == "before"
-    cache_key = f"cache.race:{id(None)}"
-    read_entered = threading.Event()
-    release_read = threading.Event()
-    writer_finished = threading.Event()
-
-    class PausingCache(dict):
-        def get(self, key, default=None):
-            if key == cache_key:
-                read_entered.set()
-                assert release_read.wait(2.0)
-            return super().get(key, default)
-
-    pausing_cache = PausingCache(second._cache)
-    first._cache = pausing_cache
-    second._cache = pausing_cache
-    first._settings._manager_cache = pausing_cache
+    snapshot = second.snapshot()
 
-    read_result: list[object] = []
-    reader = threading.Thread(target=lambda: read_result.append(second.get("cache.race")))
-    reader.start()
-    assert read_entered.wait(1.0)
-
-    def mutate() -> None:
-        first.set("cache.race", "after")
-        writer_finished.set()
-
-    writer = threading.Thread(target=mutate)
-    writer.start()
-    assert not writer_finished.wait(0.05)
+    first.set("cache.race", "after")
 
-    release_read.set()
-    reader.join(2.0)
-    writer.join(2.0)
-
-    assert read_result == ["before"]
-    assert writer_finished.is_set()
+    assert snapshot.get("cache.race") == "before"
     assert second.get("cache.race") == "after"
+    assert second.snapshot().version > snapshot.version
 
 
-def test_same_profile_mutation_cannot_be_followed_by_stale_cache_repopulation(
+def test_reads_do_not_wait_for_peer_mutation_lock(
     tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    app_name = "SharedCacheReadProfile"
+    app_name = "SharedLockFreeReadProfile"
     first = SettingsManager(
         organization="TestOrg",
         application=app_name,
@@ -377,44 +345,29 @@ def test_same_profile_mutation_cannot_be_followed_by_stale_cache_repopulation(
         application=app_name,
         storage_base_dir=tmp_path,
     )
-    first.set("cache.miss_race", "before")
-    first._clear_cache_locked()
-
-    real_value = first._settings.value
-    read_entered = threading.Event()
-    release_read = threading.Event()
-    writer_finished = threading.Event()
-
-    def pausing_value(key, default=None):
-        value = real_value(key, default)
-        if key == "cache.miss_race" and not read_entered.is_set():
-            read_entered.set()
-            assert release_read.wait(2.0)
-        return value
-
-    monkeypatch.setattr(first._settings, "value", pausing_value)
+    first.set("cache.lock_free", "before")
+    lock_held = threading.Event()
+    release_lock = threading.Event()
+
+    def hold_lock() -> None:
+        with first._lock:
+            lock_held.set()
+            assert release_lock.wait(2.0)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    assert lock_held.wait(1.0)
+
     read_result: list[object] = []
     reader = threading.Thread(
-        target=lambda: read_result.append(second.get("cache.miss_race"))
+        target=lambda: read_result.append(second.get("cache.lock_free"))
     )
     reader.start()
-    assert read_entered.wait(1.0)
-
-    def mutate() -> None:
-        first.set("cache.miss_race", "after")
-        writer_finished.set()
-
-    writer = threading.Thread(target=mutate)
-    writer.start()
-    assert not writer_finished.wait(0.05)
-
-    release_read.set()
-    reader.join(2.0)
-    writer.join(2.0)
+    reader.join(1.0)
+    release_lock.set()
+    holder.join(2.0)
 
     assert read_result == ["before"]
-    assert writer_finished.is_set()
-    assert second.get("cache.miss_race") == "after"
 
 
 def test_load_fails_closed_when_same_path_durability_cannot_be_confirmed(
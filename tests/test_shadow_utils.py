@@ -6,7 +6,14 @@ from PySide6.QtCore import QEasingCurve, QRect, Qt
 from PySide6.QtGui import QColor, QFont, QPainter, QPixmap
 from PySide6.QtWidgets import QGraphicsOpacityEffect, QWidget
 
-from widgets.shadow_utils import ShadowFadeProfile, draw_rich_text_shadow_only, draw_text_rect_shadow_only
+from core.resources.manager import ResourceManager
+from widgets.shadow_utils import (
+    ShadowFadeProfile,
+    draw_rich_text_shadow_only,
+    draw_text_rect_shadow_only,
+    make_alpha_shadow_pixmap,
+    release_shadow_pixmap,
+)
 
 
 @pytest.mark.qt
@@ -121,3 +128,31 @@ def test_text_shadow_helpers_render_from_tuning_backed_paths(qt_app):
         if found_shadow_pixel:
             break
     assert found_shadow_pixel is True
+
+
+@pytest.mark.qt
+def test_pooled_alpha_shadow_keeps_transparent_corners(qt_app, monkeypatch):
+    manager = ResourceManager()
+    monkeypatch.setattr(ResourceManager, "get_app_shared", classmethod(lambda cls: manager))
+    source = QPixmap(40, 30)
+    source.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(source)
+    try:
+        painter.fillRect(QRect(10, 10, 20, 10), QColor(255, 255, 255))
+    finally:
+        painter.end()
+    shadow_color = QColor(0, 0, 0, 128)
+
+    try:
+        fresh = make_alpha_shadow_pixmap(source, dpr=1.0, shadow_color=shadow_color)
+        fresh_image = fresh.toImage()
+        release_shadow_pixmap(fresh)
+        pooled = make_alpha_shadow_pixmap(source, dpr=1.0, shadow_color=shadow_color)
+        pooled_image = pooled.toImage()
+
+        assert manager.get_pool_stats()["pixmap_hits"] >= 1
+        assert fresh_image.pixelColor(0, 0).alpha() == 0
+        assert pooled_image.pixelColor(0, 0).alpha() == fresh_image.pixelColor(0, 0).alpha()
+        assert pooled_image.pixelColor(15, 15).alpha() == fresh_image.pixelColor(15, 15).alpha() > 0
+    finally:
+        manager.shutdown()
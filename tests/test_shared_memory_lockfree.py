@@ -0,0 +1,104 @@
+"""Tests for the cross-process shared-memory SPSC ring and triple buffer."""
+from __future__ import annotations
+
+import multiprocessing as mp
+
+import pytest
+
+from utils.lockfree import SharedMemorySPSCRing, SharedMemoryTripleBuffer
+from utils.lockfree.shared_memory import _READY_WORD
+
+
+def _produce(ring_name: str, count: int) -> None:
+    ring = SharedMemorySPSCRing.attach(ring_name)
+    try:
+        sent = 0
+        while sent < count:
+            if ring.try_push(sent.to_bytes(4, "little") * (1 + sent % 5)):
+                sent += 1
+    finally:
+        ring.close()
+
+
+@pytest.fixture
+def ring():
+    ring = SharedMemorySPSCRing.create(4, 64)
+    try:
+        yield ring
+    finally:
+        ring.unlink()
+
+
+@pytest.fixture
+def triple():
+    buffer = SharedMemoryTripleBuffer.create(64)
+    try:
+        yield buffer
+    finally:
+        buffer.unlink()
+
+
+def test_ring_is_fifo_across_attach_and_wraps(ring) -> None:
+    consumer = SharedMemorySPSCRing.attach(ring.name)
+    try:
+        for round_index in range(3):
+            payloads = [bytes([round_index, i]) * (i + 1) for i in range(4)]
+            for payload in payloads:
+                assert ring.try_push(payload)
+            assert ring.is_full()
+            assert ring.try_push(b"overflow") is False
+            assert consumer.drain() == payloads
+            assert consumer.is_empty()
+        assert consumer.try_pop() is None
+    finally:
+        consumer.close()
+
+
+def test_ring_rejects_oversized_payload_and_foreign_segment(ring, triple) -> None:
+    with pytest.raises(ValueError):
+        ring.try_push(b"x" * 65)
+    with pytest.raises(ValueError):
+        SharedMemorySPSCRing.attach(triple.name)
+
+
+def test_ring_delivers_in_order_from_child_process() -> None:
+    ring = SharedMemorySPSCRing.create(8, 64)
+    try:
+        child = mp.get_context("spawn").Process(target=_produce, args=(ring.name, 200))
+        child.start()
+        received: list[bytes] = []
+        while len(received) < 200:
+            received.extend(ring.drain())
+            if not child.is_alive() and ring.is_empty():
+                break
+        child.join(timeout=10)
+        assert child.exitcode == 0
+        assert received == [i.to_bytes(4, "little") * (1 + i % 5) for i in range(200)]
+    finally:
+        ring.unlink()
+
+
+def test_triple_buffer_returns_only_latest_once(triple) -> None:
+    consumer = SharedMemoryTripleBuffer.attach(triple.name)
+    try:
+        assert consumer.consume_latest() is None
+        for value in (b"one", b"two", b"three"):
+            triple.publish(value)
+        assert consumer.has_pending()
+        assert consumer.consume_latest() == b"three"
+        assert consumer.consume_latest() is None
+        triple.publish(b"four")
+        assert consumer.consume_latest() == b"four"
+    finally:
+        consumer.close()
+
+
+def test_triple_buffer_skips_slot_mid_write(triple) -> None:
+    triple.publish(b"stable")
+    slot = int(triple._words[_READY_WORD]) & 3
+    seq_word = triple._seq_word(slot)
+    # Simulate a producer caught between "seq odd" and "seq even".
+    triple._slot_words[seq_word] += 1
+    assert triple.consume_latest() is None
+    triple._slot_words[seq_word] += 1
+    assert triple.consume_latest() == b"stable"
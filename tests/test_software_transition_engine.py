@@ -0,0 +1,224 @@
+"""Tests for the NumPy software transition kernels and SoftwareTransitionPipeline."""
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rendering.backends.base import SurfaceDescriptor, TransitionRenderPacket  # noqa: E402
+from rendering.backends.software.backend import (  # noqa: E402
+    SoftwareRenderSurface,
+    SoftwareRendererBackend,
+    SoftwareTransitionPipeline,
+)
+from rendering.backends.software.transition_engine import (  # noqa: E402
+    TRANSITION_KERNELS,
+    AdaptiveRenderScale,
+    FrameBuffers,
+    resolve_kernel_name,
+)
+
+WIDTH, HEIGHT = 96, 54
+
+
+def _frames():
+    rng = np.random.default_rng(3)
+    old = rng.integers(0, 256, size=(HEIGHT, WIDTH, 4), dtype=np.uint8)
+    new = rng.integers(0, 256, size=(HEIGHT, WIDTH, 4), dtype=np.uint8)
+    old[..., 3] = 255
+    new[..., 3] = 255
+    return old, new
+
+
+@pytest.mark.parametrize("name", sorted(TRANSITION_KERNELS))
+def test_kernel_endpoints(name):
+    old, new = _frames()
+    out = np.empty_like(old)
+    buffers = FrameBuffers(WIDTH, HEIGHT)
+    kernel = TRANSITION_KERNELS[name]
+
+    kernel(old, new, out, 0.0, {}, buffers)
+    if name != "blinds":
+        # Blinds keeps a feathered sliver of the new image at t=0 like the shader.
+        assert np.array_equal(out, old)
+
+    kernel(old, new, out, 1.0, {}, buffers)
+    assert np.array_equal(out, new)
+
+
+@pytest.mark.parametrize("name", sorted(TRANSITION_KERNELS))
+def test_kernel_midpoint_stays_between_sources(name):
+    old, new = _frames()
+    out = np.empty_like(old)
+    TRANSITION_KERNELS[name](old, new, out, 0.5, {}, FrameBuffers(WIDTH, HEIGHT))
+
+    lo = np.minimum(old, new).astype(np.int16)
+    hi = np.maximum(old, new).astype(np.int16)
+    if name == "slide":
+        return  # translated copies, not a per-pixel mix
+    assert np.all(out >= lo - 1)
+    assert np.all(out <= hi + 1)
+
+
+def test_crossfade_matches_float_blend():
+    old, new = _frames()
+    out = np.empty_like(old)
+    TRANSITION_KERNELS["crossfade"](old, new, out, 0.25, {}, FrameBuffers(WIDTH, HEIGHT))
+    expected = old + (new.astype(np.float32) - old) * 0.25
+    assert np.abs(out.astype(np.float32) - expected).max() <= 1.0
+
+
+def test_wipe_left_to_right_splits_at_progress():
+    old, new = _frames()
+    out = np.empty_like(old)
+    TRANSITION_KERNELS["wipe"](old, new, out, 0.5, {"direction": "left_to_right"}, FrameBuffers(WIDTH, HEIGHT))
+    assert np.array_equal(out[:, : WIDTH // 2], new[:, : WIDTH // 2])
+    assert np.array_equal(out[:, WIDTH // 2 :], old[:, WIDTH // 2 :])
+
+
+def test_resolve_kernel_name_aliases():
+    assert resolve_kernel_name("Crossfade") == "crossfade"
+    assert resolve_kernel_name("GL Compositor Block Puzzle Flip") == "blockflip"
+    assert resolve_kernel_name("Ripple") == "crossfade"
+
+
+def test_adaptive_scale_steps_down_and_recovers():
+    scaler = AdaptiveRenderScale(target_fps=60.0, recover_frames=3)
+    assert scaler.record(40.0) is True
+    assert scaler.scale == 0.75
+    changed = [scaler.record(1.0) for _ in range(3)]
+    assert changed[-1] is True
+    assert scaler.scale == 1.0
+
+
+def test_pipeline_renders_and_presents_into_surface():
+    old, new = _frames()
+    surface = SoftwareRenderSurface(
+        SurfaceDescriptor(
+            screen_index=0, width=WIDTH, height=HEIGHT, dpi=1.0, vsync_enabled=False, prefer_triple_buffer=False
+        )
+    )
+    presented = []
+    surface.set_presenter(lambda frame: presented.append(frame.copy()))
+
+    backend = SoftwareRendererBackend()
+    pipeline = backend.create_transition_pipeline("Wipe")
+    assert isinstance(pipeline, SoftwareTransitionPipeline)
+    pipeline.attach_surface(surface)
+
+    packet = TransitionRenderPacket(old_texture=old, new_texture=new, progress=1.0, duration_ms=500, parameters={})
+    pipeline.render(packet)
+
+    assert pipeline.frames_rendered == 1
+    assert surface.frames_presented == 1
+    assert presented and np.array_equal(presented[0], new)
+    backend.release_transition_pipeline(pipeline)
+
+
+# --- Production wiring -------------------------------------------------------
+
+
+def _software_host(backend):
+    """QWidget carrying the DisplayWidget attributes the software path uses."""
+    from PySide6.QtWidgets import QWidget
+
+    widget = QWidget()
+    widget.resize(WIDTH, HEIGHT)
+    widget.settings_manager = None
+    widget.screen_index = 0
+    widget._device_pixel_ratio = 1.0
+    widget._renderer_backend = backend
+    widget._render_surface = None
+    widget._software_transition_surface = None
+    return widget
+
+
+class _AnimationManager:
+    def __init__(self):
+        self.calls = []
+        self.cancelled = []
+
+    def animate_custom(self, **kwargs):
+        self.calls.append(kwargs)
+        return "anim-sw"
+
+    def cancel_animation(self, anim_id):
+        self.cancelled.append(anim_id)
+
+
+class _FactorySettings:
+    def __init__(self, transitions):
+        self._transitions = transitions
+
+    def get(self, key, default=None):
+        if key == "transitions":
+            return self._transitions
+        return default
+
+    def set(self, key, value):
+        if key == "transitions":
+            self._transitions = value
+
+
+def test_software_pipeline_provider_only_serves_software_backend(qt_app):
+    from rendering.display_gl_init import create_software_transition_pipeline
+
+    host = _software_host(SoftwareRendererBackend())
+    pipeline = create_software_transition_pipeline(host, "Block Puzzle Flip")
+    assert isinstance(pipeline, SoftwareTransitionPipeline)
+    assert pipeline.kernel_name == "blockflip"
+    assert isinstance(host._render_surface, SoftwareRenderSurface)
+
+    assert create_software_transition_pipeline(_software_host(object()), "Wipe") is None
+
+
+def test_factory_builds_software_transition_from_provider():
+    from rendering.transition_factory import TransitionFactory
+    from transitions.base_transition import WipeDirection
+    from transitions.software_backend_transition import SoftwareBackendTransition
+
+    backend = SoftwareRendererBackend()
+    factory = TransitionFactory(
+        _FactorySettings({"type": "Wipe", "wipe": {"direction": "Right to Left"}}),
+        software_pipeline_provider=backend.create_transition_pipeline,
+    )
+    transition = factory.create_transition()
+
+    assert isinstance(transition, SoftwareBackendTransition)
+    assert transition.pipeline.kernel_name == "wipe"
+    assert transition._parameters["direction"] is WipeDirection.RIGHT_TO_LEFT
+
+
+def test_software_transition_renders_frames_into_widget_surface(qt_app):
+    from PySide6.QtGui import QColor, QPixmap
+    from rendering.display_gl_init import create_software_transition_pipeline
+    from transitions.software_backend_transition import SoftwareBackendTransition
+
+    host = _software_host(SoftwareRendererBackend())
+    host._animation_manager = _AnimationManager()
+    pipeline = create_software_transition_pipeline(host, "Crossfade")
+    old_pixmap = QPixmap(WIDTH, HEIGHT)
+    old_pixmap.fill(QColor(255, 0, 0))
+    new_pixmap = QPixmap(WIDTH, HEIGHT)
+    new_pixmap.fill(QColor(0, 0, 255))
+
+    transition = SoftwareBackendTransition(pipeline, duration_ms=200)
+    finished = []
+    transition.finished.connect(lambda: finished.append(True))
+    assert transition.start(old_pixmap, new_pixmap, host)
+
+    surface = host._render_surface
+    assert host._software_transition_surface is surface
+    assert np.all(surface.front_buffer[..., 0] == 255)
+    (call,) = host._animation_manager.calls
+    call["update_callback"](1.0)
+    call["on_complete"]()
+
+    assert finished == [True]
+    assert pipeline.frames_rendered == 2
+    assert np.all(surface.front_buffer[..., 2] == 255)
+    assert not surface.to_qimage().isNull()
+
+    transition.cleanup()
+    assert host._software_transition_surface is None
+    assert transition.pipeline is None
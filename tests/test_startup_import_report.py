@@ -0,0 +1,104 @@
+"""Tests for the /s startup import-budget report and the lazy-import contract."""
+from __future__ import annotations
+
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tools import startup_import_report as report_mod
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       200 |        200 |   _io
+import time:      1000 |       1000 |     widgets.clock_widget
+import time:       500 |       1500 |   widgets
+import time:      3000 |       4700 | rendering.display_widget
+"""
+
+
+def test_parse_importtime_reads_depth_and_times():
+    records = report_mod.parse_importtime(_SAMPLE)
+
+    assert [r.module for r in records] == ["_io", "widgets.clock_widget", "widgets", "rendering.display_widget"]
+    assert [r.depth for r in records] == [1, 2, 1, 0]
+    assert records[-1].cumulative_us == 4700
+
+
+def test_aggregate_sums_self_time_per_package():
+    totals = report_mod.aggregate_by_package(report_mod.parse_importtime(_SAMPLE))
+
+    assert totals == {"rendering": 3.0, "widgets": 1.5, "_io": 0.2}
+
+
+def test_evaluate_flags_budgets_and_lazy_modules():
+    records = report_mod.parse_importtime(_SAMPLE)
+
+    report = report_mod.evaluate(
+        records,
+        total_budget_ms=4.0,
+        package_budgets_ms={"widgets": 1.0},
+        lazy_modules=("widgets.clock_widget", "ui.settings_dialog"),
+    )
+
+    assert not report.ok
+    assert report.lazy_violations == ["widgets.clock_widget"]
+    assert len(report.budget_failures) == 2
+
+    relaxed = report_mod.evaluate(records, total_budget_ms=None, package_budgets_ms={}, lazy_modules=())
+    assert relaxed.ok
+
+
+def _top_level_imports(path: Path) -> set[str]:
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    modules: set[str] = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module:
+            modules.add(node.module)
+        elif isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+    return modules
+
+
+def test_screensaver_entry_defers_settings_ui_and_engine():
+    imports = _top_level_imports(ROOT / "main.py")
+
+    for module in ("ui.settings_dialog", "ui.system_tray", "engine.screensaver_engine"):
+        assert module not in imports
+
+
+def test_display_widget_keeps_widget_families_out_of_module_imports():
+    imports = _top_level_imports(ROOT / "rendering" / "display_widget.py")
+
+    assert not {m for m in imports if m.startswith("widgets.")}
+    assert "ui.settings_dialog" not in _top_level_imports(ROOT / "engine" / "engine_handlers.py")
+
+
+def test_startup_modules_leave_lazy_modules_unloaded():
+    if not (ROOT / "ui" / "resources" / "assets_rc.py").exists():
+        pytest.skip("generated Qt resources missing; run tools/regen_qrc.py")
+    code = (
+        "import importlib, sys\n"
+        f"for name in {list(report_mod.STARTUP_MODULES)!r}:\n"
+        "    importlib.import_module(name)\n"
+        f"print(sorted(m for m in {list(report_mod.LAZY_MODULES)!r} if m in sys.modules))\n"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH", "")]))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import dataclasses
+import http.client
+import json
+import threading
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from core.steam.achievement_pulse_cache import refresh_achievement_pulse_cache
+from core.steam.assets import fetch_and_cache_assets
+from core.steam.backend import build_endpoint, fetch_json
+from core.steam.connection_pool import SteamConnectionPool
+from core.steam.credentials import SteamCredentialPayload
+from core.steam.models import SteamResult, SteamResultStatus, SteamSourceId
+from core.steam.refresh_executor import SteamRefreshExecutor
+
+_PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+class _SteamStandIn(ThreadingHTTPServer):
+    """Local HTTP/1.1 stand-in for the Steam Web API and asset CDN."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.achievement_delay = 0.0
+        self.status_by_appid: dict[int, int] = {}
+        self.redirects: dict[str, str] = {}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _SteamStandIn
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *_args) -> None:
+        return
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        appid = int(query.get("appid", ["0"])[0])
+        with self.server.lock:
+            self.server.requests.append(parts.path)
+            location = self.server.redirects.get(parts.path)
+        if location is not None:
+            self.send_response(302)
+            self.send_header("Location", location)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        try:
+            if "GetPlayerAchievements" in parts.path:
+                time.sleep(self.server.achievement_delay)
+            status, body = self._route(parts.path, appid)
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self, path: str, appid: int) -> tuple[int, bytes]:
+        if path.startswith("/assets/"):
+            return (404, b"") if "missing" in path else (200, _PNG)
+        status = self.server.status_by_appid.get(appid, 200)
+        if status != 200:
+            return status, b"{}"
+        if "GetRecentlyPlayedGames" in path:
+            games = [{"appid": value, "name": f"Game {value}"} for value in (111, 222, 333)]
+            payload = {"response": {"total_count": len(games), "games": games}}
+        elif "GetPlayerAchievements" in path:
+            payload = {
+                "playerstats": {
+                    "gameName": f"Game {appid}",
+                    "achievements": [{"name": "START", "achieved": 1, "unlocktime": appid}],
+                }
+            }
+        elif "GetSchemaForGame" in path:
+            payload = {"game": {"availableGameStats": {"achievements": [{"name": "START"}]}}}
+        else:
+            payload = {"ok": True}
+        return 200, json.dumps(payload).encode("utf-8")
+
+
+@pytest.fixture
+def steam_server():
+    server = _SteamStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def pool(steam_server):
+    port = steam_server.server_address[1]
+
+    def _local_connection(_scheme, _host, _port, timeout):
+        return http.client.HTTPConnection("127.0.0.1", port, timeout=timeout)
+
+    pool = SteamConnectionPool(connection_factory=_local_connection)
+    try:
+        yield pool
+    finally:
+        pool.close()
+
+
+def _credential(suffix: str) -> SteamCredentialPayload:
+    return SteamCredentialPayload(
+        api_key=f"fake_steam_api_key_refresh_executor_{suffix}",
+        profile_identifier=f"7656119800000{suffix}",
+    )
+
+
+def test_pool_reuses_one_keep_alive_connection_for_sequential_requests(steam_server, pool) -> None:
+    results = [
+        fetch_json(
+            build_endpoint(SteamSourceId.APP_NEWS, appid=appid),
+            opener=pool.open,
+        )
+        for appid in (10, 20, 30, 40)
+    ]
+
+    assert all(result.status == SteamResultStatus.SUCCESS for result in results)
+    assert steam_server.connections == 1
+    assert pool.stats()["reused"] == 3
+
+
+def test_pool_maps_http_errors_through_existing_result_statuses(steam_server, pool, tmp_path) -> None:
+    steam_server.status_by_appid[50] = 429
+
+    limited = fetch_json(build_endpoint(SteamSourceId.APP_NEWS, appid=50), opener=pool.open)
+    assets = fetch_and_cache_assets(
+        cache_dir=tmp_path,
+        urls=[
+            "https://cdn.akamai.steamstatic.com/assets/a.png",
+            "https://cdn.akamai.steamstatic.com/assets/b.png",
+            "https://cdn.akamai.steamstatic.com/assets/missing.png",
+        ],
+        fetcher=pool.fetch,
+    )
+
+    assert limited.status == SteamResultStatus.RATE_LIMITED
+    assert assets["https://cdn.akamai.steamstatic.com/assets/a.png"].path.exists()
+    assert assets["https://cdn.akamai.steamstatic.com/assets/b.png"].path.exists()
+    assert assets["https://cdn.akamai.steamstatic.com/assets/missing.png"].status == SteamResultStatus.NOT_FOUND
+    assert steam_server.connections <= pool.max_connections_per_host
+
+
+def test_pool_follows_same_scheme_redirects_to_allowed_hosts(steam_server, pool) -> None:
+    steam_server.redirects["/ISteamNews/GetNewsForApp/v2/"] = "/moved/ISteamNews/GetNewsForApp/v2/?appid=10"
+    steam_server.redirects["/assets/moved.png"] = "https://shared.akamai.steamstatic.com/assets/a.png"
+    steam_server.redirects["/assets/offsite.png"] = "https://example.invalid/assets/a.png"
+    steam_server.redirects["/assets/downgrade.png"] = "http://cdn.akamai.steamstatic.com/assets/a.png"
+
+    moved = fetch_json(build_endpoint(SteamSourceId.APP_NEWS, appid=10), opener=pool.open)
+    asset = pool.fetch(
+        "https://cdn.akamai.steamstatic.com/assets/moved.png",
+        allowed_hosts=("shared.akamai.steamstatic.com",),
+    )
+
+    assert moved.status == SteamResultStatus.SUCCESS
+    assert steam_server.requests[:2] == ["/ISteamNews/GetNewsForApp/v2/", "/moved/ISteamNews/GetNewsForApp/v2/"]
+    assert asset == _PNG
+    for url in (
+        "https://cdn.akamai.steamstatic.com/assets/offsite.png",
+        "https://cdn.akamai.steamstatic.com/assets/downgrade.png",
+    ):
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            pool.fetch(url, allowed_hosts=("shared.akamai.steamstatic.com",))
+        assert excinfo.value.code == 302
+
+
+def test_pool_routes_through_configured_proxy(steam_server, monkeypatch) -> None:
+    for name in ("no_proxy", "NO_PROXY", "https_proxy", "HTTPS_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{steam_server.server_address[1]}")
+    pool = SteamConnectionPool()
+    try:
+        endpoint = dataclasses.replace(
+            build_endpoint(SteamSourceId.APP_NEWS, appid=10),
+            url="http://api.steampowered.invalid/ISteamNews/GetNewsForApp/v2/",
+        )
+        result = fetch_json(endpoint, opener=pool.open)
+        missing = pool.request("http://cdn.steamstatic.invalid/assets/missing.png")
+    finally:
+        pool.close()
+
+    assert result.status == SteamResultStatus.SUCCESS
+    assert missing.status == 404
+    assert steam_server.requests == ["/ISteamNews/GetNewsForApp/v2/", "/assets/missing.png"]
+    assert pool.stats()["opened"] == 0
+
+
+def test_refresh_fetches_candidates_concurrently_and_publishes_partials(steam_server, pool, tmp_path) -> None:
+    steam_server.achievement_delay = 0.15
+    partials = []
+
+    outcome = refresh_achievement_pulse_cache(
+        credential=_credential("31"),
+        root=tmp_path,
+        opener=pool.open,
+        now=20_000.0,
+        executor=SteamRefreshExecutor(max_concurrency=3),
+        on_partial=partials.append,
+    )
+
+    assert steam_server.max_in_flight >= 2
+    assert steam_server.requests.count("/ISteamUserStats/GetPlayerAchievements/v1/") == 3
+    assert len(partials) == 3
+    assert outcome.snapshot.resolved.ok is True
+    assert outcome.snapshot.candidate_cache_complete is True
+
+
+def test_concurrent_refresh_honours_backoff_for_failed_candidate(steam_server, pool, tmp_path) -> None:
+    steam_server.status_by_appid[222] = 429
+    credential = _credential("32")
+
+    first = refresh_achievement_pulse_cache(
+        credential=credential,
+        root=tmp_path,
+        opener=pool.open,
+        now=30_000.0,
+        force=True,
+    )
+    achievement_requests = steam_server.requests.count("/ISteamUserStats/GetPlayerAchievements/v1/")
+    second = refresh_achievement_pulse_cache(
+        credential=credential,
+        root=tmp_path,
+        opener=pool.open,
+        now=30_001.0,
+        force=True,
+    )
+
+    assert first.snapshot.candidate_cache_complete is False
+    assert achievement_requests == 3
+    # 111 and 333 are refetched on force; 222 stays behind its backoff gate.
+    assert steam_server.requests.count("/ISteamUserStats/GetPlayerAchievements/v1/") == 5
+    assert second.snapshot.candidate_cache_complete is False
+
+
+def test_executor_keeps_input_order_and_isolates_callback_failures() -> None:
+    seen: list[int] = []
+
+    def _slow_identity(value: int) -> SteamResult:
+        time.sleep(0.01 * (4 - value))
+        return SteamResult(status=SteamResultStatus.SUCCESS, payload={"value": value})
+
+    def _callback(value: int, _result: SteamResult) -> None:
+        seen.append(value)
+        if value == 2:
+            raise RuntimeError("partial publisher failed")
+
+    results = SteamRefreshExecutor(max_concurrency=4).map(_slow_identity, [1, 2, 3], on_result=_callback)
+
+    assert [result.payload["value"] for result in results] == [1, 2, 3]
+    assert sorted(seen) == [1, 2, 3]
@@ -0,0 +1,114 @@
+"""Tests for packed TransitionWorker block precompute and its transfer/cache."""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+from core.process.supervisor import ProcessSupervisor
+from core.process.types import MessageType, WorkerMessage, WorkerType
+from core.process.workers.transition_worker import (
+    DIFFUSE_BLOCK_FIELDS,
+    GRID_BLOCK_FIELDS,
+    TransitionWorker,
+    inverse_permutation,
+    unpack_precomputed_blocks,
+)
+
+
+class _ListQueue:
+    def __init__(self) -> None:
+        self.items: list = []
+
+    def put_nowait(self, item) -> None:
+        self.items.append(item)
+
+
+def _request(transition_type: str, params: dict, correlation_id: str = "tx-1") -> WorkerMessage:
+    return WorkerMessage(
+        msg_type=MessageType.TRANSITION_PRECOMPUTE,
+        seq_no=1,
+        correlation_id=correlation_id,
+        payload={"transition_type": transition_type, "params": params},
+        worker_type=WorkerType.TRANSITION,
+    )
+
+
+def test_inverse_permutation_matches_index_lookup() -> None:
+    rng = random.Random(3)
+    indices = list(range(500))
+    rng.shuffle(indices)
+
+    order = inverse_permutation(np.asarray(indices, dtype=np.int32))
+
+    assert order.tolist() == [indices.index(i) for i in range(500)]
+
+
+def test_block_grid_matches_reference_dicts() -> None:
+    worker = TransitionWorker(_ListQueue(), _ListQueue())
+    params = {"cols": 8, "rows": 6, "screen_width": 1000, "screen_height": 600, "seed": 11}
+
+    data = worker._precompute_blocks(params)
+
+    # Reference: the original per-block dict construction
+    random.seed(11)
+    indices = list(range(48))
+    random.shuffle(indices)
+    expected = []
+    for idx in range(48):
+        row, col = divmod(idx, 8)
+        expected.append((
+            indices.index(idx), col * 125, row * 100, 125, 100,
+            abs(col - 4) + abs(row - 3), ("x", "y").index(random.choice(["x", "y"])),
+        ))
+    assert data["block_fields"] == GRID_BLOCK_FIELDS
+    assert [tuple(c) for c in data["blocks"].T.tolist()] == expected
+
+
+def test_large_diffuse_pattern_travels_via_shared_memory() -> None:
+    sent = _ListQueue()
+    worker = TransitionWorker(_ListQueue(), sent)
+    supervisor = ProcessSupervisor()
+    params = {"screen_width": 1920, "screen_height": 1080, "block_size": 8, "seed": 5}
+    try:
+        response = worker.handle_message(_request("Diffuse", params))
+        assert response.payload.get("shared_memory_name")
+        assert "blocks" not in response.payload["data"]
+
+        parent = supervisor._response_from_data(response.to_dict())
+        data = parent.payload["data"]
+        blocks = supervisor.consume_shared_memory_response(
+            parent,
+            lambda view, _descriptor: unpack_precomputed_blocks(data, view),
+        )
+        assert worker._send_response(response) is True
+        assert worker._pending_shared_transfers == {}
+    finally:
+        worker._cleanup()
+        supervisor.shutdown()
+
+    cols, rows = 240, 135
+    assert data["block_fields"] == DIFFUSE_BLOCK_FIELDS
+    assert blocks.shape == (5, cols * rows)
+    assert blocks[0].tolist() == list(range(cols * rows))
+    cells = (blocks[2] // 8) * cols + blocks[1] // 8
+    assert sorted(cells.tolist()) == list(range(cols * rows))
+    assert supervisor.get_shared_memory_accounting_snapshot()["segments_live"] == 0
+
+
+def test_repeat_request_at_same_resolution_hits_cache() -> None:
+    worker = TransitionWorker(_ListQueue(), _ListQueue())
+    params = {"cols": 4, "rows": 3, "seed": 2}
+    worker._config.screen_width, worker._config.screen_height = 800, 600
+
+    first = worker.handle_message(_request("BlockFlip", params))
+    second = worker.handle_message(_request("BlockFlip", params, "tx-2"))
+    worker._config.screen_width = 1024
+    third = worker.handle_message(_request("BlockFlip", params, "tx-3"))
+
+    assert first.payload["cached"] is False
+    assert second.payload["cached"] is True
+    assert third.payload["cached"] is False
+    assert second.payload["cache_key"] == first.payload["cache_key"] != third.payload["cache_key"]
+    small = unpack_precomputed_blocks(second.payload["data"])
+    assert small.shape == (len(GRID_BLOCK_FIELDS), 12)
@@ -16,7 +16,7 @@ class _QueuedIoManager:
     def __init__(self) -> None:
         self.tasks = []
 
-    def submit_io_task(self, func, *args, callback=None, category="uncategorized", **kwargs):
+    def submit_io_task(self, func, *args, callback=None, category="uncategorized", priority=None, **kwargs):
         self.tasks.append(
             SimpleNamespace(
                 func=func,
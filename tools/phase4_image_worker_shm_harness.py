@@ -123,14 +123,14 @@ def run_harness(
             settings_manager=None,
         )
 
-        consume = supervisor.consume_shared_memory_response
+        lease = supervisor.lease_shared_memory_response
         dispose = supervisor.dispose_response
 
-        def _recording_consume(response, consumer):
+        def _recording_lease(response):
             name = response.payload.get("shared_memory_name")
             if name:
                 shared_memory_names.append(str(name))
-            return consume(response, consumer)
+            return lease(response)
 
         def _recording_dispose(response, *, reason):
             name = response.payload.get("shared_memory_name")
@@ -138,7 +138,7 @@ def run_harness(
                 shared_memory_names.append(str(name))
             return dispose(response, reason=reason)
 
-        supervisor.consume_shared_memory_response = _recording_consume
+        supervisor.lease_shared_memory_response = _recording_lease
         supervisor.dispose_response = _recording_dispose
 
         try:
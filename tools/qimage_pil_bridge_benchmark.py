@@ -0,0 +1,128 @@
+"""Micro-benchmark for the QImage/PIL Lanczos bridge.
+
+Compares the legacy bytes round-trip that ``AsyncImageProcessor._scale_image``
+used (convert -> ``bytes(constBits())`` -> ``Image.frombytes`` -> resize ->
+``tobytes`` -> QImage -> ``convertToFormat``) against
+``rendering.qimage_pil_bridge.scale_qimage_lanczos`` for one 4K slide.
+
+Each path records a ledger of the full-frame buffers it writes, so the
+report shows copies and MB moved per slide alongside median wall time.
+
+Usage::
+
+    python tools/qimage_pil_bridge_benchmark.py [--repeats 7] [--alpha]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+from PIL import Image
+from PySide6.QtGui import QImage
+
+from rendering.qimage_pil_bridge import scale_qimage_lanczos
+
+
+SOURCE_SIZE = (3840, 2160)
+TARGET_SIZE = (2560, 1440)
+
+Ledger = List[Tuple[str, int]]
+
+
+def _source_image(alpha: bool) -> QImage:
+    width, height = SOURCE_SIZE
+    rng = np.random.default_rng(7)
+    rgba = rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+    if not alpha:
+        rgba[..., 3] = 255
+    image = QImage(rgba.tobytes(), width, height, width * 4, QImage.Format.Format_RGBA8888)
+    # What QImage's loaders hand back for JPEG / PNG-with-alpha sources.
+    return image.convertToFormat(QImage.Format.Format_ARGB32 if alpha else QImage.Format.Format_RGB32)
+
+
+def legacy_scale(image: QImage, width: int, height: int, ledger: Ledger) -> QImage:
+    alpha = image.hasAlphaChannel()
+    qimage = image.convertToFormat(
+        QImage.Format.Format_RGBA8888 if alpha else QImage.Format.Format_RGB888
+    )
+    ledger.append(("qt_convert_source", qimage.sizeInBytes()))
+    mode = "RGBA" if alpha else "RGB"
+    data = bytes(qimage.constBits())
+    ledger.append(("constBits_to_bytes", len(data)))
+    pil = Image.frombytes(mode, (qimage.width(), qimage.height()), data, "raw", mode, qimage.bytesPerLine())
+    ledger.append(("pil_frombytes", pil.width * pil.height * 4))
+    if alpha:
+        # Image.resize premultiplies RGBA internally and un-premultiplies after.
+        ledger.append(("pil_premultiply_source", pil.width * pil.height * 4))
+    scaled = pil.resize((width, height), Image.Resampling.LANCZOS)
+    ledger.append(("pil_resize", width * height * 4))
+    if alpha:
+        ledger.append(("pil_unpremultiply_result", width * height * 4))
+    out = scaled.tobytes("raw", mode)
+    ledger.append(("pil_tobytes", len(out)))
+    fmt = QImage.Format.Format_RGBA8888 if alpha else QImage.Format.Format_RGB888
+    result = QImage(out, width, height, width * len(mode), fmt)
+    if alpha:
+        result = result.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        ledger.append(("qt_premultiply_result", result.sizeInBytes()))
+    return result
+
+
+def bridge_scale(image: QImage, width: int, height: int, ledger: Ledger) -> QImage:
+    fmt = image.format()
+    if fmt not in (QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32_Premultiplied):
+        stage = "qt_premultiply_source" if image.hasAlphaChannel() else "qt_convert_source"
+        ledger.append((stage, image.width() * image.height() * 4))
+    ledger.append(("pil_resize", width * height * 4))
+    ledger.append(("paste_into_qimage", width * height * 4))
+    return scale_qimage_lanczos(image, width, height)
+
+
+def _measure(fn: Callable[[QImage, int, int, Ledger], QImage], image: QImage, repeats: int) -> dict:
+    timings = []
+    ledger: Ledger = []
+    for index in range(repeats):
+        run_ledger: Ledger = []
+        start = time.perf_counter()
+        fn(image, *TARGET_SIZE, run_ledger)
+        timings.append((time.perf_counter() - start) * 1000.0)
+        if index == 0:
+            ledger = run_ledger
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2),
+        "copies": len(ledger),
+        "mb_moved": round(sum(size for _, size in ledger) / (1024 * 1024), 1),
+        "stages": [name for name, _ in ledger],
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--alpha", action="store_true", help="use a straight-alpha ARGB32 source")
+    args = parser.parse_args(argv)
+
+    image = _source_image(args.alpha)
+    result = {
+        "source": f"{SOURCE_SIZE[0]}x{SOURCE_SIZE[1]} {image.format().name}",
+        "target": f"{TARGET_SIZE[0]}x{TARGET_SIZE[1]}",
+        "legacy": _measure(legacy_scale, image, max(1, args.repeats)),
+        "bridge": _measure(bridge_scale, image, max(1, args.repeats)),
+    }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""Headless benchmark for the software (CPU) transition renderer.
+
+Renders every kernel in ``rendering.backends.software.transition_engine``
+across a sweep of progress values at 1080p, 1440p and 4K and reports the
+median frame time and achievable FPS per transition.  For each resolution it
+also reports the render scale ``AdaptiveRenderScale`` would settle on to hold
+the target frame rate, and the FPS at that scale.
+
+No window or GL context is created; frames are synthetic RGBA noise.
+
+Usage::
+
+    python tools/software_transition_benchmark.py [--frames 24] [--target-fps 60]
+        [--resolutions 1080p,1440p,4k] [--transitions crossfade,wipe]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+
+from rendering.backends.software.transition_engine import (
+    TRANSITION_KERNELS,
+    AdaptiveRenderScale,
+    FrameBuffers,
+    resample_frame,
+)
+
+
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    "1080p": (1920, 1080),
+    "1440p": (2560, 1440),
+    "4k": (3840, 2160),
+}
+
+
+def _frames(width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(11)
+    old = rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+    new = rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+    old[..., 3] = 255
+    new[..., 3] = 255
+    return old, new
+
+
+def _time_kernel(name: str, old: np.ndarray, new: np.ndarray, frames: int) -> float:
+    """Median milliseconds per frame for *name* over a 0..1 progress sweep."""
+    kernel = TRANSITION_KERNELS[name]
+    height, width = old.shape[:2]
+    buffers = FrameBuffers(width, height)
+    out = np.empty_like(old)
+    # Warm the per-resolution tables and the cached delta.
+    kernel(old, new, out, 0.5, {}, buffers)
+    timings: List[float] = []
+    for index in range(frames):
+        progress = (index + 0.5) / frames
+        start = time.perf_counter()
+        kernel(old, new, out, progress, {}, buffers)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(timings)
+
+
+def _settled_scale(name: str, old: np.ndarray, new: np.ndarray, frames: int, target_fps: float) -> Dict[str, float]:
+    """Largest adaptive scale step whose frame time fits the budget."""
+    scaler = AdaptiveRenderScale(target_fps=target_fps)
+    height, width = old.shape[:2]
+    ms = float("inf")
+    for scale in scaler.steps:
+        size = (max(1, int(round(width * scale))), max(1, int(round(height * scale))))
+        ms = _time_kernel(name, resample_frame(old, *size), resample_frame(new, *size), frames)
+        if ms <= scaler.budget_ms * scaler.high_water:
+            return {"scale": scale, "median_ms": round(ms, 2), "fps": round(1000.0 / ms, 1)}
+    return {"scale": scaler.steps[-1], "median_ms": round(ms, 2), "fps": round(1000.0 / ms, 1)}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=24)
+    parser.add_argument("--target-fps", type=float, default=60.0)
+    parser.add_argument("--resolutions", default=",".join(RESOLUTIONS))
+    parser.add_argument("--transitions", default=",".join(TRANSITION_KERNELS))
+    args = parser.parse_args(argv)
+
+    frames = max(1, args.frames)
+    names = [n.strip() for n in args.transitions.split(",") if n.strip() in TRANSITION_KERNELS]
+    result: Dict[str, Dict[str, Dict[str, object]]] = {}
+    for label in [r.strip().lower() for r in args.resolutions.split(",")]:
+        if label not in RESOLUTIONS:
+            continue
+        old, new = _frames(*RESOLUTIONS[label])
+        per_transition: Dict[str, Dict[str, object]] = {}
+        for name in names:
+            ms = _time_kernel(name, old, new, frames)
+            per_transition[name] = {
+                "median_ms": round(ms, 2),
+                "fps": round(1000.0 / ms, 1),
+                "adaptive": _settled_scale(name, old, new, frames, args.target_fps),
+            }
+        result[label] = per_transition
+
+    print(json.dumps({"target_fps": args.target_fps, "results": result}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
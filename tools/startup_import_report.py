@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Import-time budget report for the screensaver (/s) startup path.
+
+Runs a fresh interpreter with ``-X importtime``, imports the modules that
+``main.py`` loads before the first slide in RUN mode, and aggregates the
+self time per package (``ui``, ``widgets``, ``rendering``, ``PySide6`` ...).
+The run fails when the total or any per-package budget is exceeded, or when
+a module that must stay lazy on the /s path (settings dialog, tab modules,
+optional widget families) shows up in the import graph.
+
+Usage::
+
+    python tools/startup_import_report.py [--runs 3] [--total-budget-ms 1500]
+        [--budget widgets=150] [--budget ui=60] [--depth 2] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# What RUN mode imports before the engine shows its first image.
+STARTUP_MODULES: Sequence[str] = (
+    "main",
+    "engine.screensaver_engine",
+    "rendering.display_widget",
+    "ui.tabs.shared_styles",
+)
+
+# Modules that must only load when the user opens settings or enables the
+# matching widget; seeing them on the /s path is a regression.
+LAZY_MODULES: Sequence[str] = (
+    "ui.settings_dialog",
+    "ui.system_tray",
+    "ui.tabs.sources_tab",
+    "ui.tabs.transitions_tab",
+    "ui.tabs.widgets_tab",
+    "ui.tabs.display_tab",
+    "ui.tabs.accessibility_tab",
+    "widgets.clock_widget",
+    "widgets.weather_widget",
+    "widgets.media_widget",
+    "widgets.reddit_widget",
+    "widgets.spotify_visualizer_widget",
+    "widgets.spotify_bars_gl_overlay",
+    "widgets.spotify_volume_widget",
+)
+
+DEFAULT_TOTAL_BUDGET_MS = 1500.0
+DEFAULT_PACKAGE_BUDGETS_MS: Dict[str, float] = {
+    "ui": 60.0,
+    "widgets": 150.0,
+}
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupReport:
+    records: List[ImportRecord]
+    package_ms: Dict[str, float] = field(default_factory=dict)
+    total_ms: float = 0.0
+    lazy_violations: List[str] = field(default_factory=list)
+    budget_failures: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.lazy_violations and not self.budget_failures
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "total_ms": round(self.total_ms, 2),
+            "packages_ms": {k: round(v, 2) for k, v in self.package_ms.items()},
+            "lazy_violations": list(self.lazy_violations),
+            "budget_failures": list(self.budget_failures),
+            "ok": self.ok,
+        }
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """Parse ``-X importtime`` output into records (header/noise skipped)."""
+    records: List[ImportRecord] = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        # CPython indents nested imports by two spaces per level after one
+        # leading space.
+        depth = max(0, (len(indent) - 1) // 2)
+        records.append(ImportRecord(module, int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def package_key(module: str, depth: int = 1) -> str:
+    return ".".join(module.split(".")[: max(1, depth)])
+
+
+def aggregate_by_package(records: Iterable[ImportRecord], depth: int = 1) -> Dict[str, float]:
+    """Sum self time per package prefix, in milliseconds, largest first.
+
+    Self times are summed rather than cumulative ones so that nested imports
+    are never double counted.
+    """
+    totals: Dict[str, float] = {}
+    for record in records:
+        key = package_key(record.module, depth)
+        totals[key] = totals.get(key, 0.0) + record.self_us / 1000.0
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def evaluate(
+    records: List[ImportRecord],
+    *,
+    total_budget_ms: Optional[float] = DEFAULT_TOTAL_BUDGET_MS,
+    package_budgets_ms: Mapping[str, float] = DEFAULT_PACKAGE_BUDGETS_MS,
+    lazy_modules: Sequence[str] = LAZY_MODULES,
+    depth: int = 1,
+) -> StartupReport:
+    report = StartupReport(records=records)
+    report.package_ms = aggregate_by_package(records, depth)
+    report.total_ms = sum(r.self_us for r in records) / 1000.0
+
+    if total_budget_ms is not None and report.total_ms > total_budget_ms:
+        report.budget_failures.append(f"total {report.total_ms:.1f}ms > {total_budget_ms:.1f}ms")
+    by_top_level = aggregate_by_package(records, 1) if depth != 1 else report.package_ms
+    for package, budget in package_budgets_ms.items():
+        spent = report.package_ms.get(package, by_top_level.get(package, 0.0))
+        if spent > budget:
+            report.budget_failures.append(f"{package} {spent:.1f}ms > {budget:.1f}ms")
+
+    imported = {r.module for r in records}
+    report.lazy_violations = [m for m in lazy_modules if m in imported]
+    return report
+
+
+def run_importtime(modules: Sequence[str], python: str = sys.executable) -> str:
+    """Import *modules* in a fresh interpreter and return its importtime log."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH", "")]))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    code = "; ".join(f"import {m}" for m in modules)
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        cwd=str(PROJECT_ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.splitlines()[-15:])
+        raise RuntimeError(f"startup import failed (exit {proc.returncode}):\n{tail}")
+    return proc.stderr
+
+
+def _median_records(runs: List[List[ImportRecord]]) -> List[ImportRecord]:
+    """Per-module median self/cumulative time across runs (first run's order)."""
+    samples: Dict[str, List[ImportRecord]] = {}
+    for records in runs:
+        for record in records:
+            samples.setdefault(record.module, []).append(record)
+    merged: List[ImportRecord] = []
+    for record in runs[0]:
+        group = samples[record.module]
+        merged.append(
+            ImportRecord(
+                record.module,
+                int(statistics.median(r.self_us for r in group)),
+                int(statistics.median(r.cumulative_us for r in group)),
+                record.depth,
+            )
+        )
+    return merged
+
+
+def _parse_budget(values: Sequence[str]) -> Dict[str, float]:
+    budgets = dict(DEFAULT_PACKAGE_BUDGETS_MS)
+    for value in values:
+        package, _, ms = value.partition("=")
+        if not package or not ms:
+            raise argparse.ArgumentTypeError(f"expected PACKAGE=MS, got {value!r}")
+        budgets[package.strip()] = float(ms)
+    return budgets
+
+
+def _format_table(report: StartupReport, top: int) -> str:
+    lines = [f"{'package':<40} {'self ms':>9}"]
+    for package, ms in list(report.package_ms.items())[:top]:
+        lines.append(f"{package:<40} {ms:>9.1f}")
+    lines.append(f"{'TOTAL':<40} {report.total_ms:>9.1f}")
+    slowest = sorted(report.records, key=lambda r: r.cumulative_us, reverse=True)[:top]
+    lines.append("")
+    lines.append(f"{'module (cumulative)':<60} {'ms':>9}")
+    for record in slowest:
+        lines.append(f"{record.module:<60} {record.cumulative_us / 1000.0:>9.1f}")
+    for violation in report.lazy_violations:
+        lines.append(f"LAZY VIOLATION: {violation} imported on the /s path")
+    for failure in report.budget_failures:
+        lines.append(f"BUDGET EXCEEDED: {failure}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters to median over")
+    parser.add_argument("--total-budget-ms", type=float, default=DEFAULT_TOTAL_BUDGET_MS)
+    parser.add_argument("--budget", action="append", default=[], metavar="PACKAGE=MS")
+    parser.add_argument("--depth", type=int, default=1, help="package prefix depth for aggregation")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    try:
+        budgets = _parse_budget(args.budget)
+        runs = [parse_importtime(run_importtime(STARTUP_MODULES)) for _ in range(max(1, args.runs))]
+    except (argparse.ArgumentTypeError, RuntimeError) as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    report = evaluate(
+        _median_records(runs),
+        total_budget_ms=args.total_budget_ms,
+        package_budgets_ms=budgets,
+        depth=args.depth,
+    )
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(_format_table(report, args.top))
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,202 @@
+"""Software-backend transition driven by a CPU ``TransitionPipeline``.
+
+Used instead of the GL compositor transitions when the software renderer
+backend is active. Each animation tick renders one frame into the
+DisplayWidget's ``SoftwareRenderSurface`` through the backend's
+``SoftwareTransitionPipeline``; the widget paints the surface's front buffer
+until the transition finishes.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QWidget
+
+from core.logging.logger import get_logger
+from core.animation.types import EasingCurve, resolve_easing
+
+from rendering.backends.base import TransitionPipeline, TransitionRenderPacket
+from rendering.backends.software.backend import SoftwareRenderSurface
+from transitions.base_transition import BaseTransition, TransitionState
+
+
+logger = get_logger(__name__)
+
+
+class SoftwareBackendTransition(BaseTransition):
+    """Animates a software ``TransitionPipeline`` into the widget's surface."""
+
+    def __init__(
+        self,
+        pipeline: TransitionPipeline,
+        duration_ms: int = 1000,
+        easing: str | EasingCurve = "Auto",
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(duration_ms)
+        self._pipeline: Optional[TransitionPipeline] = pipeline
+        self._parameters = dict(parameters or {})
+        self._easing_str: str | EasingCurve = easing
+        self._widget: Optional[QWidget] = None
+        self._surface: Optional[SoftwareRenderSurface] = None
+        self._old_pixmap: Optional[QPixmap] = None
+        self._new_pixmap: Optional[QPixmap] = None
+        self._animation_manager = None
+        self._animation_id: Optional[str] = None
+
+    @property
+    def pipeline(self) -> Optional[TransitionPipeline]:
+        return self._pipeline
+
+    # ------------------------------------------------------------------
+    # BaseTransition API
+    # ------------------------------------------------------------------
+
+    def start(self, old_pixmap: Optional[QPixmap], new_pixmap: QPixmap, widget: QWidget) -> bool:  # type: ignore[override]
+        if self._state == TransitionState.RUNNING:
+            logger.warning("[FALLBACK] Transition already running")
+            return False
+        if not new_pixmap or new_pixmap.isNull():
+            logger.error("Invalid pixmap for software transition")
+            self.error.emit("Invalid image")
+            return False
+
+        self._widget = widget
+        surface = getattr(widget, "_render_surface", None)
+        if not isinstance(surface, SoftwareRenderSurface) or self._pipeline is None:
+            logger.warning("[SOFTWARE] No software render surface attached; falling back to immediate display")
+            self._show_image_immediately()
+            return True
+
+        try:
+            dpr = float(getattr(widget, "_device_pixel_ratio", 1.0) or 1.0)
+        except Exception:
+            dpr = 1.0
+        surface.resize(
+            max(1, int(round(widget.width() * dpr))),
+            max(1, int(round(widget.height() * dpr))),
+            dpr,
+        )
+        self._surface = surface
+        self._old_pixmap = old_pixmap if old_pixmap is not None and not old_pixmap.isNull() else None
+        self._new_pixmap = new_pixmap
+        self._pipeline.attach_surface(surface)  # type: ignore[attr-defined]
+        surface.set_presenter(lambda _frame: widget.update())
+        # Render t=0 before the widget switches to the surface so the old
+        # image never blinks out.
+        self._render(0.0)
+        widget._software_transition_surface = surface
+
+        am = self._get_animation_manager(widget)
+        self._animation_manager = am
+        self._animation_id = am.animate_custom(
+            duration=max(0.001, self.duration_ms / 1000.0),
+            update_callback=self._on_anim_update,
+            easing=resolve_easing(self._easing_str),
+            on_complete=self._on_anim_complete,
+        )
+
+        self._mark_start()
+        self._set_state(TransitionState.RUNNING)
+        self.started.emit()
+        logger.info(
+            "SoftwareBackendTransition started (%dms, kernel=%s)",
+            self.duration_ms,
+            getattr(self._pipeline, "kernel_name", "?"),
+        )
+        return True
+
+    def stop(self) -> None:  # type: ignore[override]
+        if self._state != TransitionState.RUNNING:
+            return
+
+        logger.debug("Stopping SoftwareBackendTransition")
+        self._cancel_animation()
+        self._render(1.0)
+        self._set_state(TransitionState.CANCELLED)
+        self._emit_progress(1.0)
+        self.finished.emit()
+
+    def cleanup(self) -> None:  # type: ignore[override]
+        logger.debug("Cleaning up SoftwareBackendTransition")
+        self._cancel_animation()
+
+        widget = self._widget
+        surface = self._surface
+        if widget is not None and getattr(widget, "_software_transition_surface", None) is surface:
+            widget._software_transition_surface = None
+            try:
+                widget.update()
+            except Exception as e:
+                logger.debug("[SOFTWARE] Exception suppressed: %s", e)
+        if surface is not None:
+            surface.set_presenter(None)
+        if self._pipeline is not None:
+            backend = getattr(widget, "_renderer_backend", None) if widget is not None else None
+            try:
+                if backend is not None:
+                    backend.release_transition_pipeline(self._pipeline)
+                else:
+                    self._pipeline.cleanup()
+            except Exception as e:
+                logger.debug("[SOFTWARE] Exception suppressed: %s", e)
+            self._pipeline = None
+
+        self._surface = None
+        self._widget = None
+        self._old_pixmap = None
+        self._new_pixmap = None
+
+        if self._state not in (TransitionState.FINISHED, TransitionState.CANCELLED):
+            self._set_state(TransitionState.IDLE)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _render(self, progress: float) -> None:
+        if self._pipeline is None or self._new_pixmap is None:
+            return
+        self._pipeline.render(
+            TransitionRenderPacket(
+                old_texture=self._old_pixmap,
+                new_texture=self._new_pixmap,
+                progress=progress,
+                duration_ms=self.duration_ms,
+                parameters=self._parameters,
+            )
+        )
+
+    def _on_anim_update(self, progress: float) -> None:
+        if self._state != TransitionState.RUNNING:
+            return
+        try:
+            self._render(progress)
+        except Exception:
+            logger.exception("[SOFTWARE] Transition frame failed; finishing early")
+            self._cancel_animation()
+            self._on_anim_complete()
+            return
+        self._emit_progress(progress)
+
+    def _on_anim_complete(self) -> None:
+        if self._state != TransitionState.RUNNING:
+            return
+        self._animation_id = None
+        self._mark_end()
+        self._set_state(TransitionState.FINISHED)
+        self._emit_progress(1.0)
+        self.finished.emit()
+        logger.debug("SoftwareBackendTransition finished")
+
+    def _cancel_animation(self) -> None:
+        if self._animation_id is None or self._animation_manager is None:
+            self._animation_id = None
+            return
+        try:
+            self._animation_manager.cancel_animation(self._animation_id)
+        except Exception as e:
+            logger.debug("[SOFTWARE] Exception suppressed: %s", e)
+        self._animation_id = None
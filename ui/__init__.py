@@ -2,6 +2,15 @@
 
 # Ensure compiled Qt resources (assets_rc) are registered before any stylesheets load.
 from .resources import assets_rc  # noqa: F401
-from .settings_dialog import SettingsDialog
 
 __all__ = ['SettingsDialog']
+
+
+def __getattr__(name: str):
+    # The settings dialog is never shown on the /s path; import it on demand.
+    if name == 'SettingsDialog':
+        from .settings_dialog import SettingsDialog
+
+        globals()[name] = SettingsDialog
+        return SettingsDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,27 @@
-"""Settings dialog tabs."""
+"""Settings dialog tabs.
 
-from .sources_tab import SourcesTab
-from .transitions_tab import TransitionsTab
-from .widgets_tab import WidgetsTab
-from .display_tab import DisplayTab
-from .accessibility_tab import AccessibilityTab
+Tab classes are resolved on first attribute access so that importing a
+helper such as ``ui.tabs.shared_styles`` (done on the screensaver path to
+register fonts) does not pull in every tab module.
+"""
+
+from importlib import import_module
+
+_TAB_MODULES = {
+    'SourcesTab': '.sources_tab',
+    'TransitionsTab': '.transitions_tab',
+    'WidgetsTab': '.widgets_tab',
+    'DisplayTab': '.display_tab',
+    'AccessibilityTab': '.accessibility_tab',
+}
 
 __all__ = ['SourcesTab', 'TransitionsTab', 'WidgetsTab', 'DisplayTab', 'AccessibilityTab']
+
+
+def __getattr__(name: str):
+    module_name = _TAB_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
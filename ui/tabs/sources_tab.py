@@ -619,12 +619,14 @@ class SourcesTab(QWidget):
         from PySide6.QtWidgets import QMessageBox
         
         # Count files before asking
+        from core.resources.asset_store import namespace_for_directory
         from core.settings.storage_paths import get_rss_cache_dir
         cache_dir = get_rss_cache_dir()
         file_count = 0
         try:
+            file_count = namespace_for_directory(cache_dir).stats()[0]
             if cache_dir.exists() and cache_dir.is_dir():
-                file_count = sum(1 for f in cache_dir.glob('*') if f.is_file())
+                file_count += sum(1 for f in cache_dir.glob('*') if f.is_file())
         except Exception as e:
             logger.debug("[MISC] Exception suppressed: %s", e)
         
@@ -697,19 +699,21 @@ class SourcesTab(QWidget):
         logger.info("RSS feeds reset to curated JSON defaults via 'Just Make It Work' (cache preserved).")
 
     def _clear_rss_cache(self) -> int:
-        """Delete all files from the shared RSS cache directory.
+        """Delete all RSS images from the asset store and cache directory.
 
         Uses the same cache location as ``RSSSource`` so that cached
         images can be cleared instantly from the settings UI.
         Skips files locked by other processes (e.g. active RSS downloads).
         """
+        from core.resources.asset_store import namespace_for_directory
         from core.settings.storage_paths import get_rss_cache_dir
         cache_dir = get_rss_cache_dir()
         removed = 0
         skipped = 0
         try:
+            removed += namespace_for_directory(cache_dir).clear()[0]
             if not cache_dir.exists() or not cache_dir.is_dir():
-                return 0
+                return removed
             for f in cache_dir.glob('*'):
                 try:
                     if f.is_file():
@@ -3,12 +3,14 @@ LRU (Least Recently Used) cache for images.
 
 Caches decoded images to avoid redundant disk I/O and decoding.
 Supports immutable QImage entries and legacy GUI-owned QPixmap entries with exact logical-byte eviction.
+An optional disk tier (``ScaledImageDiskCache``) backs display-ready scaled
+QImages across sessions; see ``attach_disk_tier``.
 """
 from collections import OrderedDict
 import math
 import threading
 from types import MappingProxyType
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 from PySide6.QtGui import QPixmap, QImage
 from core.logging.logger import (
     get_logger,
@@ -29,6 +31,9 @@ def _freeze_snapshot_value(value):
         return tuple(_freeze_snapshot_value(item) for item in value)
     return repr(value)
 
+if TYPE_CHECKING:
+    from utils.scaled_image_disk_cache import ScaledImageDiskCache
+
 logger = get_logger(__name__)
 
 
@@ -87,6 +92,9 @@ class ImageCache:
         self._evicted_bytes_by_kind: dict[str, int] = {"raw": 0, "scaled": 0}
         self._replacement_count: int = 0
         self._idempotent_put_count: int = 0
+        self._l2_hit_count: int = 0
+        self._l2_miss_count: int = 0
+        self._disk_tier: Optional["ScaledImageDiskCache"] = None
         self._lock = threading.RLock()
         
         logger.info(f"ImageCache initialized: max_items={max_items}, "
@@ -114,57 +122,102 @@ class ImageCache:
             _cache_trace("Cache miss: %s", key)
             return None
     
+    def attach_disk_tier(self, tier: Optional["ScaledImageDiskCache"]) -> None:
+        """Back scaled QImage entries with a persistent L2 tier (None detaches)."""
+        with self._lock:
+            self._disk_tier = tier
+
+    def close_disk_tier(self) -> None:
+        """Flush and close the disk tier's index; it reopens on next use."""
+        tier = self._disk_tier
+        if tier is not None:
+            tier.close()
+
+    def get_from_disk_tier(self, key: str) -> Optional[QImage]:
+        """
+        Load a scaled *key* from the disk tier and promote it into memory.
+        
+        Callers probe ``get`` first; this is the L1-miss path. Raw keys and
+        caches without a tier always return None without counting a lookup.
+        """
+        tier = self._disk_tier
+        if tier is None or self._key_kind(key) != "scaled":
+            return None
+        image = tier.load(key)
+        with self._lock:
+            if image is None:
+                self._l2_miss_count += 1
+                return None
+            self._l2_hit_count += 1
+            self._put_locked(key, image)
+        _cache_trace("L2 hit: %s", key)
+        return image
+
     def put(self, key: str, image: Union[QImage, QPixmap]) -> None:
         """
         Add an image to cache.
         
-        If cache is full, evicts least recently used entries.
+        If cache is full, evicts least recently used entries. Scaled QImage
+        entries are also queued for the disk tier when one is attached.
         
         Args:
             key: Cache key (usually file path)
             image: immutable QImage or GUI-owned QPixmap to cache
         """
-        # Remove if already exists (to update order)
         with self._lock:
-            if key in self._cache:
-                if self._cache[key] is image:
-                    self._cache.move_to_end(key)
-                    self._idempotent_put_count += 1
-                    _cache_trace("Retained identical cached object without replacement: %s", key)
-                    return
-                old_img = self._cache.pop(key)
-                self._current_memory -= self._tracked_size(old_img)
-                self._current_tracked_bytes -= self._tracked_bytes_by_key.pop(key, 0)
-                self._resource_metadata_by_key.pop(key, None)
-                self._replacement_count += 1
-            
-            # Add new entry
-            self._cache[key] = image
-            tracked_bytes = self._tracked_size(image)
-            self._current_memory += tracked_bytes
-            self._tracked_bytes_by_key[key] = tracked_bytes
-            self._resource_metadata_by_key[key] = MappingProxyType({
-                "key": key,
-                "owner": self._owner,
-                "generation": _freeze_snapshot_value(self._generation),
-                "dimensions": (int(image.width()), int(image.height())),
-                "format": self._image_format(image),
-                "tracked_bytes": tracked_bytes,
-                "lease_count": None,
-            })
-            self._current_tracked_bytes += tracked_bytes
-            
-            # Evict if necessary
-            while self._should_evict_locked():
-                self._evict_oldest_locked()
-            
-            _cache_trace(
-                "Cached: %s (size=%d/%d, memory=%.1fMB)",
-                key,
-                len(self._cache),
-                self.max_items,
-                self._current_memory / (1024 * 1024),
-            )
+            inserted = self._put_locked(key, image)
+            tier = self._disk_tier
+        if (
+            inserted
+            and tier is not None
+            and isinstance(image, QImage)
+            and self._key_kind(key) == "scaled"
+        ):
+            tier.store_async(key, image)
+
+    def _put_locked(self, key: str, image: Union[QImage, QPixmap]) -> bool:
+        """Insert *image*; False when it was already the cached object (caller holds lock)."""
+        # Remove if already exists (to update order)
+        if key in self._cache:
+            if self._cache[key] is image:
+                self._cache.move_to_end(key)
+                self._idempotent_put_count += 1
+                _cache_trace("Retained identical cached object without replacement: %s", key)
+                return False
+            old_img = self._cache.pop(key)
+            self._current_memory -= self._tracked_size(old_img)
+            self._current_tracked_bytes -= self._tracked_bytes_by_key.pop(key, 0)
+            self._resource_metadata_by_key.pop(key, None)
+            self._replacement_count += 1
+        
+        # Add new entry
+        self._cache[key] = image
+        tracked_bytes = self._tracked_size(image)
+        self._current_memory += tracked_bytes
+        self._tracked_bytes_by_key[key] = tracked_bytes
+        self._resource_metadata_by_key[key] = MappingProxyType({
+            "key": key,
+            "owner": self._owner,
+            "generation": _freeze_snapshot_value(self._generation),
+            "dimensions": (int(image.width()), int(image.height())),
+            "format": self._image_format(image),
+            "tracked_bytes": tracked_bytes,
+            "lease_count": None,
+        })
+        self._current_tracked_bytes += tracked_bytes
+        
+        # Evict if necessary
+        while self._should_evict_locked():
+            self._evict_oldest_locked()
+        
+        _cache_trace(
+            "Cached: %s (size=%d/%d, memory=%.1fMB)",
+            key,
+            len(self._cache),
+            self.max_items,
+            self._current_memory / (1024 * 1024),
+        )
+        return True
     
     def contains(self, key: str) -> bool:
         """
@@ -262,6 +315,9 @@ class ImageCache:
             max_memory_mb = self.max_memory_bytes / (1024 * 1024)
             total_accesses = self._hit_count + self._miss_count
             hit_rate = (self._hit_count / total_accesses * 100.0) if total_accesses > 0 else 0.0
+            l2_lookups = self._l2_hit_count + self._l2_miss_count
+            l2_hit_rate = (self._l2_hit_count / l2_lookups * 100.0) if l2_lookups > 0 else 0.0
+            tier = self._disk_tier
             raw_keys = [key for key in self._cache if self._key_kind(key) == "raw"]
             scaled_keys = [key for key in self._cache if self._key_kind(key) == "scaled"]
 
@@ -275,6 +331,10 @@ class ImageCache:
                 'hits': self._hit_count,
                 'misses': self._miss_count,
                 'hit_rate_percent': hit_rate,
+                'l1_hit_rate_percent': hit_rate,
+                'l2_hits': self._l2_hit_count,
+                'l2_misses': self._l2_miss_count,
+                'l2_hit_rate_percent': l2_hit_rate,
                 'evictions': self._evict_count,
                 'raw_items': len(raw_keys),
                 'raw_bytes': sum(self._tracked_bytes_by_key.get(key, 0) for key in raw_keys),
@@ -286,6 +346,7 @@ class ImageCache:
                 'scaled_evicted_bytes': self._evicted_bytes_by_kind["scaled"],
                 'replacements': self._replacement_count,
                 'idempotent_puts_avoided': self._idempotent_put_count,
+                'l2': tier.get_stats() if tier is not None else None,
             }
     
     def _should_evict_locked(self) -> bool:
@@ -5,6 +5,7 @@ Image prefetcher built on ThreadManager and ImageCache.
 - Caches decoded images in an LRU cache
 - Prefetches next N images ahead with limited concurrency
 - Supports post-transition delay to reduce IO contention
+- Optionally sized by a PrefetchPlanner from measured decode/scale latency
 """
 from __future__ import annotations
 
@@ -25,6 +26,7 @@ from core.threading.manager import ThreadManager, TaskPriority, ThreadPoolType
 from rendering.display_modes import DisplayMode
 from rendering.image_processor_async import AsyncImageProcessor
 from utils.image_cache import ImageCache
+from utils.prefetch_planner import STAGE_DECODE, STAGE_SCALE, PrefetchPlan, PrefetchPlanner
 
 logger = get_logger(__name__)
 
@@ -50,9 +52,11 @@ class ImagePrefetcher:
         post_transition_delay_ms: float = 100.0,
         max_pending_requests: Optional[int] = None,
         max_pending_scaled_bytes: Optional[int] = None,
+        planner: Optional[PrefetchPlanner] = None,
     ) -> None:
         self._threads = thread_manager
         self._cache = cache
+        self._planner = planner
         self._max_concurrent = max(1, min(4, int(max_concurrent)))
         self._max_pending_requests = max(
             self._max_concurrent,
@@ -79,6 +83,31 @@ class ImagePrefetcher:
         self._post_transition_delay_ms = max(0.0, float(post_transition_delay_ms))
         self._transition_end_time: float = 0.0
 
+    @property
+    def planner(self) -> Optional[PrefetchPlanner]:
+        return self._planner
+
+    def memory_budget_bytes(self) -> int:
+        """Bytes the planner may spend on display-ready slides ahead of time."""
+        return max(1, int(getattr(self._cache, "max_memory_bytes", 256 * _MIB))) // 2
+
+    def apply_plan(self, plan: PrefetchPlan) -> None:
+        """Adopt planner-chosen concurrency and cool-down, then fill new slots."""
+        with self._lock:
+            grew = plan.concurrency > self._max_concurrent
+            self._max_concurrent = max(1, int(plan.concurrency))
+            self._max_pending_requests = max(self._max_pending_requests, self._max_concurrent)
+            self._post_transition_delay_ms = max(0.0, float(plan.post_transition_delay_ms))
+        if grew:
+            self._pump_raw_prefetch()
+            self._pump_scaled_prefetch()
+
+    def snapshot_planner_state(self) -> Dict[str, Any]:
+        """Planner metrics (deadline-miss rate, chosen plan, latency tails)."""
+        if self._planner is None:
+            return {}
+        return self._planner.snapshot()
+
     def notify_transition_complete(self) -> None:
         """Notify prefetcher that a transition just completed.
         
@@ -298,8 +327,14 @@ class ImagePrefetcher:
             if self._raw_inflight_generations.get(path) != generation:
                 return
 
+        planner = self._planner
+
         def _load_qimage(p: str) -> Optional[QImage]:
-            return ImageLoader.load_qimage_silent(p)
+            started = time.perf_counter()
+            image = ImageLoader.load_qimage_silent(p)
+            if planner is not None and image is not None and not image.isNull():
+                planner.record_latency(p, STAGE_DECODE, time.perf_counter() - started)
+            return image
 
         def _on_done(res) -> None:
             # res is TaskResult
@@ -422,6 +457,7 @@ class ImagePrefetcher:
         use_lanczos = bool(request.get("use_lanczos", False))
         sharpen = bool(request.get("sharpen", False))
         generation = int(request.get("_prefetch_generation", -1))
+        planner = self._planner
 
         def _compute_scaled_variant() -> Optional[tuple[str, QImage]]:
             try:
@@ -436,6 +472,7 @@ class ImagePrefetcher:
                     base = base.toImage()
                 if not isinstance(base, QImage) or base.isNull():
                     return None
+                started = time.perf_counter()
                 scaled = AsyncImageProcessor.process_qimage(
                     base,
                     QSize(width, height),
@@ -445,6 +482,8 @@ class ImagePrefetcher:
                 )
                 if scaled.isNull():
                     return None
+                if planner is not None:
+                    planner.record_latency(raw_path, STAGE_SCALE, time.perf_counter() - started)
                 return cache_key, scaled
             except Exception as e:
                 logger.debug("Scaled prefetch compute failed for %s: %s", cache_key, e)
@@ -481,6 +520,10 @@ class ImagePrefetcher:
                                 height,
                                 display_mode.value,
                             )
+                    if not scaled_cached:
+                        # Superseded by a newer generation: park the canvas
+                        # for the next scale of this size instead of dropping it.
+                        AsyncImageProcessor.recycle(image)
             finally:
                 with self._lock:
                     if self._scaled_inflight_generations.get(cache_key) == generation:
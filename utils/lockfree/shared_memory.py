@@ -0,0 +1,326 @@
+"""
+Shared-memory SPSC ring and triple buffer for cross-process exchange.
+
+Process-shared counterparts of :class:`SPSCQueue` and :class:`TripleBuffer`.
+Each lives in one ``multiprocessing.shared_memory`` segment with a fixed
+layout, so a producer in one process and a consumer in another exchange byte
+payloads without pickling or a queue round trip.
+
+Design notes:
+- Strict SPSC usage: exactly one producer and one consumer, in any process.
+- Each side owns the index words it writes; the other side only reads them.
+  Index words are 8-byte aligned and written with a single native store
+  through a ``memoryview`` cast, so a reader never observes a torn index.
+- Payload bytes are always written before the index that publishes them.
+  Ordering relies on the x86-64 store order the app ships for.
+- Triple buffer slots carry a sequence counter (seqlock): odd while the
+  producer writes, even when stable.  A reader that sees the counter move
+  during its copy retries rather than returning a torn payload.
+- The creating side owns the segment and must ``unlink()`` it; attached
+  sides only ``close()``.
+"""
+from __future__ import annotations
+
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional
+
+_CACHE_LINE = 64
+_WORD = 8
+_LENGTH = struct.Struct("<Q")
+
+_RING_MAGIC = 0x53525053_52494E47  # "SRPSRING"
+_TRIPLE_MAGIC = 0x53525053_54524942  # "SRPSTRIB"
+
+# Word indices (8-byte units) into the header; head/tail and ready get their
+# own cache line so producer and consumer never write the same line.
+_MAGIC_WORD = 0
+_SLOTS_WORD = 1
+_SLOT_BYTES_WORD = 2
+_HEAD_WORD = _CACHE_LINE // _WORD
+_TAIL_WORD = 2 * _CACHE_LINE // _WORD
+_READY_WORD = _CACHE_LINE // _WORD
+_HEADER_BYTES = 3 * _CACHE_LINE
+
+
+def _align(value: int, to: int = _CACHE_LINE) -> int:
+    return (value + to - 1) // to * to
+
+
+class _SharedSegment:
+    """Segment ownership plus an 8-byte word view over its header."""
+
+    def __init__(self, shm: SharedMemory, *, owner: bool) -> None:
+        self._shm = shm
+        self._owner = owner
+        self._words: Optional[memoryview] = shm.buf[:_HEADER_BYTES].cast("Q")
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def owner(self) -> bool:
+        return self._owner
+
+    def close(self) -> None:
+        """Release this process's mapping (idempotent)."""
+        words = self._words
+        if words is None:
+            return
+        self._words = None
+        words.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Remove the segment name; only the creating side should call this."""
+        self.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+
+def _open_segment(name: str, magic: int) -> SharedMemory:
+    shm = SharedMemory(name=name, create=False)
+    try:
+        found = _LENGTH.unpack_from(shm.buf, _MAGIC_WORD * _WORD)[0]
+    except Exception:
+        shm.close()
+        raise
+    if found != magic:
+        shm.close()
+        raise ValueError(f"shared memory segment {name!r} has an unexpected layout")
+    return shm
+
+
+class SharedMemorySPSCRing(_SharedSegment):
+    """Bounded ring of fixed-capacity byte records in shared memory.
+
+    ``try_push`` returns False when the ring is full and ``try_pop`` returns
+    None when it is empty; neither ever blocks.
+    """
+
+    def __init__(self, shm: SharedMemory, *, owner: bool) -> None:
+        super().__init__(shm, owner=owner)
+        words = self._words
+        self._slot_count = int(words[_SLOTS_WORD])
+        self._slot_bytes = int(words[_SLOT_BYTES_WORD])
+        self._stride = _align(_WORD + self._slot_bytes)
+        self._buf = shm.buf
+
+    @classmethod
+    def create(
+        cls,
+        slot_count: int,
+        slot_bytes: int,
+        *,
+        name: Optional[str] = None,
+    ) -> "SharedMemorySPSCRing":
+        if slot_count < 1:
+            raise ValueError("slot_count must be >= 1")
+        if slot_bytes < 1:
+            raise ValueError("slot_bytes must be >= 1")
+        stride = _align(_WORD + int(slot_bytes))
+        shm = SharedMemory(
+            name=name,
+            create=True,
+            size=_HEADER_BYTES + stride * int(slot_count),
+        )
+        for word, value in (
+            (_MAGIC_WORD, _RING_MAGIC),
+            (_SLOTS_WORD, int(slot_count)),
+            (_SLOT_BYTES_WORD, int(slot_bytes)),
+            (_HEAD_WORD, 0),
+            (_TAIL_WORD, 0),
+        ):
+            _LENGTH.pack_into(shm.buf, word * _WORD, value)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemorySPSCRing":
+        return cls(_open_segment(name, _RING_MAGIC), owner=False)
+
+    @property
+    def capacity(self) -> int:
+        return self._slot_count
+
+    @property
+    def slot_bytes(self) -> int:
+        return self._slot_bytes
+
+    def size(self) -> int:
+        words = self._words
+        return int(words[_TAIL_WORD] - words[_HEAD_WORD])
+
+    def is_empty(self) -> bool:
+        return self.size() == 0
+
+    def is_full(self) -> bool:
+        return self.size() >= self._slot_count
+
+    def _slot_offset(self, index: int) -> int:
+        return _HEADER_BYTES + (index % self._slot_count) * self._stride
+
+    def try_push(self, payload: bytes | bytearray) -> bool:
+        """Producer side: copy *payload* into the next free slot."""
+        size = len(payload)
+        if size > self._slot_bytes:
+            raise ValueError(
+                f"payload of {size} bytes exceeds ring slot capacity {self._slot_bytes}"
+            )
+        words = self._words
+        tail = words[_TAIL_WORD]
+        if tail - words[_HEAD_WORD] >= self._slot_count:
+            return False
+        offset = self._slot_offset(tail)
+        _LENGTH.pack_into(self._buf, offset, size)
+        self._buf[offset + _WORD:offset + _WORD + size] = payload
+        words[_TAIL_WORD] = tail + 1
+        return True
+
+    def try_pop(self) -> Optional[bytes]:
+        """Consumer side: return the oldest record, or None when empty."""
+        words = self._words
+        head = words[_HEAD_WORD]
+        if head == words[_TAIL_WORD]:
+            return None
+        offset = self._slot_offset(head)
+        size = min(_LENGTH.unpack_from(self._buf, offset)[0], self._slot_bytes)
+        payload = bytes(self._buf[offset + _WORD:offset + _WORD + size])
+        words[_HEAD_WORD] = head + 1
+        return payload
+
+    def drain(self) -> List[bytes]:
+        """Pop every record visible right now, oldest first."""
+        records: List[bytes] = []
+        for _ in range(self._slot_count):
+            record = self.try_pop()
+            if record is None:
+                break
+            records.append(record)
+        return records
+
+    def close(self) -> None:
+        self._buf = None
+        super().close()
+
+
+class SharedMemoryTripleBuffer(_SharedSegment):
+    """Latest-value exchange of byte records through three shared slots.
+
+    The producer always writes a slot other than the one currently marked
+    ready, then publishes it.  ``consume_latest`` returns each published
+    value at most once and skips straight to the newest.
+    """
+
+    _SLOT_COUNT = 3
+    _READ_ATTEMPTS = 4
+
+    def __init__(self, shm: SharedMemory, *, owner: bool) -> None:
+        super().__init__(shm, owner=owner)
+        self._slot_bytes = int(self._words[_SLOT_BYTES_WORD])
+        self._stride = _align(2 * _WORD + self._slot_bytes)
+        self._buf = shm.buf
+        self._slot_words = shm.buf[
+            _HEADER_BYTES:_HEADER_BYTES + self._stride * self._SLOT_COUNT
+        ].cast("Q")
+        # Consumer-local: publish count of the last value handed out.
+        self._last_read = 0
+
+    @classmethod
+    def create(
+        cls,
+        slot_bytes: int,
+        *,
+        name: Optional[str] = None,
+    ) -> "SharedMemoryTripleBuffer":
+        if slot_bytes < 1:
+            raise ValueError("slot_bytes must be >= 1")
+        stride = _align(2 * _WORD + int(slot_bytes))
+        shm = SharedMemory(
+            name=name,
+            create=True,
+            size=_HEADER_BYTES + stride * cls._SLOT_COUNT,
+        )
+        _LENGTH.pack_into(shm.buf, _MAGIC_WORD * _WORD, _TRIPLE_MAGIC)
+        _LENGTH.pack_into(shm.buf, _SLOT_BYTES_WORD * _WORD, int(slot_bytes))
+        _LENGTH.pack_into(shm.buf, _READY_WORD * _WORD, 0)
+        for index in range(cls._SLOT_COUNT):
+            _LENGTH.pack_into(shm.buf, _HEADER_BYTES + index * stride, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryTripleBuffer":
+        return cls(_open_segment(name, _TRIPLE_MAGIC), owner=False)
+
+    @property
+    def slot_bytes(self) -> int:
+        return self._slot_bytes
+
+    def _seq_word(self, slot: int) -> int:
+        return slot * self._stride // _WORD
+
+    def publish(self, payload: bytes | bytearray) -> None:
+        """Producer side: make *payload* the latest value."""
+        size = len(payload)
+        if size > self._slot_bytes:
+            raise ValueError(
+                f"payload of {size} bytes exceeds triple buffer slot capacity {self._slot_bytes}"
+            )
+        words = self._words
+        ready = words[_READY_WORD]
+        slot = ((ready & 3) + 1) % self._SLOT_COUNT if ready else 0
+        seq_word = self._seq_word(slot)
+        seq = self._slot_words[seq_word]
+        self._slot_words[seq_word] = seq + 1
+        offset = _HEADER_BYTES + slot * self._stride
+        self._slot_words[seq_word + 1] = size
+        self._buf[offset + 2 * _WORD:offset + 2 * _WORD + size] = payload
+        self._slot_words[seq_word] = seq + 2
+        words[_READY_WORD] = (((ready >> 2) + 1) << 2) | slot
+
+    def has_pending(self) -> bool:
+        """Check if there's a published value that hasn't been consumed yet."""
+        ready = self._words[_READY_WORD]
+        return bool(ready) and (ready >> 2) != self._last_read
+
+    def consume_latest(self) -> Optional[bytes]:
+        """Consumer side: return the newest unread value, or None."""
+        words = self._words
+        for _ in range(self._READ_ATTEMPTS):
+            ready = words[_READY_WORD]
+            count = ready >> 2
+            if not ready or count == self._last_read:
+                return None
+            slot = ready & 3
+            seq_word = self._seq_word(slot)
+            seq = self._slot_words[seq_word]
+            if seq & 1:
+                continue
+            size = min(self._slot_words[seq_word + 1], self._slot_bytes)
+            offset = _HEADER_BYTES + slot * self._stride + 2 * _WORD
+            payload = bytes(self._buf[offset:offset + size])
+            if self._slot_words[seq_word] != seq:
+                # Overwritten mid-copy, so a newer value is ready; retry.
+                continue
+            self._last_read = count
+            return payload
+        return None
+
+    def close(self) -> None:
+        slot_words = getattr(self, "_slot_words", None)
+        if slot_words is not None:
+            self._slot_words = None
+            slot_words.release()
+        self._buf = None
+        super().close()
@@ -0,0 +1,383 @@
+"""
+Adaptive prefetch planner.
+
+Chooses prefetch depth, worker concurrency and the post-transition cool-down
+from measured latencies instead of fixed constants:
+
+- Raw decode and scale latencies are recorded per *source class* (local disk,
+  network share, RSS cache) into small log-bucketed histograms that decay so
+  the plan follows a NAS waking up or a cold RSS cache warming.
+- The slide interval is tracked per display; in different-images mode every
+  display consumes its own image, so the queue drains at the sum of their
+  rates.
+- Every displayed slide reports whether its display-ready derivative existed
+  when the slide was due. The resulting deadline-miss rate is the planner's
+  success metric and is surfaced through ``snapshot()`` and the PERF logs.
+
+The planner is pure bookkeeping (no Qt, no threads of its own) and is safe to
+call from IO/compute callbacks.
+"""
+from __future__ import annotations
+
+import math
+import os
+import sys
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+SOURCE_LOCAL = "local"
+SOURCE_NETWORK = "network"
+SOURCE_RSS_CACHE = "rss_cache"
+SOURCE_CLASSES = (SOURCE_LOCAL, SOURCE_NETWORK, SOURCE_RSS_CACHE)
+
+STAGE_DECODE = "decode"
+STAGE_SCALE = "scale"
+
+# Priors used until a source class has enough samples of its own.
+_PRIOR_LATENCY_S: Dict[Tuple[str, str], float] = {
+    (SOURCE_LOCAL, STAGE_DECODE): 0.15,
+    (SOURCE_NETWORK, STAGE_DECODE): 0.6,
+    (SOURCE_RSS_CACHE, STAGE_DECODE): 0.2,
+    (SOURCE_LOCAL, STAGE_SCALE): 0.12,
+    (SOURCE_NETWORK, STAGE_SCALE): 0.12,
+    (SOURCE_RSS_CACHE, STAGE_SCALE): 0.12,
+}
+_MIN_SAMPLES = 4
+_DEADLINE_WINDOW = 200
+_DRIVE_REMOTE = 4  # GetDriveTypeW
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (1ms..~2min) with exponential decay.
+
+    Counts are halved every ``decay_every`` samples, so old observations keep
+    shaping the tail without pinning it forever.
+    """
+
+    _MIN_S = 0.001
+    _GROWTH = 1.25
+    _BUCKETS = 54  # 0.001 * 1.25**53 ~= 137s
+
+    def __init__(self, decay_every: int = 256) -> None:
+        self._counts: List[float] = [0.0] * self._BUCKETS
+        self._total = 0.0
+        self._since_decay = 0
+        self._decay_every = max(16, int(decay_every))
+        self.samples = 0
+
+    @classmethod
+    def _bucket(cls, seconds: float) -> int:
+        if seconds <= cls._MIN_S:
+            return 0
+        idx = int(math.ceil(math.log(seconds / cls._MIN_S, cls._GROWTH)))
+        return min(cls._BUCKETS - 1, max(0, idx))
+
+    @classmethod
+    def _upper_bound(cls, idx: int) -> float:
+        return cls._MIN_S * (cls._GROWTH ** idx)
+
+    def record(self, seconds: float) -> None:
+        self._counts[self._bucket(max(0.0, float(seconds)))] += 1.0
+        self._total += 1.0
+        self.samples += 1
+        self._since_decay += 1
+        if self._since_decay >= self._decay_every:
+            self._counts = [c * 0.5 for c in self._counts]
+            self._total *= 0.5
+            self._since_decay = 0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding quantile *q*, or None if empty."""
+        if self._total <= 0.0:
+            return None
+        target = max(0.0, min(1.0, float(q))) * self._total
+        running = 0.0
+        for idx, count in enumerate(self._counts):
+            running += count
+            if running >= target and count > 0.0:
+                return self._upper_bound(idx)
+        return self._upper_bound(self._BUCKETS - 1)
+
+
+@dataclass(frozen=True)
+class PrefetchPlan:
+    depth: int
+    concurrency: int
+    post_transition_delay_ms: float
+    service_time_s: float
+    slide_interval_s: float
+    memory_limited: bool = False
+
+
+class PrefetchPlanner:
+    """Latency- and deadline-driven prefetch sizing."""
+
+    def __init__(
+        self,
+        *,
+        min_depth: int = 1,
+        max_depth: int = 12,
+        min_concurrency: int = 1,
+        max_concurrency: Optional[int] = None,
+        base_post_transition_delay_ms: float = 100.0,
+        quantile: float = 0.95,
+        network_roots: Iterable[str] = (),
+        rss_cache_roots: Iterable[str] = (),
+    ) -> None:
+        self.min_depth = max(1, int(min_depth))
+        self.max_depth = max(self.min_depth, int(max_depth))
+        self.min_concurrency = max(1, int(min_concurrency))
+        if max_concurrency is None:
+            max_concurrency = min(8, max(2, (os.cpu_count() or 2) // 2))
+        self.max_concurrency = max(self.min_concurrency, int(max_concurrency))
+        self.base_post_transition_delay_ms = max(0.0, float(base_post_transition_delay_ms))
+        self.quantile = max(0.5, min(0.999, float(quantile)))
+        self._network_roots = tuple(_norm_root(r) for r in network_roots if r)
+        self._rss_roots = tuple(_norm_root(r) for r in rss_cache_roots if r)
+        self._drive_remote: Dict[str, bool] = {}
+
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        # Recent source mix of the images actually being prefetched.
+        self._recent_sources: Deque[str] = deque(maxlen=64)
+        self._display_intervals: Dict[int, float] = {}
+        self._same_image = True
+        self._bytes_per_slide = 0
+        self._deadline_hits = 0
+        self._deadline_misses = 0
+        self._recent_deadlines: Deque[bool] = deque(maxlen=_DEADLINE_WINDOW)
+        self._misses_by_display: Dict[int, int] = {}
+        self._last_plan: Optional[PrefetchPlan] = None
+
+    # ------------------------------------------------------------------
+    # Inputs
+    # ------------------------------------------------------------------
+
+    def classify_source(self, path: str) -> str:
+        """Map an image path onto a latency class."""
+        norm = _norm_root(path)
+        if any(norm.startswith(root) for root in self._rss_roots):
+            return SOURCE_RSS_CACHE
+        if norm.startswith("//") or any(norm.startswith(root) for root in self._network_roots):
+            return SOURCE_NETWORK
+        if sys.platform == "win32" and len(norm) >= 2 and norm[1] == ":":
+            if self._is_remote_drive(norm[0]):
+                return SOURCE_NETWORK
+        return SOURCE_LOCAL
+
+    def record_latency(self, path_or_source: str, stage: str, seconds: float) -> None:
+        source = path_or_source if path_or_source in SOURCE_CLASSES else self.classify_source(path_or_source)
+        with self._lock:
+            hist = self._histograms.get((source, stage))
+            if hist is None:
+                hist = self._histograms[(source, stage)] = LatencyHistogram()
+            hist.record(seconds)
+            if stage == STAGE_DECODE:
+                self._recent_sources.append(source)
+
+    def note_upcoming(self, paths: Iterable[str]) -> None:
+        """Fold the sources of the next slides into the mix before they decode."""
+        sources = [self.classify_source(p) for p in paths if p]
+        with self._lock:
+            self._recent_sources.extend(sources)
+
+    def set_display_intervals(self, intervals_s: Dict[int, float], *, same_image: bool) -> None:
+        with self._lock:
+            self._display_intervals = {
+                int(idx): float(interval)
+                for idx, interval in intervals_s.items()
+                if interval and float(interval) > 0
+            }
+            self._same_image = bool(same_image)
+
+    def set_bytes_per_slide(self, nbytes: int) -> None:
+        with self._lock:
+            self._bytes_per_slide = max(0, int(nbytes))
+
+    def record_deadline(self, display_index: int, ready: bool) -> None:
+        """Record whether a slide's display-ready image existed when it was due."""
+        with self._lock:
+            if ready:
+                self._deadline_hits += 1
+            else:
+                self._deadline_misses += 1
+                self._misses_by_display[int(display_index)] = (
+                    self._misses_by_display.get(int(display_index), 0) + 1
+                )
+            self._recent_deadlines.append(bool(ready))
+
+    # ------------------------------------------------------------------
+    # Plan
+    # ------------------------------------------------------------------
+
+    def plan(self, memory_budget_bytes: Optional[int] = None) -> PrefetchPlan:
+        with self._lock:
+            service_s = self._service_time_locked()
+            interval_s = self._consumption_interval_locked()
+            recent_miss_rate = self._recent_miss_rate_locked()
+            bytes_per_slide = self._bytes_per_slide
+
+        # Workers needed to keep up with the queue, with one spare while
+        # recent deadlines are being missed.
+        concurrency = math.ceil(service_s / interval_s) if interval_s > 0 else self.max_concurrency
+        if recent_miss_rate > 0.05:
+            concurrency += 1
+        concurrency = max(self.min_concurrency, min(self.max_concurrency, concurrency))
+
+        # Slides that fall due while one is still being prepared, plus those
+        # kept busy in flight, plus one slack slot.
+        lead = math.ceil(service_s / interval_s) if interval_s > 0 else self.max_depth
+        depth = max(self.min_depth, min(self.max_depth, max(lead, concurrency) + 1))
+
+        memory_limited = False
+        if memory_budget_bytes is not None and bytes_per_slide > 0:
+            affordable = max(self.min_depth, int(memory_budget_bytes) // bytes_per_slide)
+            if affordable < depth:
+                depth = affordable
+                memory_limited = True
+
+        # The cool-down only protects transition smoothness; spend at most a
+        # quarter of the spare time per slide on it.
+        slack_ms = max(0.0, (interval_s - service_s) * 1000.0)
+        delay_ms = min(self.base_post_transition_delay_ms, slack_ms * 0.25)
+
+        plan = PrefetchPlan(
+            depth=int(depth),
+            concurrency=int(concurrency),
+            post_transition_delay_ms=float(delay_ms),
+            service_time_s=float(service_s),
+            slide_interval_s=float(interval_s),
+            memory_limited=memory_limited,
+        )
+        with self._lock:
+            self._last_plan = plan
+        return plan
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    @property
+    def deadline_miss_rate(self) -> float:
+        with self._lock:
+            total = self._deadline_hits + self._deadline_misses
+            return (self._deadline_misses / total) if total else 0.0
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            total = self._deadline_hits + self._deadline_misses
+            latencies = {
+                f"{source}.{stage}_p{int(round(self.quantile * 100))}_ms": round(
+                    (hist.quantile(self.quantile) or 0.0) * 1000.0, 1
+                )
+                for (source, stage), hist in sorted(self._histograms.items())
+            }
+            plan = self._last_plan
+            return {
+                "deadline_hits": self._deadline_hits,
+                "deadline_misses": self._deadline_misses,
+                "deadline_miss_rate": (self._deadline_misses / total) if total else 0.0,
+                "recent_deadline_miss_rate": self._recent_miss_rate_locked(),
+                "deadline_misses_by_display": dict(self._misses_by_display),
+                "depth": plan.depth if plan else 0,
+                "concurrency": plan.concurrency if plan else 0,
+                "post_transition_delay_ms": plan.post_transition_delay_ms if plan else 0.0,
+                "service_time_ms": round(plan.service_time_s * 1000.0, 1) if plan else 0.0,
+                "slide_interval_s": plan.slide_interval_s if plan else 0.0,
+                "memory_limited": bool(plan.memory_limited) if plan else False,
+                "latency": latencies,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _latency_locked(self, source: str, stage: str) -> float:
+        hist = self._histograms.get((source, stage))
+        if hist is not None and hist.samples >= _MIN_SAMPLES:
+            value = hist.quantile(self.quantile)
+            if value is not None:
+                return value
+        if stage == STAGE_SCALE:
+            # Scaling cost does not depend on where the bytes came from.
+            for (other_source, other_stage), other in self._histograms.items():
+                if other_stage == STAGE_SCALE and other.samples >= _MIN_SAMPLES:
+                    value = other.quantile(self.quantile)
+                    if value is not None:
+                        return value
+        return _PRIOR_LATENCY_S[(source, stage)]
+
+    def _service_time_locked(self) -> float:
+        """Tail time to make one upcoming slide display-ready for the current mix."""
+        if self._recent_sources:
+            counts: Dict[str, int] = {}
+            for source in self._recent_sources:
+                counts[source] = counts.get(source, 0) + 1
+        else:
+            counts = {SOURCE_LOCAL: 1}
+        total = float(sum(counts.values()))
+        return sum(
+            (n / total)
+            * (self._latency_locked(source, STAGE_DECODE) + self._latency_locked(source, STAGE_SCALE))
+            for source, n in counts.items()
+        )
+
+    def _consumption_interval_locked(self) -> float:
+        """Seconds between images leaving the queue."""
+        intervals = list(self._display_intervals.values())
+        if not intervals:
+            return 10.0
+        if self._same_image:
+            return min(intervals)
+        return 1.0 / sum(1.0 / i for i in intervals)
+
+    def _recent_miss_rate_locked(self) -> float:
+        if not self._recent_deadlines:
+            return 0.0
+        misses = sum(1 for ready in self._recent_deadlines if not ready)
+        return misses / len(self._recent_deadlines)
+
+    def _is_remote_drive(self, letter: str) -> bool:
+        letter = letter.upper()
+        cached = self._drive_remote.get(letter)
+        if cached is not None:
+            return cached
+        remote = False
+        try:
+            import ctypes
+
+            remote = ctypes.windll.kernel32.GetDriveTypeW(f"{letter}:\\") == _DRIVE_REMOTE
+        except Exception as e:
+            logger.debug("[PREFETCH] Drive type probe failed for %s: %s", letter, e)
+        self._drive_remote[letter] = remote
+        return remote
+
+
+def _norm_root(path: str) -> str:
+    return str(path).replace("\\", "/").lower()
+
+
+def create_prefetch_planner(max_depth: int) -> PrefetchPlanner:
+    """Planner wired to this profile's downloaded-image caches."""
+    cache_roots: List[str] = []
+    try:
+        from core.settings.storage_paths import (
+            get_asset_store_dir,
+            get_imgur_cache_dir,
+            get_rss_cache_dir,
+        )
+
+        cache_roots = [
+            str(get_asset_store_dir()),
+            str(get_rss_cache_dir()),
+            str(get_imgur_cache_dir()),
+        ]
+    except Exception as e:
+        logger.debug("[PREFETCH] Cache roots unavailable for planner: %s", e)
+    return PrefetchPlanner(max_depth=max(1, int(max_depth)), rss_cache_roots=cache_roots)
@@ -0,0 +1,407 @@
+"""
+Disk-backed L2 tier for display-ready scaled images.
+
+Every screensaver activation starts with an empty :class:`ImageCache`, so the
+first slides of a session pay the full decode + resample cost again.  This
+tier persists the scaled derivatives (``"<path>|scaled:..."`` keys) across
+sessions.
+
+Layout under ``<app_data>/cache/scaled/``::
+
+    index.bin        fixed-slot index, mmap'd (digest, bytes, last-use clock)
+    <digest>.px      header + raw scanlines exactly as the QImage holds them
+
+Entries are addressed by a SHA-1 of the scaled cache key (which already
+carries target size, display mode, DPR and quality flags) plus the source
+file's ``st_mtime_ns`` and ``st_size``; an edited or replaced source simply
+misses and its stale entry ages out.  Loading is a header read followed by
+one ``readinto`` straight into a freshly allocated QImage's buffer — no
+decode.  Eviction is least-recently-used against a byte budget, with the use
+clock persisted in the index so recency survives restarts.
+
+The tier assumes one engine per profile directory; a torn or foreign entry
+is detected on load, dropped, and counted as a failure rather than raised.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import mmap
+import os
+from pathlib import Path
+import struct
+import threading
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from PySide6.QtGui import QImage
+
+from core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+SCALED_KEY_MARKER = "|scaled:"
+
+_INDEX_FILE = "index.bin"
+_ENTRY_SUFFIX = ".px"
+_INDEX_MAGIC = b"SRPSL2IX"
+_ENTRY_MAGIC = b"SRL2"
+_FORMAT_VERSION = 1
+
+# magic, version, slot count, use clock
+_INDEX_HEADER = struct.Struct("<8sIIQ")
+# digest, in-use flag, payload bytes, last-use clock
+_INDEX_RECORD = struct.Struct("<20sIQQ")
+# magic, version, reserved, digest, width, height, bytes per line, QImage format
+_ENTRY_HEADER = struct.Struct("<4sHH20sIIII")
+
+DEFAULT_INDEX_SLOTS = 4096
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def entry_digest(cache_key: str) -> Optional[bytes]:
+    """Return the on-disk identity of a scaled *cache_key*, or None.
+
+    None means the key is not a scaled key or its source cannot be stat'ed.
+    """
+    source, marker, _ = str(cache_key).partition(SCALED_KEY_MARKER)
+    if not marker or not source:
+        return None
+    try:
+        st = os.stat(source)
+    except OSError:
+        return None
+    material = f"{cache_key}|{st.st_mtime_ns}|{st.st_size}".encode("utf-8", "surrogatepass")
+    return hashlib.sha1(material).digest()
+
+
+class ScaledImageDiskCache:
+    """Byte-budgeted persistent store of scaled QImages.
+
+    ``load``/``store`` are safe to call from any thread.  ``store_async``
+    hands the write to *submit* (normally a LOW-priority IO task) so
+    producers never wait on disk.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        index_slots: int = DEFAULT_INDEX_SLOTS,
+        submit: Optional[Callable[[Callable[[], None]], Any]] = None,
+    ) -> None:
+        self._directory = Path(directory) if directory is not None else None
+        self.max_bytes = max(0, int(max_bytes))
+        self._slots = max(1, int(index_slots))
+        self._submit = submit
+        self._lock = threading.Lock()
+        self._opened = False
+        self._disabled = False
+        self._index_file = None
+        self._index_map: Optional[mmap.mmap] = None
+        self._clock = 0
+        # digest -> [slot, nbytes]; ordered least- to most-recently used
+        self._entries: "OrderedDict[bytes, list[int]]" = OrderedDict()
+        self._free_slots: list[int] = []
+        self._total_bytes = 0
+        self._pending_keys: set[str] = set()
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "failures": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def load(self, cache_key: str) -> Optional[QImage]:
+        """Return the stored image for *cache_key*, or None on a miss."""
+        digest = entry_digest(cache_key)
+        with self._lock:
+            if digest is None or not self._ensure_open_locked():
+                self._stats["misses"] += 1
+                return None
+            entry = self._entries.get(digest)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._touch_locked(digest, entry)
+            nbytes = entry[1]
+
+        image = self._read_entry(digest, nbytes)
+        with self._lock:
+            if image is None:
+                self._stats["failures"] += 1
+                self._stats["misses"] += 1
+                self._drop_locked(digest)
+                return None
+            self._stats["hits"] += 1
+        return image
+
+    def store(self, cache_key: str, image: QImage) -> bool:
+        """Persist *image* under *cache_key*; returns True when written."""
+        if image is None or image.isNull():
+            return False
+        digest = entry_digest(cache_key)
+        if digest is None:
+            return False
+        nbytes = int(image.sizeInBytes())
+        with self._lock:
+            if not self._ensure_open_locked() or nbytes <= 0 or nbytes > self.max_bytes:
+                return False
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._touch_locked(digest, entry)
+                return False
+
+        path = self._entry_path(digest)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            header = _ENTRY_HEADER.pack(
+                _ENTRY_MAGIC,
+                _FORMAT_VERSION,
+                0,
+                digest,
+                int(image.width()),
+                int(image.height()),
+                int(image.bytesPerLine()),
+                int(image.format().value),
+            )
+            with open(tmp_path, "wb") as fh:
+                fh.write(header)
+                fh.write(image.constBits())
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as exc:
+            logger.debug("[CACHE] L2 write failed for %s: %s", cache_key, exc)
+            self._unlink(tmp_path)
+            with self._lock:
+                self._stats["failures"] += 1
+            return False
+
+        with self._lock:
+            if digest in self._entries:
+                return False
+            if not self._free_slots:
+                self._evict_oldest_locked()
+            slot = self._free_slots.pop()
+            self._clock += 1
+            self._write_record_locked(slot, digest, nbytes, self._clock)
+            self._entries[digest] = [slot, nbytes]
+            self._total_bytes += nbytes
+            self._stats["writes"] += 1
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                self._evict_oldest_locked()
+        return True
+
+    def store_async(self, cache_key: str, image: QImage) -> None:
+        """Queue ``store`` on the injected executor (inline without one)."""
+        if self._submit is None:
+            self.store(cache_key, image)
+            return
+        with self._lock:
+            if self._disabled or cache_key in self._pending_keys:
+                return
+            self._pending_keys.add(cache_key)
+
+        def _run() -> None:
+            try:
+                self.store(cache_key, image)
+            finally:
+                with self._lock:
+                    self._pending_keys.discard(cache_key)
+
+        try:
+            self._submit(_run)
+        except Exception as exc:
+            logger.debug("[CACHE] L2 write submission failed: %s", exc)
+            with self._lock:
+                self._pending_keys.discard(cache_key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate_percent": (self._stats["hits"] / lookups * 100.0) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "pending_writes": len(self._pending_keys),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._index_map is not None:
+                try:
+                    self._index_map.flush()
+                    self._index_map.close()
+                except (OSError, ValueError) as exc:
+                    logger.debug("[CACHE] L2 index close failed: %s", exc)
+            if self._index_file is not None:
+                try:
+                    self._index_file.close()
+                except OSError:
+                    pass
+            self._index_map = None
+            self._index_file = None
+            self._entries.clear()
+            self._free_slots.clear()
+            self._total_bytes = 0
+            self._opened = False
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _ensure_open_locked(self) -> bool:
+        """Open (or rebuild) the index on first use; False when unusable."""
+        if self._opened:
+            return True
+        if self._disabled:
+            return False
+        try:
+            self._open_locked()
+        except (OSError, ValueError) as exc:
+            logger.warning("[CACHE] Disk image cache unavailable: %s", exc)
+            self._disabled = True
+            return False
+        self._opened = True
+        return True
+
+    def _open_locked(self) -> None:
+        if self._directory is None:
+            from core.settings.storage_paths import get_scaled_image_cache_dir
+
+            self._directory = get_scaled_image_cache_dir()
+        self._directory.mkdir(parents=True, exist_ok=True)
+        index_path = self._directory / _INDEX_FILE
+        size = _INDEX_HEADER.size + self._slots * _INDEX_RECORD.size
+
+        fh = open(index_path, "r+b" if index_path.exists() else "w+b")
+        try:
+            valid = False
+            fh.seek(0, os.SEEK_END)
+            if fh.tell() == size:
+                fh.seek(0)
+                magic, version, slots, _clock = _INDEX_HEADER.unpack(fh.read(_INDEX_HEADER.size))
+                valid = magic == _INDEX_MAGIC and version == _FORMAT_VERSION and slots == self._slots
+            if not valid:
+                fh.seek(0)
+                fh.truncate(0)
+                fh.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _FORMAT_VERSION, self._slots, 0))
+                fh.write(b"\0" * (size - _INDEX_HEADER.size))
+                fh.flush()
+            index_map = mmap.mmap(fh.fileno(), size, access=mmap.ACCESS_WRITE)
+        except BaseException:
+            fh.close()
+            raise
+        self._index_file = fh
+        self._index_map = index_map
+
+        self._clock = _INDEX_HEADER.unpack_from(index_map, 0)[3]
+        on_disk = {
+            entry.name
+            for entry in os.scandir(self._directory)
+            if entry.name != _INDEX_FILE
+        }
+        live = []
+        for slot in range(self._slots):
+            digest, used, nbytes, last_used = _INDEX_RECORD.unpack_from(index_map, self._record_offset(slot))
+            if used and digest.hex() + _ENTRY_SUFFIX in on_disk:
+                live.append((last_used, digest, slot, nbytes))
+            else:
+                if used:
+                    self._clear_record_locked(slot)
+                self._free_slots.append(slot)
+        live.sort()
+        for _last_used, digest, slot, nbytes in live:
+            self._entries[digest] = [slot, nbytes]
+            self._total_bytes += nbytes
+        self._free_slots.reverse()
+
+        # Files the index does not know about (torn writes, a rebuilt index)
+        known = {digest.hex() + _ENTRY_SUFFIX for digest in self._entries}
+        for name in on_disk - known:
+            self._unlink(self._directory / name)
+        while self._total_bytes > self.max_bytes and self._entries:
+            self._evict_oldest_locked()
+        logger.info(
+            "[CACHE] Disk image cache opened entries=%d bytes=%.1fMB budget=%.0fMB",
+            len(self._entries),
+            self._total_bytes / (1024 * 1024),
+            self.max_bytes / (1024 * 1024),
+        )
+
+    @staticmethod
+    def _record_offset(slot: int) -> int:
+        return _INDEX_HEADER.size + slot * _INDEX_RECORD.size
+
+    def _write_record_locked(self, slot: int, digest: bytes, nbytes: int, last_used: int) -> None:
+        _INDEX_RECORD.pack_into(self._index_map, self._record_offset(slot), digest, 1, nbytes, last_used)
+        _INDEX_HEADER.pack_into(self._index_map, 0, _INDEX_MAGIC, _FORMAT_VERSION, self._slots, self._clock)
+
+    def _clear_record_locked(self, slot: int) -> None:
+        _INDEX_RECORD.pack_into(self._index_map, self._record_offset(slot), b"\0" * 20, 0, 0, 0)
+
+    def _touch_locked(self, digest: bytes, entry: list[int]) -> None:
+        self._clock += 1
+        self._entries.move_to_end(digest)
+        self._write_record_locked(entry[0], digest, entry[1], self._clock)
+
+    def _drop_locked(self, digest: bytes) -> None:
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return
+        slot, nbytes = entry
+        self._clear_record_locked(slot)
+        self._free_slots.append(slot)
+        self._total_bytes -= nbytes
+        self._unlink(self._entry_path(digest))
+
+    def _evict_oldest_locked(self) -> None:
+        if not self._entries:
+            return
+        digest = next(iter(self._entries))
+        self._drop_locked(digest)
+        self._stats["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def _entry_path(self, digest: bytes) -> Path:
+        return self._directory / (digest.hex() + _ENTRY_SUFFIX)
+
+    def _read_entry(self, digest: bytes, nbytes: int) -> Optional[QImage]:
+        try:
+            with open(self._entry_path(digest), "rb") as fh:
+                header = fh.read(_ENTRY_HEADER.size)
+                if len(header) != _ENTRY_HEADER.size:
+                    return None
+                magic, version, _reserved, stored_digest, width, height, bpl, fmt = _ENTRY_HEADER.unpack(header)
+                if magic != _ENTRY_MAGIC or version != _FORMAT_VERSION or stored_digest != digest:
+                    return None
+                image = QImage(width, height, QImage.Format(fmt))
+                if (
+                    image.isNull()
+                    or image.bytesPerLine() != bpl
+                    or image.sizeInBytes() != nbytes
+                ):
+                    return None
+                if fh.readinto(image.bits()) != nbytes:
+                    return None
+                return image
+        except (OSError, ValueError) as exc:
+            logger.debug("[CACHE] L2 read failed for %s: %s", digest.hex(), exc)
+            return None
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -1,8 +1,22 @@
-"""Overlay widgets for screensaver."""
+"""Overlay widgets for screensaver.
 
-from .clock_widget import ClockWidget, TimeFormat, ClockPosition, PYTZ_AVAILABLE
-from .weather_widget import WeatherWidget, WeatherPosition
-from .media_widget import MediaWidget, MediaPosition
+Widget classes are resolved on first attribute access so that importing a
+helper such as ``widgets.shadow_utils`` (done on the screensaver path) does
+not pull in every widget family.
+"""
+
+from importlib import import_module
+
+_WIDGET_EXPORTS = {
+    'ClockWidget': '.clock_widget',
+    'TimeFormat': '.clock_widget',
+    'ClockPosition': '.clock_widget',
+    'PYTZ_AVAILABLE': '.clock_widget',
+    'WeatherWidget': '.weather_widget',
+    'WeatherPosition': '.weather_widget',
+    'MediaWidget': '.media_widget',
+    'MediaPosition': '.media_widget',
+}
 
 __all__ = [
     'ClockWidget',
@@ -14,3 +28,12 @@ __all__ = [
     'MediaWidget',
     'MediaPosition',
 ]
+
+
+def __getattr__(name: str):
+    module_name = _WIDGET_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
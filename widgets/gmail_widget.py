@@ -213,6 +213,10 @@ class GmailWidget(BaseOverlayWidget):
 
         self._update_timer_handle: Optional[OverlayTimerHandle] = None
         self._update_timer: Optional[QTimer] = None
+        # IMAP IDLE push replaces the polling timer while it is running.
+        self._idle_watcher: Optional[Any] = None
+        self._idle_watcher_client: Optional[Any] = None
+        self._idle_unsupported_client: Optional[Any] = None
         self._fetch_in_progress = False
         self._fetch_lock = threading.Lock()
         self._fetch_generation = 0
@@ -437,6 +441,7 @@ class GmailWidget(BaseOverlayWidget):
         logger.debug("[LIFECYCLE] GmailWidget activated")
 
     def _deactivate_impl(self) -> None:
+        self._stop_push_updates()
         self._stop_polling_timers(delete_qtimers=True)
         self._reset_deferred_runtime_state(delete_qtimers=False)
         self._set_refreshing(False)
@@ -479,6 +484,7 @@ class GmailWidget(BaseOverlayWidget):
         self._backend_ready = False
         self._pending_fetch_after_backend_ready = False
         # Explicit timer cleanup for safety (also covered by _cleanup_impl → _deactivate_impl)
+        self._stop_push_updates()
         self._stop_polling_timers(delete_qtimers=True)
         self._reset_deferred_runtime_state(delete_qtimers=True)
         self._set_refreshing(False)
@@ -525,6 +531,7 @@ class GmailWidget(BaseOverlayWidget):
             self._gmail_client = (
                 self._backend.client if self._backend.is_authenticated else None
             )
+            self._sync_push_updates()
             if self._pending_fetch_after_backend_ready:
                 self._pending_fetch_after_backend_ready = False
                 self._fetch_emails(defer_for_transition=False)
@@ -564,11 +571,14 @@ class GmailWidget(BaseOverlayWidget):
         self._gmail_client = (
             self._backend.client if self._backend.is_authenticated else None
         )
+        self._sync_push_updates()
         if self._pending_fetch_after_backend_ready:
             self._pending_fetch_after_backend_ready = False
             self._fetch_emails(defer_for_transition=False)
 
     def _schedule_timer(self) -> None:
+        if self._update_timer_handle is not None or self._update_timer is not None:
+            return
         interval_ms = int(self._refresh_interval.total_seconds() * 1000)
         try:
             self._update_timer_handle = create_overlay_timer(
@@ -581,6 +591,73 @@ class GmailWidget(BaseOverlayWidget):
             self._register_resource(self._update_timer, "gmail_update_timer_fallback")
             self._update_timer.start(interval_ms)
 
+    def _sync_push_updates(self) -> None:
+        """Drive refreshes from IMAP IDLE when the active client supports it.
+
+        The watcher is bound to one client instance; a credential or mode
+        change swaps the client, so the watcher is rebuilt (or dropped in
+        favour of the polling timer for OAuth).
+        """
+        if self._cancelled or not automatic_service_updates_enabled():
+            return
+        client = self._gmail_client
+        if self._idle_watcher is not None and self._idle_watcher_client is client:
+            return
+        had_watcher = self._idle_watcher is not None
+        self._stop_push_updates()
+        factory = getattr(client, "create_idle_watcher", None)
+        if not callable(factory) or client is self._idle_unsupported_client:
+            if had_watcher:
+                self._schedule_timer()
+            return
+        owner_ref = weakref.ref(self)
+
+        def _on_change() -> None:
+            owner = owner_ref()
+            if owner is not None:
+                ThreadManager.run_on_ui_thread(owner._on_push_change, client)
+
+        def _on_unavailable() -> None:
+            owner = owner_ref()
+            if owner is not None:
+                ThreadManager.run_on_ui_thread(owner._on_push_unavailable, client)
+
+        try:
+            watcher = factory(_on_change, on_unavailable=_on_unavailable)
+            if not watcher.start():
+                return
+        except Exception as exc:
+            logger.warning("[GMAIL] IMAP IDLE unavailable, keeping polling: %s", exc)
+            return
+        self._idle_watcher = watcher
+        self._idle_watcher_client = client
+        self._stop_polling_timers(delete_qtimers=True)
+        logger.info("[GMAIL] Mailbox updates pushed via IMAP IDLE; polling timer stopped")
+
+    def _stop_push_updates(self) -> None:
+        watcher = self._idle_watcher
+        self._idle_watcher = None
+        self._idle_watcher_client = None
+        if watcher is not None:
+            try:
+                watcher.stop()
+            except Exception as exc:
+                logger.debug("[GMAIL] IDLE watcher stop suppressed: %s", exc)
+
+    def _on_push_change(self, client: Any) -> None:
+        if not Shiboken.isValid(self) or self._cancelled or client is not self._idle_watcher_client:
+            return
+        self._fetch_emails()
+
+    def _on_push_unavailable(self, client: Any) -> None:
+        if not Shiboken.isValid(self) or self._cancelled or client is not self._idle_watcher_client:
+            return
+        self._idle_watcher = None
+        self._idle_watcher_client = None
+        self._idle_unsupported_client = client
+        if automatic_service_updates_enabled():
+            self._schedule_timer()
+
     def _fetch_emails(self, *, defer_for_transition: bool = True) -> bool:
         start_time = time.perf_counter()
         if defer_for_transition and self._defer_refresh_if_transition():
@@ -606,6 +683,7 @@ class GmailWidget(BaseOverlayWidget):
             self._set_refreshing(True)
             # Re-acquire client from backend each fetch in case mode/credentials changed
             self._gmail_client = self._backend.client if self._backend.is_authenticated else None
+            self._sync_push_updates()
             if self._gmail_client is None:
                 end_fetch_guard(self, lock_attr="_fetch_lock")
                 self._set_refreshing(False)
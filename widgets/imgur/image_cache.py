@@ -3,9 +3,13 @@
 Manages disk caching of downloaded Imgur images with LRU eviction.
 Provides thread-safe access to cached images.
 
+Images and their metadata live in the shared content-addressed asset store
+(namespace ``cache/imgur``); a legacy ``cache_metadata.json`` plus loose
+image files are adopted into it once and then removed.
+
 Thread Safety:
 - All cache operations use threading.Lock()
-- Cache metadata stored in JSON for persistence
+- The asset store index (SQLite) provides persistence
 """
 from __future__ import annotations
 
@@ -14,13 +18,13 @@ import threading
 import time
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtGui import QPixmap, QImage
 from PySide6.QtCore import Qt
 
 from core.logging.logger import get_logger
+from core.resources.asset_store import AssetRecord, namespace_for_directory
 from core.settings.storage_paths import get_imgur_cache_dir
 
 logger = get_logger(__name__)
@@ -29,7 +33,7 @@ logger = get_logger(__name__)
 DEFAULT_CACHE_DIR = get_imgur_cache_dir()
 MAX_CACHE_SIZE_MB = 100
 MAX_CACHE_ITEMS = 500
-CACHE_METADATA_FILE = "cache_metadata.json"
+CACHE_METADATA_FILE = "cache_metadata.json"  # legacy index, migrated on load
 
 # Image processing
 MAX_IMAGE_DIMENSION = 1024  # Max dimension for cached images
@@ -88,12 +92,13 @@ class ImgurImageCache:
         self._max_items = max_items
         self._lock = threading.Lock()
         
-        # In-memory cache metadata
+        # In-memory view of the asset namespace
         self._cache: Dict[str, CachedImage] = {}
         self._total_size_bytes: int = 0
         
         # Ensure cache directory exists
         self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._assets = namespace_for_directory(self._cache_dir)
         
         # Load existing metadata
         self._load_metadata()
@@ -107,142 +112,120 @@ class ImgurImageCache:
         return self._cache_dir
     
     def _metadata_path(self) -> Path:
-        """Get path to metadata file."""
+        """Get path to the legacy metadata file."""
         return self._cache_dir / CACHE_METADATA_FILE
     
     def _load_metadata(self) -> None:
-        """Load cache metadata from disk, rebuilding from files if needed."""
-        meta_path = self._metadata_path()
+        """Load cache entries from the asset index, migrating legacy files first."""
+        self._migrate_legacy_files()
         
+        self._cache.clear()
+        self._total_size_bytes = 0
+        for record in self._assets.entries():
+            cached = self._from_record(record)
+            self._cache[cached.id] = cached
+            self._total_size_bytes += cached.size_bytes
+        
+        logger.debug("[IMGUR_CACHE] Loaded %d cached items from index", len(self._cache))
+    
+    def _migrate_legacy_files(self) -> None:
+        """Adopt a pre-asset-store cache directory (JSON index + loose images)."""
+        meta_path = self._metadata_path()
+        legacy: Dict[str, dict] = {}
         if meta_path.exists():
             try:
                 with open(meta_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
-                
-                self._total_size_bytes = 0
                 for item_data in data.get("items", []):
-                    try:
-                        cached = CachedImage.from_dict(item_data)
-                        # Verify file still exists
-                        if Path(cached.path).exists():
-                            self._cache[cached.id] = cached
-                            self._total_size_bytes += cached.size_bytes
-                    except Exception as e:
-                        logger.debug("[IMGUR_CACHE] Failed to load cache item: %s", e)
-                
-                logger.debug("[IMGUR_CACHE] Loaded %d cached items from metadata", len(self._cache))
-                return
-                
+                    if isinstance(item_data, dict) and item_data.get("id"):
+                        legacy[str(item_data["id"])] = item_data
             except Exception as e:
-                logger.warning("[IMGUR_CACHE] Failed to load metadata: %s", e)
+                logger.warning("[IMGUR_CACHE] Failed to load legacy metadata: %s", e)
         
-        # Rebuild from existing files if metadata missing/corrupt
-        self._rebuild_from_files()
-    
-    def _rebuild_from_files(self) -> None:
-        """Rebuild cache metadata from existing image files in cache directory."""
-        if not self._cache_dir.exists():
-            return
+        def _meta_for(path: Path) -> Dict[str, Any]:
+            item = legacy.get(path.stem)
+            if item is not None:
+                return {
+                    "width": int(item.get("width", 0)),
+                    "height": int(item.get("height", 0)),
+                    "download_time": float(item.get("download_time", 0.0)),
+                    "is_animated": bool(item.get("is_animated", False)),
+                    "gallery_url": str(item.get("gallery_url", "")),
+                }
+            # Untracked file: probe dimensions as the old rebuild did
+            width, height = 160, 160
+            try:
+                img = QImage(str(path))
+                if not img.isNull():
+                    width = img.width()
+                    height = img.height()
+            except Exception:
+                logger.debug("[IMGUR_CACHE] QImage probe failed for %s", path, exc_info=True)
+            return {
+                "width": width,
+                "height": height,
+                "download_time": path.stat().st_mtime,
+                "is_animated": False,
+                "gallery_url": f"https://imgur.com/gallery/{path.stem}",
+            }
         
-        rebuilt_count = 0
-        for path in self._cache_dir.glob("*.jpg"):
+        def _accept(path: Path) -> bool:
+            return path.stat().st_size >= 100  # Skip corrupt/empty files
+        
+        adopted = self._assets.adopt_legacy_files(meta_for=_meta_for, accept=_accept)
+        if adopted > 0:
+            logger.info("[IMGUR_CACHE] Migrated %d items into the asset store", adopted)
+        if meta_path.exists():
             try:
-                image_id = path.stem
-                if image_id in self._cache:
-                    continue
-                
-                size_bytes = path.stat().st_size
-                if size_bytes < 100:  # Skip corrupt/empty files
-                    continue
-                
-                # Try to get dimensions from image
-                width, height = 160, 160
-                try:
-                    img = QImage(str(path))
-                    if not img.isNull():
-                        width = img.width()
-                        height = img.height()
-                except Exception:
-                    logger.debug("[IMGUR_CACHE] QImage probe failed for %s", path, exc_info=True)
-                
-                now = time.time()
-                cached = CachedImage(
-                    id=image_id,
-                    path=str(path),
-                    size_bytes=size_bytes,
-                    width=width,
-                    height=height,
-                    last_accessed=now,
-                    download_time=path.stat().st_mtime,
-                    is_animated=False,
-                    gallery_url=f"https://imgur.com/gallery/{image_id}",
-                )
-                
-                self._cache[image_id] = cached
-                self._total_size_bytes += size_bytes
-                rebuilt_count += 1
-                
+                meta_path.unlink()
             except Exception as e:
-                logger.debug("[IMGUR_CACHE] Failed to rebuild from %s: %s", path.name, e)
-        
-        if rebuilt_count > 0:
-            logger.info("[IMGUR_CACHE] Rebuilt %d items from existing files", rebuilt_count)
-            self._save_metadata()
-    
-    def _save_metadata(self) -> None:
-        """Save cache metadata to disk."""
-        try:
-            data = {
-                "version": 1,
-                "items": [item.to_dict() for item in self._cache.values()],
-                "total_size_bytes": self._total_size_bytes,
-                "saved_at": datetime.now().isoformat(),
-            }
-            
-            meta_path = self._metadata_path()
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-                
-        except Exception as e:
-            logger.warning("[IMGUR_CACHE] Failed to save metadata: %s", e)
+                logger.debug("[IMGUR_CACHE] Failed to remove legacy metadata: %s", e)
     
-    def _get_image_path(self, image_id: str, extension: str = "jpg") -> Path:
-        """Get the path for a cached image."""
-        return self._cache_dir / f"{image_id}.{extension}"
+    @staticmethod
+    def _from_record(record: AssetRecord) -> CachedImage:
+        meta = record.meta or {}
+        return CachedImage(
+            id=record.key,
+            path=str(record.path),
+            size_bytes=record.size,
+            width=int(meta.get("width", 0)),
+            height=int(meta.get("height", 0)),
+            last_accessed=record.last_used,
+            download_time=float(meta.get("download_time") or record.created),
+            is_animated=bool(meta.get("is_animated", False)),
+            gallery_url=str(meta.get("gallery_url", "")),
+        )
     
+    def _staging_path(self, image_id: str, extension: str = "jpg") -> Path:
+        """Get the temporary path an image is processed in before storing."""
+        # Hidden name: never mistaken for a legacy file awaiting adoption.
+        return self._cache_dir / f".incoming.{image_id}.{extension}"
     
     def _evict_lru(self, needed_bytes: int = 0) -> None:
         """Evict least recently used items to make space.
         
+        The shared store also enforces the app-wide byte budget on every put.
+        
         Args:
             needed_bytes: Additional bytes needed for new item
         """
-        # Sort by last_accessed (oldest first)
-        items = sorted(self._cache.values(), key=lambda x: x.last_accessed)
-        
         target_size = self._max_size_bytes - needed_bytes
-        evicted_count = 0
+        keep = 0
+        kept_bytes = 0
+        records = self._assets.entries()  # most recently used first
+        for record in records:
+            if keep >= self._max_items - 1 or kept_bytes + record.size > target_size:
+                break
+            kept_bytes += record.size
+            keep += 1
+        if keep >= len(records):
+            return
         
-        while (self._total_size_bytes > target_size or len(self._cache) >= self._max_items) and items:
-            item = items.pop(0)
-            
-            # Remove file and thumbnail
-            try:
-                path = Path(item.path)
-                if path.exists():
-                    path.unlink()
-                # Also delete thumbnail if exists
-                if item.thumbnail_path:
-                    thumb_path = Path(item.thumbnail_path)
-                    if thumb_path.exists():
-                        thumb_path.unlink()
-            except Exception as e:
-                logger.debug("[IMGUR_CACHE] Failed to delete %s: %s", item.id, e)
-            
-            # Remove from cache
-            self._total_size_bytes -= item.size_bytes
-            del self._cache[item.id]
-            evicted_count += 1
+        evicted_count = self._assets.trim(keep)
+        for record in records[keep:]:
+            cached = self._cache.pop(record.key, None)
+            if cached is not None:
+                self._total_size_bytes -= cached.size_bytes
         
         if evicted_count > 0:
             logger.debug("[IMGUR_CACHE] Evicted %d items (LRU)", evicted_count)
@@ -266,18 +249,18 @@ class ImgurImageCache:
                 return None
             
             cached = self._cache[image_id]
-            path = Path(cached.path)
+            record = self._assets.get(image_id)
             
-            if not path.exists():
-                # File was deleted externally
+            if record is None:
+                # Evicted by the shared budget or deleted externally
                 del self._cache[image_id]
                 self._total_size_bytes -= cached.size_bytes
                 return None
             
             # Update access time
-            cached.last_accessed = time.time()
+            cached.last_accessed = record.last_used
             
-            return (path, cached)
+            return (record.path, cached)
     
     def get_pixmap(self, image_id: str, max_size: Optional[Tuple[int, int]] = None, use_thumbnail: bool = True) -> Optional[QPixmap]:
         """Get a cached image as QPixmap.
@@ -343,14 +326,12 @@ class ImgurImageCache:
                 return self._cache[image_id]
             
             # Evict if needed
-            if len(image_data) + self._total_size_bytes > self._max_size_bytes:
+            if (len(image_data) + self._total_size_bytes > self._max_size_bytes
+                    or len(self._cache) >= self._max_items):
                 self._evict_lru(len(image_data))
             
-            if len(self._cache) >= self._max_items:
-                self._evict_lru()
-            
-            # Save to disk
-            path = self._get_image_path(image_id, extension)
+            # Process in a staging file, then move it into the store
+            path = self._staging_path(image_id, extension)
             
             try:
                 # Handle animated GIFs - extract first frame
@@ -366,7 +347,7 @@ class ImgurImageCache:
                         if pil_img.mode != 'RGB':
                             pil_img = pil_img.convert('RGB')
                         # Save as JPEG for efficiency
-                        path = self._get_image_path(image_id, "jpg")
+                        path = self._staging_path(image_id, "jpg")
                         pil_img.save(str(path), 'JPEG', quality=85)
                         extension = "jpg"
                         logger.debug("[IMGUR_CACHE] Converted GIF %s to first frame JPEG", image_id)
@@ -399,31 +380,26 @@ class ImgurImageCache:
                 except Exception as e:
                     logger.debug("[IMGUR_CACHE] Failed to process image dimensions: %s", e)
                 
-                # Get final file size
-                size_bytes = path.stat().st_size
-                
-                # Create metadata (no thumbnail_path)
                 now = time.time()
-                cached = CachedImage(
-                    id=image_id,
-                    path=str(path),
-                    size_bytes=size_bytes,
-                    width=width,
-                    height=height,
-                    last_accessed=now,
-                    download_time=now,
-                    is_animated=is_animated,
-                    gallery_url=gallery_url,
+                record = self._assets.put_file(
+                    image_id,
+                    path,
+                    ext=extension,
+                    meta={
+                        "width": width,
+                        "height": height,
+                        "download_time": now,
+                        "is_animated": is_animated,
+                        "gallery_url": gallery_url,
+                    },
                 )
+                cached = self._from_record(record)
                 
                 self._cache[image_id] = cached
-                self._total_size_bytes += size_bytes
-                
-                # Save metadata after every cache operation for persistence
-                self._save_metadata()
+                self._total_size_bytes += cached.size_bytes
                 
                 logger.debug("[IMGUR_CACHE] Cached %s (%dx%d, %d KB)",
-                           image_id, width, height, size_bytes // 1024)
+                           image_id, width, height, cached.size_bytes // 1024)
                 
                 return cached
                 
@@ -459,34 +435,26 @@ class ImgurImageCache:
     def clear(self) -> None:
         """Clear all cached images."""
         with self._lock:
-            # Delete all files
-            for cached in self._cache.values():
-                try:
-                    path = Path(cached.path)
-                    if path.exists():
-                        path.unlink()
-                except Exception as e:
-                    logger.debug("[IMGUR_CACHE] Failed to delete %s: %s", cached.id, e)
+            try:
+                self._assets.clear()
+            except Exception as e:
+                logger.debug("[IMGUR_CACHE] Failed to clear asset namespace: %s", e)
             
             self._cache.clear()
             self._total_size_bytes = 0
             
-            # Delete metadata
-            try:
-                meta_path = self._metadata_path()
-                if meta_path.exists():
-                    meta_path.unlink()
-            except Exception:
-                pass
-            
             logger.info("[IMGUR_CACHE] Cache cleared")
     
     def save(self) -> None:
-        """Save cache metadata to disk."""
+        """Persist pending access times to the asset index."""
         with self._lock:
-            self._save_metadata()
+            try:
+                self._assets.store.flush()
+            except Exception as e:
+                logger.warning("[IMGUR_CACHE] Failed to save metadata: %s", e)
     
     def cleanup(self) -> None:
         """Clean up and save cache before shutdown."""
         self.save()
+        self._assets.close()
         logger.debug("[IMGUR_CACHE] Cleanup complete")
@@ -23,6 +23,7 @@ from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen, QPixmap, QTextDo
 from shiboken6 import Shiboken
 
 from core.logging.logger import get_logger, is_verbose_logging
+from core.resources.manager import ResourceManager
 from core.settings.shadow_tuning import (
     HEADER_SHADOW_TUNING,
     ICON_SHADOW_TUNING,
@@ -720,9 +721,15 @@ def make_alpha_shadow_pixmap(
         source_dpr = 1.0
     logical_w = max(1, int(round(source.width() / source_dpr)))
     logical_h = max(1, int(round(source.height() / source_dpr)))
-    pixmap = QPixmap(max(1, int(logical_w * scale_dpr)), max(1, int(logical_h * scale_dpr)))
-    pixmap.setDevicePixelRatio(scale_dpr)
+    pixel_w = max(1, int(logical_w * scale_dpr))
+    pixel_h = max(1, int(logical_h * scale_dpr))
+    manager = ResourceManager.get_app_shared()
+    pixmap = manager.acquire_pixmap(pixel_w, pixel_h) if manager is not None else None
+    if pixmap is None:
+        pixmap = QPixmap(pixel_w, pixel_h)
+    # Pooled canvases still hold the previous shadow; always start clear.
     pixmap.fill(Qt.GlobalColor.transparent)
+    pixmap.setDevicePixelRatio(scale_dpr)
 
     painter = QPainter(pixmap)
     try:
@@ -736,6 +743,15 @@ def make_alpha_shadow_pixmap(
     return pixmap
 
 
+def release_shadow_pixmap(pixmap: Optional[QPixmap]) -> None:
+    """Return a superseded shadow from ``make_alpha_shadow_pixmap`` to the pool."""
+    if pixmap is None or pixmap.isNull():
+        return
+    manager = ResourceManager.get_app_shared()
+    if manager is not None:
+        manager.release_pixmap(pixmap)
+
+
 def draw_pixmap_drop_shadow(
     painter: QPainter,
     target: QRect,
@@ -783,6 +799,7 @@ def draw_pixmap_drop_shadow(
     cached_key = getattr(owner, f"{cache_attr}_key", None)
     shadow = getattr(owner, cache_attr, None)
     if cached_key != cache_key or not isinstance(shadow, QPixmap) or shadow.isNull():
+        previous = shadow
         scaled = source.scaled(
             max(1, int(round(target_w * dpr))),
             max(1, int(round(target_h * dpr))),
@@ -798,6 +815,8 @@ def draw_pixmap_drop_shadow(
             dpr=dpr,
             shadow_color=QColor(0, 0, 0, alpha),
         )
+        if isinstance(previous, QPixmap):
+            release_shadow_pixmap(previous)
         setattr(owner, cache_attr, shadow)
         setattr(owner, f"{cache_attr}_key", cache_key)
 
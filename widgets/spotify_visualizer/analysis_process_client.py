@@ -0,0 +1,300 @@
+"""UI-side endpoint of the out-of-process visualizer audio analysis.
+
+``AudioAnalysisProcessClient`` owns the shared-memory PCM ring and frame
+triple buffer used by ``core.process.workers.audio_worker``.  The beat
+engine pushes each consumed PCM block and picks up the newest analysis
+frame on its next tick; no per-frame traffic touches the worker queues.
+
+DSP configuration still lives on the UI-side ``SpotifyVisualizerAudioWorker``
+(settings and presets keep writing its attributes).  Before each PCM block
+the client diffs those config attributes against what it last sent and
+forwards changes, plus explicit reset calls, as ring control records, so the
+worker applies them in order with the audio.
+
+If the worker stops answering the client detaches and the engine falls back
+to the in-process compute lane.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from core.logging.logger import get_logger
+from core.process import MessageType, ProcessSupervisor, WorkerType
+from core.process.workers.audio_worker import (
+    ANALYSIS_FRAME_BYTES,
+    AUDIO_RING_SLOT_BYTES,
+    AUDIO_RING_SLOTS,
+    CONTROL_CALL,
+    CONTROL_CONFIG,
+    FORWARDED_CALLS,
+    AnalysisFrame,
+    pack_control_record,
+    pack_pcm_record,
+    unpack_analysis_frame,
+)
+from utils.lockfree import SharedMemorySPSCRing, SharedMemoryTripleBuffer
+from widgets.spotify_visualizer.audio_worker import (
+    _COMPUTE_RUNTIME_ATTRS,
+    _COMPUTE_SNAPSHOT_ATTRS,
+)
+
+
+logger = get_logger(__name__)
+
+
+# Never seeded or synced: per-process handles, or owned by the worker side.
+_UNSYNCED_ATTRS = frozenset({"_np", "_cfg_lock", "_transient_bus", "_activation_id"})
+# Config the worker cannot derive itself; bar count is forwarded through
+# ``reconfigure_bar_count`` so its cache/state reset runs worker-side too.
+_CONFIG_ATTRS = tuple(
+    name
+    for name in _COMPUTE_SNAPSHOT_ATTRS
+    if name not in _COMPUTE_RUNTIME_ATTRS
+    and name not in _UNSYNCED_ATTRS
+    and name != "_bar_count"
+)
+
+
+def _values_equal(a: Any, b: Any) -> bool:
+    try:
+        return bool(a == b)
+    except Exception:
+        # numpy arrays and similar compare element-wise; treat as changed.
+        return False
+
+
+class AudioAnalysisProcessClient:
+    """Shared-memory producer/consumer for one attach to the audio worker."""
+
+    ATTACH_TIMEOUT_MS = 2000
+    # No frame for this long after a push means the worker is stuck.
+    STALL_TIMEOUT_S = 1.0
+    HEALTH_CHECK_INTERVAL_S = 1.0
+
+    def __init__(
+        self,
+        supervisor: ProcessSupervisor,
+        ring: SharedMemorySPSCRing,
+        frames: SharedMemoryTripleBuffer,
+        dsp: Any,
+    ) -> None:
+        self._supervisor = supervisor
+        self._ring = ring
+        self._frames = frames
+        self._dsp = dsp
+        self._sent_config: Dict[str, Any] = {}
+        self._pending_controls: Deque[bytes] = deque()
+        self._active = True
+        self._first_unanswered_push_ts = 0.0
+        self._last_health_check_ts = 0.0
+        self.blocks_pushed = 0
+        self.blocks_dropped = 0
+        self.frames_received = 0
+
+    @classmethod
+    def attach(
+        cls,
+        supervisor: ProcessSupervisor,
+        dsp: Any,
+        bar_count: int,
+    ) -> Optional["AudioAnalysisProcessClient"]:
+        """Create the segments, seed the worker with *dsp* and wait for its ack.
+
+        Returns None (with nothing left allocated) when the worker is not
+        running or refuses the attach.
+        """
+        if supervisor is None or not supervisor.is_running(WorkerType.AUDIO):
+            return None
+        ring = SharedMemorySPSCRing.create(AUDIO_RING_SLOTS, AUDIO_RING_SLOT_BYTES)
+        frames = SharedMemoryTripleBuffer.create(ANALYSIS_FRAME_BYTES)
+        client = cls(supervisor, ring, frames, dsp)
+        state = client._seed_state()
+        response = None
+        try:
+            corr_id = supervisor.send_message(
+                WorkerType.AUDIO,
+                MessageType.AUDIO_ATTACH,
+                {
+                    "ring_name": ring.name,
+                    "frames_name": frames.name,
+                    "bar_count": int(bar_count),
+                    "state": state,
+                },
+            )
+            if corr_id is not None:
+                response = supervisor.await_response(
+                    WorkerType.AUDIO,
+                    corr_id,
+                    timeout_ms=cls.ATTACH_TIMEOUT_MS,
+                )
+        except Exception:
+            logger.debug("[SPOTIFY_VIS] Audio analysis attach failed", exc_info=True)
+        if response is None or not response.success:
+            logger.info(
+                "[SPOTIFY_VIS] Audio analysis worker unavailable (%s); using in-process compute",
+                getattr(response, "error", None) or "no response",
+            )
+            client._release()
+            return None
+        logger.info(
+            "[SPOTIFY_VIS] Audio analysis attached to worker process (ring=%s bars=%d)",
+            ring.name,
+            int(bar_count),
+        )
+        return client
+
+    def _seed_state(self) -> Dict[str, Any]:
+        """Return the attach seed and record its config as already sent."""
+        snapshot = self._dsp.make_compute_snapshot()
+        state = {
+            name: value
+            for name, value in vars(snapshot).items()
+            if name not in _UNSYNCED_ATTRS
+        }
+        self._sent_config = copy.deepcopy(
+            {name: state[name] for name in _CONFIG_ATTRS if name in state}
+        )
+        return state
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    # ------------------------------------------------------------------
+    # Producer side (UI thread)
+    # ------------------------------------------------------------------
+
+    def forward_call(self, name: str, *args: Any) -> None:
+        """Queue a DSP method call to run worker-side before the next block."""
+        if name not in FORWARDED_CALLS:
+            raise ValueError(f"DSP call {name!r} cannot be forwarded")
+        if self._active:
+            self._pending_controls.append(pack_control_record(CONTROL_CALL, (name, args)))
+
+    def _queue_config_changes(self) -> None:
+        changed: Dict[str, Any] = {}
+        dsp = self._dsp
+        sent = self._sent_config
+        for name in _CONFIG_ATTRS:
+            if not hasattr(dsp, name):
+                continue
+            value = getattr(dsp, name)
+            if name in sent and _values_equal(sent[name], value):
+                continue
+            changed[name] = value
+        if changed:
+            record = pack_control_record(CONTROL_CONFIG, changed)
+            self._pending_controls.append(record)
+            # Keep private copies so in-place edits of lists still diff.
+            sent.update(copy.deepcopy(changed))
+
+    def push_samples(self, samples: bytes, *, activation_id: int, capture_ts: float) -> bool:
+        """Send pending controls, then one PCM block of float32 mono samples.
+
+        Returns False when the block was not queued (ring full or detached);
+        controls stay pending and go out ahead of the next block.
+        """
+        if not self._active:
+            return False
+        self._queue_config_changes()
+        ring = self._ring
+        while self._pending_controls:
+            if not ring.try_push(self._pending_controls[0]):
+                self.blocks_dropped += 1
+                return False
+            self._pending_controls.popleft()
+        record = pack_pcm_record(activation_id, capture_ts, samples)
+        if len(record) > ring.slot_bytes or not ring.try_push(record):
+            self.blocks_dropped += 1
+            return False
+        self.blocks_pushed += 1
+        if self._first_unanswered_push_ts <= 0.0:
+            self._first_unanswered_push_ts = time.time()
+        return True
+
+    # ------------------------------------------------------------------
+    # Consumer side (UI thread)
+    # ------------------------------------------------------------------
+
+    def consume_latest(self) -> Optional[AnalysisFrame]:
+        """Return the newest unread analysis frame, or None."""
+        if not self._active:
+            return None
+        data = self._frames.consume_latest()
+        if data is None:
+            return None
+        self._first_unanswered_push_ts = 0.0
+        self.frames_received += 1
+        return unpack_analysis_frame(data)
+
+    def check_health(self, now_ts: float) -> bool:
+        """Detach when the worker died or stopped answering; return liveness."""
+        if not self._active:
+            return False
+        reason = None
+        pushed_at = self._first_unanswered_push_ts
+        if pushed_at > 0.0 and now_ts - pushed_at > self.STALL_TIMEOUT_S:
+            reason = "no analysis frame for %.1fs" % (now_ts - pushed_at)
+        elif now_ts - self._last_health_check_ts >= self.HEALTH_CHECK_INTERVAL_S:
+            self._last_health_check_ts = now_ts
+            try:
+                if not self._supervisor.is_running(WorkerType.AUDIO):
+                    reason = "worker not running"
+                else:
+                    # Attach/detach acks are the only replies; drop them.
+                    self._supervisor.poll_responses(WorkerType.AUDIO)
+            except Exception:
+                logger.debug("[SPOTIFY_VIS] Audio analysis health check failed", exc_info=True)
+        if reason is None:
+            return True
+        logger.warning(
+            "[SPOTIFY_VIS] Audio analysis worker lost (%s); falling back to in-process compute",
+            reason,
+        )
+        self.close()
+        return False
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "blocks_pushed": self.blocks_pushed,
+            "blocks_dropped": self.blocks_dropped,
+            "frames_received": self.frames_received,
+        }
+
+    def close(self) -> None:
+        """Detach the worker (best effort) and unlink both segments."""
+        if not self._active:
+            return
+        self._active = False
+        self._pending_controls.clear()
+        try:
+            if self._supervisor.is_running(WorkerType.AUDIO):
+                self._supervisor.send_message(WorkerType.AUDIO, MessageType.AUDIO_DETACH, {})
+        except Exception:
+            logger.debug("[SPOTIFY_VIS] Audio analysis detach failed", exc_info=True)
+        self._release()
+
+    def _release(self) -> None:
+        self._active = False
+        for segment in (self._ring, self._frames):
+            try:
+                segment.unlink()
+            except Exception:
+                logger.debug("[SPOTIFY_VIS] Failed to release audio analysis segment", exc_info=True)
+
+
+def samples_to_pcm_bytes(samples: object, np_mod: Any) -> Optional[bytes]:
+    """Flatten *samples* to float32 mono bytes, or None if not an array."""
+    if np_mod is None or samples is None:
+        return None
+    try:
+        arr = np_mod.asarray(samples)
+        if arr.ndim > 1:
+            arr = arr.reshape(-1)
+        return arr.astype("float32", copy=False).tobytes()
+    except Exception:
+        return None
@@ -42,6 +42,10 @@ _COMPUTE_SNAPSHOT_ATTRS = (
     "_work_bars",
     "_zero_bars",
     "_band_edges",
+    "_band_segments",
+    "_band_counts",
+    "_band_sq_buf",
+    "_band_sum_buf",
     "_freq_values",
     "_bar_history",
     "_bar_hold_timers",
@@ -58,6 +62,9 @@ _COMPUTE_SNAPSHOT_ATTRS = (
     "_base_output_scale",
     "_energy_boost",
     "_input_gain",
+    "_use_hann_window",
+    "_hann_window",
+    "_hann_buf",
     "_use_dynamic_floor",
     "_manual_floor",
     "_min_floor",
@@ -129,6 +136,76 @@ _COMPUTE_SNAPSHOT_ATTRS = (
     "_prev_raw_bass",
 )
 
+# DSP state a verified compute job writes back onto the live worker.
+_COMPUTE_RUNTIME_ATTRS = (
+    "_band_cache_key",
+    "_band_log_idx",
+    "_band_bins",
+    "_weight_bands",
+    "_weight_factors",
+    "_smooth_kernel",
+    "_work_bars",
+    "_zero_bars",
+    "_band_edges",
+    "_band_segments",
+    "_band_counts",
+    "_band_sq_buf",
+    "_band_sum_buf",
+    "_freq_values",
+    "_hann_window",
+    "_hann_buf",
+    "_bar_history",
+    "_bar_hold_timers",
+    "_running_peak",
+    "_env_short",
+    "_env_long",
+    "_env_bass_short",
+    "_env_bass_long",
+    "_env_mix_short",
+    "_env_mix_long",
+    "_agc_bass_split",
+    "_agc_mid_split",
+    "_last_fft_ts",
+    "_raw_bass_avg",
+    "_applied_noise_floor",
+    "_last_noise_floor",
+    "_gate_floor",
+    "_support_pressure",
+    "_support_signal_avg",
+    "_last_bass_drop_ratio",
+    "_bass_drop_accum",
+    "_transient_bus",
+    "_transient_bass",
+    "_transient_mid",
+    "_transient_high",
+    "_onset_detected",
+    "_onset_type",
+    "_onset_strength",
+    "_pre_agc_control_norm",
+    "_pre_agc_control_bass",
+    "_pre_agc_control_mid",
+    "_pre_agc_control_treble",
+    "_pre_agc_live_bass",
+    "_pre_agc_live_mid",
+    "_pre_agc_live_treble",
+    "_pre_agc_bass",
+    "_pre_agc_mid",
+    "_pre_agc_treble",
+    "_bar_gate_prev1",
+    "_bar_gate_prev2",
+    "_bar_gate_output",
+    "_last_raw_bass",
+    "_last_raw_mid",
+    "_last_raw_treble",
+    "_prev_raw_bass",
+    "_floor_log_last_ts",
+    "_floor_log_last_mode",
+    "_floor_log_last_applied",
+    "_floor_log_last_manual",
+    "_floor_log_last_applied_bucket",
+    "_bars_log_last_ts",
+)
+
 try:
     _DEBUG_CONST_BARS = float(os.environ.get("SRPSS_SPOTIFY_VIS_DEBUG_CONST", "0.0"))
 except Exception as e:
@@ -187,6 +264,10 @@ class SpotifyVisualizerAudioWorker(QObject):
         self._work_bars = None  # output bars buffer
         self._zero_bars = None  # cached zero bars list
         self._band_edges = None  # logarithmic band edges
+        self._band_segments = None  # interleaved reduceat indices per band
+        self._band_counts = None  # bins per band (RMS divisor)
+        self._band_sq_buf = None  # squared magnitudes (+1 zero pad)
+        self._band_sum_buf = None  # reduceat output
         self._freq_values = None  # temp buffer for frequency band values
         # Per-bar history for attack/decay dynamics
         self._bar_history = None
@@ -209,6 +290,10 @@ class SpotifyVisualizerAudioWorker(QObject):
         self._base_output_scale: float = 0.5
         self._energy_boost: float = 0.85
         self._input_gain: float = 1.0
+        # Optional Hann window before the FFT (cached per frame size)
+        self._use_hann_window: bool = False
+        self._hann_window = None
+        self._hann_buf = None
         # Floor control configuration (dynamic/manual)
         self._use_dynamic_floor: bool = True
         self._manual_floor: float = 0.12
@@ -448,6 +533,10 @@ class SpotifyVisualizerAudioWorker(QObject):
             val = 2.0
         self._input_gain = val
 
+    def set_hann_window(self, enabled: bool) -> None:
+        """Enable a Hann window on the PCM block before the FFT."""
+        self._use_hann_window = bool(enabled)
+
     def set_energy_boost(self, boost: float) -> None:
         """Adjust post-FFT energy boost factor."""
         try:
@@ -529,7 +618,13 @@ class SpotifyVisualizerAudioWorker(QObject):
         self._work_bars = None
         self._zero_bars = None
         self._band_edges = None
+        self._band_segments = None
+        self._band_counts = None
+        self._band_sq_buf = None
+        self._band_sum_buf = None
         self._freq_values = None
+        self._hann_window = None
+        self._hann_buf = None
 
     def reconfigure_bar_count(self, bar_count: int) -> None:
         """Rebuild bar-count-dependent runtime state using the startup contract."""
@@ -776,69 +871,7 @@ class SpotifyVisualizerAudioWorker(QObject):
     def commit_compute_snapshot(self, state: object) -> None:
         """Commit mutable DSP state produced by a verified compute job."""
 
-        runtime_attrs = (
-            "_band_cache_key",
-            "_band_log_idx",
-            "_band_bins",
-            "_weight_bands",
-            "_weight_factors",
-            "_smooth_kernel",
-            "_work_bars",
-            "_zero_bars",
-            "_band_edges",
-            "_freq_values",
-            "_bar_history",
-            "_bar_hold_timers",
-            "_running_peak",
-            "_env_short",
-            "_env_long",
-            "_env_bass_short",
-            "_env_bass_long",
-            "_env_mix_short",
-            "_env_mix_long",
-            "_agc_bass_split",
-            "_agc_mid_split",
-            "_last_fft_ts",
-            "_raw_bass_avg",
-            "_applied_noise_floor",
-            "_last_noise_floor",
-            "_gate_floor",
-            "_support_pressure",
-            "_support_signal_avg",
-            "_last_bass_drop_ratio",
-            "_bass_drop_accum",
-            "_transient_bus",
-            "_transient_bass",
-            "_transient_mid",
-            "_transient_high",
-            "_onset_detected",
-            "_onset_type",
-            "_onset_strength",
-            "_pre_agc_control_norm",
-            "_pre_agc_control_bass",
-            "_pre_agc_control_mid",
-            "_pre_agc_control_treble",
-            "_pre_agc_live_bass",
-            "_pre_agc_live_mid",
-            "_pre_agc_live_treble",
-            "_pre_agc_bass",
-            "_pre_agc_mid",
-            "_pre_agc_treble",
-            "_bar_gate_prev1",
-            "_bar_gate_prev2",
-            "_bar_gate_output",
-            "_last_raw_bass",
-            "_last_raw_mid",
-            "_last_raw_treble",
-            "_prev_raw_bass",
-            "_floor_log_last_ts",
-            "_floor_log_last_mode",
-            "_floor_log_last_applied",
-            "_floor_log_last_manual",
-            "_floor_log_last_applied_bucket",
-            "_bars_log_last_ts",
-        )
-        for name in runtime_attrs:
+        for name in _COMPUTE_RUNTIME_ATTRS:
             if hasattr(state, name):
                 setattr(self, name, getattr(state, name))
 
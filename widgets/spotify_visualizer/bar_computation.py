@@ -137,6 +137,28 @@ def get_zero_bars(worker: "SpotifyVisualizerAudioWorker") -> List[float]:
 
 
 
+def _build_band_segments(np, edges, n: int):
+    """Return ``(segment_idx, counts)`` for a vectorised per-band reduction.
+
+    Band ``b`` covers ``mag[start:end]`` with ``end`` forced past ``start``
+    for empty bands, and is zero when it starts beyond the spectrum.  The
+    segments are interleaved ``[s0, e0, s1, e1, ...]`` so a single
+    ``np.add.reduceat`` over a squared buffer padded with one trailing zero
+    yields every band sum at the even positions, even when neighbouring
+    bands overlap.
+    """
+    starts = np.asarray(edges[:-1], dtype=np.intp)
+    ends = np.maximum(np.asarray(edges[1:], dtype=np.intp), starts + 1)
+    valid = (starts < n) & (ends <= n)
+    starts = np.where(valid, starts, n)
+    ends = np.where(valid, ends, n)
+    segments = np.empty(starts.size * 2, dtype=np.intp)
+    segments[0::2] = starts
+    segments[1::2] = ends
+    counts = np.where(valid, ends - starts, 1).astype("float32")
+    return segments, counts
+
+
 def fft_to_bars(worker: "SpotifyVisualizerAudioWorker", fft) -> List[float]:
     """Convert FFT magnitudes to visualizer bar heights.
 
@@ -191,7 +213,10 @@ def fft_to_bars(worker: "SpotifyVisualizerAudioWorker", fft) -> List[float]:
     drop_signal = 0.0
     center = bands // 2
     try:
-        if getattr(worker, "_band_cache_key", None) != cache_key:
+        if (
+            getattr(worker, "_band_cache_key", None) != cache_key
+            or getattr(worker, "_band_segments", None) is None
+        ):
             min_freq_idx = 1
             max_freq_idx = n
 
@@ -204,6 +229,10 @@ def fft_to_bars(worker: "SpotifyVisualizerAudioWorker", fft) -> List[float]:
 
             worker._band_cache_key = cache_key
             worker._band_edges = log_edges
+            worker._band_segments, worker._band_counts = _build_band_segments(np, log_edges, n)
+            # Squared magnitudes plus one zero pad so reduceat may index ``n``
+            worker._band_sq_buf = np.zeros(n + 1, dtype="float32")
+            worker._band_sum_buf = np.zeros(bands * 2, dtype="float32")
             worker._work_bars = np.zeros(bands, dtype="float32")
             worker._freq_values = np.zeros(bands, dtype="float32")
             worker._bar_history = np.zeros(bands, dtype="float32")
@@ -218,16 +247,13 @@ def fft_to_bars(worker: "SpotifyVisualizerAudioWorker", fft) -> List[float]:
         freq_values = worker._freq_values
         freq_values.fill(0.0)
 
-        # Compute RMS for each frequency band
-        for b in range(bands):
-            start = int(edges[b])
-            end = int(edges[b + 1])
-            if end <= start:
-                end = start + 1
-            if start < n and end <= n:
-                band_slice = mag[start:end]
-                if band_slice.size > 0:
-                    freq_values[b] = np.sqrt(np.mean(band_slice ** 2))
+        # Compute RMS for every frequency band in one reduction
+        sq = worker._band_sq_buf
+        np.multiply(mag, mag, out=sq[:n])
+        sums = worker._band_sum_buf
+        np.add.reduceat(sq, worker._band_segments, out=sums)
+        np.divide(sums[0::2], worker._band_counts, out=freq_values)
+        np.sqrt(freq_values, out=freq_values)
 
         # Get raw energy values — band splits driven by notch positions
         _notch_pos = getattr(worker, '_spectrum_notch_positions', None)
@@ -1026,6 +1052,27 @@ def maybe_log_floor_state(
             logger.debug("[SPOTIFY_VIS] Exception suppressed: %s", e)
 
 
+def _apply_hann_window(worker: "SpotifyVisualizerAudioWorker", np_mod, mono):
+    """Return *mono* multiplied by a cached, unity-gain Hann window.
+
+    The window is rescaled to a mean of 1.0 so bar levels stay comparable
+    with the rectangular (unwindowed) path.  The product goes into a reused
+    buffer; the caller's samples are never modified.
+    """
+    size = int(mono.size)
+    window = getattr(worker, "_hann_window", None)
+    if window is None or window.size != size:
+        window = np_mod.hanning(size).astype("float32")
+        mean = float(window.mean()) if size > 0 else 0.0
+        if mean > 0.0:
+            window /= mean
+        worker._hann_window = window
+        worker._hann_buf = np_mod.empty(size, dtype="float32")
+    out = worker._hann_buf
+    np_mod.multiply(mono, window, out=out)
+    return out
+
+
 def compute_bars_from_samples(
     worker: "SpotifyVisualizerAudioWorker", samples
 ) -> Optional[List[float]]:
@@ -1078,6 +1125,9 @@ def compute_bars_from_samples(
         if peak_raw < 1e-3:
             return get_zero_bars(worker)
 
+        if getattr(worker, "_use_hann_window", False):
+            mono = _apply_hann_window(worker, np_mod, mono)
+
         # Inline FFT processing (single code path — no IPC fallback)
         fft = np_mod.fft.rfft(mono)
         np_mod.abs(fft, out=fft)
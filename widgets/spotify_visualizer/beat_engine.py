@@ -29,10 +29,18 @@ from core.logging.logger import (
 from core.threading.manager import ThreadManager
 from core.process import ProcessSupervisor
 from utils.lockfree import TripleBuffer
+from widgets.spotify_visualizer.analysis_process_client import (
+    AudioAnalysisProcessClient,
+    samples_to_pcm_bytes,
+)
 from widgets.spotify_visualizer.audio_worker import SpotifyVisualizerAudioWorker, _AudioFrame
 from widgets.spotify_visualizer.energy_bands import EnergyBands, extract_energy_bands
 from widgets.spotify_visualizer.signal_contract import soft_ceiling
-from widgets.spotify_visualizer.transient_bus import TransientEnergyBands, TransientEventScheduler
+from widgets.spotify_visualizer.transient_bus import (
+    OnsetEvent,
+    TransientEnergyBands,
+    TransientEventScheduler,
+)
 
 
 logger = get_logger(__name__)
@@ -121,6 +129,12 @@ class _SpotifyBeatEngine(QObject):
         self._pending_analysis_activation: int = -1
         self._pending_analysis_capture_ts: float = 0.0
         self._thread_manager: Optional[ThreadManager] = None
+        # Optional out-of-process analysis lane (WorkerType.AUDIO). While the
+        # client is attached, PCM goes to the worker instead of the COMPUTE
+        # pool; if it is lost the engine falls back to the compute lane.
+        self._process_supervisor: Optional[ProcessSupervisor] = None
+        self._analysis_client: Optional[AudioAnalysisProcessClient] = None
+        self._analysis_attach_retry_ts: float = 0.0
         self._ref_count: int = 0
         self._latest_bars: Optional[List[float]] = None
         self._last_audio_ts: float = 0.0
@@ -174,10 +188,48 @@ class _SpotifyBeatEngine(QObject):
     
     def set_process_supervisor(self, supervisor: Optional[ProcessSupervisor]) -> None:
         """Set the ProcessSupervisor for worker integration."""
+        if supervisor is self._process_supervisor:
+            return
+        self._close_analysis_client()
+        self._process_supervisor = supervisor
+        self._analysis_attach_retry_ts = 0.0
+        self._maybe_attach_analysis_process(time.time())
+
+    # Seconds between attach attempts while the audio worker is not up yet.
+    _ANALYSIS_ATTACH_RETRY_S = 5.0
+
+    def _maybe_attach_analysis_process(self, now_ts: float) -> None:
+        """Attach the out-of-process analysis lane once its worker is running."""
+        if self._analysis_client is not None or self._process_supervisor is None:
+            return
+        if now_ts < self._analysis_attach_retry_ts:
+            return
+        self._analysis_attach_retry_ts = now_ts + self._ANALYSIS_ATTACH_RETRY_S
         try:
-            self._audio_worker.set_process_supervisor(supervisor)
+            client = AudioAnalysisProcessClient.attach(
+                self._process_supervisor,
+                self._audio_worker,
+                self._bar_count,
+            )
         except Exception:
-            logger.debug("[SPOTIFY_VIS] Failed to set process supervisor", exc_info=True)
+            logger.debug("[SPOTIFY_VIS] Failed to attach audio analysis worker", exc_info=True)
+            return
+        if client is not None:
+            # In-flight compute results were taken from pre-attach state.
+            self.cancel_pending_compute_tasks()
+            self._analysis_client = client
+
+    def _close_analysis_client(self) -> None:
+        client = self._analysis_client
+        self._analysis_client = None
+        if client is not None:
+            client.close()
+
+    def _forward_dsp_call(self, name: str, *args) -> None:
+        """Replay a DSP state mutation on the analysis worker, if attached."""
+        client = self._analysis_client
+        if client is not None:
+            client.forward_call(name, *args)
 
     def _replace_runtime_buffers(self) -> None:
         """Discard queued audio/result frames at a runtime activation boundary."""
@@ -260,6 +312,7 @@ class _SpotifyBeatEngine(QObject):
         self._bar_count = new_count
         self._replace_runtime_buffers()
         self._audio_worker.reconfigure_bar_count(new_count)
+        self._forward_dsp_call("reconfigure_bar_count", new_count)
         self._latest_bars = [0.0] * new_count
         self._smoothed_bars = [0.0] * new_count
         self._last_smooth_ts = -1.0
@@ -289,6 +342,8 @@ class _SpotifyBeatEngine(QObject):
         self._last_audio_ts = 0.0
         self._audio_worker.reset_processing_caches()
         self._audio_worker.reset_reactivity_state()
+        self._forward_dsp_call("reset_processing_caches")
+        self._forward_dsp_call("reset_reactivity_state")
         self._advance_activation_generation(reason="smoothing_reset")
 
     def reset_floor_state(self) -> None:
@@ -297,6 +352,7 @@ class _SpotifyBeatEngine(QObject):
             aw = self._audio_worker
             aw.reset_reactivity_state()
             aw._last_floor_config = (aw._use_dynamic_floor, aw._manual_floor)
+            self._forward_dsp_call("reset_reactivity_state")
         except Exception:
             logger.debug("[SPOTIFY_VIS] Failed to reset floor state", exc_info=True)
 
@@ -320,6 +376,7 @@ class _SpotifyBeatEngine(QObject):
     def set_floor_config(self, dynamic_enabled: bool, manual_floor: float) -> None:
         try:
             self._audio_worker.set_floor_config(dynamic_enabled, manual_floor)
+            self._forward_dsp_call("set_floor_config", dynamic_enabled, manual_floor)
         except Exception:
             logger.debug("[SPOTIFY_VIS] Failed to apply floor config", exc_info=True)
 
@@ -478,6 +535,7 @@ class _SpotifyBeatEngine(QObject):
         self._idle_wave_phase = 0.0
         self._ref_count = 0
         self._capture_keepalive_deadline = 0.0
+        self._close_analysis_client()
         self._stop_worker()
 
     def _stop_worker(self) -> None:
@@ -658,6 +716,56 @@ class _SpotifyBeatEngine(QObject):
             if token == self._compute_gate_token:
                 self._compute_task_active = False
 
+    def _consume_process_analysis(self, now_ts: float) -> None:
+        """Commit the newest frame published by the analysis worker, if any."""
+        client = self._analysis_client
+        if client is None:
+            return
+        if not client.check_health(now_ts):
+            self._analysis_client = None
+            return
+        try:
+            frame = client.consume_latest()
+        except Exception:
+            logger.debug("[SPOTIFY_VIS] Failed to read analysis worker frame", exc_info=True)
+            return
+        if frame is None or frame.activation_id != self._activation_id:
+            return
+        if len(frame.raw_bars) != self._bar_count:
+            return
+        aw = self._audio_worker
+        # Mirror the worker's DSP scalars so energy/floor/transient getters
+        # read the same values an in-process commit would have produced.
+        for name, value in frame.state.items():
+            setattr(aw, name, value)
+        aw._onset_detected = frame.onset_detected
+        aw._onset_type = frame.onset_type
+        if frame.onset_detected:
+            scheduler = getattr(getattr(aw, "_transient_bus", None), "_scheduler", None)
+            if scheduler is not None:
+                scheduler.feed(OnsetEvent(
+                    timestamp=frame.onset_ts,
+                    event_type=frame.onset_type,
+                    strength=float(frame.state.get("_onset_strength", 0.0)),
+                ))
+        smoothed, _reset, energy = _smooth_analysis_bars(
+            frame.raw_bars,
+            self._smoothed_bars,
+            self._last_smooth_ts,
+            frame.computed_ts,
+            bar_count=self._bar_count,
+            smoothing_tau=self._smoothing_tau,
+            segment_hysteresis=self._segment_hysteresis,
+            min_change_threshold=self._min_change_threshold,
+        )
+        self._commit_analysis_frame(
+            raw_bars=frame.raw_bars,
+            smoothed_bars=smoothed,
+            timestamp=frame.computed_ts,
+            activation_id=frame.activation_id,
+            energy=energy,
+        )
+
     def _commit_analysis_frame(
         self,
         *,
@@ -846,6 +954,9 @@ class _SpotifyBeatEngine(QObject):
             except Exception as e:
                 logger.debug("[SPOTIFY_VIS] Exception suppressed: %s", e)
             return self._latest_bars
+        if self._process_supervisor is not None:
+            self._maybe_attach_analysis_process(now_ts)
+            self._consume_process_analysis(now_ts)
         frame = self._audio_buffer.consume_latest()
         if frame is not None:
             frame_activation = getattr(frame, "activation_id", None)
@@ -895,7 +1006,18 @@ class _SpotifyBeatEngine(QObject):
                         self._prime_idle_bars(now_ts)
                     return self._latest_bars
                 
-                if tm is not None:
+                client = self._analysis_client
+                if client is not None:
+                    # The worker owns the DSP state while attached, so a block
+                    # it cannot take is dropped rather than computed here.
+                    pcm = samples_to_pcm_bytes(samples, np)
+                    if pcm is not None:
+                        client.push_samples(
+                            pcm,
+                            activation_id=self._activation_id,
+                            capture_ts=frame_capture_ts,
+                        )
+                elif tm is not None:
                     if not self._compute_task_active:
                         self._schedule_compute_bars_task(
                             samples, capture_ts=frame_capture_ts
@@ -0,0 +1,231 @@
+"""Struct-of-arrays broadphase for :class:`BubbleSimulation`.
+
+``BubbleState`` stays the per-bubble record (``tick()``/``snapshot()``, the
+parity harness and the tests all read it); ``BubbleColumns`` is a snapshot
+taken per pass, not the storage.  The pairwise paths — smooth-mode collision
+response and spawn overlap checks — mirror the few fields they need into
+NumPy columns and filter candidate pairs in one vectorised pass, so only
+bubbles that can actually touch are visited from Python.  Collision passes
+that move bubbles as they go use ``live_sweep`` instead, which reads the
+current positions the way the original sort-and-sweep did.
+
+At the simulation's own scale (``MAX_BUBBLES``) the filter runs over every
+pair at once; larger sets are bucketed in a uniform grid whose cells are at
+least as wide as the largest interaction distance, which makes the 3x3
+neighbourhood of a cell an exact superset of every possible contact.
+"""
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Same cell plus the four "forward" neighbours: every adjacent cell pair is
+# visited exactly once.
+_HALF_NEIGHBOURHOOD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+_MIN_CELL_SIZE = 1e-3
+
+# Up to this many bubbles the candidate pairs come from one vectorised
+# distance test over the upper triangle; the grid only pays off beyond it.
+_DENSE_PAIR_LIMIT = 256
+
+_triangle_cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _upper_triangle(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    cached = _triangle_cache.get(n)
+    if cached is None:
+        first, second = np.triu_indices(n, k=1)
+        cached = (first.astype(np.intp), second.astype(np.intp))
+        _triangle_cache[n] = cached
+    return cached
+
+
+class BubbleColumns:
+    """Position, radius and class flags of a bubble list as NumPy columns."""
+
+    __slots__ = ("x", "y", "radius", "big")
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray, big: np.ndarray) -> None:
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.big = big
+
+    def __len__(self) -> int:
+        return int(self.x.size)
+
+    @classmethod
+    def gather(
+        cls,
+        bubbles: Sequence,
+        radii: Optional[Sequence[float]] = None,
+        big_flags: Optional[Sequence[bool]] = None,
+    ) -> "BubbleColumns":
+        """Snapshot *bubbles*; *radii* / *big_flags* override the stored fields."""
+        n = len(bubbles)
+        x = np.fromiter((b.x for b in bubbles), dtype=np.float64, count=n)
+        y = np.fromiter((b.y for b in bubbles), dtype=np.float64, count=n)
+        if radii is None:
+            radius = np.fromiter((b.radius for b in bubbles), dtype=np.float64, count=n)
+        else:
+            radius = np.asarray(radii, dtype=np.float64)
+        if big_flags is None:
+            big = np.fromiter((bool(b.is_big or b.promoted) for b in bubbles), dtype=bool, count=n)
+        else:
+            big = np.asarray(big_flags, dtype=bool)
+        return cls(x, y, radius, big)
+
+
+class UniformGrid:
+    """Spatial hash of point indices on square cells of ``cell_size``."""
+
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size = max(_MIN_CELL_SIZE, float(cell_size))
+        self._inv = 1.0 / self.cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+    @classmethod
+    def build(cls, x: np.ndarray, y: np.ndarray, cell_size: float) -> "UniformGrid":
+        grid = cls(cell_size)
+        cx = np.floor(x * grid._inv).astype(np.int64).tolist()
+        cy = np.floor(y * grid._inv).astype(np.int64).tolist()
+        cells = grid._cells
+        for index, key in enumerate(zip(cx, cy)):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [index]
+            else:
+                bucket.append(index)
+        return grid
+
+    def insert(self, index: int, x: float, y: float) -> None:
+        key = (math.floor(x * self._inv), math.floor(y * self._inv))
+        self._cells.setdefault(key, []).append(index)
+
+    def query(self, x: float, y: float, reach: float) -> List[int]:
+        """Indices in every cell touching the square of half-size *reach*."""
+        inv = self._inv
+        x0 = math.floor((x - reach) * inv)
+        x1 = math.floor((x + reach) * inv)
+        y0 = math.floor((y - reach) * inv)
+        y1 = math.floor((y + reach) * inv)
+        cells = self._cells
+        found: List[int] = []
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            for (cx, cy), bucket in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    found.extend(bucket)
+            return found
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Every unordered index pair sharing a cell or adjacent cells, once."""
+        first: List[int] = []
+        second: List[int] = []
+        cells = self._cells
+        for (cx, cy), bucket in cells.items():
+            for ox, oy in _HALF_NEIGHBOURHOOD:
+                if ox == 0 and oy == 0:
+                    count = len(bucket)
+                    for k in range(count - 1):
+                        i = bucket[k]
+                        for m in range(k + 1, count):
+                            first.append(i)
+                            second.append(bucket[m])
+                    continue
+                other = cells.get((cx + ox, cy + oy))
+                if not other:
+                    continue
+                for i in bucket:
+                    for j in other:
+                        first.append(i)
+                        second.append(j)
+        return np.asarray(first, dtype=np.intp), np.asarray(second, dtype=np.intp)
+
+
+def contact_pairs(
+    columns: BubbleColumns,
+    *,
+    gap_factor: float,
+    gap_bias: float,
+    slack: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(i, j)`` index arrays of pairs closer than their contact reach.
+
+    The reach of a pair is ``(r_i + r_j) * gap_factor + gap_bias + slack``;
+    callers pass the largest factor/bias any pair policy can use, so the
+    result is a superset of the pairs whose exact test can succeed.
+    """
+    n = len(columns)
+    if n < 2:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+    if n <= _DENSE_PAIR_LIMIT:
+        first, second = _upper_triangle(n)
+    else:
+        max_radius = float(columns.radius.max())
+        cell = 2.0 * max_radius * gap_factor + gap_bias + slack
+        first, second = UniformGrid.build(columns.x, columns.y, cell).pairs()
+    if first.size == 0:
+        return first, second
+    dx = columns.x[second] - columns.x[first]
+    dy = columns.y[second] - columns.y[first]
+    reach = (columns.radius[first] + columns.radius[second]) * gap_factor + gap_bias + slack
+    keep = dx * dx + dy * dy < reach * reach
+    return first[keep], second[keep]
+
+
+def sweep_order(columns: BubbleColumns, first: np.ndarray, second: np.ndarray) -> Iterable[Tuple[int, int]]:
+    """Orient and order pairs as an x-sorted sweep would visit them.
+
+    Pairs come back as ``(a, b)`` with ``a`` earlier than ``b`` in a stable
+    ascending-x sort, ordered by ``a``'s rank then ``b``'s — the visiting
+    order of the sort-and-sweep loop this broadphase replaces, so sequential
+    responses (and their random draws) happen in the same order.
+    """
+    if first.size == 0:
+        return []
+    order = np.argsort(columns.x, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    swap = rank[first] > rank[second]
+    a = np.where(swap, second, first)
+    b = np.where(swap, first, second)
+    visit = np.lexsort((rank[b], rank[a]))
+    return zip(a[visit].tolist(), b[visit].tolist())
+
+
+def live_sweep(
+    bubbles: Sequence,
+    radii: Sequence[float],
+    *,
+    gap_factor: float,
+    gap_bias: float,
+) -> Iterator[Tuple[int, int]]:
+    """Yield ``(a, b)`` pairs from a sort-and-sweep over live positions.
+
+    For callers that move bubbles while consuming the pairs: the x order is
+    taken once, but each reach test reads the current ``x`` of both bubbles,
+    so a push made for an earlier pair is seen by the later ones.
+    """
+    count = len(bubbles)
+    if count < 2:
+        return
+    max_radius = max(radii)
+    order = sorted(range(count), key=lambda idx: bubbles[idx].x)
+    for pos, i in enumerate(order):
+        a = bubbles[i]
+        max_gap = (radii[i] + max_radius) * gap_factor + gap_bias
+        for next_pos in range(pos + 1, count):
+            j = order[next_pos]
+            if bubbles[j].x - a.x > max_gap:
+                break
+            yield i, j
@@ -2,7 +2,9 @@
 
 Manages a pool of bubbles with spawning, movement, drift, wobble, pulse,
 and lifecycle (surface-reach vs pop/fade). The simulation runs on the UI
-thread inside ``_on_tick()`` — at ≤110 bubbles the update is <0.1ms.
+thread inside ``_on_tick()``. Pairwise work (collision response, spawn
+overlap checks) goes through the NumPy broadphase in ``bubble_grid`` so
+only bubbles within contact reach are visited per pass.
 
 The public API is:
     sim = BubbleSimulation()
@@ -22,6 +24,13 @@ from core.logging.logger import (
     is_verbose_logging,
     is_viz_diagnostics_enabled,
 )
+from widgets.spotify_visualizer.bubble_grid import (
+    BubbleColumns,
+    UniformGrid,
+    contact_pairs,
+    live_sweep,
+    sweep_order,
+)
 from widgets.spotify_visualizer.signal_contract import burst_authority, soft_ceiling
 
 _SWIRL_DIRECTIONS = {"swirl_cw", "swirl_ccw"}
@@ -30,6 +39,10 @@ logger = get_logger(__name__)
 
 MAX_BUBBLES = 110
 
+# Stream modes whose predicted entry positions depend on per-bubble (or
+# random) vectors; spawn checks for these scan every bubble.
+_SPAWN_GRID_UNSAFE_STREAMS = frozenset({"random", "diagonal"})
+
 
 TRAIL_STEPS = 3  # uniform layout still reserves 3 vec3 slots per bubble
 # Smear tail behaviour: trail_tail slowly chases each bubble, forming a streak
@@ -228,6 +241,9 @@ class BubbleSimulation:
         self._prev_bass: float = 0.0  # previous frame bass for slope detection
         self._stream_burst_envelope: float = 0.0
         self._pair_bounce_cooldowns: Dict[Tuple[int, int], float] = {}
+        # Spatial index over self._bubbles, live only during the spawn phase
+        self._spawn_grid: Optional[UniformGrid] = None
+        self._spawn_grid_max_radius: float = 0.0
         self._last_big_lane_diag: Dict[str, float] = {}
         self._last_big_render_diag: Dict[str, float] = {}
         self._last_perf_diag: Dict[str, float] = {}
@@ -267,6 +283,7 @@ class BubbleSimulation:
         self._prev_bass = 0.0
         self._stream_burst_envelope = 0.0
         self._pair_bounce_cooldowns.clear()
+        self._spawn_grid = None
         self._last_big_lane_diag = {}
         self._last_big_render_diag = {}
         self._last_perf_diag = {}
@@ -1114,6 +1131,7 @@ class BubbleSimulation:
                 self._bubbles.pop(i)
 
         # --- Spawn new bubbles to maintain targets ---
+        self._begin_spawn_phase()
         # Exiting bubbles are draining out and shouldn't hold spawn slots.
         big_count = sum(1 for b in self._bubbles if b.is_big and not b.exiting)
         small_count = sum(1 for b in self._bubbles if not b.is_big and not b.exiting)
@@ -1175,6 +1193,7 @@ class BubbleSimulation:
                                       initial_fill=is_initial)
                 small_count += 1
                 small_spawn_budget -= 1
+        self._end_spawn_phase()
 
         tick_ms = (time.perf_counter() - tick_start) * 1000.0
         perf_diag = dict(self._last_perf_diag)
@@ -1335,223 +1354,243 @@ class BubbleSimulation:
                 and -view_margin <= bubble.y <= 1.0 + view_margin
             )
 
+        # Collision radii and class flags depend only on per-bubble pulse
+        # state, which the passes below never touch.
+        collision_radii = [
+            self._effective_collision_radius(
+                bubble,
+                big_bass_pulse=big_bass_pulse,
+                small_freq_pulse=small_freq_pulse,
+                big_contraction_bias=big_contraction_bias,
+                big_size_clamp=big_size_clamp,
+            )
+            for bubble in active
+        ]
+        active_big_flags = [_bubble_behaves_big(bubble) for bubble in active]
+        max_gap_factor = max(
+            big_policy[0],
+            mixed_policy[0],
+            small_policy[0],
+            big_policy[6],
+            mixed_policy[6],
+            small_policy[6],
+        )
+        max_gap_bias = max(
+            big_policy[1],
+            mixed_policy[1],
+            small_policy[1],
+            big_policy[7],
+            mixed_policy[7],
+            small_policy[7],
+        )
+
         for _ in range(passes):
             pending_dx = [0.0] * count if smooth_mode else []
             pending_dy = [0.0] * count if smooth_mode else []
-            collision_radii = [
-                self._effective_collision_radius(
-                    bubble,
-                    big_bass_pulse=big_bass_pulse,
-                    small_freq_pulse=small_freq_pulse,
-                    big_contraction_bias=big_contraction_bias,
-                    big_size_clamp=big_size_clamp,
+            if smooth_mode:
+                # Every push is deferred to the end of the pass, so the
+                # pass-start positions are exact for the whole pass and the
+                # vectorised filter only hands back pairs that can touch.
+                columns = BubbleColumns.gather(active, collision_radii, active_big_flags)
+                pair_first, pair_second = contact_pairs(
+                    columns,
+                    gap_factor=max_gap_factor,
+                    gap_bias=max_gap_bias,
                 )
-                for bubble in active
-            ]
-            active_big_flags = [_bubble_behaves_big(bubble) for bubble in active]
-            if not collision_radii:
-                continue
-            max_collision_radius = max(collision_radii)
-            max_gap_factor = max(
-                big_policy[0],
-                mixed_policy[0],
-                small_policy[0],
-                big_policy[6],
-                mixed_policy[6],
-                small_policy[6],
-            )
-            max_gap_bias = max(
-                big_policy[1],
-                mixed_policy[1],
-                small_policy[1],
-                big_policy[7],
-                mixed_policy[7],
-                small_policy[7],
-            )
-            sorted_indices = sorted(range(count), key=lambda idx: active[idx].x)
-            for sorted_pos, i in enumerate(sorted_indices):
-                a = active[i]
-                if a.popping or a.exiting:
+                candidates = sweep_order(columns, pair_first, pair_second)
+            else:
+                # Pushes land immediately and later pairs must see them.
+                candidates = live_sweep(
+                    active,
+                    collision_radii,
+                    gap_factor=max_gap_factor,
+                    gap_bias=max_gap_bias,
+                )
+            group = -1
+            skip_group = False
+            for i, j in candidates:
+                if i != group:
+                    # Like the sweep, a bubble popped mid-pass still finishes
+                    # the pairs it leads.
+                    group = i
+                    skip_group = active[i].popping or active[i].exiting
+                if skip_group:
                     continue
+                a = active[i]
+                b = active[j]
                 a_radius = collision_radii[i]
-                max_possible_gap = (a_radius + max_collision_radius) * max_gap_factor + max_gap_bias
-                for next_pos in range(sorted_pos + 1, count):
-                    j = sorted_indices[next_pos]
-                    b = active[j]
-                    dx = b.x - a.x
-                    if dx > max_possible_gap:
-                        break
-                    pair_checks += 1
-                    if b.popping or b.exiting:
-                        continue
-                    b_radius = collision_radii[j]
-                    dy = b.y - a.y
-                    a_big = active_big_flags[i]
-                    b_big = active_big_flags[j]
-                    if a_big and b_big:
-                        (
-                            gap_factor,
-                            gap_bias,
-                            softness,
-                            max_push,
-                            bounce_strength,
-                            speed_norm,
-                            strict_gap_factor,
-                            strict_gap_bias,
-                        ) = big_policy
-                    elif a_big or b_big:
-                        if bounce_same_only:
-                            continue
-                        (
-                            gap_factor,
-                            gap_bias,
-                            softness,
-                            max_push,
-                            bounce_strength,
-                            speed_norm,
-                            strict_gap_factor,
-                            strict_gap_bias,
-                        ) = mixed_policy
-                    else:
-                        (
-                            gap_factor,
-                            gap_bias,
-                            softness,
-                            max_push,
-                            bounce_strength,
-                            speed_norm,
-                            strict_gap_factor,
-                            strict_gap_bias,
-                        ) = small_policy
-
-                    radii_sum = a_radius + b_radius
-                    target_gap = radii_sum * gap_factor + gap_bias
-                    strict_gap = radii_sum * strict_gap_factor + strict_gap_bias
-                    target_gap = max(target_gap, strict_gap)
-                    target_gap_sq = target_gap * target_gap
-
-                    dist_sq = dx * dx + dy * dy
-                    if dist_sq >= target_gap_sq:
+                dx = b.x - a.x
+                pair_checks += 1
+                if b.popping or b.exiting:
+                    continue
+                b_radius = collision_radii[j]
+                dy = b.y - a.y
+                a_big = active_big_flags[i]
+                b_big = active_big_flags[j]
+                if a_big and b_big:
+                    (
+                        gap_factor,
+                        gap_bias,
+                        softness,
+                        max_push,
+                        bounce_strength,
+                        speed_norm,
+                        strict_gap_factor,
+                        strict_gap_bias,
+                    ) = big_policy
+                elif a_big or b_big:
+                    if bounce_same_only:
                         continue
-                    overlap_hits += 1
-
-                    if dist_sq < 1e-10:
-                        angle = random.uniform(0.0, math.tau)
-                        nx = math.cos(angle)
-                        ny = math.sin(angle)
-                        dist = 0.0
-                    else:
-                        dist = math.sqrt(dist_sq)
-                        inv = 1.0 / dist
-                        nx = dx * inv
-                        ny = dy * inv
-
-                    overlap = target_gap - dist
-                    a_in_view = _in_view(a)
-                    b_in_view = _in_view(b)
-                    both_in_view = a_in_view and b_in_view
-                    push_softness = softness * (0.60 + 0.52 * speed_norm) + bounce_strength * 0.03
-                    push_cap = max_push * (0.25 + 0.75 * speed_norm + bounce_strength * 0.15)
-                    if speed_norm >= 0.80 and bounce_strength >= 0.90:
-                        push_softness *= 1.70
-                        push_cap *= 2.00
-                    push = min(push_cap, overlap * push_softness * dt_scale)
-                    if speed_norm >= 0.80 and bounce_strength >= 0.90:
-                        push = max(push, overlap * 0.34)
-
-                    # Entry stability: resolve overlap before it becomes visible.
-                    # When only one bubble is on-card, move the off-card bubble
-                    # far more than the visible one to prevent snap-shifts.
-                    if not both_in_view:
-                        if a_in_view != b_in_view:
-                            push *= 0.70
-                        else:
-                            push = min(push_cap * 1.35, push * 1.35)
+                    (
+                        gap_factor,
+                        gap_bias,
+                        softness,
+                        max_push,
+                        bounce_strength,
+                        speed_norm,
+                        strict_gap_factor,
+                        strict_gap_bias,
+                    ) = mixed_policy
+                else:
+                    (
+                        gap_factor,
+                        gap_bias,
+                        softness,
+                        max_push,
+                        bounce_strength,
+                        speed_norm,
+                        strict_gap_factor,
+                        strict_gap_bias,
+                    ) = small_policy
+
+                radii_sum = a_radius + b_radius
+                target_gap = radii_sum * gap_factor + gap_bias
+                strict_gap = radii_sum * strict_gap_factor + strict_gap_bias
+                target_gap = max(target_gap, strict_gap)
+                target_gap_sq = target_gap * target_gap
+
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= target_gap_sq:
+                    continue
+                overlap_hits += 1
 
-                    if a_in_view and not b_in_view:
-                        weight_a, weight_b = 0.14, 0.86
-                    elif b_in_view and not a_in_view:
-                        weight_a, weight_b = 0.86, 0.14
-                    else:
-                        weight_a, weight_b = 0.5, 0.5
-                    total_push = push * 2.0
-                    ax = -nx * total_push * weight_a
-                    ay = -ny * total_push * weight_a
-                    bx = nx * total_push * weight_b
-                    by = ny * total_push * weight_b
-
-                    if smooth_mode:
-                        pending_dx[i] += ax
-                        pending_dy[i] += ay
-                        pending_dx[j] += bx
-                        pending_dy[j] += by
+                if dist_sq < 1e-10:
+                    angle = random.uniform(0.0, math.tau)
+                    nx = math.cos(angle)
+                    ny = math.sin(angle)
+                    dist = 0.0
+                else:
+                    dist = math.sqrt(dist_sq)
+                    inv = 1.0 / dist
+                    nx = dx * inv
+                    ny = dy * inv
+
+                overlap = target_gap - dist
+                a_in_view = _in_view(a)
+                b_in_view = _in_view(b)
+                both_in_view = a_in_view and b_in_view
+                push_softness = softness * (0.60 + 0.52 * speed_norm) + bounce_strength * 0.03
+                push_cap = max_push * (0.25 + 0.75 * speed_norm + bounce_strength * 0.15)
+                if speed_norm >= 0.80 and bounce_strength >= 0.90:
+                    push_softness *= 1.70
+                    push_cap *= 2.00
+                push = min(push_cap, overlap * push_softness * dt_scale)
+                if speed_norm >= 0.80 and bounce_strength >= 0.90:
+                    push = max(push, overlap * 0.34)
+
+                # Entry stability: resolve overlap before it becomes visible.
+                # When only one bubble is on-card, move the off-card bubble
+                # far more than the visible one to prevent snap-shifts.
+                if not both_in_view:
+                    if a_in_view != b_in_view:
+                        push *= 0.70
                     else:
-                        a.x += ax
-                        a.y += ay
-                        b.x += bx
-                        b.y += by
+                        push = min(push_cap * 1.35, push * 1.35)
 
-                    if collision_pop_mode == "all":
+                if a_in_view and not b_in_view:
+                    weight_a, weight_b = 0.14, 0.86
+                elif b_in_view and not a_in_view:
+                    weight_a, weight_b = 0.86, 0.14
+                else:
+                    weight_a, weight_b = 0.5, 0.5
+                total_push = push * 2.0
+                ax = -nx * total_push * weight_a
+                ay = -ny * total_push * weight_a
+                bx = nx * total_push * weight_b
+                by = ny * total_push * weight_b
+
+                if smooth_mode:
+                    pending_dx[i] += ax
+                    pending_dy[i] += ay
+                    pending_dx[j] += bx
+                    pending_dy[j] += by
+                else:
+                    a.x += ax
+                    a.y += ay
+                    b.x += bx
+                    b.y += by
+
+                if collision_pop_mode == "all":
+                    self._trigger_collision_pop(a)
+                    self._trigger_collision_pop(b)
+                    continue
+                if collision_pop_mode == "one":
+                    # Mixed-class policy: big bubbles always win when
+                    # same-class-only filtering is disabled.
+                    if a_big != b_big:
+                        if a_big:
+                            self._trigger_collision_pop(b)
+                        else:
+                            self._trigger_collision_pop(a)
+                    elif random.random() < 0.5:
                         self._trigger_collision_pop(a)
+                    else:
                         self._trigger_collision_pop(b)
-                        continue
-                    if collision_pop_mode == "one":
-                        # Mixed-class policy: big bubbles always win when
-                        # same-class-only filtering is disabled.
-                        if a_big != b_big:
-                            if a_big:
-                                self._trigger_collision_pop(b)
-                            else:
-                                self._trigger_collision_pop(a)
-                        elif random.random() < 0.5:
-                            self._trigger_collision_pop(a)
-                        else:
-                            self._trigger_collision_pop(b)
-                        continue
+                    continue
 
-                    bounce_prob = bounce_strength
-                    pair_key = (min(id(a), id(b)), max(id(a), id(b)))
-                    cooldown_until = self._pair_bounce_cooldowns.get(pair_key, 0.0)
-                    in_pair_cooldown = self._time < cooldown_until
-                    if (
-                        bounce_prob > 0.0
-                        and speed_norm > 0.0
-                        and both_in_view
-                        and (not in_pair_cooldown)
-                        and random.random() <= bounce_prob
-                    ):
-                        rel_vx = b.impulse_vx - a.impulse_vx
-                        rel_vy = b.impulse_vy - a.impulse_vy
-                        sep_speed = rel_vx * nx + rel_vy * ny
-                        if sep_speed <= -0.004 or overlap > target_gap * 0.07:
-                            restitution = speed_norm
-                            impulse = (-(1.0 + restitution) * sep_speed) * 0.5
-                            floor_kick = min(
-                                MAX_IMPULSE_SPEED * (0.03 + 0.22 * speed_norm),
-                                overlap * (0.25 + 0.95 * speed_norm) * speed_norm,
-                            )
-                            impulse = max(impulse, floor_kick)
-                            local_cap = MAX_IMPULSE_SPEED * (0.18 + 0.82 * speed_norm)
-
-                            a.impulse_vx -= nx * impulse
-                            a.impulse_vy -= ny * impulse
-                            b.impulse_vx += nx * impulse
-                            b.impulse_vy += ny * impulse
-                            glide_window = 0.10 + 0.10 * speed_norm
-                            a.bounce_glide = max(a.bounce_glide, glide_window)
-                            b.bounce_glide = max(b.bounce_glide, glide_window)
-                            self._pair_bounce_cooldowns[pair_key] = self._time + (0.10 + 0.07 * speed_norm)
-
-                            a_speed = math.hypot(a.impulse_vx, a.impulse_vy)
-                            if a_speed > local_cap:
-                                scale = local_cap / a_speed
-                                a.impulse_vx *= scale
-                                a.impulse_vy *= scale
-                            b_speed = math.hypot(b.impulse_vx, b.impulse_vy)
-                            if b_speed > local_cap:
-                                scale = local_cap / b_speed
-                                b.impulse_vx *= scale
-                                b.impulse_vy *= scale
+                bounce_prob = bounce_strength
+                pair_key = (min(id(a), id(b)), max(id(a), id(b)))
+                cooldown_until = self._pair_bounce_cooldowns.get(pair_key, 0.0)
+                in_pair_cooldown = self._time < cooldown_until
+                if (
+                    bounce_prob > 0.0
+                    and speed_norm > 0.0
+                    and both_in_view
+                    and (not in_pair_cooldown)
+                    and random.random() <= bounce_prob
+                ):
+                    rel_vx = b.impulse_vx - a.impulse_vx
+                    rel_vy = b.impulse_vy - a.impulse_vy
+                    sep_speed = rel_vx * nx + rel_vy * ny
+                    if sep_speed <= -0.004 or overlap > target_gap * 0.07:
+                        restitution = speed_norm
+                        impulse = (-(1.0 + restitution) * sep_speed) * 0.5
+                        floor_kick = min(
+                            MAX_IMPULSE_SPEED * (0.03 + 0.22 * speed_norm),
+                            overlap * (0.25 + 0.95 * speed_norm) * speed_norm,
+                        )
+                        impulse = max(impulse, floor_kick)
+                        local_cap = MAX_IMPULSE_SPEED * (0.18 + 0.82 * speed_norm)
+
+                        a.impulse_vx -= nx * impulse
+                        a.impulse_vy -= ny * impulse
+                        b.impulse_vx += nx * impulse
+                        b.impulse_vy += ny * impulse
+                        glide_window = 0.10 + 0.10 * speed_norm
+                        a.bounce_glide = max(a.bounce_glide, glide_window)
+                        b.bounce_glide = max(b.bounce_glide, glide_window)
+                        self._pair_bounce_cooldowns[pair_key] = self._time + (0.10 + 0.07 * speed_norm)
+
+                        a_speed = math.hypot(a.impulse_vx, a.impulse_vy)
+                        if a_speed > local_cap:
+                            scale = local_cap / a_speed
+                            a.impulse_vx *= scale
+                            a.impulse_vy *= scale
+                        b_speed = math.hypot(b.impulse_vx, b.impulse_vy)
+                        if b_speed > local_cap:
+                            scale = local_cap / b_speed
+                            b.impulse_vx *= scale
+                            b.impulse_vy *= scale
 
             if smooth_mode:
                 # Prevent one-frame "snap" shifts in dense pulse clusters by
@@ -2019,45 +2058,91 @@ class BubbleSimulation:
         candidate_vy: float = 0.0,
     ) -> bool:
         """Return True if (x, y, radius) overlaps any existing bubble."""
-        for b in self._bubbles:
-            existing_big = _bubble_behaves_big(b)
-            if candidate_is_big and existing_big:
-                min_gap = max(0.010, (radius + b.radius) * 0.10)
-            elif candidate_is_big or existing_big:
-                min_gap = 0.001
-            else:
-                min_gap = -min(radius, b.radius) * 0.10
-            if candidate_is_big and existing_big and stream_dir not in {"none", "random"}:
-                # Entry-lane guard: directional streams can otherwise spawn
-                # big bubbles too close outside the viewport and they enter as
-                # sticky overlap groups.
-                min_gap = max(min_gap, (radius + b.radius) * 0.22 + 0.010)
-            dist = math.hypot(b.x - x, b.y - y)
-            if dist < b.radius + radius + min_gap:
+        grid = self._spawn_grid
+        if grid is not None and stream_dir not in _SPAWN_GRID_UNSAFE_STREAMS:
+            # Fixed stream directions shift both predicted positions by the
+            # same vector, so every conflict lies within the current reach.
+            reach = (radius + self._spawn_grid_max_radius) * 1.22 + 0.014
+            candidates = (self._bubbles[i] for i in grid.query(x, y, reach))
+        else:
+            candidates = self._bubbles
+        for b in candidates:
+            if self._spawn_conflicts(
+                b,
+                x,
+                y,
+                radius,
+                candidate_is_big=candidate_is_big,
+                stream_dir=stream_dir,
+                candidate_vx=candidate_vx,
+                candidate_vy=candidate_vy,
+            ):
                 return True
+        return False
 
-            # Pre-entry lane guard: keep big bubbles from spawning into future
-            # overlap when they are still outside the viewport.
-            if candidate_is_big and existing_big and stream_dir not in {"none"}:
-                cand_px, cand_py = self._predict_stream_position(
-                    x,
-                    y,
-                    stream_dir,
-                    vx=candidate_vx,
-                    vy=candidate_vy,
-                )
-                existing_px, existing_py = self._predict_stream_position(
-                    b.x,
-                    b.y,
-                    stream_dir,
-                    vx=b.vx,
-                    vy=b.vy,
-                )
-                future_gap = max(0.014, (radius + b.radius) * 0.16)
-                if math.hypot(existing_px - cand_px, existing_py - cand_py) < (b.radius + radius + future_gap):
-                    return True
+    def _spawn_conflicts(
+        self,
+        b: BubbleState,
+        x: float,
+        y: float,
+        radius: float,
+        *,
+        candidate_is_big: bool,
+        stream_dir: str,
+        candidate_vx: float,
+        candidate_vy: float,
+    ) -> bool:
+        existing_big = _bubble_behaves_big(b)
+        if candidate_is_big and existing_big:
+            min_gap = max(0.010, (radius + b.radius) * 0.10)
+        elif candidate_is_big or existing_big:
+            min_gap = 0.001
+        else:
+            min_gap = -min(radius, b.radius) * 0.10
+        if candidate_is_big and existing_big and stream_dir not in {"none", "random"}:
+            # Entry-lane guard: directional streams can otherwise spawn
+            # big bubbles too close outside the viewport and they enter as
+            # sticky overlap groups.
+            min_gap = max(min_gap, (radius + b.radius) * 0.22 + 0.010)
+        dist = math.hypot(b.x - x, b.y - y)
+        if dist < b.radius + radius + min_gap:
+            return True
+
+        # Pre-entry lane guard: keep big bubbles from spawning into future
+        # overlap when they are still outside the viewport.
+        if candidate_is_big and existing_big and stream_dir not in {"none"}:
+            cand_px, cand_py = self._predict_stream_position(
+                x,
+                y,
+                stream_dir,
+                vx=candidate_vx,
+                vy=candidate_vy,
+            )
+            existing_px, existing_py = self._predict_stream_position(
+                b.x,
+                b.y,
+                stream_dir,
+                vx=b.vx,
+                vy=b.vy,
+            )
+            future_gap = max(0.014, (radius + b.radius) * 0.16)
+            if math.hypot(existing_px - cand_px, existing_py - cand_py) < (b.radius + radius + future_gap):
+                return True
         return False
 
+    def _begin_spawn_phase(self) -> None:
+        """Index current bubbles so spawn checks only visit nearby ones."""
+        if not self._bubbles:
+            self._spawn_grid = None
+            return
+        columns = BubbleColumns.gather(self._bubbles)
+        max_radius = max(float(columns.radius.max()), self._big_size_max * 1.30)
+        self._spawn_grid_max_radius = max_radius
+        self._spawn_grid = UniformGrid.build(columns.x, columns.y, max_radius * 2.44 + 0.014)
+
+    def _end_spawn_phase(self) -> None:
+        self._spawn_grid = None
+
     def _spawn_bubble_at(self, is_big: bool, x: float, y: float,
                          stream_dir: str, surface_reach: float,
                          drift_dir: str, *,
@@ -2162,6 +2247,9 @@ class BubbleSimulation:
             trail_tail_x=x, trail_tail_y=y,
         )
         self._bubbles.append(b)
+        if self._spawn_grid is not None:
+            self._spawn_grid.insert(len(self._bubbles) - 1, x, y)
+            self._spawn_grid_max_radius = max(self._spawn_grid_max_radius, radius)
 
     def _swirl_motion(
         self,
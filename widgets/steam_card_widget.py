@@ -597,8 +597,21 @@ class SteamCardWidget(BaseOverlayWidget):
                 selection=self._achievement_selection,
                 force=force,
                 source_fresh_seconds=self._refresh_minutes * 60,
+                on_partial=_publish_partial,
             )
 
+        def _publish_partial(snapshot) -> None:
+            from core.threading.manager import ThreadManager
+
+            def _apply_partial() -> None:
+                if getattr(self, "_achievement_cache_generation", None) != generation:
+                    return
+                if not getattr(self, "_achievement_refresh_in_progress", False):
+                    return
+                self._apply_achievement_pulse_snapshot(snapshot)
+
+            ThreadManager.run_on_ui_thread(_apply_partial)
+
         def _finished(task_result) -> None:
             from core.threading.manager import ThreadManager
 
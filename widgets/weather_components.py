@@ -21,7 +21,12 @@ from PySide6.QtGui import QFont, QPainter, QColor, QFontMetrics, QPixmap
 from core.logging.logger import get_logger
 from core.settings.shadow_tuning import ICON_SHADOW_TUNING
 from weather.open_meteo_provider import OpenMeteoProvider
-from widgets.shadow_utils import PaintedShadowLabel, make_alpha_shadow_pixmap, shadow_config_enabled
+from widgets.shadow_utils import (
+    PaintedShadowLabel,
+    make_alpha_shadow_pixmap,
+    release_shadow_pixmap,
+    shadow_config_enabled,
+)
 
 logger = get_logger(__name__)
 
@@ -167,6 +172,7 @@ class WeatherConditionIcon(QWidget):
             scaled.setDevicePixelRatio(dpr)
         except Exception as e:
             logger.debug("[WEATHER] Exception suppressed: %s", e)
+        release_shadow_pixmap(self._shadow_pixmap)
         self._shadow_pixmap = make_alpha_shadow_pixmap(
             scaled,
             dpr=dpr,
@@ -327,6 +333,7 @@ class WeatherDetailIcon(QWidget):
                 or self._shadow_pixmap.isNull()
                 or self._shadow_cache_key != key
             ):
+                release_shadow_pixmap(self._shadow_pixmap)
                 self._shadow_pixmap = make_alpha_shadow_pixmap(
                     self._pixmap,
                     dpr=dpr,
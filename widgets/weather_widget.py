@@ -14,7 +14,7 @@ from PySide6.QtGui import QFont, QPainter, QPen, QColor, QFontMetrics, QPixmap
 from shiboken6 import Shiboken
 
 from core.logging.logger import get_logger, is_perf_metrics_enabled
-from core.threading.manager import ThreadManager
+from core.threading.manager import TaskPriority, ThreadManager
 from core.performance import widget_paint_sample
 from core.weather_preparation import (
     PreparedWeatherFetch,
@@ -1042,6 +1042,7 @@ class WeatherWidget(BaseOverlayWidget):
             tm.submit_io_task(
                 _do_fetch,
                 callback=_on_result,
+                priority=TaskPriority.LOW,
                 category="weather_fetch",
             )
         except Exception as e:
@@ -1154,7 +1155,11 @@ class WeatherWidget(BaseOverlayWidget):
 
         _persist._srpss_runtime_generation = runtime_generation
         try:
-            tm.submit_io_task(_persist, category="weather_cache_persist")
+            tm.submit_io_task(
+                _persist,
+                priority=TaskPriority.LOW,
+                category="weather_cache_persist",
+            )
         except Exception:
             logger.warning("[CACHE][WEATHER] Failed to submit widget-cache persistence", exc_info=True)
     